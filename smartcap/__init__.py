@@ -1,13 +1,194 @@
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
+import argparse
+import json
+import logging
+import os
 import sys
-from .app import SmartCapApp
-from .icon import getIcon
+import time
+
+# Startup times in the report are measured from here, interpreter startup and
+# unpacking a frozen build happen before and are not included
+STARTED = time.perf_counter()
+
+# Stages shown in the startup report, in the order they happen
+STARTUP_STAGES = [
+    "startup.imports",
+    "startup.app",
+    "overlay.grab",
+    "overlay.open",
+    "overlay.first_paint",
+    "startup.first_overlay",
+    "startup.ready",
+]
+
+
+def addBatchArguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "sources",
+        nargs="+",
+        help="image files, directories, glob patterns, or - to read paths from stdin",
+    )
+    parser.add_argument("-p", "--prompt", required=True, help="prompt for every image")
+    parser.add_argument(
+        "-o", "--output", required=True, help="JSONL file the results are appended to"
+    )
+    parser.add_argument("--provider", help="provider to use instead of the config")
+    parser.add_argument("--model", help="model to use instead of the config")
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=4, help="parallel requests"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=0, help="max requests per minute (0: no limit)"
+    )
+    parser.add_argument(
+        "--retries", type=int, default=5, help="retries on quota and server errors"
+    )
+    parser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="reuse and store answers in the response cache, for identical images"
+        " only (default: off)",
+    )
+
+
+def addBenchmarkArguments(parser: argparse.ArgumentParser):
+    parser.add_argument(
+        "-n", "--rounds", type=int, default=20, help="captures to run (default: 20)"
+    )
+    parser.add_argument(
+        "--moves", type=int, default=30, help="mouse moves per selection"
+    )
+    parser.add_argument(
+        "--scale", type=float, default=2, help="device pixel ratio of the fake screen"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="seconds the stand-in provider waits before answering",
+    )
+    parser.add_argument(
+        "--startup-runs",
+        type=int,
+        default=3,
+        help="fresh processes started to measure startup (0: skip)",
+    )
+    parser.add_argument(
+        "--startup-command",
+        help="command to measure startup of, e.g. a PyInstaller build"
+        " (default: this Python running smartcap)",
+    )
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument(
+        "--baseline", help="results of an earlier --json run to compare with"
+    )
+
+
+def printStartupReport(reportFormat: str):
+    from .metrics import recorder
+
+    build = "frozen" if getattr(sys, "frozen", False) else "source"
+    stages = {stage.name: stage.last * 1000 for stage in recorder().stats()}
+    stages = {name: stages[name] for name in STARTUP_STAGES if name in stages}
+    if reportFormat == "json":
+        print(json.dumps({"build": build, "python": sys.version.split()[0], **stages}))
+        return
+    print(f"Startup report ({build} build, Python {sys.version.split()[0]})")
+    for name, milliseconds in stages.items():
+        print(f"  {name:<24}{milliseconds:>9.1f} ms")
 
 
 def runApp():
+    parser = argparse.ArgumentParser(
+        prog="smartcap", description="Screenshot and send picture to AI."
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_const",
+        const="text",
+        help="print startup times once the first overlay is shown, then exit",
+    )
+    parser.add_argument(
+        "--startup-report-json",
+        dest="startup_report",
+        action="store_const",
+        const="json",
+        help="like --startup-report, printed as a single JSON line",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("capture", help="take a single capture (default)")
+    subparsers.add_parser(
+        "daemon", help="stay resident in the background and capture on trigger"
+    )
+    subparsers.add_parser("trigger", help="ask the resident process to start a capture")
+    subparsers.add_parser("stop", help="stop the resident process")
+    batchParser = subparsers.add_parser(
+        "batch", help="run one prompt over many images without the GUI"
+    )
+    addBatchArguments(batchParser)
+    benchmarkParser = subparsers.add_parser(
+        "benchmark", help="time the capture-to-answer path headlessly"
+    )
+    addBenchmarkArguments(benchmarkParser)
+    args = parser.parse_args()
+    logging.basicConfig(level=os.environ.get("SMARTCAP_LOG_LEVEL", "WARNING").upper())
+
+    if args.command == "batch":
+        from .batch import runBatch
+
+        sys.exit(runBatch(args))
+    if args.command == "benchmark":
+        from .benchmark import runBenchmark
+
+        sys.exit(runBenchmark(args))
+
+    # Talking to the resident process must not pay for the full GUI imports
+    if args.command in ("trigger", "stop"):
+        from .daemon import sendCommand
+
+        if sendCommand("capture" if args.command == "trigger" else "quit"):
+            sys.exit(0)
+        if args.command == "stop":
+            sys.exit(1)
+        # No resident process is running, fall back to a one-shot capture
+
+    start = time.perf_counter()
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QTimer
+    from .app import SmartCapApp
+    from .icon import getIcon
+    from .metrics import record
+
+    imported = time.perf_counter()
+    record("startup.imports", imported - start)
     app = QApplication([])
-    iconImage = getIcon()
-    icon = QIcon(iconImage.toqpixmap())
-    smartcap = SmartCapApp(app, icon)
+    icon = getIcon()
+
+    def reportStartup(stage: str):
+        record(stage, time.perf_counter() - STARTED)
+        if args.startup_report:
+            # Printed and quit only after the painted frame has been flushed
+            QTimer.singleShot(0, lambda: printStartupReport(args.startup_report))
+            QTimer.singleShot(0, app.quit)
+
+    if args.command == "daemon":
+        from .daemon import DaemonServer
+
+        app.setQuitOnLastWindowClosed(False)
+        smartcap = SmartCapApp(app, icon, resident=True)
+        server = DaemonServer(
+            {"capture": smartcap.openOverlayWindow, "quit": app.quit}, app
+        )
+        if not server.listen():
+            print("smartcap: a resident process is already running", file=sys.stderr)
+            sys.exit(1)
+        smartcap.showTrayIcon()
+        smartcap.watchConfig()
+        QTimer.singleShot(0, lambda: reportStartup("startup.ready"))
+    else:
+        smartcap = SmartCapApp(app, icon)
+        smartcap.overlayWindows[0].firstPainted.connect(
+            lambda: reportStartup("startup.first_overlay")
+        )
+    record("startup.app", time.perf_counter() - imported)
     sys.exit(app.exec())
@@ -1,53 +1,212 @@
-from PySide6.QtWidgets import QApplication, QTabWidget
-from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication, QTabWidget, QSystemTrayIcon, QMenu
+from PySide6.QtGui import QIcon, QImage, QPixmap, QScreen
 from PySide6 import QtCore
-from PIL import ImageGrab
-from .widgets import OverlayWindow, ConfigWidget, PromptWidget
+import importlib
+import time
+from typing import TYPE_CHECKING
+from .overlay import OverlayWindow
 from .config import ConfigValues
+from .metrics import record, span
+
+# PIL and the prompt window widgets are only needed once a selection is made,
+# they are imported on first use to keep them off the path to the first overlay
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+def cropFrame(
+    frame: QPixmap, startPos: QtCore.QPointF, endPos: QtCore.QPointF
+) -> "Image.Image":
+    from PIL import Image
+
+    ratio = frame.devicePixelRatio()
+    region = QtCore.QRect(
+        QtCore.QPoint(round(startPos.x() * ratio), round(startPos.y() * ratio)),
+        QtCore.QPoint(round(endPos.x() * ratio) - 1, round(endPos.y() * ratio) - 1),
+    ).intersected(frame.rect())
+    # Only the selected region is copied and converted
+    image = frame.copy(region).toImage().convertToFormat(QImage.Format.Format_RGB888)
+    return Image.frombuffer(
+        "RGB",
+        (image.width(), image.height()),
+        bytes(image.constBits()),
+        "raw",
+        "RGB",
+        image.bytesPerLine(),
+        1,
+    )
 
 
 class SmartCapApp(object):
-    def __init__(self, app: QApplication, icon: QIcon):
+    def __init__(
+        self,
+        app: QApplication,
+        icon: QIcon,
+        resident: bool = False,
+        config: ConfigValues = None,
+    ):
         self.app = app
         self.icon = icon
+        self.resident = resident
         self.overlayWindows = []
-        self.openOverlayWindow()
+        self.config = config or ConfigValues()
+        self.appWindow = None
+        self.configWidget = None
+        self.historyWidget = None
+        self.diagnosticsWidget = None
+        self.promptWidget = None
+        self.trayIcon = None
+        self.openedAt = None
+        if resident:
+            # Nothing is waiting on a resident process right after it starts
+            QtCore.QTimer.singleShot(0, self.preload)
+        else:
+            self.openOverlayWindow()
+
+    def preload(self):
+        # Imports the modules deferred at startup, a no-op once they are loaded
+        importlib.import_module(".widgets", __package__)
 
     def openOverlayWindow(self):
+        if self.overlayWindows:
+            # A capture is already in progress, bring it back to front
+            for window in self.overlayWindows:
+                window.raise_()
+                window.activateWindow()
+            return
+        start = self.openedAt = time.perf_counter()
+        screens = self.app.screens()
+        # Every screen is grabbed once before any overlay is shown, the selection
+        # is later cropped from these frames instead of grabbing the desktop again
+        with span("overlay.grab", screens=len(screens)):
+            frames = [self.grabScreen(screen) for screen in screens]
         QApplication.setOverrideCursor(QtCore.Qt.CursorShape.CrossCursor)
-        for i, screen in enumerate(self.app.screens()):
+        for i, screen in enumerate(screens):
             x = screen.geometry().x()
             y = screen.geometry().y()
             w = screen.geometry().width()
             h = screen.geometry().height()
             self.overlayWindows.append(
-                OverlayWindow(i, x, y, w, h, self.beginPrompt, self.closeAllWindows)
+                OverlayWindow(
+                    i,
+                    x,
+                    y,
+                    w,
+                    h,
+                    self.beginPrompt,
+                    self.closeAllWindows,
+                    background=frames[i],
+                )
             )
+            self.overlayWindows[-1].firstPainted.connect(self.overlayPainted)
+        record("overlay.open", time.perf_counter() - start, screens=len(screens))
+
+    def overlayPainted(self):
+        if self.openedAt is None:
+            return
+        record("overlay.first_paint", time.perf_counter() - self.openedAt)
+        self.openedAt = None
+        # The overlay is on screen and the user has yet to start dragging, a
+        # good moment to load what finishing the selection needs
+        QtCore.QTimer.singleShot(0, self.preload)
+
+    def grabScreen(self, screen: QScreen) -> QPixmap | None:
+        if not self.config.freezeFrame:
+            return None
+        frame = screen.grabWindow(0)
+        # Some platforms (e.g. Wayland) do not allow grabbing, fall back to a
+        # translucent overlay and a desktop grab after the selection
+        return None if frame.isNull() else frame
 
     def closeAllWindows(self):
+        QApplication.restoreOverrideCursor()
         for window in self.overlayWindows:
             window.close()
+            window.deleteLater()
+        self.overlayWindows = []
+
+    def showTrayIcon(self):
+        if not QSystemTrayIcon.isSystemTrayAvailable():
+            return
+        self.trayMenu = QMenu()
+        self.trayMenu.addAction("Capture", self.openOverlayWindow)
+        self.trayMenu.addSeparator()
+        self.trayMenu.addAction("Quit", self.app.quit)
+        self.trayIcon = QSystemTrayIcon(self.icon)
+        self.trayIcon.setToolTip("SmartCap")
+        self.trayIcon.setContextMenu(self.trayMenu)
+        self.trayIcon.activated.connect(self.trayActivated)
+        self.trayIcon.show()
+
+    def watchConfig(self):
+        # Edits made by hand or by another process reach the resident app
+        # without a restart
+        self.configWatcher = QtCore.QFileSystemWatcher([str(self.config.path)])
+        self.configWatcher.fileChanged.connect(self.configFileChanged)
+
+    def configFileChanged(self, path: str):
+        self.config.reload()
+        # Atomic saves replace the file, which drops it from the watch list
+        if path not in self.configWatcher.files():
+            self.configWatcher.addPath(path)
+
+    def trayActivated(self, reason: QSystemTrayIcon.ActivationReason):
+        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+            self.openOverlayWindow()
+
+    def createAppWindow(self):
+        from .widgets import ConfigWidget, DiagnosticsWidget, HistoryWidget
 
-    def beginPrompt(
-        self, screen_id: int, startPos: QtCore.QPointF, endPos: QtCore.QPointF
-    ):
-        QApplication.restoreOverrideCursor()
-        self.closeAllWindows()
-        screen = self.app.screens()[screen_id]
-        x1 = screen.geometry().x() + startPos.x() * screen.devicePixelRatio()
-        y1 = screen.geometry().y() + startPos.y() * screen.devicePixelRatio()
-        x2 = screen.geometry().x() + endPos.x() * screen.devicePixelRatio()
-        y2 = screen.geometry().y() + endPos.y() * screen.devicePixelRatio()
-        screenshot = ImageGrab.grab(
-            (int(x1), int(y1), int(x2), int(y2)), all_screens=True
-        )
-        self.config = ConfigValues()
         self.configWidget = ConfigWidget(self.config)
-        self.promptWidget = PromptWidget(screenshot, config=self.config)
         self.appWindow = QTabWidget()
         self.appWindow.setWindowTitle("SmartCap")
         self.appWindow.setWindowIcon(self.icon)
         self.appWindow.setBaseSize(800, 640)
-        self.appWindow.addTab(self.promptWidget, "Prompt")
+        self.historyWidget = HistoryWidget()
+        self.appWindow.addTab(self.historyWidget, "History")
         self.appWindow.addTab(self.configWidget, "Config")
+        self.diagnosticsWidget = DiagnosticsWidget()
+        self.appWindow.addTab(self.diagnosticsWidget, "Diagnostics")
+
+    def beginPrompt(
+        self, screen_id: int, startPos: QtCore.QPointF, endPos: QtCore.QPointF
+    ):
+        from .history import history
+        from .widgets import PromptWidget
+
+        frame = self.overlayWindows[screen_id].background
+        self.closeAllWindows()
+        if frame is not None:
+            with span("capture.crop"):
+                screenshot = cropFrame(frame, startPos, endPos)
+        else:
+            screen = self.app.screens()[screen_id]
+            x1 = screen.geometry().x() + startPos.x() * screen.devicePixelRatio()
+            y1 = screen.geometry().y() + startPos.y() * screen.devicePixelRatio()
+            x2 = screen.geometry().x() + endPos.x() * screen.devicePixelRatio()
+            y2 = screen.geometry().y() + endPos.y() * screen.devicePixelRatio()
+            from PIL import ImageGrab
+
+            with span("capture.grab"):
+                screenshot = ImageGrab.grab(
+                    (int(x1), int(y1), int(x2), int(y2)), all_screens=True
+                )
+        start = time.perf_counter()
+        if self.appWindow is None:
+            self.createAppWindow()
+        # Reuse the window across captures, only the prompt page is replaced. The
+        # new page is added first so no other tab becomes current in between
+        previous = self.promptWidget
+        self.promptWidget = PromptWidget(screenshot, config=self.config)
+        self.appWindow.insertTab(0, self.promptWidget, "Prompt")
+        self.appWindow.setCurrentIndex(0)
+        if previous is not None:
+            self.appWindow.removeTab(self.appWindow.indexOf(previous))
+            previous.deleteLater()
         self.appWindow.show()
+        record("prompt.window", time.perf_counter() - start)
+        self.appWindow.raise_()
+        self.appWindow.activateWindow()
+        if self.config.historyEnabled:
+            # Written in the background while the question is being typed
+            history().addCapture(self.promptWidget.capture)
@@ -0,0 +1,217 @@
+import argparse
+import functools
+import glob
+import json
+import logging
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
+from PIL import Image
+from .config import ConfigValues
+from .preprocess import CapturedImage
+from .providers import getProvider
+from .request import Request
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".bmp", ".gif", ".tif", ".tiff"}
+MAX_BACKOFF = 60
+
+logger = logging.getLogger(__name__)
+
+
+def iterImages(sources: list[str]) -> Iterator[str]:
+    # Paths are produced lazily so a huge directory or stdin stream is never
+    # held in memory as a whole
+    for source in sources:
+        if source == "-":
+            for line in sys.stdin:
+                line = line.strip()
+                if line:
+                    yield line
+        elif os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                        yield os.path.join(root, name)
+        elif glob.has_magic(source):
+            yield from glob.iglob(source, recursive=True)
+        else:
+            yield source
+
+
+def completedImages(output: str) -> set[str]:
+    completed = set()
+    if not os.path.exists(output):
+        return completed
+    with open(output, "r") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A line cut short by an interruption, the image is redone
+                continue
+            # Images that could not be decoded will not decode next time either
+            if "answer" in record or record.get("unreadable"):
+                completed.add(record["image"])
+    return completed
+
+
+class UnreadableImage(Exception):
+    pass
+
+
+class RateLimiter(object):
+    def __init__(self, perMinute: float):
+        self.interval = 60 / perMinute if perMinute > 0 else 0
+        self.lock = threading.Lock()
+        self.next = time.monotonic()
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next - now
+            self.next = max(now, self.next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class BatchRunner(object):
+    def __init__(self, config: ConfigValues, args: argparse.Namespace):
+        self.config = config
+        self.args = args
+        # Resolved before any image is read, so a wrong provider fails the run
+        # once instead of once per image
+        self.provider = getProvider(config.provider, config.apiKey, config.model)
+        self.limiter = RateLimiter(args.rate)
+        self.writeLock = threading.Lock()
+        self.stopping = threading.Event()
+        self.done = 0
+        self.failed = 0
+
+    def process(self, path: str) -> dict:
+        started = time.perf_counter()
+        try:
+            with Image.open(path) as image:
+                image.load()
+        except (FileNotFoundError, PermissionError):
+            # May be there on the next run
+            raise
+        except (OSError, Image.DecompressionBombError) as e:
+            raise UnreadableImage(str(e)) from e
+        capture = CapturedImage(image)
+        attempt = 0
+        cached = False
+        while True:
+            self.limiter.acquire()
+            request = Request(self.config, capture, self.args.prompt)
+            try:
+                answer = request.run()
+                cached = request.cachedAt is not None
+                break
+            except Exception as e:
+                if attempt >= self.args.retries or not self.provider.isRetryable(e):
+                    raise
+                # Exponential backoff with jitter so parallel workers do not
+                # hit the quota again at the same moment
+                delay = min(MAX_BACKOFF, 2**attempt) * random.uniform(0.5, 1.5)
+                logger.warning("Retrying %s in %.1f s: %s", path, delay, e)
+                if self.stopping.wait(delay):
+                    raise
+                attempt += 1
+        return {
+            "image": path,
+            "provider": self.config.provider,
+            "model": self.config.model,
+            "answer": answer,
+            "cached": cached,
+            "seconds": round(time.perf_counter() - started, 3),
+            "attempts": attempt + 1,
+        }
+
+    def finish(self, output, path: str, slots: threading.Semaphore, future: Future):
+        try:
+            if not future.cancelled():
+                self.write(output, path, future)
+        finally:
+            slots.release()
+
+    def write(self, output, path: str, future: Future):
+        error = future.exception()
+        if error is not None:
+            record = {"image": path, "error": str(error)}
+            if isinstance(error, UnreadableImage):
+                record["unreadable"] = True
+        else:
+            record = future.result()
+        with self.writeLock:
+            # Written and flushed as soon as each image completes, so an
+            # interrupted run can resume from the file
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            if error is None:
+                self.done += 1
+            else:
+                self.failed += 1
+                logger.error("%s: %s", path, error)
+
+    def run(self) -> int:
+        completed = completedImages(self.args.output)
+        concurrency = max(1, self.args.concurrency)
+        # At most this many images are loaded or waiting at any time
+        slots = threading.BoundedSemaphore(concurrency * 2)
+        skipped = 0
+        with open(self.args.output, "a") as output:
+            executor = ThreadPoolExecutor(max_workers=concurrency)
+            try:
+                for path in iterImages(self.args.sources):
+                    if path in completed:
+                        skipped += 1
+                        continue
+                    slots.acquire()
+                    future = executor.submit(self.process, path)
+                    future.add_done_callback(
+                        functools.partial(self.finish, output, path, slots)
+                    )
+                executor.shutdown(wait=True)
+            except KeyboardInterrupt:
+                self.stopping.set()
+                # Requests already sent are let through and written, so nothing
+                # that was paid for is lost. A second Ctrl+C must not close the
+                # output file underneath them
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                print("Interrupted, waiting for running requests", file=sys.stderr)
+                executor.shutdown(wait=True, cancel_futures=True)
+                print("Interrupted, run again to resume", file=sys.stderr)
+                return 130
+        print(
+            f"{self.done} done, {self.failed} failed, {skipped} already completed",
+            file=sys.stderr,
+        )
+        return 1 if self.failed else 0
+
+
+def runBatch(args: argparse.Namespace) -> int:
+    config = ConfigValues()
+    # Overrides are for this run only and never written back to the config
+    if args.provider:
+        config.set("provider", args.provider, save=False)
+    if args.model:
+        config.set("model", args.model, save=False)
+    config.set("stream", False, save=False)
+    # Batches often hold many near identical images that need their own
+    # answer, so the cache is off unless asked for and then only exact
+    config.set("cacheEnabled", args.cache, save=False)
+    config.set("cacheNearMatch", 0, save=False)
+    try:
+        runner = BatchRunner(config, args)
+    except Exception as e:
+        print(f"smartcap batch: {e}", file=sys.stderr)
+        return 2
+    return runner.run()
@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import platform
+import random
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from .config import ConfigValues
+from .metrics import StageStats, record, recorder
+
+# Long enough for the markdown render to show up in the numbers
+ANSWER = "\n\n".join(
+    [
+        "## Summary\n\nThe capture shows a **settings dialog** with {width}x{height}"
+        " pixels and a question about *{prompt}*.",
+        "\n".join(f"- Item {i}: `value_{i}` is enabled" for i in range(20)),
+        "```python\n" + "\n".join(f"print({i})" for i in range(30)) + "\n```",
+        "| Name | Value |\n|---|---|\n"
+        + "\n".join(f"| row {i} | {i * i} |" for i in range(20)),
+    ]
+    * 2
+)
+
+
+def syntheticFrame(width: int, height: int, scale: float, seed: int):
+    # A busy, document like picture so encoding is not trivially cheap. The
+    # same seed always draws the same frame
+    from PySide6.QtGui import QColor, QPainter, QPixmap
+
+    rng = random.Random(seed)
+    frame = QPixmap(round(width * scale), round(height * scale))
+    frame.fill(QColor(246, 246, 246))
+    painter = QPainter(frame)
+    for _ in range(60):
+        color = QColor(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        painter.fillRect(
+            rng.randrange(frame.width()),
+            rng.randrange(frame.height()),
+            rng.randrange(20, 300),
+            rng.randrange(10, 120),
+            color,
+        )
+    painter.setPen(QColor(30, 30, 30))
+    words = ["capture", "prompt", "answer", "model", "screen", "dialog", "value"]
+    for y in range(16, frame.height(), 22):
+        line = " ".join(rng.choice(words) for _ in range(frame.width() // 60))
+        painter.drawText(8, y, line)
+    painter.end()
+    frame.setDevicePixelRatio(scale)
+    return frame
+
+
+def measureStartup(runs: int, command: list[str], env: dict):
+    # Every run is a fresh process so imports are measured cold. The process
+    # time also covers interpreter startup, which the report cannot see
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            command + ["--startup-report-json"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        record("startup.process", time.perf_counter() - start)
+        report = json.loads(result.stdout.splitlines()[-1])
+        for name, value in report.items():
+            if name.startswith("startup."):
+                record(name, value / 1000)
+            elif name.startswith("overlay."):
+                # Kept apart from the warm overlays of the rounds below
+                record(f"startup.{name}", value / 1000)
+
+
+def runRounds(args: argparse.Namespace, config: ConfigValues):
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+    from PySide6.QtCore import QEventLoop, QPoint, Qt, QTimer
+    from PySide6.QtTest import QTest
+    from .app import SmartCapApp
+
+    app = QApplication.instance() or QApplication([])
+    smartcap = SmartCapApp(app, QIcon(), resident=True, config=config)
+    geometry = app.primaryScreen().geometry()
+    frame = syntheticFrame(geometry.width(), geometry.height(), args.scale, seed=0)
+    startPos = QPoint(geometry.width() // 10, geometry.height() // 10)
+    endPos = QPoint(geometry.width() * 3 // 4, geometry.height() * 3 // 4)
+    moves = max(1, args.moves)
+
+    for i in range(args.rounds):
+        start = time.perf_counter()
+        smartcap.openOverlayWindow()
+        app.processEvents()
+        window = smartcap.overlayWindows[0]
+        # The grabbed frame of a headless screen is blank, select from a fixed
+        # picture instead so every run encodes the same pixels
+        window.background = frame
+        QTest.mousePress(window, Qt.LeftButton, pos=startPos)
+        for step in range(1, moves + 1):
+            QTest.mouseMove(window, startPos + (endPos - startPos) * step / moves)
+            app.processEvents()
+        QTest.mouseRelease(window, Qt.LeftButton, pos=endPos)
+        app.processEvents()
+
+        promptWidget = smartcap.promptWidget
+        pane = promptWidget.panes[0]
+        promptWidget.promptTextEdit.setPlainText(f"What is shown here? ({i})")
+        loop = QEventLoop()
+        pane.done.connect(loop.quit)
+        QTimer.singleShot(30000, loop.quit)
+        promptWidget.sendPrompt()
+        loop.exec()
+        if pane.isBusy():
+            raise TimeoutError("No answer from the stand-in provider within 30 s")
+        app.processEvents()
+        record("benchmark.capture_to_answer", time.perf_counter() - start)
+    smartcap.appWindow.close()
+
+
+def compare(stats: list[StageStats], baselinePath: str):
+    with open(baselinePath, "r") as f:
+        baseline = {stage["stage"]: stage for stage in json.load(f)["stages"]}
+    print(f"\n{'Stage':<32}{'p50 before':>12}{'p50 now':>12}{'change':>10}")
+    for stage in stats:
+        before = baseline.get(stage.name)
+        if before is None or not before["p50_ms"]:
+            continue
+        now = stage.p50 * 1000
+        change = (now - before["p50_ms"]) / before["p50_ms"] * 100
+        print(
+            f"{stage.name:<32}{before['p50_ms']:>9.2f} ms{now:>9.2f} ms"
+            f"{change:>+9.0f}%"
+        )
+
+
+def runBenchmark(args: argparse.Namespace) -> int:
+    # Everything runs headless against the Mock provider with a throwaway
+    # config, so the numbers only depend on this machine and this code
+    directory = tempfile.TemporaryDirectory(prefix="smartcap-benchmark-")
+    answerPath = Path(directory.name).joinpath("answers.json")
+    answerPath.write_text(json.dumps([ANSWER]))
+    configPath = Path(directory.name).joinpath(".smartcap/config.json")
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env.update(
+        SMARTCAP_MOCK_LATENCY=str(args.latency),
+        SMARTCAP_MOCK_CHUNK_DELAY="0.001",
+        SMARTCAP_MOCK_SCRIPT=str(answerPath),
+        SMARTCAP_MOCK_FAILURE_RATE="0",
+        PYTHONPATH=os.pathsep.join(
+            filter(None, [str(Path(__file__).parent.parent), env.get("PYTHONPATH")])
+        ),
+    )
+    os.environ.update(env)
+
+    config = ConfigValues(configPath)
+    config.set("provider", "Mock", save=False)
+    config.set("model", "benchmark", save=False)
+    config.set("stream", True, save=False)
+    config.set("freezeFrame", True, save=False)
+    config.set("cacheEnabled", False, save=False)
+    config.set("historyEnabled", False, save=False)
+    config.set("compareModels", "", save=False)
+    config.save()
+
+    recorder().clear()
+    # The started processes read the throwaway config from their home folder
+    startupEnv = dict(env, HOME=directory.name, USERPROFILE=directory.name)
+    if args.startup_command:
+        startupCommand = shlex.split(args.startup_command, posix=os.name != "nt")
+    else:
+        startupCommand = [sys.executable, "-m", "smartcap"]
+    measureStartup(args.startup_runs, startupCommand, startupEnv)
+    runRounds(args, config)
+    stats = recorder().stats()
+
+    print(f"{'Stage':<32}{'count':>7}{'p50':>11}{'p95':>11}{'max':>11}")
+    for stage in stats:
+        print(
+            f"{stage.name:<32}{stage.count:>7}{stage.p50 * 1000:>8.2f} ms"
+            f"{stage.p95 * 1000:>8.2f} ms{stage.max * 1000:>8.2f} ms"
+        )
+    if args.baseline:
+        compare(stats, args.baseline)
+    if args.json:
+        from PySide6 import __version__ as qtVersion
+
+        results = {
+            "rounds": args.rounds,
+            "moves": args.moves,
+            "scale": args.scale,
+            "latency": args.latency,
+            "python": platform.python_version(),
+            "qt": qtVersion,
+            "platform": platform.platform(),
+            "stages": [stage.asDict() for stage in stats],
+        }
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    directory.cleanup()
+    return 0
@@ -0,0 +1,169 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from PIL import Image
+
+HASH_SIZE = 32
+
+_cache = None
+_cacheLock = threading.Lock()
+
+
+def imageHash(image: Image.Image) -> int:
+    # Difference hash for the opt-in near-duplicate matching: survives small
+    # rendering differences between two captures of the same picture. Small
+    # hashes cannot tell apart dialogs that differ only in their text, so it
+    # is 1024 bits
+    small = image.convert("L").resize(
+        (HASH_SIZE + 1, HASH_SIZE), Image.Resampling.BILINEAR
+    )
+    pixels = small.tobytes()
+    value = 0
+    for row in range(HASH_SIZE):
+        for col in range(HASH_SIZE):
+            left = pixels[row * (HASH_SIZE + 1) + col]
+            right = pixels[row * (HASH_SIZE + 1) + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+def requestKey(provider: str, model: str, systemPrompt: str, prompt: str) -> str:
+    text = "\0".join((provider, model, systemPrompt, prompt))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def responseCache() -> "ResponseCache":
+    global _cache
+    with _cacheLock:
+        if _cache is None:
+            _cache = ResponseCache(Path.home().joinpath(".smartcap/cache.db"))
+    return _cache
+
+
+class ResponseCache(object):
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        # Requests run on worker threads, every access goes through self.lock
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " id INTEGER PRIMARY KEY,"
+            " request TEXT NOT NULL,"
+            " image TEXT NOT NULL,"
+            " width INTEGER NOT NULL,"
+            " height INTEGER NOT NULL,"
+            " near TEXT,"
+            " answer TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS answers_request ON answers (request, image)"
+        )
+        self.db.execute(
+            "CREATE INDEX IF NOT EXISTS answers_accessed ON answers (accessed)"
+        )
+        self.db.commit()
+
+    def lookup(
+        self,
+        request: str,
+        image: str,
+        size: tuple[int, int],
+        maxAge: float,
+        nearHash: int = None,
+        threshold: int = 0,
+    ) -> tuple[str, float] | None:
+        # An answer is reused for the exact same pixels. Only when near
+        # matching is turned on, a capture of the same size whose hash differs
+        # in at most threshold bits is accepted as well
+        now = time.time()
+        with self.lock:
+            row = self.db.execute(
+                "SELECT id, answer, created FROM answers"
+                " WHERE request = ? AND image = ? AND created >= ?",
+                (request, image, now - maxAge),
+            ).fetchone()
+            if row is None and nearHash is not None and threshold > 0:
+                best = None
+                for candidate in self.db.execute(
+                    "SELECT id, answer, created, near FROM answers"
+                    " WHERE request = ? AND width = ? AND height = ?"
+                    " AND near IS NOT NULL AND created >= ?",
+                    (request, size[0], size[1], now - maxAge),
+                ):
+                    distance = (int(candidate[3], 16) ^ nearHash).bit_count()
+                    if distance <= threshold and (best is None or distance < best[0]):
+                        best = (distance, candidate[:3])
+                if best is not None:
+                    row = best[1]
+            if row is None:
+                return None
+            entryId, answer, created = row
+            self.db.execute(
+                "UPDATE answers SET accessed = ? WHERE id = ?", (now, entryId)
+            )
+            self.db.commit()
+        return answer, created
+
+    def store(
+        self,
+        request: str,
+        image: str,
+        size: tuple[int, int],
+        answer: str,
+        maxAge: float,
+        maxBytes: int,
+        nearHash: int = None,
+    ):
+        now = time.time()
+        near = None if nearHash is None else f"{nearHash:0256x}"
+        with self.lock:
+            self.db.execute(
+                "DELETE FROM answers WHERE request = ? AND image = ?",
+                (request, image),
+            )
+            self.db.execute(
+                "INSERT INTO answers (request, image, width, height, near, answer,"
+                " size, created, accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    request,
+                    image,
+                    size[0],
+                    size[1],
+                    near,
+                    answer,
+                    len(answer.encode()),
+                    now,
+                    now,
+                ),
+            )
+            self.evict(now - maxAge, maxBytes)
+            self.db.commit()
+
+    def evict(self, oldest: float, maxBytes: int):
+        self.db.execute("DELETE FROM answers WHERE created < ?", (oldest,))
+        (total,) = self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM answers"
+        ).fetchone()
+        if total <= maxBytes:
+            return
+        # Least recently used entries go first until the cache fits again
+        rows = self.db.execute("SELECT id, size FROM answers ORDER BY accessed")
+        expired = []
+        for entryId, size in rows:
+            if total <= maxBytes:
+                break
+            expired.append((entryId,))
+            total -= size
+        self.db.executemany("DELETE FROM answers WHERE id = ?", expired)
+
+    def clear(self):
+        with self.lock:
+            self.db.execute("DELETE FROM answers")
+            self.db.commit()
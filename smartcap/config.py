@@ -1,45 +1,226 @@
+import atexit
 import json
+import logging
+import os
+import tempfile
+import threading
+import time
 from pathlib import Path
+from typing import Any, Callable
+
+SAVE_DELAY = 0.5
+
+# Attribute name, key in config.json and default value. Keys missing from the
+# file, or holding a value of the wrong type, fall back to the default
+SCHEMA = [
+    ("provider", "provider", "Google"),
+    ("model", "model", "gemini-2.0-flash"),
+    ("apiKey", "api-key", ""),
+    ("systemPrompt", "system-prompt", "You are a helpful assistant"),
+    ("stream", "stream", True),
+    ("freezeFrame", "freeze-frame", True),
+    ("maxResolution", "max-resolution", 1536),
+    ("imageFormat", "image-format", "Auto"),
+    ("imageQuality", "image-quality", 85),
+    ("grayscale", "grayscale", False),
+    ("byteBudget", "byte-budget", 1024 * 1024),
+    ("cacheEnabled", "cache-enabled", True),
+    ("cacheNearMatch", "cache-near-match", 0),
+    ("cacheMaxAgeDays", "cache-max-age-days", 30),
+    ("cacheMaxSizeMb", "cache-max-size-mb", 50),
+    ("compareModels", "compare-models", ""),
+    ("maxConcurrency", "max-concurrency", 4),
+    ("firstAnswerWins", "first-answer-wins", False),
+    ("historyTokenBudget", "history-token-budget", 8000),
+    ("historyEnabled", "history-enabled", True),
+    ("historyMaxEntries", "history-max-entries", 10000),
+    ("historyMaxSizeMb", "history-max-size-mb", 500),
+]
+
+logger = logging.getLogger(__name__)
 
 
 class ConfigValues(object):
-    def __init__(self):
-        self.path = Path.home().joinpath(".smartcap/config.json")
+    def __init__(self, path: Path = None):
+        self.path = path or Path.home().joinpath(".smartcap/config.json")
+        self.listeners = []
+        # Keys this version does not know about are written back untouched
+        self.extra = {}
+        self.lock = threading.Lock()
+        self.saveLock = threading.Lock()
+        self.saveTimer = None
+        self.saveDeadline = 0
+        self.dirty = False
+        self.saved = None
+        for attr, _, default in SCHEMA:
+            setattr(self, attr, default)
         if self.path.exists():
-            data = json.load(open(self.path, "r"))
-            self.provider = data["provider"]
-            self.model = data["model"]
-            self.apiKey = data["api-key"]
-            self.systemPrompt = data["system-prompt"]
+            self.reload()
         else:
-            self.provider = "Google"
-            self.model = "gemini-2.0-flash"
-            self.apiKey = ""
-            self.systemPrompt = "You are a helpful assistant"
-            self.path.parent.mkdir(parents=True)
             self.save()
+        atexit.register(self.flush)
+
+    def read(self) -> dict | None:
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Cannot read %s: %s", self.path, e)
+            return None
+        return data if isinstance(data, dict) else None
+
+    def reload(self):
+        # Listeners are only notified about values that actually changed
+        data = self.read()
+        if data is None or data == self.saved:
+            return
+        with self.lock:
+            if self.dirty:
+                # Unsaved local changes are newer than the file
+                return
+        known = set()
+        for attr, key, default in SCHEMA:
+            known.add(key)
+            value = data.get(key, default)
+            if type(value) is not type(default):
+                value = default
+            self.set(attr, value, save=False)
+        self.extra = {k: v for k, v in data.items() if k not in known}
+
+    def addListener(self, listener: Callable[[str, Any], None]):
+        self.listeners.append(listener)
+
+    def removeListener(self, listener: Callable[[str, Any], None]):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def set(self, attr: str, value: Any, save: bool = True):
+        if getattr(self, attr) == value:
+            return
+        setattr(self, attr, value)
+        for listener in list(self.listeners):
+            listener(attr, value)
+        if save:
+            self.scheduleSave()
 
     def setProvider(self, provider: str):
-        self.provider = provider
-        self.save()
+        self.set("provider", provider)
 
     def setModel(self, model: str):
-        self.model = model
-        self.save()
+        self.set("model", model)
 
     def setApiKey(self, apiKey: str):
-        self.apiKey = apiKey
-        self.save()
+        self.set("apiKey", apiKey)
 
     def setSystemPrompt(self, systemPrompt: str):
-        self.systemPrompt = systemPrompt
+        self.set("systemPrompt", systemPrompt)
+
+    def setStream(self, stream: bool):
+        self.set("stream", stream)
+
+    def setFreezeFrame(self, freezeFrame: bool):
+        self.set("freezeFrame", freezeFrame)
+
+    def setMaxResolution(self, maxResolution: int):
+        self.set("maxResolution", maxResolution)
+
+    def setImageFormat(self, imageFormat: str):
+        self.set("imageFormat", imageFormat)
+
+    def setImageQuality(self, imageQuality: int):
+        self.set("imageQuality", imageQuality)
+
+    def setGrayscale(self, grayscale: bool):
+        self.set("grayscale", grayscale)
+
+    def setByteBudget(self, byteBudget: int):
+        self.set("byteBudget", byteBudget)
+
+    def setCacheEnabled(self, cacheEnabled: bool):
+        self.set("cacheEnabled", cacheEnabled)
+
+    def setCacheNearMatch(self, cacheNearMatch: int):
+        self.set("cacheNearMatch", cacheNearMatch)
+
+    def setCacheMaxAgeDays(self, cacheMaxAgeDays: int):
+        self.set("cacheMaxAgeDays", cacheMaxAgeDays)
+
+    def setCacheMaxSizeMb(self, cacheMaxSizeMb: int):
+        self.set("cacheMaxSizeMb", cacheMaxSizeMb)
+
+    def setCompareModels(self, compareModels: str):
+        self.set("compareModels", compareModels)
+
+    def setMaxConcurrency(self, maxConcurrency: int):
+        self.set("maxConcurrency", maxConcurrency)
+
+    def setFirstAnswerWins(self, firstAnswerWins: bool):
+        self.set("firstAnswerWins", firstAnswerWins)
+
+    def setHistoryTokenBudget(self, historyTokenBudget: int):
+        self.set("historyTokenBudget", historyTokenBudget)
+
+    def setHistoryEnabled(self, historyEnabled: bool):
+        self.set("historyEnabled", historyEnabled)
+
+    def setHistoryMaxEntries(self, historyMaxEntries: int):
+        self.set("historyMaxEntries", historyMaxEntries)
+
+    def setHistoryMaxSizeMb(self, historyMaxSizeMb: int):
+        self.set("historyMaxSizeMb", historyMaxSizeMb)
+
+    def scheduleSave(self):
+        # Typing in the config tab changes a value per keystroke, the file is
+        # only written once the changes have settled for SAVE_DELAY seconds
+        with self.lock:
+            self.dirty = True
+            self.saveDeadline = time.monotonic() + SAVE_DELAY
+            if self.saveTimer is None:
+                self.startSaveTimer(SAVE_DELAY)
+
+    def startSaveTimer(self, delay: float):
+        self.saveTimer = threading.Timer(delay, self.saveWhenIdle)
+        self.saveTimer.daemon = True
+        self.saveTimer.start()
+
+    def saveWhenIdle(self):
+        with self.lock:
+            remaining = self.saveDeadline - time.monotonic()
+            if remaining > 0:
+                self.startSaveTimer(remaining)
+                return
+            self.saveTimer = None
         self.save()
 
+    def flush(self):
+        with self.lock:
+            if self.saveTimer is not None:
+                self.saveTimer.cancel()
+                self.saveTimer = None
+            dirty = self.dirty
+        if dirty:
+            self.save()
+
     def save(self):
-        data = {
-            "provider": self.provider,
-            "model": self.model,
-            "api-key": self.apiKey,
-            "system-prompt": self.systemPrompt,
-        }
-        json.dump(data, open(self.path, "w"))
+        with self.lock:
+            self.dirty = False
+            data = dict(self.extra)
+            for attr, key, _ in SCHEMA:
+                data[key] = getattr(self, attr)
+        with self.saveLock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it over the config so a crash
+            # mid-write never leaves a truncated file behind
+            fd, tempPath = tempfile.mkstemp(
+                prefix=".config-", suffix=".json", dir=self.path.parent
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tempPath, self.path)
+                self.saved = data
+            except BaseException:
+                os.unlink(tempPath)
+                raise
@@ -0,0 +1,50 @@
+import getpass
+from typing import Callable
+from PySide6 import QtCore
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+SERVER_NAME = f"smartcap-{getpass.getuser()}"
+CONNECT_TIMEOUT_MS = 500
+
+
+def sendCommand(command: str, timeout: int = CONNECT_TIMEOUT_MS) -> bool:
+    # Only QtNetwork is needed here so the trigger client stays cheap to start
+    socket = QLocalSocket()
+    socket.connectToServer(SERVER_NAME)
+    if not socket.waitForConnected(timeout):
+        return False
+    socket.write(f"{command}\n".encode())
+    socket.flush()
+    socket.waitForBytesWritten(timeout)
+    socket.disconnectFromServer()
+    return True
+
+
+class DaemonServer(QtCore.QObject):
+    def __init__(self, commands: dict[str, Callable], parent: QtCore.QObject = None):
+        super().__init__(parent)
+        self.commands = commands
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.acceptConnections)
+
+    def listen(self) -> bool:
+        if sendCommand("ping"):
+            # Another resident process already owns the socket
+            return False
+        # Clean up a stale socket file left behind by a crashed daemon
+        QLocalServer.removeServer(SERVER_NAME)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        return self.server.listen(SERVER_NAME)
+
+    def acceptConnections(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda s=socket: self.readCommands(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def readCommands(self, socket: QLocalSocket):
+        while socket.canReadLine():
+            command = bytes(socket.readLine()).decode().strip()
+            handler = self.commands.get(command)
+            if handler is not None:
+                handler()
@@ -0,0 +1,351 @@
+import atexit
+import logging
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Callable
+from PIL import Image
+from .preprocess import CapturedImage
+
+THUMBNAIL_SIZE = 128
+PAGE_SIZE = 50
+# Oldest entries are removed in batches of this size while over the size limit
+PRUNE_BATCH = 100
+# A capture is stored before it is answered, it only counts as abandoned once
+# it has had no entry for this long (seconds)
+ORPHAN_GRACE = 24 * 3600
+# How often to look for such captures (seconds)
+SWEEP_INTERVAL = 3600
+
+logger = logging.getLogger(__name__)
+
+_history = None
+_historyLock = threading.Lock()
+
+
+def history() -> "History":
+    global _history
+    with _historyLock:
+        if _history is None:
+            _history = History(Path.home().joinpath(".smartcap/history"))
+    return _history
+
+
+def searchQuery(text: str) -> str:
+    # Every word is matched as a prefix. Quoting keeps FTS5 syntax typed by the
+    # user from being interpreted
+    words = text.split()
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+
+class HistoryEntry(object):
+    def __init__(
+        self,
+        entryId: int,
+        created: float,
+        image: str,
+        provider: str,
+        model: str,
+        prompt: str,
+        answer: str,
+        thumbnail: bytes,
+        width: int,
+        height: int,
+    ):
+        self.id = entryId
+        self.created = created
+        self.image = image
+        self.provider = provider
+        self.model = model
+        self.prompt = prompt
+        self.answer = answer
+        self.thumbnail = thumbnail
+        self.width = width
+        self.height = height
+
+
+class History(object):
+    # Captures are stored once per distinct picture under their content hash,
+    # entries (one per answer) reference them. Writes are queued to a single
+    # background thread so encoding full size PNGs never blocks the UI
+    def __init__(self, root: Path):
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        # Searches run on the GUI thread and writes on the writer thread, every
+        # access goes through self.lock
+        self.db = sqlite3.connect(root.joinpath("history.db"), check_same_thread=False)
+        # A search never waits for a write to finish. With WAL, an entry is only
+        # synced at checkpoints, a crash may lose the last few but not corrupt
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS images ("
+            " hash TEXT PRIMARY KEY,"
+            " width INTEGER NOT NULL,"
+            " height INTEGER NOT NULL,"
+            " thumbnail BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL)"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " id INTEGER PRIMARY KEY,"
+            " created REAL NOT NULL,"
+            " image TEXT NOT NULL,"
+            " provider TEXT NOT NULL,"
+            " model TEXT NOT NULL,"
+            " prompt TEXT NOT NULL,"
+            " answer TEXT NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS entries_image ON entries (image)")
+        # External content index: the text is stored once in entries and kept
+        # in sync by the triggers below
+        self.db.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS entries_text USING fts5("
+            " prompt, answer, content='entries', content_rowid='id')"
+        )
+        self.db.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries"
+            " BEGIN INSERT INTO entries_text (rowid, prompt, answer)"
+            " VALUES (new.id, new.prompt, new.answer); END"
+        )
+        self.db.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries"
+            " BEGIN INSERT INTO entries_text (entries_text, rowid, prompt, answer)"
+            " VALUES ('delete', old.id, old.prompt, old.answer); END"
+        )
+        self.db.commit()
+        self.queue = queue.Queue()
+        self.writer = None
+        self.sweptAt = 0
+        atexit.register(self.flush)
+
+    def imagePath(self, imageHash: str) -> Path:
+        return self.root.joinpath("images", imageHash[:2], f"{imageHash}.png")
+
+    def submit(self, job: Callable, *args):
+        with self.lock:
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.write, daemon=True)
+                self.writer.start()
+        self.queue.put((job, args))
+
+    def write(self):
+        while True:
+            job, args = self.queue.get()
+            try:
+                job(*args)
+            except Exception:
+                logger.exception("Cannot write to the history")
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        # Waits for the queued writes, called on exit so no answer is lost
+        if self.writer is not None:
+            self.queue.join()
+
+    def addCapture(self, capture: CapturedImage):
+        self.submit(self.storeImage, capture)
+
+    def addEntry(
+        self,
+        capture: CapturedImage,
+        provider: str,
+        model: str,
+        prompt: str,
+        answer: str,
+        maxEntries: int,
+        maxBytes: int,
+    ):
+        self.submit(
+            self.storeEntry,
+            capture,
+            provider,
+            model,
+            prompt,
+            answer,
+            maxEntries,
+            maxBytes,
+        )
+
+    def storeImage(self, capture: CapturedImage) -> str:
+        imageHash = capture.contentHash()
+        with self.lock:
+            stored = self.db.execute(
+                "SELECT 1 FROM images WHERE hash = ?", (imageHash,)
+            ).fetchone()
+        if stored:
+            return imageHash
+        path = self.imagePath(imageHash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if not path.exists():
+            fd, tempPath = tempfile.mkstemp(suffix=".png", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    capture.image.save(f, "PNG")
+                os.replace(tempPath, path)
+            except BaseException:
+                os.unlink(tempPath)
+                raise
+        thumbnail = capture.image.copy()
+        thumbnail.thumbnail((THUMBNAIL_SIZE, THUMBNAIL_SIZE), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        thumbnail.save(buffer, "PNG")
+        with self.lock:
+            self.db.execute(
+                "INSERT OR IGNORE INTO images"
+                " (hash, width, height, thumbnail, size, created)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    imageHash,
+                    capture.image.width,
+                    capture.image.height,
+                    buffer.getvalue(),
+                    path.stat().st_size + buffer.tell(),
+                    time.time(),
+                ),
+            )
+            self.db.commit()
+        return imageHash
+
+    def storeEntry(
+        self,
+        capture: CapturedImage,
+        provider: str,
+        model: str,
+        prompt: str,
+        answer: str,
+        maxEntries: int,
+        maxBytes: int,
+    ):
+        imageHash = self.storeImage(capture)
+        size = len(prompt.encode()) + len(answer.encode())
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO entries"
+                " (created, image, provider, model, prompt, answer, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (time.time(), imageHash, provider, model, prompt, answer, size),
+            )
+            expired = self.prune(maxEntries, maxBytes)
+            self.db.commit()
+        for expiredHash in expired:
+            self.imagePath(expiredHash).unlink(missing_ok=True)
+
+    def prune(self, maxEntries: int, maxBytes: int) -> list[str]:
+        # Oldest entries go first. Returns the images no entry refers to any
+        # more, their files are deleted once the lock is released
+        affected = set()
+
+        def removeEntries(rows: list[tuple[int, str]]):
+            self.db.executemany(
+                "DELETE FROM entries WHERE id = ?", [(row[0],) for row in rows]
+            )
+            affected.update(row[1] for row in rows)
+
+        removeEntries(
+            self.db.execute(
+                "SELECT id, image FROM entries ORDER BY id DESC LIMIT -1 OFFSET ?",
+                (maxEntries,),
+            ).fetchall()
+        )
+        now = time.time()
+        if now - self.sweptAt > SWEEP_INTERVAL:
+            self.sweptAt = now
+            expired = self.removeImages(affected, now - ORPHAN_GRACE)
+        else:
+            expired = self.removeImages(affected)
+        while self.totalSize() > maxBytes:
+            rows = self.db.execute(
+                "SELECT id, image FROM entries ORDER BY id LIMIT ?", (PRUNE_BATCH,)
+            ).fetchall()
+            if not rows:
+                break
+            affected = set()
+            removeEntries(rows)
+            expired += self.removeImages(affected)
+        return expired
+
+    def removeImages(self, candidates: set[str], abandonedBefore: float = None):
+        # Images left without entries, plus captures that were never answered
+        unused = [
+            imageHash
+            for imageHash in candidates
+            if self.db.execute(
+                "SELECT 1 FROM entries WHERE image = ? LIMIT 1", (imageHash,)
+            ).fetchone()
+            is None
+        ]
+        if abandonedBefore is not None:
+            unused += [
+                row[0]
+                for row in self.db.execute(
+                    "SELECT hash FROM images WHERE created < ? AND NOT EXISTS"
+                    " (SELECT 1 FROM entries WHERE image = images.hash)",
+                    (abandonedBefore,),
+                )
+                if row[0] not in candidates
+            ]
+        self.db.executemany(
+            "DELETE FROM images WHERE hash = ?", [(imageHash,) for imageHash in unused]
+        )
+        return unused
+
+    def totalSize(self) -> int:
+        (entries,) = self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        (images,) = self.db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM images"
+        ).fetchone()
+        return entries + images
+
+    def page(
+        self, text: str = "", before: int = None, limit: int = PAGE_SIZE
+    ) -> list[HistoryEntry]:
+        # Newest first. Pages continue from the id of the last entry shown, so
+        # deep pages cost the same as the first one
+        columns = (
+            "e.id, e.created, e.image, e.provider, e.model, e.prompt, e.answer,"
+            " i.thumbnail, i.width, i.height"
+        )
+        query = searchQuery(text)
+        if query:
+            # Driven by the full-text index in rowid order, so only the matches
+            # of this page are read even when most entries match
+            sql = (
+                f"SELECT {columns} FROM entries_text t"
+                " JOIN entries e ON e.id = t.rowid JOIN images i ON i.hash = e.image"
+                " WHERE entries_text MATCH ?"
+            )
+            params = [query]
+            key = "t.rowid"
+        else:
+            sql = f"SELECT {columns} FROM entries e JOIN images i ON i.hash = e.image"
+            params = []
+            key = "e.id"
+        if before is not None:
+            sql += f" {'AND' if query else 'WHERE'} {key} < ?"
+            params.append(before)
+        with self.lock:
+            rows = self.db.execute(
+                f"{sql} ORDER BY {key} DESC LIMIT ?", params + [limit]
+            ).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def clear(self):
+        with self.lock:
+            hashes = [row[0] for row in self.db.execute("SELECT hash FROM images")]
+            self.db.execute("DELETE FROM entries")
+            self.db.execute("DELETE FROM images")
+            self.db.commit()
+        for imageHash in hashes:
+            self.imagePath(imageHash).unlink(missing_ok=True)
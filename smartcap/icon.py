@@ -1,12 +1,24 @@
 import base64
-from io import BytesIO
-from PIL import Image
+from PySide6.QtGui import QIcon, QPixmap
 
-ENCODED_ICON = "iVBORw0KGgoAAAANSUhEUgAABFwAAANrCAYAAAB7oYxSAAAA0mVYSWZJSSoACAAAAAoAAAEEAAEAAABcBAAAAQEEAAEAAABrAwAAAgEDAAMAAACGAAAAEgEDAAEAAAABAAAAGgEFAAEAAACMAAAAGwEFAAEAAACUAAAAKAEDAAEAAAACAAAAMQECAA8AAACcAAAAMgECABQAAACsAAAAaYcEAAEAAADAAAAAAAAAAAgACAAIACwBAAABAAAALAEAAAEAAABHSU1QIDMuMC4wLVJDMQAAMjAyNTowMjoyNyAwOToyNjozMAABAAGgAwABAAAAAQAAAAAAAAB4RWRmAAAAYHpUWHRSYXcgcHJvZmlsZSB0eXBlIGlwdGMAAHjaPYg7DoAwDMX2nIIj5PN4ac+TUomNgfuLwoC9WJbzuku2j6BEg6NjKJY/1qzUeawKDBrB3TWTPcHmiuRcJuv9MHR5ADvcEtSMTc0lAAABhGlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw1AUhU9TpSIVBwuKimSoTnZREcdSxSJYKG2FVh1MXvoHTRqSFBdHwbXg4M9i1cHFWVcHV0EQ/AFxF5wUXaTE+5JCixgfXN7Hee8c7rsPEBoVpppdUUDVLCMVj4nZ3KoYeIWAEapBjEnM1BPpxQw819c9fHy/i/As73t/rj4lbzLAJxJHmW5YxBvEs5uWznmfOMRKkkJ8TjxpUIPEj1yXXX7jXHRY4JkhI5OaJw4Ri8UOljuYlQyVeIY4rKga5QtZlxXOW5zVSo21+uQvDOa1lTTXqUYRxxISSEKEjBrKqMBChHaNFBMpOo95+Icdf5JcMrnKYORYQBUqJMcP/ge/Z2sWpqfcpGAM6H6x7Y9xILALNOu2/X1s280TwP8MXGltf7UBzH2SXm9r4SOgfxu4uG5r8h5wuQMMPemSITmSn0ooFID3M/qmHDBwC/SuuXNrneP0AcjQrJZvgINDYKJI2ese7+7pnNu/d1rz+wGSL3KzKJZXwAAADvFpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADw/eHBhY2tldCBiZWdpbj0i77u/IiBpZD0iVzVNME1wQ2VoaUh6cmVTek5UY3prYzlkIj8+Cjx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDQuNC4wLUV4aXYyIj4KIDxyZGY6UkRGIHhtbG5zOnJkZj0iaHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyI+CiAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgIHhtbG5zOnhtcE1NPSJodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvbW0vIgogICAgeG1sbnM6c3RFdnQ9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC9zVHlwZS9SZXNvdXJjZUV2ZW50IyIKICAgIHhtbG5zOmRjPSJodHRwOi8vcHVybC5vcmcvZGMvZWxlbWVudHMvMS4xLyIKICAgIHhtbG5zOkdJTVA9Imh0dHA6Ly93d3cuZ2ltcC5vcmcveG1wLyIKICAgIHhtbG5zOmlwdGNFeHQ9Imh0dHA6Ly9pcHRjLm9yZy9zdGQvSXB0YzR4bXBFeHQvMjAwOC0wMi0yOS8iCiAgICB4bWxuczpwaG90b3Nob3A9Imh0dHA6Ly9ucy5hZG9iZS5jb20vcGhvdG9zaG9wLzEuMC8iCiAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyIKICAgIHhtbG5zOnhtcD0iaHR0cDovL25zLmFkb2JlLmNvbS94YXAvMS4wLyIKICAgeG1wTU06RG9jdW1lbnRJRD0iZ2ltcDpkb2NpZDpnaW1wOjA3ZDE1N2Y1LTJiNTktNGFjMC1iNTk5LTg0ZjZjNjg0NjUyNCIKICAgeG1wTU06SW5zdGFuY2VJRD0ieG1wLmlpZDoyNDg3MGU3Yy0xNzA4LTRhYTAtODVlOC1kYjYzN2RkY2NhMDUiCiAgIHhtcE1NOk9yaWdpbmFsRG9jdW1lbnRJRD0ieG1wLmRpZDoyNmQ5ZDg1Yi1hNGJhLTQzOTAtOGViNy0zZjQ5ZGEzNjk4OWQiCiAgIGRjOkZvcm1hdD0iaW1hZ2UvcG5nIgogICBHSU1QOkFQST0iMy4wIgogICBHSU1QOlBsYXRmb3JtPSJXaW5kb3dzIgogICBHSU1QOlRpbWVTdGFtcD0iMTc0MDYyMzE5MDcwMjcyMyIKICAgR0lNUDpWZXJzaW9uPSIzLjAuMC1SQzEiCiAgIGlwdGNFeHQ6RGlnaXRhbFNvdXJjZUZpbGVUeXBlPSJodHRwOi8vY3YuaXB0Yy5vcmcvbmV3c2NvZGVzL2RpZ2l0YWxzb3VyY2V0eXBlL3RyYWluZWRBbGdvcml0aG1pY01lZGlhIgogICBpcHRjRXh0OkRpZ2l0YWxTb3VyY2VUeXBlPSJodHRwOi8vY3YuaXB0Yy5vcmcvbmV3c2NvZGVzL2RpZ2l0YWxzb3VyY2V0eXBlL3RyYWluZWRBbGdvcml0aG1pY01lZGlhIgogICBwaG90b3Nob3A6Q3JlZGl0PSJNYWRlIHdpdGggR29vZ2xlIEFJIgogICB0aWZmOk9yaWVudGF0aW9uPSIxIgogICB4bXA6Q3JlYXRvclRvb2w9IkdJTVAiCiAgIHhtcDpNZXRhZGF0YURhdGU9IjIwMjU6MDI6MjdUMDk6MjY6MzArMDc6MDAiCiAgIHhtcDpNb2RpZnlEYXRlPSIyMDI1OjAyOjI3VDA5OjI2OjMwKzA3OjAwIj4KICAgPHhtcE1NOkhpc3Rvcnk+CiAgICA8cmRmOlNlcT4KICAgICA8cmRmOmxpCiAgICAgIHN0RXZ0OmFjdGlvbj0ic2F2ZWQiCiAgICAgIHN0RXZ0OmNoYW5nZWQ9Ii8iCiAgICAgIHN0RXZ0Omluc3RhbmNlSUQ9InhtcC5paWQ6NTNjM2QxM2YtNjNlMy00NmUzLWJiMTYtOGQ5MWU3ZmI2ZGMzIgogICAgICBzdEV2dDpzb2Z0d2FyZUFnZW50PSJHSU1QIDMuMC4wLVJDMSAoV2luZG93cykiCiAgICAgIHN0RXZ0OndoZW49IjIwMjUtMDItMjdUMDk6MjY6MzArMDc6MDAiLz4KICAgIDwvcmRmOlNlcT4KICAgPC94bXBNTTpIaXN0b3J5PgogIDwvcmRmOkRlc2NyaXB0aW9uPgogPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgIAo8P3hwYWNrZXQgZW5kPSJ3Ij8+JjT/ggAAAAZiS0dEAP8A/wD/oL2nkwAAAAlwSFlzAAAuIwAALiMBeKU/dgAAAAd0SU1FB+kCGwIaHknhcMIAAAAZdEVYdENvbW1lbnQAQ3JlYXRlZCB3aXRoIEdJTVBXgQ4XAAAgAElEQVR42uy9e5AkV33n+/2dk1nd0zMjjTTSCI3eGoHQDAIhHgLMQ1haVmaFkSXLCrAvBhmZayPfXdsY2xEgEEQ4Ym3uPzjEvQ7bdx1hFhOA1zbGgFkEZmV5ZQQCowdCFkLveb+6Z7q7KvOc3/3j5Mk6mZX1ruqq6v59Ijqy65WPkydPnt83fw9AEARBEIR1w/ve977fedOb3sRnnXUWx3HMSikGUPmnlOI4jvkFL3gBX3fddSfuuOOOHdKCgiAIgiAIgiAIgiAIAK677roTp512Wi6uEBErpfI/rXX+598jovw9ZAKM/91ll13Gv/d7v/cyaVlBEARBEARBEARBEDYUH/3oR0+54IILCh4sRMRRFHEcx7l3i1KKoyjiKIoKwgsRFYQZ/7twXQsLC/z2t7/9UWltQRAEQRAEQRAEQRDWPTt27MhFEQAFzxX/vxdTyp/5vyiKuFarcRzHhe/6z6IoyrcxNzfHN9544/3S8oIgCIIgCIIgCIIgrDsuvfTSgsiiteY4jvOl93YphxN5j5fQo6UsxJS9W0KvGL/OU045heUsCIIgCIIgCIIgCIKwLvjgBz94Va1Wy0WQubm5guhS5cHiRZQoivLP/O99/ha/Tv/aCyz+PZ9U14cfIRNerr/++mflrAiCIAiCIAiCIAiCMLNce+21hRAfL4bUarU8F4v3bvHCifd6CYUYL7yEAov/jfdo8UtkwooXYML/vcfLZZddJt4ugiAIgiAIHSBpAkEQBEGYTvbs2cOPPPIIlFIAAGYG0WRv3dZaaK0BAKeeeioOHz4scwlBEARBEIQKZJIkCIIgCFPIrl27+IknngAzQykFrTWstRPfryiKYK1FmqZQSmFhYQFLS0synxAEQRAEQSihpAkEQRAEYbq4+OKL+cknnwSzi9qp1Wqw1uavJ0m9XgcAaK1hjMHKygpOO+00CS8SBEEQBEEoIYKLIAiCIEwRr3jFK3LPFqApbHhPl0nCzIiiCMxc+H9xcRHnn3++iC6CIAiCIAgBIrgIgiAIwpRw44033v/d734XURSBiBBFEQAgTdNc5JgE4bZ9WJN/j4hgjMHTTz8NqV4kCIIgCILQRGKuBUEQBGFabsquFDOIKBczvGcLESFN0zVPmlsWeZRSsNZCKYU0TQEAcRznopDMLQRBEARBELJ5kzSBIAiCIEyezZs358pGmqbQWoOZYYzJ3/MeL5PEGAMiyqsVKaWQJAkAgIgwPz8voUWCIAiCIAgQwUUQBEEQJs5VV13FjUYDzJwLGV7YCMUNL2ysFVUhTN7Dxn+mlMpDoLTWqNfruPbaa0V0EQRBEARhwyNuv4IgCIIw6ZsxETMztNZTt2+d8saUxRcfAgUA1lqZYwiCIAiCsKERDxdBEARBmCAXXXTRzHuDeE8cLxpZa/H6179evFwEQRAEQdjQyNMnQRAEQZgs7PO1rHVC3J52ruTh4vcz9GYpe7pYa/3nMs8QBEEQBGHDIh4ugiAIgjAhdu/ezXEctwgW00y3ffVeLkop3Hzzzd+UsywIgiAIwkZFnjwJgiAIwqRuwlnuFu8xMgseLhXHUPDOCbxbsG3bNhw9elTmGoIgCIIgbEjEw0UQBEEQJsC73/3uTwKA1hrTHFJUpt0+huFFXnA5evSonGhBEARBEDYsIrgIgiAIwgS45557fiMs+TwrVOV0AZpCjFJuauGP6YYbbnhIzrYgCIIgCBsRcfMVBEEQhEncgIlYaw0igjEmr+4zbVSFFIUJc/1rjz8GpRSstTj33HPxzDPPyHxDEARBEISNN9+TJhAEQRCEtUdrzUSENE2hlIJSaiqS5g67D0opGGPyZRRFSNNU5huCIAiCIGw4JKRIEARBENaY22+//d3GGBARoigCABhj1sWxhYKNUgppmsoJFwRBEARhQyKCiyAIgiCsMQ8++OB/A1z4TVilaBo8XMKKSYP8Ac08Lp4PfehD58tZFwRBEARhoyGCiyAIgiCsMc8++yyiKIK1Ni+jrJSaiSpFvVA+jscff/wuOeuCIAiCIGw0ImkCQRAEQVhbjh8/DmttLrKElX6mwctlWLzXjj+WZ5555no564IgCIIgbDTEw0UQBEEQ1pjV1dWWcsoA1o3YUj62ffv2yUkXBEEQBGHDIYKLIAiCIKwxSZKAiGCtzSv6rJdwoqpy0YuLi3LSBUEQBEHYcIjgIgiCIAhrTJqmBWHCe4WUk83OIj4fjT8mIlo3FZgEQRAEQRD6QXK4CIIgrCN+//d/f/exY8d+ul6vn7e8vLx7ZWXlhY1G4wX1ev3Uer2OJEmQpimMMbDWIkmSPHGrtRZAs3JOSJXXQju01gXD23tv+D//Ovws/D+KosJ3y+vQWp/M1p9WLWu12l4iSpVSq/5Pa72klFolojT7bKX02v+faK1PMHPkPyuJCS3vVQgOqVJqxa/HGLNFKbW6ZcuW7915551H3ve+9/3On//5n+cCi9YavkT0eggp8v0j7Cf1el0uzhIf//jHyVo7z8xxtox8f8muuThbRsF1GKVpui27Tjcxc2StnQ9/799v1zf9Umu9FEXRsSiKjkZRdKxWq+2NoujoRz7ykRU5O4IgCIIwonmRNIEgCMJ0G2V79+5933PPPfdfnn/++UuPHj2KpaUlrK6uYnV1FY1Go2DceoO9bLiHJXv951UGftX3+qVKnAnXWfZ2KG/TCz/l31UdY7j+dsfeizgQvg49Mzp9v10OlnbbDxPkWmtRq9Xy0CKtdV6taNZFF6VUQbTTWucePXEcF87/IHlsuiUYHrb/9hPaVbX+0Eupqk92+7zb9r33UKfrvZffV22zajxgZtRqNczNzWF+fh5btmzBli1bsG3bNmzfvv3hbdu2fWPHjh3//Q//8A//VUZsQRAEQRDBRRAEYar4rd/6rf/4+OOP3/XEE0/sOnToEBYXF9FoNJCmaYto4Y1Z/3/Z0GdmRFFUaYhVJTP1BpU3wjoZe1XGcS9GaHkfoihq+70wrKadURkanO0M5naGKDPnHjhV2+51/d2OtywU+Xwt1lporTE3N4eVlZWW7fnzO8v4nDS+7LVv80ajkXsrtTPuu4kHvfRBf32Uv9dp/e1EmqrtVF1D5e2327Zvn3af9bP9dp/3KhhVtUN4/YXiYHhMoShZ3m7ghYaFhQWceuqpOOuss3DhhRd+ddeuXf/5D/7gDx6TEV8QBEEQwUUQBEEYObfddtuHH3300Y89+eSTOHr0KE6cONFicMdxnHs9eMMp9IxoJ1L475W9C8L1hB4HVYbXuDwr2q23ygDux8Oj3XfbGdzdjO5eBaWq9YS/9QZ1aJyGIVI+jCuKovzcp2nak+g1C0RRlIsrXmgiIszPz2N1dbXyHITH3c956OXctusD3frnSCZZXQSTXr/T67p7Ibw+Ou1PuQ+3u7bDdveCjR+Dwusj9KrbvHkzTjvtNJx33nnYtWvXX376059+l9whBEEQBBFcBEEQhJ645ZZbvvLQQw9d9/zzz+PkyZMFESX0YvBPk72BUuW5Eho91tqCh0BZUCm/V2WkVYX0rIXA4rfVyQOg3efl/e8knPQastEuJKkXg77sLRRuJ/QwKm87NEaVUkjTNPf4AZreITM9scjOoReQvFePP2/tPJhCcaqTuFDV78PvdQrrGkVi4rIH1CCeOp2um27710ks7AWtdWXYXFV/Ds+jF9BCQTH0xvJCbvhe+LuwL/j/fZ/3242iCNu3b8eOHTvwkpe85POf+cxnfkHuJoIgCIIILoIgCBuYX/zFX/zM97///Xc8/fTTOHnyZMFwDEUUb0h5bwZvsHQzIMP/Q4PdG0NlN/+ySBMaUkqplhwaYVjRIIZir0Z4OwOx1xwo7Qzafl932r5/3S6/TSdDu5NAUM47489j2Ce01rkwMctUtZsXl9r187DN2gmAvXi+dPptr0JILx4yvYQ9dRJs+hVUer2W+jlHoRgSrtv3P7+fYc4XL5iEokr4ebtrLhSWw/NR7g+hwBOub2FhAZdccgn27NkjIowgCIIggosgCMJ65j3vec///b3vfe+3Hn30UayurhaeGIfCinfdD4WP0LulKuwHQG50Vz0dLhs55QSa5XWWhYUqj5jy0+5hDN5ejMd2Bmu79fdjgLY7nm5hG1V5V/rxignf914qVclJw+2G589/v9FoVOaYmamJRdAu/viMMYiiCEmS5B5A4fdCcbIqh00vuVTa5VYZNESp27G128dePu/kgdYth0+/OZR6vU57aZ+yh1C5L3fKQRRem+2uj9Dzy+eCCT/34+LCwgLOOuss7Nmz57kvfelL58pdSRAEQRDBRRAEYUb54Ac/eNW9995732OPPYaDBw+2GHShuBGGiZQFl1BMCcMtyt4vYVLZcj6WcHvthJt2oQLldYT70ckY7CXnRCfDr9ecFe0M5fL6wpCGspjUyz5UJRvuZBCXBZZePRjKyUbLBqvWuiBAlHNrzLLgEnpxhUKKF5N6yRvULvFtLyFDnSrw9FpFqJewoU79vlPS3E6fd/PI6uda7OZN1Is4VPbA69RPq0K2wr5d1fbla66d959/HUVRXvXKvx9FEc4991xceumlJ7/61a9ukbuWIAiCIIKLIAjCFPPzP//z99x7772v37t3b8sT+25JOId9Ar2WST2ngVk8vtBbaT2IJMLort9x7ccoPXXW65jhxZ35+Xmce+65ePnLX/5Pn//8598svVoQBEGY2LxCmkAQBAH4wAc+8Ka77777nx5++GEkSdJS+aefUIdRCS7rXWiZ5WMUwWUdT4xEcJnZMSNM9uuT8FprEccxdu/ejde+9rW33XXXXX8mvVwQBEFYs3mFNIEgCBuVX/3VX/39b3zjG3/wxBNP5IZMOfdEu+S0vRpnwuDGkyBs6AmaCC5tx4x+EiCHYU4+LOn888/Hq1/96n/+whe+8AbpaYIgCMJY7+fSBIIgbCRuvvnmb957771XHzx4MC/VDDRzq4SlTcOcE6ER1GuCyVEYFOvZaBIEocMETQSXnsbH8lji82hprQtVl8KxPEmSvC23bNmCl73sZfjnf/5nmRMLgiAIo7+fSxMIgrDeueWWW77yzW9+87oDBw7kE/KwJK9/z1dTCSfn5WSWaxFCst4FFxFbBKHDxKxLotuNTjfBxY/nPrFumJTaj/M+1MgLM2Hul8svvxz333+/NLYgCIIwmvu6NIEgCOuR3/3d333FF77whe88+eSThZLKfvIdupqX/y9XxfDCjH+vXIVD6N9gWg9Gcbm0sSCMqm9VXSciuDTHj04hRWE7+THdezN6oSX8nRdcfNU2v6zVarjiiitw3333ScMLgiAIg9/XpQkEQVhPXHPNNXzPPffkE+wweaKfoIfllMNSpABaBBX/uS9F3M3wGYUBvt6T5nZLejkLhmWV4CLiizCqvlV1nYjg0tv44T0YfZv50FClFBqNRi66eC/GNE3ze4AxBnEc594xfl2nnHIK3vrWt37ps5/97NvkDAiCIAj9II9pBUGYeX7913/9/9y5cycrpfhb3/pWXmVIKVWI4/dPLv1EPKxA5N/XWudPQL0402sY0agNIu9pI4aUIAhCb+NsKJp7YcWHD3kPR+/5Yq0tiPFebNFa57+L4xhLS0v47Gc/e73Wmnfv3s0f/vCHd8qZEARBEHq6b0kTCIIwq1x11VX8wAMPIE3TXDipMtzbJZ/sRwQo53JZC0OiattrWZJ2VCEzG1FImUTIkSRVXV+CQth3unl+DeoZNgvedJPYt/J1G17LXtDZsmULXve615386le/ukV6rSAIgtAO8XARBGGm+OVf/uVPnXnmmVyr1fhf//VfkSRJobJQmIOlLFT4v0GNklEbVFWGRbiPYRlq/7fWxrSILbNjLG40j6iN0HfKIlq7/iTnfQ0nzpln5PLyMr72ta9t1lrzRRddxL/92799jbSOIAiC0HKPliYQBGEWuPrqq/mee+7JnzD6MKBQkKgyOofxMigbO2tp1LTzapm1PCEb2btFEIa59qsE1o1QMn7axxAfpuTvRT70yCfavfbaa3/8xS9+8RLpyYIgCAIggosgCFPOnj17+Ic//GHLRLdMu/eHFVzWIpSom8E+Kbf/fkIapt1ImkS7SSUjYZg+VDWGhV5vkx4f1oppO66qcdCHtWqt8xwwl112GR588EGZZwuCIGxwJKRIEISp4wMf+MCbzjvvPAbADz/8cGHCHSa59RPccZVpHpfY0s2AKH8+KYOjKgSrl30RcUEQRjtOdKvMI6wdoRelT6oeJtkF3AOABx98EAD4jDPO4N/8zd/8T9JygiAIG/S+IU0gCMK08M53vvNz//iP/3jz4cOHWyoHGWPypScMLQqrTgyTJLfbRHstjKtpDBnoZ/82ugE4CY+Wae8/wnD9p1x+fNT9Zpr7zKQ8+zpdx2GeMGttXgHP348ajQbiOM7fZ2YsLCzgpptu+uO/+Iu/+L+klwuCIGyg+7o0gSAIk+aGG2546Gtf+9qe5eVlACgIKz5UKIqi3FXbT3j908Ty5LycA6HfsI52392ogku5/YYRXDZKDoq1El3Wup8Ka993uo1Hg44d3aq5TdP4M4n2L495YXilvy+FYV7e24WIWrxdfI6XRqOBU089Fe9617v+jz/+4z/+tPR2QRCEDXBflyYQBGFSXHfddSe+9a1vbV5dXc0ntd6rhZmhlIIxpuDCHRrsfnLbaYI8SD6NXstLj8qAmGZDp13bDmIgbaSyxePM39Jr/xXWRx8qj3tVnw9y7kVw6X79VJWGLgssofjivVn85/51+Z4GANu3b8d73vOe1//RH/3RvdLbBUEQ1vH9XJpAEIS15vWvfz3ff//9qNfr+dNApVSeeLAfw7zKIBnEyC3nidlISA6I2To/5cSpvQhi3YzrjVr9pkqQ3fATwy4hmf22US99bxrbIBRO+jnmXgTpOI6RJAmYGdu2bcOtt9569Sc+8YlvyWgnCIKwDu+r0gSCIKwVb3zjG/m+++4DgDzGnZnzUCEfA18VKhROzLtV5Ri2asd6NrrKRqWILbNxzgY1iLuFomxE4aVKkBWxpf/+M0jf7WX909g/hvl9VWUpYwzm5+exsrICwIn827Ztwy/90i+945Of/ORnpRcKgiCso/uqNIEgCOPm+uuvf/brX//6OdZaNBoNAEAURfnnYWiQd8PuNHnvVXAZdEK/Xg2vKg8IEVxm57yNy6AsX08bRXAJvRdEcOl9/NzIgku//aSdt1kcx6jX64jjGNZapGmKWq2GRqOB7du349Zbb5VQI0EQhPVyX5UmEARhXNx0003/+ytf+cprVlZW8glsrVZDkiS5sRPHcf6/j3Hvx4W7F3f3dt9pV/J4PYYU9ZKEU5j+c9evgVi1nqrQu40kOkj/H659+gn1nOX275ZDp9tv2429aZoWHjj4MFpfZc//ZseOHbj99tvVhz/8YemsgiAIs3xflSYQBGHU/Nqv/drtn/70p//4xIkTeYUhAHmJzHCiCaAlhGiYHAHtftvuOxuhyosYl+v7/PViwFb1/2GTrs6yoBC2iXi3CN2uq376SDsPsnA9/sGCf+3zl2mtc2+XNE1hjMGLX/xiPProo9JBBUEQZvV+Ik0gCMKo+PjHP06f/OQn7eHDh3MxxZfC9MlxAeSTSl+xgZlRq9UAIJ+E9jKhbRcW0Yvo0otBthGMdWFjnMNyUugqoWUjVZEKxwpJmiu0uxba9ZlB1hn+b4zJqxuF16e1FrVaDfV6HVEUIYoirK6uQimF66677vCXv/zlM+QMCYIgzNh9RZpAEIRRsHv3bn7kkUcQRRGYGcaYPD69SgzxE04/yQzdqsOJaNUkt9OTx24T4l6M1/VidA1iqI/C6Jy0yLPePZSGqfKyFqLCpNt/0LLv0v/G3396GZ8n3X7Dhjy1O4aw3/k8Lr60tH8gkaZpXmraP6zw90alFBYWFrC0tCRzd0EQhBlCSRMIgjAMb37zmxlALrb4CWWtVoO1NvdgCfO0hLlafDiRn4yGHi5lL5aqyXDZ26XbZN0n5w3/1qthNGtCiTC4Ud9PuEPV9zfauS97FkjfH//40E/Y26SPs1PYXb/XZrhev64oipCmKdI0zbfh74X+gYMPLQoTyi8tLQEAX3755dJhBUEQZgQRXARBGIj3vve9d27atIm/+c1v5q7PYdJZ/9QuiqJ8Qqm1LggdSqn8z09yw2SCVaKI/17Z42UY4aRXAWZaBRo/kQ//hmmHQYyJTu1Ztd5Rn8NpFUJGcT6rPg/Fy0GM1WFyt1Sd02kQMH17dNuXdvlsZkHomKQoMapxdtrH17LY4sNje+3jvdxPjDEFcQVAIWGuX4//XnjPjKIIDz30EOI45ttuu+3DMhsRBEGY8rmhNIEgCP1y1lln8YEDB3JPFl/q2YsnazEhHpfhMe15HKpCqGaBbpWiRhnmMevCzbSf06r+N01hROMOGZpE/9to+XWmpX8Pcq2Oy3usLMT4BxsXXHABnnrqKekYgiAIU4p4uAiC0DMvf/nLWWvN+/fvBwDEcQxjDIgItVoNURS1VByaJYN02g3d9RT2UPbeGMYzp9262/0Jo++P42zXQc7fej3P0n+ni2G8cgb1rjLG5PdapRSeeuopAOCf+ZmfOSZnRBAEYQrvFdIEgiB049Zbb/2vf/VXf/XB1dXVfILoPVnK1U98rPksGzJVE+BeSk+v5f6tpeE1bA6DWTMShylL3svvZ91o7tT/xundsRH71zQe20YpHT5IFauq74zDw8WH7Po/n6h+69atklRXEARh2u4p0gSCIHTi4osv5qeffjov4xzGs4eTyzD+fC3CioYxULpNiCcdsjMtBuUwuWDWi7jQ6fjE22D8/b9byMZ6PQez3MfWSy6maRVclFJ5lT+feN7nUPN/11xzDb7+9a/LHF8QBGEa7inSBIIgVPH2t7/90X/4h3+41FcZqtVqhWSdofDixRalFNI0zcs9T6s4MO0G26T3b9htrrUHjrCxxIZh+te052jaCNfPrAsy/XpAdjqXZUGnl3E5TAztw4qqwjNPOeUULC4uyjxfEARhwkgOF0EQWjjvvPP4S1/60qXebdmXePav/aQuFF/CSkSzwnrM2dItf0kvf2ux3+PM4SLMNt36wjBiizA953c95Fgadp8HqTIW5o0Jq/2V23BlZQVExDfffPM3pdcJgiBMDlG+BUHIueGGGx764he/uCeMFddaI03TvFyzL1MZJsj1VRN8WWf/nWkVJro9TZx0RZD8qScDTONrh1YUALsm+WraVSeahaffk87nM2w/2IiVbqb9nFWeI8tgQj4OEAMWDAVqeT9cjgaLYZ/JESsw2XxcaS4rzk+2/9N0ftp5n3S7f/QbUtSrR1P4nXKeNB9S5L8X5nmx1mLnzp14/vnnZc4vCIIggosgCJPirLPO4v379+ciyzBGXSeX615j4Gf5aTRx2ZiwuVHRKnCE3y++VgxYqjZOWo2j4Glp+XNWvQ34rACyLfvfr6Hmtj+5xMlh1xnEdhvmxshtz9Hg/ad8TOO+tRNxvk3ffuH/40WVlr0ZqYVxQ/FIrt9+kyGPbmJmC9d/v0seUy/hlnNU/bo5finYQHBhuPGldX2Z4JIdN7GqHD/9mJJ7d3C7vjJ7Sdur7oHlfl51D626T1aF9nrv09tuu+3XPvWpT/2/MuMRBEFYOySkSBA2OG9729ueJCLev38/arVaz0ZFL98L3ZvDagqdxJQwN8x6eBLfyfAmRkdxw4stTMW/tpN0Dg2epnBCsLkxg5blNN9W1EBLIgUitxzk9wzljEHufzms2FJ9bmWcqurvg45LncaqqRB6s37kr/9+l6Mct/LlAOuwgVDChILY0va4s2sp/OuwhWAZ/m1swiS6PuwXcN6pn/rUp/6fq666SkYUQRCENUQ8XARhA7Nz504+cOBAPiHzLsj9VBnqZviUk1QOmrRytjxeVBtRw5YEl9YntE5UsW0d+kOBJvyfmZsO+2SbIQbhQJ95sPglt3lSTUM2NZMdWHQoikblUITxL30IBJPNQyL6Xa6VuDDWyUGFl1mvlVrWct+qnvr30387VUFq5+HSvQ2GER2H7z/la69bexQ+JwvbEqo0gC8MBR5ReahTtUcfWAXbC8cOW5ikEtuWc9163Gro8Wta6dXDxYcBa63z8F5mxvz8POr1OpgZp59+Oo4cOSI2gCAIwhpaBYIgbCBuv/32d2uted++fXl5SQB58tt+jZ9+Pu/mudJJwJkdj5d2T1qbAkvRbb73J7Sh7ZM/ffaCWWYwFYQLFI2pwrJle1X70d9yGLGlcEwDLkdi2Ay5rBaPel9OWmxpt931kmS6mzdLu8/C9zt7wwx+/fi+PMzfcH1fVV6Lva+X8+/bTPANBZTK8Y2aHniEVrGlxROwItGuxdolBZ92fGVBf9+MoghRFGF1dTUPLTpy5AiUUnzbbbd9WGZEgiAI40XUbUHYYFx11VX87W9/u5Dg1rsdz83NFVyQhzV2qgSSdvlZ+snxMmnDravIFBpPgcjCXuxgVQjxoZK5zm2HZtXDvtq2v+auIk74BHpQT5FsfTygnh+IQYN4mHTaP3Y7loUadfgeqaGOPxRQOiU3bZ/0VE21YThu4bObl1CVh0v4WbdQva7ld2kU7TGMp9XkJn4MgJmyNuBCf+7592UPG0JpPdVjQ+ghxkEuqXJOl7CVqgTXrh49Mxqq2quHi7UWcRwXkuYycyGhfZhU9zWveQ3+5V/+RewBQRAEEVwEQRiW7du38/Hjx/OqQz7G2/+fpmleYnKYCaFSqlDBqF2Cy1GKIGspuHTGQpEz7JvCiWoKLoXBt/TEl8oGDrURTLISoFRltFQLLlxhVIZVRLhla3ZAwUANLrbk+2owWNaI9uZcv4l0myEQ/RnMnbxVeu9BXDItZ2tJpIf6/TCVuRQy14qhBJ9hRaguXmo97x6hGRQ42iWh+iIuerP0L7gURRcvcPfeDrQAACAASURBVPYmuJTbLx89w/Ek+L+Q46qwf7aPc7X+BBd//7XWQmsNrTWSJEGtVkOapgDQUklwx44dOHDggNgEgiAIIrgIgjAIt99++7v/5E/+5L+FSfR8fLcXV/z/YbnnQSeFSnV/Ql+ePHbzfJlWcabSXKZimdPcFMzLnur2gghZEDqX1Wbb28DOJc+L0JhklMq2elssMFYGMee8UTRUpR8erqz4ME+4i8b2MB4KdqoN7kkuu3oYdT1/ndtx2IkNYxAvl26SX+/jU1GYGECwQjFXU9WSehC82l1H7d5X4KxKEjW93Cq8lTpdf9WCperYtuHY2Yvg1Z94NnuCi7U2v5c3Gg1orfNwKqVUfq/3vw0fvlhrxS4QBEEQwUUQhH54wxvewPfee2/B+8Q/AatajkqsaJd4stNksttEchYEF18S2XuQFA0J5aWXYi4WP1HOfqvZBrVpqcPxqdaH1Jk3DToZjWWDgqosmCEM62Gb35ohT8JwiV2JqCBI9RXSRD4kb/arpYQi6LSVag8T+LbN+9TGEyu//ixXfs7oUAO7Q33svM+xGnJ8Uh33v2tIWl6WvSSohMJLlWdSmPS5p/Lw5d/7IavozVcWXVq9gVo9xJBff2HDBeNpKedNcX2juXfNAr1ck/46CcOI/D0/fN9/9zd+4zfe8clPfvKzMnsSBEEQwUUQhC5ccMEF/Mwzz+RGSRRFSJIkT5Lb72RumJKrnSp89GvIdVvHIOvvR+wJvXi8UBVOYpv5Jai4fla5dxEzZ5WCfAhNlruCCNoqWJuFY0EDigou4GElKcMWMDYbzQkgBVCt6HJCWckQKhuMqoPgEhpqVHwdhoywaf0elUKlmIv/dwpZYzTLK/nfMfcXE8RdRKbQgyuPdyh93mqlN5eGW98nBnmhq1t/K38eeHkBDLbtkyfPgjE4nDCjQKChpideMGkrSPTqQlNu616Pq3MCmR5i2lR+WXI/281/XiWABo1g/T6qoFH89c0g4rbnsSBwFX6XtRc3f9/sr35MZP+V/JAoc64j5Tz33Liqs/OnYDht6Vtaa4CDxLCMTOhEc6Uo5ikZpWg46Wtw3MKntRZve9vbnvr7v//7C2UWJQiCIIKLIAgVfOhDHzr/E5/4xFOrq6u5ce8nm8OUfB6H4DLKyWOvLtejwLejF1jC7SgVObMxCx2y1sLmcUAERRQ8SSaQcr81MJmbSwSoOLNMMqFEx01DzZjMUnFiDJQCKAIiDSgNxAtAPIdoroZarZZXqdBxBK01avFcnv8gPy9UNHl9DoDA1bzwXrlaS+6yDoa1aW4Qhevw3zFp2rS4rG1aYMzOu8ULPpaAvE2CJbQTdSo/DwShwhP97POqEAu/Pr9M0wovoArBpup68BYlijZvbvh2cxKCzdZrO8TMDFuKZjBBqPL1INdXt/03avD15aJi0K6gzq9bljzcsVSFZPZzzrif461QS9ttyue2Kd8DwusP3ruuJHaybe6XUoEHHgM2zY45u+4IwXWc++9l+2uhtM72JcjzpditggGiuDhuK24d49m2TGQVIwtpEsFlFKLLlVdeiQceeEDsBEEQBBFcBEEIueWWW77yhS984TpmzpPkpWkKrfVAIUO9Vg+aJsFlLSa8VcmAm6JWBGsAmz2ddeIL5Z4wnBqwIkC57xsvOigCotiJLcgElXjOGThKA/ObobZsxZbTtmPzqafjtDN2YOtpp2PLKduweesp2LSwBVFtDqRqsKSaJVPDhMWBHhCeBxu8plI7dmrXqnKrShXDyarKsRZKugZCDjFAJgXDgFjBZkKJXzJZsEHL+/nnbJCmFkQMxQqWLMgSDAzIEixZwGTilgFSTvMlZb8HpyAUxaawmlcnIYosw6QN1w8yA1AxYNB8bZMUBu67KdvCktnAGoOmV0DreRgmx1IvVHnA9XP9D7t/imp97V9L6Xkddcx0EmsNC0BTm0wmSnUMRYqUbuZoUq2eNPO1ubYhP1AETapjSJBS0VDHD6VAqtULkDLBJUkSN+4Yk98fkiSBSVLApmisLINMCmNS2CSFTepAUgcadSdGJiuZIGgzocU4Lzs2TkghBtIkEECziyAPFXTiDSmAOc01Ga2yhK+phaLs2iWCMZyPXUplQ2XhwigKSEyoFFjWi+CyFvdCfw3v3LkTzz//vNgKgiAIIrgIggAAL33pS/kHP/gBlFLQWmeTVZMb+kmSFMJRJjX5G3biOy7Rptf1lPPThKKUUpEzEIicyEXeQDeZLRTBWOsqGKkI0JETUxjudRwDW0/F5h1n45zzL8DZO8/BaWfuwGln7sCWbadjbmErornNYB2DdQ2GCKAYqWEsnjyBpRMnsXSyDsMWNuU8Ka4/5y6UqaqKTLPqB0xabcj2aGg0nyqrLLygdclhKFLptYYPVag+N2H/LVe/AoAo+LzqXHmxrOq4iBjgFArWhXN1SD5a/pygnVBjLFQfuSRaro/s6b1vHWIunK3y68olMRRT5VJDtf+8kxDhz4q1Le8zUc/72239TihDQbAKl2S58FqDCq+5lFi11/BD/7+l6us9/zwQlKqvCTWUwW6890amwrAPAeo1kUvFfhf6mOW24xlZg4gt2KQgZrAxgE3BJoVJGyBj0FhdRtJYxuqJJZxcWsLJpeNYXFzEyaVFJCvLWD161IkzjSQLOcxC5KwFOAGQiS82CYSbrFwxyvlenN8MkfNta4rFTbHFHVsmYlHr2DGRyfWUiDKD3Bt9dSP/2ziOUa/XxV4QBEEQwUUQNjY7duzgAwcOII5jGGMK7tRRFCFN0/yzWZj09Sq4jGLd/a6jLFgVDTANhgJ7o0l5K8G782sXHqTngLl5YOEUbDpzJ869+EW4+IWX4oyd52DbznMQLSxgbm4eFozEMIx1K7OsABUhtc4QSxlYOrGMY8cWXX6eqIbEWEARFDSguJBLxos+VYJLdjSVORxCwaJKsGsxMCoMxSrDkbIcKH5Zbs/Ogk6rMdzLOe74XWIQUhSr5hRz2IRlj8vCkeL+S0IXjH52OX2IqOAZY8AtwkLnpc09fMpLDd3hcwDGdlx/eT/Kr8uCSPn9bsdBtrMgEwo4odDjl8xUXTK9NGa0E93a5S7xy3L/rOpPw4xLNsvvFAp8DNNW6CsvvWCk20zx8n2zzXZoercBEUXBBNHmnjHIRGNNTjhVmfBBHFyXbJDWl9FYXsbJpeM4fuQwjh8+iGMH92Hp0AHgxDFg6ShgEheKhAaQBuJLsD8upZEBrAHDQpcEF5tVQrLI8mNlh6toepJWT4PwMkhf9A9r/PyBmXHHHXfU7rjjjkRmW4IgCCK4CMKGY2FhgZeXl/OQIS+wUOZlkSQJ4tjFxadpiiiK1mySN87qJoOud9j9KXq0qMIElZmAaL6ZqFarTGAgYPNm0OYt2HnxC3HOhS/ERZftxgvOvwgLp54BFc/DUIQGgBW2SLwnBtyTxoaxUKQRRTUwE5KGweLiIo4cO476agNRFGUlPxnRXBaS4avmWGojOLQKCIDNQ6EGNxpsZVuHlbI6GSbMVEp/wvlry5y/r7JqQn5JmSXWzgOpt7uizdKwNEOafPUWBd29SpHvF222WxasyvlwAECrKA+vKiR7tZwV/aX2Tg6KB65uky8tVYbChPtR/tyCO37ez1KB3HHYAZY9lPUOBTTvcdVOUKt6v5MAB9gs4TVj0LLOTjBpn+jHWs5fk89JE37uehOIW39PBGgdgdk6jQa2KIQGbZcLH1wUZbzg5F8rDq5vslBww54mhmYLbVKQacDWV8CrJ3Dy6GEsHdmP/c88jQPPP4OVI4eA1ZUsDCkNQpJSgFO4/EspFHEW6hdeUNSsikQut4ziZmn5qrAiEV3QVdD2cwmtdXZfY8zNzeF973ufVDASBEEQwUUQNg533HHHjo997GP7AeT5WnwoUZIkufDi87eEk+V+J4vD5H7p57fcY0nfQfdn1JPXsDwtEYGjOTDFgK4BmxYQn3Emdl78Ilx82W6ce8mlOGX7Dsxt2QYbx2AVIzE2CPNxngyGGKTjwEtJg5Sb+DYaKY4eOY6l5RUkDYM4rkFrjTS1TVdwOC8JzpLEEnQeVlYwmIIn46S4+YQ88CApn8teDAlOTaX3QK9CiFLVuU+qlqyo5f1256uT4NN6XMVQGwObv3b5ernNaxTc8TsJT+3a0XskVXmKGDBipXv0cOktJKd1qTq2c7v9aufxMtiyvYdOZ4+dYIzrEPrVMVQsyz3STnjptCTiroKO272OQVt9bTfcT0sWlqnz8XHn9bT34FEtnm7M7ELp/DWuOPt9th5rEDG5/CxgKGsQkXufjAvdM40Gjh85ir17n8Ox/c/jyBOPAEvHgeVFIFkFkLpQJJsAJoFiWxReyOemanrplPexn3vLqAWSWRNcwmp7/gGOz/mjtcZ73vOej/3Zn/3ZR2QGJgiCIIKLIKxrbrzxxvv/5m/+5pX+KZQ3kp2Xg0EcxwXDud9J5yQEl+Zvqr6vuhrSbQWACuO3awgKVYeGMLI6plBAFLmnqoaBKAYtLGDTtu248CUvxXmX7sYll16GLaefCa7NgaNNaGiNVQMY0kiR5TjJskAyG0SkQJGGycqjOg8llxNmeXkZh48ex8mTJ8FM0CoGQLBMmWeHzj0NrE3zpJm+/QuVhAohA93bq9xW7UJ68v/tYC7sHmOSguFeNuBhbKXQ4r8X9odec/2En8VK9yzYlIUUS/0da5X4xJyVA2/z266iKdnhDEBWPV/bvRp3feVcIjtw36na/37LxFOb4xtV1bbu4W9mYKHY9z/u0M9UyQusdRs+JJEKHkwKWblmOE8zReTCnyzlHlBQBBNUJiKiLBk05/lZODWItILOkon7imaaFGJuIF4+BnPiKI4c2IvnnnkS+37yBOoH9wLLx53Xi6k78YVts7KSb7Ow7DYzCE1B3L8uj/NFoauX82p7uj/NqugSClVKKaSp83j0D3AA4Kabbrrvr//6r18rMzFBEAQRXARhXfLa176W77vvPoRii69cESbJbTeZGvXkb7QhQxYEDibDPvsJBSVBVYdJrs0rZXBhwut+R0QwmYu8RTZJ97kMABAIVmXrzifx2TpUBCaVJbutAVENOOU07Nh1Kfa84pW4dM9LcfrZO9GINFY5e9JNBENORLGkQErDgmHYlY1u5ivIa65C6Xlo5fLtnDx5EseOLeZCCxGBLfKS00w6y2Whc88DULqG56vKuBh2/aolhMgbet0qK7c3iPrZfz1k+9nKHCI9X09Wbs2DCD3jmNiMw1Beq2pqg24/FE7b5erplFMoGDIrz4dPzhtuy4fQaQKI66gpQFlXZj7mFPWlRRx8/hkcfOZJPPmjR4Bjh4DjR4DGSQCuuhKxcR42nOblv5VSTgiyLueMUgqpCcYHUrBMLkcOfD7xTBjywpTPoZMdmfJVkMrNyFH2OztR0WWt+tfVV1+Nb3zjGzJYCYIgiOAiCOuLXbt28U9+8hNYaxHHMdI0hVIqfxI1NzeHNE1bjJNRlHdeS8GFSxP3cBNU8QS+yiOltfpLdvxKB14CtrgByraplHtBGtA6+0C7RLdzm3HhFa/ElT/1Rlxw2W5s2rYdVs9hlRmr1iLNwoKQTfB9HhZkT3QNMqEsm8P7MrBEBKVjmFRhcfEEDh8+jNXVVfh8CioTApqCQNYOee4QBYBd6eMOXgLTLriEVWYG6bc0YcGFyQ53LbGSgW6KJjbTLVCPfvuKh2uXbnph1+0r5wVjrYVWhBgKmi0iMqhZC52uYPX4ERx85gk889jD2PeTx8FHDrjS1co6wZkTJ6RbCxhX5l1BQZMbi1llS7jwSxBBaffAwns4MZV7Uzamt+YHd4IvR9lv2idVHscDj0n0L5/n5dWvfjXuu+8+sSUEQRBEcBGE9cEZZ5zBhw4dAhHlSXDzMJEslCgMI6lyiZ+NJ7Y2n/Dmk3fmZlJSRjAhthWCi3KJTLOnpn6deRULpVyF0sx7QlGWTNMnrMy8hRDNZY88a8DWbThrz8tw5evegBddfgX05lOh5ufQsIzV1DnRUxQDipoT+bLopaik7WgoFYFIQ6sIjTTB8eNLOLD/CBLDuQeTS3LJwfp0LrS4c6pL+Qps32EZoxZchhH8OMgVMYjxS0NXKBlO8OgmuHC3kBURXNa14DJp8aWfbXYLKR2kbbp62NjWsYONy0mkiKHZoKYZNRgoTmBWlnFw37P40cOP4MgTPwT2PgukJ10lJFN3iXc5BcEn16VmJyHOEvU2O06FZpLfO7LIpEJPayZ9Vvn416kdZ7lktBdbwvCiK6+8Eg888IDYE4IgCCK4CMJsMzc3x/V6HQAQxzGSJAERYX5+Ho1Go1CRqCrHxKwaDWHVk9wQpZJ3Ssv+UEGcaYZ3ZKILM7TSABSsAUhrl4sA5GztKAbiCNhyKs665MV4xevfjBe+7ErUtm4H5udxssFIlStHati60rQ6c7XPQrpC+cDn1rFUFFuMYURRDWDCsWOLOHxkEaurq3nC3ObxoJCYt53g4n4zWbFlFIKL5eH6qhpBSNM4BZeqHDiFa2mDCy7D5kqhsfTp9SO6jHp7ocDfb9LzqvFB2+bYbwyDiaC1y0lmbYo4jgHbABkDrYBIMxRbmDSBWj2Jo088hmcf+QGee+wh4NhBgOtZ1aMkS9diMtHFJe+FtYB26bg4gcurleeh4sK9iMjfX4rjRDGEyrZtg15ymq2lIDNspT+fU+rFL34xHn30UbEpBEEQRHARhNnjYx/7WHznnXc2vAdDWLKxKimqf/o024KLq6Sh4PJZ+CeTxlejIFcFw3syFI6MfbWK0mQ4/BJlpYUNAGhAzwOIAD0HbD4F8y/ahVdf/Wa89GVXYPOpp8OoGHUQbFa22WahRjYrH+xyAyBPMmmti/8HXNWOqqS1RBqgCCsrdRw8cBgnT64g0nNQSiGxrVV+nIijCiVZcyPHUmEiT4on3GuHE3x4SMGjW08f9lroGlK0zgSPUYsT/a5/GgSXcRrDox4/x1GRrSospiyu9JMgvZ0Qy8xQxudTcWOeAbvS9hR8z2aJXH1SXzbQYEQERNagBoPGiWN4/seP4CcPfhdLT/4IOJ6JL0kjG6Oye6oxAANR5Kvz6Kz4us29Vdx+NssiETfvMBb+vtQ8PoXZEFwG6S9+/uErGcWxyzf2ohe9SEQXQRAEEVwEYbZ4//vf/9677rrrTwFg06ZNaDQaeUJcb3inaYooiqC1KxvcbVLXb5nmSQkuYIa2Ck52UXkqXUPsBBcvunBZcHHTYA6q1RS9Y7I34gigCLAKiDcjPucivPK1b8TL3/gmbD33PJj5GpZPriK1DIpjpNYlzTVsQVEMosxzhZEnVLTW5c5R0XwztAfIJ6ZKqaxksEajnuDw0WM4fsxXHYp8rkaXgFK1uqH7z1tKLvtjFsFlJDe2YQWDcbf+pHOATHzisoZJc8dtEA9yLtfq/LfzNOrXm6VfFNvCPpjsjCqloLSGTRkWxiVBz8Y6ay0Uu+plxjDm4wgRJ9DpMuZNHY2j+/HEg9/GY//2HfDB/UCykuV3aQDGAGwRKYKxBkCcHXBRcPHJ3MFUGKHKggsRNROxD9A+0y64+N94scVam3t2vvCFL8SPfvQjsS0EQRBEcBGE6ecXfuEX/ufnPve5a32uljRNs3weOp/gaO2q3IRhLFVPHcc9SR+0ZHT7gclmE2/VUpEoLzhaEVZUjkRpVjXKp/JgFYGjeefVsu10nH3FK/G6a6/DhS/eDYpj1A2wahic5U3xlYSMtfDJa8OcqgwTlAt2eVqsaS1L69bhDIMjR45jafEk0tRCqxoA5VznM08Vioulhv3vQ++WcU7Oh/dwGF3S3Fm8sfGQ7T5qD5G1Z9iQqOEEO0WzPbWZ9qS64dgzDtHFWgsNrgy7S9kiogiWLMgSmJt5y1K2MBaguObujzZBBIsIBhEbKNNAbBp4/seP4tHv/iuWH/8hsHocSOtAYzkvMe29U7w3pRP1GYp9UWnncemEFtty1RMVc1D17aE14f7biweO/46/J0VRBGPcvXD37t145JFHxL4QBEEQwUUQppdrrrmG7777bgDIyz37cCLvKeEnRv59/73wO+FkuOklYSdedaPrhI7hPFiCXBYKCF6rTHTxxpl3/cg8SpgC8cV7tmiAYkDXsOm8S/DKa9+Cl/7UmzG/4yw0ohjLiYFh344KqXVlUP1kHnAhSD49CzNnT0ApS5RrmvvEKs+rAmQVpBKD40sncOzoItLUupAipvx/reLmJDbz4PHnKzznZWEtPMejEtdGIbgMmzS3bHz0lehzygWXdkZqmAC7m0E61onB0CFXNNT6i2EcIrgMYhCvpeDSr/hSvi+Vr/OmuNy8ryVJgogUKNJ5+elwP5VyAnkKzscPt0YLsgy2KTQzNKfYEhH06gk0Du/FI9+5F08/cB9w4jiAxCXaTROXaDe7pxC7e5KrVUdgEIwXZPLvcD7u+P8GPQ/TLrj4ZO4+rKjcD6y1uOyyy/DDH/5QbAxBEAQRXARh+njVq17F3/nOdwqGftWEdC0Mrl4n3sMY6JW/tT4UiPNEhSBX8RMAtJqDsXDhPURgm0KRRZSV50wAgBQoitzkN6oB85ux5YW78dM33IRLLn8l0ngedathiJDCAioCaZ8jJ2tnLhr+ZCkXdUK3cebAw4gAJg0LAkGDSOHEiWUcPnQUy8urYCZEOoYLkyoKSEEDdDZiuiRlnXUPCR6wvwYHOFP7P3rUSKvKbDSGT7o8nvGyalyuWtfQHmLcn9BSFk58iGW/9xf/vi0fkx9zswToCrrlGrMUjNXWC9fBOWWblYZ2OWI0GdSYsUAp6scO4tEHvo0f/+A7wIFngcaSCzkicgIMu5wsCj7zi6tC5x9qOC8bN+wQOQ+XQcatduLTuEO4Rt1X/b5ecskleOyxx2TAEQRBBBdpAkGYHvbs2cMPP/xwbryHngvDuCgPOmGaiNiSCS5EBCYLq4pWbF5kQiuwVYDW0GxBbKGtgQEhrc0DOgYMA5s34wWXvxxvvP7t2HnZS8BbT8OJxMKSy5lSZTwQtyaJzNtGMchyHs5V+JwtGASLCFE8h3q9gYMHD+P4sSVXCEPVXIUL0gCrgkFQFltEcBm87250wWVYDxMRXKZTcOl1PdMuuPRy/RTEkpYazeXjyzwes6XKcnuF1enCcdOk7KobkYIyCeaRYpMyWDl2APufeBTf+9bXgEP7gJWTgG24ddoU1iTN482OlQrjts08Tvscr8r3mDXKlTOu/uoT+1trJbxIEARBBBdBmB527drFTz75ZD5RaTchmzZjadiyktUDUzEvC8Mnvi1ZtLlgkgkl0GClgSgCTt+Bc694Bd78tp/DjgtfiEZtDssWWAWgfBUny9DQecUJyks2x8XJug9Vouz5ZhD2EeZV0ToCQaORMBYXl3Ds2CJWVxoAIijSsIjg88AgcEAvCy1h8sXeJtt2XQ3sw5qjNOP7P/w1N96y0utdsJlWwaUcvtO+/022rDgNnTS7z+u5JMAwKRDbTKixAHGWbyX3cQHYVTTSbKFM4vK8aIK2DdTSVex7/FF8++5/hHn2CaC+BCTLLqaIk8yVRTt3ltSJS5pQCGkd9fUzi4KLUgppmuJVr3oV7r//frE3BEEQwUUQhMlx/vnn87PPPtuc8LfJ4TDpJ13jFlqaAkc2p81ctDkQXlo1CuW8WVTk/k49HZe85qfwprfdgDPPvwirKsZSyrBRjAQES80cEZoBxS7ngwYBqUuMq6gGG2yElatWYdyeNM+DygSRIDTIGMbzz+1Ho5HCpOzEINYupwtpaB3DGFsyL4pPYMsGkwgu/fWvSefw4AldW2sluIx9YjLh8zesYDDp8XbWBZdWD5aqjVgoVm225IJ/VJjfC4BR7l2lsgSvaYIoVqiRhrEp2FjUtELEKVSyilM149nHHsR37v4y6s88DqwsAmRcfhdr4DK6EFQmgLF1gaQ8pAdip9+Mo8rgOMYkn8zf85rXvAb33Xef2ByCIIjgIgjC2nPOOefwvn378mRzURSNPSnmdAotTfHAIouFZ2R5VFQmgFhAUeaJogCKYKGd0HL6dlzw6tfhLT93E0475xI0tMZqaoBII2XAEsGXF0rZe6U48USDoJUCpTYLZ8rKECmfdjFIiJtNJKOo5taVWsTa/b94fAmHDh1BIzHwOVqYXUJHlYUw+ad/QIXLe75UQ03Sp9FgHLdgUXDJ72KwdW3LLgZT97LQk63Sk1f0apMjY+YnLuMOqZyS62fgsXaWBRdWUKwqp6c28Dxy1YNUSdzIKsmxar2Wgqp2eeU3rfIKgEopaFKAsagpDTYGhBRzEWMLUjz1yA/w7f/598DzTwCrS4BdBZC40tJWAaRBrLOQqkbHa3jWPFz67ZM+qa61thBe9Na3vvXwl7/85TNk1icIwkZDSxMIwuQ4++yzef/+/fnEZG5uDvV6veDhMi2hRGPJ1dLO1Mzm28SuQGcz1IfA0GAVg6M5MNWArafhgp96M276td/AVf/xbcCp23HcKDT0HAwppHBuMi65roHOxBRiQJN25T6JoBg+MN8rPS5pL8JJvlvGuoY0sWBWiKM5rKw2sH/vARw6dBSNxEKp2D2lVe5pKkFnIhoVvZeobFxz+EHLhLtXDyfCbOSg6GBdDLUfNPSzhEkHNQ2//Y2cNHfYHEbjbqJ+yu7671M/1wRNWnAZKgtTdv1SSWzxa6bsI79kV7GIXJJ1QpZlPf+O+3OV79wg75PdGuPCj2IdA0yw1kBHERqNFGpuAauWkaoICWJsO/MsXH7FK7Dt7HPw7L59LpTIWtfWytUvQp77y3S8hvu5Bquq0E3ztQU4D11jTOG7URThRz/60cJ73/te9cADD/yTzP4EQdhIiIeLIExQbNm7d28+QdFaI0kSxHFc6eEyKy7FVcZBP79lgvNYYQZZk5XjdGE7hhQMxUBtHti0BTuueBX+w02/gPNevAerU1zbgAAAIABJREFU0Di5moLmajAUIQW7Up3ETj9RDOufbLKbcOtsPxWyctkMQBGMsrBZ4kXAhR01292Vct40vxmpJRw+egyHDx1FPTW5yAJLUBTlx+TPL+DKm5KueAJbPXXtUXAprm/oHAoznnSWeEiDk4bNQTFeDxfJ4TJeZiVpbrv1dut/oygb3ams88jaj1UmcqvKK6MYUNT0DjS5qM4ugW6YHwsKiTWIozn3oINTxEqDYGGTBqIoAnSU3yvSNIUiRk0p1GwDm5CAFw/hB/f+E37ywLddVSPbAJCCzCq0cveSTmlcqhKytzsnZcFlGsKKe+m/1lrUajU0Go1c4NJaI01TfOQjH9l+5513HpFZoCAIIrgIgjA2XvCCF/D+/fsBuCc/3hCv1WqFuOcqY3sSgkvfFYsUAZl3SvO3tnLK3CK2sCrkk6XMTZyhgGgOiOax9cWX4/pffBfO3XMFkto8li3BKp0nz00zk10B0FqDTQpmzkODIhXnggtbygUXAIBmpDCw1DRbKFuvygz5SNewstzAoaPHcHxxGY3UIo5rAGkYw7lQE54zL6y5FuAeDWuqFNpaJ9wlwYWHEw1mWXBx5bqHvLWJ4LKhBZdJhxQN4tVY8IhZg5CiUQgu3ULe8lHSe+yUhFRVuqdQduztBBffLqRjNNLEeTgSwCZBHCkotkiSxN1LFOVCu6YIIAuyBsqm2KwstpDByX3P4Lvf/Br2/tt9wMpxIF0Bwboy0YX94uB4KGgrQktVOnIPAHLxrKJSUbt+UT7OSc4H/AMkH1qU941mUQCxPwRBEMFFEITxcO655/Jzzz03sJvwOIydURjY+QSR/IRPgdjnW+HMiE2bCXEJ0KRgUnbJZ6Gy8B2Th/a4iaYGVA2ozYPOuRDX3HgzXvqma1CPNyGlGCk02Ff+IVs0ArhkwFYZ0tysNqRUBCiG5QTI3c4tYhUDHMGFBEU4dnQRi4sncOLEMgzD5XPJvGZyYYRstRHRyxNKHi6HC9O4z/e054iZjhwqk7weZ3piImWrZ7p/KAwX0sXUWdCp6h/he8YL5B2uY0teQLctgoXP9eVfK86260Nb2WA+JkS2gU28iqNPPY5//srfof74I4CpA7YOpA0oBYBT56WpgCSLQLJWBeNEVgWPKBv3TRARpvIHF81xyea5xdw91r1PAFTWVpaoJ9HF540re9z0e/0NUsUou0/KhS4IgggugiCMlgsuuICfeuqpQh6PvpKhjskQGaXg4uSVpuDixRaX3DATRCygNWBToKZdclmrAGOc+KKiCDarGIR4HthyGq687nq88WdvQG3H2TiWMBoqBiPKQoQAsgxS2T5YrjagS4IMcu8TlU8ClVJIOcm+B1ddyGoQKaQJsH//QZxYWobLk0Eg6MyLRTsvHTYF8WdUgks/518El+kTXApJfYfMMbLRBZd+2lIEl40huJS/M5r+54UML7RkAZuKXKiqTRCjjlNgoFaW8MwjP8D9X/kicPwwsHocsA1ozWDTALMrpmdSgKHzMBuwSwZPWjVzfVGabU+VxpI0GF4oEGScF0+vgsuovWS7ns/S5z68aGFhAUtLS2KHCIIggosgCKNh165d/MQTTxQmdFUTx16e4E274BLm0PBCiw2e2hEpaLaILGCsC7BJAUS1GKkh501S2wQsbMW5r3w13nLLO3D6+Rciqc3jZGLAOoLJNqehM8Gl2aYmLLVcgWFXOSGvFsQm33+lXIy/F2LYOq+WkyeXsX/fYSSJQaOeIopi5xETeLYAqiC4DHzOWA1sjDozYdwG2cYWXLonPdUinkxAmBmVwS2CypDnZcjdH1RwGZWYYIPqcZq4kMvLkqtIZMCwNkUECzRWsFUTtigCn1jEvV/9EvZ9738Dq0eA5ATAq8GY4lauSQHsQlzZZuIJaYAsdFZFz0KVKtnZLFdwdq/JH2w4bxxfBrv4u85tNIr26ldwiaIISZJAKYWzzz4bzz33nNgigiCI4CIIwnC85CUv4UcffTTPz1KoVNOD4DLup7ijFFyIiykObZZSo5D80FgQCJoZWisk1rryzkRAtAmIT8X8eRfhhne/BxdccQWS+U1YMhYGGqx0LpL4SbAigoYGTBY5T6ajycxUPAfWpoU4+cS6J3BsnefKkSNHcejgETBrWANEUQxmyibKRUOfiMFZrphxCC69rHejCy7dPNW7n5fpzqEiQsv6nrqI4DLZ829LIof2VY4yUsOI5zchNQZgRkSASlMgSbBZE7Yo4MCPH8Y//d1ngH0/AZIlgBIgaSDP5MIMgisVyuwfErh8bnG2HZPfN5tii5u4e8Elyqfxbn2BF2kPSXsLIbBr3F/9tq21eNnLXoZ/+7d/E3tEEIR1i5SFFoQx86pXvYq///3vuwtOa2fIc+8lI2fOuCBkIURuQunKdbo6z67MM0OTEyagnLiBaN5NM/U8sONcXPXzv4hbbv8tnLprFxYNYVXHSKCRpIxYRSC4RLcgl/eFiUB5skELUpSHC1X+qWbeFncuQpHLPWlkq8BMOHTwCA4ePAJmlYstrow3gxm5p0xxPcOW8h5OMBi/udbfE821N5iHFVwmXRZa2MiCy8yfnzGvYOwPIODuV0wKlKW8zStNA9A6gk1TmNQ4bxxoWNIwFMGoCMvGYNPpp2HPK16NtLYJR5/dB6TWxdLmQk42zCiX18WtX2UFsRWALIk8+S+y827xOwNXitoW9o/hUwejB8ElbMe1vqZc+K27X+7btw+33HLLax5++OH/LlePIAhyXxQEoS/e8pa3mLvvvltZaxFFEaIoQr1e73lys1aToJHncMnyl6gsjohJ5VPBwhM4FWViTA2Y24ILX/16/Kd3vgtbL3wRFkFYbqwi3jSfe5yoLHwH1k1GbbYtN/1kqCx3i+3mYaAon/CV959II7WENLEuX8uJE1AqyrxdVPZUzg+gulCFKJ9EquEEF7etwc/9+FMRDhtyM26PLRrr8XW/bnVlOwxSfUbYeAKMeLhM9pyH9w8nqDjPEeV1DGOhtQa0E+FT64QDRRoMi8QmmNPAZjbYbFax8uxP8M2/+QxWn/13oHHSJdZFko8zmrKcuZnIT6SdxELN3GPENp+wEzSYFEwzu67z9GS3n/16CFWV+R5lf62qRuUrFxFRXi76ox/96Kkf/ehHF2VEEwRBBBdBEHriHe94x//4/Oc//3PWZpMzAGmadvRw6TVOfZoFF+fR4hLeklWZV0soxLgqC0wabDQwtwU463z87LtuxeWvexNW4hqWGLBRDIaBtSli5SZkxMqVmYSr6FBw/SYLhSx/iokqDWhuqVKkgvKbBMMMZsLqSoJ9+w6g0UhBmSOgykOZCIqi3BXbTxxV4DWTJ+/FYElz2Q5WwWqtBBcfzjWtBvKki190Ml5GcW1Pu0E+CQFklkSX9Z7XZy0ElzUXXbJQWWKX14XZwBjjHgSoCMYYN+4oBRu7+0CcGtTYYjNZzCfLeOier+OH3/oasHLYCS+2DnDi1q2yXO/KJcJlUs3E6zbzZeFiG7l8MvlNwwlCjKCKUf/ttpaCSxRFmbeo+99VBTRilwiCIIKLIAjdef/73//eu+666099uEmauhwhfoJRnogMWiJ6qgUXVgAiEBOUdbNwzj8HQDGw+XRc+oafxs/+8q9Cn34mTlhghRQaTsFATZFLBJgltXXeIxGY3TNHlYkuLpmhq+5ARCCrs8S9tiDItB6lgrWZWMIKDeMS4j711HPuKSK7sCGtde7VolVcKKUZJtvNXwfCzjCCy6B9QgQXyfGx0QSXaTq+DV9lao0El/H1Ndu8P+TCiwvV8fcjIgasE1z8DmsdI7EGaRYOFCNy965GA5uUxRazisVnfoxv/NX/ByweAOqLgK2D2EIRwxgD0llIU+C9AkYmplhfSDoTXDI1hp04o3yaF+qcLaAZAlsUQAb1cun3++F2rLWFhxXbtm3DsWPHxDYRBEEEF0EQ2nPnnXduuvPOO5eHmRhOIp663+/7Eso+D0qYdJaIYIyBUhEsezFJwRrjhJZNW4Ezz8Lbf+V9eMlPXY1linEiZSCag2V24gkAnU0wOXuP4RMaugmaypLLKjgXbJPNUSMmsLVu8pqVagbcxM7Y1C1TC0sKiiIALhnukSPHcODAocyDReWTbnfQKjsOHZynTGQaNkluSwMPl3S1l7LQHffVdukP1CWkaGiDVotBO8PHG/atcl8bdUlaof++Mu7qTmspuIz+/mkBMs0pcvbgwBbGvizEKE+A28z/5e9JFgCUT4brwn1iWCzYOuYbx/Gtv/0cjjxwH5CcBJKTIM3QJoFlAx1pJKnJ8qE5L1FFlOUoc/cz/2DDe9+4rVMuC/XTPlUeKIOMP52+124bVb+5/PLL8YMf/EDsE0EQ1g2SNFcQRsw999yTDDsBnPZwonLekvIEimChSMP6cstR7Lw21Dyw6RRc9Lqrcevv/D7OedkrcMgAdR3BqBiGGaRc4luVx8xrl0SQKMsuiCwhL2eKMedDGWcpB2EZWikYYwFixHEEIjgX8Eg7d+8oBlEMawnWAPv2HcLhQ8cQ6VoxgW5BAFEl47G5HO05o7H+vF058p63TuM1mImkys+sii1VxpTkrJm+vjLOhKk04RUMdzw+Lsdm4bCuQhERZR6aVNhHBmX3AZX/+Ym1YQaTBpQCK41UKTQIQDyPF+95CRbOPBN7f/KkS6ZrXGiNgntYEUeAtS6/i4o02DIsW6gsKTuFd7wstwyRS0zfz/hf1We6fT7sOSmXpS6frwMHDuCd73znngcffPDzclULgrAekFmQIIyQhYUFXl5ebin7PA2CS9mFeFjBpZx0trk+C60AY+CqAVEMayNg0ynAth24/t234qVvvBrpwmYcayRIoxgM5SaZiFzelmwbmpteLIALG2Ky+VPD5kAWo/k0EmCTIIqyaS9ZGJNAKeSeN6woy8VSQ301xTPP7EWjnnnkBC7OoaeJazNVemKfxdjnOVtsUagZ+GSN18Olm6HWVU8Zs4eLlFVeX4KLiC7T10/GeT4m7eEy3LHb3MNSceZdko3HRnnfFlPM08UqG7MJil1xZ+eV6Us7W0C51woWNmVsIott2qC+72l87S//HPzsj4F0BUhOIELqqvlFhHrKUNrde3z4K3EQ1ulDitRgHrSjFFx6+W65FHXVWOGT6IqNIgiCCC6CIBTYunUrLy0ttSTFHWRiO+rJcJU776CGXLmyj39CFcaAW2sR1WKkrF0M0KbTcPZLX4Fbfv0/Y+u5F2ARCouNBKo2B8MuJEkpBaSm2X4+hKc0GWYCTBbCkzlr588UFevs+BjMNhcGjEmy5IYK9XodKqqBSOP4sRN4/vkDAGswE7SK3bFwWhA+Qo8Xv6+uHWZfcKmccIvgsuaG8qBu/NMquHQLUxAmJ7aI4NJ+A5aaydV1lvRd22bOlPD+A1gQaZdDDE3BRft8ZopgYWCUe1BA5JLFAwqUWmwixhauY+vqIv7X330Oz333HmDlOMAJtFlFHGmk2b3IsqshTeTuj80wItsMd1K6dB/q/focxfxgmN+EwotS7gHM/Pw8VldXZeAQBEEEF0EQgHPOOYf37dsHpRSSJHFPoYaY0I5bcBmV0BIKLv5/y5SVelZAbR7Ysg2vvemdeOPbbgRvPg3HGwZGa1ilYUyCWDuvkyiKXFQ8M5RtBguFlYiqj0NBZ0NZ/lXFmTdLAmZGFNVcrhmblaBkxuFDx3Hw4GFYQzCGMVfblOejUVnulyrBpSnoBKLaOhJcmBmqq0+6CC7juC5HnUtjGoUYYfJiy7jPx7QLLp2wWfUfYkCzy8+ird8vzu5Hxdwpufdjtt/++0bZzCsT+X3Dj28KGkgYW2sRovQETlEJHvv2t/DdL30eWDoGJCtAuoI4VrCmDmszj9EgzFURgdk0RRdF7s/yTPXFqrLU/iHOlVdeiQceeEAGDkEQZhrJ4SIIQ/LKV76S//3f/71prA8ptox6IjxqsSXcv6o8AJY0oOeB2gKiCy7BO/7LB/DSN/8HNDadgsXUoqGi/Ekcs4UiNEtCWgYbA81uwmsBMGxWj9O6BIIlMUCB4dIJ2szUNzDWgMhCKZ2dEw1FEZiBRsNg//7DOHJ4EcYwiDRq8XxWSUq7fcrds8vx5VQpKTS/wqXvDdwD1uTn7dzJJ53DZSM8C+hWGl4EF2HcY/vYBJcZvvydOOJ2QLELa/WpwZqfu9wpKvzIJ1MBgwhgcJBvTEERXD4YEGJysUkqjrHSSGBVBIojnLFzJ86+eBd+8sMfAY0EiBRsUkeklHswYS2Udnc8Brl0M2AwMsGCrPt/wuPnICHUodDik/ETEfbu3Ytf+ZVfqX3ve9/7hlzxgiDM7PxHmkAQBueGG2546G//9m/3+IlCHMd5CehJGh7DTMSrKthU52ophk35v1TPA3ozznvjtbjxl38FCy/YieMMnGxYxHPzsFBQDCRpHfHcJiQmhdbalcRkIFIApS4cqFD+0hWChuJW299VtQm8LrR1VZLIlXNWVIPWERZPrOLgwcM4cvgY5uc3ufLBrLJ9dx43URTBcukctvE4yb9DQfnpTAYa7gSOv0rRUHqKeLiM7BqtKg3frdrHrAoXIrhMj9gyVsFlhj1cgKZXpbbF+41Rrcep2OUWI6Lsc5uVjlawFFbTcwlxQRaWGRRpV2TaWihroNmipoCt2iI9+DS+9Jd/Cjz97wDXoRtLIJOAgP+fvXcPku2qzjx/a+1zsureqysJPRFIvCwhJBnES0KAZMAS5iEMqNtgXrZ5T5sG05huxswEMbSJmRj/0TETeDrG45npifB0uGd6OjyMcfdgdziiw3Y3doeHtkE8bDAGIeneK+m+H1WVefZe88c+52RWVlZVVmVmVVbV+hRHVTcr8+Q5++zHWt9e61tUgISShIBl6kVrkV/EMKMmXHTb/WqjfrHR3zfSZVmPYBn12VU6arTaaz55OBwOJ1wcjoOGT37ykz/zxS9+8f9qojNSSn3iYE4IF7FRxmuqjbG0xihrdUnqCA+xRqtEhz5PLruMgGbD0USg6MDi5bzuA7/IXfc/SDpymEsIXVF6BkGKfO8p56VHE7QI9GI2WAuAmOpolbTK+E6SjdtRBp8ibYi3Sa72YCoEQjZzk3JxqceTT57k4oXlTNCY1los2cADaG08SesSLiMF/+asLHSakPJwwmVnHOZRkWMbES57veqPEy7zQ7bM8pnsB8JFbaDcsmmr3zJIqffvM6cNmTaqYql+tWgFd/PGQD1+A1SW11kRwWK2HdQUektcVRp6/im+8i/+Ny59+2uwfIaSClKFlkq3IqftiiApIlQgTbU8ckXAseZQXbWmp3od03WC3zebf0b9fSukS/P+EEIbMdy8duWVV3LmzBmfQBwOhxMuDsdBQlEUBrRES+NADRsSo4yQmYvi1kZem9u9ykE2kuUKy41lO3jNJoZprlSpBMSU2FRHqHVRShUsRsAw6RClhM4hwrNu4d0f+wRPv+MlXNKCiryvF6WJQlknWkb6hnqzo2itMOFaQ61bVZRliZHLThdSG7AxQSgoioIqGhYhFAtcurDEjx49TlVFhLIVHhx+Hg3hpJt4DLJRNuYmZMSsCJep6n5MeA/mVYZm/4ymcB27RYD0RafHu9b1SsrOzDCy3SUEdqqfDJbkHXRunRhb2x+Gn/nGpc9rMXUJ67Z7Q+xkQmcgwo1EmRJHNNLpXeBPfu//4Pgf/1tYOU9hPVJcwTRgKWXCRQ2LqS0jrZrX68Hvt6EIzGwfaGsnWF39L2lNuCRp/7Yb/bmpJtjYVY2Nddddd/Gnf/qn3jkdDseeg2u4OBzbwJEjR2xlZSVHZRQFvV4vD6h6Z2bYQRg2YGet0dLkcBt9EiW/PvD9MvhKcy6p88EBy9J+ZtnDsPo/6kM1oGEhVyI6ciXXvvhuPviZ/4Irb76N81LQ1ZIkARNFRDe894EU+WzY2mDi/MBR34fWkUT5OrS9Twn5eqsoCAENJWfPnuexx54gxkSKoBraEp5Sa8IYNiAAnPPiNyZcdMO/Tq5xIhP3gZl6nFO+fscuOZJz7ljvFjEkB6R7z3pt2j8DZfOxs1brSzZsz0YrS9Z8XqgIRA3QKbn1BbfTVeHkIz8ixVRHgGi79qkKnVCQLKcxxZRTl6RZp5r1rNaeqb+s1ZPJC26t/9LYCSa7qgOTUqIoijZauIkcPn78OJ/61Kf+5Ktf/erfeqd0OBx7fBlxOBwb4aabbrLHHnuMEAK9Xq8VeWuE3sbZIdwpUdw1u3KWd9CEkKMY6pShNm3HBCHvJpGsJjXyTlm0HLaMKp0y0O0mYBGuvIY73vg23vy+n8cuO8r5CnoWMAljhRaPbJ805GjVO3TtOQKrIooakqvZOU8WEJSzZ8/zxBNP0evm3PYidGrdlrp8tA5fV6oN4U3Kam7GVU8aIZJkw7DtmZcQ9giXmRIIB5XIWG/+G6da045e6yZVXmwfES7Nz/1aGWu3+vQ4/XZd0kaLrHEmiSMhcaRa4tG//HP+7Hf+BZw+DulCnqNTysK5ZgTNFYuQVEeJaq0jk9c1VOpIl7yZIaZgBYNC8KY5JnWa0S3bmfeatb0oCqoqpx+XZUmv12vIF/ddHA7HnoJbxQ7HFnD33XfbY4891pZ/XlhYGEi1ia0WyE45TZuRLYm6zCUDkrKmiBmSZIBs0dZJNpTYgypmoiXfnxG0rjoZAt1osHgErr+BN3zk4/ydj36cpcNXcqpnVEWJyWjCYLNr3shQ26gsdafTQaUgxfr+UC5eXOLYsRP0upEQCspioQ25bgJuBh1PEduTjoc7So5pOog73Xc306uZ5feudxw0+BwyuzbcTtvGGCnKBSgXuRALzslhnnfXT/CGX/gYPP05sHglSAFaZsJEFQlKwnL56DVjO29EDAYujiINxXTqZMt223Iw7bCJdml+3nLLLd5hHQ7HnoKnFDkcY+KDH/zgr/2bf/NvXt1EsTTpQ61JMxDlMqiwPwtHZ3Mjrq5YII3yX13msg42ljqM2GqVPaPJJ89/D5rFbSUIyRLJEqI5yDhZAcVh5BnP5t3/8L/kBa+5nwva4WJSKilIliNNZMT1ishY968MpSDVlmKSXCK6IbgwzZWIotVkSkC14MyZCzz6o2MIWRRXVUkxt0N+NnXqUHs9aeD7bNPQP9mMq56SauR6kQAzJ4Y8pehAkS3jjsuDQhIdpJQix8605/gRMAqiaAj0qkRSRcMiy1Xi8JVXc8ttd/DXf/UduLRMDm+pICUSEVUIqqSU13QbPLdYK6q7qiNLP3moTSSS3eUzQght5OqggG6Twv3kk0/y8Y9//If/8T/+x7/wXudwOPbE+uBN4HCM7wYXRbHK8W2Il8Gd0XFKIu4I4cJgGUsFg2BKGAjCiVpX9UFr3ZTMvDQ7SVqn3GhNzVY9g8XLOPr8O3jPJz7NVbe9iCeWe0TtEMpFqh45pDnFVYbdcGrAZtevNpiKlNqqQWkgtShWOeTYTOj1enQ6C2DKuXMXOHb8CbrdClWlKEp63di+t2mP/nNIrVhuX7hws4lz9ilFGxEus18ZPKVoJhPIHEYSbDftb9Lv3M53jTt3Tnofuy2a62TL/m3XzTVzNGumqRCpy0dXRsBYsIojaRk5dYwv/9ZvYI98B+IF0Ap6y2BQBCXvA2lffF1Svb71Sy/ZQOloGaiklPv3dCN1tzoeQwhUVdWSLY2mi0he65uNLfdhHA7HXoFbxQ7HGDh69KipKlVVtREsgznGjaJ+syuznuG1E0aumdWCedZW/MFyacvWkZBEaioTSJNwlMsxi0aquIxZNxtKZsQuVD2Fy6/h6Xe9ml/8x7/G0efdxtmeoeXhbLBVkVKUkmJb+eyb0UeDJmCqCxg1NtfC4hGQklOnz/PY48dZWemxsLCIiFL1EouLi5hJS47l8pz9s67a4Zc0N/1uvZQqh2OvO+GzjKpp/MrtHv6cHbMgEkZ9Zu05EpoSwQxJCaoKo0KLQI+CS+EI4frn8OBHfgluvgMOXw7RkFCAQCKnCdda96t/N8OaCkYYYgmxNLAWDq+0u4OqqvqVnFJev1NK9Ho9mk0vVeV5z3ueL4oOh2NPwFOKHI5NcNttt9njjz9OCIEQsqZJjJGyLOl2u22Ya1O+cCODdtaGbhOpEZB6F1aQgfKPAoikWrsl5eo+kj2UXCgy/9PUIAhl6FCZ5nzxy67k+a95gPf9g89QXX4VF6WkIqcQlRpIMRFUsRRrKtdGOlfjGKlCwIx+CHSuYY21orZKUXTq+wuIBk6fOsuJE08CmiN0KiOETP5UVSbJqqpqDbbVdI6tIls2q9CwUylFu+YceUqRkyw79J1b+f6xI1w2Eb2d+J7Fn7mTLaOFp8dp240+I5a10gTLabxBCYWS6gWxMliJxqHLjnLz82/m+4/8ADt3Ou9CxCpL4lp/zYRGZN3a6nvNOr+qTBKDjOPu9o+mKlFjNzRiuc0a3kS4nD59mve///1X/8Vf/MX/6z3S4XDM9brrTeBwrI/3vOc9//K3f/u33xFCaI2sQTG3nTJot7aTlgiWSROrNUz6ocOpruKTCCVEA0sQipp3qLKxZwqmSqLApAOHnsY9f+ed3P/eX6B3+ChnuhVRdFU1BIDIgPE2yf1YHS1kFSJ9IqmtQpRqoywZIoHTp85z/PgTmEHQsj6JjtVW/Yc2oMezGRc9obDgepWsBisvTTazT7hLOen9+coyhXG8e073Rn1wnP45+J5BonXc+5/3KBNzDRfHBO25canopspQogqhjVBp1qVMnSiFdTliKyxeeop//b/+Oit/802Iy0hviTLkTSEzQ4K2m0Fa658xHGWzSnAti+VPe94bTCOcNI1xWNvFfRmHw+GEi8Oxtw0oa3ZZYox0Op12h2WWGi2TOmoqdcWNlnSoKxBZRMRIZmiR7S4zsAidQigQur2EBSGiEA7BkSt54Oc/zL1vewdnwwLnE5jmvbJgfYoCUyKD9hsaAAAgAElEQVQ2lfsR0bbUc9OcZrEmvIo6UqUECZw+fZZjjz8JCCmCarGFZ5BGEhROuDjhst8Jl91wuJ1wccLFCZdxCJdEkkyspDAs6h4wCkiRBYscDT3KM8f50v/868QffAfiMlRLlLXuWWWRsizodiuklmoTWW38N5SFjbv+zQHhArlUdFVVPPOZz+TRRx/1zuxwOOYWnlLkcKyDw4cPW5OC0kS2bOQsz5UR2xpP/foD2bAxUKMohRizHRcEigCxByGUmIScRlQswJXX8vaPf4qXP/h2nuxBWligG2PeZ6vzw1Mdm2x1FYT8zTKR05VSRLWfqpXDi7U2FhVEUC04e+Yix449QVVFLAlF0WmrFfXjpYX1I26sJXgE7VcuGkM2d9oG+noh6ts78c6nBK16ru7I7Rsncar9cma9b+fnVydcHJO250jSnTaPtiY/pBaRr9N/sVq8TOhFoReN4vARbrvjTr7/wx8RT56ClFAsR4iSI1u17rcamqjXulqhWJ1ybHUa0jjr39bbZVTU27YdlzriOAv7K2fPnuV973vfj33961//v70XOhwONxscjj2C22+/3b71rW+xsLDAysoKIkKn02nzigerFO2EAbvVXaCmykCj3WImNAq6OVIkkyyWoAiSo1woqKJgEqDTgaddwzs/8Wluv/e1PBWVnpZUdcqOxV4mRqR2rpvrsybyRye+h6Y9Y8yJSk055xRBgnLp0jI/euQYVRVRKQihJEZbpyT3ehEfQ5o7Q+22fgPrVJ7nzCrE7HCEy5prV19apjGO94PjPWqO3DTCzSNcnHA5oIRL//XUN9BF6o2NhAmEpEhR0otZ66UkctS6FKeP8//8L/8U+9G3YeUcZSFY6iGp18rhahCShdoBSKvGWiOyq1N0DQajW4aJl+3OiU1KUWMbNMUL3KdxOBzzCq9S5HAM4Wd+5mf++Nvf/na7sJdl2QrkzrPTtL7BI218R6qNKlGIEYJCr2d0K6VnIZMthw7Ddc/gHZ/+LLe95gFOp0Akl1RWVWLqkVBSzeHogEClkqshTe5o5hKWTUWoEApSMkQLtAhcvLjEoz96vH13s+M1mmzZgtFrOjGZslVjdCvaFg7HTpAi835eh2M/j7tY666pgVoCi/XvBSEViAR63YiWBd2UiKJcsoJ09TN48D/7ONx0MywepUdBZYFEDmdfLPM6utoF0HrNro9602SjY7fRrPfN78013XzzzT7hOByOuYSnFDkcQ/irv/qrf9Ys5E3IalOVKFe8qVrHfrvVNmYNwZBaMFfqUj+5gnKdVpRqcdwKtChIWuZKRIcOw9XX8bOf+hVuvefVnFqOrEgBBAyhCAVaJ4LLQLpOu+NbJ4MP7gBvbwcr1tWEpE7nCm2Ey9LSCsceP0Gv10TqdIjRasNrvZSv9fR21mu/zVt4rrGDKUUjn6/vnO9JDArcTiKay471vl2bYPfV83bsXnuul1Zk1Not0n8NJGu4RCjqiNvFhQ4pGT2r6BosHj7MLS+4he9+/2/gwkUIQiGCpSqfRaXVdluVdCs1ASP9akbTuM9RNtKk/U5E2s2wOrIFVeXkyZP88i//8p9+9atf/RvvjQ6Hw80Gh2NOcfToUVteXm4jKxoHo/m91+tRlmUr2jbocO5kWP5mJIa2mi2aw3hRosQ61STnc6tAYSVdU5IWUHTguuv5uU//Cs98yas42zW0CCRVLAndKtKREkuNQ59IQdpkHTNro1vShIQLJESNWOWKRJ3OAkFLzpw7z5NPnOTcuQssLh6i6iVSgoWFBXq9iNahxcWaSJe0JYNR2CQlZ0opRbOb2WebUrTp9XtK0e489zlzwrd7v5PyhZPGqG02ejylyDHt9mw+mwbEa4VU66Wlek5WsICSNyASkWQR0wgqxF7FoiauDD2Wj/+Ar/zmP4UTP4LqEmVcJlHV03vRKq2JgZLq6FetX09TbYdZiOY2dlhKqU0pUlXKsmR5edk7tsPhmCt4SpHDUeNFL3qRXbx4sSVbmrKKZkZVVZjZGrKlMR7mKrqljvIIIoS2WlHsOzGmWASsoGeQJEDowHU38u5f/hWe89J7uBAV6yywEiNVVREtUYYCS/X91uWg+2HG/dLTmXiZjGxp2lxEKMuSGCMXLlzgqSdPceHCJRYWFql6iRBKiqJoI1yqqloVbuxwOCYjSbabRuDpRA7H5GRFxFoCPNUMSRtpm4wgtPZKUXRIWnCmgoXrb+L+930Ern4G6CF6BERLRAM5cibbMSbtFgxiaWKyZSfQrPGNLdbr9dq2W15e5r777vPJx+FwzNfc7k3gcMAv/dIvveuLX/zivyiKXFI4sTuijv0doGFRXt3kOnTg/Ylk2RDphIJejFkIrwitCG0wQUJBL5KrEd3wbH7mlz7N8+56FRcskFCigSp1eeacJ90Xk+0ba6McqzXCeHXIi2k/pLgp+9x8vl8GOqco5TZQYpVLYR4/9hQnT56hCJ363NvXa5nYqJxUVLa9oDk1bieMcDFZW5liPdHEg0RirJk31nv+My7LPWq3efDfw69tdf7bMbJlTsePzfle1qbPb8T43RomfS57ey9w0tSiJkK02bhYez5tNz4agfwk5GgYEkZkwSqOBuH4N/8TX/2t/wnOn4DeBVSqXL1IIegCVZUoNGBEiD20JmAmieIaNedPez4dFUUz9Lv7Nw6HY27gW8EOB/CNb3zjG00ucFEUpM2qaMzcYBvvG2Xk3w1RIwStNWiyGRZjBIOy6FBVEBEIC3DNdbzj45/iBa/6CZ5aSVTFIgaoDGZ4D1jqYmte3tTobKy3DZy71pTUQLKUfyYIGjh9+hwnT57J9yK6gUGeWK8s9apccna+bPK2PJ/dcxkm/viofP1p5fDvWUdsk+ev1qgiycwfXzP2hsfiOE7S3Dy9/Tp+dvnqRCcdp7av228WhMuq+XFEC6w+p9WVo21Vi0m9ZoeyZKnbQ4pFrr76GhYWD3H8b74LcQVLmWwxa6r9lFhKkBILQRGl3nCSXWmDaZy/0+lw5MiRz6+srPxjt24dDsc8wFOKHAcet956q126dIkQAmVZtuGpewFNGcfmaIZ1qSVWGRoKYsrCv2UoUAJVL2GqsHAIrrqOd/2Dz3DHvT/JmZWElgUpriADZa83MmzW3QGvHbbmEM3HcKWDQcJl8GcW+w2oBM6fv8iJ40+24cP96/Hpay86HK4bsQfmFU8Hcqwzdn38TjZ+xllPxxl/o1L9mte63S6Li4ucX1riXC9x632v46b7HoDyEBSLWKqrE5UlMfYQqyhFqZLRSzaVCK1R5eCn1YdGfX7wtW63y7lz53j729/+sPdGh8PhhIvDscv4xV/8xY9/73vfqyvikAVX69/3tMGXhEg2vspOQUqp1VmRciEbXpdfxUN//5O84NWv4VTP6IZAMmOhKCdyvMb5zHDawiABY2YELah6keXlLo8/fpwYDRFFCKv0YqZBADhm66D5M5j/5+LPyeHz55TX4BHr4DjtOEi6DKfJrJe+O4xSA70Y6SwusKyBk5Vw79veydV33gNWQrEIWpCqBGYEFEhUBkjYkX4zDeJlM2LrS1/60h3eEx0Ox1yso94EjoOMhYUF63a7raPf6XRymcFNqqzMi4ZLH30Nl6bqAKr0LCIiBNEsLKsdKgvw9Bt5w89/gLve+FZORlghoEWHmHJ0TyFFq7OiqmMbesPEybABFOvXmnMOGpf5NUFE0VCytLTCD3/wI1KCGBNBy74w4BqJgDT0Uzc0+lzDZbr3t+bjvrKMHhebaLg0mg2J2Wu4THIvc5PJ4xou22u2zZ7f0Po3bqrZ2vl4u9gfe4HD42wzbaStnGdYg2n1uRORusqgGZKMy4ksnHuSf/3P/geqv/7/QFeg16MoFKu6BA0kDXUkaZra/Q/bBCPLYG8zom49HarB126//XYefvhhX5EcDseuwiNcHAcWP/7jP27dbpeiKFZFtez1cPoskFvQixVa5PKPVZUwKahM4YqreeBn38e9b3mIM1GwziG06JAwLAkqRd+xWsfA3lQ0dZPPrEo3GtKSAKh68MSJU3S7kRgTnXKRGA3VYk2VqI2MPd+ZdTimNK9ss1qRY+8+7+Hf/flvnySZpB1HpQ6NOmf7uhmdkNf+XjJS6LDEAumK63ngZ98P194IlEhnMVcDLAqS5spH7EJZ+Ek1b9ZLrUop8Z3vfMc7o8Ph2HU44eI4kPjCF74gDz/8cEu0dLtdyrLMpRZ17w0LGzwk0Ytdik4gVRVogIWFfFx5Fff/3Pu558GHOLEc6WrJcrdCgQKhKDp1ys7Wna6Njat610zykawCSa3BpFq001GsjCefPMn58xdyRSJKer3YXpuNET7hRMv8OR3+TByOPbKeDBEDTrRsf97brG0nISrWe79KQYwxC3CbYQbLyTi1LBx+5o9xz0M/B0evw0zREKhioooVWggp9mbSBrPuS4PRLkVR5NTkEKiqiiuuuMI7sMPh2FV4lSLHgcTXvvY1q6qqjbAIIdTpKrWhsllK0cwNtq1+4+pKQkUpVL0EIdQ1PgvoXMYr3/U+XvPQO7nYOcyKlqRcTga1bKRVdWlmlb7RNJ3SjjVRM3BjqkpdvZoQivY7VlZ6PPrYCYQSs/y+lGgNqKZ89PD5B3/mSkYbtZZXKZrp/YkTLmO16tDzl7YXz7ZK0VafxZr0wLlpUK9SNJOrk7V9ZWtlor1K0TTeu1FK0kbCsbkKkVGlSNACMcnViESpepHrb7ieniVO/e1fY6mqSxwZZomgwjQrFG0mcDvt9UFEsg1XR7iqKktLS7z73e++8+GHH/4/3fp1OBxOuDgcO4C3vOUtjz788MOXj1rkW0NGdpZwWUtm2MbfqEIyQ0NAQ5+4AAiFkmLErGZuwgIcOsqL3v4O3vhzH+Jc6HDJoJJMPEhNP6TU2l1jOzLjkzA1adN6lApkIxCEGBMiyvLyCn/zvR+guoBIkYVyRduoo3yfMvB40qq2EumXxpwXwmXDNtrnhItjyBEadpZmRLiISutwjDq2c/2rPj83Gi5OuMzk6szAQMjPWkXqUsXSlize6Jj8uexvwmWzsbjZON34/AkjkjCEAkmKWCZTRBREqKJw07OfxYmnjrN88gmgQlIFydApEC7jzifDaNb5rcxXm7Vjg29961u3mZmXiXY4HLsCTylyHDh85Stfeaaqrsn/3Us78LGqcrhsr0ev2211TXI0SMqisoXkigMLh7jldW/iLe/5ABdDhwsoScOAQWNYsxtUH1snVLaGJlIlt3s/lejxx56o04tWExYe0u7Yb+SLw7FX+qnPv3sLacjIV8ikC5EowkrosLJwGfe+9Z3w9OeA1qWiBVKyqaY7beU80+xnjeh/rtBoxBh54xvfeMF7h8Ph2A044eI4UHjuc59rVVVte2dpx4xdNt5jCkVfPDZ0OhCUZIlo2cDQIDmKZPFynvPK1/Kuj32Spc4RlkxJFlaZZkly1lHUpjpB2iEjWzGDFCHoAo8/fpzl5S6WBFmvNKUY62ULuSPrmEc4YejYa5hmJZmDPOY3OmaFJJBIJLWRxn7CiAJLSYlHruP17/oQHL0WwiGkWERMdoQQmSUGiyCEEFDNUbJf+cpXjnjvdDgcuwEnXBwHBp/61Kce/OEPf0gIYVV1nGF9kr3iuFsWOCF2uxAjWhQ5p0YDyQroHOWq21/Cz/69T3JRO/TKBUw7FEWBmqIGSTSnE9XlVZuUn5kaVqZ9vZzKCKHk5MnTnD1zEaFAtZyKg+BwzJPD6nDspf7rfXj26/ck5ZA3PERySnET62J5V0UsS+uLCMuVsRwOccWNt3DnAz8Nh5+GxYBpZ0dcg1kSOk1US/P74Llf/OIXO3PocDh2HK7h4jgw+MY3vvHXg0K5Gwq7bSY6OWuDdx0NF6tDX1JKOd+5qaikoTYoDEIJYZHwrOfz0c/+VxTXPoNL2mE5AmZIzLotiGBiJOl/p1qoNV2mbZPUFQpaQ05RDYTQ4dy5Cxx7PKcSpSiEUAy8b40pxWBNpv5zXK3lMk8aLhufxjVcDhLhsnOiuTN+AK7hsqcHgGy3/47brw64hsu05ottDU1pVjdBa80dKMjaZxElUkVDixJB6HZ73HjTszn+5FMsnXgCLIJFhDR5P9jkfmcpntuca1D0X0Q4fvw4gGu5OByOHYVHuDgOBF7/+tfbxYsXERHKsmwX4L0aJt1otViMaAgQYz/KxRSe9nTe84l/yJEbn8M5lBUJUJR0igUkCWo6wiZWWlbH1p8aptFmIRRYytUEjj1+ImvOmBJCSUreXx17G55+4dhPRIBHvOyt+UJM85GEwWSiZs03IgAXexW9coGLxSHue8s74JoboTwCWqxLhky7H8zCDmvEd7OtEVZFuagqd9xxh0/QDodjZ/02bwLHQcAf/uEftnm9acijn2fnaCMtlxACWtSGkQrSKUm9Hhy+jLf+4qe48c67ONlLxLJAQk7jiVWiDCVi5FLQ7ZENtM12FqcpmJdS4sSJJ+l2uwOGfdZ16X9PGjqav619vT+l+bTmmC+n1Z1Vx14jAPaimLwjr+e52qCCBSyBWWyjOsWUhaKkqipCp0MvlFyshOKKa7jvre+AxStohNJmpTszHHUyHIkyi37c2EwpJb75zW96R3E4HDs7N3sTOPY7br75ZkspEWNs1eqHDcm5MzDrCJMmeaZ13qwfrW1mpCoRexG0wExg8XLuf/cv8LKffANnK4hlh16V85nFMtlU1e3Q3rMZpM0Nq8kNIV3188KFS5w+dRbVEiEgIRNiouoOq2NfO7MOx36Gz9a7Oy+oDRn3YqQ6qsUELCaKosg2BEYqS85F4aY77+KZr7gX9AhJFjApal23bImYADrq6eaNj3nK8CvLso0EboRzG9sP4NnPfrZPxA6HY8fghItjX+Nzn/vcM773ve+1C/CgcTNMsAyWiW6IjfWO7RpU41YsMMl6Jyb5gJRzqutDCTkFR0vQOo1o4TJuedPf5dU/+35O9mIu/ZwEJSAGZRAkCBYgBcE0IBLo/ye1UWUgaax7WWNoN7tVSQhaEmOkqqpMCEkOb1YNLC1XHD9xkipCMkFCQZUSJoaGQV2Wtc8ql/QOdSUjHTo2cQQ2eX5NxM9UnY9RZJGkTdt4MutdJzsckz3zup8pAinPJ6QRhO5QuyfyoSN69rjHqLlmmk7hXBFGc9t/0zrHzva/ra5frZC8GqLWn6e2etCPztzocGxsI2y790kWwk9i9ZHq6kVGxEAFI2buJEWSCSuh5EQM3PXmd8Azb4XicggL2b7QhnLJVRCTCWZS/7R2Z0jMaEXhtkk0Da+X47bD8AZas8E2WB56EI888oh3OIfD4YSLwzEN/Pqv//pjTUnAbrdLWZZ7ZIdZs3Bs7TxI/bMhA2JKEApiinkYdw5zzYvu5qEPf4wz2qHSQKpjY4JI3xEjYpL6kTNjOijbabOU8i5ap9OpjZ1MtqQITz5xkl6vQrVAtSZbzIj1sZPOicMxdYdX1pZWHfWaw7EvDcsZENeO7UxEq4n9hgvpC+UnVIQk0FNlqSi5UCzwk3/3PbB4JchCtkUMEFCRLLw/bB+sXvnHurTtECnjYhRhNRgp26Qu3XDDDd5LHQ7HDnl1Dsc+xXvf+97fPnPmTLvwFkVBVVWrIl2axXneUlZq+wYBNNW711bvYZsihZDiCoQARQe58cf40Kc/C4cOk5CatBjPwJnJTjgRUaNKiQSI5NzpoCWnT5/l7NnzWBowgMwIIiCpFfRzOPYqhomWrZadTxMcDofDMc78NPizmaeSFFz13Ju58VWvgWIBQr9MtEWjkNBu1AipjsYNJMK2559Z6Lesh0G9mGPHjvGFL3zBg60cDsfs5x5vAse+7dwipqqtMn0T5dLkLg8vvrMmXrZiTBhFDv8m5Z3CZpfKlKgQqXLp1+IwPO3pvP+//G+46c6XcbaKrKhiSUDDKiNm1febrntNIrKK9NjKdQ/u4qsq3apCJNRpQMrFCys8+ujj9CqjCB1iNEDr3acc7iwiSLINz7/tPtGcdp10nmZXdtOo6C2mLaxpQ5mxa7zLaRV20MtC2/bH/izaf1rzWjtvzvu+sOwu9bR+8+iu9L+tzt+Ttt+48+hut9MesGG29bnN2n1V+vSQ7dOxSCcu87S0xL/84n8LP/w22BLEFQqhjqot6z6S6rmm1l+zKvc9lbHvb5QtNon9NM77BqtU3nDDDRw7dsx9IYfDMVP4qubYl7jnnnusWbiLoshisVXVRrnsPQcuVxFKotlIDSUsHIKFI7zpFz7MzS+7h6dWjJ4ooejUui+MJlvGNFgminpRpRcjITQluCFFOHbsBN2VCpWcSpR1WEAkf5caBDzK17E/sNXIFofD4RicP2ZF1g6TLc33VAhLYYFzxSEeeMf74PJryYSKUiVDtGjJlnyiprqhzNSlGE4J2uh9myHVKcwAx44d4/Of//zl3tscDscs4YSLY1/ia1/7WiuW1hAtzUK8sLCwBxyilLVWZHi3KpGkSS0qeOGb38a9D76dExdXsHKBnim9OHmkzqRGXiNuCxBCQdCSJ554iu5KhYgSo7UidoNlIc3iGnE7h2OvYljI0eFwOHZ6Pd7K+ZIoXVNWdJErn30rN979Wli4HLQDoiSryGTL4DlqVTgbT7x+kvsal3TZqLph87cceSv85m/+5lnvZQ6HY5ZwwsWx73DbbbdZt9ttRVtVlV6v15YG7Ha7axbfuXOGarG7hnRpRG6tLfHQ4WkvfBlv/YWPcCYFqrr8oUqZtV4GUoZsHT2XWd5zjJEQQvs9ly4t89RTp9C6MlJu89HpTu6YOvYLnHBxOByzJkkmPefgz2RG0SnpoZxNHV71xofgiushLEIn69/lSoaDqYsVWKo1CrZGugzaYLPY9Bp1zibludncefzxx/nVX/3V0nuZw+GYFZxwcew7fPvb3yaEsKocYPN7QwTsGYfNQCwbBUmUKApawtXX896/9w9Ih65giQAS2ns221q0znbLMG6E3O45uiVWxokTTyIEer2ISkFZLrS7S82zab63iYxxOPYqBjUSGkfCqxQ5HI55nasG7YBeL7ISYSkGlsrDvPrvvBsOXZ43coqwWvxREmKGbFEydzcjilWVGOOq6/iN3/iNrvcGh8Mxs3nHm8CxnzBY5m/QkBgWjx0OOd3q4r9RuOoobNXJSikCCSwilsVkTSVrtxw6woMf/CjX3XoH53rQswItC8wiseoRVEhWbVtkbrNw3Hx9aZXYXfPvvkhxQTIwlKdOnebsuQskIBQFCSNVkVTFLLCXDEUIov2ykwPXMM717AWjdj/cx37BrEmPhOXINAFU2p+oIEHbv613zGt/2wv9d725Yy+Nv0y0b/+YluPtmL95azg6ddS/tzMXtus5EESz9p0WXIjK1c9/IYduvzNXLUp1eeiUqwsquUy0itVi+wmzuOpaR6VuD1/zdjaJxv3MqPHfbLw1dsvjjz/uHczhcDjh4nBshs985jOvOHbs2Jqyz7vttG3HuVPNBISkvBsjQYnkij4vedNbedn9b+RMBV1TEKVKWftEFVKavSjwoKGjqgPRNQZaYAZF0eHChUucOX2OsuygkoX33KB3HATSZTcJh4MKn1scB6WfD0fPDf578vMbVVVRWaIqOlwIi9z1U2+Do9dAsUiMQgj9aFrV/HummuNIYnMzAf/tCPtPghjjqnYDuP322z380OFwzATBm8CxX/CNb3zj0V6vN5bBMe+GuaVEUKXUkhgTSQJWLnLk9hfxnl/6NL3DV3GulwjlIjFGLIEWSiiEmHpsyqVuto2+yTbpqKih9m8awAKGcOL4k1y8uIRqIGhBSkYIJbTvHxbfq0VqZvR8ZJP7kzGbBya9vlnbdbvcv/eQ37sbc8GmERgDhw0Mi80OUdmRthd2N1JkIzHMceaveR8Ysottmn/aVO5y+9FaTpyN2/+Hx4KIkLBtjZ8BRgOzRFGWJDMqE6676mksXTjL2e//DaSEpgrVQEwpJxNp3igSDRPNtTs1rzQbRQ1Jpao88cQTAP/Ye5jD4Zj6nONN4NgP+NCHPvRfnzt3jhBCm5u766TJBMK0IkqsjJUqkbQkaQmHL+O9H/sketX1XEigi4cwM4qQ9VuiGd3ucv2dacPrmsa9jbrPRidHgnL61FnOnbtACAUpQqqtMltFtsyHA3wQnHzH7MbDPPSV3SKOpjXn7adn5nDM+5y30SGS7YoYK3opkTRweqnihffej9z0fCgPEympktSpkoqpEGvbY9Q8MG4a0E6M7YZgaVKhG7ulKApe8YpX+OTicDimDo9wcewLfOc73/lDEWnDRDdb1GfpnEzDYAiixKRIWCCWC6AL/OT7P8Jtr32AswQqAkYgVV3KskMyI0ggBCXvTjbb3utd12QRLoPt2KQTtQK4BlUFjx1/gqpbEbSsjRvLIroxomJ1JaZGdCB/NhAwkZntUM9NhIvYjPUkPMJlVsSGX/vmj3enrmddbRaPcNl2H/IIl31AqEzYfGqGovRiJBQBQSAZhw4d5uhll3Hs6/8JygBVjnIxi3lNA1IcPf63orsyiej/OBgkWoajhR577DHMzKNcHA7HVOERLo49jw984AP/ZGlpiaqqKIpi1xyn6e7uKiZClABacO3L7+betz7EJSlZMSGaIMnodDpUVZdYZZFci2Bx7dCe9q5RU2J7UACvKcMdQsHJp07T61a1bku+nmZHSZVMtqwxmpSGKBI7OFOTR7vMiZMyx1ETG/WR3ew/6wlu+3N0OPb2XJhSogwFQfK6LeUip7vCTXe8jMtf9HJIBZSHSMlyirCBIuvOA4Ppx7Mco1s5dyPyH+oo4aZM9IMPPnjce4HD4Ziq3+RN4Njr+O53v/v7vV6PhYUFqqqaew2XzYXtlBTBtABRuO4G3vPp/5zy2mdwSQK9aHQ6C6RUEauca91EtlhlLJSLucrRhrc4WYTLcOnmxlAJIXD23IogtEoAACAASURBVHmefPI0Tf0C0SJrzNQ7YfmzNjQRKWKZbGl352awSz1PES4zdtF3mSHYu/PJvBJgoyI5du1a54TUWHcn3SNctt2WHuGyDwiTCZsvaMBiQhFSjEgIoEpVVyR65g038P1vPQwXT4FUWdPJEimRN1SQscbrplpM25wHxvn8YJWixoZpdOl+9KMfXVZVlUe5OByOqcEjXBx7Gh/4wAf+yfLyMiEEut3urjkho3ZV1ho9Cknav5msr7OiIUC5AIuX8RMPvZOn33Ib5yroVYZKQexGlCz41gkdiAlJhkqg161WDe1Z7Cb1er1V51Up0KJDr5t44sRTVFUiRkMktGUXU0qrdpH6pnUg0TbNVAxGd/Id0xzL3mf8/h2Og4JeiqB5rW6iVqoYQQqWreDQ9c/ihrvug4XLIJR1taJcSpqU049IRibu8iE1Cbpq3CabqJT5JHNHVVWtTTJINqoqy8vLfPjDH3bCxeFwTG/e8SZw7GUcOnTIlpeX+46/jschblWIcqtOWDIhSerTHqaIKcEgSaLSHqIgFagIKeYdlypWaAgkLbGwyOE77uIf/tp/z/niEJfqUxVFh6o3QHYYILVQsAUihjUaKdt1IpPVuz2NLoshaq0gb5KBsGFTqsooO4ucfPIMjx87gUrJVvjc1uAxrcmWNNnEtkeyCvZr+sNOEWaD0WKrKmW5M767hoVN1u83+/u48/y2x52kCTvm3trLWjNeJr3/Sce17wXuGpI0/VcGnkaqXw8oRkjLXJHO86//u1+FE9+H6gJUPYKUaDKgh2EkqdeClIuu5U0VQQgIUNSbLyaJKP21QycOvk+bjHNd1feHiwAALC4usrS05AuJw+GYCnxVc+xZfPSjH/1sQ7aUZdnqt0xqjE9qrA/+PY0yZlCIIBLyJpAI5UKHXqxQUZIJlgwOH+UdH/oovYUjdMnkhwKp6q7yaAYjQyI7o/C/RgBPhJWVHqfPnENEtz215Kif5J3bse1x6GTL3semZbMdU23nnaou5dgDToH1iY/mgIRaAowExHKRbljkFW9+O5RHQEuQXCK6r8fWJ95HDdlRpOxuRLaOjE42o6oqPv3pT9/vPcLhcEwDruHi2LP4/ve//8fLy8urjMZxS0JParSv9/lm8RYEqVX7IVFv7DT/IxQFsdfLv5eBbreHFiGL4MYEi0d4yU//Xe5+4EEuRLBiIe/8SEI1VwLK1XzyKZW6pGNDdAgThXlIK34HtRrewH0bqf6+oCUpgUjBEydOcvbsuTo3WqfSntu/fsfuenI76zQOOo+O/f/4pzF/b0zo2N4ZAFNsxz6BbgdnAnGMID5WVzrU+plYnf8jyYi9Hjdcdy3ff/QHxKdOQOxmgV1LGEZE2sfYyrL1TRaktlZMsoVk2v+LTPz8beL+par88Ic//Plz5855apHD4ZgYHuHi2JP4xCc+8b7Tp0+3lXKqukrPYOWcHTdShit2GIilNkdZLIEkEgZJcgUfESpLUGubLK90oVyEZ9zEG97xLnrFAoROP3UiGTFW5BjdRJL8MxJzpEv7ZWlm9wVZ2R/TWiQvsLzc5cyZM9mQMZ9WHDs71hz7Cx7hsnPjqFlbvF0dqymJ1BIX/eToJgJVkeIQ56Xkvjc9BIeuBC1zhIpavcXURLoK0lI2DJynIVsg6XzNPZBFdB999FHvCA6HYypwz8ixJ/HP//k//99DCK3j1aQR7VbJwbVkyxDhIalv3BpZ+Z8s1mapNnY1QCigs8jbP/BRimtu4BLKcoJuzKG6ooBFrCFbRnz3dO4+G1b9kOKhiUOKLIRrWa/mySdOUlVZgM6dYcdOOuUOJ1QO2vU5HDN1DGxtam8a0lZbiXCeDkef9XxuuPMVoAukFDGLoE10SyZdTLTOT9J+3IykTOkIdUVDbbXudhuNkK6q8uIXv9gNGofD4YSL4+Dhs5/97O2D0S0N4ZJSao+dxLpaEtYfYmZN1EmOSMnXG7ORIWBVAi0gLHDTPa/mha/+CU73jK4WaKdDURRU3eVWVX/0d6cNKx9N4nysmTg0G1IhlJw7d4GzZ8+jGjy6xbFjDrHD4Zh8HLmGi2Pd/jEQiTLoMpgISRXrHObUUuLu+98MV94ARVmnBjEg3FJHt8haBYO1Gzq6Y/1+I8QY2/Hw9a9/3TuCw+GYGO4dOfYcfuu3fuubRVG0ei2tbooIIYRcmnCHMJ6Rqm3UiZDa6BcRzeWcCUjRgShww4289b2/wHJYhIXDLFWJXjRSnS5VFAVV6t/3qAGcpkC6JCwbQxbzv+r7jCYkFLO8T1VViaeePDXUDrs/rTQOxHYPx95xFh0zaFub7Dgofc8jYBz7EUlWWwPZIuhHokRLFAsdYpWopKS8+iae+bJ7ICzWREvKE4ElBMuFAGQzUVxlXgTzB9OKQgi89a1v/Z73CofD4YSL40DhscceI6XURrioauskzzLCZU3qzrhki/VV+9VASZhFLJcqwkywCBy+gle+4ae5+rnPZ5nApW6PEAJaZH0XE6GKEZUiVyyyfgiu7mBkiRmklAVzz5+7yIULlyiKkqBlfa8OJ3R2t+0dDsf485QTRY4GSVZHnrTFoQe6hxZCFbPov4WCc1F42eveBE+7HsICSMjka1MwoCZskkkr7K+rCNpB+yXtyjhY77Ver8cf/MEf/Jj3DIfDMQmccHHsKdxyyy0WQlij2dIYjeOWhN6OgTm4g7mZU5cGKvmMfKdUmMVcgtEEQoejz72F177lIS6mQBUhSM53TrHX33ERITZDt86HVtt4OG/XAW3aM8aIqrZtq6oggW4VOX78CSDr0KQEBM0G2xaIhVHPYdMd9Cwes/4xRcJkuxh5X+7UTN1Z9DZ2zF3fFECl/Tn4+2C53fWOaXz/JIdjvrGZ/ZJk9ZG3d8Y7zAxLeU0fnGPz2qs1CbECJIIK0YSLJoQrruZZL3s1lJdBNgXy7oxVqBhWb4SlERZRW2BgymTLeu20RnOvfk9zv03adqPlsry8zKc+9akHvec5HA4nXBwHAo888shUHbZZf87aYaar9E2SQVEU5MLRAS67kre85+cIV1zDipQkNH/KDDWrDRHFUr8KkACaZOZDWUTayCEzwBTVgjOnz9HrVQgB1aJtm606vPMekbCRU7/RzpjD4XDsBefdsfcw7jozyXpkw+eQHLESQiAEadf7CuNsL/LCV70OLr8OOoeJCQqpo3o1R8WgQwSIpDYSpo/dTytqNplSSu31fulLX/o973UOh2O7cMLFsWdw//3328rKylQMxFmTLSZp5E5hEojNqJMAUkJxiJvufiUveMWruBQhScjFFNuQ3MFqRJm8aZX8Za12yjQGtUjIqU4miASiGbG+dzOj142cPn22NUhMpd0dm4oBX5e7Hj6afbj1/t4eO2TsDt7rYKTV8Hs2ImgcDsfBITFc78WxW/bL2P13iHSRNnW5Fv63iKWs7dakcFcGh655Bje+/D6QRSyUmIScSlS/lzp6ZpS4/jyNhBBCe83N/f3t3/6tdzyHw+GEi2P/44//+I8JIVBV1VwbOf33pVU/V+VFB6GqIqYlXH0tb3zHuzkvBT0pqVKOhlFS3h2yUd+dDZ8mZLg1WqZkhw2mTfXTtLTVzTlz5gxLS8sELdsImOHPTbttd5Os2Ey/ZxS54nA4DjYG54L15oXdmi98rtrfmDglloYEUaCfXqSk1s4IIWACZSegRYcnL/S4894H4IrrQBapTHPp57ZqgAykR9fXKWtLUO/2xkRTpWiQGA0h8MADD/iOicPh2BaccHHsCXzwgx/8tV6vh6pSluWOEyvjEgJr3tdEZtQRL1npH1LUrOhfLPKKn3qQZ976QpYsYBpaYyShJEnEWrVlLerqAZLqykQ57UimIKAr5BLPKdM++by1pktVJc6cOTdgtIdVJFOubDRdA3EeIkOGr29VfvtQFMuoyJfddrAcDsfBwGZVlHwOcqJlQ8fAUh3NMriJk8X/LWXBfjGoUkQkR61UEaqwwOKV1/O8u18LxVEIi4gWuSJjMkh1kQCpNfg2cEt2U2De6qqQzVgyM2KM/If/8B+8gzkcDidcHPsXX/rSlz6zE0TLJGTLaiJk9e+2yrio9VxE0Rufw088+DbOdCuSBFaqHiKDTr2sS7RkIqciDRA6s2qXvMNTYEk4d+4cy8vLdXUoaYmYxjCZ1EjaC5ouw46LVyFyOByTECQOxyzsly07BdaPbslVFQcsD1lNiKRUgQorVaRnipSLnFuJ/Pgr7oOrbwApSakmauqUovZ6GU+keTfW06IoRn73pUuX+MIXvuCD1eFwbH1u9SZw7AWcOnWqDfPcyZSibVf4scFyiqm1YJpcaAigi7zyDW9k8dqnE8mpRCGEXDJaspp/Nkh0YMDmeJNMthhJDJNYR8RM3Q1Y4xQsd1d46uTpfC2qbQWE9aI7JjUe55XA2OyaRmm8uI6LY68ZB9s9HKw7/jd677jRJ7OMXnHyZ/8TM+O8p1+2OaHNllEd9apaICKURb3RIgXaWaRKkShKuPxqbnrRXVAcBjoIgSAFRShysYAm4ne4BLVNJ0J3UjT6LU21ooaEUVX+1b/6V8l7kcPhcMLFse/w0pe+1Jrwzqqq2t2HWRsh268CUA+rVS83kS6KESB0uOw5z+O1D76NSwQqAqKKWWzLSbOZ4VFbKTKD0JZkFUn6Gi5mkCJ0VxIXLy6hGurqRLqGGBm3NPded6QaQb1RES8Ox0GFeyN7e15z7E8SZSvvg7yRso7JsUogP6XUVvQB6KbEBQvced/r4PKroXMolymq7Yqq6q6ZJcQGU5fSRNc9lTmsvpcYIymleiMsr/d/+Zd/6R3O4XBsGcGbwDHveOKJJz7fOPbjGoSbOcDDr2/VWd7sWsQEUSWZoTIg3hIWcmWizmF++sN/n6tvfiEXTLEiECXVucP1sLQEBsJA2goC0pSFFgQd+AlSf5ExiYGSIBiJCkPQUGBWYKY88shjWBJE6nQiI19B/VNF640wyQJ5mz0nEoKtOabgOuyug1Lff34oa39vn5CMPnbb7TFZ/9rGOva7Y2rbbJZN2ibVu7273YRCf8oaPPr9l3WPafSh3e9CEw4AmXhi2eSY9fibdAJYbw7XuZpA1lvHR0UoThOxnv9tg3E2HAEyeKThz4+IFtnILtps7hdyynPzOFLNiAiDzEj/ywRBrM4/EqEKBQudgriyzOkffA+LK2A9xBKiqf+I66hfbTeXRqdGb/05rO5PIpp1ZDbpX4Pt0/xsNpAG+8pHPvKR9LWvfe2P3Dp3OBzjwiNcHHONj3zkI58b3GXYqjE1GH2w2eI9bSMrxoiqkJLVZEQBVYLOIY7ccjvPf9ld9IoCQkFKVb5ekXZ/Z9R19//dLw8ttYDdtCoU5TztbMqJGLFKBC05d+4ivW5EtfCpw+E4YNgSIe2BEo590Ke3G1mx0ef2QkppU/1wuAri+tRG1pQDiKL0JNANC9x+1yvhadeDhVosd4iKMx2I5E07Nm+sRzyNm8L8+7//+7/qo8fhcGwF7jU55hq/93u/96shhC3lwk/bQNrW+SRH0aZkEISYjCQKoQRR3vgz72DhmutYil1iWsn50FqSsH5K0TpGwE4YbCkZeWeoH0p75swZYowedu5wuKPq84DjQPTvUU74rAmVYQ2zvSTKLoDFim5MLD7tOp7zkrtyZG/oIFq0EbpAq9cyboTOvPSNRx55xAeJw+HYEpxwccw1jh071hoYTa7wVtOKRhkzo4yp5v1byYdev4xxQoISgkIEkVp3pii5+gW386JX3sep5WUqsVxlyIxYdSEZQXTs756VQda0UVMe8dKlSywtLW2pfRwOx/5xQLcyxzoce6Vfj0ovHvX7OKTLZhsjB2btNANRLkTlRfe8Bi6/JlcsMsFG2WRNlcVVES+zvLzRdtKo/jDqvSLCu971ri/7CHI4HOPCCRfH3OL++++3oijWGD29Xm/ixXU9Y2haBpFRC6/V6UQEhXIRwgL3v/2dLIWSWC6SVJAgJHJlokIViz0UWZMSNfjvHXGwTBEJiATOnj1PjLEVj5tllQyHwzFfTul2HFeHY29wAxvbAptFuzjWohAlWqAbFimvuiFXLCoPQ1hA6jLRg+7HoBbNvMx5Gz1nEeEP/uAP3uJP2uFwjAsnXBxziz/5kz9pS0A30S2qOpaWy7i7F9N0EvrGWMp6cwIp5ggRqxIkuPL2O3nBXfdwyQKVZmG62BIYWTOFtMsGnWmt05ItoG634vz583V7uc72VvrCXgwJdzjWmy/H/cykh8OxU/P0Rq8N/r6RuO5Wz3UQ2jVhrKCcj3D7K18Hhy6HULSbOW0ki6yuSrQTpMu4Gi7rzUUpJU6dOuUDyOFwOOHi2Nv4/Oc/f/nKygohBMqyXLXjMI2yw8M7WNNGoQFLWcclk0YBFo7w2rc+xFKxSCoC3W6FakFAqawixojFRFku7LqGSzaG8nHmzBm63e6qEpADpgdeCHYODV6Z7HA42TJtMsbhmDdSYNTaOioadlS0y0afOehIAqoFMRlROxx5xrMpnn0rREMJrdh/Q7b0awftDXui6QMPPPCAP3iHwzEWnHBxzCV+53d+52wT0ZJSap39GONYxs2o6j4bGVMb5Wpva1iZtVWDQtGBosPRZz+PW196N0sSWImJUJb0epGUICAUQQgixG5v19s/pZSrCphx9sx5cuHH4Ialw+EYOc86HHsV46xrk1QsOojrZq8W2F8x45KUvOTen4TFI+SY5br0ssEgwbJTRcG3ouEy6j2Nbfrv//2/98HjcDjGQuFN4JhHfPOb32xJlsFQ86ZiznaiXDYKCR4njHS99wxHyohBqhKFCr1mYe8s8rq3vB3rXEakAM1sp2hAkoEIkrJwnKhh2zA7Vl0TNtZ7B9ty8P5SglAUnDp1jpWVFVSLmpjK6UYpVUNnbIwm3dq1zsgO3etRGh5lsr8JilERaztJXmz6XTYb53OSdnLszf4+SnB0Hp7r8HXMknTZaahN1vZpzKlolKacmRG0rH8qqYqcj8Z1z3t+LhG9fJ6UlikVEkKKIJIIIW+uhRCIcWPNva3OlVt9bsMbdM2/B+0mM2NpackHucPhGG9e9iZwzBs+9rGP/b1RTshuOCbbXcgFoZdq2qMo0Rtu4sdfcS+p7BAHCA61TNDknZ7tD8fttMmgATH4UyRQFCUpwYXzlxAJqBQ0KUYpTS/k13fIHQeNbBn1u48Dx37s6+sJzzp2xzbZqbavqoqUEilVaBGIUpDKRW6761WgC4BmQiMmREA1b65hkGKci7Zbr882vzdagi9/+cu9Qzscjk3hhItj7vDlL3/5f9zLxkvWwQhAiRSLYIFXvfkt6FXXsJIqICEGIQ2cY5ulEEcRUlvZqRsV3SKS04dWVnpcuHAJEd3RCkkOx0FySnf6O30MO3ZqvRxV3cf73/6f18oQCCIkgcpylHKk4OY774Yrr4Oik/sFgtZuiJELDewVPq7ZePrzP/9zf+gOh2NTOOHimDs89thj60a2zIuxthmpYQIWAhYFueEm7nrd67mQjJ4lRFZHtrRipfWuz046XoMG8bBxfP7cRWJMtXaLzMxRdAPccRCckJ0kQNbTJ3A4drrPe787iI6FNJ2AKkZMhJ4Jevk1XHv7nVAskEIJhNYNEWn0UWTu+vGwnTS4YaWq/Mqv/Mqd/tQdDsfG86LDMUd46KGH/lOj2zIv2A4JUlNE0DnMy37i9Ry66jq6IlAGklUIqVVpSQJRlKjbv7ZR6UHjGMPNLs2gRg5AVSXOnDm36rUQylZDZ9rTihvljv3ueO5k//fx5JiHPj8YGTm8xjj2B0YJ0FZVVZeGFkyyPVBhrIQFbrvrPigPkyyANtGzgjBULnrOEUK/iMDv/u7v/oX3BIfDMV3PyOGYIf7dv/t3L9Z6ER4mEOYlJHnT6BYzRA1CgCuu5u7XvZ4VhG6MJFaTSU3gSBKIZlsyNiZph8GSmKPa99KlZZaXl9vKRKrFmMbyZDo07ig69pPTuZX+PMu+7+PKMS9jwPviztopg4TIjkXQBs1kSgItShJGVKWnC1x943PRp98EFBgKmnXjjIJokLC5abtVNt2AnRRCaDeeUkp897vf9Q7ncDhm5B05HDPA6dOnUdWRyve7YaiNWnjHMnJigqBce8edXPXcW6gQyrKoyQsBEolIxHIqkeQKRUkYm3SZxHga3HUcJl/MjLNnz7bPYTgaZpwKUYM7mqMOdw5niySTHY6dIzgGx8QsSEcfT45ZESlbmd89smW6dslGx27Pb1lQtiZSTLJto0IXIRYdbnvZK+DwUdDa/kgCBAxlipr8M73/plJRURT0ej3+0T/6R6/2nulwOJxwccw93vzmNz81imjZHcch0S91PMLgETBJq4bSoM6JaYBykft/+m2sqOaKRQaKEmNc/XlJA5WKtmf4DEafjGNwDZfZboRyhUCs4MLFi5RlpyZhApDWKPePnk6Sd2SHY5eJkY2cX3d8HXu9fztGrL7WP3YVpvRipFv1gETqdfOzl0A3Gcum3Pyiu+Do06AuH221/aOqWcxlTvrqejZPjLHdeIoxIiJ8+ctf/hPvhQ6HYz0U3gSOecGf/dmfXV0UxSqNkGFCYVppRRs7HQmT2ghAMpkCCI0tkEhqYCCWUAIpKUEFsx5SlFR0uOxZP8YL7rid82aYFiRTCgzBAMsicRiGEAzyDk/cUoTBMMmy5r4Go2UkZTpEUrtDE0JALO8sIYJIwVNPPUGMgKV6h6pp87p1UjVEsgwbKjY2eWTrcL6GO4WTGt/jGpSTj5eD50wNcKsjU/Jsm3OR9k+67WcyDxFkYlNq321GS0zt+/cp6TH78azbem675VDv9HVtNj83mzdpnX6pkq998DyDfb5ZP0eVMx4nWnhT0sas1qDTfnsa7TVHlFAIlnqUhWIpC+dSdFhKxqErr+Wq217EqVOPQVFClUipi5HIPIZuOveNKqzQf77D/2Zojg5j9cn1NrJGCel+73vfc8PD4XBscVV0OHYBJ0+eJMY4J5bpJsZ4uwg3Bg6kZCRLVMmgc4h7f+pNWKdDNxnRJIfNmkLKH0pSkx+WUFMk7ZzRlzeScnRLc6gU9HqRC+cv1USNTw/7mjSYEtkyT47UQcIop8mjCByO8ee/+RXxrSNspX/kiNh8WGNzDKSAzg9JOFTRUFJLzhjQ04JLUnLrS++B8jBYQItAWZQITTrS5nPfcCr0VjcRJu07w5t/VVXxuc997hk+shwOx0i/y5vAMQ945zvf+W+bhXa4osF6C+tMTQbLZkOT+iOrDCHa3RxryzpbNoMk5OOqq3jJq17NCkollo2hoGPlWO+E4TRYCSqnFeXrunTpEktLS1NzAGdJBDjmt413Uk9gngmQnfxOJ1scW+k329XYmtRB9bE7zvXYqgPNQvxS5wwlYq37lo+GeImaj4RueESTDY/NPt8/ZM0BEOrYYBMlDRg0+TqVZQLXP+cWiht/DMIhYoKUQKUgVbKtZ7fTRRWaktCDmoO/+7u/+5jPLg6HwwkXx9zij/7ojx6Yn90mrVmUDd4hkkkZoc+8KJiWUC5w68tfweI117JiWRQ3EhExjJjjgbNp0EaStGGrs7QVBtKLmqwtEWlzkc2E8+cvbstwmYaRc9Ac9L1Aymzleaz3fidddsZ5djjmdR6Zt766J+YkSXVqT1o/Ra5pT5E26qX5LAMacVv9acRV0TUjz5dbcuio7SNLhKF8KKk3qxJCRWCFDre+9JXQOQoEYkqEUJIsbZoSOCqqZScJl0b7zsyIMbZp8N/61rd8wDscjpFwDRfHXODEiROYGWVZroq+2FXSZcCAaAyAhhAR0zaP2RrFNymAAIuX8coHforloqSX8i5QjgTuV/kxS+33/P/svWuQJNd13/k752ZVd88DM8AAIEACBECIBAkSJimSEvWySXptS+u1/FgpFIql7LUVCu8HRyjCEdp1cO0IPUIfdr/th/2w67DsUEghe9exK+9yFZIsWTQpERZBEiQl0BAJguKQeAyeg5npV1Xec/bDzczKqq6qrqqu7q7uvv+InJzurkfmzcx7z/3f//kfd+E4ztaTNAcRJWggxsjm5iYhFDMb12VVy+meIOVruXoES0ZGxnKf4WX3WQep9JZIFq3CD21+tuFOtvFNmfRVfgDChVb0s6ePExvXiE08I61jErcqZiqBgFZrvObCjgcees9389SnfgfKN9AyUpY9VPY33x/n3zLsqXI04+Qomdjv9/MDlZGRMXFWmZFxrPiZn/mZfwZQFMUK51SPRlQONpLipAqi3PHQw9z3jney44ppwBCSGXDZBBImI6syNZPjR/BIuo7Ned7a2mF3p3/kk8hMtqwGDlNhdBqv8aqQLVkZlnFSnpNVvldX5XkekDVJ/Woy7KcmVApb9pItgypFVr12wX1LWeM+MMEfep1Y62eGfp8KD9jguFVwj4hbFesIUQLF5Tu59PZ3AZ0qJWk+pe849dRRlcWu1cH1lkJA5WMf+1jujDMyMjLhkrF6+PSnP/2L9eDZ6/VWJPAZBDkyptxiqiKgTYDQLOtsnOcDP/hRymKdndKJll6nrih1GeaYvF/GPH5LP/O2FHiEdKnTmUQUM7h+/XplAjwc4O2tAJBX9TMx4wu/77SSA8fxXIyrQnJWJvFH6UGSsZzrtcrHN7HS33GQLi2PFK/2zZjdWpSp4xKxiPrAVFddEddj2eNKFKVsKCHFUVzSa1I81SF6waZ3eeT9H4a1cyn2CAVGnOu6jY4vR5VS1E4rqvfuzhe+8IX8wGdkZGTCJWP18Mwzz6CqmBmdTmc1AjMfkC1NtQAG3AoqoIJZFaC5AgWcv43HPvwDRO0SJeAuqEPZ66ckJXdcp5WNtQOXNF0k2IwxcvPG5lAZ6HbwmZUPp59EyRP8k3/N8jXJyDgFz7aAi1RKD5m5H2gTW/UC0eJ7bX5ul6Ae3msziWhrcFyEunC0a/RWSwAAIABJREFUtCo51p9baCJhtiPc+7ZH4PY7oVgDkZmqFI0SLMcRM7aVLe1juHnzZr6BMzIy9vYZuQkyjhsxxkae2e/3910JP8ikYtYVdmv7tzT/GSZDQlEgqpU1iwKB+9/7fm67583slhAIYIJGodDBID1QkQwdWaOkGQ66Ftua8pEjVZ7GBg1ScPPmZuOdI4Q9AdzoStKygpy8Kr0amFUhMOvrTpOSZZKCYvTZaq9yLut7R/u8cQRoVneczvvuZLePjd2aqjvN+BRxj2Neu5xnZ/R5aD8/k8ZGEWmq/iy6zXIdpv1NHMQd8aSDTak46f9BvFG2DD4nqVIjQt8cl7Bnm73ykOI60gYTX5uuVvTBZqRCASKBYBAccEcJTTRlZZ8gClpgxRpvfedjENYRDZRlOVf7zXNPj+sj9+sz2/dS+/91fz96P5kZP/mTP/l/5d4mIyMjEy4ZK4OPfOQjXg9YtcJlpSZbIyRI/diYWVK3mIGGZJjbPc8HfvAvsRsKXJIEWGs/3WprBwYmg1zlds6yHkE8nIKDKpc6Rm7dugUIbpn4yFgeUXFaJqn7ndthkB2jk8BJx5MJhoyT3EfU6TzLrDJz0p+J+viDSCJcmnaKxBhb47cOlXJ2SylI0wildrtPTMlr+bwJYSzpMPngUyGAoe/1lFLkFYEjQUGFvjvbER5+z3fD+nmc0KhGTmL/X//+s5/97N/OT3dGRkYbuUpRxrGine9apxWt6kSuqjFUHwSRCKKAgHRYu/te3vWBD3GrjJiEpIYZQ9bgjKiErSFdxA+5NHTtS9P6jl6v5NbNLUQCVnnOLGOVMSOTLeOe19NAEIyrjHFY/VOtKMvESsZJwTjefuj+lT0dRnpN9a+y3Op3bW+PVXiO9lURKrgnNxN3b0gP0Q5Ui1Mi1ViuNaFRvd8dH0lNno+k9bE/t/ugvcevYz5fKCUlFsVa2SKC4qBQlru4C31R7nzgYbh0J2y9jkmRFD0rHINM65NFhKtXr+ZOICMjY0ovmZFxxNja2hpyeJ8kDz1quXx7sDfZSz+oalPmGZI09t0f+h46F26jX6/mjJyH4UOfo61S04chLJnm8ZCChRSobW5uEmNstbVO7Rpy+k/GQSYWJ/H+mWWV8yi+cxmvzcjP5HE/P0dlbDpufyL6G1JZ5+aIxXAi0fpEq9OuBxWFnAgeU+VErFLFDDZVabb278dvgqinTQavr44KkUQGDW9xkB7msbbJbT4vtBV6welbn06nQ6cTKEXodza48s73gHQOJxha8vMzTfFT/+6XfumXcqCUkZGRCZeM48fP/MzP/LMYIyEko9YYI0WxKqIrQ7xllivW8kdhENyIpnLQ5y7wob/0Ubajo50ORsTVBluV81znWovX/x+UULTqO44mAB4EvbdubVEUnUpGrBOD4ewRkXGWMS3tYRU8VLJ/ScasE8XjJFv2MztdZkrRcT0PftBNrNmMAZlRCHSDopQEStR7BPoU3id4n0Day4QN6yHeRymnb25pq34OEptNKSmUkc2HN7G04QQ3ggsdhyCGElEiFnv0d3ZQBwsd3vneD4KuQ7GGy8mYmoy7l+t77rd+67eyTDgjI6NBTinKODY8/vjjvwhgZqgqMcbGuHWZwddCwakPB081CVNzlGaW3PRdiFqwdt/93PPw27keIaq3jGtJct8xdYlG04dcgKXEh7WZW0uBMyZICNqh349sb2+ndC6vyzhyKEFwRsZpIV6O4nlY9DuO6vgyThbZsorEz2EqX1Y5DW/asYk6ZiXuhhAJDoogHhtPuTURsPRz81nV4pAMJCmTSSef897Zk560DyFig9eIJF8ZVCi0REToFAUSBQlCcGN3c4e7rtyJ3HEFv3Z9pa/PpPt1yJ/PjKeeeip3PBkZGZlwyTh+PPvssxRF0ShbatKlLgt4rMFSFbw4I54qniiJ5HQilGYQCt73vR/GuutES+cgoeWG24pXpCm1aC3lrGGSDHZtjInuYU0aIaV09XZLimKtKQmdV8kzMo7m+ZslkG/L1/OzmXFa0SZh5IAeLqPPzyo+N+OOS0RSNSKr1CEKhWpK0TGHssRiJJjhVqKk6kUpNImD87bpCp/92mOUtB091sHfxhEvBirJh8dDeo0KIo5LrD5fCJXPnbhTFAV3ra/xvkce5snn/3NSFx9q/3rw/lv2IbVSIYKMjIyMTLhkHDO2trbSTVgUjVlunV503Cty6oqJjSVivEoHKs1xBIouj33P99PTACEQAPO4NwgZE5wklYsO+bnIDLHh9ICilsro0HHjOhQwmRlbWzu4p9Lcoejg0TD3IaFLXi3PWFZgepomh205+aTfLWtCNu57MjLmJR8OjlHVpFYj28BPBDHEHFffM7nVZtzzapytxrJkRJKq+0Eae9vjVcsUdtzxDMShisneSn8uAScS2PvsjHv9gduc4cWaul1wrRZzQvM6sFTNEKNwo/Ael9eU/vYm119+jRdevsZrL13j1vXr7Gzewvol7O6AlWCx+qZB6jMiUMZWi9tg75L2EoZ/v9DrpjWAVQ1QpLMUqU42pr+VTlg7R+yXVagihP4WG1uvNvfSKo9j+xkw1wUg/sE/+Af/06/8yq/8D7kXysjIyIRLxrHg4x//+K/+xm/8xtjAsDbPnbgCtOCEY5ZVncEPOggcGPAPAxJG0WIdj86FBx7inrd9F6/3nRiM0iGoDH+Ot4PVlpLFZbCap9WEbYb4eFwQPXx+ujcsFUMkAIIjlNG5tbmNhg4igdJLQhFSipe0z/roJwbD5r65SstRBZWrN8Fb3baaVPljv5XPg37+LJ950KpJvuKXcL8Jj59RjnhZz55gTSnfwQhizfgn5oh0kjk8Tq9vdAtF3BFzLEQQx3zgbRTLEkUJIoQYUYS1oNUw4xhO6SURoSeChAJMkFr9mfQcSVUqRsDRuhRg9DR+hgJBsWj1kFodeRoT3W1AChEoxSt/NSqjWcc9oq4Hamf3iBdKv0r5KQTKMlIUIR2LOxYjHTQF4bFkTXp04yY7r36HLz35x7zwja+x8+pr0NtJBEpNrnh6f3NmzuRVmnbpw3pfcyajv59nv6/9o01+EKvPicl9N5Exlioy3bLddJVlUMpxYurVSD/bJrxVw1z94Wh/sl+q235xSb2A+OlPf/q/BzLhkpGRkQmXjOPBl770pZ+KMdLpdJoBy8ya/9dpRUcdrDbHIjVpYe0YoY5G0VBg/QjnLvLIX/huvFgjeqoPEIIk+W87GBgOQ8YP5OYLcxx7Bv0RwqjZVytrqsruTp+yTDJkV8HNmopM2U37bE7WDkK6DKUEnHLSpd1Oq36+p/V6TKoclYnZw0OjUFElYjhJKdlZ66YKNeaEjhIr/5GOKlbuUriz0e3S8ZK4vUm5tU1v8xav3bjBzs4O5iVFt6C7sU5nY4Nzl26nWD9HJ3QpSydaoNQOUYsmRTcUglVKDpe0eIE7vX6PoihaHIRUlXW8GQtT+m5M3iKt85rJn2RfGK5CjP1EGuGUpRFCh7Isk6JXImvdQGe3z7o4XdvhxW8+zVNf+DSbf/Zl6N+CrRvViQrERKyIykAV1I4mRtW40wijuNizdRjE3x7l3ozmMqMlqqeXrF5+v7DfZ9UKl+eeey53GhkZGZlwyTg+fOMb32gGrkkTgkXzj5eHCdLWxpBFoejwvg9+kIgPzgWZeRX62EyBJbC7u0WMEZVicEpNYHK8E7T9AqiMjONGm2DKRrXHT7acddJlqfefCI4NVAMqiClFteqwG0u000XEMXNi2UuLJIXQ8xJ3p4Pg25tc7ga65S4vP/sUV59+imvfepbdV16E3jaUfXBLSof6moUA587DpTu4994HePP9b+PuBx/m3JU3sdtdY9OSkqWMgaCBMjqqBS7Q66dFHDw2eT2KJkuT1i1hFWkjWJOKlAiatMhyEIWUCUQ3Op0OZlCWJaodLDpBkmonmODlNucLY/vFb/O53/sdXvvTL0DvBqhB3K3M4iSpd+rFmFiPzXE4TmmLc2V49D6OkvZHFR+M20+rsjhrX71oH1J/bl38YXt7O3fWGRkZmXDJOD70eilAqwemWQfMZQbso5+3R8Ivw8GLtAQoZgbdDeTy7bzlwYfZMmuS1c2MMMP3L4t4mTkwcG1OIPm3bA0mjAyCFlVlSeWSVmcCkXEkxEO+bqtLUJyl63LWSJdlX1uTZAoPluw3vPLhqJiITlEQMcyEolAETWWHBbpihLLHeQW85Gv/6XGe/sLj8MoLsPk67GwCZdpa1XVq9SUaoHcdXnuBF/78GV743B/Cxdu58Na38dD7P8D973wUNm5jOwpR1wga0mjlSgiGe0wpUQ2RUqXISkqmdbdGTZEq8NTVfWr/uIB5OdSu85jwalWVMPaTkuZcZw2XDru7u4g4a2KshZJu7PH1P/4sf/YffxeufRu8B/0dGp8TDSmVSNIijpAUPEZZXZuKbGnFK3WcgkyPDeYx7V7k77NW+Bn1qVq0P2vHju2/7Wf+O8+4tt95jmuTEAI/8iM/8p1PfvKT9+VRKCMjEy4ZGUeKf/gP/+HP/fN//s+byX3t2TLOIPIoA9Shwb8t0W2Nt+LayJAR5aF3PUb3ttu5gSCqqGhaM1vUY2aO8154QuFKtFY56JgIl6R0iYjKKvAtZ34SddYnfSeBxDhJ533WCLFZJkz5mRtPtlCllgavEkwrc/coaZLvlhQc2zESMaTf51wBWu6w7ruc6+/wzFe+wJf/8DPwwvPg/aRosd30f+sjoSqBjINrU5nGa8NXAdGISA97bZNb11/kT559ij+5cjfv/8hf4cHHPsS2CZtRkW5gp+yhXaWMJUFbtiYjig8RwYX0vQJUKb+KEJOTS/pJFleGrIc1+uVuk1qy29+l0+mwJpFueRO9fo3P/H+/yRtf+Tzs3IDeJnhEO10spvhB6wUfUYIobiXmRlBFbEBUNf5srXCllU216I11sL/PEEB4057zl60eZyJ+WPHBIp9bkz9mxhNPPPGWHB1kZGRkwiXjyPHEE0/8z+1B092TUatqMteLcSWPOxn3VStJQcGMd3/gg/S0wFtlGKNFVGbLAz+IqeZB0Ov16PV6VdlGQQhVgFApXDKxcerJgv0UXvNMaM8a2TIuCD8p7ZDVLhlzjHpV+yUCI1ZkTAgdtnZ7rJ07T393h24QOrbLxVCy+fxVPvn//lt2v/0sbG5Brw+UqaqOlxTqleeKJXFJJZ5BDPGU0pOGV8fLbShDStOlgOvbcOs1nvyN7/BnTz7JB//yj3D7fW9n23ZxVXZ6fTpr3eQHJ9p4zA7u9kG6UPMMSPp0fNi4f1xK8az30e7uLp1uoCxLRISLGxfob99iPZT0X3ue3/03/wK+/XXYvI5iBPoYhliBBqUsDbVItFRK2ao05YBQBKFsVUEcd6RDnnOLkG5mM/X9i/59tD0XJU0GitzxfdtBx7j9+pBpleTq3127di13IxkZGdkbM+Po8cwzzzTKlvbgXq8KtAfQeQfweQmLyRVF6toGqQQ0VSnoZhOF22/noXe+m213omhDHE37znHVRw5lEiQ2bKQ3YqK3vbXbHGtNdK1qNaCconJ4E+9x92SenM7ef+T7dPX6hHz/HjAo9KTk1ErN6dZKX5FkrL6rTrFxjv72LhtFoEufi4XxzOOf4nf/t/+F3a8/CduvQP8NkC0IJQRHg+AaiAjuAXcFq77DFarxv4yOCKgU1ZgrBHWCGpTbsPM6W1/+Iz796/873/z8f2Ct9wbrvsvFoovtxpQehBJFG7+WPbRElTOsQ2O+L0Xc2TnXxVQoioJgEPrbXOnCzre/xu//q/8Vvvkn0L+OaB/xpIRBkjqndKsUOmkfBFJIZDiRsixTdCLWbKetL52HAJlVGX0UCr/RMbWOZX/hF35hI/csGRlnG1nhknHkuHHjBiGEJpWonvSbWTJxrQiAw5zIjJOb70c21GFNEiAH7njL/dx29z3cdMWqYxaEjgYYIV5mNXk83NXnWi4NOzs7SKXCSW1frRYFrYiYPHnMRMJsAe9ZJRqyd83xt/+k0tmzvDZjOukyGPccbexlq3seJfZ32egoG96nU27zh5/8TV7+T5+CzZchboP1K98Xh9JBFbOkJAkhKSoxb74jFQYWzB1JNZqTeW+kSc8IQPCIlX0oDH/pW/zJb/4btm7e4j1/8b9g25yurlF6q+qNj9GAVH5mqbx18qqJdYoRzkTD/BlgYqlSkgaEQEeddd9h56Xn+dT/+S/h2rfAdqC3ncgdEcpYIhoIQYmxIlQqFUutlnUcF0VUofKYqY9W5uivZunnxy16Tfqsg44jbaJikf639gGc9pwv49kfHfNm8cGpX/OpT31qKwdVGRlnfFzNTZBxlPj5n//52+oBsK1saZeDHjXOXWQwnnfA3fMdKikWrAKyRBBVq20aIHR453s/gBfrmBaU0VJAKDJEtsxy7IdBtrQ/p626MTPK0tjc3G6+s53CVad2zfM97e2wSYDD/J6TQohMUqWM+3nStt/1nOfazxuMnzQyZfR8xhEt7YB/Gll8Wu7f4yYvxt3H7X50nnt+1e67ebZ522nWz62r6SiBoujSj2VKo5WAEgjRKQQK6bEeb/HZf/vrvPwHvwM3X4H+Llo6wZTgSiCgUqCuiFZqDYtILAluKJaMbWuio3Knr0kYqdgflUT6uEAowON2Ina2XuUbv/dJvvIHv8OGb9OJ25X3DFg1XpuAuaQUH0Iax71ApNOoV0VkX8XIuOd73OYKXqTPUy/p7t7g3/8fvwIvPgv9m6nakHRB1zAPIIpiEEsKAcVR0YZsMRxRxcWIXjY+LU4l1GHYu0VEqKyMm02qtDDMJ/6t/ZpZNo+2Z+/R9nzepG3Sa6eNJ6M/1wt049J55h2TJj1X01Sgk17fPp4vf/nLOfjPyMiES0bG0eGLX/ziF+cJ6KcNoocd0GsY+MvEGJOg1w2kgLV13vqOR7CiS9+U0OkSQmff3OfjnDyKCCpFkiSbIdQkEvtWiMrIk9+TejzLeHZm/dt+ZNaqtM9Jv0bjSJRxFWXOOhbt0/uxbKoIlmWJdorGX83KSMedi+JctF1++1//K179/B9B/xb0tihwVASRkCbVLdJLqtTWINL8DYvDgai3K+4kMkaaFN8Es1R5KFg/GfFuvcE3/8Nv8fXPf4bbpAc7m3RU8BiJ7jgptajb7bZCX0nVl6gVJDW1cXAUAmKRQox16fP4v/9N7FtPQ++NlBLlPiiDWH1/qgw1kgrMXi+W+meX8f+f9rzMuqhzFAspo8/qfn3taFWjVX/uYozNOV2/fj13RhkZmXDJyDg6PPnkkw/PO4AfRwAtTlN60d2rqkVGs0R36QoPPPIo/ZRo3nikjFuhOciEYtHV2r0rMIP0od3dPmbtwEtP7YT5NE+kxl2ro1rNP4nqgYOc636rrJOen1Vum2nX7qD9z3ERCZk0Xh5qNQkkLxWLECSwXgTWvOSi9/jSb/3f7Hz5j6G8DvEmhYKbgUhSlUhd1a9NamhSnlQ+Ky7pZ/Fqk/R6r0bggBG8ROtS0qRKPTgEccQj+Bb03uCrv/ubvPT0F7mj44SdLbpBKSrFZjNhZ9SUXwaVB2EP4TF3UO3gpdN1Zy32eOFrf8oLj38Gtm+ARYKkKkMCFO4UZo1KxaSl1BohUdLPVXtqwGWwSbWh1bZEImRaf7fKz9ooOXOUfUMIYWjsMLNG3Z2RkZEJl4yMQ8crr7xyoEHvKAf4erAsiqIpJZmc/AJXHniQ9Uu30ytLCAVlaVhkyJfmuCdTo+0lkqS329vbrUnV4qtYx5lOkidV+1/7VZm8nyYchCyeZ4U5X7vFCJezch8e9r2rRUH0QTpt7a2mKgQvOU+fq195gm995vdg8xXwbTrBwEq6oahIi7Sl8sqtNNuKPIgKFoQobUVLtdDhOlzmWCoyotrK0igEojlFqEokl9tw61Ue/+1/R/+V5zkvJV3ro27gTiHaSp+dkjbkB2/PNS1Y80hn8w2e/P3fgp2b4H0KAYsRdUM9It5vlXeWgbpGRxQm1c9e+dpMo4TGHf+8CpFJpuDLTCOdx2tlXoXOcY+P7k4IYcij8DOf+cwbuRfKyMiES0bGkaDX681tqDaNRDi04BTwqkSyVLnjVtfGdHjbux6llAIjGe81j5Ov1iM1GmCZGTs7O/sESyej6kFezV5Nsue0THiXfX+terucFcVSJlumwyRN+OtJfvL8qIQTvkMRt/HXXuSLv/1J2Hot+aj0eziRSEweKBYRyopYMAKOUKUGiYEm1agRcbFmQww80jFDLak5Sk1b1BYxEyAC3Y5S9iOFWfJO296Ga8/xpf/4e9zmPYreNtLbIVj9/KXqR3VFogGlU43gVXWmg7SniqAYnVjyrS9+Dr75DMQeao5H6GhASYodEyOKtZQslbJnRqVsrR0a+J/oyDh+tNuAXDvoxonud2OMe6oofeUrX8kdUUZGJlwyMg4fv/RLvyRtg9Z5A5qjnmB7lWNeWh9vSgE4FB0eftd7KENRVfgpCVpQaEirV5UJ3SoRLTX6/T69Xq96TRh+3RxS6nm9LVZlMnGaiI1VbY/TeD0WWVkdZ1h6EoiXk3I9pq3CZxzseTSqkrbVYoIWBWYlHXHOd5yv/NHvE7/9dSh36BROZ00oDYpOoB97IJaGS7GB6W2lWam9WwyqCTrNJNuHgtPB7xyGFjNCSCqP3dLohoJoThBNhry9HV788hO8+MxXua2jdKrUI2+bx1fkjrcGauHgKcF1xSPKPrZ9i6/+0R+kikT9bYJW/UidbqJ704ZExscO9e/GBez13yaZzrafl3k8XKZ9xjLut3mUMot6uBxXX1AfZ703M1599dXcGWVkZMIlI+Pw8aUvfemz8w6Ch1Xib98Bk4BKKz1IakJC0Tvu4C1vfZBo4FWAJBVBs2pB9miAtbvbJ5ZeVWrY2565fOrJJ1yO8547bZPdSdUoZiW8VvVZOi1qlrPkJXSksOE2dTHES9ZD5LXnnuVbn/sM6C4aIjFG+qUjHSF6REIqG11v5tIoWEQ8kSwWq+pEipIqHzV6DQnESvmREm0YbNUl7vecoF3cO5SxQ1GcI5phbuB92L7Olz/7KWzrJl0VOq1Q1z1WH5T8YFwq5U2lblHXA5Eu6rCu8J1nnobXXoT+LUIhlLGHB2c39lMaVeUdUy98iFtTtUlHyJTBwQ+OUSvPGyr/m/S7wxlfppVbPwn99iIViw40sWpVesxEe0ZGRiZcMo4UTz/99IcX9Tg5jslcSidKubiJUUmGdHfc/SYu3n4HO2XEXVBNueExxiZv11cgDmkmIq12K8sylZicEgQMUqRODrLK5Xjb4jS2/6hnwSyTkGlmk6vs4XKSr9G4Pi/joM9lUoNIUKKnKn1rATbKHf7z5z4DvRtgPazsVelHisd60aE2gdWx1XOa52ps+V9txs/hSkVt8kEpii4WodAuEjSVe1YlaEgvLHe5/o2nefXqs6zHHmKRTmUmG0InkR2iTQnoxjS3Ub7M0VKVv0zdboVH1soeX//C58B6QCTGPqLVOUr6bpe20b4he1p/mHTZjwQyma0vm9XDZRqROa6fW+S5m9VgfFEPl+Pqa2sl9yjR8+M//uN/kHuljIyziSI3QcZR4Tvf+c7M5YdH/VoOGkRP8oOZ+P1ijZS57EU0dLDQhbDG297zGKUUaLdLaU50BxUcJ3qJaCUjrUpPjv/8iSc+dIyj0tT2fnr7xSS7Fkeq43DgjZs3mqDV0IHMG6+0246oTm3DacHVcU52ZlEWHKUP0HFNoPKEc/ntOGvVjtG8/XHvWZUqP8f5/mWQROPKQJ+We39ZK/KTxopJ7Zd+BnNHNb1GVekEp+jtUr76HC99+QnobwElaJX441aNKpKK+dW0QYskGR7iZCrRo7UCU0b67SqtyLwEUSK74Kl4YH0YAji7sH2Trz3xWT720CP0JFASQApKpFF4itTq1ETyGGUrNFYgkT11uq14aM5HJBn+mtcltEvUImsa6b/yAr2r30hqG4upeBAF0UCak7LqWGPTGtErLc+E5plkl1vHEzYUW0wax8f/blyZ9XbM0b5nvDrOlHZdX1NtwpdRhW173B2+99r3o7b+P/7+nTX+Ge1rD/oMzdv/pFRzGyqiYGZ87nOf+0gefTMyziaywiXjyLC1tbUSQfE8Lv1aVYFuSit31rjvoYcpZbhspqsMVsvElmKeOzqgTwqQZ3vSU2nCeuVl0mpYnR51Wif02ePh+J6pjHy9V4UwOkn91XEg6MjE0iPrQbj2ja/D5k1acpbBEFNNuuXIjOMnGK5KZaBrPV79zjfZef0lAjERH6q4SaUu0eZzbKQKkiXeaEhV0r4WOkIspOWZNMFWM15//luwswkxNqzR4JnR1hhre4iTg6hjl6WsHSURljVuTlNlzqJOO45+Z9bFwXG/M7Oh97/22mt58MjIyIRLRsbhot/vN2UmV32iYFVVg7Sv3ifAxgYPftcjlGZVkHW4QfG0FfNZyYX6vTE6Zd+qlSQ71ffafuZ7GZkwOMiWsXokW74uy51ENosOlRtLR4yvffVPYHd7z/jR9g7xVelezbBXrnHtuasUOqzSmNejpVa7tgkZl1Y7WlVCG0Fj5Oqzz8DuVlKxCLgJ0aeMub56FQ59jNp23vcvkmo0SR1zkp6fEEKjDmsvlN28eTN3PhkZmXDJyDg8/KN/9I/+20UH7uMIyKUKptzqTJv03vN33cvFK3dSeisoFavKX7aUMEse2JeRAtDv94kxDj5LTi/pMkveecbhkBgZGfm+W+6k7ihI/TZ5YtVKg4gj6gQzdjc3uf7tq2D9NCjKcAlfWZFLIA4aBCwCkee+9Swqvoc4GJee07as1RbBsl9VPhGpLH8Fi32uPXcV4k6lcKnebzXpEzkpCx7LTNc7yWmMi3x3Tbi004wAPvGJT7wj99oZGZlwycg4FDz11FP/sl0ib5XJFoBCC0K03hNaAAAgAElEQVQIqcykVIOlBu5/+O1Id6MiXFIJyMMO9hf9fHcfWjXb3d1duO1PMlmRVS2r/ayd5En+WVfAnIT00NPQtkd/ntpMENWNgPP6K9fg1o3Kl2Xgz6LQVMtZLaLAgJJXX/wOxJIgYKKYDZMtJu3qPtV5+N4qM3XakQnJs631rNejSxCh3O1hN64nQxnvA1VaiaZXaVPZsE5BrrezG46305ZW9ZmeJY6o/16WJWY2FO/W6UVPPPHEn+UoISMjEy4ZGYeCr3/96ym/WY/+llvUPd8MRAKqgViJit/6jkfouRJFibVE2S0Z3y3ZFHNSVZT5JboBN9jZ2dkbNAwtS+qpn8hkFUZGxul4ps4SsXfUbamqKT0GAXM6arzx8ktJNeJVnu2IukVW6HKYVV4u/R22blynt73VTOrrCfC4Esp16tDoBHvU86yu/mcDV2C0aq/e9laVTlSmT3NP728qBfmIunS1yKpJ98VBFy0OarS/Ks/7rKQLI/dR/Sw/9dRTedDIyMiES0bG4eDll1/eE8SsclAezQcrFO4pyOx2ecvDb2cbMJGBYW5jzW9Ly8UeJVcWIVuGKwsou7t9RMb454xGyiPHf9LVIdl7I092Mw5/0pHviZNPvDTX1rX5TsUpRNi8cb0iEUqoEm90zHixEu1FnbYTYXeT3e1bqDiBqvJSrdIZGxLr+Ptb2l4uMrFMcX93B/q9lGos7XFbpxxvq6DTCj7ji3qxzFpRaNxrZn3/cbXNtOOqfQrdfcjHpR0LZ2RkZMIlI2Pp2N3dJcZ4pClFBwlQBUEkVMGngAY4f5Er976Z0kOz4jXNoX6Z57DYZ9bBo+IulH1rKYxO96M/bxnwjEy6ZCyHDDiOCdJpV+Qd9fnVFe3cHSERB7G3C5ZMYJWBf0v7aq+KykVVwZ1QBOht0+/tNBNfkaTOEcarXPa0hUy/PrVZrli6TjFGsBJ1a6U26dhnZTAOr9a4PPo8L+senNY3TCKwZn3/KsYfZtZs9e/6/X4eNDIyMuGSkXF4AVA9cM+SVjTOrG3aKss4DwVpJLyzl/WrX18URZt9gdDhzvsepLtxkRKaVb0h2XGliJklKJjVA2JW09zR82wHSXXwXO+HP2u0rObs3zvub6OrOcsKXuZVRo2WsjxtHi7H7Uuz3/fXz0ImZU4vyTLuXjgqQn30vjotz/e4/n+0fed9phbxF6r78XqsFhF6vR5U6pDhFKLlpcdMUzvM1/9HECfGPrTO28z2xB+12f0840x7nG9SlFoxDkWBVYRV9aK63OHKkwSj43/b9HVc+0yLPUaf1UkLVJNe0z6O9rEc5HlY5vM56e8xxqH2GlXr/NzP/dwP5FEkIyMTLhkZS8VP//RP/3IdlIQQDlQmcBnB+Swoy3KQ7y0BpOBN9z2AFR1Mdaj0peEYlcx4xeJ+EUEI9Pt90iWQpUnAD1vdM27CMM95z7JilpGRkZExpv+UkFQuaBoPi9AiL6xiXIbJtcMc/+ZLpyWVGkQgKEgywF9kLNhPBSMijZmuu9PtdquYQSsyRqvSSYrsWZCwCfujx7KqEM2b9nyQ167y2D6NcPr85z//h7mXycg4WyhyE2QcNp5++ulPjK6OLLJKdxSDa2Osh1fyaUnVA6TL/d/1dhxFCECsXl8FdU0EYE11oKlnKMs5zsnBiCLiqXqnCLs7/eo9+5EteuyB3yxBzOi5r3K+96FPjFZw1TSTXGcb+92T+f5Y/evXVitGUdY2zkFQrKwqE1GrXIwhw/WDD29LgoIoaJfQ7VTpwQwdZ/u16mCVma2OWYtsp0sF2VtUOqm7PLVT0QFCRfoMyJTUX9ue9pET8BxPGl9HFcVHYYI7LuVpFfuV0WOr///Vr341dzIZGWcMWeGScei4evVqM+DEGBcmWBaVUi8abDbyYwG6a9xz/9soa/mxA+YNNdGUdqyly8c87tfGh3Uot7OzQ61uOalpHvOuhq16mck8+c7IyFg1WGssk6D0oyEaOH/pMqimbSR0bMa/Q+ov5lfFVpSKFFCs0V3bIEZP1QSnjM/q4xUto78TkdohbZBahBPdWDt3HtbOgXZAQ1VFe/ABZoyoTIfTeY+jP15GHz1PvLVILDfL+09KJaM33ngjdzQZGZlwychYLq5du9YYhwEzky5HMcmb9DrRgckdEmD9IrfffQ/mXlVAqD/g+Eo6znKOdYWiXq9svU+OLdg7jDZoq1vO4uT+uP1cMjIWnZzt52GVcYzXSFKI6KKUDhcu3QEEcEk1ilxaZi524HSiSdd+8fshpRJx4TbWNjYoY6yIj1qRo4DNbPRbkzE6pgS2+WDxpVjr0r18RzLal06qDOgO0QZpJgJexQ3SeOLYkTxzs7bvfq89qpTdVSdXFjmHbJybkZEJl4yMpaPX6zXeLap6oLzdo5hUu0B0QKvvUqG4/Q7OX7qDWgysE451VaiLtsIjxkiv16sCpOVNzts5ygerpjQ7sTBrsJU9XFY74MzIyFj957X2MutF48Kly7C2PlbGksgWA7Gl9Q+Lk29VRRgRkA63330vobPWmOXWCz4mlf5TWik/1QaGMWoOPH2sMVLMIFpw7/0Pgq5VaiCqY6nSlULnyEPv5bbv0RzrLMc37jWrdE6TfGfMjF/8xV/s5J4mIyMTLhkZS50ot/PB550AL3sAnenzbNjE7t77H6DT3agm8GmQVwby64gnmbIcLeUyy4pVjHGoOtFJJiDG+QBN2p/F5ywfZ0ZGxsEjQ2/M4A0lurBx4SLhzrsq5Ub1LDddrQ+l6RxUwbSUPlwFOmvc9+DbkvfaTCmm4xWftVNbo0YxHyJiGnVPUPrAQ29/JKUVITiCaHr9xAUAGSarDlsBNguRMSvJsczxdhlj+KqmFY2qcZ988snP5Y4mIyMTLhkZS8HP/uzP/pi7U5ZlxWMYIYS5B89lqzL2HZilKuGoAUy56943E0NIfi0uTWimrk3gpW5LqwC0jMHeKgPf0lJ5SiGkcpknlGSZVC503D57uGRkZGQs2Od6Kq0cQpFUkdqhs3Gey3e/CTprQFjad03vn7UhNNopS+LDG016TpUqZJL8W9bOc+dbHqCHUJKqCzbxhyuOVqk9ieyof67Jo/b3to/SJHm2NGOSeTLXV6EE7rz/Idi4kHxcquMSB9yJeOt7dWCYOxI7zKKuOU4CYtKYfFTVJE9y+qGZ8ad/+qfvyz1NRsbZQa5SlHGoePrpp38daExo9yNb2hPm9mrQslQMs1RJEiet7QXFokO3w5sfehs77jghERc1IUPK6S6qikBaB06yf4nMif4xM5BL49qmTTqUXlYEi7O9tYuZp2PW9LcBKaPVOYyvTjTPSthhKUymfe60++Kgx9Fu4zZxs8ppSrPc3/Mc/7wVoMbdi0c1Acg4Pcj3yGLP2UGVASKCmONeUhRd+ruRjgbMnIjyyF/4IJ/98ueh38O8RCkpgrDrnkgHHBFr2IlJY6C36QsZEAsDgkEHBMiIGa9UY66IEKsFBKkULIUWxBjpY+BduOteLt73IDelQxk6iDlBkurEBPYuP9QEiYNYMxqqJxIm1Aa5HhOnI4IbBFVw6Edj1wvWb7vE5Xc/xvXHXwFTOuoYEdcCN8Pr6+YDomVA7ljyiqnawXyYeKr4neq8bWg/aN+DQEf2k+6X9hVpj0GLjl1DlMTMY9243x9WlbTR941+17RjGn3Pc889lzuyjIwzhKxwyThUPP/88906d7px8zdb+UBbxCHGZLqnBbfffSelG64h7UciyXYVg6OoUDRzwCABawV4Bwk2ztoEbJJnzElPiZnn+OdNQ8sGvhkZx9M/LrOP7GjA+yWdTqcZr0tX7n7gu+DiHRA6SOjiDmXpSe8i4HVlP8AnpNeOqlP2ki2tCbckg9thtYcRiZRe+axop/LFgH7cpcSAAMU6Dzz6XnztPD1RYvWRHkeOaySdZ5xKtR7TTQbb+H5O6auyEzZ49wd/AMI5KNYw83FMRYtoqdU2k2B7lTZiM5MTGauHVDkyIyMjEy4ZGUvACy+8MKRWmaWazEqtboYA62vcdffdR3ps8+ZwT1MS1OlcedX4YNfjtBAuh4VpqV8ZGRknqsMjiCIWEUleLj0Tiot38tb3fxgoKi8XbezOxJPWwcrYIluSJ4p4vdUki45sg7pBNQHiWlafY4hrVSEo/ezBsRBxdUqJRC/RQhAVpNuBjfOwcYF3PvZ+Stchs/i6L1faviy1Wa7P5MM2vY8LbO3AfQ+9iwtv/S6wgjIdNW4l2hGEco8qZZSEScSO4SPbHoJoani/yMbQtTue7ZRPvCrFd0ZGRiZcMjKWgps3bw5NVs1sKfLnZU2eJ77GgNABnLVLl9m4cJHogjUi5OHBMuJLO4ZltUtNzpz0EoTHdZ+cBnPhg57DJI+cTLJkZJy+vnEPseyGaCIL+ig3+vDu7/0huO1OLHQx7VAUipdQSPKp9aq88d50Ih3yWxn9W3uqPXOJaUl1mt0ds0TQpIlswZ2Pvo+Ld72JvgMSGuXNMKGQvlmr/Tyky8Q2RAlrG2xa4Pv+6n8F52/Hi/M4HbrdAsr+HgLK93wGTSpVO9XIGX2t5dD+BOOnfuqnfiW3QkZGJlwyMg6M9mS/rlZUl2U8juB0ngBVgoIHLl25QtFZS6k5J0QlUiuJzKxRuJzEycRxtnfbJ2FcdaSTRr4sQrTMQsJkZGScLtJFCFhZ0gmOuNF36IWCWKxz7sqbefBDPwjFBaCgjE43BLxMhrQh6Jgwc+9WG8cO1BxK1LRvMwsuYGrpb9VHBwSJ6TWqpKpKbpWbiMJtt/PdH/nLbEsHK7oQUtxhUo3r9ZG10pkSGWRTlScztZ8KOx7ZKZTbH3k3F9/zfuicx8Ia/V4v8TkklU/wWmmTyKLG9JdhsmVgsjvyXaJT0pGUg6tcMg7zmf3qV7/693NrZGRkwiUj48CoFS1pBcr2pBMdZYrOXBNO1aRyEeXOe96CdgqiW2Mq2JyfTDBzlfmO7aAO/ZM+46QSLqtGapwGcqFNHO23jSNW5IT7AGVkZNJl9nHbK+WIhpQCgQTKULBpwnd/9Ifh8r0QzuFe0C8jnRAoyzggqke8WdoeLOkXVepQM2Zas0/jZ+Xd0ko1qV8bEApJv/bSk9daWKP0DnTO8/APfozz97yVbYe+C/igLHQSugxIlTpdaUDALEa4DPpOQwLsoLwalY/8rZ+AC1cgrOPSQXVUuVK9H2uImMWqE2nynzlwpcSc6nIkky9Vrl69mhsiIyMTLhkZB8M/+Sf/5L3tyVlNuiyDcDj0B0OKFBWFwJvuvx+bwqCY0AQ5Vv07rwfLsgLt5jtMEAnE6MSY6ieJzFjKUw4/4Dqq9lkGSXESqhOt0sQvewVlZJwsgma0X3MiIQRKEpkRJIBBvzS2pWB34xJ/6Sf+HqzfDt2LaPc8PRPcFSU0fi7SEAlWpe6M8euQstra3iSDqnmCoZXHipBUHT0gilIESYWVPQBdKC5x7u3v49Hv/wg3ohB1jTJWxBGCehWHyOSx3A/YxXulotkpS+LaBly6i/f+8N+CzjnorlFaUvGYQF+VUgdkT3Aj2DiPm+lboxoSbR3/Qf1TJr/G/WDbWfdwqZ+3Gzdu5M4oIyMTLhkZB8Nzzz33syGERtlSp7hMKg19WBO1RT7XPZVQpljjjrvfRB8bUrPokr/vsM5vvgmwHQnZcpIConn/dhKOv/77fgqX0c+a9pmZaMnIWC0SZd6+ov18awipqk8o6Edv0mldApEOO7LGHQ++nbd/7Idh7TJ97xK1S+isE71tRtsmM4Yn800Kz4SqRV4zNgw+L2UaKahinhQvogVIB3QN7n0bP/SjP4GcvwPrbtAX0E6RlC0YZmWz6NOQLq6YjE/ZWbS/LcuS7toGuxG2ovLo93+EOz/wfSkNq3Mu5UEJSeEjNih1PXIJmzZheDt85Djg0FvYjN3d3dwQGRmZcMnIOBiuXr3692HYkV1Vx5jXLXfiNm71bhYfi7bCIhkGCnQ6XLn7Hnr92HyWeTl3xaBZJr/LDbYVd+j3ImUZERES+UVT0nr4PTZ34H6aU07aqpbR/bSKRatCOux3HPMojEbbYB4C57jImEz+ZGTM3rftTVEVXAWL6dkOYoiAiIIGShM2LfDej/4I9374IyDnQNeIdDETotFsokr1ZgjgWPJbEUEJTZ1lqdQxmCCp0DQOmANS6VtcQFK1H4CoUIYAnQ140wP80I9/nI37H+KmKT0Hl2rBx+NehWKtDFHBGZAubT+UaUT0pP4UEwrtEHuRQgpMu7zccz72Y3+P4qHHoLgtkUNmyZ3fqkrRQSlxItV4LUpo9sn1RtxwKxvT3T3KE7ElKFwsXf8p214KaHhzmb4Z07d5Y6ZVJfzH3TPZaD4jIxMuGRlLxfXr14eIluMeGOf53hgjaAHdLuuXLlFaUry4xxHCaHVWgiZ5uLT/Pssgv4xAYJy/TJ4En00cV3CZ77eMjMUQ8T1eINokzApadPDuOrfCOh/64R/lru/9Qehewi1AsYGGtWZxpU5rNfNEuoyMR6oFIgHxAiw0YWn6e0BViJVvWuh0SBKagGxsgBcgXbjvQb737/wEtz/8CDe9Q08LoqTP0VHljAbwyqx3JAw+aDpR09f1nY52kn9a0SF2z7MZLvCjf/e/gze/A/Q8hI3GGFiDUkYDdSRoRRJV42aMWCxxS6SRKoh62qTeZGTvMysYx04Mqmu36DaPX9gixzcaV5w0AqNdrfPjH//4r+YeJyPj9CPkJsg4tJsrhJ+/efNmM4DPVSFoSeVsF5+tAZ01uHIPH/2bf4ded40oARBE04pUMr4TEJAkbm69/fgGfxEBSYHP5uYut25tIdpJQSb1QN+s4aVgpflp8Ps86d3//pqUfnPW0a7wtArXafTY8nVa3nOb23L1+qUDPyM1CaGCyEBzIK4IYBYxd0pz1tbXeeiRR7h24w22X3oVYpm8OprFloC4oCK4VV4logTVxhvNK0WmqKIaqhHUsWioBIpQYDHiVhnkWuXZcuEK+vB7+OhP/F3uevu7uVkqsdOhlJR2JC4ITjPCiVSkSj1uS5WmNFBm1L+VKe05qq5oky3qJJVLCCBCv+xTOpQOIh3e89j7+PaL1+i/9jqgiAoeUznqogiUMVbKHsdwREFUaJ3CHoLI8Wrkdtq7A9xJBwyf/IDfLjP1T9NSYFe1zxr97m63+97nn3/+F3LvlZGRCZeMjIVgZj8fY5yagrHsAXHSRG++iX+qyEDRZf3+h/i+H/4v2ZUuURQVxaKlwK0V/QgjlZeOexIiiohy48Ym29s7aUUQbSWJDxMr4lXwskTC5TQrDPIkc/52Oo42myTpzsjPQ74Ok9/nLdPa0B4LKnI+8RKKqdCzSOiu8a5H3wNFwcvfugqUoAENXcy8UauEyntFKzNyxyuCpfrZwd0IhaIqg/GYZMiLBijOpe38Hdz5wR/kI3/7v6Fz5328YQU9KSiR5L8GKFqZ6g7MYIYJl/FT/XocnDdeaRYvqvG0jP0qcymgoUPRXYOi4NFHH2PLhevffg4qJQ6SiKz0/2pxR0A0YOZVahWETiKupqlxpB3L4HPu5eApqQddMGN+0mQeIv24CZfajL8+jps3b2bCJSPjlKPITZBxWNjZ2RnycWgHJUc5GV/4uxxuu+MKUqxRljGFnlIHFHUwMxKEHJ2r3f6Hb0JZWlMSM60OTm+nw4pDTqOq4Kjv44z5n+n9qrHk9svIGF6oMElTb6mq5gCYprW54GUiLUwwHBNHQsH1fonpGu/8gY/x5vveyqf+3W/Qf+UFbPsWaBe0i9FPaTEI+MAppYy9yuOlJhqgtH6lkAkVE6FQrIF2kl/LfQ/xob/2o7zpkccouxfZskAPhSCY1FWNxqGqyVwb1dZjU5UwJfVzMUc3sVftInQ6Hfr9PmudLobT8z6lCJsGhXbpnbuD9/6Nn+Tedz7G4//Pv4EXvwU7b6QvLmpmKOlETBU0Quzj7pTRURlmi2TkHIcJF9mzd2+TWeP2vs8570+ZHAw219g76hm26v18Sg1Lqu+XX345d0AZGWcAWeGScZiDys/XA187peiwJJ+jA/Dik4qKNQkd7nv/h3j3h7+fW33HiyJ9pgMUDbmSAjUbiTPksNt2ehtJABeuv3GLfj+mqgguY1OKho+2/tzlHv9Jm+guUsUnY3Wu+yypABmc6Wc8X4MJE9lKASJA4Unt4UilbqkJCcUrb5UQOrgEeqUjRZeLl6/w3g9+CFs7x8s3t6AXk4pDO2kcIqkzXHQwzKhACHiofuckoiZ0IazBemU0e++D/IUf/lG+72/8GBfvf5gtPcetvlASEFVitCYVSHBwr6r8SOXZUitdfGjckyq9qB75XBZPiRSHWEa63S6llUgRKGNJURQ4St+dWBTsROOOu97E+z70vcTQ4ZXXX4cypoBCQ5Wz3FrUaZEkTq0GGtkspWbR/Jyu3p6914qicXtbjon/AbZUPno2U/fRe/8kpBTV8Zu71z57WeGSkXHKkRUuGYdODLQnsKPEyGERDstawb3z7rtwFFUn1gO1LCFF+ihIFyrz36GBfvnfP7pfDul18iY67XbIEz9ZiX4n43jaPJMvJx1GUoMktUTAUtWh4A2pICZ0QpeyX6JFwLqBN8rIduiwrh3e8bG/yQPf8xf51p99la99+fP0n/tz2Hoddm4Chtsu3pToqQcsT+RM53z6/8ZFuHgZvfcBHv2eD/PWR94DnQ22tMvmTgmhoCg6RByzPp2ghBDol2Xl3FLFHHXaTsXmaCNkSd4p0k47Smc+KBs9Z7+XhDqR6D12Y0QwOrJGf6ek6Ciho0TvYYVxI0I/bPDOv/LXecf3/RD/+YuP8/UvPJ4UL/3NqkSTg0egrBiiWqnC5ECk+b1UpM3wXvapMiQH9XARP9C9N09KUbva1kk0zs1jVUZGJlwyMhbGP/2n//Stv/zLv5wkyq1KOfXP00pDr8jsAUS5dOVu+g5adOjHSNBOKm0ZWwO/xwNXN1gq6eJaKW9mqwxUy6BTnKasBp2Ucdom4qsQDGfD3IyMWdkDw0RR12oSbMlHpfFxEdyMoigoLY2BWhRsmxElsGslxcW7eOiDP8DD7/0AvTde4ZVvP8sL33yGl577c/o334DtTej3KpZDoQjQXSecv8SVe+/jnoe+i3sefgd6+QplscZ2sUYvphLSYX0Di0k9Gy2mCoKueBnHTNcrAol2SrBVxveWylCL7anMtFj/ZqimtKjQKRDpUPYiIYTKoyU26VOlOjtS0IuBzqU13v2Rv877PvxDvP7sV3nu2T/jm9/4BjuvvAS93VRj2yrSpVaD7Me3LNpP1ik9zkBxNM+eBd/nI98/ma3ALULsARGhHFxbqvLlJwgf//jHf/XXfu3X/m7udDIyMuGSkTEXnnvh+Z9FK3KlCFUlgJSTrEWoVm5mmxi1VwGmTd7mWS3w/YIVUSg63H73PexGpzQDCUQXxOpjiVV80A4OFNBBitGk79h3zqf7HufEWETS+0oTIo6rYDGmvO89x1u1WxVwDsiXGbwvWsbBQ/v2cY+8TY+Iy5l2L+z3t3m+o00o5ok8B27Tgzy3eydYkz5jlmM63IB9lvOYxZNgVlVJXkU9/c/YspSjSvJxUU9kRF06Ofm6VB4o5rik1A91J2h1j5lVeepKXwI9c3YpCHoevbzGldvfwpve+wN4LIn9XXa3d+jvblOWJSEEut0uRbdL99xFTJQoQilKVCWK4lExhKBCP1ajb2U0q6pEYnoOWm0xqlQRgdheMUEHrxdrfhcmSFn3Po8yCBw8pV8ZgBZVe0VC0Mo3JilMkm9MSnOKCBYCJUaPgmLtEhff/X08+ugHeEdZ0tveYfPWDTZv3mJ7e5vY3wVzFEMRlHaq63JKJDdxlntDVbX3mI39fb2vU9PEmWmPVRWZvGpfd6J7VTWq5fVfXZBCldu7wh/95q8TX/4OGgT3Hma1v4xN7cOXuQgw7dmbpL5J5Js1f3/66ad/CsiES0ZGJlwyMubDK6+88l/XbvXtvNtFlC3HIlVXge4a6xcuVkZ+1eAoikkckiSnKpCJqNBjmNdMmpDtyXcWG6wgTVLGEE/F/TeVUFsC2bLsoC3jZBJAx3l/j6ZpTusHMjLmGv5at8xgcUAHvx/xy9BGcJEIi5hK8+AacBHMwb1DX9N7NBh0Qc7BejWRrv0sdnG2Q2dqSk/0yff35Pt9MglrS14YsEphIe2xt0XwtKOgJlUZJQqUHti2PkEC2lWK9Ts4f+XNnK+Ih0TWGOqgFROhDYlcT/Cnp0Tt1yfIPgtibdXyuM+bNR1rnO+KmBNEk+dObdZs2rSheCKaLrHLN//kSb79xmvE8mYqN54qcWNxtRQuo/1yjHGIdLl27VrudDIyMuGSkTE/XnzxxQdwR2qCZYGgf5I3yNGMkAHW17lw4QJWT24MRAWztm52scnSfq1x0NOtlRfjSIFxwZYvUJ1hkUDuqCek8/5tGeee87KP97pPe36Ok2w5zHti9PnOJODZu++Peqyc+p315LhWXwzeldSXZTlQCFa2LaICogNj3hnv+dEx7iT0vaNjRJtAdRFcOvQ9gkM/GmJVO1bvMbfBoo9DkBFFzz6pUfs10f5/31uZaZ5+rt1Pp/Nuky+K9yOuktK9RBCPaGWkKxgFQrdQiguXU6wmBSLgRGI09IQ9sy+99FLuxDIyMuGSkTE/Xn/99eFAoqpS1Ay0B5xYHEVQtbaxwfr6OpvuiGga0A/wvYd5zOMMa2vCJX2tHDoRsEqB7rRJx6R0tNPYDqcV+xGIp4FsmfaeWc4l34dn51k47ms9Sr6Mz0CVhnCRIjSqDPeUnkRVKUjRIQXLrPf3KIFxEvuyBEWD4l6gIil1ucq/cQERx2IiVqrE40aXWqfoDDJwdOBN094z4ffV3k2m/+ytn3Xk/Tr5c0c/r/bOGd17UZFxaFJEOUQxxJPLXLSkKj5/+Q6gA159DdsAACAASURBVATMStwk+beIr/SzqapDXoa7u7u5I8vIyIRLRsb82NzcbEiWUa+LOn950YHr0IMpAdw4f/EiobtGpC7f56h6GiRryW0VQGiKe4518jOqUokx7ll92hskZ5JhWfnuGasb4J52xcdoNbh8T2asYr858PqSymus8lyp/FLEnIhVabxn43kdO5b002KJNb4srQUfUYqhNOcUVyXvlMpnp1W+OzFZw3tv/Gl07N7q46rNZ3Xk/SpjP7fep6SpKX8PgdpnxT023+tVtShXTfdHRSkZIBSIGI7hZpQBLl25B7obYFuI99MrG1Pk1R6TRp+j3GdnZJxuaG6CjMPA9vb2RCXBvIHakZItzWMhXL50xxjPGatKQ4/kg/vqGFbW39dOKdrj53KGJwPtvPGcenH6r/1pKVE97hk+a891xvGPL/P2u+Pu0ZRK5EQ3ohtmhuGYgARdqCTzqerDnGSG68m+N/1fcU8LV/XmntQupUGMTj86fTu4D1uoFLF12tLovv57QPb8XX1wzSdto2rc0fhLJFTnHRBJW/qT4BKQbhcPgQuXLycyyJLhriCo6KoIXPbEvW1ypVa51L//x//4H/+13JtlZJxeZIVLxqERLvVgMsmpfZbA7dh8XLTD5St3JokrdZ60DEyA28fKQNyySgP9qLHdaQ3yD0K6LKMNsqLgZN4DJ30SPG4SO6t/QiYaT999flzXdXSMbo+P9fGYgKo03iDuVgkeOo1HR63QsDN03SYpXUTa19Kpa0UllYtVZY9rlZBVtEdrcWXgjl+l8ozsm5QiJu6V+nvS5+uEfRAHt+bnVGZba4ffsXv3WKUWDY5HBs7LaF2VujqWhoAzTyWjRSnNWL94G6yvw3Yd7/RxBz0BZaFHlS1f+9rX/gVwX+7NMjIy4ZKRMTP6/X5VIrE1EWivcOyj+RwlaiaViT40BOX8hQtI0FbhHkv506MRoetexcsKEBOzlEXOk6/lBU81waVVKl3G0d7bw74upzuNqCaz5+1r8n2ZsWySZxoJMw21erRN0Ngcz/9JNs3dr70sJdcMP/NiFKKYBDxaZY5r06+LeyJi5txLHa+1j8MqIscdc6uOsr5q2rw+FUuQyrl8/N4tlRSnSn+Sug0aiimirk0/Lu6YWHOHlB7ZpeTcuY1EuBQBL6vxV6YKjlfmWrf7cHfn6tWrb8m9SkZGJlwyMuaeEIwahNQVi0QE9nXBHw6ipplkzutf0CZwRskHVcUrieqFS5eJbrgrqgEzb4zOYuPqN1gBap391KBURNivTtGiQWOqCDGY/JtVq020VyLbkzUZCnTa5MHoqul+ZWePa4J70EB7mlJgP5XMnnsnT2iP5FqPu3bj+oXF70k70GRz2dm64yqaLKP9DnNSMc9xnLTJ8qqVhF9mu816f02rgBdqj5BqbDGpFQgt1UZr5cJH74cFzvmw7p39U2DGxz+j72kf337l233MAo5j9C0m41zGhFDS/iytg66F9oPC1a291D9La9Oxe/ea9Zi01/RxMnifNO+vvP40SVvSR7UX7wwToWfGxY0NuO02eCEmLieAxUS6rEI/OOn61ulEbePcF154IQ/wGRmnGNnDJWNlA9pZ/QmWP3gKhIK1c+eb8ortifXYVB1f7UdpWonkab+bZSJ03F4oB/Gx2O/8Z23XRarmZJwNUijjcAmCfJ0zDnNcWeQ6L6I+G3q97N3S7wcEiHgyyN271yq018pbZb69+hiyZcG9+P775NciQ793FBuSqehQu4ik10QtWLt4CUKRuByHk/BYlmW5JyX51q1b+aHLyDjFyAqXjBMR+BxpcCtAUC5cuo2Ig2uS0MpwQAQDz5a6SpHNeD5H4aI/D5kwbhVvkZW9kzrpWyTNqq1qGVUFZRzdpPc42jtf47PdnqME6yLeZGcJtanqwAx3eIFir/eZHfv1PaxrNMu9IhMXcCoFyj6kSK2yS6a7zLWfLR1nHwVby0TXxuwDUiciYb7377E6Bm2pW5KBTa3tUQgFJoHLV+7lmhbVopegsp9+ePX6EBFhZ2cnDwQZGad5HMxNkLFsfOITn3jHYQTk01QvSycDJHDh4m3UzEit4ghzfs9xe7hMa5dFjm1S288URC7xGh3UEHdaGto87590n2acDWRl09m+7qPV807L85/v5cPvLxYJ12sFSrrPpNlj7f3AESeRJ/PvgcozZf79gCyrfGbm3A/UPDVp01LMMCCjhAKn4PKdd4MH8FTJadXVxpBSiib1IRkZGacTWeGSsXRcv379Yyc+SBRhbeN8KlmJJtf7lHScdu183BMUNCcSZvrflhVYzktirHIbTipxPqqKyUHT8U9+j+P+yCbUi7XdaWqr02ZafBg+NTrj6R93WehZvMsO814Z/WtNMgwKPg8fj1bVnVTGEx+L7F1SbaRxexeZ+HdIamD1KZ8vMvF7TcAZ+P1JnSbkILX3S3Wy0Y3Ll+5MUZglwkUoAVl549z6HjjMapIZGRmrg6xwyVhJwmWakmK/4GcpwVGnS7fbxa2lcMEZlTqrM3FFZVWC62UexySzy9H/t02Jm1KhSwzgp53TPL4/4/L0l+XrknF2kJUuZwv7KVlO0z2Q7+fltcGsnyMj237YQ124YzhGXHjvPnlfm/qO23tLrWIy/96bz7MqNcnQKgu7IbZNwJVocOG226Czxt70qtUfL0SkMc0F+Omf/ulfzr1rRsbpRFa4ZCwdr7/++l9dVnCyaK78gQfEbpfQKejXLmzmuDhmDoE9S1Cz5z4fb5A4q4plXFuPluYe9x0nyaNgVKGyH2Ey7vyP497M2P96nsXvz1itCfhpUPgd2rMysfk0TdpX6Dk6anULtNUhs2GsIugAqTVy6M/PDO0rVjnkWqtdHEGIIhUxBBsXL8DGOtxS3GRshcxVHKvaPnm1F9yf//mffwL4H3MPkZFx+pAVLhlLx40bNy4ta0AaF6wcfjCmSKeDhg6IoVXpZIupQlGjemmqAZyMyej0F9hQYDMaHM4bdI5TkMxatntZ98qi7bLoZ+XJ9tmceOfrfriTz1U+7nF9z7Rx66Sf79I+b4xXx/CCxfGOq6OqzIO21zxjSjvtSvbpdyZtJ7kPTT4t9T1hY6YsA/8TA4r1DVhfBw1VxenVJzfrNKK66mXdBi+99FIeFDIyTimywiVj6bhx40YzYIoIi1jGj5uYT5v8t19bO/TTDMnt19lgVFfB6opBlsS7KXdYCOvnCWvriDvqhqnS6awhFinNkHrgrwMDhVg56LtMW8Grvt7HBZnLDRjLsqy+IK38aJBWm0wJaF1Rj+CO1tfPfci7ZnANRk5gz3nLnt8vg3TZjygZ/Y7/n703j7rkKutGf8/edc7b/XZ3ks5AB+iEEDIyfIrIkPiREJAAggFEgZB4E7ggiEHvAgT0CmFYSwXlW0sMUdCPsIhXFBH0QgTxYlwYptgx0BAydEJGkg4ZOkNP7zm193P/qNp1dtXZNdcZ3/3LelN9Tp1Tp2oPz36e336GPA+UuuFDeWOwbRlQj+7GfbGpMhkDdLy/28blr5+9kLy5MutS81XGWVX5Ma0qRlUI8ibeeC55V3SPCtXaT8RL7+gYJ1DldnNAtBW/hFJvziJIZPQes37WmP+a4qo9ji9y+e23kz4Ndba661+qba1xGY0BARXLUUkcJc8lGX9eQQtCqBQYApu3HoG99/wY0ARWGiQmLz/r6qjZ9mFmSCkRhmFy7v777/eLuIfHksJ7uHh0ji7K27l2aqrmcGmnVEeLulzZAA6kUX3AzAi1Sn0npZTE7rs8B8n+mk3xKGZ6ETL8d0XQeHh4LB4Rs8zPMo1cIU1kYTnB2Gx9V3Af56m/srrINO4v2x6L4MHStOqh63t2ZaKsTqVBEBQg8XYJeljZdAggJEBiqs+bDRusU7HReLfY3/OloT08lhfew8Wjc+zdu3f+jeSSa2/cuAlS9BBlu4+Il8gN1O0dwsZTZkrKS/kO5nIbQ7POmVL0+967xcNjOeb5ohiu02i79ZaTJi+PmUf3Y670O3nh21JACIkthx6GBzgKNRIkwHM+b7NFBMy/Dxw44AeRh8eSwnu4eHSOLhaNop2CiSs9BGxY3QiI8dKCrqSpEdkyf6X9XLuSy7ZrnPc8XjH28PAExKLIq0Vru0XOGeKfc7Ljtgvvp9LPUPpzhx1+BEAEnrKLsYuQq/P8pkKR+c5wOPQC38NjSeE9XDw6x2Aw6HRBm6Sik3f9/sYNSex0nJolJoEAgp0LZXZKUJ2dpOizy6kwzmoX3O+AeiPfY7nn+CTH1rSeZxptN+1nWnr5QPP3nPMwB+NUswCiakQaUdjVlkMOA2QADKNy2DTFBsx6flWqQiUElFKp7/sE7B4eyw3v4eLRObpg6aeRw8XBSiT/3LhxI0CUolQE4t8XPBfu1WULtKvksVeAvTHt4eGN3Pl4nmk90zR/x8vX+RlbTf9mOZ4SfSrO40KOxME2+ROyxsYthwC9DVPN4eK8Z9RPkJ3Fu9/97mf4EezhsXzwhItH5zDMfZeL2LSxcXUVLCTYWsCTEsc6pwoFaRCXVyjyRstyGoG+bT26Mog8Flt+zfo+q1ZkqzI+GymW3O5v1ijSPebBi2fS8iObY8SuJjSJjZzsfesxM0WMkS7R5peAZkJ/8xag1wdIxpUm53uOG8Iou4HIzLjzzjvf7SW9h8fywRMuHp0jSi47OYVn8u68Ar0NG5L4Wk0Ak0iyyhuVIFEAZpy/xecxKX5eX6HIw2P55/mi3ueknqct6dLkOZaJMCwr7evRfuw29VgefU9AQ0CubAD6GwBBUxsbeeHEdUpiG33SXI+Z8dOf/vTX/Mjy8Fg++BwuHlNVWLq4TpEiVF7dJ14cow8nx6wr6uYtWxAqBiPjKpr67ahiEcfXsa+gSqrYlLVN2fPkxcybaklm8WZmCCHjz3NMIulSBUosqGLpaq+q7y2TAdjFPdFCj4G2914/RG0skXYH/TfLcMVlGxfTnLN126jK/dgJ28s+XyXUtGtiYZnIiPWyiWHrIva/094k8TNTdVkpK8rf3HLj2VLQHBMctm4DRhgqMDH6G7cAm7cA92pIKaHVMPlc9vm6yEXjCik3G3RViE6bnDTfM9+99957vfHg4bGE8B4uHusSozhht/LZ6/XABCgQRqWK9EjBGPNq0ZWVzyqLfdlOoa18+103j0U0SpflnvNc7he5D2x3d5fbu4ef5x5LpAdhsQgzZgbiMtBMAloI0IaNAMlIZyPZSv+auOElBIQQqXsRItq8e+SRR/zA9PBYQngPF4+JLuLzfI9MNEa4GKxsXI12eRjQGO2YE1v8C+nobZ6Pdk6MvhJFpUr3zENSYI/5UGwXpf9nbTguk+GqHV3OKVlTYlDw9Np6Pcgnm2D3WB9ydxnuv+14FVbCXCY7P57l7QWAZR8rq4fgoJBA6JYN8zZ3iChVFtq0mSdcPDyWE97DxaNTXHzxxYcvnBJrdhosd9aVjRvjBGwZMsOE3PD077VKlSY7FjhPgaurzPkdUK/8+3uc3b3MymvHj8/Zr02+Des9g086vSxzkwpNlGjDLPq3JgEWEpsOOXRhTBrXODWbGwcOHPADx8NjCeE9XDw6xd69e5++CLvio1hhQ1BY7xNhZeMqFBhEApoZEqPYYa01KKf8YMoDZg4U8qoeLR7rRZFt/nvzOqfnzbNlEu007fYvImz9/Jjd/U9yHMw6b9B66u/S+6Xp3IMrB1zX/d/lNZmithEkwKyT91gIbDrkUDwAivLxsZ77MWAnzDUQQmA4HHoFx8NjCeEJF49O8cgjj5y+SPfrVASIsLKyAjCBhQR0OFrwUW0hL05N2/C+SpSZrGLTpdG0SKElHtNT0Ne7oTXN35+VQbwoHk7LLJ+yct63ZfH4nHVS5HmfM0UVdWbd/5qSgCEAUa4WV7ECGyEIq5u3TIWomlQ/JFUxtYaHh8fywRMuHp1i0QiXZOGzdhtYSgQr/Th3C9DGTXUau9/dKKmJiw8SXafgO20Vzlm3w6Lf36Ibtl20/yTbaJ4NpmkYRG2q4OQKkHU6Zxap3xfNUM2VHes8rGje5kIbPUgACGMNRTj7OvrbsLppTPTY4dVVqntNey5PKtm6h4fH/MHncPHoFPv37z91EZRCARolYON4GpCIErSRhJA9MBNIM4g1oDn5MyWT03lcBAAxiivGZHbeXHHqxdfU0V9SVUkXiwPSjgpMHh7zpcxP/h7W99IosrKx7tGjMznvDbFqmGbFvmz/dN1f00o67dIj7PfMfdQ9AqNkt3WPYGE4FGgQFAEgTiQysYjvkaAhoElAgRD0+7FTjG5dJXKqstaqVhSFq3tS1cNjGeE9XDy6JlyeYMrbzUrpilft6P/xroYhVygxDBgEgEhCaQBCAiBAa2B1FUFvQ0S8MKEPAhPHuxISWgOCCBoUGRgZz4+oulGUO8VNutgv8p5Djz0Tx/ds3mPWo80cs/vJDEGA1hI9KREIBnMIMCAoAEBQSiXuq24Ds8Kiz8WnmBks8ndwqGQHPKtw1t0hy1ZZyX7ffn6X0ilLEvGMt189QmDSiVXLnq9MES33QBGFIWtUUJYzGcsFfRg6YvBTny+tkiMKx0s5SVlMupS1FaElacklpA8XP0ud8Zmt5MEEMOtoDjJF95E5EkTcCe4/Igagc8eIXZ3DdTTjJ6/fyua/IK5kZOZ3sCyUO+XX0LntW0k+ZPrPyFRk2s95jzrePWdUGr/O39e68LOl64MomR8l87FU/rsHtXV9d19X9XYQkKV6xqR0HLP0uEiXquNfVdSTXGOTiJLfJo6kkDlCR3oNGQlgnZdEiQQYagZEnBvPVISMFC4QAVozOJ4lY8dYf2JrHReson0jktAskvE/1ArU62GIITYfdgjQD4CBhmYNmTNuZ50PK3sfSqnktXmuD37wg733ve99PpmLh4cnXDw83FiUhF/EUTYW0hQnWBOAjAkUEYB6fSgmsFIJ0aG0BrMhcSISBszQ4IRASEoYtg6ZYLcxlHPd1PU42jHRysQDi/i+FQQFCIIAZWHCye+wAAkTR62TI2sae9+8JtLQEGBoCBbQNDqSptRr1zEifCSYFUw2nMgAM8+iwEwYxXKPH2XsrSQYUGBIUPI6e1QYvZaoVn61Sv9Gn3HfX/b58o7Z5zTtYLdH+fd57Pvu9ht9rsxgd43HOiU4xwi4DDFHsg1h0pYA40b9n34eFM7Vwvth0xf540OIIHkdGZciMz+40rjKjkNmkU76Tew8MnQsoth55IQwozEqyiazTDOb9iIaJ0fyjMKiNmRXXWtQsjNeStg6SMp6RrbdH6N+KpNbpl0kCArcag6YMrrOY+l5KjwP5uLvc/E91iUs6uavKWtnIhlvaqTnTTIuK4TEZZ/BJc/MZ/IIcacxzmnCqg7R0mV7uqY+m9eUKxqS5zMJbiP6Mfqyio/J7xOcx+Q5KdIvpLk+CzBRJLcIgBDQrKAABP0NgAyizTMmsFbOZ522B0ndsc7MePjhh88A8HVvUXh4eMLFw8OJtbW1Wgv+zIkXsrSCWBkPej30ehKhjBVvZmijLBAgBEErhXirJzYSONrFiZVkkdnhHleWde796PgKTA5HEqM82NZK/DpR8kAASRCL2KOHwDFZpDgypsm5ez7a2U8pPIaQMrvujOSao70u4+kTnSeOf4HjUtYsktfRHYl4Z2z8GO2wxzvqyX0K695QSjiYxHMcK3fZHTnWUV+a85ESGNuL5DIUa4+s+C99/8yUOed6n6wqWDT2/K7PRwYDp95jBvI8EMz3R79jDEP7u1XmLxUYPAXmqAhyrhuPRF08f8oNomoeJsWJpXVzAgcyHl/jRjNH0qJw6ETPa/Z9x/+YtHV/mSNx3Jc552OKGEmWqsw+M1ueek3BIjU2sv0Xas6ZM+OEMzsMl0jG5feLoPy2NZXoCse35vRvjW6p5tplzVtrfhX9MenUN92Eki6fARRLQ8cR8YaDqED/MNHY96nk+zIhFNz3ZjzYnN5ZHHmoUMkIyZ97cfJREpGBboQ6xTLXrC8m/wdR3DWUWPylGYosptCueJi7TmdkgeIsCZhtg6yHENUkTMoI4+LPsZXBLnXVeGJpF9FukyUMp4dVMqdEyfyLda3YjzjSD3gkwQ6qNQgpASmiSG+tsdpfBeRGgFYArKHcz2cedE93++zevfv/9ISLh4cnXDw8cnHw4MGFiDkfhT2NG1VBEHuBCAEtBKBUFB7D5AglsEyngt2uqiExHLvSJjpM3g5j7LJrdsPM7pMApRQlY1BHO3oErU1ZazshsO3hYN0LAcQqdRTQ8Q5oRDBRstOp46tYxp3mWNkdHaOwrYj1yNshoyoe/6VmzkgJTKgB+/qx+3NyPntsWd57tJvmJvi0ThvQUT/ZhAuNyKCUQYZUGXM3eUg1doLN79cjFMo9QFRFhb/a9even5nbRfOsiPAhKh6IXFpJIh3amH2/NGIvIWSV88gc5pIpJtyw6PuUkIqcOprv6daEuKhEbLn7h5M8Upw7ZopDVpibh/yRMfgdxIIkgo5N+nLCgmI/v/GjLS/HjuzwC8oS9kXPZryFOLpT1zEKl41+0XUkkpDQAMWfz36ORHJ+/BgRVnly2ibR4Nr9Jx2vGVUpoexRxc8ZjXcy84Pto0odKfHQSpfqzffg4Xg9pMjJM+e8vU6bz2lw+vNi3DMIrC3CzyVdrDo+PL5ut8+kpJPra47y1hkHNhBBCoKOPX/N2h4taZH+YhPq7lBQXSI9KdngIdbx2Ive18QICNCsonZWQ0Br9PsbgN5KJOIcVb3yqjlOi1yp4+0VhuFWb014eHjCxcOjlHCZu/KxWYMtzncShQsxQDLZ7Q16JiRHQWudJDKTsRKgtYYARQpGTr4Hhk7tEI8bkDm7G4RoV4452SVyKnxxDLSIjfe0q3hsEHAIrVXKG0FIASGsBZ7Nj6S3pBic7GiyURhjRb5459QQWnH76igJLxkf5OR34uS8DOdRsNuYRFZ5zosELxmDRec0xR4WbXIgmJAIzXGoFSeGBEiDok4cPbdG6rzm3Aj3KHdP4uGTbpeERNSUut7Ycex8+vdFKSOgWhFiZYY366ySPE6YFhkLDC4kNrjYZC0tzVnWPhoqN39TFRfzJvIznb+q5Po57UeVTPoqoR1hbcY0RWajbHxRYV+W9k9B/zIAwTIxuAWNjlEeCaQ84pocs9clBmQsZ43HZN7zVplgkfx2e0dFMkQVy08Uy9foHvPkc0kOLK4yjsxaODqSoMTgNx6K9vnkCCDkYbv5FRN2dhiNfYTmeD1Mr4+jY7QxIUFQOk2wkIg8hlScWy57/eT+CsISWfM4tWsRNEKIQg+1qiGxZjxG0VeUeJmwsoik+DmNHkBEUHqtcOOkSsgqgxCYEOH4fhWFEEIiZI2gF0R+sqQhTLLZTYcAIoDbPXi2cBE+eeGKe/fufbq3Jjw8POHi4ZGLqiFFs4a2ykAnPAEzIARWegF6BKxpBaEVCBEpo+Ps9xojF1+Od3YEFBQzBEc7MIKyiVu5UOFJK4A6CfmheBfJ+D9IiogeYgZrSl5HBAuScJ3+Sh8r0Dio1zCKS4+MCMHCEeM+TjokXr+x7RNY1ZmICJKj58hWKCCO/p2Xh6FUMcHoOl0RbFUVbmaGBCCR3ftPH6UQhefNziDF3ITzcwU2gz0+KxEUrtAVzYX3l/7d4WhUW3OiyXF0f81Dckr7q1LEkK71m/Z5CaRyFtU6YpR81hhmxjARcL8/7sFGpTkykh1xp8FXcgzzr1OlrcoMpmj8unPMZHPIuHPMVMsNlHefomVSU9KTtdZSFXU4LWcRG/RNiLdUUuKm49dxJMjC19nxL0tCXsrl1yhBcLZ9qvRr4tWS5wnDxTl0nARR3lGnX7NmiHGH0RFJojIGNo+rCGWFAp3jguzhw4WEQ3b+ZttUmtCrJI4uE8ZnRbyOebCQToWEuao3EVfI8UUj4ksazzsRFS2QvQBQa9CKIUDoEWFVHcDW1Y3YoxVsL89Z53Ap6ztXIt9bb711m7cmPDw84eLhkYv5SZorciyztEeKIVySBZo1+oKwuqEHLQmKZLJQKzAEc+RBIkaKRPQ+oIiT5K+l4ShZRWUsQaKOCBwUxNTHru2j16PPqcE+bBZDUD/yMrHDiKJ/y0LChZNcLe5blFImz2ErU+YYyNgIbEi6lBnoZdeSqJf01HX9vCS7VY4SBC1Kzo8l7+XkdZlPeGHCUKutSXOr56hy//Z9C0alsuKUU8XEduWv09/ZOW7Pv1GOhZptSpE8cB0JcciD4zwxoJRKpEyTwAhiXdj+AYnR52OCU2N0lHGdpPzrc+rzgqMCbaN5U5JjocxgwohwSXJAuYgVTQ4ipriyTVGy0pF41blViYiofIddVyM2y8ZS3rgtzsGhQaUhefnPHzkQahDnU6M8ig9pdL6McmWlC+/ZzA/3ys3Q4XBMBFatthbl8ApRlHzcfu1KXq6GYSXCMe+ehuGgMLG2S09KXStUhf2e6/lidBVVPH7yzif3NziYbKzkrZfMnHgAa62T18wMHaqEOHXpB2X3N0o4P5rPUcJcEXs4hVYp5Wi8be4xHr31RwCvRVWNFgw28XLDDTeg3+9zr9fDYDBIKhgNh0P0ej1nImb7dd6GjV1+us74Hq8iN1nSKo9wt/XPovllE9qu4yjHHxc+v7lO9hpSytQ582dKfJvvCyFSf3nfKfqelBJBECRHIQRWV1fvlVLu7fV69/X7/Xv6/f7ufr9/T6/Xu09Kubff798jhDhoPtPr9e7zVa884eKxZNBaz9X9UM5GT6p6AFn5L5ghmXHrtVfjUS0xHKrkmZRSkQGrNZTitIKhx3dlNZUTBnkKt1IqJ21deXgSM0MrYO+BA4AChkpBDRREL0BP9LAWDtET0jLg9JhBV2bx2wu+efaUYhUOE7PNeA9Fm+hUWW0fxYi7Xxd5WCQGL5vomTTxAKVzCQMFTp139mANTQAAIABJREFUHcuIjCCukpRXHamoalLR983vmiomed/Xw7Dw+Yp+nwWV3p+5D7sdzO+Y8YsK/esaF2Pz1+HJoUNV7CFicg3V9fyoebQ9VUxuhjqGeb4crW4wlFVMKpMhrn+LkvlfajCVeBeFYVhoRNbNeTB+g7rQOC1ep6pV6aqyDubJalf7jYhBDWgFESeSioi99ODTis2gSw9K83qgkCSicg3e7PeqnI/Y/ei14mrft69jP0fR903CZ5uoy3pkahRTlqwzr3OqFuW9X55kqfh1nXgW11jWXHw+DoluYdGmr+WYA4BTaKeTnSWhXfZij9E4tn+r9Ddd92lvnIn0BpEOo/AhIkAD+zgEwn3oSYZiPVc5XMrksOvIzDh48CC01pBSJiSdUirtoZ3z3UL5bsk3ly6avVY2d+E026+MtHb1sf1MLllflLDY1mnzPjPKAVltQ6jKhmGVTUDr39sAbGPmJ1VZ9804STZEgyAhSosIp5WVFWzcuBGbNm3CUUcdhe3bt9+yffv2P7300kv/0lu7DcaybwKPLrF161Z+6KGHSgXQpAU2JeVNYyY7SUKbVgIIMg73FSOiQRDQWwXylG5mtCvhgWJlqWJiuUKlj2T0HImiZC4qC6zgGmQZUTXFs+kmaZtjld+PkxmmStrar41C2XiTl8rYhnbXL/s+icm2c9Hv2wp30/6z3e2btG/btJG5cWAVjzRB+YAOrt9eC65/z7U+25K4J9nF9kGL+28JRjnbZxMgWUIDoh7Bkr0ORAsW0poMdX7P/t0kx1dOqNOIHc75nCwhZIrKRidmR4txo9v3/zxYB43Wn0luuonRupLMQUreJx6Ckhxn+YbvvOUYzNOP7U0s2yti0hubbdunLgHRWlzW2tBsf1/zPn66eE5DrLnyDJlz/X4fhx12GI455hiceOKJX/zsZz/7K94K9oSLx5Rw6KGH8iOPPDIXhEtEtJQTLtH5KCeHNmVyWRXmEMku6OM77MWcTLUFqaD+RUlZ5FECXiSJeJOGiOOxR/fLYx4iRnE0IVLZI2lyvh8d2y9YYtL2zJxVMeh6wZx0pTBqmVS3fP62aBt7vLd5voY5L5g0WFBH/dts/rc7pudhEw+vkYdUnNMqc4xsZs49L0pCqspD3mSr73elmDc2K5Ok4HnynUr7kUnHGw/jRwE5Js+T84Jz5X6VY2qccvF95B1ZmMp2NhHL1QhX5mT9b65/tK3z084gnvXqE5WzrijvoMZz/pAjpNF4qBpDDuWequP3JRIyzl4jOHbWFxzGw0PmztdFMJaNB4X5c3luzDPhskjEQpPvrQfCpYh8ybaFIQGZGVJKCCHwhCc8AU996lOv+6d/+qeness4gg8p8ugUVZj3WQqrpFJANmEhNEBW4lcRVxrIYc6jGHGXloLUxl6+QkWFyl6acKhfpYdJJ7kaov1OGSs+IlZ8jMKjR8lTEyVG2JI2jp9OHym6Ury3NH6sptG1ON9WobB+gzK/SR38fNsxrko9HMrab9KhfWVZiWccWkiiVVnvUblaTnIfRZVzRq+TZ3QcidsaXGI0Jl3VvDJVreoeCcivEpbpZcHjR8ThY/nnY/nHAhQbYvaROJYfeceUPEHtI7i87HzxUbQ0iLswuPOrtBEJq/S3jhViHv9c7pEy8pqS81GSeBTK96Jjtd836xgnCXLTR8TE0CjnEFsciyjIUcRjmV3r9mAHHiq02B4uZK8hJUeKJxtb7xNorAoXmZDLuGy2KVyYe8zcD8f/YJtYTwj6MBoVLGDyFTMtroGc9WyZJtnrsTyEU5vns0mWLOGXHacm14z9nZtvvhk//vGPnyKEYGbGkUceiWc961n3XnHFFUev23Hlp5ZHl9i0aRPv37/fOaGnGveZ4+FiFKmE0LB2wpgizxU2BpO9Y1Nzhw5l5zVFniU8fozaalSWtMwr2+SOsF8L4fq8sF6LhGBJH0UFZbU4mZ45H7V9/R1a4vY7pF2Rc+3R3NNAt6gqIritp0O7BbutUkjc8vepuP25QkhBmyoX1JrwEpOVjy13+F3x8132f1sPv9Zzv2X7syG4GrZ/nfFflGC4SX904eFX10Mt5XFIiBPZNh3Dwuq/Zh5CiYfbrBTzWRMuLUODGO3lb2SgjPQ1HYd+M8V6nbUzQhzpNFLHep/gVA68RTWgqWW1tfVCaHQVUrTMbd5l+9ry2hAtZrNdCBHlu4yTANvvm9xtKysreNKTnoSXvexlz/nIRz7yXU+4eHg0wMaNG/nAgQNjSQenveBVJVwSF/I454ut9BW5RgvIXIO/iks1bBfuseNI6W+SXJZZjbKsNyZc6i9KSXwndRMS0YRoGbV/c6WVOx2q9QkP7qCMq0DbkJNuF+jZoVlITduQM+rCw2iWXkIlOVDKlFLmjkKqKpYpHjtilh5WugOX9PohMUVhE9MmXJqSLaMmrFD6ueAe2xKuy77DXTZ+uyN8mrU/JzlZdGo26Hh91DSSj8QjwkVw5LQfVYrUuRt/3qBeLsKmK8JlWiFbi06+SCmhlEq8WwzhYior2UmH7fOmulMYhqmwuZNPPhmveMUrfv7DH/7wNZ5w8fCoiH6/z8PhMLcKxjwSLmYhj94YES55911FGBOXhBSVKIta61EuipoGN1mEA3PWFVBYCq5OKVmu+6hSncV5bJm0klsLNd0+D0hrRRMzboN2Snc7QkW0/H5zYyv9DM1zmLQjXDpo/xkRLozy+Vu9okK7HDKTGr8T/35r4VN9/rjKZNfNoTaLHBdZl/WU6zqnR09Sxjx+LSk/pEjF4Uft5ccsx+9sCRd7GNfNm2zazeWFVSlZp52DKyZP7esavc72ZI34l4hw0WazTHijeb0QLl3qGZ6QK5fXUsqU50pUuVUl/RIEAZg5ec98z3i5GGLGeLyYz/T7fZx22mm48sorl5Kb8ISLR6cIgoCzeVxmS7ggWaDjQI0xwiVK8CYyhrYoVEZsb44m+vZkk+a6FhpR0bjQI2KmTdncliEnk3apzmZfHzOs9ewW3C48bGbtkl7m4VCa9LelwZQNCax17EBmMc026WYn84PaEi6z87Ba9PnTlrCsu/50Tbi0lWFEcT6AnNBZkUr6ng2xVaVzyBMuVfpQtyJcmhvAIvE4BoUpwsXkaNExGZMaZwyA+9HnRJzLzkE+LkJS/EW810UiXMpCMj3yiXw7fMh4rCilxr5jCBZglNvTEDEmya4ha+zrGZLm1FNPxY9+9KOlGvx+Jnt0CikljxmvM1GYxwkXo4RRJlkqESWGlgmHESLIEcQ6LVQaEi5lQl5U0NuKjB4imVlUKKc/tJtQqmEwTiKHw3omXDoxWKbQfpM0GNs9v26dg6BtlaNFJ1zQusqS6mIWoGFN9qUnXIoMBiIau/9phxRVnb8u75aq8iP/HrXDg7Pb9alt/y0C2dKUIDD6V3MPYZGqRmSHCBu9TsCEDaXFRVStSECY0uKue1tAAmOR730a+kfdkCKfiLj+WmDL6iAIEmLEDicy5Eu/38dgMEjyu2RLS2utkxwv2QpIxoMmDEMQEY4//ni85jWvOfkP//APb/KEi4eHhSAI2LiMTWOByKsT7zpfz2D0qLKg+QXLo+n4qZrnoihhWxXZkD2WGaxV5MO8lo2so5ibHSij/NQxjIvatjvDoX1Z60UwnKomvXUTE82S5rp+f17XxCKjKauoV5l/RfKjy7aoo4+sJ9lfDcWebkloc+ozo0TJRF4fWU9kQN57ZfMtKz+azPsi2by+5my+XVb3mvZ3zN9RRx2Fc88999yPfexjf7eo7Sr8tPWYp4naJRFTRwnz8PCYHxQt0q0rqGS+v0xyYVLPklcWcrL3Jxoel2stLQvfWpQ1ucsxk5UPZeu8rbhPM0fNsvXF9GRSSQ6xVOi3yMx9DY/1aXNk16k8gjtr0DclBjyK570hXurKXfvzQgj0ej3cd999uOSSSz57xBFH8O/8zu/86kK2iR8WHl1CSsn2junMQooyzHaT0q4e60ep95iNYtTk+1W9N/K8MMoqvHj54FZQ8/qvjoeLnwPVPVyK2rWqh0ydHAbzPOazz2Fc0ZvIhaLPev1gOv3XVl74/vEo8tB0rVdlniw+X8501ryq+oJJzGuqG5kkvObcUUcdhd27dy9Uh3kPF4+lneSGYbVZVr9Ye3jMzog3f00U6qrftb+fd/QKfHeGjt22vh27VVKbGqX2eres486lzJe12SzG57L1RZdyw8sLjy7GVF5oUTbssOx7HpPT+7KeLkXzP5tM106q2+v1oLXG7t27AYBPOeWUhRGunnDxmJiyuEiKm4eHx3wtztNWyBfJAJh2u9SV/V7OekxyftrjrArZ4kOK5qv/qsiXOp/1WL+2Rlm+JtfRpxyYb13GeLIEQZB4t9jkCxFBSgkpJW644QYQEZ933nl/O/fP6rvbo0sIIdhkrJ6lEMu6r9UR0h7dKJceHl3NYT9/85WUpnOvKGylyOW6SKbW9ThYr3KySvsUuV2vt5CiNu3raqdphhR5ErKZDpGVNcuYnNSj3RroWnfs8WFskbz1qYtw2LqJ4/08Lw/rdn0m26dEhDAM0ev1oJSC1hrbt2/HXXfdNbfCwXu4eEzUGJj27zQNV/AYbyPfTh6zlAHeFX9++i1PofT9M/l+sGVx3Xm1nmR4Uc62Wa1pWSPCo/249XqJR964cBntLi+XIhK0btiyH5/dz1PTP0KIVLlprTV6vV7Sh71eD8PhMPnsvffeCwD8qle96ttz2SZ+WHh0CSEEZ+P0piVg7fe80OtOWFbxMPDKpEeV8dMmaWWTneJl3X3qYv5V2SEsKv1cx0PGy4f8MVzmoVK2w7/sZaGbtuukPtOUcPHGWP1+dI1/Dw8zRkxCVRNmUmQPuIp5FK1vdddP7+lSbJvVnf920lzbu8WVl5OZIaWEUioJQXrsYx+Ln/zkJ3MlMLyHi0en0Fp3LmzyyJtsHLcXdN0qPlmBVlWp9FiuhbNOstu88ZO9Xtnv1T1XNjYXbYxm271uP5R93xXy6ZKzrqTDLo+Ltvfn55i7PaoQV1Xascq8ypuzdedW20S/TfI3uZRw1/3kkYbZJJtt100XQeAyElzfWeT1tOr9V/UOcJEtnnTxsEsGFyViLatMVLaOueSyvX661tGsLClKGF1Fbi+int0mzNk8s1IqRWBlyVf782YcmKPWGvfccw8AzFUJaS+5PDqfa0YIdbU41skxYI72PXh0I0Dzdp08ll+xWcRFf5naPW8u5vVL0+/XKbnd1f2tpzHVxoOiLAdJ2/NN1oMq5Va7WvPbtE+Vc12FQdr3X5ScM8+7bD2QCn5zzGNS62OVNaXu+pUn91xhTFX0pirn65a1Xg/rZp3xoZSCEAJBEOC5z30uvv71r8+80Tzh4jH3hEtVgekzjnvCxWNyc8339ewVyqYKXdH368jNpiFhnnBpZ9zX2XCY9vo4CQOgK8KlLCTO1SdtnqeIPMl60hSFH3j9ZbLjy8Ovr12ub2VjtWnIrScmm+kIWmv0+30opaCUAhHhmGOOwR133DFTQeLdADxmPjm6+A1PtkynX73w9/0+afngx9hk2qXK99uEDjYxkH1fd9PPbfvGDuep8/tdlj4uuoey++qqzdrOkbLPF4WLLYsh28T7oMrY87LCY1Zyt22o3KLYVcsCIQSGw2Hi5SKEwB133IGVlZWZNqInXDwmsuh6eMPAw6Ou0eTH1GTmWt73qxqdkyBbPKqN/y7IlK77IhtDX1b5Y5Jjv6jN7B1irXXhd6uSUlXvuUpuuWWbB0Vt5OW7h9dl69lQZZXXPHKIDSuni514N65oxBdddNGFM7kv3zUekxIW0/oNX6p0Ngayh8ckjSaPbtpm0t/3fTfdPq6aYLWK8dsmuWHX636VJJJZgqSqK34XOWu6+O4k2m1Zx7eXMR6zHpuz0oGLwuj8hnY5lFJO2WteX3LJJZe97nWv+9zUbWPfNR5dywpTlqtL4ZBVoAyDmScw510otUnqNe17LCq35/qsx3IqJG2rdxSNb18+1T3/iwzKKu1X9v1Jn29qcC1r/9fNcZO3mTDr9smrHjMJ1/s2Jc/LxpedYN9VNraufHLlbbHvx5SnNb/ZtIzsPOkH05ZPXsfwmPT6WiZDXJ5r2XxRbfQfl8xYz+O+jRemlDJJomvaVEqJ4XCIl770pfdeccUVR0/rObyHi8dcTI66ioWLbPFlRhezjz3W91jxY2ky7bKIni3rcSzM4pnz1smqhEleQti2CWezv98mH0yWCMq+P63+cSXNnWciZRbju6xs+bK2jYfXYavIAW/X1G8/Q2qHYZh4vJhjGIYAgCuuuGLbWWedNbWB4HvQo+uBzvauUTYb/7SERlHFgVnsoM77DlaVsnSLaBSVVYPwaDZGysZD0yo5rvlbZX7PQsZ0NTbzxut6JSDWwxyyPTQXUa5O2+CYtzaqK//KPtOmytgsxm9b+d6lfpcnOyfZZtPyUPaen/M1/pvKr6ZVijy6sadc48cm4U877TR8+9vfnvig8h4uHp0LGrss9DwJ5mkJa1ec+aIx1HlJERfN3b8o7MxjMRbJKorNou2CFhksfqyuv7ng+3w28qPNvdT1BsojDIr0g6qfm3b75z1/9v4m1WdFSZqnMU5sb2rX3yTWCe/h4D09PNrLC2CUQN2Mpe9+97t45jOfOXHB4QkXj06htc51CZ6moCzK8j1NpTCrMHl4eHjkyaRlzl/iUbxG+X5fTkW/jWGZ3fhYD8/eZA4tswerJxk8PIr1pqpyyMwl42FqcuMwM3bs2IFnPetZExUinnDx6BQrKyuQUs58IS76vUnuuszqGSfZdnmJAD08Zql8Z72XFmlcVtkd9lhfc8LL1fnRGarO36YlkIvKas/6matUCcp6c9jtMe3NpVlt6k1rLPt1oV5beDnqx0LZ2DBRGL1eL3Xu6quvxtlnn60mdc+ecPHoFNu3b5+bDPq2C+6kQ2LycjE0LXHoUmBmocz4hczDjxsPj8kqjh5efrieeZrGdlN9ZVZJnxdtPnkv58m2oW9fv37mnc+Sw1rrpFKR+YwQAkEQ4Gtf+5p47Wtf+6VJ3KsnXDw6xTOf+cwvm0GctyjPOiFs10K5rpLiFezp9fkie0Ess3LU5UK7iFUsXIaUVxjX9/zw/b84BlRZvo4yoqRqbpZpjZE8HabMuG1StrnL+1+Udb3N/Xm5MNn29Vh81NX9zOdNyWiTCiMMQwgh8Hd/93cve9vb3nZ+5/fpu8qja0gpOS97/LRyFBRVAOnSOKuSrT67YE7r+btesOYpv0TVUpN5VWwmvUAve3nPtokRu6pStOgKQp6hY1xevSK5nHMor/99PpflMwCqyDfXa5e8NbpE14UJpiVnuhzfeev4NKoUTbp9Z1HsYZFIlLpVgGZNAPgqRbOfY1niOgiClLeL1jpJpmtyvDBzpwPJe7h4dI7DDjts7hTbSSxcdSoU2Dtii5ZroqoRvCyC2WPx+nLRPJiKiCRvbK+fcZvta9/3i4E6FWnyPFfs6+TldDKwjYGux8i0yZZJzaFp6id1Qr7berd4vcXrcx7VZHLRXLU/ZxEqqeS5NpHNzNi4cWOng8sTLh6d48UvfvFn7UGcDDYhZh5OVGWxrPrXtWCYZBsYZc02TKs8S1Gpymn3n33vVcoxTtIYt39v2iEt2ZxETRTFJgpl3vm2Cmub+8zvA93yb3ayqc7zz6PyW2d8TQ56In/MCsyq9vgpmkOzXh88Jie/ivo4u54VrTNCiEpeLUV5WKabD258ThBx8tel/K27vncR3jPpctBl/Th5zHb9dIXZZTdP68y/OuO+i35sP8fmX3+ZV9Klasn2bALd7GshBA4cOIAnPOEJnU04v7J7TEwnMdWKjPDUWiMIAiilvFI5YQghEpIlq+QtkpeNrYyWhaXN6plmETLX5HfqhLXN+/gof/a2Soffi1hszFrpFAs1nzxmu2ZkSZii3dom56c//mYrf4s8m9us0UXtP01v4MnrGLPtv6zeN432m6ZeXB6S7fWXrvXlWqPfchZgZpx11lm48sorW0863yseE8FZZ50FAFBKpQSoSUrkMV8CZnEN6/XZ1kUJFr1x5+Hh4TH/a9s85UVbL/rPNKs+ecy33udDtjzK5LMQAldeeSXe8Y53vKD1NX2zekxSnpnERCZJ0WAwGIuV85i80Jg3ZahoQXWdX29Jx9o+/3pPyha5rbeBl0+LbGy17//ieVk0n6Lfl9748qg0jvIS/BcZiN7DZTZG/Ly077J7uEyjbWdJdJbr5ZNr/yokb5ViIIuoF1Qe/XEiXeMwQESQUiIMQ5qPWeHhkcG55577xTAMoZSCEALD4RBBECAIAt84cyRcpnlPZYZK3RLby27MVPFYWc/t4+FRZ65M8je8d5lHU8PLe7ksrk7k5/zk58iy9dssftten9rmp5xUfstJj6OqY0lKCSEEpJSQUiZ5MB/3uMe1ejgv5T0miq1bt/Kjjz6KMAxTNc/Xu4IxLQbZTj42TwtMFQ+Nonwz8+C5M+28LU0U+fWrpHkPl1nO8Sbzoc33x+UHz+zZo9/3Hi4e1db37DpStJ54D5fZGvB5Zbub6A3zSELMU//llUyfhH40f/ZIt+2/fB5Yk7W/bA8XIkpKSIdhiF/7tV/7j3/4h384q1G7+KXPYxrj22YJTTLdZSZM5kWguQiXWRAEXREu80JuZBUvv0M5bwaNJ1wmKd/Kk/5hat93X0O3HD9UKw+EJ1w8mozfOknhPeHS3fxtql+1bcey/psf/XG5CZd5Jgi6CYn1hEtbwgUAer1eQrRYYUWNuRO/jecxcXzgAx9Y9e7WsyMEzOtZtf8yhrxUKUPdts38nPGYZ/kyybLgXcqXWcs3D4+yMdPl2uFRLHO8nPDI6nHzomtN4h6m9Vy8RHuOQRBASgmtdWrT2qTH2LZtW6NG9duyHlPBm970pvf+1V/91QeDIDAMIfr9PobDIYCojLFSKomXM4l1DdMohEg8ZObJw2GS1y8qXTevDHLVHbguFsq8HZC6u1tdlo30mC9lqsqc8nCHNfixU02mLaNx1aaEfBfjZz3M06LS0G09XES8Q65NPwiZ9nDlzH1Ye69EBLBClU32rJHFhOR7Rd93PaP9WoNzx1j2u+bfdbzmTNGGvCo12fNVxnPq/rUulSlFz182z1zz094ECrUaIxXs13YyUCc057ZtpfYQVEvGtF2bs/cjSVRqs7w+yvus+bfdv87z4LFruDzYbGN+rO0Ztduw6lhKSCbKk/lciShga97bc19okZIP9u8Qx2OS3bLEvk6b9aHqGtTEk1Vrjde85jVf/fu///uXeMLFYy7x5je/+Xc/8YlPfCQIAmitobVOXLbsmDk7O7QZ9IaQmSdlbJZK9aIRLl23lSdcPKrMD9+X7cgXT7gs5vowy3XQEy7tyZeuCBeO3+PYAE0MIlierxS9wynDQBcafQkRQW6jSYBQJyoiRUZQszmUJTTyvHyFEKXkTLaKZtkYzxIzJmy+qedS3vXNv01OiTpkWBXZNEYC8cgArnOctb5dNvbyCKsy+VUW3pQlDe3SwnmEy9gY0fEY5fxcM9mN5yxp4yL86owRZtWacBEAmCgin8gil3gkf0TSVqNrVOm/OikV2nyuiHCJ7dRao91roh5TxXvf+97HfehDH/qJIV1MEl3j+WI8XIx3iyFZTNZom52fV4VzGoTCvCvf04i7neQ91y1bXVUh9lgcg3k9Gnqu8d3WWFjv42fZiZdZPN+iz28XwVJlh7qyB6nI9ImmDOFinYrfMUYRx4SNa6c5b1d67LVuT7hlr11HJjXZkKkzprLXzIak2HkKswZ11uB2kQVCiFQbFuXAGwtPI6RIJddzl32fKKLcBADFkf+TeV12rEp6TFLOiBLTVtkeQCAnadH4PqmcvCkjRFz3YY+bsvHXVj8tm+e5zx1/T3JWvqTJFCJyki0aI/lUNH669jatS7iY9j7ppJNw0003Vb4Zr5V6zAS9Xo+FEBgMBqkQIsPeh2GYCinKxllmdyCWlXBxCdauFoZlUb4ncd95C16b8x6zNcjqeLvUDaOYN4OzSt4kO349K1+bEC5tE+EuCulS12tqWQgXl3yb1bMtG+FSZBA3JVw0ARLxNSsQLrZRpKHGjK9cbxca/7doaVo09ZIo2zRxGcCuz+WFjFQd/609vKw2d3mQCFDh+0VjqujejMeTTbhkj0wEYi4lXIruP9czRnOt9q1CHNT5/bx2LfqcBo9/rkJRiDwy0EXS5a0/ee1j20d5nlJOuc45RAOhcjsDgLT0Cc6QT8yMwLo/Q7jYviJdEi5NSJcq+pXWGkII/MEf/MG2D37wgz/1hIvHXOO5z30uX3XVVYlwUEqlyBYhROL1YsgY85mqLnOLSjA0Vcg84dKtQVGVkKmixHnMzijzZFi+0pb1bmlqUC8b4VI0z7t2aV4k2egJl+7X+eyaX9YPVT1cRkbOiHBxfzcbQjNOuGSNad0BQZILQbmJhauOi7wxajyoi9ovz2Atuo8q8q/uvMkjAljpQoKgraxO1gYH4QBBgObSkKIqHjHS4UnTRpaOERgViBYNHmtHAQmODWRzBFHymrXOPW/PjiICMBtWlJIDND7XXeu0SxakZEpOkwm455dAs/pUrn5V5pmERS7pNOFie79MknCpM+eqbqgY0uXwww/Hgw8+WOmGvObpMXOccMIJfMstt4wlyrVzvZhJZsKQJq1wzYuibLPCtoCeJw+fIoVwkQyOvEWsivtxk7ALj8UxtGdt4Na9v7pEiZEvtqz1WL+oE7LhCZdu1vguCReikaETvSfGk5Ry2mTi6ET0fZkmW1zGjyshZup8xiCtcwRR9EJz+mg+RKLwIhQb0KnvgUfnSYwMbOt9cxQkUp4LY79fdnR9XlDJQ1v3QWPxVFUmbfrzrvnJXO9aefcLKn5+aiV80hdoImfKntGcd12bCFCZdspej0vOqzB5LzskdOOqAAAgAElEQVSvbTsmT6651uEy4iV1e/aGtBW+k1wvE/I3FkLk8oQhNyFoCBIbGsVJcG0PODt3yyRCiiZl15mKRUIInHvuuZddfvnlb/CEi8fC4LTTTuOrr74aSqmkgpHt/WKHHS2Swd504hcpYOs9aa7LrbJtotRp3fsyGAyLkhQzL0TGEwr1Dbo6IXXLZHB35VXYZftMOuStzGNv3vP0LML8LqoK1jpprjAGTJzkESZp7mjnm3gUQsIQI0OZjKWdYU/KrAgqsc6qGsVEgNbjRIVNWNQhQLLfFwQMQ/f75qhKfj9UaeLBJiAEjc6X3X/ec8Ay6LPHojbMm5OGgCkiGlzXKeqjdoO/GZHiIjvySJMqz5UQS1lGQDjIJ+sYBPnnEBOCReeFKH5+dty3/XkhivvRPu+6BxK5v0cMCNbOHCvsmPpGlhiixP48EUEzR0Pb0ruyhEsekTMJ+d5lpVTjELCysoK1tbXSm/Jap8fc4f3vf/8hX/nKVx6+/vrr8cgjjyQeLXYY0bLncLGvbZcozCvTtwgGW5dt1RXhUnSdaRuRHpMzvFwlGhfZoOvi/qsm7Szz8FrGOZLnoVfVc2/e26fpPVWp5OEJl3pzMG8+tllfpSFcYkLFmE8i/kwgZGLsaEHQJKKTkpoTLvbroF+PbMm+jpPOmk02kwTW/Nn6n0snMmHo5ntCCEgpRwafdT37M/ZvFJ03v5/9jOv62c8Akfe2a6yacBIKZMzRUOShYB0ZQC8IUq/N0Vyp1+s5SVIzvuzfH5NXGCX9bapvVi1L7FqbiwzTqjqaUsritjh1ZAAqDKOS6cypY/bzYIbSGqy18/PmvH1MPNJ1lALBhJ6YlAjMjDAMk/eVUonhnvyFKs69pBFqnRyJGaHWYKWgrPOsVPI5xQwdhlDMUa4drQGlIhJTxTZUGKbnNHP6tVLIlC1zygPbA8782yZnKEd0iILxUSXZ8qQ3P8oqVZm+syvovvKVr9zxhS984ZmecPFYCvz2b//2a/fu3fv0wWDw2MFg8Fit9Qat9Qal1Jb4uDl+b+NwOBRG8GWFmS34yv7M5HS9dk1e82+7kpLrvMlTMxgMUoubvWgbQRyGITZs2IC1tTXs2bNnrvNRTJp8avPcdXbopZRJ/iAzZoySZQStXU3LpdSY1/bnTY4iANi6dWtS3tEoQK5wsTy30ibPX7VMpes3ywgM+9pm/BfNp6I+Kkr0lo13zv51abDlxV3bVSjy2qoNqlZiK/vtsnZsOne7VsDrGpZlhHtev7n61zV+XL9fZR5WfU6XwZg977o326Cr+px51y96DmOsmr8gCLCysoKDBw/i7rvvxg033ABmToxYI9NcciLrSh+X0xyTp3XJ8nkmXOqGpFYxKOt8x5R1ZkOqQKSsHxG3+wlPezLOe/0F6B92KB7VA6wcugUikFDDMNFRjK4kpYyMtnh8FMnzfr+fmwvCNSazr6WUyQ55lfGf/X4eoZC3TrjGf9FaO4mQBvucElWddygTlVTu0VmFLKX4ujPbEOjg+nXabezIwpm7pkoy3ejHi9dvV8hQkshe8+h8TlLecDBMQt00ODmaz7PSo/djUkcpBY5tiuFwCDUMsba2hsFggOFwiIP7D2DPnj149OGH8cDun+L+n96H++7ZDX50b0TUKItR0RoIFQjpalisNYSUIBE9ixqGkTyJIxQgBDgME0JV1CBZJinfi8ZTns5r+tG8HwQBhsMhecLFw2MJ8JznPIe/853vFCrcy0q2VFU+q95bWdiQUTRt5SybqNkYDrZANmXNbaVGSonhcAgAeMxjHoOXv/zluOCCC3DiiSdi8+bNOHjwYLIjZ65nG/RdGfZd9E+ZN5BLCXe9V5b0uowYshUWu4+6Smaa3eHLM4irGhR1UScpeJNnzrt+1flVRni0TSJdZnhX2UGtSkRl+yuv/4r6u2tCypUwMU/5ayIj8vo/S3y4rnHw4EHcfvvt+OpXv4rPfvazuPbaazEYDFJkpE3AGFLayMZs35pqD4aQ6YJ0mRfCpWq50akQLpaBw0oDgQTrEIc+YTsueOtb8IvnvBQPru3D/nCAoN9DqDXW1tbQ7/dBRMm/7b41IUomJ0Qi38GFMrZIvukc48Y+2oR01fDGornRNkl+l2tw1F9RlSkRF5hyHVmQ+32b5GxYhacLFN0/6fznS7V7QTWjwucgKm2/wqMWhe1t33+2H+z5V3X9HJN5unj8VvHwt+eLtHWkTOLsgESaQNAagZDQwxD7Ht2L++7Zjdtv+TFuuu563PyjG/Dg3fcA+w9G9IGKQ5ZCHSUNlhJQGlKMiHQj+0OtAGZQvMnoIlxsL5lpy/c6ia5dXvXMjAsvvPB/XXbZZe/whIuHx4Liwgsv/NjnP//5t+3du9dpHKwnwqWpsdaEcDHeUXlGmNYavV4Pw+EwlfDZJlyCIEAQBHjBC16ACy+8EC960YuwZcuWxMhommS4Sg6HIkW0qxwQdaq4dOmhlGeQdjVW27bPsueImXSS6El78c17tbe2yuGk28uWcTfddBM+97nP4W//9m9xww03JKSLMYqNXDTyzshFm3zJytquCI9ZEi5FcyTrIVKFPGhDuCDJ4QJIHhmmigBFGugFePL/PA2vf+ubcczJJ+CBwT4cUEOIXpCEQAS9HpRSGAwGUUgLLAOf06QLU5SEN8/DrkrInaZqROcs+noSVcrGPA6pflnjbFlfQwxIVCcgumhTBW51/8k8aUDYaGrXflWIKdd54wFj+lJUSPrqCustCu8tmgNZ7/i8eUcWYWPmrpHFJvTOkKrMjIAE+r0eehA4sG8/1h7Zi+uu/T6uvupbuPEH1yF88CFgoGLXGwUpCUoNo8hCGSBUIQgEEUSbWKFW417cc0y4lMlcexNxy5YtePTRR8kTLh4eC4ijjjqKH3jggcS4B6JwpHnL5TIPZEuXOSiyi58r14utPJtdN9uoOPnkk3HBBRfgvPPOw7HHHptK/GwEtL3wZF8vs4HedQzuNF1Ml4FQaZsA1ycdnq3sbJrjoy3RYsuo4XCIIAhSyQO/+c1v4lOf+hS+9KUv4eGHH4bWOhVGGQRBKkTFJqhtknvRPVzq3l8Vorou4cKwjReR5FkQAAImKERhCNyTUf6HjSvAxj5e/rrX4OzX/go2HLYFj+7bl+RkCFlDBgGGWo1yQcRGBMVkC6k4xIEkFLjVmGeqTkJV7e+qGxt5ZaHzvF2rjD/XdcpCa8sM/qynh8iYdFkiogrx0haaupN5TT1U2hIudds9j/Bq+vxlemBWRhZtxDpDsDMeNMIKhWfmKKwqfk9hRB5JIRAwYYUk+hDY/8BDuGHnD/HvV3wVP7jmv4G1IaAVEGoIsvTnWF4kXo7ZFE5zQLjUGZs20ZLV+z/0oQ+J9773vewJFw+PBcEznvEMvuaaa1LKqomnt8NY5kGxnDeyJSsQywRm3nnbuLBLlRujwPSNfZ3V1VWcffbZeNvb3obnPe95qcXTpRgbQ8XEnC8L6TLPeYYWYU5MIkfRemrfpjk0PFAoh2xPlbw21Frj4Ycfxhe+8AV84hOfwH/913+NhV0aJdVcTwiRDlWZcP/MU46XMvKkCeGCsZCGkYeLsPphEEbVeoTsIVRDoN8DoLD6pGNx3m+8Ac989rNB/QCDcAgdCGgAQ1ZjRnXi6aIiY0rp5vNXU7N2rJqbpJKh37IaZpPvur7ThHDIGtKNynPHITmNCYOOVML8Ctpc6f6besgIpkKCyvW+CS2Kbk9XHr91vVrqEDp5oXOuvD7mfa0UNvRXEIZhlBdGCEAKKNaAjslxzcBQYXN/AwIQpGI8eO99+MoV/4J/+9KXwA88lOR7gtKAjn4jEFF4vStkfp7kdxVCLBsqb0KnjjvuONxyyy3kCRcPjznHueee+4XPfe5zr1RKJQkJbXc/k8huHhTHaRItRR4Nk7qPbFJcm2wZld+Mzp9yyik4//zzcd555+G4445LCeC8e3QlyJ1WyWIfEtMuQex6J5Q8STYbg39aoVAu7z7zb1tZzpPLdnjQNddcg09+8pP4/Oc/jz179iRy0/6cDeMFs6yEi0vud024MI2SbhrChThtMJh1TPYChKEGmfckgF5U4PWk05+D1/z6eTj+lJMwJMYAGkNoaBHt9GsahU/Y4Qkg9xipnDhdisLvl4VVFyW6rGvQVglRdhlkdWWK/dm2hAW1kTEtCRf73msTPV3Mr86onjbypZgYM4SNRORBYo6C89u3jFxMjR+HfCmq1DiWNNrMYxFVx9JxXqEkdD5UkCCw1uiThOTI+ycQEgcfeRhf+dwXccUXvwA8/GgSagQISJAzP82iES52MQw7sbj1PU+4eHjMM7Zt28b33Xdfoohmk7IaVtWOj590zP68GkCTJlzshLe28WD3S6/Xw0tf+lK8+c1vxllnnZUkF9SOSg6unQX731lvmi7z9LRpnzq/XbW/FtH4LlK4lym8aD2TSItW/W1a95gns1zJb/OUfQDYs2cPvvjFL+KSSy7BtddemzyDLVezCVGXjXCxifpJES4REaITwykKJRJJgkqTlJYJgIjXK45yNwiiKMG7jAgXCAI2b8TzfvmX8IrX/hoO3XYU9oVrUJIQxnk6nJXlNDnNi6o5vljkJ6ps049FSd+LrjvVpLkVNl3KSodLzN4Duk3S3C50Hk3TkRl5Y7lqiJIGp452/9UhFKvOs2wbZfO/SBDCcJiUIk9+S1BqI1EphZ6QkbeRGsn+DUQQA4W1hx/Gp//qf+Oaf/8PIGRgbQiCAA+GkGK2Hi5VvOGqlIW20wnYdtkv/uIv4t/+7d/IEy4eHnOGM888k7/xjW+MhbHYQiVbnnjZCZeqHhiTuk+bwbZ3d4MgwAknnIALLrgA559/PrZv355SgMwxS6BkFWzXeVNOObCyuHfVx3VznjTZSW9DuFT1YMozWCaZI2YWSmvXJZrrJo2edI6dpvN2miRD0e+58ox0RQJny8pPoj+rPF/eLqntbZktvwsgUT6zctG+xjXXXINLLrkEX/jCF7B3795Ubpdp9PGs53RZjpA6fVWVcAHictAASMaemyJa38KhhjSVosIo3IskMAwV0JOAJKxsOxKve8MFOONFv4ghMYbECImhCGN5GcKh2aQQyPouJF4wSOdpyRrIVUoo54VWu8Z/1SpH9trfdKzUzYvVlTxMNooKCJcuqxXmQbX0M5Fon7R3krKjEqFRIzcMNCdJd4nI6eHURCcpqiZJRFEYlCPkXRQksrYr2JEeVeZMchQSQQ6GUbJdkrj++z/Apz7+l3jw5puBNQ0IEeV4QYNy0FYVKlt+2OebEK91CRdjiwVBkKQFMAmHh8MhVlZWcPDgQU+4eHjMC971rnc9+9JLL/3O/v37kzwe2VLE84JJhu1MAnaumyxBlfUSssOG8oynDRs24MUvfjHe9ra34cwzz2wdg+rh4eGxXmGU9t27d+Mzn/kMLrvsMtx4441jhIsd1mkbwPYua2IkWIkL6xhNsyBhXEZbHZK79BkFOQ2QqmV/iQhhGEYbPYjyZYAYWAlw4s8/Ha974+vxpKecgocHB6AFQZGIiB7LzX44HIJEAEUKYBGRP0AqpIApomM0mfsy9z1e5cXlATNJcq3NeCg36LqpEpj/+9UJu3lE25Cq9t4t1HJscPIcVXPv2Dlgpo2xCpzUfI4IjjyYTJjUigygDwzwj5f/Da78/P8LPLIXIAlSDOJIR2cVhzeKUUhiKgmxIaIAqDjUKSqfnvntmsRL13aK7e33u7/7u8/5yEc+8l1PuHh4zBgnnHAC33777UmlBzsRa1kGfE+4VFsIbIUcGE/46HIJtNl/rTVOPPFEvP71r08qDdleKB4eHh4eDQyiWPaatW4wGOBrX/saPv7xj+PrX/96ingx4ZvD4dBJlhgZXhZ+UsUgtj0ap2XkFIWdNl03WxvXxvLTDK0YgQwAQRiGQ2BjH8Ghm/GCl70ErzjvNdhwyGY8uraGgVYQ/R4Ua7DS6G9YwVCF6UpVOlqXTQiCIX90HN7AlE+4pAyaKRAubcma4j6aHuGyiJh3wqWcdJhvD86y326auNogIInBYAAKJEgzAiJshMRN/70Tl374ozhw508iL5deAL02QCCD2NNuiCAQ0ExjhIshU5goqZzmIlxoAqK7LuGitcbJJ5+MG2+8kTzh4uExI7z85S+/4ctf/vLJxiWt3+8nZZ6Ni9o0YtiXnXCxvVqySlA2w7jxVrGJrrPOOgu/+Zu/iXPOOQf9fj8VXuTh4eHh0V7uZ3NYKaVwyy234OMf/zj+5m/+Bnv27ElV6rPzmtnyOlvto2pS1EUlXCYNjWgDQiAOvzEWmIhyTTABCAhHnfBE/Oqvvw4/e/pp0CsB9g3XIPo9hFqlws+iazIgRuGyxuPFLgVrvF2oJLFmXYN6FqRL8fif+AybuQG/XggX1zgRU8qbN4+ES7QpqdHv9zEYDCAY6AUSNFTY3NuAR3bfh7/46P/Cru9eAwyHgAJIafR6vURnT0INY88WOwyRYsLF/hwmRLTUsVOyn4nXp1TjeL94D48pYevWrbxz584jjRKSDWWZlqK3HmAIkl6v5xSMNnliyK+tW7fi3HPPxeWXX453vvOdePKTn5zkzjG7qB4eHh4e3Sj4pjy07XF4xBFH4CUveQne9KY34fGPfzxuvvlm3H///WPyO+vlUlT9p4pR0yZnRxeGVZeJ0rswN9lOgkwCWisIEgiEBBjgUGH/ww9jx7e+g9vuuBOPf9zjsW3bNoTDIYQU4LgMLDhiVkgIKM0gKUCIEnJG/4rX4jjVi6mwU5YfY5pG7CKv/Yt4723vmGm2dyAWuM9sQqPuvSY5hHoBlNYAA5Ki3CYKjFAprKxuxBlnPhcPPvII7ty1CwhDSBkAHMkGtvLvJNW2YvEgMvdG9h+P/j1tVxJXxaggCPDrv/7r277//e9f0dW49vDwKMFpp53G3/3udxMFM8kGHntW2PHSLmVyHrBoHi7MnHJDN7ukpo1tUubxj3883vjGN+Ktb30rDj/88FHpu5zEkR4eHh4ezWGHd2aTQWYrva2treErX/kKLrnkEnz9619P3jefMdWNjBdM08o13ghO9dBonQQgZQBiQIfRDrQkAhNBEYMDAUgJbNqAV5x/Ll7wspeANm/AQR157pKUiZGkWGOoFXrUcxogJseMLih5CzTzYJgX0iV6lkn3/2JXnltEDxcbcsHlQ52QPft+TfLsoYrk+4oMwKECUXTNMAwRgLCiGf2Q8Q+fuhz/9v/8PTAYIuitgJgxHA4haVQ4JJn7cVLhrLxIxkwiubog3KrZKWX2y7HHHovbbruNuhoXHh4eOXjXu9717J07d9512223jXlc2GEt9i6fnezVo8WCHbdjEARJRQ0jII1C/5znPAfvf//78Zd/+Zd44QtfiNXV1bEKUbYXjF2tyPePh4eHR3ODIlXtwvozniqGROn3+zjllFNw/vnn4xWveAWGwyF27dqVVIcw+c+ahHzOg/v+PII53mwQBNbxmhevjb2gBxW3e6/XgxoOo0S4mnHDf12DH1z3Izzu6Mfi2O3HQLOONjqCAAMVYmVlJc7HkOMxSm66INu3ZQaVa43uos3bXCNtnPlxNzm6Y/49XNrqkJPuR25zDwSImASH1gAzFKLnDfo9aAJCViAp8XM/93N4aN8+3H7jDdDhEBz5vo283tI/mLiwkEVgZAvQ8+ymV8r+0Fpj79690Fp/YLaz3sNjyfEzP/MzfN111yW7cCaJ62AwQK/XSymI5t9hGM5t6MoierjYgs8cV1ZW8Au/8At497vfjTPPPBMrKyupz2d3V12LoydcPDw8PNrJZ5dMtQntohwne/bswZ/92Z/hM5/5DO66667CMr9l6473cHG1j0oqHWnNECJOKK81SIgk3AhEUZlXxOWfBUXHTRtx9qtejpe86hVYOfwQrJEG9yT27duH1dVVIIyT5vKovKvJ3wKU53ApK/ubV5lnlqTLdAkXXujxt+iUDxEajc/EYOfZyiBNzb/PBKgk9wpHIUUA1sIhRBD5eIRhCKmBDUTYqAX+7IN/hOv+89vA/gEEE4h4lLulIF+LzLSTxvhnJ2mn5L2v9SiHzQc+8IHViy+++IAhiDw8PDrCRRdddOEPf/jDa+++++5ECTShQ8bjwuzK2W7RtoLpF8PuFftNmzbh1a9+NT75yU/i937v93D88ccnfWHvrppqRfMQ4+/h4eGx7ISLi/xw5TOx87ysrKzg+c9/Pl7/+tdj+/btuOWWW3D//fePlZCuYyxMuyz03PaNCemRIsqxQrElw3G1opgckf1+ZNZrDeIoH0tUfYiAgwPcct2PsOOa/8bjHvdYHHvccVgbDBD0epEpyxnDlqzS0KN0Lg3phPx27qrd615n3DCb7libVDt4wqW8rZuMJZqxHOIWZaHjxCuRjcMA4opkkuIQUgDBSh9D1mAZbWw+8xnPwI4d12DfQ48AHBNWzNG/Y5cWk5tFY+TsYrfVpMiWNm0b23r/9+233/6B6c56D48lx3HHHcd33nlnYrQvqiLc9XWKFOs8ZL1M7N1PV9iVTV7Zuwfbtm3Dq1/9alx00UU48cQTS3cWPDw8PDwWB1pHYSv//M//jD/6oz/CtddeCwCJJ6nZ4DDrhP1vsylikzqRohznHYiVf/sIpN+z17TRGlee+yvPCJ51/jYmQJOVzF8zhBZjnzFeKQBALFLGD7MCSwFAARv7+J/n/DJe+X+ciw1bD8EaKyCQCLWCpMijdzBUgBRRJaPYOCPNKQ9gO9+PnWPC1V5FVaimSbCY8WY/BzC9KkWeYJk84eJu28UuflF1vNhyM+WlaJV0NtXIDBQBSkRClACIgcKhcgX33HALLv7tdwKP7gVpDaF55MkiJRRrKNaxR10kYYVuRhRVeS67kmkTe8nM961bt+LBBx8kwHu4eHi0xste9rK7brrppo/u3bsXSin0er2FrDY0qXtuupuYLZNpEy7mtV3S2Sa5jj/+eFx88cX4i7/4C7zqVa/CEUcckdpV9QqIh4eHx2JjOBwiCAIAwJOf/GT8xm/8Bk4//XTcc889+PGPf5xUi8gmQjdrXb/fT/7d6/WsxLtussUsG0TmjxoZbFXLV8/K1mQaWUkCFHuwjOdLGOVToNRTS6JoZ5sEMAxxx64f46qrvomjjjoKxx5zDDQzer0+NGsMVYh+fwVDFUJQVLdIotj7ialcv8jTZ6ZBuhSFIE8naa4nW6ZFuCxrG1fV0V1Jz8FW2XdHy2rWsdNcJJ/DwRBHHnEEDt1yCHZ++1tAXLWItUY/LhdNQoCEgDb2QEYeseUhR3MwZ8x6MxgMwMwf8ISLh0dLHHnkkfz973//ECN4FpVs6Zq4scN0sopTlfZxhVtlr2dCguzPP/nJT8af/Mmf4NJLL8Xpp5+OTZs2jf2uV0A8PDw8Fh+m6pwh4YkIT3ziE3HhhRfi5S9/OQ4cOIBdu3ZhbW0tIVjsfC/GG5WZk5DfaH3ghFjJHomqKOb1jfO5WZ8M4YLYaOLImjGlV22DxuxAU5zsMqESYh1AgCCEhA4Vhvv347+v/AbuuvsePOXUU7GycQNCpRD0etDQYGIwNAKilAeIy6jjim06K8LF9fm8JNHLSLhwql5v/b/Za2iecGlCvphjLtkSC1AKJECEQEroQRh5uoBw3BOfiF133IYHbr0dkAJ9GWC4NojmSiyvSY687QQyrAs16b3u+9NsBpuE7h/84Af/8Morr9SecPHwaIAzzjiD77jjjvcPBoMk54cx/qvEkM8jSdLlNcZ3dOoJNLMTaZdxNkp1NnSImfHzP//zuPTSS/HRj34UT3va06JqCAUu25508fDw8Fhc2HLcrBdmnQCAo48+Gueccw5e/epXQ0qJG2+8EXv37k02Rcx6YqoESikRhmEciqScZMukDLZ5Mt4i+4VHBAsAgojIFOvW2H5SSnu4EOLkx8xQWiMgAT0MASbce+vt+I9v/Ce2HXEUTjj+SZHHkSnxnZQKR27iZBfhMs3qVE1+K3v/0+jvaRE6HQ//TgzmWTzAetMps2FEqXFu/ixnLo7lhCZERKuQYKVBAAIpoZRCf3UDTjrxZHz9X78GKA21NkC/34eI9f6gF0BrNZI3NO5xNw+ES/Y6hxxyyKtvvPHGSzzh4uFRE5s3b+Zdu3aNES3m9aIZ9F2TLWUCq058qIm/l1Im8fi2Z8sZZ5yBT3ziE/jjP/5jnHTSSVHpudjF3LVjmA098vDw8PBYTBiixc6VYd43Bufhhx+OF73oRbjwwguxadMmXH/99di3b1+qCp1dWjpaN9quiVSZLJpH400YwmV0Q1EiTKIoFCBj6FDGLYEQFwUgAIKgOapuJIjAwxB6/xr++xvfxN1334NTTjwJh2w5BKFWYCLIQIJ1cXu4cjXUIRjatm/VpMz5RMtk+3cevKTWG+GynomX7PgWOcyHSYwthIzkNijO1SQAIhwYDrHtMY+BWhvgpmt2ADKAVhpQGoGIghoV6xTBO4+ESzbnVBiGRz744IMf8Nu8Hh4V8axnPYt37NgRxRyG4VgitLwQmmUmWvKu07YdsmWd7X8TEc466yz8/u//Pp7//OePea4UJS323i0eHh4ey0G0mH8bIj4Mw4Rwz8p7c+7BBx/EX//1X+NjH/sYfvKTnyAIgmTNMDlc4ksX5nEZX1vsc6I24TIvHpjEgIhrfug4MS6T43lM6WbNkYkV51aJyrlqaDBICiitkxAjaI7JsYiEQV9g5bGPwZv+r4vw9F94DvbrIQ6yAoSMPWrGd8+BamWhi8qKT7p9XfnnygiXLnXGWas4bZOX0szVZ1ro9p+G7VCWD9GEFmXJlkhmRycCIRPZa47BUGHjWoh3v+W38NAttwMDBckCPSmxFg4h+z0oYx/EY8WMl3lJmmtsFXN+8+bNePTRR8lv9Xp4lODiiy8+fMeOHftvu+22xKA3bslBEKSET7Z6zhWodREAACAASURBVLKTLWUKRxu48uG88IUvxKc//Wm8973vxfHHH58S/nm7nYZpTtyRPeni4eHhsfAKvy3zs8pyVt6bz/T7fZx++ul4y1vegiOPPBI/+MEPsHfv3kTpJ8tdvehYbGjVL0ttvz/T9SmOBbCrEMF4tlh/qce0ktsQETQrQKQrmARBAI6NEGZABgEYDLV/P66+8j9wx9334Gee9j+wZfNmhAXGExEl1YyqtHGTMJ4udAR753+ceKHCz7f9m7RuNmG+olX+l25ywLTM4UGcmivZvyQWZm5z2BSP6bIxZWRH6nmtZmWKE+Bqhf5KH0prkKAoMS4zVnt9bN6wAdd+4yqIlQ0I4pLzUgbp6mhwpHChbp6zq++banhaa+/h4uFRhJ/92Z/l733ve8nESS36sbeF2VnTWo8l5Vt2wqWoEkBXni/9fh9nn3023vOe9+D0008fU7ZtmHh820MGSO+IesLFw8PDY7EJF5tUMXI/Gz46KvOcXivsNeShhx7CZZddhj/90z/F7t274/VDJzxCkZdLfmloUflZ5i5pbtR6GQMq8nkR8RmBdA41YpEmi+KtbaMLCcSh1zEJIynyKqJeAIaOrtqT2HLsdlzwljfhf5z+LBwkjVAxlAA0M1hEO+aa6ukPeTqHXbo2T69pm2DX5Aqyx1t0Xkx6htRqi85/fdYRTa0frz3h0sagpzl0kM9LAu3ydskSorYHSkR+SwzCEIEQUMzoxR7pzAypNFZB6A8Z73zTW/HgLbcCawpSI/JGZB2Vrkfaw0VYUqu1h1VLD5dsVdVYDnoPFw8PF97+9re/aOfOnTffeeedieGeVzXH3kGb91CiuvfX9HlM27iU3DyBnW3Tfr+Pc845B5/5zGfw9re/Hcccc0xKqLsWLbtahX0+798eHh4eHouFrIzPki32Z1wy3369urqK008/Ha9//euxdetW7Ny5E/v27YvDUskq4xtVzxFxLoHIaI7e19okehXILpmTWG8mv4alt9wpJp+IrSOirWYCxaQTg1lHZBVHbBQl9Yvi/rDqGUXf0SDm6POaMdjzMK7+93/H/Q8+iFNPOgmbN20CCAihoIlBksCsQQIQgqChISRBSAnWDAkC8cjgkubeY8OMDVkjBDQoqZqC+N4EU5KPpriNy9ws2Kn3lHmgROfnQE+kyNsAJkGx43XhX8d6au3xTm3/qJ2HDY/GepP/slW6Onigmn/N+42ZIUjEsiGb6wmJ24sQFMsTiiuhRecFRSTMho2rIBL44be/A0AgIAmhNEgzmBhklUwjzlCM1O34awKTL9K0yUUXXXS7J1w8PDI49dRT+V/+5V/OX1tbQ6/XixZuKZMQF5dnxSSVSpcwaKJwTZMMMkLG3imyXxvm10BaDHcQBPjlX/5lfOpTn8I73vEObNu2LWlze2fTw8PDw8OjLkzokJ1kd9OmTXj2s5+NN73pTdiyZQu+973vYf/+/diwYYMjqW56DbMV62lUoZnF+kc1bJnKyWuRrmhCHHkN3XXzzfjPq76Jo7dtw7HbHw9CFIIQhiFEEBUnGA6HI50s1FYZapHssI+qLFnGn0kAPLL9xkzN8h3y6sl5s1WK5rFvHTcxN3N1Nu1BE/32NKtqzSNMmedkbqbdBBGyhtIaj992NL76r/8fcPAgeKjQFwISBB2HPNotTR0SLl3YP3YeSSLCYx7zmKd7wsXDI8Z73vOen9mxY8fu3bt3g5mxsrKC4XCYLJgmUe60qtzMcxWDKvdukyiuHQvzDCZ2HgDOOeccXHbZZXjHO96Bo48+GkopBEGQcsv1hIuHh4eHR1PYoab2ayEEVldXccYZZ+CNb3wjNm3ahGuuuQb79+9PNl/MWtbr9aCUGluPlpVwqXIfXeSg4aiRMdy7F//1javw03vvw1NOeTK2rG6CJkCxxlCFEckVKqzIHggiqoZEUUJdYTygeNz+4tiDwfZDmRTh0rzPZh2TQ3MxtmY3zmmG3243dqpurE6jbYvkQanM1IzHHLYVd9z8Y9x94y6ACSIuMw+BFOFCc0a42BEPhnxZWVk5zBMuHh6IKhD94z/+41tsUmU4HKYmj1HI7MpEsyBc5t27JUuiSCkT4ZMtxWnims8++2xcfvnleOc734nt27ePkTZdKnQeHh4eHusXYRim1iXbA9OsLb1eD2eeeSbe8IY3gIjwwx/+EAcOHEiqIJkqFFLKVLhxVj9YZsJlIvdGAFQU9oNBiLt+fCuuuupbeOxjtuG4446DFFHYlgAhkAGGwyGkkFgbDiBX+lF1JIy8ZrL2l0jCYpD7uUkSLtU2jNY34TL78T1fhEuVNmkT/j/9vqRCfZ4JCCDAYYjDVjfjm1/914gdjctDc8bDZR4Jl2wOmA0bNsATLh7rHkceeSTv2rVrrPywlDJJgptNmNvFhCz7m3Ri20kim7Q2S7aYNjj99NPx6U9/Gu973/uwffv2VAJEV3tnQ5E8PDw8PDzqwLW+ZEOMpIxCV1ZXV/HCF74Qr3vd67C2toadO3diOBwmeWNMSWp7k2E9ES5d3wvF/cOhQi+IvFfW9jyEq7/1Ldx//wM46YQTseWQLdGGGBGEFFCCEfQDDMIBpBRWnBAl/0wZQyZhhGWwdUm4FJEq1bx0F5xw0YzCMj0lfzzzcT5/hEvRfGur40+TdKnybyEFWGn0hcTWLYfga1/9V6j9BxEQxYTp/BMu2Tbt9/uecPFYv3jZy15216233vrRffv2JcqTqThklDKzE2aIgK7cHOtco0kc8KyIliwxYnYBgyBIdv6klHjKU56CP//zP8eHP/xhPOlJT0qRLOaYTUo8WxdTDw8PD49lhV1d0OQMs6vebdmyBb/0S7+Ec889Fw888ACuu+66hJiJy3461+f15uHS+tkYIM3oBz2wUtBhFLYFpXDnrh/juzt24NjHb8f27duj/C0ABjqMEu2vrGBtbQ0kZcKnEOJ8LbFHCwuLZKHJEC51uqfIA2Bm+hvyq2dV8tBpSwBkmmD6431+CZdse3Sl50+LdCkLQ2SKkjZH1c8YmzdsxM6rd+DBu+5GIAQGg0FUQjozf+eJcDF2TLagiidcPNYlnvjEJ/KOHTsOMTlCzE6VcRHOGvlG8TLuxNNklPNKr80r2QLE5duUQq/XS9qVmfG4xz0O73//+/GpT30KT33qU52hRub5kpKSGY8Wn8PFw8PDw6MtzNqUJfRNmJA5CiGSdejwww/HK1/5Srz0pS/FnXfeiV27diV6gVn3Zl0Vb9q/2eXvEeKy01ojjHxRIAIZBQqFIQ4+9BC+fdW3AAZOPuVkBP0eZC/AQIUYhmHcFxyHHXBEt5BVYSfzWzbl0mVIka2DFW0WzSPhgsz4zY7nMv2SEFUGb1Ifx7R9Kq9OxgOG7OpTjr+ZN9+Er7CIJG76+pRPxBAw1Aq9IIAaDnHIxlXcfdvt2HXNtdBx9TMhKDVOaWzAzHr60FiYqidcPNYdfuu3fuuNO3fuvGbPnj3JxMhzAzYKl/FyAZB4v8xKuC0K0WDcrE17HXHEEXj729+Oz3zmMzjzzDMTUst+puyuou2y7Son7eHh4eHh0VYxtg1J28MyG8JqkzNHH300Xvva1+J5z3serr/+etxzzz2Jl8us1+xFXh8jwiXKz6KYIXpBXGo2tqY0A0OFG7+/E9fv2oVTTjkFh209DMPhEP1eL3p25sRwZ0JSmtrO3eIycLsOKarqlTv+mdkTLi7PlipjizgiW9r0vwa3KxqxTgiXrjdWOw8PzMwB1xga+zdFBKtSCv0ggNCM/Q89jB1XfQsYhgiERBJ0lvFQmxcYO8a2bYIg8ISLx/rB0572NP7yl798jqtiTp6gyCpcTUKBXItu1UW4aRhN0W/XIU1sd7isgE9YWyuxre2xwsxYXV3FG97wBlx++eX4lV/5FWzcuNEZM2+3SdajZRou2h4eHh4enoCp81oIgeOPPx7nn38+Tj31VOzcuRMPPPDAGEljbx7YSXaz66odertohEteLrompmZUpITBIs7XADstC0UeMEpjz+6f4lv/+U0csfVwnHD8kxDGVaMgCLA8LBQ0NGvIoAdtyBuK/CSIouonY5WMWhvEdf6q9V+XIe2F1+Fx7xL7ddmTUPsbbDful5xwmfxcnoxcHY27fLnKABRzEjbUY0KgNP79iq8AmiE0wBzLT3Mdrif/XJu2tixuO8eyMjzJC+qXWI9lx8UXX3z41Vdfvf8nP/lJKq5u0gpLU4Y+e39tWewm3zd5V1y5a4zyaJMjhsE1n2Vm/Or/z96Xx0lRXW0/91Z1NzPDyCooCqLBDQTEV6PilsSgb4wLgkoUMaIiJiiuREk+ReObNyoucYnBaPSNEaMiJjEmGiHuqGBQRERwF0T2dQZmpqvq3u+PqlN9q6Z6757pHu7Dr3/NdHVV13KXc557znPOOAMzZ87Eeeedhy5duuiSzhoaGhoaVQ/VoJZSIhaL4cADD8QFF1yAHj164N1330UymXRXaeNx2LbtpyRT1KdhGP6cSURLqeyPqhbVVX2okG/mO/SOhBQSsCXsxh149623sXHTZgw56CDU1tZCOsIjCiQY567jZpqwHQHHcWBQFBMdL2QilaNKUVvYjvkcv5xp58WeoWRF3jdNuFQU4dK63WYgspmn4+Kl4JhgkE0tePGfLwAtSVfjySdIWWTEWmFRZaXrY1GL9DqlSKPDY8SIEfLhhx++VgiBWCwG28/xzVwpqNxGRrrt+QrjlpJkUfelkDiVIFFzEclQVCdvWr076qij8Pjjj+Pyyy/Hrrvu6kfA0L0l41NDQ0NDQ6PaQAsRJKhPkZ6JRAJHHnkkxo8fj+3bt+PDDz9Ec3OzH9Wikiskyk8LG7QKappmxVcdKTsJwwRA+iuQbkqQ6pN5Oh6mYUBIAdgCKz/7AgsXvIN9+u6F3XbbHcJxYDC32gkHAzM4HNtCp3jc13StRsKlGiBZca+i71sRhE1J7H9NuOTdvls9OwlwzmAIIC6Bl154Efa2RlcbyB8fWevINIZAxEvG3yoj4UKkvCZcNHYK9OnTR77//vt+Y1crDrRP7fnM26PSddqSbFH3UysKqSRQmFxR3wcNGoR77rkH06dPR79+/fxIGHV/teqThoaGhoZG1TmUHsESXjygxYpOnTrhhz/8IUaPHo1169Zh2bJl/j6qGLyaXkQETlsI3re3qG72xS3p+15McaxSoqgMnHnpyySz6whs37QFb7z8CsxEHAfstz+4AEzDgME5hO3eX0c4YN5e0IRLh0IpCJeSnIcmXIoiXKhKlsEZTAEkGMcrz7+I5g2bYDAOSOHpBIXCW9I8/nyfaynagarj5M8NuotqdDRMnjz5R6ZpytWrV/uGTSKRCERntLVxls2ICm8vNA2oVCQNGZHhKBdagaNtALDbbrvhvvvuw+LFi3HWWWf5x1AjYNTqD9qY0NDQ0NCodseOolHCBAK977fffnjyySfx+uuv49hjj/UXKOLxOBzHgW3bfqUkml/bu8JgOe9ZIavNrgMl3Jd3a4QQcKSAgIQjBUyDwYCEaQugYQeeeeBh3PO/t6FlwxbUSgNoSiIm3FQkQwAcwn2FBF4Fc1/tjfZsA6X47faKcAnbwule5bChOxIKvX/F+Cr+wqx0q5QZjEE6wiexzUTcLzfOZXR7KxcZVAriBYCOcNHoWDj44IPls88+ewYRA0QcWJYVEHdtK4Msl+2lGsBKvS+tyJHYH91PCoOuqanBNddcgz//+c845phjWhlVajQRrQRqHRcNDQ0NjY7imFB6kVrdiOZM+qxPnz4YN24cBg0ahIULF2LDhg2IxWJ+dIsaCVoJEbht/dutP0tFuMjgF/3/ctOAYZoQjuMSWYxDCgcUB7P+8y/w2ptvYq++/bD3PvukBHUNDv/gobXw3J021q73q/xES5G/2U67+9EE7Xxfqz3CpfxtlkV+T41yYYxBCgHOGAxb4KV//gs71m0Ak67ItfucWaTuNMvznMpR7Ukdx3VZaI0Ohy5dushVq1ZBCOGvIJHj76tER4QBt/WAUyzZUqhBFk5ZygQKdVZJEzIsTdPEmWeeib/+9a8YNWoUYl4pxnAkjGVZfjSMmtOoGqcaGhoaGhrVBIpEoXksnLNP24QQgfTcgQMHYuLEiejZsydef/11JJPJgB6aqndW2Q5TmX/fqz8iPRJEciJDXAfLNEzYlu3qtHj3THKvnDDngOOAx2KwGrbjrddexQ7bwuAhQ8BjJmzHUYgbz17Je4WcdfBn0fEJl3Le452dcMl+b1na7Ywxt4qYdPWbDDAYloMXn/0HmjduBrMlDJmqWCZzJFzask9FXZNOKdLoEDjvvPN+bxiG3LZtm+/MJ5NJv9Hbtu2nErVHSlEuBEgx++RynExRLOkMSiJHVBHdY445Bv/+97/x2GOPoW/fvgFjk95pgInH4wDc1CJ1e6Xcfw0NDQ0NjUIMaiJbSNMsqjIF6bSohEw8HscVV1yBTz/9FD/96U9bRbnsrCkNuThBdGf8iFnPVvGjl4kAYxyiOQnYAtiRxL8efRzTrrkOG1d8g85G3E0vkm6qkuBeiVkmAqkJhaQoUIoSL+EjbIv2sLOn0ZQyXUYjum1lShsLpPUpdBnnHAYYIASSyWRkW3WrFgX/bm+oFecCGpi6OWhUM4YNGybfe+89X4xOLVlczsGjvVeAcp0YciFa1CoLYUFcCo3+1re+hV/96lc466yzdDqQRocxAnItz+4oK6nhbdnErtWor7COQfg8HMdBMpnE9u3b0dTUhIaGBjQ2NqKxsRHbtm3Dtm3b0NTUhO3bt6O5uRk7duxAc3MzWlpa0NTUBMuyAsYjOXyxWAzxeByJRALxeBxdu3ZFbW0tunTp0upVW1uLXXbZBYlEotU1q8RpWLci0z2h61ed1PB9SPc99Rg6HVGjo2HRokW49tprMWfOnEAlQJqPqQ/QogdFnVK0rvo9soPKXQUxn+Nn+031mtOOxSzaoVL3ZYy5ES6Rx5KAwZDo3RMTrrgUhxx9JBpEElaMw2YSDuMABDh3o42YYDBicQivhDfzxr64kSrfLVg02eI7l8U4bEVXUclPM3BnR/h+piPboua3gn6vw9/+1vdTAABn/vVzAIbwiAjpfsfh7vcMz67gjkACHNaGzbhy/MXAxi3gDmB6hCkdV7Jw7IjI+ryjbIt0Nly+/SfKviGCWEOjKtGlSxfZ0NDgG+mJRCI1GQpRVmetIxAu4TQg1WCLxWKwLAs9e/bElVdeiSuuuAK1tbVtQmppaFQa+ZLLWJDL/x3HQXNzM9avX4+1a9fiiy++wIoVK7Bq1Sr/tXHjRjQ0NKC5udknUcLjGTldUX1cTWuI2qYSJupYSWKesVgMtbW16Nq1K3r06IGePXti9913x5577on+/fujT58+6NevH3r27IkuXbpkHRPV9AvSc6IoN9oWpa+VjpQJRxNoaFQrVALzmWeewdSpU/H555/7fdy27YAmTJSzQIsj2fpFKe2WXKoslpJwyXVs8McIKcA4d8tBS8ARDnjMhCNtoFMMJ513Dk4Zcwac2hh2OBYcgwGcwZESnJtIJm0Y3IRJKdX0e05qMUolXDilOGjCpUOQLpmim4qpIKoJl9aEC9EQKuHikjAShpCoYybWLPsEN02+GtjeBG5LcAE/PUclXFL9r30JFxrbKV2Ucw7TNDXholF9+NGPfvT3J5544mS188RiMV/xvy3FcSuNYMl1v7Cxouac04rZ+PHjcfPNN6N3795pV7I1NDoKyZLus1ycBzUChvbZuHEjVqxYgU8//RQff/wxli9fjk8++QRr1qzB2rVrYVkWbFpBDR3PNE3fiQqTKOE+HNXHw9uinBo1LUKtjqI6Lur31e3xeBydO3dGnz590L9/f/Tv3x9777039t13X/Tt2xd9+/ZF586dfX2nKNIkPKaoAqTkSNK5ZS4hq6FRXbAsy48+oygVxhi2b9+Oe+65B7/+9a/R2Njob1dBmnRqtAv1kTCZmo9uWzURLtlIJFo4IqdHCAFwBhYz4VgtgMHwreHfxoTLforue+6OBrsFNgdk3IDlSHSKdXKfEbyxSkgYcXcsSyaTAWKLl8F5FkVHIJXHntSES4l+SxMuMCj9Dq4OC+koCcAnOE0JdIl1wvzn5+DB/7kVaLHARSqNiKMyI1xUwoXG45qaGk24aFQXBg4cKJcuXeqTLGF9ENU50YRL9ggXMk5oJc0wDBx77LG46667MGTIkFbCuRoaOxPhopIR4cgu6huWZWHVqlVYtmwZ3n33XSxZsgTLli3D2rVrsX79eliW5TtDqpC3+ls0yYfFOMPnR2Mc6VHl2uejiI10109jghohE94/fFyVsOGco1u3bthzzz0xePBgDB06FAcddBAGDx6M3XffPTA+R5Ep4ZX6dNFCGhodaTxSFz3WrFmD6667DjNnzmzlBITTjCgSJmo8KQfZEnW8dGmUuRIuxdy3qOPSGOJv4y6RCynB4jFIxwLiJmp274VLLr8MQ4d/G1usJoi4iRZhAywGYTvgEojFYgCAZDIJIx6DgAyWsA2VlS4FCaMJl/YlXjThUlrChUgXSdpWSt/xbYEQ4WIwDiYEusVq8Kc778UrT8wGhPT7FpE2Lr3CQ89MlPXqctXNVO2+bt26acJFo3pQW1srd+zY4YvQURUcWjGNynsuatCtkEmpHCWf1dB8ul/77LMPpk+fjtNOO80nYYihTaepoKHRkYgXlZAIf0YT58aNG/HBBx9g0aJFmD9/PpYsWYIVK1agqanJj9CgY4ZTAaKOSwQHjTmqBkO6sonhfq2et1p+Pd2qjarXFBB1815qKkN4u6rzBMC/XnJM1GPSNgCor6/Hfvvth8GDB+Ooo47CoYceigEDBqCuri7yuCrUCCKdUqTR0cae8MIG/f3SSy9hypQpWLRoUSuyNDxHR/X1cs3T2Sot5kO4FGPjpLXThEdImW6ki4R0S0jbbhGAWCwGy7aAuAHUxDHy/HPxg9Ej0WxIWCaDzUyX/PIqISUSCUgpYXupOiTsSY4zOYGVQrgUl9CkIVmZy0bvJIQLl6k+Eb6nYcKF0okAIGZwOJaNGOOosRmuv3gSNiz9BMwT0JWMgcPVclEJF+n/evsSLqrdR+N6nz59NOGiUfk488wzX3766ae/ExaFU1cwyBCxbRudOrnhoOU0KKqBbMm0v3ovu3XrhiuuuAI///nPAaRWz8l5VB0g7exo7Ayki5pWs27dOrz99tt49dVXMX/+fHz00UfYunVrYBxSI09UPYXwxKseP93vhx2mKHIlHeg3qbpYeDzLFikSFt9Uj6Fej3p/iLyhanDq94hIIgKHxhByGHfffXcMHToURx55JI477jgMHjzY14XJdt80NDoCLMsKkJUq6WmaJpqbm/HAAw/gpptuwubNmwOiupRWpPY1leRMF4lSCtHcTONQexMuXHj2oBQwvXRztyyrO15L4YAbJiwI1+szGQ44Zjh+/NOL0XOP3dEoHbQIiUQ87guRc84hpITkwd+sxAgXTbgUT7ik60OacMmPcFH7BUUPqUQlYywQ3aISLrvEOmHDl1/j+vMnANuTMOFWKKNqZKagtKLKJFzU4iODBg3ShItGZeOwww6TCxcuDDgwqmCkaog7jgPTNGFZVtE6LuUmXNqKxMkU4cIYw+mnn45bb70V/fv3z9kh1NDoKCRLOPTctm20tLTggw8+wL///W/MnTsXS5YswcaNG30nRyUdydlRP1N1kOg7FLkSJhDUvqgSHup3oiJMVGdDjaBRf7+YcU89D5VQAlLRJuFSmuGUK3UbOZREUpFuBaVCkAbXbrvthkMPPRQjRozA0UcfjSFDhvi/FVXFSEOjIyAcbaqOK6ZpwrZtrFu3Dj//+c/x2GOPteqHKompEqJR/bot5vJc7YdC9Vuiri9AlAuBmBlDUiF61XOImyaaki0wTBO2FIDJAOmgS/9+OO+SCRg0/HAkYwzNySSYwf0KSBCttbSkQraUSs9FEy7ln/8zEoCacCkJ4UKgSBe6l2o/iSJcDAZwR6JbrAZ/e/TPePa3DwACMMFgW5bbXwEYgoeEqnlJCJdSLHTTYhQtXJ100klrtQelUbHo3r273LJlSyBUPsoJURt5qURzs+UoVzvhMnDgQNx1110YMWJEwJEK6yuE76VeZdboiFi1ahVee+01/POf/8T8+fOxcuVKNDc3ByJDwuOPSjT4hoPSZ9QyyumqBkU5JWpUjDoeqQRLlE6V+hvh341yuqIQJp9UUilKrFPdR42Iob/T6T+p56+KhqpaFPF4HAMGDMCIESNw0kkn4dBDD0W3bt10Y9XoUI5fOD0vTOqGycY333wTkydPxgcffOD3uajUv0w2QLUTLmmJFu/drU4kwZQKTnRfA0SN4a6Mk6guDAbETZw0fhxOOuN0IGFih52EEXO1Wzh3yS+1wCutrGvCpbr6XaZ+ENZwKbkG0k5IuACA5K0JF/osWPpdIg6OmqTE1J9cik3LPgFs6TZrKQHPLSmUcAnrwuVqH+XTvlTbx3EcTJgw4QbtOWlUHM4999xHZ86cOS68MlGICFxU+WN/Uo4orRr+blsRJFGic1GGRPja0zlH6jWqxlsikcDPfvYz/OIXv/D1b8LH1SvIGu2NKE2DKGci/H0gGKIf5cCQ0f3hhx9izpw5eO655/D+++9j69atrcaFXMaZdBWBymEIdjSDN1sbUAmo3r174+ijj8aJJ56IESNGoH///nm1pUK3a2hUGmzbxoMPPogbbrjBj75T+4o61lGKcDgaLsrWKZV2HcuhrLGqSRMed+k7UdE6uSBAiKjRKCzasVYdYMEBxDkGfuco/HjiRHTdozcaWppgMVf7xSV0XILYsiwYMROgOcrgflWj4ggX3cYraa5Kp6mWdh+mCZeAZhxapzTHYjE0W0lfk5PsNcYYmBCoYyaWvbkA90z7H2D7Dq9XixShoYjnMslLGuGSzWbJJtGelgAAIABJREFUNCZFLTZ5465eqtaoLAwaNEh++OGHAQO4kPSW8IQe3jfbaktbEi7ZcqGjOrqU0k+fIqIlvDJO2xOJBFpaWnD88cfj/vvvx4ABA7JWKdFRLBqVavSEP1dXiKOqaqn//89//oO//OUv+Ne//oXly5ejsbEx0N5zrXAWXsEIjzXluNadiXAxlJXpqL/r6+sxZMgQnHbaafjhD3+IAw88sFWaaTgVKTwHRJWm1uOeRjWASOV169bh+uuvxx/+8IeAkR8uFx21oNOehEu+Y2EhKUfuhCB9zQjVCQ6upiuaEgAcBoi4AQgLuw48EBdfeRm+NehANFjNsCDADAOO4433RspONWMxtLS0+NUzNeHSQamEXOwDTbgE5tsw4UJpRGpVRs45DDDYSQtxztHV7IRfXfUzfDJvvqvZIiTgOGAmb0VoMkn9kENWAOGiEi+UWmRZlrYuNCoHPXr0kFu2bPGNhGIm7nRik34OYWg1JRfHri0djmyEC72bpolkMhnYFk596NWrF2699Vacf/75WUuuarJFoxKQTaw5imhJR5Z8+umneOaZZ/DUU0/hww8/9FOFVD0o2j/duJBL39QOe2nHR0ozsiwrQG4RWaKmOR1yyCEYPXo0Tj75ZOy///6B1Ci17ZAQqX5WGtXeP+idc46FCxdi0qRJmD9/fiCqVV2AiSsCsOkIl7Z0SkttK0U5vUS0ZHJwo7YJSEi4YrroXIPxkyfh2B+MwA5INEkbgjNw04DweBWujElQ0k8LPX9NuFROP0tXKVATLunBJYtsx0S8OEhFfsTjcTetGAzCdlAbT6CWm/jgzQW462e/AJotcO4tJgsHpmlAOiJwn1OES/b+XooxKBvholacBIDOnTujsbFRWxwa7Y/zzjvv94899tiEbBEopRg0w2lFuTpNpSRcSrmCRAyx6oioBMrYsWNxxx13oEePHjBNs5Uzq0kWjUp2KGzb9tODoshBte2qUSZr1qzBX//6VzzxxBNYuHAhduzYEajuQX2HSBsSbSXh7WyVgSqpbHyHNNg8rRgaz0zT9I2XcCUlAP7/6+rq8O1vfxtnn302Ro0ahR49evhjnqppk61iih4PNaoJpOXy6KOP4rrrrsOGDRsCGktqpFi2SkZtQbiEBcWj+p2aEp3veJvO4Q07YukcMyEFTMOEJWxX18VkOPq0kzHmogtg7FIL22SwIWHZ3rkp45Rt262SB/KdKzThUrnQhEtxhItgCESHSSmR4CakI8AcgU7cRNwW+J9r/x++mDcfBjMh4QCcQ8KBARZJuBC52haES6770H577bUXvvrqK21VaLQvDj/8cDl//nx/QiXHJ1NOfd6Tb46ES6bjlkpIqZQDgFoBhMoexuNxJJNJ7Lvvvrjnnnvw3//936lJPCLdQjsYGtWAsC5B1P8bGxvx4osv4tFHH8Wrr76KLVu2BPo8ES00voQFoilaIplM+uRkLoRLIf1HEza5jdlRZFqUmLdt24jH43AcxyeUu3TpgpNOOgkXX3wxjjrqqFbaPPScw9VhNDSqiWhRRasNw8C6detwzTXXYNasWUgmk76Oi5qSV8iqfVkcszITLukcL1VoMwqmoYicMwZpmHCEhd0OGoiJ11yOvvsPQKOThMM4BBQ7UrrRLY50NOGyk5ItmnAJEi5SKQlN120YBgSkL3kAy4G0HdSZcSQkx0t/ew4z774P2J5EnJtwpO2SKdId7+ClFEURLuWwRYq1Yb73ve9hzpw52svSaD/suuuufgoRrSyreW/FOCu5qvRnSz0qFVmS7/7ZSBEynPwVFbghwwBw6aWX4pe//CVqa2sDv5uuYoiGRqU7FeRgk3aB+tnSpUvx8MMPY/bs2fj6669he6VA1bSUcGUhVRNE1T8qNq2oVOOTNmyDkUwqIRZVhltNFaWoP0q5FEJg2LBhGDduHM4991w/6iWqfWkBXY1qgZpGSW2Y0u8A4NVXX8WECRPw5Zdfpq3sGDVutaV9EGXjpNNdys/jY0Gn1tNyyefeGhwwGYdggGULIG4CBge6dMb4y36Co084HtstCzJmoMV2xXMZN5BMJsF5cVHSmnCpHESR/1kjuDThkpZwkSxlfznSlbmNgSPBDCBpo3nTFkybfA22f7kCJkwYAnDgQMBN/Y7FjNZVHL2UorYgXDLpwqnjmlq5ccqUKUdPnz59nqG7k0Zb49prr/2vBQsWfNPS0uKLvqoGL4kdpmvg+VQOSfdZJtHcXH+j3B070ypU1Ar7IYccglmzZuGCCy5APB73O324egGt8EeVQ9NkjEYlGTrhSjUUecIYw7PPPovLL78cU6dOxbx587B169bAdyjNhD6jMYbe1dShRCIRcL7zIVzSfZ7ppZH9vqrpQuGxKuyYhSsChMvsrlq1Cv/6178wc+ZMrFq1Cvvttx/q6ur8Y0eV4NXQqOSxMWoOJ4KZc45+/fph4sSJaGlpwdtvv91KtyqdTdQW7V/VOchE+KTrj9nGV6Y4tgyAwRgABgbmVpZ1/wy81F+JxQzYtoBkHlHDiISVQNLCovnvwOAGBh440I2A4W6KUVIKMNOAhATL95yVl6bgK2suCj/D7DsVtbn67xmUUs8MoBo9jKX6ufDm55hpgtkC0hGoi3fCQ/fej5X/WeRGiwlACAdMShiGmZapYr7yNSv5OBv1dzb/kv4mn2vevHkX7gzPXaPCcMIJJzhz587l6spymOigMNlwg88UlZJuoAyLy2UiWTJV6SlmFTqXfdORLVGlocNaLT169MC1116LK664wo94UUtBqtetphWl+y0NjUpwKNS2Se1206ZNeOSRR/CHP/wBy5cvD0xshmH4q7xq2yaSMZOzQb+RD7kbRdAWqomko1yi7wcRIrZt++UjaXVLTQUKky3UXtT2oLalmpoajBo1CpMmTcIRRxwRaGMaGtXYX8K6btQPpJRYunQpJk+ejFdeecX/PGwjtWWEi3qu6UjUTGWhcz1HtfoQrYlLRqK4QQeIKWVmBQSkdHdkJoefISQlwBnADYADh554PMZP/ilYXS12MAfC5LAcGwbjftnaMNTolajvkMaFRmX1q3za3s4X4cIApUdRu1YjXGTIx6MS67AdJARDl5o6zP3bP/D4nXcDzRYMS4IJ139h0oEjJSQTEEKCGSzYZ+m+g5f8+WcjXKI+U22Juro6NDQ0ME24aLQp+vXrJ1euXBkgAQqd3LNNSPkazuUmVHIhhKKugVZo1fJpdM8cx8Fpp52GO++8E3vvvXfexoiGRltAdZCp3VK6B7V91VEOC9syxvDpp5/izjvvxOzZs7F+/fqix498+mamz4p1ODQJU9hYm6soZ9RzU8dc0zTx3e9+F5dddhlOPPFExGKxQJqZ2obDkYLh39CEjUalOYrqoksymcT//d//YerUqdi8eXOkU6kSNeoYHCZEVKIk6hjFjstR0S/h38xr/5C+A2MsVcUoKuVcEeCUjAFS+O4SI+eRScBg2GPwgZh49ZXYbZ+9sB02bJ6qhuaPFdx7FoL5mi8AYAjVWQQEU1xHmX4OKHfKkWxnE7JSCQlV7Lmc96/Y6+dF7K+SJOHz4TI6skOAA0xASAYGAS49/wWyFeEi3Bgzd19HIMEM1PM4Vi3/DDf97OfA+s2AI2AoaUPl0mfJZl9k0vQME8TqZ+S7maaJYcOG4Z133mEAoK0DjTZBIpGQK1asKNkKSrWH7KulTcNlGqmTO46DeDweIKhohXe33XbDzJkzMXv2bOy1116BfEENjfYGpYNQtJqqt2EYRoBsYYy1Shuhtvzmm2/itNNOw9ChQzFjxgxs2LDBdwTK2c8roR9p4rQ0c0TU56rBPHfuXJx66qk44ogj8OCDD6KxsbFVW46KjEo33+gxWKMS2j6NrWQzxONxXHjhhViyZAnGjBnjkyuqzhXpY1G7J3tEJV2iNPbCkTLl7M+FHD/KWfNXx7MdT3or916qEpOAIQEmXO901eKluOln12Hx2/OxixFDwhGoNeNwLDfSxbZtSNuBbduwhZNKi5UpokWmcZh1Cmp1zCkd+pozTmccUjIwj0zkYGAwUlGnQrpkiSPAlPHBMAxIIRAHRy0z0bB2A+695XZgcwNg2+CitARWMcRLLulD4W3ku9m2jSOPPPJsf5vuQhrlxPjx4+/44x//eJW6yt1Wk3NbOVjF7kv7UzoQVR1Sj01Gk2maOOecc3Dbbbdh11131RU2NKoCappbVN8kI57a8wsvvIBf//rXmDdvXoCYiYokKFfFn0zHbUujSzvw0YZQofdQNYgsywpUd2OMoV+/frjoootw0UUXoVevXv74q7ZDFeHqbzo1U6MSEBURokbHPvvss/jJT36CtWvXBqoYqRXAwmLj5CypC0XlaPeZ9F3KMd6Hj8fhRqJI5pEhjAFS+oSLFErZ6LgJSBvoXIPTfzwOp445Aw2ODcdgcKQAOIfggC0FEp1q0dLSAlPxIIVSyjZbZIIvIq6Hl3YnXjI+p3aOcCkWajsMtrVg+l/qe26VIP++8CBJC4O7fcHwNJQsGzFw7MLjMFps3DL1Bny68H0g6YA7DigWpj3ti2xjTLriKqqd6n3GNOGiUXYMGTJELl682CcLKAc/vGLSFoRKKZ2akqjoh8gWMmSIaAmv+juOgwMOOAC33XYbTjnllIBugWpElTvVQkMj3z4SVWVIdVRVPPnkk5g+fTree++9yP4ZTvUoJymRrnR8exINul3l9hxyMZjC7Y/mKQoF7tKlCy688EJMnjwZvXv39p1S1elLp6+lyW+N9iZbqE1HjctkP6xfvx5XXXUVnnrqKT+yhb6njrXqPmGCMZMDUrDDl0eluHKMsb7Dy1mg7DM5lYYEHOGAGyYcJiEMBjg2wIFDTvw+zp04AfW79oAFgWbhki/S5HBs774K2YpwAdwUo1zsXlsK3cgrjGTZmQiX1t/lgbLPkolgSXevHzkQMBlHHBwJG0BjM+6/9Q588NqbQNKBQVRnqKx6JREuUfN+lL0opUSfPn3wzTff+DdNVynSKAt22203+eWXX/qTthq1ERZKqwTCJe8JuYS/T8SKauRQDiBjDPF4HJdeeikee+wxDBkyJPD7aoivroKiUSlQ0zDUdCJyWtU8V845/v73v2Ps2LG47777sGbNmkB4u2mararQqI5EuQzzqL7UXn1L9+n87ke2cVCtbqSmTqgLAi0tLXjzzTfx0EMPYdOmTdhvv/3QrVu3VgKlavtORwhqaLRX/4hqj7QA1rlzZ5x66qk4+OCD8corr6CxsTFgj9D+akRLNrKlVBou5ehHmY6rbvOrHMGvaevxL+573DTduYuqqTkCRiwOCYbVX3yJxYs+wP777oeeu/aELQV4zIQlHTiODcPgkFAqKSkOrmSA4NGRLgFNqQqvY5RPRaZKlwQo6JyKvQTWfi8GVb8oRCIxFvwuZ/5nbkUv9wUvXTHpWJAGgw3hlmoXEglmoNbhiDc7+P2td2HRK28Alg3mCFfjRKJiRHyixrh0Y2vYp43FYjjuuOM+W758+T2lahYaGq1QU1Mjm5ubA5M1kS60ilLsinFbR7hkUskvxOGj/OmoVSP1eEOGDMHdd9+N73znO60E68LnQKtaakiwhkZ7QXVi06VdvPrqq5g2bRpeffVV3wGmNhzWdIkiacu5CpouXLS97+nO3qZyJVxyrQ5H4rmUUkHtUBVwllKia9euuOSSS3DVVVehW7dukWlGOp1Io1L7TboqGoR169bhsssuw1NPPRWIsKWxlyJwKRWv3IRL+PzbgmQnGJ5grR9HwkMiu8IdF9RqK44XdeIwAFKCd++CCVdehm8ffywahQXbYBAcsIQDzkz/d/xrAuB4l8jBMormOlVAuFTzPFf0+Vf5FBDmO9SkGIFU1S8jSt9EAtJ2F9KYySEMdy62mltQn6hBjeCQW7bjjpt+hU/+s8hNIxIOOBhs4e3XToRLPmlE2VKKPF838AXtmWmUDBMnTpzy7rvvzguXdQ4bpqWIFGlvo7YUv68a9YwxmN6qCa08/fSnP8XMmTOx3377BcojhgUc1ZUnHcquUQlQV/uFojZPDu7y5csxYcIE3HTTTfjss89gmqZPFKrVudT9ycDNZtCXSpS70sacSjmHajfoozSvwqv2tJ10taSUaG5uxrx58/DHP/4RjDEMGjQoIGpOpavV+U9Doz3H4HDUVXiVlv52HAf19fUYPXo0Bg4ciLlz56KlpaVVpEsmh6TYqOVcxt+2csQ5/R6di7ry72+TYJzDEV7dFWXRy4x3grNjBxa+9TYEgEGDBrk6FgxgpgEJATDpV32RIceWeREw6QS5K92hL/c8VWwETdkjbIo8hGDBKJN8X8X8PGkJUSCLZKnr8dPfGNzy6GC+6DMVhWYAYoYBwSSMmAnbssDB0ImbqBMGNny+AtOn3YSvFi4CLAeG9zwd4cAwTUjOfIHd9kbY1ozSkooiYIQQ6N27N7Zv336TJlw0So7vf//7ctasWSNUx4gIAJUMCJfUrAbCJbJsYAl+X3Uk1ZXVwYMH4/HHH8eECRMQi8UCnVtN04jKGcy3fKKGRrknKvV9/fr1uPzyyzF58mR89NFHvkg0tVlq19Sm1TQk+n+6CJdSG/zhaJxK6VO6bxd+D8LVB8JkoGp0q5oWRP5xzrFt2zbMnTsXzz33HLp3747BgwcHUi002aJRCWQL2VxRBGDYaVBts0GDBmHs2LH49NNPsWzZskDkrWpfhMf4UovmpjtWMb+TV1l5lZiiUs5S+mkUQkpwg0NCQgIwyNZlDNIRrmfqOPj4vffx1epvMGjQINTX18OybaR8WBbpq6cTz/XPRxMubULotBfhUrQGTJH7sqhjKWQOYyyy/bo8DIN0HMQME07SQpwbiAuGrkYCC19+A9Nv/B80rPwGnBmA440pVI6euYLUjFVG+k1UeeiosS+8DQBGjBjx4bJly+4vYbPQ0AD22Wcf+fnnn7ciAfJ1ztI14lw7QrEkSin3C6cIkVOpRqM4juPnUjuOg5qaGlx66aWYNm0a6urqdMPSqGioYrjhz6KERKdPn4477rgDGzduzGo4lTttKFsp30onNcq/0lusKCOv6PuTzZDK5f7S2H300Ufjl7/8JY455phWVeUy6V2kE9/TpJpGpYzvjzzyCKZMmYKGhgafAFf7jrpYpP6/0h3qnM4hIq3C76PcW8n2iBlI6TqaId0bDgbpkTK9DhiAS669Cv0O2BdbWnaAd4rDcmwIBnBmuilE3pghMgh2AsVXKYrSnoga89TPogg2PVaVhzAp9vnmWu0qrb8l3ApEqg9DaWzqYgUzXJ/Psiy/KIqwHSQM0yUdbQtdaztj+4bN+NOMh/DOnJeBpiQgJJgAJA/2J0rZ42gfGZdM8364LxDUAINQGj0rMQ+nsbNjl112kY2NjX6ObzKZ9Mu/lptwqVSyhb4bFgylFSfbtgPpFlJKDBkyBHfeeSeOP/54rQOgUfkGRQ4VWai/zJo1CzfccAM+/vjjAPmYq0HYFmHk1dTf2iasvroJl3LfT9J9IS0LzjlGjhyJadOm4aCDDgq0J4qUIYc0W3/RToxGpfQLx3Hw9ddfY9y4cXjjjTcCxQ/8nu61Z9IzsW275BoulUK6CMXpJAImijQ1TRPCdgAhAc7ggAEcMHp0wU+mXInDvncs1jdsAa/rBAEJ4aQcMoquyUiGFanhUgjhUs1zpiZc8oPJUxVTOefgMhWRT1qcauo3tRPDMCCFgNPUgi6d6mA4Nl6f8xKe/uNMNK5YBdgCjJuA45VM9nOXWIroqUCyJWq7SjBT9LVhGGhpaUHfvn2xcuXKVk9RpxRpFISrr776+HfeeefzlpaWwISrrm7nO/hnU9avHmcFraJ9iAWla1NDcy+55BL8+c9/xgEHHKAnMo2qQNQKfdgQ/+ijjzBu3DjcfvvtWL9+fWBsyJY33dZ9oFr6XNuJCRb7O9U3hkXNW+mqEFC7N03TN7iWLl2KmTNnYs2aNTjkkENQU1MTqLJFZItaVS78W7rKnEYljfGcc3Tp0gXjx49HfX09Xn75Zd++oQgvSveMxWL+Sne1j8eqbgXU9AZf24ISKrz/Se8zb7vwHFIhPeFtL81CNiWx4M23EYvFMGzYMCSTSc9+lpBSgJvcS1/KXO1Mlvn+kh/M4Zb6VQvZcK/8L/evXQb+LsWr2kVnUYKUoGJehdoTftlxRwCMwTANX59IIqVhZHAOy7JgGq7eCmeAISWkbSMuGboYcXyy6APcf+udeGXWX5DcuBUQDAZnEJYFbjA/bUhSg5apZZpKf/xqyWs1LZMWYEaOHPm7999//x/VbxVptDtOPfXUT//xj398i0JMY7GY20lt2xd+rcQVjlydlXTq0/mev6oRQJoAZIw4joO99toL9957L0455ZTI8qIaGtXgnIbb7vbt23HDDTfggQceQEtLi/99zjkMw8hqlEelYGjCpa0rN3T8CJdM2lzhMtG0TRUZDYvu0hzIGEOvXr1w1VVX4corr/SrmKj9QO0zUSK+GhqV0jfUPrFs2TJMnDgRr7/+eqAdU5+g6OZyj1XlHq998VrlMpjMrgHjpxSa7jxnxmMQtuMSEpzDFhLS5EDcwPdGnYpzJl4IURND0rHRLB3YcFfKpcgcwV3KCJd0hEv4mqIiecqVWiSq3DOtdMIoXdtiHpnmBlm5dIiUbpQW5xwQ7t+GR65x4cCUXrlnMwbpCHz58ad4ZuYTWP7OQqDZAiwHcACTudWHKDKMqn5F3bO2jnDJtaKhep+iqsUqxHNkC9ARLhp54bDDDpMvv/xy93AjI6OTSJdiJ9xiq1AUQpikC+ku9FqooorqbJJhcsIJJ2D27Nk4/PDDWxnbmnDRqAZQVAutckop8dRTT+HMM8/Eiy++CMuyACAg/Jxr29YRLu1JtgA7Q4RLNv2gsDGlfk7poWplEpVQb25uxosvvogXX3wRffv2xYABAwJC0CrhqLUQNCqxb4TFoznn2HXXXXHOOedgl112wWuvvRYIqVfJyWofryMjBbzVfTfixd3KEYosYCltF8454KXQOnAdTIMzSClgCo7PFi/B1998g4OHHgwzEQczuO+IpruNpapSlDVlH+nFidNF5pUyFX6nj3CRRUa4SIlA+aDQK/1+gAEGU7plyZlk/lxFekWmYYIJB9KyUGPEUG/EYbTYeH/eAjx6/+/x7KOPY+PnK1yyRQAGuFtMWkoISH+xgqnXyYR3Yu4JMrRvUZRcQPclXMxk8ODBWLNmzU3VaRVpVAz69esnv/7664A4EIFCpQvJ4U3HnBfTcfIlTKJC64oxHshQCZ+HaZqYOnUqrr/+ej8ySBMsGtUI0iICgK+++gqTJk3C3Llz/f5PBCORMhRymamtR/X/nT3CRbZLicSdQ8Mll8puUZ9TzjYRLWExdJWMMU0TP/7xj3HLLbegZ8+eGeesKEJGQ6O9+kU4kpGEcm3bxvvvv4/zzz8fS5Ys8XUd1KpyVU24yKDj779TBIuXaqOOdiKCLBBCuESLYcCxbRjc032QDJIxgEv0P3Qofjr1GnTefVc0SRuCMwjJ0s6DUkpIXroI8qg5l8vc552wBkxJKnju5BEuxUZ4FGMzcAmYzACXgC1d1SLGvecqJJiQqI2ZiAmG9atW453X5uG1F+diw2dfuBduO4AAGHMJR3dOTInqWo4Ng3n2gfDOk7kpTKnIMt4mY1yh3w8vkof8YVYmHk5jZ0GPHj3kxo0bA+Uv1VVr6kyk6ZLLoJuuUkOxJf+iJoG2dmrCOc1CCOy333747W9/i+9+97sBwSkNjWrGrbfeiltuuQVbt271xwcS0JZSIh6PI5lMBiK80o0RmnCpBLJl5yFc0t1jdf4I/5+cTiIPSTyXol5o/Ff3cRwHe++9N+644w6MHDkSyWQSsVgskFZEv6PnBY1KQiZtvs2bN2PKlCl4+OGHkUgkYFlWZBnqahqvmaIlIQAIroyGRLgw5hMv0tMwCaREKJpmZjwlMkppSQYzYQvHJRa4ROd9+uLqG/8f9jxwADbtaAQzzMgYw1yrFBVa5dOP4hMy67xczLPJNq9pwqXI2Vfm5nule3ZO0obhte2YYaIukXCFdLc3oXHrNry/YAHemfcWPl6yFM6WbYAtXDrBSZGKNB9aTmphTthh/TKRIlkYU669vONHoUL54b/VRRbGGPbee298/vnnmnDRKByJREKSuJeagx6LxdDS0gLGmK/dkk9YaSkJl2IiVMpZdpYm3rPPPht33XUXevfuDSCldxMmaXSki0a14J133sGkSZPw3nvvBYxsImBprFAdSVVgO9eKZDtrWej2I1uqn3DJpSx0tnLM4cgX9fvqIgOt/APRlQsoJYP2P+ecc3D33Xdjl112CYjuasFcjUojWcJ2SpTWnJQSzzzzDC655BJs2rTJ7xMdmXBhnLtioWCBKDlwltJr8e4dpVEwxmByt3iCFIDpRThbwnbFHXp2xWVTp+C/jhmOLTsa4XAAkkPCASSHV0cXjEs4knlnxyPfGTNy2i5Dx2HMAIeAFAwszXYpncjjMyYBcH+7ZAJM8sh3CJZ5u+QQLP35l/e9VKRL+uvL9F7s+XMIv71kOh6XqefLmAHGpPf8GWpicUBIWM0t2LplC1Z+/iWWLn4fSxcvxZqvvgS2NrqVhogcEdLXaPGj+w1vUTlmuuSjlDCNoMaTZCLQp5mkubnMGk1FEi6qfhXN/5xzXHbZZWfefffdT2vCRSNvnHvuuY8+/vjj48LstmpE5tNYVcM1V2JBNYgzkTHFhIcVOuHTJErXQikTaipFr169MH36dJx33nkFV3HS0CjHhJOpL6lpDaqRTelC06ZNw7333ott27b5hCv1iVz6dxTBmq7EZj4Oc6Ua9KU+x3wj+MLnUWwEUaZntjMIEOezihu+11JK9O/fH7/5zW9wyimnZDxeOgFpPX9oVNIckkwmsW7dOlxyySX4xz/+4acYqXN2WXYDAAAgAElEQVQB2T9kO5qm6aebqnNOpvS+tiBciHRxHcLge9R3sp2nSj5FpidCQgoBGAzxXepx/qSJOOqkEbBMBseWkHDcstHMJUIkHEjBfAJGfWcw/O9Fbad3zkyfyKHjqceNwYSUjk+gqIQKOeaZHH8p3XQpjhTxIuD4xIL6edS7AM94/nSeDAYYl/47EVJSMP/v8P5hAqvVex7tK5P4bJhYUq/fYGbk5yz0HNM9H/X5qs/Rf3fgPjfBIKUDIVJ/gwkwwSAdG7Yt4DgWnKSD7dsbsGXLNuxoaMSGVauxYc06rFixAuvWrQOamgHp3TfpuESLkH4fYLJ1f8iFM1H1T8rZpwspeqL6neH+GxbOF0KgZ8+e2LBhQ8aL0LO2RiSOOuoouWDBggCBoE6I5XZoolYe0xEvpQgPyxe0eklho5Q+RCv6QgiccMIJmDFjBvr37x+o4KTDxTUqDWQEq21TzdmncnfLli3D2LFjsXjxYr/dh3P7c0kpzIVwKQdR0R6ES7kIoWJI5mLvb0cnXMp1DeHfnTBhAm655RZ07do1MoImTHiqjquGRnv2n/CKr5RuJMdDDz2EqVOnYsuWLX50jPr9cNodheTTHJLLmFRthGN47A0LcyeTSV/7JrZLHfoc8C1YJoN0hEvIOMKv6uJI4VaL8f4WSKU00TuHp4ehfE99t5NWYDuEK2hKmhom85xguGKpJAhM75wxV9sDiHzPNg9kWpARzGtPEedN7wbj/nWCM/966T0Ri2fcn76X/vhmxuszOPf/pvujbod0Io+r3u9ctkc9H/VdOgKOFJCOgC0cv4oQFSxg3t9SeqSe95lj2e5ntgOPjXFftu1qsEhXryWl3sx8QWjATamjVLoo8jHXAJVMEabtSbhks5vU8Yvm4quvvvqI2267bb4mXDTywr777is//fRTN3/Pc6jIyFNXKNrCmcnFsWgPwkXN4VfJKNu20blzZ0ybNg1XXHGFv111RnTqkEZ7Q9WYyOa8EZN/++2345e//CWam5shhEAikUBzc7PfximMOp+2HUW45NpXyx3lUqoxrK3PLZf7WApR8GomXNrL6QoTXUIIHHjggb62l0qmqBXu9JyhUS3tW0qJ5cuX4+KLL8brr7/uR7tQe1dtSGrrNMfkmo5ULWNMpqhN+r9aaMI0TbRYSSBmpLwzKYNli6QEDKP1Z9nuifp9df+od3Wsoc9ZQKQm1xsQvY8sWhU2eEwWJARAbSj8O7met2Dp2RZGBESm7aKw60kxUq23q+0g23VwTmxQ6zYkAZimu80nW5Rjem2JKQtnwvseC9te4dsrCyNcym07lCISOGr8ocXGvn37YuXKlVlPXltGGgF069ZNbt261TfwVANRLf+ab8cotEOVOrKlVA6QugLpOI4fvTJ06FA88MADOOyww7I6khoa7YVcVskpKmv16tW44IIL8MILL/grmWREq+lzqbm+9OVB0wm8VXIETHucWzpDoZznUqoqcx0N6viv3hc1HZWcy3g8jkmTJuHWW29FLBZLS0TquUSjUkmF8N8NDQ246667cPPNNwe0YGiuIAIxPG6UYqyqlD6SzmYl+1EdC2ic8KOClAiWcERGugiJbJEtOb8zBgGASRlIGDK8z7MpoKjXE/VMctZ5LPD80/1OzrpxorgFFQknJ4c96zwecX1qRFO4XdDfmUhLqjak/s2RIhAEJIyYCUeNfPEILR7u5yUyK6LGj0ogXNI9L3Xx3COQczphPXNr+IjH41IV+KMVB7XMc7YSmqUiWsrhyJTS6VDzkgE3H/niiy/Gr3/9a9TX10euZmqjWaNSoK6Yh8kXdWX9mWeewWWXXYZvvvnGb+dqm1arbdHKZbmc+6gIjfYkXSrV+SnUuG1rQmpnJlyEEBBCIB6P+8axbdsYPnw4ZsyYgcGDB0f2TT1/aFQKwiQKpcSomgxSSrz00ku48MIL8dVXX6GmpgZNTU2IxWKBVBpKoytVu660/hFeOFSjfGh8UIlW2sZd6dq0jrXqiJNgbxThEv4+pSilTa1hLONxMhE6dN7ZNNiy2SfFpASBZ9a9yhZFVaiQf8nmWpEqP57t+omACbx7zy9Q6lt190X0wghjboqW5dj+XJXOlkgbeSyL67OVQLhkI+tokZExhoEDB+LDDz/UhItGfmQLlapUJ1KVkVfDqHIJby41yVKMc1VOYc099tgDd911F0aNGtXq/tBkmiuzrqHRXlCdu2QyicmTJ+ORRx7xdZxs20bMq6xA44Ft24jH463aerlJl3QVzjTZ0trAL3Ss1YRL6Z9PeB4Ip+BJKdG9e3fcddddGDt2bKuIGN941ulFGhXSlmkuUNOqVd0/xhjWr1+PSZMm4emnnw7o3VFbVit9lKKsdCWNP5nmKUrNdRynVUW0KIcbQgKcwWA8UrulZJEuRVYOVCs9Rc1HmfYXSBE+aQkV77rSERJAcaWZiyVk8r1/gblb2ZRLZJNKtNH3c9YoUzRhVE0cuv/hKCU612xRzPmQLm2RVlQqv1GdjznnJC2R8wlr5bWdHNdcc81xb7/99pc02FNII63AUcNSwx5zEewrttNk6ni5CnKWE3RPRo4ciVmzZuGII45oVdoznJaVzsjW0GhPg5nEDkkE+pNPPsHIkSPx3HPPBVYuw/1PNZipTeer4xIuw7szOPKVEvGXjdAqJ3ZGQibK2aLUPMaYv+ptWRZmz56NlpYWHHfccf426muazNKopPas6tjRHEBOCYng1tXVYdSoUdhrr70wZ84cmKYZIF1UW6mjEb7hlCn6u1OnTn5kD9nV6n0k4oMZ3lxKURueQ0x/hwkGNULFj1RJ872o95JcMzzx3AJedI2ZzjPT9avnkO7l65akebGs/7Id331JIYP6K/4r/HvKeSH43Og6BWTW5xde9JIs9TNCStA/Qe3OOz61t8D+QkIKCQY3lYgznjrPbIRTgX21EiPTov6mOfm73/2u+Oyzz36ZT7/Q2Elx1llnzZk1a9b3o0gUdTJVVxxogsjmUKkMaClWW3NdxW6rkPouXbrgxhtvxOTJk/3fiBI4VJX41e9oaLQnokqUO46DmTNn4qqrrsKmTZsCIoaqmGHYuKbxIVwCsxBjNNe+Wq3RLaUmNMpBthRyfvk+g0onDUpRxShTWegobbRw5TsAOP300/HQQw+hW7dummjRqBioJIE6Hqvbw+kIRCx+8sknGD16NJYtWxZIQVLTVNuibHtbEi1R0Yfq/VNtbH/BzkslAmd+CpB0BJjB/VSjdJEOWTVOlEiJ8H4lGR9let2LbPsHiJUcU4oC14PsWmalWBDOp/0VoiGSy3ONjHgBghH2LHcSUH1+4XMP9FHTKFmES9QcWQkpRdnso/r6emzdujWvE9Uz+E6K73//+3Lu3Ll+dRHHcfzUAFWzRe0MpTSo8z1mOb6nOowqERKVGkGRP47j4PDDD8eMGTMwaNAgP/VKQ6MSncYosc6wkUyG8KWXXorf/e53fr9o63PNlMOrdVrSkxvVeG92VvIgnfhz1LxDBObAgQPx2GOP4eCDD271ffU+UjSa1njRqHQ0NDTg6quvxoMPPhio0qO261gshpaWFgDwFwc6WhWjrNdRoIYJ8+Ih0hXSobLOkLJ1gR24orHFVOIrVbRMMaK5sh2aQDZCJ6eS57K46y/kGbSKDpLRpIkadRMtFuy2KQ6W0cdLVw66WEKslLaQmvWhksf0G1ddddX377jjjn9rwkUjI4YOHSo//PDDQK5tJiO+XIRLPscrNeESjthR91VTIwD4pbEZY7jkkkvwv//7v6irq4uMWtHlOzUq2dmLqiTzzTff4Ec/+hFef/11v03nkjbYVoSLJlvaxsCIehaakCnf80o3r0ZFltbX12PGjBk466yzAqKkYVFdPf9oVAMoouuZZ57BxIkT0djYCMMw0NLS4ttbjuP4/yeBacuycmrjmnDJTrgIr8xvFOECyXOeH8pFtnQ0wiWfykylIFzyuQfh73GR5XsZCBeGoGhy1DwX5f8VW+Ww1NG+lPZIZK86v+6///746KOP8j5JreGyk2HvvfeWH3/8sR/REiYbogT62sNgLoWqdLYJP0zA0ERCxi5FrziOg169euGRRx7B1VdfjUQikZb51ClDGpUEmjDUCU0lWN955x2cfPLJ+OCDDwC4VYjaq/1Wci5vRyFbcjUIK/3+d4T2kUmjjNKLKPrStm3Mnj0btm3jO9/5jt+HwxVhwmkcGhqV2vallDjwwAMxZswYvPbaa1i1ahVqa2v9qBYS1wXgi/G2lYZgRYzvWTRMMmuxyMzbZRYNF8YixUmkLzjClM9C31PPv9gXULAGDWuHV0qPhWXYlvWSC7pu//qjDhbVtjJ8L21KEEsxK9wrFR21mSE3Wy5qW6X0XVrwoDGH/EHTNLF27dqCTlITLjsRevXqJdesWeM3agrjJOIlrLtSTQZxoexmmDBRnVEiXoYPH47nn38ew4cPb6Vno+pWhA1gDY32njDCKQaqoPPjjz+Oc845B6tXr1YV1yvCaWtPXZa26L/lzgHP9pvFRhDpCJjSnH+6cGu1v1If5pxj3rx5+OCDD3DiiSf6opvqd9tK9FhDo9ixiCKJu3btivHjx2Pbtm144403/KgWNZ2bBKbVAg4deYwIOM+R7yzLdplle4Z3FnSY080fWecNirgo4D3Cg8/z/CtjfC90jpWsvNfPMjyfjFwNC11juopWMlobJtNcl0/bKnfKOUW4qFpLVEnsnHPOeWTx4sV/K6hd6KF/50C3bt3k5s2bAbgMXVjMTCUY4vE4HMdpt8msHKlGYYRLEZLoJ6UREQF10UUX4d577/U7HwkcqqSLNnA1KtmwVUX6iBC84447cN1114XL28E0TX9yaevzrIR71VYOf64GRanuS6nvr46AKe45ZCNcKKWVVvbVOcswDBx55JGYNWsWdtttt4BT2tapgBoaxSBcYOBPf/oTJk2ahObm5sB2zrlf1aijCXSXZ/wrfLyXUoKH1uILiqZkxaUElYSwKrxlFjm+G0XdO1bkdJ3L/rmkJGW6r9kWbXKxYXJNN8rUp8thO9KYRL4x/eaee+6JlStXFty6tJe4E6Curk5u377dD1GmUE2VWCFCgaJeSlGloS2cgkI7G62YACmRYEqnMk0TdXV1uP3223HRRRe1quRCDmmYfFEdXA2NSjBkwxOZZVmYPHkyHnjggQABQySsmoLUls5nexMuHUknpi1EhzXhUhrCJR0JQ+Q+lVhXU1VphX/AgAGYPXs2Bg8e7B8rrOmioVHp/UCNGgaA999/HyNHjsTKlSsjixcUEoG5s9lkhRAuQVvB8B33cDWkfDRE2o8wKY7wYVIURhR5VYM4jLzvWynvn0q8lPJ36Llksy+ioi1zEc/Nh3App81Gmp3hhXUhRFEtU4tNdHDE43G5Y8cOf2WASBc1moNW0yidgBpbJU5eauWVYg1yx3FgWVagApFhGBg0aBCef/55XHDBBYHOphq9ZNSGVfM12aJRKQ4nsfNkoCaTSVxwwQV48MEH/TZPbVg1fKu9ZK86TqR7dXRHppDr3RnuT6X21aiwaqo6pPZPtXLC559/jhNOOAFvvfUWAATIGQ2NamnzJEpJbfzggw/G/PnzMXz4cACpxUCKvtwZNPKoSkzBLxQlm+I718LTgsnnVcg+4VfR11+K+1fEO4Rst3NXn1+pX/nMYbkQoIUWZyn3HGcYRiDSW0qJCy+88Iaij6uH/o6Jyy+//IyFCxd+SCSKGopJxIEaukwifbmkyLRFdEu5RR1pgqcqTWSsjh49Gk888QT233//QBUI1ZGh3w+vJEd9pqHRngYtOWANDQ0YNWoU/va3vwXyU8N6RBS11ZZtuJDykwWp2DM1BT4iwkCmcpsrgTiRqZISOZ1SVLUIlud9DYxl3v5R75Cle6bZnpcsICe/GiNw1GegGnzUN1WtNVoYaWxsxKxZszBw4EAMHDiwKq5dQyM8x6g6RIwxdO7cGWPHjsW6deuwYMGCwIJAoUUdqqlfsKLHl2Ltb54SyFVPiAR70fpzICWqy4q8AlbCe1jQO5PF7a/cgXzfS3rhZdK6SVdRMvz/dJEoUQsMlTxG/dd//Reee+6577V3v9aoQPzoRz/6+5NPPnmy2ujVzlGKklul7CBR5aiLqWNPnUVdCVHJEOpIRDLZto36+npMmzYNl19+ub/yr6FRqYhKcwPgr4qr7X/16tU444wz8OabbwbS4MJCuvn0L5W8jQovbf+yzsJ32n2ylAEsVO7S1xaUqXBPAUAodRHD+oPuNbkveEL9wvu/YXAIW8A0DSAUMZLuNjAlTFdICYB7RT05mFf+kyP6fkohMs/uUvmBNCcQXlnyjaRwzVCDg4NBMACOcI/HBMCYS1Z575J5kX+QEHbKOSLyj8bfgDHGWavziCxXGvHc0pE1leiEZUopypuQCy2czJgxAxdccEGrqkVhnQxdyUijWkgZKSV+//vfY/LkyX67J8IlFov5lYvU4gU0/3UU8qUj2Syluv9R9ofq32RaNMq0KFqq8VmjctpblKh8lK9IwQdqpVrOOfbYY4+idFs04dKBMWLECDlnzpxAVIZKvFRC6eJwXm6hpE8mkAhoLBYLhGJTZyKBQcuycMABB+D+++/HscceG6nLoqFR6aSLCiJgWlpa8PXXX+P000/HkiVLfFKmlE6XOqakM6balXCRMuR881aOOv0/TLiouc6B73tGvWXZkABM0x0zHCldbsOz9bkXmeII9/OUTpbjb3d/T7rchbd6KMABwwBUp6EVaSIBGqOY93lktQCPGSLiRX1J6TJFdMzA/ob3ueP+gFS+J1O/R1oB/jMWQQKFI2UAh6vAtTKMDJ5ze4l6fvQMRQUTLun6bSFzIRmF5GQCwM0334zrrruu1W+pcxqRshoa1TLPvf322xgzZgxWrlzpEyq0YEZjS1Q1Pk24dDzCpVxR5IWmt2hUH8Kkijp+EKFrGAY6deqExsbGkgcfaXQADBs2TL733ntpdRgqgXApZgDLZ1+V4VZTp+i6qWOdfPLJeOihh9C7d29/P022aFQj2aJGukgpsXz5cpx66qn45JNPAkKaYd2hUhmh6QyhtjRa6Lc4k160SBitCRd/XxZ8T3uNEjAYD0avuHUQ/XtLER7ci1ARQviEBTNNSClShIrBXbLDcdx303BJjZjhEi/xGGKJBOrq69GlW1fU1ndGt+7d0am2BrX1ndF5l3okamqQSCRc0kJIJAwTJkuJrNq2jZaWFiSbW2BZFpqamtDc3Ixt27Zh69ataGxoQENDA7Zt2wZ7RxOwwwJsx41kAQDhBAkX79g+EcNUQkbCME0IO1X9jiJgVMMmLBKrCvJRxJFQnk265xJFvlQy4ZLL3JZLOU3q75QSS9dy3XXX4Ve/+lWra9REi0a1INxWbdvG2rVrcckll+C5554LOExAMKqlvYo+aBROuGSLoM+0PVNUfD6R+XmXvdaoGNu3UNKFnrMqkkvH9zROSzpQ6FGng2CfffaRX331lV9lJ2oVuxQljIthftuKbFEdS1UBP1y5ZerUqbj55pt1OU2NqjVKKRQybKguWLAAo0aNwqpVq3yhQWr/mXLgcx0b2julKMogChhMFOHSyjmPJlNVh16mmRjV43OkQtjV8QVQIjWIUOHMI1WQIlkov9owgJgJXluDHj16YI9+fdGrd2/03G13dO7WBbvuuqtLstTWIt6pE+KdEjBiJpjhVkGwpYAjhX+dggFcAtzPcwo+VwOtI0yY910iYqymZjRu3IbtW7dhw7r1WLt6NVav+hprvvkG69ashbV1m3tsn4yR7o8K4V4Uc0kfCAHmtU9hO+qNBGc8SHQJ6VZ18OasKMIlikgJE2fVSrhkckjS9Z+wWLvqgF555ZW4/fbbA+1TnQM1NCodqog7zSnNzc247bbbcPPNN/tFH8KRm+kWFApx2DXah3DJdf4PV8PJZnsUK1WgUZntJ9991QhRzjni8bhfip5kJm688cYuN9544zZNuGgE0KNHD7lx48YAO5dOyKhYdrBQwqWtyRa1xDPnPFCBqXfv3rj77rsxZsyYyN/RE69GNWPBggU4/fTT8c033yAej/ui2LFYzCcXyTFrC0e0rYyZKMIltZFHkiz+e2i7ZCKlLydDuiksNKaScU9f4QzgBiCVCBZI9/P6OtR164q9B3wLe+7VD3vvNwC9+uyOLt26oqauDvFOCcDgPolCqy9EbtkylZpD5+H+n6Udy+hc6TgAYIbCaNXn7qYCGeBeVAqHS8jYySSaGxvQ1LAdK7/4EmtWrsJnyz/GV198iYbNWyC3NwGO5RIxhgkkLQAMzDAgHcd3/jlYsP3xlPZLOiIlbTutUA2XYlZI80k5isfjSCaTgWdM89ykSZNw3333BYTf9eKCRjUSL+FU7+effx7jxo3Dli1bWqUn5tKnNeFSOQ5zofZ9JsIlW3qQ1mip3rZTLOFCf6sFI6SUvvwEAEycOPGy3/3ud/eV3C7Qj7K6UV9fL5uamvzVbmo0UWJShLZe5cqnLGkpDFbfjvfSiIAUa3nYYYfhgQcewLBhw7IauRoalTwBkfOkGhmvvvoqxowZg3Xr1gVW/mKxGJLJpE/KZuv/+Ua6ZDJc28Kgaf0bIjjJeYQKB+BIj/xQSZdwqhETwb+FDH2fRFfgvnNP5wQSME3vMwD19ei/z97Yf+CB2PeA/bHn3nuha/fuSNTVQBocDgdsx4EthRuxIgRs4bjkGGQqigYsUvzNjwghoUCvqpFkqWgXBxJcApIzGEg55uFnGDBcmdeuhPu54RElHAKGAOKGCWYLSMeB02KhqaERq1d8jeXLlmLFF1/i46UfYfvGTUBzi6f5Ak9zhrmpSrJ1FQMJpHRkQivUYWKFZzFdKoFwKXX7D8+PhmEgmUwGNC2ITKXfP//88/Hwww/rAVOjKhG2VdWU+C+++AJnnHEGKI2+EPKknMUgNLITLsUuxEalpqargFMq/0L7Cu1LtpRiDg5HepMdLaXEmDFj/vLnP/95VFnsAv04qxexWEySIGwikfDJBVWlO2yct/WAUQjZUqqJWnVQhBAYO3Ys7r77bvTo0SNSS0BNOdIDqka1TESMMViWhXfeeQenn3461q9f7zrJip6LN16gpaUlrcZTqQzOUqQU5ZODH1UOWSoTHJOA4WvNSkikhFUleKj8EP0ZJFx8fRGKxODMjWwxSHPFAUwGs3cv7LlPfww97DDs9a0B6Nd/L9TV1UEyBma4Y0tTSzN4zISg+2TwlM4LAMY5bKTU8gEAjvAdDc7dlB0pZavqRRyA9KJfSPRXQPpETPj7UZEwkgGWkxobuRfhQ3sajEPYyVRVIilhwCUAGADpCAgriY1r1+Grz7/Ah4sWY+mixWhctRqwBZC0vQgg734q+jauNcRSQr/h5y5L6xhVK+FC/6eVfyJdSMtFnffHjx+P3/3ud/53tI6LRjXMbTTepYv4chwHzc3NmDBhAp5++mn/MxInLyfhsrNrxBRy/fmMg9kImWyVhsp1/3U0VPUQLpnaFNnGFJxA8+ipp566/G9/+9sB5boW3WqqEFOmTDnq9ttvf4MakbpqTSvfKkoRzVLIxJRPRyk14aKWzK2pqcH111+PKVOm+JEuqtGpCRaNapyE1AnkjTfewKhRo7Bp06ZWRKOa165WdUjXr4uNLmsLwiUjOPMFc1XCRT1mgHCJmBCZFIEoiUDEBANgemlCtZ2w6159MezwwzD4sEPQp++eqOnaFRZjcBiCDjBDQEsHjKoYicC9dyAh4QSeBRNBZztuxlLjvJCB0suAlz7Eop0Ydc4IzxGO47hOSywBR4mwod/3yTvTm2sgA1WIiAQwvKiaTmYMXABW4w6sW70GH723GIsW/AfLFy12U45sx6uUhFRUi0xvmlQj4VIO0oXIU/otNWotSr/i/PPPxx/+8Aet36JRlc5WlD4HtXXLsvDb3/4WU6dODYxDmnCpfsIl3X7tQbiUsqy1RvuQLaodRCQLbT/ttNMW/eUvfxlWzuvRrabKcNVVV534m9/85oV8O3yhA4SarpBu0iu2YxQriEt6LXQs0zR95nKPPfbAjBkzcPLJJ2tiRaNqCZWoSDXaNm/ePIwePRrr168POO65jAdR/Vt1wNP1zajSvuXKi86pTHDofLhpuGmWJBLrpARupZQAN1qr0zsCEhIGdwVpZYBs8dKQTA50rsWAwQNx+DFH4aBDDka3XXsiVtsJluNWAnIY4DDuRsGo9zU0fgrmitgK1vq5qASLTxyl0eXKRExEEkY53GOZxWBIFad2fJLIJ31kqpoTnYfJOQzGYTIOAwxNW7Zh6aLFePvVN7Dk3UWwN252j95ieaK7TqpctxL+S1FCUobKWUulSpTjBER524twSdeHSzV/ZtonKmd9/PjxeOihh1qRbGrahlrpTEOjGogYar9z5szB2WefjW3btkXag2oKbr4OWi42sHaKdTlljcogWNSxQY0UVm0+VcvwzDPPnPvUU0+NKPf16VGjinDeeef9/k9/+tOEXCeNqAGwELGhqBXvUjlXhe5LnYaYSjqOmhZ0xBFH4I9//CP22WefgBGpJ0yNaiJc1IkinA70xhtvYOTIkdi8ebMv/KWWiC2GcClkpbDUBlcuK2lRY5QUAgY3wAxXx0lNH3RXNbh/jX7pYoW49SNYGACDw9ilHoOGDcXw7xyLAw8ZirpuXYCYgWYriSYvvcZP9SHCJcJId5RKPOF7pqbvRE3OUYSLzDKpq2K0VH0p/B5VPptlIV6IMOIQAbLFd+ZlMMdeeAK/Bty0pjg3EJMMpgPs2LINyxcvwSv/fgnv/+ddYONml3RJ2q7uC2NK9IsE4xxSCJixGBzLdkkyL2LRX7HKo/mVYy7ItYpGsfNgppB7tR/TfZk0aRLuvffeyGsnskWTLhqVjnD6N70vX74co0aNwvLly/30IvX7auSzJlw04aLRcWqkibkAACAASURBVAkXNeLWUUT71egWKSXGjh37p8cee+y8trg+PWpUCUaPHv3W7NmzjyBmrpAyauUYWMthLOZ6PY7jIB6Pw7KsViHVZ599Nu677z507949cqLW0Kgm0iUQGeE5T/Pnz8fpp5+ODRs2BKK9YrEYLMsqyDEsZJwohcEVRejmE9kScGwl/ApBwv1SKsLDCyeJGSZsx9W84jQhm9zdz+QA42Ddu2LwsINx9Pe+gwOGHoTO3bsiCYFm24LkDEnbChAtRDQ4kJDcIxlE5nvbSuCPzjdLqDvL5b4oxIpPkMjW706IVuESYNJNd5JMBogXEUqzIg0XxqV/re4XKTzFI5eUaB8iY2LMcEtH2wKJeBxxM4YNa9fhg3fexRv/fAGff7gMsqHRvQov7cgwTDi2Dc54KorGUMhBzvKKcGkrwiVb/yrHHErjhDpHMsYwZcoU3HrrrYHUWvq/Jls0qo14IUeKsHXrVpx//vn461//6qfQ0nbqh/mWjU5X+Uaj8LlbQ9u15SRc1GIA1P8ppZsW7H/yk5/85P7775/RVteuZ9YqwA9+8IMt//znPweEJ5ZyEy6ZOkaxKt+l6Ex0LHI0KWT0F7/4Be677z7U1NS0ug41zExDo1Jh23bA8SGCkdr6okWLMHr0aKxZs8YdyL3vMsZyinAJ96Pweyn6ZiHjSkkmWu9lGiYM0xWn9Vf8jdSKZzyRgO04LqkQ4y7TsEsdDhh+OM6ceBHOnjAe3zv5B+jerw+chIEm6aBJ2HAMV+hWQCJmxsC91RLmOfx++hBLVdPJJlLMFBJFTUFiafaNOlqAYAlrHaglsL13KUNpU8pJcI9wob+Z8ruStT4HIzwuE/nCgtWg/PM0OJhpwBYOHAYIg8GSAon6Ouz9rX1w/IjjccRRwyFqEvhq3Rq3rLTBIW036sW9R8IrfsRTYcKeg8XQNim3+fartlwhp7nRtm3EYjHf+HzzzTeRSCRw9NFHB84rINKsoVHhTptq+6l9KhaLYcyYMWCM4eWXXw5EwqiR0W05HrT18TU0KrHPtlX7j6riSJ8TATtt2rQu06dPn9eW90D3+grHCSec4Lz00kucKhAlEglYlpW3Q1VISlGpdRlKHS6m5vZLKdGzZ0/ceeedGDdunO9UqQak6rBqaFQL8aKu0gkhsGLFCvzwhz/Exx9/7K9IE9FCVWyyreAh5Nzn4wiGI2+KnXDLsRrmkgkSDF50i3AjAznnqegfDrfKUMxAzZ574IRTf4gjjzsG3ffYDS1cotlKwjQMSMCv7hSPx9HS0uJHA6j3zeAcTAK2cAAuA9EgYXCZ3gB3o0aYXwWISliHyZUwKGIlE9KdU1jjxRDB8wGTkWk6vmguOTQ8JbKrXhOlFPl/e46PaZrgEr7eDuBWOao1DXAB1MTiaNragNde/DdeePY5bPziK1fnRUhP6yUljKweuxDioBykS3tpoIXTLSikmiJkhRB45JFHMG7cuFYrgTplQqManLeo6pLhzx977DFMmjQJyWQSlmUFxu187GZNuJTfptfYOciWqPZf6nYUTiGnrBDGGGpqatDY2NguHVDPqhWMI488Ur711lt+mTs1D7W9U4rKuW8uBl84VGzffffFQw89hOHDh7cS/Ixy7rRBqVHpiArvX79+PU466SQsXLjQFwQMs/m5GJSFEC7FpA6lm3ALFQvNen08tZrpiua65ZaFW7cYiJkAk+g79CCcctZoDD70UCR26YztdgssJuEYbhqMsFyi22BedSHpRhMR6d0qMoi0pOCkTeHJZXxmkrd+TgimCGUiUtL9Tq6EC1M+4BJgUNK1ws9VieoBE8F2pWrIUDvjDNJ2YCbigCOQTCYRi8XcCnJJy0uJawFkqtJRTDAwy8Hi/7yLvzw5CysWL3GJF6oBbnu/i2DFnvZ0htIRLqU2OKP6lkoGhqsXqZEATz75JEaOHKnnR42qnBtV7T76W3W2AODtt9/Gaaedho0bN/q6LrksSKTTB9sZCJeoRZWo9GZNuGgU4vu1xYIbgMDiI+cc/fr1+//sfXm8XEWV//dU3dv9kpd9gYQlwbAZA4RNUTQEgkRBogQQCKIMo4gBRcDRzE+cn7IMI6AoAyoMkxlHYVCURUQ0qAP8EIkCSiRsY4CENQKB7Hnd91ad3x/31u26t2/36+7XnbfVgfd5L+91992qTp3zrXO+X6xevbrfJp9bVQeoHXDAAbxixYoU4U+ew+ttsag1wJuRv2t2wcn7/GYTs0Z32pkZRx11FP793/8du+66a+77zOKc1+/rzNlADnjs3fqtW7fiIx/5CH7729+mWgDMa+w2pEZLphtNCNsNuLRj8a5XQWAC8IpMqIirWQRQ9DHzPe/Ch05ciD33fQfYlwgYCFmjHMa7oLGEtp2oaq2TSg27KiDP7wrEvgYEDU6+GwCiV04XrvZRLCgBbqrwJa6/sNe6+3mfFYEowgJfqj/JPh7l+Hwirgm4QFBSCeQJmSJoTip6BFfa4xiQIlI38jQgNfDsU8/gZz/6CZ568CGgJ4ieb6Cj11LU7tXfCVEzSkXtAlxsADAMQxSLRYRhmFR32qoNSimMHj0ay5Ytw8EHHwzf9wEgxe3izNlAtWwlW3btMqCjEALPP/88Fi5ciCeeeKLl6k8HuDjAxVl7AZdOjR+TN5sq2nK5jLlz5+L+++/v14nnAJcBaHvttRevWrUqWRh8308SB3sgNePY26FS1MgCVK+qpJXAsd51KaVw1lln4eqrr0axWGwI+GkWcHLmrL8DHhNcnnrqqbj11ltTjOvaAgZMS1GzfqGVHfjeFkyTpBtwoRMLdyN+iSEAX0ZkuCOKOOjw9+FDJy7Ebu/YG4EENpa2QRZ9hLoiIaqDEDIGsJKKQnN8WZHPNc8gCe6lgCdi/8yqCnBJqShRLwE4iyowpJ7PahfgUnn+okKKm/peTbDLzBBVQEJFLSi5fsoP2u3vkgTKYQDpC5TCIAIQY4AmutEaHgmMEB58Bbz4v8/izltuxSP/cz+wpQeQXqRuhPpKRY22FNQdj1R9DHvc11Io2h6Ai0lGTawgpUy4XLTWqQqBqVOnYtmyZZg1a1aqKsyZs8EAumTHq4mVs+3jGzduxDnnnIMbb7yxoXUyC+C3k39pKAAuAxls6W+OHmf1n0OnARc7V5ZS4otf/OL+X//611f09/1wo26A2W677carV6/eLkoBneijawZcqefQTfJjCEDtSh8AGDlyJC666CJ84QtfcGCKs0FnebvItTiTiAj/9E//hMsuuyxJ8jvB5t6uIIo4okcxabdN1Jqo+VgAhM0dkVR/MCIOFhEl/qw1YPxAGEKKuGJNMFhXaE5YG9JYGZ2IXwBGFvHueXOx4KMnYKcZ01EmRpl0RNaKiDjWVurJyjM3Wtljtw6R5rqtRDVJdOuAI9vbrzXTEpU3Zu3ryV5XrWsRRAA0OAasmKLKHhugIgYQKIyQPgoQKDDhtRdexs3/9UP86b77ga0lQBGkiMaKkZGmmGNHiKgCpuoZaq6JYFWAlIraiQYg4kokwyNj3qZJV4Fq9eZeo+tlKxww9cavAWVmzpyJ3/zmN5g6dWqStJoYxK4kcOurs8GS6GXBRwDo6enB9ddfjyVLlqSUu7I8RnY7rw2u521K1Pr3YEz4G2nD74R070Cz3q41VZXZSx6T/czBquK0PeW/UzFhhlss1Soe/93uYEjWZ62x88474+WXXx4wk82tnAPIpk6dyq+//npbVXSoAYnR/nKg9RyWsHaYzc+Gr2LixIn43ve+h+OPPz6VuBouABcQOhsMliX7M2M/O36vu+46LF68eFC1xdk7/0xIASn236WR6USFDyT1fkFQrCNuFNNCZVosk0S6ArZEHyoAzwNGjsShR8zFwkUnYYfpu2CLCqB9gbJWEe9Ixg+xRU5LmusG8b35OV2jssck5PUAFwwg0KXTAW0tE6wBihqDOFYxsk2SAAIFnwRIaRRZYIRXwP8+8wx+8dPb8ehdywDF0TgohwAjAVwisISTqo/kmIgqbCAIoQ5yxzIgUpU6aBFw6a1KtJ5sZl8AF9vH2C0XWmsceuihuOuuuzBu3Liqdo1WiYidOetPs4US7Nby+++/H6eccgpee+01FAoFlMtlAEht8qVbJCklKZ1VPnGAy/ACXJoVH8kbRw5wqX//DWhiABUzn+2/mVjYFpUw5zZ//vzysmXLigNqXDmXPDBswoQJ/OabbyZKGo32mbYj4K1Vqt9p51kPcLEDPK01CoUCgiDAzJkzccstt2DWrFmp4NMGXvLIRp05Gyzgiz0ffvWrX+HUU0/F+vXrAQCFQqEp2edGEr5q/o2+BwRcgxskC7hU+QNDwCqiRJCVruxsxIo4TBQRq/b0RKBLdAOjspqCD0jgXR86GgtO+ih2fdtuKGuFHg7BMmrTKasQHomWfFmj96VWq05fAZehBLrUuxYRo2cGrCOi1D1lZhSkBx0qkNLwOFKJkiTgQ+ClVatw/TXfwUuPPQ6EDAQaggR0GCVgZpz5vo9yqQRPehAgBGEAKSSYdH6QZHHrRGNc5AKN9vvbCbi0svbWawc0oJM5n0WLFuHGG29MBbkObHE2WNdT87NJ0srlMgqFApgZa9aswUc+8hGsXLkyWXtNNYvNhZZNktuxITpYAZd2VcEPdA6YRs6vWY6bwb5ub0/AxcxHU21mV7mY45uNePv1ANDd3d1vKkS9mctKB4CNHj2aN2zYkCDxzXAxNOrQs3rk7Z78rYAt2YUs+2/DJm92J4477jjcfvvtmDZtWgqYsUkATUWMM2eDYQHLklzapfsrV67EKaecgtdffx1SytR8aHeim1U06VOwCwYb3hMDHpg5npPE6li+2VS32CSrDIAEgQRFbUWICFTDcjkCWzg+QkECnsCMg2bjs/90Id5/wkKMmDweW3SQtA/BlxGfSNymZGSIyZxPfLy2PNsc/hUigkB9fgxq8fkN5LHd0nUQJzfDtCMZHphkvpQDgKLKlVBHFSWKGGWtMGHHSTj8qCOx6x57YNWa1ejZuAGsFMjzwFql1ysdjwkdly+TSJATSgAgM04o1SZFoPRDqwymlp9jFvzsCxBT6xhGSt5u0xVC4IknngAAzJs3LxXMtivRdOZseyXMdhueGcO2ktH48ePx8Y9/HCtWrMAzzzyTGuv268zc2578Rv09zzpx/MEEPjQjSpKXxwy29Xqgjc+K2EF6vbJ/Z3Ocmn/PmTMHq1atGrA3262eAwBs2bJlSyI1mjew2jEpGnF226OqJS94zEOI7fYJrTXOPfdcfOMb30gmV/YzjEKLCwidDSazq7Hs8bx582Ycdthh+POf/5wa12Y3uh2AbLbCxQ5M++ILoqoEqmTKzEnLhU0qmgInNKeSaTZkLGZLIOrRiaSHNUNKP0oWY+WhcW+bhtPO+iQOmfs+9ADYSgo9MemqfSwVhEl1RJ6n0L1cd6sVLrAS90YWZG7g+Q10wKWVc01eW6dCxB67Ipb6NhwzRrqbWMMngSJJFBRw909ux0/+60bwmxtA5IGDECOKXdi2bVuFSykGXoIwgJCUDpDiyhaRAgrtsSzSHDXQTc/DegljbzFBozww2Z/tqlBT8RMEAX70ox/h5JNPdvwtzgal5YEjQRAp0NncLubnxYsX44YbbkChUECpVMqNMben/+2vedap9qFmSfcHCqDQl/Or15Y1GK0/OFxMDmha/bLHNuvilClTsHbt2gF/c12FSz9ad3c3b9u2rfIw4naiLAFQOxx2tsKlv4On3hBiU63ieR6uvfZafOUrX0kC7DzJXPPdfq8zZwN98bLHqSl5llLi9NNPx29/+9ukYsu8vlAotIU0t5Z/aDUoSJ0PoaJaA1SBLeY1TDExLlEVwCDsH3SMQNgBDAjwBOTY0fjwxxfh/H/6R0zde3dsBWOLDqAIkL4HEpRqwSr4haRaAbAKKZJftGcHsxZ/R2+fTL0E+gMlYG8WUGlWVU8LrrQT5QFXpgUgJr/luNIl4nwhMEVtaSUVAlJg3/1nY/7RH8S6jRvx4rOrACKEQQDP9xEqBbCpWomImTkLe1G6ssU8q+Tf5rzjcxZoXSXDrv7sVBJnr5tms6JYLKJcLoOIcN9992H+/PmYOnVqkpja6kbOnA309dXmKjJJW1a9y3wde+yxmDhxIn7+85+n1ldTdb69Y+eBUOHSKbBlMAAPja5peTw/A/3ZDpbxmUeca3Jjc6+7urpw5plnfu6+++770KC4b84194+NGTOGt27dCqVUshAYZR6TdLVjQtSSoGyWeK8ZZ9rse/MqXZgZO++8M/7zP/8T73//+1OkSPaOm1FTsMnRnDkbLGYnM2b8XnLJJfjqV7+aLC52cqS1HpCl/b3JQ+cBEolkNFnVK8YHMEMIitVkDIojomqZog8mwsx3HogzzjkbO+85AxvCHmzlECAB4Xtg1inCNY9i4m2jdqYzilCmjQmRYpHg2kF8I36vVoWLIePtjcNFD8Idsd54wRqeE4RUKZD9TvNrO2mCjMnyLDDeSFULBlhp+EwoksQI4eGZFSvx3Su/hTdXvxgR65ZDeNKDViqSWS/U3vCoAg4z4znhbebe71U9DpdsVQm3qfIqr6rN9/1k99D4HK01Zs+ejfvuuw/jxo1z1S3OBp3ZVc+1eIiyXC933nknFi1alICLJtnLEnU2olY0GAGX3vha2sUvNRw4XOpVhAxGX7q9OVxMTmcDLlrrRDxl/vz5G375y1+OG1RAlXPL299GjRrFmzdvTvpEtdYoFotg5oT81e6t7rTD7gtpbqdaig488ED893//N/bcc8/k9zaokqfs0pt0pjNnA3kxIyLcddddifqWrSBixrkBaAeSLHRuQMVZOtF0C0ZCgJsBWmxgQogIANGSAIXoAz2B4qQJ+Pinz8TcD7wfZU9isyoDBQ8Ba4TxgkzMgNLpstQ4mayZ6NYIOFsJNHQN0uBGSXP1ECLbqwfI5F1bFnCx70uiApRRJUhIMVWYVKgYRSsJAiuNgpCQGiiShBcy7vzRT3DbD/87kpEOQkADIt78QE5LkKgDuqSkz+sAjY0CL3nBe28gTTNz1fO8pMUiyxln86KdeOKJuPnmm1Pn4Eh0nQ10yxuj2eqsPB+ktcZf/vIXHHXUUdi0aVPSXmSvxb2pEw1VwKWV6+tN5WcwqxT1tmFc73Mc4NL7sUyuZ29K+r6P9773vbjvvvsGZVDkstLtbKNHj+ZNmzYljr9ZieZ6u4jNvK5VaehaDrkeyGGqdrLOyt5ZsyfW8ccfj6VLl6K7uzvpMbdRTmfOhqKtXr0ac+bMwcsvvzxox7lRIqoFtmQBl6TsOwwhKGqfUpZULwkBDQ14AvAIB35gPk7/zJkYNWkiytAIWEOJqMVI2/LTlJGm5nTVSquKao34OwMa1JKFboQ0l4fJmK91LxSpqr9TXLGSBfaqnhXF9x9IqlwMSCLi9xSEhKeAja+9gWuuvArP/eERgDxAaUAxiBgUb4bYUrEJ4K/0gJ1/vYE62c2ObAuT/XetNS6//HJ86UtfSoExNiiTl8w6czbY1+IFCxbgqaeeSikX2RXptmyt2QSxpafz/Fej605vCXm9KvXe2hWbySOy590O0GUwySL3F4fPQF5PGgFc7FzNlm+2N8uzr7HFT5J4yYqD58yZg/vvv39Q33gHuGxnsGXbtm0plLxV4KMZnfjeAJdmnF8zwIwt3WWXZBpiPqAic2vuyeLFi3HVVVcl/Xr2hHMVLM6G2mJmxrNSCh/60Idwzz33wPf9jsvCd3JxzgIuaXLRdNBlL7wCBKVVJN/LGsL3oFQIeISuqTvgE585E++Z/34EEtimNXTM76GZo4OIWDpYxKS7VkJea7fOBkJqAR6tgDMsyAEufQFdeiHNzQIuKXCNACXS91vo9BhkpeFLiQIECgq45/af4+bvXg+UQiBQgFKQnldpXWJUrWWDKUBuJRmyeSzuueceHHnkkVVJSB7Q4tZnZ0PB3nzzTSxcuBC///3vq6Rps7GoiW3tirHsPGgn0NAKZUCrgEu7fdJgAlxaBcSGA+DSG4l7ntqePXeya4yp4DZ5XxAEGDFiBI488siX77rrrl2GRKzj3Or2se7ubt6yZUsy0OrxjTTijDoFqNSbTM0qIRiz+8KNmV0C87tisYiLLroIX/ziF3NBFvuzXaWLs8FupnXQmOFtSRLzQTi+UyWnmQQ4BbYYEERreNJLcTERERRrKBIAK2BkEW9/zzvx6QvOxYSdp2BDTw+0JyxwJ9GQTtqPEpWjPKCF8s81C7joPrRKAnCASx+DV5HTssN13m+TIEfjLQ3YCG0FfTEoF4YhBCJul5Essfa5Nfjuld/CSyufApEEAgUOFaQQEOA0f0PVKevM8xP9OgebKfnOHadWDz0A7Lrrrli+fDmmTJlSueIM/4Vbk50NpUSTmREEAT75yU/ipptuSlEA2Ali9mfz905uEDarQNos4FJLxbDPhPqDDHDJO9fhBCb3hTLCJp/OikTYnCz25pupIpswYQJOOumkC6677rpvDaX76WpAt4ONHTuWN23aBM/zEn6WeuW3dql9rd20PPSwHU6hnZLR0uJMMGWX2UWLmTFhwgT827/9G84666yqoC1Pzcjtnjkb7GYnKvfeey/OOuusJKAZ6KX5tXbVcoEDSifLRrUImuF7PrQKQSSS14Y6BEuK5J7HjcJpZ5+Fvz/3bNCoLmzRIbQQCLQCBMWfVR0QaTBE3NpE1jETxRuqRjkSMlaOlZP6GpzU4WhpBHAZbpZaz+IvoyZV87mlPyCjNpUG1Mg+DgEsBTQzKP4uhMDoMWNw+JFHIBCEv65cCWgF+B44DEEEeNIDtIb0PLDmzPlw5vnRgLmfzb42r8plw4YNePbZZ3HiiScmvqtcLqdUXIw/c+CLs6Hgj8w4PuGEE6CUwv33318FyGSTxXotN31RAWx0fjerBteMT+j0uQ/UNanWvXDWe+5nfrbBl+xme1LhLARmz56NV199lbZt23bRI488snzI3Rc3NDoPtmzYsAGFQgFaa4RhCN/32+602ukUGqmOaaRX1JRY2p8bhiGKxWJC2rfLLrvg1ltvxdFHH53qDbc/34Eszoaamd2wnp4eLFiwAOvWrUsBMQMVaGnUR1AO2JICXBiA1tCIqklYxFUJAkBBYMKsvbHksktx0Nz3YVNYRgmMIL5nkkQln46lpSsfTCmQxf6K+Ds49d4EAOMK/0wruXLVPXCAS+sBrj1OYFVH5dwcw9sDq8rFBlyqCG4FQQkkXAyCIzJlpRXKYQDq8rHvgQdg+u4zsOLJJ6E2bQI8D8yAVmlJWZhKGmJUn+LABVwa3cAxFWcGVHnyyScxceJEHHzwwQAA3/dTrUXGfzmwxdlQMDOWiQhz5szBjjvuiF/96ldJwmjmig202PFqJ7k/6lVeNFKJ0iwwk13v25VfDIb1aLCef3/GidlWO3us2nwtzIyddtoJp5xyypcfeeSR97/66qsXDekYxw2Pztm4ceN4/fr1CU+JrS7SSXbnRkGTlhKJBl9rB6Y2EVKhUEAQBGBm7Lfffrj55pvx9re/vao0udZOgesPdzaUFqbFixdj6dKlyVyRUlaphgw0sKVWwJfNd1OAC0UgC8V/kySi6hYhoQWgWQEeAQUPB31gPs4497PoGjcaJRWipEOoGLxN+K/iFiIigkLFp8qklSNTcRDLMdvyz7aSEGlOzs1+Tas+0rUU9SHRIUqeVzLWajwTneEFSlqRSFcBLsl4FNE86+npQZdfiLiDlIIkAcUakoERWuCNl17Fty67HK//7yqgJwSxgGQdEeYKc05priCqDICctqPtN09bWf/t9xqi+2yLxMiRI7F8+XLss88+CIKgLZtHzpwNRMur1LrjjjuwaNEi9PT0JO0PJt6118VGuBX7Ayxo1j/kKaQ1G4O7lqLBHaO28lrDQ1hLFXLixImYM2fOE3fcccc+w8mnuMy1QzZmzJiEIFcphWKxiFKplELNWyUkamTgby/ApV4FjK3ukEU8Dz/8cNx8883YcccdG+4PdUpFzoaS/fjHP8bHPvaxVCtRuVxGoVDosyx8fy68dgJqFGOygIvhb9FgKGLAAzB2FBZ9+pOYf9xHsFUAPbrSehlyujUR1v0x56YzXDEGaBFcvdC1Arg0KotIRE6lqN2BSS9rg85UK4FiuWhGLvBhK+yUwiAlk+yRgApCFEmCN/fgB9+5Hg/ffQ+gCAgCeCDo5AlF5M2JEtIABFx6m8dZQkOTQNocLrbSxPve9z785je/ScAWu0XatRM5GyqJJhEloKI9rx5++GEsXLgQL7/8ckIRYN5jbxbmza92cbrkKYt1AnDpROzQDsClr+/vNGjSKJdOf51fo8dvh6CKGac777wz5s+ff9nSpUsvHK5+xbUUdcDGjh3LGzduTByL2Zm1uRl6K/ltRX6tHZO1L8dNJRZWVYtJJs3vTj31VNx8882YMGFC7gKURdSz5c6uwsXZYLeXX34ZCxcuxKZNmxIA1gR3BqQcDGBLzRYcipJetglNkVYNYgFoEf1h9Izp+NIlX8O75s7BNqHRo0LAk2AAoVIQDAhPVs5HxMk0c9Kmw4jai1KBrXV6OdQtET+ItqphGgBb6gWNKWLWWrfFtRS1P4ClzD2kuD1MUALIpOhdOBpXzAwv3o2TngciQjkMQUUfgVYoFAp4z6GHonvsWKx8/HFAhdBagWHGNYGsaqpUSxE1ME/66X41wgFn4pXsBtGaNWtQLBZx2GGHVYEzNnmoM2eD3d+YdiETd4ZhiF122QULFy7Evffei7Vr19YEMPLacdrFhVKPQqAdLUXZOLudleUDIbZp9Bxave6BDui0+/yzx/M8D1OnTsURRxzx7DPPPDORmS/auHHjRX/+85//Z1j7Feda2w+2mCRqICVG7f6MbOuP3UKUtxNs/n722Wfj29/+titFdjakzZZ+N/PAnjMnnXQSWjKN8AAAIABJREFUbrvttmRxCoIg1fvd3yW3qTYM5iShFWbJ0DFRIFGV7LNRiSEBcBgVJ7AChAAEJDQ4eo8vAQ/Ye877sPgL52HEhLEoQyOkatrabKVCrfujkC/33Lyf41TVRLt8rexlyW1bhQvp/g3IuLPrX7MBYd7rq4B+QSAdSXrrGLgTWkEqxkjhY9WKJ3D9N76NTS+8HCE4pRIIVOlHVxVeh+T+x/dBoCKPXg8wMupGhL7JwnfCf9if6Xkefve73+Gggw5KfJoDWZwNJ1u/fj0WLFiABx98MJkfpgXPxLwmDjCtwr2BJe32j7XagLKtQu2OOcxnmpjH5u2w+W9szsa88+okkNJfgIm57k4eP08hKEv5kHcf7HyuXmucPb6FEBg1ahSmT5+OAw444IYf/OAHn3bewQEuHbfx48fzhg0b+q0KY3uW6RmnYXYATDWLYae2uVvMQnThhRfioosuchUqzoadmbL7MAzx/e9/H5/+9KdT1W926f6A2AFqAHDJJpJMkUJQgnIwQDLKPYkNSRoh1AooFgAPOOpjp+Kjf3caQk8gEFHSq8AQimsmpvXaGNvl6zRxn97vAJftl3y3U5kjaSXQEaluqMqQIHgQ6ILAWy+txXeuuAovPfIYAAmUy5BCwhMymedCCCgOY3JokRKI1pmxXAUkDhLAhZlxwAEH4MEHH8SIESNykyxnzoaqMTPCMIRSCqeffjp++tOfpkADIQTCMEShUEC5XAYQ8VqYjZVOJ/i9cqx1GHAx129aruyKdztZz55rrYr3vM/P80nbe02p9fp2g1e1rr/Wa/IqcvPU52pVZuX9XCgUMHr0aIwaNQp77rkn9tprr8Xf/e53r3PewAEu290mTJjAGzZsqOqtHKqAi3GWtsSXjWDbJZm+7+PrX/86Pve5zznSW2fDwkzSkSWOfvHFF3HIIYfgtddeS4Ixw+tkAhJbBWGgAS7EmQWZM5UtXGEpNbNckkAYausXAE2agDPO+Qzed/QHUBaMQFDS4mFLCmb9U16rTjM94o34OGbuFXBp1YYK4NJ7YCF7PX5fW1+bLc9v+HXxmA2CANL3UA4CCAlIJnSRhOgJ8P1rrsPyu34FaAKVQkgwlFbwpIdQK5CMK1vixyAswMWeL9SPhWzNjoFsckNEuPDCC3HJJZc4h+9s2AEudhXJZz/7WVx33XUp0NHEv2bD0QYgOg24NOMLO1nhYoMvo0aNwuzZs7FlyxYUCoXUWm3aF4MgSFVXGLVTm4CVmREEQSUmyHwBQBiGvSqs1vt7M/FX3rOz6SNaec69ASi14qM8kCXvq6urKxmXvu+jWCxi5MiR6O7u3lAsFl+aMGHCL0aPHv3w1Vdf/VM32x3gMqBshx124DfeeCNV9TEYAqi+vNdebMw1J3KZllMbM2YMli5dihNOOCHZ5Xc7YM6Gq33wgx/EsmXLEhZ3szgbuXgTWPT7wlAHcMkDNTSyiz1DCkArQGuTxQIQAqOn7YTP/59/xJ4H7octKkQoCUpXdl5YawjLh6YSPWrNbzUKtCTXM8gBF0Y/ky43UeHSTonRRjjI6v2NmSGIIHWUKGwrl+AXC1AcJkpGXcLDSEW486ZbcMd//AAoK1AYJnLlGjnzhdPjNzuOBwPwktcqLKXEo48+in322cdtpDgbdqCLkZcHgEsvvRQXX3wxlFK5VauNVJ1sb7Clr3lDI/7Crlq54IILDv/GN75xvxs9zoajOdLcPtrEiRN53bp1yS62lHLQBR6tOFx7Qcn2dpvf7bDDDrjllltwzDHHNEUa7MzZUAnITLChtcYNN9yAa6+9tpLYWZUtBmSx2/T6F3GJvpKgCWl0nsn6ZV7yyABrQAqCkCJqkJACu8zeF//nXy7BrjP3xlvlHpSgoQEIquwA1qpwsRGJevcnu/vYig/slMKMaBBwacPoQ/8PoNaTgL68vpHPqsvpEkuOs4qAP80aQniAkAg5jJS1mDH7gP2x40474dFHHwVKAUj6gFIJGXNqHlF6ziSKRpnX9ceq2MpabJemv/DCCzj55JN7JeJ15mwomdY6qVghIsyZMwc77bQTfv7zn6eUBs0636hKUTvmTqPH6HTFuRHLMNUpy5cv/7vzzz9/+UMPPfSsG0HOHODirCmwZf369QnwYJKnAZEwdRBsqfU+WxpyxowZuO2223DooYcmf7N7Np05G+rBmCmllVImScnWrVtT1V1mh8y0EQ2auUHVgZ0ti0sECEFQiqEFAwUf+x12KP7h4v+LrsnjsaHcAyUJIgaoWTN83084n1rN41vxZ3nvcYDL9gVc+pr42+1FrQIu5vcMwPc8MOINBCKw1jEnEYGEAKRAEIbYfY89sOfb98Yjj/4J4aZN0GYd5Ggy6PhJmC9bqSvvNvXX7G/23ttr/apVq/C2t70Ns2fPbpvsrTNnA93seN/4nX333RcHHXQQfvKTn6Tkos2csIGXdvvCZt7faXDU3kCy5bJj0OW0iy+++LJ7771Xu1HkbDiZWxVbtKlTp/LatWtTDP0m+Ku7QzvAwJNWAZdsW5CUMiEEmz17Nn74wx9in332SXat673XmbOhZnb7HAAsWrQIt9xyS5KoZEuMbf6WMAz7fX4kgIOucLXYv88j3EvxuwiCZg0q+GAJHHzkPJy95ALQmJF4q7QVslCEAkOVQ3QViknvNkQkvZkHTNTicGnGl9Uji0v5KNdS1McTaH78tgtwscdnb8fLVkNlf9ZaQ8ZzkYigzXzVATwhIRkY7XfhuT+vxJVfuxSl19YBPQFELFuuMhVgUkdzyZBNm8oXjeh3A7m1KI/Dxfd9lMtlTJ06FStWrMD48eOr1ntnzoaiZf2FrdT1wAMP4Nhjj8XGjRtTG7K1lIraDbj0dt52dXoniHPN/TDxjLmmzGaTyz+dDStzWW8LNmXKFH711VeTUkGTRNnlc4Nx8Wi1tUhrnZRVHnbYYbjrrruwzz77JA7XgS3OhpvZ7XN33XUX7rjjjipp6DAMU+TTRsVgoCQsef4gy0mRBG2cBms0a8AXYA+Yd8JH8LmvLEGpILAp6AFLwrZyKVEvKJVK8GJwygBVjSaDWbK8Zq9nsFQiDpcEphWQJgue5clgtnIuUsoINLVBUWZopVAoFBCoECEYG0pbMX3W3vjK5Zdi5M47AgUJTTlVUpwOugbaKthMkmfue7lcBhHh1VdfxZe+9CV4nufmlLNhYXa7cNYPzZkzBw8++CCmTZuW+CRT7bq9OR5721zo1DENr6Pv+0nMYype4nzBOQpnw8tnuFvQnJnKFnuneiAE781yFTRy3iZBtFnETUJkHKlJGJkZCxYswNKlSzFx4kQ3UJwNeTNjP7tbZLcVlstlHHLIIVixYkVb24baTXxXi8MkD2CJXqABEilFBnNOChqQEih6+MjffwLHnXYKtgogEIiqWuL7I4jAOn9B4l7Oq9Hrbv2+NPa5tZ6lrvGIBdd/lsn1WypDnZL4rddW08imQd1x3EdZ6E6X1LfyOWQ9iwpJPEOAoMsBRhdH4NXVL+DKr12KTc88DygARBAkAKUjMmgwPJN8xM/ZHtNJJRlTW6+jffOi+v32jvmyZctw5JFHpoj0zcaLazVyNpxiAyEE1qxZgwULFmDlypXJnDFzwV43TVxgYu1GOcra7R+byQ+aXWOypNtaaxSLRZRKJecUnA0Lc6UGTdiUKVN47dq1iaTZQLFOqBPZMmx24GR4FjzPQxAECVp96qmn4qabbnJgi7NhY7YMuh2kCKsF4Zvf/CZWrFiBQqFQ1Xo4EP1BIwuGWTQKngelFRhRCxFLgpIEeAIoSBx/5hk4+ZOno+wTSoIREIO8aIdPcDWIQzEgIbh6JyBbxdJqRd5AtFrX0slrrEUa28z4GcqVDJQBWIA0F4tZ+5KkwpMokcbUvWbgixf/X0zYawZQ9CIeFx2BLZIBX0oESqXaibJgy2Aww1vBzCgUCkkCdckll6BUKqWqfrNgS54srjNnQyqximOA6dOn44EHHsChhx6aVH2EYZhUhBv/4vt+Tf+bbVsaqCBsvTXGnLf5nSEcLpfL6O7udpUuzoZHzuBuQWO200478dq1axMnaSdV/R2ANnPcrFRbb68zC4QtcWcAGBNILV68GFdddVUCxvSXLLYzZ9vT7PagbBAUhiFWr16N2bNno6enJwXMtAN0qVXh0ogsbqs+xHBP2O+Rvo9Qq4irAhrwJDCiiNM/dw4+cMJCvNWzBdoT0J5AyBpEAmGpDF/IJInNAi5AVCGiMwAL0BiZbSsqRdWfoVt6DsnYaKLCJX9B1g0fK+86+0L62+w9yz2vQV7hQkyx2hAn45SIkucqGGCtwUrH4AMj1AoQhG6/iC0vvYZLllyIjc++ACigoAmSgbIqwfMLCFjFvC06F2zpdIVLX8eBnUCZ3XrTEnnttdfinHPOyX2fiw+cDafYwHwvl8v48Ic/jGXLliXKRnbLveE5yQI2tWL3doIhefO9nXlN9ryzwBEzY/z48XjrrbdcPupsSJurcGnApk+fzq+88kriJAYSx0I7VYbyAio7QLIXAbOj9ZWvfAXXXHNNakdrMHLYOHPW6jyyd23Md8/zsGTJEmzbti3F3dJOjoM8/pJGVVpaOh5VYICI4FagHAZQYIAVUPAAj/Cp8z+P+ccfh7fKW8G+REmHya6eDiKS3GQBygGOdJNtQ3n3YihVwHQq8c4bO60ca0hXunBFfcu+Tk0RCGMqPSAIha4iFAFbghLGTJ2Mf/qXSzFut10BaJRVGKke+QWUwwB5KyQNwDFXayzYO/K2IhsAXHHFFfjb3/6WjA1T0WI4LJw5G/KJVaxgZL57nodf/epX+OQnP5mSizbcLoYL0sQItQCLdhLbdtKH1yIiz9sMkVJi/fr12GGHHVyli7MhbW7168V22203XrNmDQqFQhIs1EKCt3ei10kzfBN2P6nWGoVCAWEYYsSIEfiXf/kXfPnLX07di2zpoDNnwwVwsb/ffffduPjii1PzIknWBoH8cyLxTBWwxf53qBWElNBgQBJQkIBHOOMfzseRH/4Q1ocllAlQWoNA8KUHAQGt4p0/5oqEtJVs6uiG1W5vodb9Xyd8Zs1e+BqPt7enbu0rNrXGVL2Gmr+G9laV9HOFSl/nl3k/p8coEUVzgQgCsUQ0gDBUYAaEJ+AJiZ5yiAnjJ+Lggw/EHx9+BKXNWxAqBR3NGAii+A5x+m4Rp2bEQPATeedgWiLsGMH4wg0bNoCIcNRRR6X438xOv4sPnA2HuMBWMDXzaP78+di0aROWL1+eAmNMxYu97tl+uVabUTvmdC45fhs/P/tZprXKrgICgG3btmH33Xf/2ptvvnmRG0HOHOAyzGzGjBn8/PPPp3alsyDEUAwcssSAGSk3jBkzBt/85jfxuc99DkDUz27uSbuCd2fOBktQlQVQenp6cPrpp+OVV15Jfud5HogiyWN7d7gvAU2eQks7AibTOkTIICKUATwERfwtMeCy6LNn45gTF2J90IOyJGgAUkS7dlAa0BrS81KtQlUkuXHlANXyS0201fRXMtoOwIWo+Wql1Gup8THUzvtY+byBQXrb+udT/H/1PSIQoC0ZVaJEOtqwQDMIoVIYN24s9tl3X/zu9w9ClwMAgC+96P0ACGwOlZ5rPLDW0bzz8Dwv1WpsJ4YrV67E8ccfjwkTJiTjzBDtu9jA2XAwe9ybOMHzPBx99NHwfR+//e1vU7LJRvXUblWu5afbAYjU8/PtJB3Pq9AxfJC24IAQAuvWrcMhhxzytZdfftmBLs4c4DJcbO+99+ZVq1YllR7GGYZhWBe9HSiJYKvnleVusRF3KSUmTpyI7373u/i7v/u71Gvte+ECKmfDBXDJEsEppfDDH/4Q1113XWpny+wIm92sdu0g1VMYa/mzM0AIi4xmDwHSk2CiCJ3xPXzkk6fj+NMWYUPYg9CTCGOfKYUEmCGMTGQQAvHuPmWAFkUMLarPwb5ObhFoafcOYScAlzSIxi2fDxG19O52VSdG7x/cgIsCICwkxIxYQqX6iyJUDCwilJCIojci+r0mQDFj8g47YMaMt+Ghhx4CenpADEgd93MbjhjKAC88sNdS49PMmDExgNmcKpVKeOutt3DCCSekKmH6Gp84czZYwBbTKpTdlGFmzJ07F2PHjsUvf/nLpIXI3sztDWDpf0C6+c/KfqZSKrlm4088z8OLL76Io48++vxVq1Z93Y0kZw5wGeL29re/nZ955pnEEdpBaHZ3eqAFDn2pvMmqgCT96fHn7bLLLvjhD3+ID3/4w7nXbxaKwdAy4cxZX+dZljCXmbFp0yZ87GMfw8aNG5OSYSJKJNQ7SRrZLiC4CnChGr5CMFDwMO/k43Hap8/EJh1AexIhawhDiqsZSmuACIo1pBBRm1G2x9tUtpjkNfpjlV+iDGpRC2zpDYTpD8AlVxIaMY9NVRVFE0ToVCmKIDRPLJwXGPe5Agv9S5rb188ntu6HPfbie+fFCl2mtagidS5AIooXQtYgQVBgTJs+DVOmTMEjv/89OFRAUkXG0fOy5y633lJk3kodvmd2q5Ct0mYT7D/55JM4/PDDMW3atFTS6WIDZ8MhPrABRiFElYrhIYccgt133x233357FR9Sb+D3YABc6rVF2ffEBm7N9a9atarrhBNO+OBTTz211I0mZw5wGaK2//778xNPPJELthg2fttZZANX28G00yk2GgA3SqxlnL7df22fv02Cy8zYc889ccsttyTydnlO2VW4OBtOZs9/k3Rcfvnl+NnPflZFNJ2Vju7kOfW1TcSke4ZrRbMGmSo2FvHPDEiBWfOPwOIlX8BGVghlJBpNEGBtt8dQukIlV9Umfr3meNNfRK+NM0hiA0GwkYyJCAdZgyk6KjNHvBpAwq1R1XqlGRTDGSm/bpJeEYEfkgSYo+RXiiiRjs6RICgCjaQ0O5Mc8XcICU9IaOYU6JEnc03QIDDIcNnE7KxKMJi4Aiw18KXjBNv+DgPixNUuHCE7UdVGA+Mwuo+1/2PNyf3IPS2KwIRWv+w7RkSN3oqGv3r9bLJem/NHtt5rz3O2gEqKHz4To0eHeNseu4OFxP8+/nj0Os0gEmDW0CoGSoigmSPgJgYpDRgZfSZVACFU8yxpJNOjbaBLbxwPtX7WWuO5557DJz7xiQiYiu9Rtk3ZmbOhGBvU+9kAC/vuuy/2339/3HbbbSmqgjwOs7x8o5OASa1Yp9n3NHJ/srmDlBJPPvnkLqeffvqOK1as+IUbUc4c4DIEwZbHHnsMXV1dvSZIvTnU/gYdGgF8TOBjI++2g1RKQSmFQw45BD/96U8xc+bMXM4KZ86Ge0BFRHj66afxqU99qqrtcNBdWxTpQbOugBAxV4VAlCDCF5g6exaWXHoxeiRByai1QgWq5ZYWsoGXLEhBFjIDJFUygiiR1DWVMpp17o4aWQSoEYDCyXFETIZqH46ZwToG2bUGbFLDzLNPSENBEZlwDARJzpx+8vmccOUYpSYmqzqliYSZKQ0kZPEBjkEf0UQKTk3OgfYH/NunhL5PlWD1rh+RrLkWEddROShDs8YBs/fHa+vW4aWnn46Gn9KQwoP0CDJuNwTH4zPnQSSAS/ZOxQ+bKT0G+vMeERHWrFmDWbNmYZ999knmoQNbnLn4gZK5sPfee+O9730vbrrpplRVrPm7vbnr+35DLcmdqOBsZRO51fMwrUaPPfbYOxcvXrzukUce+aMbNc4Gu7mVL7b3ve99/Pjjj8PzPARBkA5oc+QztwfhVCeDJaUUisUilFKJXKPpobRbHubNm4fbb78db3vb2xJmcQe2OHOWnl9aa3zjG9/Apk2bhoxMrgZAUsRgQ1S9olkBBYkx06fhHy68ECh4EVdFGILDKBAMY9nLPN9Z7/f2vyVXJHmjvykw6QSUECDoUIGV4dcihKxQ5hBaAiErhKygVAitVVI5IZkhmEFhCKEUhNaQzCCtQUqBlAJU/D5iCE9AeAIkKfpZEkjEhTBgMGswa0hBkILA0AiCcvX11htDBnjR8XXHAAk1+CX6+Pe8r+FiedLqzby3nl8gABKUkGVqANt0gLPO/Sz2eNdBgC/AkhCwgtZAUArBGvB8P3f85LX3ZQM4YVqVuP/9oqlqufTSS9HT0+NiB2fOLN9h5xHz5s3DAw88gEKhgEKhkMwd04Zs5s323MypB7Z0+hwMF5QQAtddd901n//85090o8aZA1yGgM2bN49///vfJ07FcJf0Bqx0iohxe4AuQgiUSqUq2UbDmA4AJ554Im699VbssMMOjvDOmTMbjNA6qYIDgIcffhg/+MEPIIRI2hEHbTAY9RNBUFzNJgTIkxES4AlgTDc++6UvYMKuU1FmFUlEC5FUamTbFJtNXimzOHGmRcf4qqQHPAihlYJE1ApEHAEXRU0okkQRAn7I8EoKshTCKyvInhCyJ4TYWga2lkBby5A9IbxAo8AEXwN+yIDS0EEIVroKdM8SJmutI74aC0ipGjdxC5BdzZKqrLEAEm7QzdrHyQNOTGVLb8+Em5SS3p58HO0GMdulzlTrPTpU8IRMEiTP8wBB0IIQeoQvfu0rGL3r1BghqVTFChJVErG9PSeBzgNmzT5nkywyM5544gl8//vfbws3kDNnQ8FsIn3z74MPPhi/+93vMGLEiFQlueF/257zJ6suZPu6ZmkTWlkjjGCHyU+uvfbanyxZsuQgN3KcDep5P9xvwHHHHbfyZz/72SyDKJuSPluurC8BSbscZF8/pxY4ZBPdGS4KZsbHPvYxLF26FMViMRWsu3JgZ84qoIuZR8cccwyWLVuWVIHZ82QgJBnNnoO5LsUawvOgQxVldqNH4ozzP4cjjluADUEPQmIwAEkyUR0wZc+NnkfuuRkSwczfNCpBnwpCkEAEsmhOjl+UHjgM4DHBJ4GiX8DIri6MKo5AV6EI3/PQ5RcidRkAoVIoBWVs6dmGrT3bsK1UQrkcImSNkDhql5IC7ImkUsWsEzDkyfF4YEEQngR09Eqbv4VjwCW6AB3l2hqQNu8FKmCMpnyi3VpgTt7vuQbBcB64Yh+vlaS9vWTyoq0BfKeAhbz3RaBHBJrAk5ECFxgcKkgmeCB0Cx9rn1uDr3zuPGDjVlBZATpKLhTrSmUX5R9D6Oq7pFsAzjrpS2zQaObMmVi+fDlGjRrliHOdObPmSBbcWLlyJQ4//HCsW7cOAJLqcztG75Qfy74/u8Faa8O1FaXA3l5r89+Ze+ByVmcOcBmktmjRott+/OMfL7QVRHzfR7lcTkkd1yKNs53lQAZc8t5rE9iZJNFcxxlnnIHvfe978Dyv6rpchYszZ+m5cM899+DYY49NgEsznwYz4JJwksiIJFcDQEHivR8+Bp/54nlYXy5BFz1oZigwBEdcKnktmfWOX6utSGeacIjTr/U8D1opkNaQDHCgoMMQXdLHyGIBO06chMnjJmDSxInoll2xIgxQgIQEEEJXCGBRIRtV0AihsblnG9Zv3Ii1b76BdZs3YGPPVpRUCC0J5HtR5YKMnnVClCoIGpyQ9+aR5SagSwy4GDWcbII9GAGX9proaELRic9NNjEYkMTQAEKtwAQEWkWtAjEpNAUKY70u/PE3/4Pr/vkKkAKoHFVqFYpFhOWg6lklvA4WcW72Lg0U0MXs4Nvnfc011+Dss892mzbOnOXE0/ZGzTPPPIMjjjgCr776alUeko0vOuUfawEtfQFdmgFnTJWPycUsbhuXgDhzgMtgsnPOOedT3/nOd27wYqI6KSWklCiXy+jq6kqShqzTsZ1BnhPKQ4T7E3Cp9T4pJYIgSFBzU+ly7rnn4lvf+lbi7LLBUSdlbZ05GywWBAF830cYhjj22GNx7733JrtQ9bhJBgvgohHttnuygFK5B/AFph24Hy78+qXgUUWEJNCjQyAO/iRiedwwjMCQHJWF3s4n8a8EhFbGT4xKohrDGzoIIYWACDR8DYzvHo1dd5yKXXfcEWNHjIKI6H1joEXHfBoCEmSRy1JyrQqcgDwR8EIgCGgAARTe7NmEV/62Fi+9/je8sXE9dEGCCh7gyaitKg4GEwJyyJqACwDouERBcC/kq9z+MVBrE4FpIPG39A/g0tfPr4AuOqpUkSLhYyiFUUwhhACFGt3Cx0gtcNP1S3HPf/13dM1MQKggLZDFruqqUkXk6rumBwjgYpIl06a855574tFHH0V3d7cDXZwNazObM6ZS0pZYN3Nn9erVOOyww/C3v/0tAS9Npcf2IM3NrhN5bUatxhiNgi5WZUu2hdeBLs4c4DIY7IILLvjAt7/97V+Zyet5XtKDn1XhqQe4ZJ1Dvb7H7Z0w9fZ6W87WnOsFF1yAK664IgkKTdWLA1icOas2pRSWL1+OuXPnpnyHqZgbzIALG4laDUAS5ORxuOiqK7DTXjOwWZWhPS+WZo7aJaA0ZKz845FAyLqqHagZwKUcZ5KGn0IojgllGVJH6i4FIbHDuAnYY9fpmDp2EooQKCKS3tNxBYu0VF1EZsHLVnyw4TpBpVJAWyBJGRrbOMD6nq14fNUzeGPzBqwvbYX2BLyCH3GzxGsDxYCLvdDaV2wAl1rBq9T51SrNcLvYfr4W4FILYGk1YW/futdZwKUKuMhJLvqSqJBEwsViQFghRKTkZZKnkDFK+PBKCpd86ctY/egKINTwKGqJEwDYPi+RX02b9wwHQltR9n5qrfGd73wHixcvdlWyzpzlxOLZvOL555/HEUccgRdeeCF5jdno6TTgYuc6jfJVtqvKxQZbDGBt/+x5HkqlknMizhzgMtBNSsm9yT03soNTC2zpjwQpa3YCaHaZjLMyziwIgqRtaMmSJbjkkkvcjHDmzJpD9q5KXhXbCSecgDvuuCMVHDTrC+rtJHXSlxj1FJvAz/xOqbjiQxLQ5ePMJV/A3GM/gA1BGSVEO/dsLSFGdtnIICtwlTKPfR7GDxlgyvgrIQRKQRnwRdyqBHgctefIUAPKbLG9AAAgAElEQVTlEEXhYdcpO2LPaW/DjiPGQwIQ0ChAwDeICcGCTRpb7KyzS95pgzSaAUVACGArFDbqEp5+8Xk888Lz2BqWUeweiYBVxA3DIlUWXZBepU2LCBSjMWafjjPnWWAB6DQoo5hBHLWq2EFwCkihNLeQacUy49IG0aP2lMqzMZ8jhNguVRJ9AVxqBf7t3uhoJYlhACwrHD7QXHk2VJnfHglIxRgpfLzx/Iv4x3POA97aAlIaCMrwRVQ9pvPiDSnaei3t5ogzYz+7Gz9r1iz88Y9/RFdXV92kzQEyzhwIE/nr119/HYcddhief/55BEGQ+A+b2yUPWLf9fm8ASl8Bm7wN50ZAlVrHradoZq5h5MiR2Lx5s3MUzgaNDbu6zmKxyHYilRd4tEIwOZDAFgCJUkqxWExknwuFQhIABUGQOOyvfe1rCdgShmFDpFzOnA11s5NUe56b+fnII4/g17/+NbTWSYuRSWgbTXjsJLyd87+RzyoUCgjDEEEQpDiczL9NrcecDx+DucfMx6ZyDzRFvoXidhlqkPMjex727r8NUiXnEVe1eEzwmSBKIWSgsdPYiZh70CF45977YuqI8fABFACMgEABAOnKeRHSX70+E+tL2GBLXPIiGPAZ6AIwChITRRcOnj4TH3rPXOw1dVfIUoguRfAU4JNIEuZCoYBSGKAnKCfVlMlz1/F36xwEp+WKs9LFCXCSyDlFQDpJkVJvQgyaGF4ZU7WUVZmwJXxdotumBMR8cbo1zn62QRBAC8LmsISpu++GT33+HIAYDA3pF2PQi+IWPQ3NOiZozlRmUX+DY7XnvC3vKqXE008/jbvvvjsF/nXC7zlzNtj9jclTJk2ahAcffBB77LFHap7YmyQG2LdzG+PPs2vH9lQ6avbvzeRfW7ZsweTJk53TcOYAl4FohUKBw5hjoNFkq9ZXO4KyToEtBjhhZpTL5URpyFy7UirZ2b7yyivx5S9/GUB6x9uZs+Fuef3KJpABgKVLl2LTpk3wPA+e5yXzq5H506nWw0Z9iUn4AMD3/aTiIWqHEIAUQNHHxJl74mNn/j02Bj0IIobXGIypZHk2uMFMaJTTzhCVZ3fHJIkI3CABXwOyFKKbCfvsuhsOP/Bg7DxqLEbDwwhE4IePqI0oKkvhSsarRfTF1lcMpXDC8BJ/2a/Jcq9kUBtioKgZYyAwHgI7eaMw7+0H470z98VoCHQFDAo1wAwJQqlUglfwUSgU0NPTAyllSsJXcEXNyLQhRWSrBIiItDj6mazvlpoRGKGO5LkNb4j5OdQKENEztV+vwfHfoy+T3GNAVLe0PsY7IR/dynpo5L+TCiarhUswQIrge0WUNYOlhze3bcXc+fNx4PwjAU8ghIYWAEmBIAwghYQXy7T7np9/LwYQ+GKDp/a/wzDE9ddfn2qJSIiy3UaPM2dV+YSUEuPGjcODDz6Igw46qKrtyMT0vu83pK7abh/Zlwr/Wv61Lq+ZBSK9+eab2GOPPRzo4mxwzOnhcqFjx47lLVu2JKBCdnFvR0/4QAFbAKRIb/N2kqSUuOKKK3D++ec3xEDuzNlwBV2ypbKG0O5d73oX3nzzzVTgYMp1+zKX+7oL1WiFjfEPhlMi4bICA0IAo7rwpSv+Ge9414HYyiFKKoSEjN4TH8fs4kfCOwzTjsOk6ybFpo0pu/MmpYwJbgEOQhQ0YZQsYP+99sb0STuhAEIBkWq0oMqOAVlYC+yfKX+1q/pzli8FFT4ZMvS62c/niM5US4EeKGhIbOSt+OPKFXj+9dchuruiFiTWgIz9MQOelIBWqUQ5OVbM0SJJpMqr88A/JkCAUgFo1pfbVUQaXKX2ZH9mdje0f000NV86nfQ0Nf8AaBkRMUsDsHD0rBIwhKKWXkiBLr8AKA0/ZPCmbfjiZz6LrWteilrKGPBFJDNuS60LIVLgis7ctWbJj/vaYlRrTNlzHahU3N57772YM2dOircij8PCmbPhHnfYc3Pjxo2YP38+/vCHP6QIZX3fT6rWzVzK45RsV4VLnkprHgdWK0S6jeQg2Zbk/fbbD3/5y19c4uJsQNuwWN0mTZrEGzduBBFBSlm1qLebgK+/wRYAyQ5SEARVZem+7+Pyyy/H+eefX3VsOzhy5my4W62+5J/85Cd46623EgI38/cgCFqeP32tdmkmWTa93wYksqXhIQVQkHj/Ccdh30MOxmZVRk+owBTxqoRc3TbFmqAhoNhS+8mcj/1vGwiwTWsdATflEH4QYodRo3HEOw/BjEk7oQuEEYh4YnyqKLIkxLZZcMX0BMVfSZtHFjcBcvuPqioFsp8fVwMRGF2QKEJjdCgwb993Yp9dZ0BsLkGWFQoQEDoiFrZb1JK2Ja7+CrVCoEKEWsUAGKV4O4QQgGboUEEFIaBjKWoQWGkIUFQpBEpex0pHib913+3qmECFESgjB1dY0EmAqC9zMSvpHc2LuMKKGYVCAcViMW7hY4QAvDGj8Jkvng8UvWRwBBy1j5l5mkdiLwZYMGfaG+z7Z7jklFK44YYbqvxkI9wSzpwNN+DFtu7ubjz44IOYN29eKu+wuV3MvMqrot3e86tTYLhSKtU+9fjjj2Pu3LnOeTgb0Dbk5Wd22203Xrt2bbJ7m5UYq9VH2Kyj6Itj6WQ7QaFQSJBg0/pw8cUX4wtf+EKyo5TdjXK7TM6cZZKneE4QETZt2oRzzjkHb7zxRlSRYc39PEB3oCWdNmmqaS80LYgRX4TCTrNnYfGXLkAPKaDgQQHQghK1HUKGoA+UgBoVKKP++dn3zSSTSilwGKIQMHabPAWH7HcAxskRKIIgFUMSgTgisNWaQYIqx4vBChDVbasg9M7vEp1bBGDktRdp1lG7T3wvBAAojRFeAdAa48ZNQLFYxIsvvQgiEZfjEMj4W9YxZkOVO0WAIAKIIGI5YUkCgqIaG9JRJZFHEagiE4CGIRRHZKtKA6EChwqko5Ymu12JmMFaAzF3jEDk7wURBBEYhlOmvzcLt9/624ljiLgvzYAuSWELibRalVIo+D7AlRakabvuis0bNuK5xx8H4rHCMYghiEActfZRnVtFDVyL/dXuGMQAQ+azTSWdOc5LL72E4447DpMnT06BNFmVSGfOhqOZjc9sxYqJzxctWoSHHnoIzz33XFUbUTavqUUs3g5f2Aq9Qm/vaeT8bHDW5HZr1qzBySef/O4nnnjiJjeCnDnAZTvbO97xDn722WdTPY4AEhLZdgVvAw1sMedkghelFLq6uiCEwEUXXYQlS5ak5J6zSLgLeJw5S1eB2HbbbbfhP/7jP1KJgpFrbEYWsT9ISm2+BHMOJngxpL9yTDfO/eqXMWG3nRGCEYKhiKBYQ0gZJea6cp0aDB2DHAKUC7jUOpc8daYR0sOMSVPxznfsg24qxspDDD8GV0hEeaiIASCykjWKQQMdAxkMS7QIOa1HdX1o5s3WW4kIChYwYUA5BqSICHPHj52AkSNH4pW1r4J8L2oxMetO3I4Fi9zWkNpGgy8mDo6ViUhpCESKTR4JdEkfvpAokkRReCiQRJEEfBB8ELqkhwIJFGPuDz/+kkKgIDz4UiaS2VC6AsJojipk+r3Kpfl5MZDWrISPxygTJZckIvnwGJwUQHTfw4h7pxyx6uLAmbPw0B/+gC3r3gSKRSCMALpioQCtVAJ8MpAu3Yq/WiGs7ISfsdvajI/UWmPbtm0YNWoUDj/88BQgYwPbzpwNd9Aluylqf//4xz+Ohx9+GH/9618TgNMm+M/Oo2YAjXYBMs36nVpCJrWAo6x09MqVK/c477zzVixfvvxpN4KcDbg5PVQv7D3veQ//4Q9/SCas53nJot+pAKPZnaJOlvcJIZJda7PT9O1vfxvnnHNOSnLO3o13/C3OnCEFpGR3j7TWOOqoo3DvvfcmVSKmPcCUubYa1LTaUtQMyGP7hwR4AUMKCcUa8ASO/fgpOOHsM7GRyyApo7aTmH+CGBF5Z6jTgEvc0GBaZMCVdgHNFT4UxH9XSiXVHMwMrRQkAJ8kpowai/n7vRs+GH5cPWJIcQ0OkFyLAYlZQ5BIElHby4vsYteK2yUkSj/J8UlEbU2sIUmYiwUERYUmAtgMxtOvPIc/PLkSNMJDIASEVyEbrvLb8e99JhSkBxkTpeowRE9PD7Zs2oxtW7Zi3euvY8Nb6/HWG+uwadMmlLb1oFwqJS1tJnD1fR+FYhHFEV0YOXoUxo4di+7RozBx8mR0d3djzLjo34VCIXrWWqPMCoFWCTAQ3/qWyVjNuEndTkZqTGR/JhYtz592AgatfiZRZcxrq9KFSabOV+ioXEvG8ywggIIQk70u/PXRP+Of//FCYOMWQAtIUFQRI71ELrr6vpmB1Bzg0ilZaK11Sr7W7NorpbDDDjvg8ccfx+TJk3P5Jpw5c5aOy+2qFyBS6jnppJNw9913J+t63iZG3t/aAapk855aUtTNxDh22209X5yVnbd9DoYRP6kzB7j0q33wgx/cfM8993SbSZmd/LYWfR75U6eTnWadbJ4DNbtFdrWO/Xu7fHfUqFG44oorcOaZZ6aSLWfOnNUGW8x8s8HJhx56CIcffnhbeI5sn2NXldUDbhtXN9LpZFdXKikMgarN2yKFDyUYk2bujn++9ltQI4ook8XHYgc6RGCdPh8bTAEzBIuo9Qcc8awIDRV/imCAtIZHAoGOAiYJgggC7FgciyPf9W6MhQ+vFmDSiP9sdJHj1lfBum/VDBaEHgBbEeLR557Gn/93JbrGjkUgNbTZ1Q9DeEzo8nz40gMHIcKtPdj21ka89upavPD8arz44ov429q1ePP1N7Bx/QaobT1AuRwxB3MOgEQU/a3Wak+ISJGlhOweiQmTJmLKlCmYPn06dtttN0zcaQomT58Gv3tEpG7kCWwLygmXiBk7thSpAQ3MGiQoquAhKRCyjsYDUcIzQ/E6bIAcjis/kjnHqmni1/Qt6Gvxrq4JHvUF/MlV5LDAJw0BAQ0BiTGej+9/4xo88NOfgQINEcbQpqDq+MDcX45JuwX3Sa2oNx9UqxW7GcBXKYWrrroK5513XurzHHmuM2e9xyc2cexxxx2Hu+66K9WSlyeEYec/HU0sc8CYVloX+8Kh5UAXZw5w6bCddtppP7j55ps/biOt2eRkMAAutRIs22kyM4rFIpRSCfAiZaR+YAKaMWPG4JprrsEnPvGJusGSM2fO8pMKO4A588wzsXTp0j4HLHk+qZ1y0kTGR5ikLuZqoAqHS6hCyLjdEkTAqBE47/KLsffBsxGAoES170qCJs4/vlEskrpSGaSoGnBBvFMfaAXBgNQKY2QRh+17EKZ0j8UIiMHb7xqDTiCCImAbNLYgxIN//iOef+0VFEZ3J0DWyK4RUFt78MrqF/DMyiex+tnnsOrpZ/Dmq68BQQCUg+izNFdAFAYgZAVwsbEUzlkrKANC2aU+Ru4JFRAGnsTIyZMwdfqumDnrHZi53z6YMm0XjBwzGloSylohiOWnDVhYvYuqDToHBYYv/LhSRyWy2GkQI+I2MaCLZN3H+TUwAZdsMpJ7ZAK0kBhJHsS6jVjyqbOxefWLgAIKBQ9BOYQQ6Cjg0gjw0hfAxVz/rFmz8PDDD6OrqwthGMLzPBejOHPWBOhi/O/xxx+PO++8M6kgM8pFAJLNlVbznP4CXFrNnaxqF+dInDnApRN27rnnnvKv//qvN5uKj0aDnoEKuOSdj/07KSXK5XLSF62UQqFQSHYdx40bh6uvvhqnnXZa6r1uB8mZs+aDmzVr1uDggw/G+vXr+xyw9LV9qLf3C2JoZjBTKlE0HCtaaxSLRZRKAeBLwCPMOX4BPvn5c7AFIZSQfQJcTOJnKhg0KhVBEemtgicicLiLJLxQ4d2zZmPvibugAKAwmBcnC3BhAgIAJShs4wB3/+YebCn3QGmNp558Eo89/ChWPrYCm9e+Ft2oIIhIauyyFaIK4MIxMMLmecb3PAO0ZAGNLPBCQiTS19A6OkasvGR9cvTleeiaOB57vOPtOOCQd2LGzL2x8+67ISBGAI0w/hzF2irp1ilyZmhK2muYGR6JRJFJAACLVAtTLcCjcesrF0jfAJdGj533Gk0ACQ/h1h5MGTEKTz74MK5Y8n+AbQEIDFaAlBk+g6QFKwY6qT2t050CXAznQhiG+MUvfoFjjjmmqqrQmTNnvQMudrvzwoUL8fOf/7ymf9lepNS15KJbWk5beL/Jc0aNGoXNmzc7Z+LMAS7ttK9+9asTLrnkknWNLtjtcjidrnDJOiyD3IZhCCEEfN9HuVwGgAR40Vpj7NixuO6663DiiSe6AMaZsz7MbzPnLrvsMlx44YXJPOtvwKVuH7RpKYJIqikM4GKScQ2GEB4UFMbuuRu+/p1vg7q7wL5ECUjel3ssplywxU4AOa6e0GBw3CKSBGGI2lB8EsC2MmbvvidmT3s7itDoiqtbBrXH0nFrjSdR1gplVvBkAZuDrfjoySfh/gceAG/ZEuta66hCIQZOgEgRKiKksapaYqCEiKL3pBJu1P13FnixKzyVeSYGeAEgEbcHUXx+AlEljCeBooedZ+6Ng9/7bhx46LsxccoO0AQEiBKAQCmQjMaPJ0ybUdRepKlSMSYYENrw1lTUeyLgpT2AS+trfd8Bl1ZBF02AZkKX9IGt2zDeH4FrLrkMDy/7LRCqGKTKB1zYcAmh7/6p0y1Fxoced9xxuPXWWx2PizNnTVqW06VUKuHkk0/Gz372s6TSJTunExC8w4BLX3OfvuRPto+aOHEi3njjDedQnDnApV0mhGDTRmMILIcC4GI7DzsgMWR0BuU25FHMjO7ublx//fU49dRTk9dmVYlcQOPMWXOBzIEHHoinnnoqNZc6kdD01Y8Yud8kySYLqImTNXMNCgRdIHzqq/+I937gSITE6AkDKBJ1AZe8jo/0a0SsXhSrIXGF3yXikNEgBmQQYOqYCThq9qHoAqEAwB9CC5NiDcT3UrMGkcQN3/93fPZTZ0J0dUFv64lLTmIJaERyoCRFle+3P1PUuEOGsyepHMlACAZwsYkJjdqDBlcpR9nKFwkVoQGDdAiMGom9Dtwf7z3ycMw6YDZGjx+Hkg4jZStRwYqiaicGkUxkPM15puER61z7NAhEH9f77Qe45L0u1IAEwSNgBAv0vL4O553xafCGLUBZQRCngBabByaPpHigAS72+Bs9ejT+9Kc/Ydq0aUmFrqvAdeasfnySqPJlKtfL5TIWLFiAX//618naYZNVb0/ApZ3HafazbB8zY8YMPPfccy7pcdavNiRkoQuFAptdM8/zEIZhwxUu7Wgr2i7IWCbotmWf7d3K0aNH48orr8QZZ5yROBtb+tXtIDlz1kC6JtIJ77Jly3D11VfD9/22BCzZHaB2A8AShIQ2jir+gy3Hr8BgYhz0/sNx0qdOx2YOUQrKgCAwKHlffiVLfZUTbZJmETWuCK5I5Zp3SwZkWeHd+x6AyYVuFIcQ2KI4LtuO9YAlCBSrGu37jlm4/fY78PrLr0CYsUQEz/einvtsCxFH8tMEguZIwrlmQkrJI0/dR9PqxQlmImIKl+g4OjkG4t/rRLqadaQAJSmujgojwIdDBpTCuldexWP/73e49/89gE3r3sKkCRMxedwEsNIgNgo8gPQkPC8iejeVVlHhTHpt09a19GGG9RFw4UY+tmOgi4CpEANCpTBu7BgIEJ7602OAjsiLo2dMyWkxpcdAOxOnvt3L+jFNqVTCpEmTMG/ePBebOHPWYHxieBuJKCWeIaXERz/6UTz88MN49tlnU1wvXV1dCIJgu7QUdcpfNHp/7Nhl/fr12H///b+2du3ai9zocdZv83awX8CYMWM4DMOqoN8mlh2MVkuZKPsa8zchBAqFAi677LKUGlFWYs2AL86cOauTMCuVqhq78cYbk7lk/E27g4h2SzbafrA6b5RgJhQnTcBHTz8NWzkESxG1jAjRZ8JNYg2BdBVD5K8AYSpeQo29pu2GHbsngMDwTD7Lg3/8CBIIwgAUy1pHoAlDACj6Pq68/HJ4vm8eFiBEFAgXfTAiv+6JCOQQNpBGAp6Qqfuavu9p0EsxQ8VcOvbqkbT1kIiAFq5UxjAzhJQgEVXcEAisNFQYJsE7xecMDSBQQFkjePk1/M+PbsPFZ1+Af/v6VVj31zUY63VBqngHloCeoAdSRseTRKkWNyaCFpRUabR7Pe2vmKDRY+a9RguC9gQ2BwEWnPRRjJu2c1RhxCLixbFUwsxxaBDMnyy/w4033oitW7e6hceZswbMqJGauWQ2mk2sXygUcOedd2Lu3LmJohwA9PT0JO/7/+y9e5wcRbk3/q2q7pndze7mHpKQG4goCa8QyAlXBUHCRY8/kaiA8qIc8YYc8YYeQfnlE0VfL3w4yE2RAzFyyKtGSCQJgXDRKCAIBCQEOAi5kpB7steZ7qp6/+iu2uqentnZ3dnZntn65tPZmd25dU/VU8/zref5PrWKckgXznlkw1lKiXXr1uHss8/O2dFjYQmXfmDq1Kmys7NTL95KlbuWiZa4UTHTvks5ZplMBj/+8Y/xxS9+MUKoqNRDCwuL8qE6fgHA1q1bsXLlytoijOKZbCLodKMIHg8CpCmL957zAUx8x3QIhyLHPfgQQRlMLDDqDylkarZoR1HtzHOBEW4Ws95xJBpBkTWyK+qlnsh13JBoCa+bCG9zgbPPmodj33OMzm4JdFIoJOcAY+BSgEsJSQhkjDzrbX1T5TuiBHNldvCLd/PTJEioQ8NYUAbEKNMtxbnvhzoyJKh/4QA8CXTmgQMdeGb1o1jw1atxyw9/ir1btmMEceD6ElnqBGPR/Lyx71vWaYJDX0gXaexKcwJ0CR8+BS75t8+EojfF51wlCJdS870SvlVcvP+f//wn1qxZUxe+m4XFoAduhliuIi4dx9HzSWX7r1ixAqeffrrO+lfETJrJkkr5b2b7a/Vz9erVmU984hOr7AiyGJK4olY/+FFHHSU3b96sWwkyxrSQrOM4Eaey1MQv9jPJwUjqaz8Q56qkwxU6HspwqDp7ANpoqsc2NTXh+uuvx5VXXhkpLzINTTWNnYVFPQVId999N5YvXx5xZobCGektyDYhpIQMNTkY7dFuooSBUAZJgeaJ43Hltd+CaMogBwHJCEAYKGE9Yq3FP23i++r7yn4Rqm9TEpAqjFCQfB7vnn4YZow8BC6ATBjkq+yOuoGyw2otkmHmIYB3Hfku3H333XAYgxQSlBIwyiDCdQwEkbKwsGdQ5H5JQiXUgUFYSkZoT5lZ8FpS3yfx71JClzHBDIKNEjXd0Sg8Nxp2SlIZMZAS2//ndTz+yKPobu/EtClT0NLSErwrBcBU6RoJSppIUDIFCZ0qnzQ3yuuyQQY47ypXUtSfuR7OrkCvJyS8ICQOmzIdL7/8CvZseQuSA5QyCCFBWDC3nHC+DbSuKH7tyykRKMfXKvYYSim6urpw4YUXJj7X/M6tBp2FRemyHTXXHMfBxz72MTz55JPYuHFjpLxIxQpmJrzZPrpan79U7FXOayTZFZNsUWuXOs/169cf8dWvfvXvTz311P/YUWRRTdRk6sMJJ5wgX3nlFXiep8kVUyR3oB1E4hPXFKyNly0NRoBnOiEqQ0VKqc8xl8tpAqahoQELFy7EV77ylUH7XBYWwxW+7+N3v/udLumrRJvDqhh2g3iOp9dyyQEq8cGPfxSZUS3wiNSCqb7vwxO8z4RPHCzULYFR4qDLHnyORuZi2oRJcEECskXZ7p5mxfXtLFOKU089FSfOPQE83H0kEvDzHhhlPWLHxtEXaAFcgkimSzGntpz3UH/X5UcINHlomA2jsnggAqKN+gLIC+BABx759b343lXfxKPLV8LJcTQxN+i4Q0hEU0Dt0pprrS6VUcTOMMjYVOfoOA6kEMj5Hrr8PDgjuOjT/xvIOGCNWYiw/IuHGzAkLNNKE5LshuqwqP7GOcdjjz2GN954oyCAMsdBfwMzC4vhBNNfaWpqwv3334/3ve99Ef9Fd6kLy6fVpvVAGwL01S7Ef1YD//mf//mAHSUWlnDpBfPmzeNPP/10ZMHW9egxR20wHAW14FfDOJhkS5zNVlk9CxcuxFVXXRX5XLaEyMJi4BBC4NVXX8Uzzzwz5A5/X+2NkAI+90FAwybLFJS58DkHHIbWw6bh1HlnwqcUeSEBSeESV9d7J+0Y9faZ4rpTUZI6zKmQEpILTBwzDhOyI5FBmGYpgghekqChdb2RLvHsFBCAuQ6+eMWXtFaK4BwZx9XEuowfAyBhkp5b6ihGxhAZih1LwBHBwYwyFkGDgwsOyTlchwWkC6fwt+7E73/6c1x/9TV488UNaGVZEC+PxmzQZl0gIOckF5ogNLU+kspr6x487DBIXTA3iw7Px7uPOQZzTj89IFloIH6ts4xABuX6DMbmkud5AHrKN/fv34/Vq1frroqmvU2ySRYWFigao5hxSmtrK1asWIG5c+dGymw0SRtqO7qu22uH10p/zv7a9HIygpN0PY3n2p1pC0u4FMP555///Jo1a6hpUJLIlkoQDknaBYNJ5MR/pzRpVGZLvB00pRQLFy7EV7/6VU3OKJFPCwuLgYMxhvvuu0/v/pgpuKkO7gmMUhaqyz+EFAAjgOQ476P/H5rHjUaO+/qxZrpxX+1VQZwICUESHCsh4YBg+uQpIJBgiGpOkDoRcCFFjsg14hz/+q//igkTJoALDgISCO0Wy0LppzPalzUsicQxBXVpkcfHtWAYJXAcBt/jyLgsyILxJQhxsf3ZF/Hjq76J39zySzg5jkbiwCUUTAZjMKl8ZDDW4SGdo2W0UNZZLoQGxAsBPCrR5udwwacuAkY0AhknbNMdZEgpsiLNZIs5NlUWnhACjuNg6dKlEZIlKViyGbwWFuWTLmp+NTU14aGHHsJxxx0HABFZAhqKtptVA9W0g/1p+TwQKFIpk8lYY2JhCZc4rrrqqo8sW7bsWLUEWnIAACAASURBVLVIK2Nh1h8qzZPBMgrlCkcW+3sxZ7FYyq0SulLBntoJklLi29/+Nr75zW/2dK8wat4rWVJlYTEcocprli5dGhGeHqouJ31/EgUhTs8ul8oyyThonj4Fp51zFrqFD0kJnArYjoJsF4Q6MipKZxSUBCVGLQ1NmDB6LCB40IFHGARR3QygXg4RaOuMHjkK8z5wlrbhMJzkRNJGRo+iDqks7yj+AkGXqfgBCAgiwImAT3sOQYO/URkcgktIIUAokPc5hBQgREJ25UDhAh0eHv/v3+O6K7+ODU89ixbmwBECknvIZJ3EMTUY3byG2sYU9RUI4AsekFyh7eFCgLguOoWPqUe9EyfMOwOQfti1SIY+EIeUfGhsTh8DJuWrKZvj+z6efvpprTUxlOKeFhb1AHMOEULQ0tKCP//5z5gzZw6y2ayOJ8z5Xs0Ml0rblL4+nnOO0aNHW9LFwhIuCgsXLiQ333zzfWaanOu6BWnr8TS6VDlQRYiWYo9XhtJ0Mj3PA+cc3/rWt3Ddddfpv5tBku1KZGFRmcX7+eefx4YNGwqIiKEO+Hp7f7MNc6Qc0WGAn8eH538UTaNakRO+thlmlqBywgb0GVV5ChDJdKFcYszIUXDAkKUOhAiyXszzKtGEpW6gyik457jgY/PhOi78UDtH6bn0iSApsrYMhCAUpPC+IEXKm2TPQYThANNAvJXQkDiQAPE4XASlRnte34Qbrv3/8Ye770FWELS4DWACupNRUplwvWVx9rZBI3yuN1sEAbhD0ebn8OGLPgY0NACSh8LIclBaaveHjCnnO1KbZOZOfFtbGx588EG9wWRudtnsXQuL8sE5jzQQMcuHHn30URx77LH6MUbGx5DYvmr7VMq2cM7R1taGww47zJIuFpZwAYDvf//7wjQi6qcpBKlbKJZZVhN3SJMc1L5kpFTaaVEaLXGn5Bvf+AYWLFigHRZ17nFDYmFhMbD5uXTpUuTz+Yi4Y7Wd/lI6KSXtB2MgCARTqcPUk9EyYxpO+cD70e1zUNKTSSAN3YT4Dldvei4F9wkgKQmCc2oQ4hKgRGL82NGBoC4ASgFJZQ9RVC+2q1RNEQHcbCYgIhjF+04/DSNHjwq79xBwKQacoVLu84r9TSXi+LTn0ISLoedCRXAoEV1FzBAK+FxA+BKMUUAA3AvKRgSCzQPKGOBxoK0LK+5ejOu/8z0c2L4TDZLCKdERbDhsKAgCEIcBlMDjvvZ3PMFBHIZ27mHqO9+BOR84IyC1KAGhtOA7qibJ0qfzM/wapc+jMnmXL18e8XlMX8/6NhYWZS5BCZ3dOOdwXRfNzc146KGHcNJJJ0XiCM/zIiR3qfiokp+x0n5Vb13WTILJ931s3LgRp556qjUuFsObcGlqapIqs0MRCso4KMdLLd5mb/pKTdhyA56+tGwtF2bg4/s+vvKVr+AHP/hBQW/5+HtYp8TCYmDwPA9/+tOfNIFZa+3VTeFJn/Mw00DitPPmoXF0K3wi4UsB0ECAW4Z2w6UMRMh+2bm4/YyI5nIBKgEmgJFNzXDCAhUg6NgTPilsK1wHhF3siBAxpm2nBK2trThuzvFgYUcasyy2vwt0fzVcIqQZid6OZ08Qo1N0KCMSVIaFGS+gwX3JBSglcBwaLc/jAbEEASDHsemZdbjuqm/i9XUvoZm4cARAuBGYhx2XRJUyOao6XuLlU0KCSugAyXGcgEiRAjk/DzCK/V3tmP/Ji4CmBgAkzCijEJJESLX+droabMLG7MLIGNNz4q9//Ss2btyos3xNX8/6NhYW5c03U49N+TFKekAIgdbWVqxcuRJz5szR2lnmPKyWTahklktffDPGGPL5vC5v/Mtf/oKPfOQjL9nRYzEsCZdJkybJzs5OPSHibVmTuhZUinQptqNdrOd7MUXsUoGL4zgRDRZl9EyGWb3fl770JfzsZz8ryGgxP1cSEWNhYVGclFBQmlBqPr7yyit4/vnn9WPMHaLBdPp7E4cs1jK18OQ4SBjNypDpcCaOwQc+dC48hyAPH3AAQIBLH4IKcMLDjii0dxtmpEQQGruPoPUzERIOoWAgoIRAej5GNTVjdFNL2DcpiLWlmQFSpwkuScFm8D1JUBCcdMKJED4HVJeekFgQKL+bUOTrN0gJdVtlQpQTeBNJez2Cb5BCxg6AgpDwcSR8jCTgvGfddhxHl05BAuAB6dK1eQd+/LVv48/3P4AWQeBKCSkCnRLiMAhK4EOCh9lToKTg80JEBXz76qAHv6PJhyzzGMDcN+e/CpQ86QW6OgxwKEApAZc+Dpk6Ccef9l6ASEhQMOYGnYrCjDI1hgQx5hqKZ0gV/X0CgVeKaO3tOps722azAyklOjo6sGLFCn3u6rGKnLGlRRYW5REPxTaK1NwaNWoU1qxZg+OOO07rRqo5Zv4046Hesl/6simT9DNuR/qaBWM+vthrmsSS2Q77gQcemHXFFVd81o4gi2FFuBx99NFy+/btEfLBdV0dHA0lkrJJ+uoEUEqRz+c16eJ5nj4/ldavWrR97nOfw4033liUbLGwsOi/UwJAz0O1CK9du7anPa9BfKZx/hUjZgJDE3QlAiM449yzMWLMKHTkuiPZCzB4DiXMWrFrK2VPJY0EGt0MnN56EcnhMfaUcwsAM2fOjDjC+lKkILbsr45Mb2NWO8aqA5IkoBxAt4/F/3kL/u+di5D1gWaWgfQ4fN+H67pBZlYZDnxJQrLE39OQRVHsWlNd8sUhAHRLH/M/eSHQkAUI4Pk+pCwiQE0KHT8iB3eM9xcPPvig3oBSJJ0lWiwsKgOV2SGl1OVFRx11VEQTUhGcqkuj4zhDOg8raZfNbB/VnERJUtxyyy132BFiMWwIl3nz5vENGzYgk8lEOhGpXehqti0rNumTmNy+dFFQBJKqmSSERIQU1d8+85nP4NZbbw0cTavab2ExKAu4sjPKtixbtqwgoy6NhEsx5yfoChPWdrgO6OjROPOccyBJQPaagZYgQYaA2pmvdJBPjJa1zY1NYKCwtHF09/Fd73qXJv2GQ2BZav0EF0Dex8NLfo9f33Qbst0cjYSBCYD7PrKOGxCDQhYSBkYGT7F1uDdNolRcn14ymJSuCRcCh06fhmNOPlF3A9MZIfGxJHt/v7SUaj3xxBPYsWOHLq9LK9ltYVGLyGQymnQhhGDUqFFYtWoVDj300EimvMr8ABCJVaq5PkTI+TIzF8uB8u/URjcAM7a0tYsW9U+4XHjhhX986KGHKBDNZDGzO4aqbVmSnkt/VfTj5UOqbEpNfs/z8MlPfhK33367fi/FMNs6ZguLysK0KRs3bsQzzzxTEJxJ3Xo1BTvgRWyNzsQhZmmlxPEnn4gpM6Yjl8uBGV1wAl2IsCPMIJxW5FoJieamEUHJA3oKNYYjTNsPAGPHjkVjY+Ow2ck3088L9H4IAXwBeBx/+eMq3HT9j+HkOBrB4EgCkffAQqFeJcasNF7CSdCndTyt16e3gIkwCk9weFLg/E98DGjMQkoB6jDI+DWIvZwwiJY04sCBA/jb3/5WEHD1t229hYVFdP0xM+oZY5gyZQpWrlyJsWPHal9HPVZtApu6MEPp5/Qn5kp6XdV+Xl0Dz/N0R7iWlhYbaFnUL+Hy9a9//cwlS5Z8SDmilFKd2aECHVX/nTYHqK/q3dTowmCq9StG+SMf+QjuuOOOCPtqZvtYWFgMbD6bO6aqNSLnHA8//DD2799fVK8pDfOvaHZA3BlhDpDJ4pwPfwi5sH1s9IWCzBZqdJlRLXkHA40NDWAh4cIM0dXhBvP74pyjubkZI0aMGHZBZVJ5LgUBIwzwBJDnePFPf8VN1/8IpKMLri/BZKxtNiEhhRAcBGLADnlarg2HhCABGUplT6coHuryCEh4EJhx1JGYcuQRACPwOe83kVLpDJf+Xn8hBB544AGd7q/KPW2Wi4VFBQK/hDiCEIJZs2bhwQcfxMiRIyOEjMq4NzNe0riW9sW+qJIiBd/3AyI7LC9qb2/HtGnTLOliUZ+Ey0033bRGiceqiW5O8KFyREulJg8kPdlUEFftrKWUOPPMM3H33Xcjm82WLVZnYWExsEVadctYtWpV0R3VNAZxSTaIC9WZCHjXse/BkUfPRKeXgy9FZPe7wF6JyrZ8JISAggQBI4AMc4L7GL5ki7o2pmB6NpvVhMtwyGA051GS4DyEBCUUlFAg72PD2idxy//5GWhnHhkBOOEYYoTUfZZU0nhQdolmXHQLH9JlOPf8DwclVU6oe0eiTp7StjbJFfNn2gKkRx99FN3d3db/sbAYJJui4g7TBzr22GPxxz/+UXeEBaDlDqq9PvVVgLcvNkht4juOg2w2qzNOTZJ369atmDNnjiVdLOqLcGlpaZGqhEhlsCgWVnUHUWU31SwpKlePpT/96dVzzA4oJ598Mu655x60trZGgj5Tqd/CwmLgMMkUNcd2796NZ599VutpmBktadXXiHf8UKZdgAIOxRnnng3pMsBh8KFShYOOLnSQXIn4dTODbALZ070n3jeZDB8WJj6WzKzH4YJi3WuUeLDgHKAMyPnY8Ke/4je3/xIZj4PJhOdKADFdl3LW5Fq83oQQ+FLA4z7gMHQKD8efehIy40YDIshwMe1B3NFLIllUjlAayBbGGDZv3oznn39e2xIl4GlhYVGZeRjf4Fbz66STTsLSpUuRyWT0hreZ8VKNz5fk1/Qnzirm+5kVFLlcDpRSXVKkbI4QAn//+9/x0Y9+9Bk7aizqgnCZNm2abGtri+i0mM6nWT9YzbTS/hAoZV/48FzVxAeA2bNnY8mSJRg3blxkwpvna/VbLCwqt6jrgCSci8899xy2b9+eGAgnETVDhZKdiQAQSgFG0DxxAo45YQ468t3wIeFmMxAwxOhQee0W9XKCRIXEiTVdRceg2lkbLlBzKCljzGy/ThkDETJgCHyJp5avxKLbfomsIHAESpIr5YjmltPCOB0XrFBniRAClnHhSY4OP4+G1mac/P7TAIeWXRqkHiNixEtaxsfq1asLgiTrA1lYVG6OKd9HbWircutzzz0XixYt0vPN8zy9ETWUJFF//x736ZQ2jVqDlFxFfGONMYY//OEPcz7/+c9/044ai5omXI4//ni5efPmSHtk5SyplC9FtKjblQh4eisN6I9RSdqxjOvOqPvKuVbdl97znvfgt7/9LaZOnRoJ8uLB3lB2aLKwqBeYYp3mfF29erXWjFK7qqZQbio7mhi7PpRSUIeBMgZwHyec/l60jhuDHPcDzQcBENJTg00M7RbRzxb3pj2N70qp62gSLxS2NMAcR2oNMFOZUxv4V2DNVfMqPqdM8kl105Jc9JS5hSkYT92/Avf/5r/RIINORSKIHgKnGRKSFXa0SBqfxa5vGud4UtkgpRQ+56AZF05DBl3cw/vPPgvIOABBpMOP5AKSi1gWXNQRpFX47L3tUMe/pzVr1kTsc63r8lhYpCb4M2KL+G01R+fPn4877rhD22zf9yOkhJkNEu8sVE42SpJtjtuJ/vhefe1mlFRCTgjRjUocx8EvfvGLHy9cuNAaH4vaJFw++MEP7njhhRd0mZCUEplMpmo7fZVwrIq9Rtw58DyvoG5fGbbDDz8cd911F4444gi7e2NhMQSBr0orffrpp2sqeE0iXoQQ8CGAxiz+5ZST0O7l4GTcYDeHUsDs6DIIdlG9tNqN1+QWC1J2rYUrFM31PA/t7e32wqjrEwriUpCoOC4PSJeV9yzBXx95HM2ZBjAZil5LAcGCUpt6G2Px+UoIgef7OgjyBIcvBQ49bDrGTJ8KQMIXAoQx8PBxQ7k73V+7/Nprr2Hjxo0RzQnrI1lYVMe/oJTisssuw89//nNNRnDOdSmSeRtAoo0pNV+TRNNTERiHG20qq05thixYsMC2SbOoPcLlyiuv/NSKFSsOUQuoasWlyodqmWwBAqZUkSyKKVXGSbHJvu9j0qRJuOeeezB79my9G2wdCguLwXcozNRRQgg2btyIF198MXGep31exuucQSQmHD4DRx49Eznfgy8AxtxInbYZ3OpzraCIitkJQdnBXC4XdFhBWHoUf7u4psswAGMMBw4cQFdX17DevdeZLhIgUoQqRAKEGvMUALgEOvO4+6Zb8c9/vARXPY/RIEurDq5hqfI7Knu6bCj/iRACToBMcxNOPeP0oKxIhJl6ob+hMlxUC21JeoitNNozANi3bx+eeeYZbd9slyILi+rNP2WXv/jFL+Lqq6/W67qSdjB1lRhjOgOmr3Y/bb4V5xyZTEZvijuOozNRR4wYYQM0i9oiXH7+858vVl1BFJNoMqhpdwx7S4tVDpF5TmZQxDnHqFGjsGjRIsydOzdiyGzKrIVFdZ0KxhiefPLJSJZB2olPM203YjMIAEpwwntPAcm6ADPsipSAUbZhvFiE86jU9aWUQkCGbWwJOrq7INGjEzFcPRc1ttT6sGXLFuTz+WFVMmGScckXqch1k6Hrsu8gbv/Zf4K3dYLyHrKxXoJyIkvrKzmG3oI654PdnYGOS2MD4DBA9mjAmbo5xQiewSwt6s/YoJRi7dq1kd9b/8jCYnBhllGrdfxHP/oRLrvsMh2fqQwXAMhkMj1ljgkVCpX2pZJer5LvocgVFcep25lMBh0dHZg+fbolXSxqg3DJZrNSZXqots+9Ol9D4Az3lWgxHxdnedV9sxXZLbfcgrPOOitivKwzYWFRHYciPtcfe+yx+nDoCYDmRsx978nwBQDCQB2m02KTdqCIJCAV7A9ranCZdrOzqwsijKU5Gb6kSzxj6tVXXx3WHViS5pxEILwcUlOIyLn6HODA3tffxL2/uhtZAMjn4UBCClFXKkFUBtdBGCelNmccxwmzfoK5xikw/tBJmHz4DIBSgBLwcN4X29DRJVspmoimft8TTzyhycjBCN4sLCxiNsfITjXX9F/96lc477zztJ+kdKLy+bxe80v5BJWcu4NpB9SmuRJwV9dDrdGbNm3CWWedZQ2RRboJl3HjxslcLgcAunxILa6KVRxKoqUU2dKXya+CGxXgKIOkyKXrr78eF110USQ1z9R1sbCwGFyHwgz0uru78eyzzxYP/lI2J+MEdbSciGDyYTMwedpU+ILrEh4hpW6bq4IrSYxSjvB+pRQwzC4IUkoISHR2d8EH11kuwo5DAMC6deu0QzecSXdi6AtJGusYbrSCZpQBhAKS4Mn7/4i1Dz2CkdkmuJIgM4wyhHTLZBHqmzAKmWE45bT3AdwPSRda0I3NvKZx8iUN0GVSnOPVV1/FW2+9lZzNZ2FhMSiIVxwo23Hffffh1FNPjfxNzVlz87yaREmlX9OsSFDVF0oWwnVdMMbw8MMP47Of/ewCO1IsUkm4zJw5U+7bt09PZrWAqknKGEMmk6kZZyc+2c3dXDMNTbVTUzXXV199Nb7+9a/rc453QbEOhYVFdZ37N954A1u2bEkmMFJuf+J6NGAUc08+CcTNwBc96b+mEFzPyRNIkIq3ho53fwINyOfOXDc6ujuHPdGids8AIJfL4W9/+5veLRwuhHupdU6EZEtAAPYQc1QATIY7jUIAng84GSy+7Q5sefk1jGAZUFH/Lci1rpQQoBJghIAC8AWHzzlOOuVksNYWABKOsalVS+VWanx0dHTgqaeeqkh3SgsLi/Lsi/IX4h2MMpkMVq9ejVmzZvWs7wZR0df1ayCZL0nPrcT6qWIztRHOGIPneTquU+/xq1/96nt2tFikjnA577zzdm/YsEEzhEo1XwUAqiW06YhW28D052/FoNJ948boc5/7HH74wx8mtmTrLSXPwsKiMjDrkAkhWL9+Pdra2nQqqenwJ5GrVbFJpI9OCiWQlADMwTFzj0decEhKIunBpmh3JMCNvddAzlIiKKEUJMiqkcqBcR10+x7aOjoK3me45fSp78P3fbz11ltYv369XjNshiO0qKt5KczbRA8aCuTywJ79uOvm28HbOsE8UTaBGNdorhXNZof0lGPr8r0wo7abexg3eTImTZ8KSKmzhgkLs1soKbjOQJDdIlOy10NjWTlPPPGEPlcLC4vqrE+m76Cy9oUQaGxsxGOPPYaZM2dqH0pl6veF1E1rlyJVbaH8RJXxYsZq6towxqxRskgP4fK1r33t7FWrVo1VAzSezWG2IDOFmpImwUA1FsplU3sLshSTqxhgM6Ax02FVKprv+7j44otx6623Fn0/sybSwsJicB1607FXGQZqF8Oc9+b8rxYZLFQnn1hApA4pCQCqf4IwiPBjTjjiMEw+fAbyxAdhgBA+CAQokeDSB5d+8PpSQkIAREKGByB1kxeZcICQgiP+GEIIcsIDdSgkJeCQIJQiLzjAHOzYu1fruBTR7R0WDq1aOx599FF0d3dHOkgNhyzH+LoaJTiVfGvQxirQFyJ6/aaEau2SYDARbF3/CpYvXoKRNAOm5jcIKIgmsigI1EQJNGIIBAmyvCSIcb/I+K/aAGGQoICkIGCggoIKGtZZUQgOuMQFfEAKAskcEOYAkkISAj/DcOIZ7wdAQSUFczLwhQQPLIHOGuKhfTHFcsPLWdXvP54lbI4HIQSeeOKJiN22sLCoLpT2m5qDY8eOxZo1azB9+vRI6Y0iYFRMp2I+068qFodVQuclHrslbZyVE0ean93UcInrr3HO0draakkXi3QQLjfeeOODpoNZjjhgPMgZTAe0N8XrJLE2FaiZO0xxg6QIGN/38aEPfQh33nln2edvYWFRHadfSol169bB9/3UOfSyiMFWZZgq7ZcQEuxcM4JZs48ByTjgBPCNcsXe3qdSHoMgPfZREqPjAaMQjGDPgf3wE95Nm/hh4rqoa7Rs2bKedr2GY2pRnHhiRptoxpxQhVlgzR9X4n/+8TKyJCBWzM4ZSfpoitA0RWnTkOVhbkbFfZJiAsOGd4Ju4eOoY98DNGQBRuFLAeo4QYtoGutolrLvVtsRQ9tv06ZNePvtt4v6axYWFtW3T+PGjcNDDz2E8ePHR/wSFe+puarioKH+zKVsT19jTJPMOXjwIKZNm2YNk8XQEi4tLS3SbJPcV4cyTTt98c/iuq7OYlG3lWNnEjGnnXYa7rrrLjQ0NNgsFguLlDgMCh0dHVi/fr2e42kp6yMl4iEhAmnbSHthQoCMi7knngBJkNhlQAX6g7qoqCwcLoIMA9nz3pwA+9oPYl/XQfgwslxkz0nLYSJhJYTAnj178Pjjj0fa+9qAsrz5SwmNzhbPh9/egbt+dSd4ZzcaSDD2PO4XZE6oDkhEShApK65hVKlz7G3jR5+PmS1CAE9wvOOdR2Di1CkQIrorK7mIMjVIn4C18pHUz927d+OVV16xA9/CIkVwXRfvfOc7cf/992PEiBHaZnHOI/qUapM5qUPiYMds5baQ7su6G89+oZRi8+bNOOmkk+zibTE0hMsRRxwhOzs7dSceRbakJcOjnPS1UhNTkSuUUnieFxHLVWzu0UcfjSVLlmDcuHF2tFlYpBBvvPEG9u3bl3qNACUgCvRo0OhdlrA70YgJ4zDtHYdF0nqrSbZo8EBHg8pooCgYQR4Cm3e8BQ8iKF+QPaSLkACGAeGivrff/va36OjoiBAtVser0GlOJFwoBaOBUw8hATcD+BxbXvgHHn/wYYxwsxHRQ90K3myvLAFVgZ8m0mWgulGSADTjYvYJ/wLIUJNKSEi/9y5YFNXvVpREDsc7yT3//PN2MlhYpMQ+mVp3J510Eu69915NRKiOPmY5j4qTquWDlMpoMcn3uI/Ul01+sxEBIQRPPvkkLrjggiftCLGoKuFyxhlnyNdff11ntiiHRwhRVieiUmVElch6KZdoiTs+ZhpZ/L4yMsqgzJgxA/feey/Gjx+vHzvUaXUWFhZR4uGFF15APp+PLJxpJFuSbKBZJw0hcMSso9A0qjUQq405HOqcqxHQEyDQ0ZASBABV7X4JATIOtux+G93wNeFilhEJDI+qIikl7rrrrohwvC0pCsePjB1qzVUZUGZ7YyEBIcBEeJs6+ONvl2LPth1wCSBlj5YaYT16azQk+ogESMrkcuP6duU8Vt8HIAlBTviYc9IJQNaFRA+B4RiZQdSwL5Ig0jJ+KM5ZQXUCMYO25557rmL+n4WFRf8R9yE45zjvvPNw66236sx+My4y/ZB6yeBU58kYi8hJLF269MSvf/3rZ9pRYlEVwuULX/jCVx9//PFI2pXqwMA5h+d5/XfEqrjYxgmVyE5tWEakMnYIIfA8TztIo0ePxqJFizBz5sxIcKeugYWFRQoCO0Lw0ksvRZyAtGYY6M4tJAyqQqdGaHsicezxx4G4TqTrkKkPUq1OaBQEjFBQkEgAxylAMg72d7ZjV9t+CABEaaMOM9x3331Yt25dRHA9zeMvDXM1sgbLgKiiCCYEz+fhZhqA7jy6tm7H6vv/iAxztJaLcohhiifKnhI483dpcej74g9FyopYIFY9/Z3vQGb0yGBchX6K7/ugKf6OzcDMzPxav379gHxHCwuLCq3vYWa/2ixwHAeMMVx++eX43ve+19O2Puw+qzXdqrihUCpLML5pHv9duWuRiufiYro33njjGjtKLKpCuPziF7+4QTGcSkQJADzPg+u6qXco4+r5SX3elRBf/FyklMhkMrjjjjvw3ve+NzI54461hYXF0M/19evXa3I4Lbun5u5+iVW/p0xCSrgjW3HErKOQkxwC0Q5LpToDDBZ0C1oaU/UngHAp3ti2Be0yDw9RwmU48C9CCNx2220FGaB2fYiO/2LOruripTK3GAnKi7yubgStuQgeW7Ua215/E81uFg4lyPs5+MZmB0FSGVE6Ml2SAoLefBXTdgkC5CVHQ2sz3jVrJhCKVxMERK2eZzLaDrraGS7Fzi0uvkkpxaZNm7Bz5067aFlYpMh/MokXAFiwYAG+8IUv6E1poKerq7nOVevzlSuQ2xffT9kl3/fhum4k20U1RmlubrZ6LhaDS7g0NzdLUxjWm84xzAAAIABJREFUTI1VaVflOJRJXYrMXdpqOQDm+8Ynm9n6DICuF7/xxhtxwQUX6L8rY1OOA2VhYVE9dHZ24rXXXoso6qetU5EZAOnUf9LT6haEgDKG8RMmYOKUycgJvyC4T6pZHlRHhwBchmUyhm0VUoJLAZbNYNP2bdjT2YZuSPgqApZacqKu8cADD+CRRx7RzpnZDtqWnfYO13UL/QIukHFcOCAAF/B37cWjKx4E4xIsnC+CAJISXUoUmWdIj45LX0qK4v6JCDPgPCnAGcHRxx0LQIKGwY4Kgko5hUOd5aNKs9VPIQT279+PzZs328FvYZESG6ViOTMOklLi5z//OS644AKdkab+ZsZCVfejetHF6svnUkSLqmxQsa25Cd/e3o7JkyfbYM9icAiXGTNmyM7OzoJBbJINxdhN07lIaoc4UKKiPwK55ueOw1TgVg6glBLXXHMNPvvZzxY81kyVtTXIFhZDC2WHtm3bhq1bt+qdCTVfkxbq+M/BcGD68lizI5ogEjOP+V9wGxt0x5Fi2XmD4cgU2GwAhFL4kDoABCFgYWpxjvuQGYZXt2xEDhJdkoMDUF1rhyIjp9IwiROznMvzPHz3u9/Va4bKrlK7hGkj/IYSxTIufN/XmS4qnZsRAsk5JBcggdAL/rTqIezYuAWUBwSGkD48P9dTSpQwdmkNlRQlBROKgBGQ6PLzmHXcMUBYZuiE3RQT34+g6qVGSZ877q+pOcE5x8svv2wnhYVFGmxzbO6atxljWLJkCU4++WQ9n7XWnDHX48SyWUaYdPQn3isVx5m2v69iucqOKkJYlVmZYt9vvfUW5s6da0kXi8oSLmeccYbcunWrrufr78RNq0FJCtgcx9GkSz6fxxVXXIEFCxZYh9nCIu2GL1zUt2zZogUa1aIcD0iSdJzSYJuoCqykBBjFETPfDUmJLicaclIrUMsNuiuRwuDOkwJbd7+NHV374BECjrBLkUz/2lAO1DpoOpVCCNxwww3YsGFDgR4FpVSvKRZ9ICYShkigq8uAA+1Yfd9yNLgZiLBDT4Y5YAjmjxqnos5kmimlYBkXnhQYe8gEjJx0iGauasE/URtacV2jDRs22AxhC4u02+Qw+2XFihWYNWtWIvGhdF/imw1DpXFZSbviOI5e8//+979j/vz5a+2osKjIyvulL33pC48//rgeaLW4IPb2mRX7mpSWJqXEJZdcghtvvNEK4lpY1NCcf+mll3Saa9JOyEDbs1YimEzsHmLs+ggKoDGLI4+eiZyfDlFJQZIDYf13IeA0ZCFdhmfXv4huCHRBhCRNfWQCml2v1O3XX38dP/rRj+D7fqTs1vxpCfuYQHSZ3XNE7J7wPcDjeOqxP2PX5m1ooE5Phx4S5IHFd04Jhl4/qJJdGLkUGDl6FGYc8Q4AgC9FUTtGZPwaDq1tNjuwqWP9+vU2Q9jCIuVQc3TUqFF48MEHMWHCBE1CKDLV931wziNZndXsElkq82WgUNnH6rWXLl166re//e1j7MiwhMuAcfvtt9+mJpCaNOVOyrQvnqUmozIU55xzDm655ZYC8UMLC4sUGz9K8Y9//EPbot4C3jTZqggBTAnGTj4EoydOQLeXT58GTcJ1czIuuBTIE4k2P4cX3nwFeQAeAI76aAttplCrtOPLL78c+/fvj9S7V7tld0078rI4QWOSLkQC8DlAGLx9B/DnNY+ikbmQXlByJMLnCJKueVIJG6PaXQvPhyQEklEcOesowKEAJHgvY0ygNFlaDcR3u9X82LRpE3K5nJ0IFhY1QrpMmTIFDz30kG6YYm5KqwyXanYvKhbXVZJ4YYxF4mEpJX70ox+ts6PCEi4DQjablWqyZDIZXVvdHyc8jaRKqecQQjBz5kwsWrQILS0tdjRZWNQYXnvttUiwYy76SVltVbNJpLBziBlsmrpQAHDErKPgNmYjuyppCI7VwWJ5A5wHnZR8CPgU+Oe2zdjeuRddEPCQnp32gQSMSltEZbdcc801ePLJJyN/T9rZs6RLdPz39pj4oZ0bSgHuAdzHE488jq69B+CSnhp7of8f+uvdXxsTf54m+GSPkGXO93DkUe8OxJEYjdg4M4MojcGaqX0kpcTbb7+NXbt22YXLwiLFUJkrCkcffTT+8Ic/IJPJaP9FPc7UckmT/1KJmJIQgkwmo8+3paXF1kNawqV/mDRpklRqzZRS5PN5rdxcD5OlN0do4sSJWLJkCcaOHRtxtG1KuIVF+ud4R0cHtm3bVqDP0pdWgkP5+XuyciTePWsmPClAGE1VWSOVPSKkhBCAEEjDTkpK4BEJj0g8/eLzaEcePgJNjWKOVy04ZCq7RYkALl68GDfccAM45zoTUgkem4GlFVUPSQCEB+lxVNSqGunahZ5sKPVYTVQSrdaMA5u24KXn1qG5oREQsixCZyjJlnK6MhYjW9R4ogjIPo/7mDx9KtCYDf5GSU3MH5OQVOfX3t6O7du32wXMwiLFUOub0sejlOKss87CzTffrDu3mhpnSrusWiVF1fDvMplMQdlSe3s7Zs6caUkXS7j0De973/vkzp07AQCe5+kJZPZjr+RkqAa5UsqZjwY4QHNzM+666y4cddRREWE3S7ZYWNQG3n77bezevTsy75Pawg9loK+CThoz1hFSJeNi+hGHIy+DXaU07FYroiVJE0Pt+uS5D8oYwCh8RtAlfPz56SfRgTw4ZJ/sc+pIA6Mrw5o1a3DFFVfo7E+1+6fKcOMtNa1GRd8dljhBo4iK4LoSwPfwl0cfBe/OB98BBXhEKyjIdCEyveOpb9epZwwJKdHc2ooJhx4KEECoFuQJL5kmIkoRL2oeqQBu69atdiJYWNQATFKFUorLLrsMV199daTkBujp6FfNtW8wGyGodtEqEUGRSowxbNiwAeedd95uOzqs/1IWrrrqqo+sXbtWp0wrMaRKOMO1Ump00003Yd68eQXnbRX0LSxqA7t27UJ7e3tkzhbbYal2lyIVDKl3U4UPxMgWIYSAUAq3oQFjD5kATtCvLnHVhAh1M3zfRyaT6SGOKIFPgf35Lqxd93d0g6CbSPjE0HORPUFh0Ygb6dB/UePkkUcewcc//nF0d3drQXn1/cRFc02RUIvYuEFy4Q8xfpLI4w3iyvMBMLz87Drse3sXsswJ2kSLwkxWnR1T5XFS6edQh0ESgLkOJCVwGjI49LDpobiLiJ5rSl0WN2xhrTbw1O0tW7bYCWFhkXKY65oqrWWM4Yc//CHmz58f0TdTjx/KDM9Kvq/afDfbRUspNbG0cuXKsV/+8pc/bUeJJVx6xS233HKfSodW9bXFBnC8P3tvg7qv/dbjzyu3f3ux35uK+El1xJRSLFiwAJ/5zGcKzsk6yxYWNRLACYGNGzdqbQBzF7WU8zBYhGqiLTJ+JWhwmL+XACQFxk88BK2jRiLve5CEwOM+BGRQlkMKd/0T7WN4DLRLS9zGx7o895QYSQr4ACMOqKAAYeCMIe8wbOvcj9UvPIk98NGBQEhXvRAhBAIk+roSwecPb4oKkS7xNSLpdlIGjvrd8uXLccEFF2Dfvn06WHQcR29UxLMm1bhMG2nf21paccfXyIwiBskmSVTQVWsEoVDniBBACA5AgBKA5DlkWyfWPfkUMgAYl4Afth2mBEIAhLDI90EGcPR+USkgKaQg+lC/g6SJ/oj5fZTyMwQBPMEhKUHe9+BDIs+Aae88HBACxHEgQCFAq0a2xD9vfC6ZwZlJrqhW6ebj33jjjUG1xRYWFpWf88q3IoTg17/+NU455RRNRKiffamOKDfW682fM9fhePw3EG2tngzLaMales2bb775LjtKLOFSEhMnTpSe55U94MxBbN5PO+KTRS38l1xyCa699lo7ciwsatnwUYodO3aUTX5U3VmRheRK/DMKKQApMG7CeLiuqwNTwmqjrFHKniwDEmq7cEbgMYZN+3bi8XV/wwHk0AEBHraLznu8J6CNtMkOSBdZ4fyW+FiIO4Rq507tXKn17Sc/+QkuvPBCHDx4EEBQz00IiaRRW/RCuhQpeSk2VxAbDoQRfYdJAFziuWf+DupxuISCGeVdmuwCQIagLLjiPhEhEFJCUgIuBXLcx5QZ03vGNCl9/dJgn82NLjNgK2W3LQljYZF+uK6LlStX4rDDDiuY46XmcCXn91DbCtd14TiONViWcEnGv/zLv8gdO3ZUtX3XUEI5x+p8582bh9tuu82OGguLWg/oCNE7peaudq047eZnnDZjOkiYbVhsV6ba55S0U1T2rhGjcFqasLOrDSv+8hi2dexFJ4BOSFCXgaqA3ExloaEgr5QgkAMuCVFZKKYDaG4cmB2FzF347u5uXHrppfiP//gPdHV16cfl83mtc2azIKsxANW8VtouBJASr657AXt27Y624RY9O49DJdg4GPYh3m58xowZQDZTvXqpMq9BsUzoYvpNqqSomGiwJV0sLNLvfzU1NWH16tU45JBDErv1VZMoSco2HUw4jgPP8+D7PsaOHWsNliVcovjUpz7162eeeaZPorD9KSlKk0FgjOn2nccffzwWL16MhoYGu6BbWNQBNm/enJh9Vws2SnX8ASE4dOpUvUOkMi5Sv/AUCXDVfQ8CMusgn6V49Nmn8MybL6MbQCcE/DCgBgVk+C/I9pEgMioYOtCAMEkE3vzMpqP4t7/9Daeccgruuece3Y1IjSnVvU+1wbQYfATXPpgm2m/p6MSr61/W91V7dQpSNNCv5JytVvczGeolqHbshBC0jhqJxtbWVBAu5Xx38Wukfrdr1y7kcrnEx1sy08KiNsAYw+GHH47ly5cjm80OCWE6VPbC9304jgNKKfbs2YOjjz7aOgWWcOnBb37zm0uGS2aLmvRq4k+dOhV33XUXRo8eHSk1srCwqN35vWvXrsjvTNKiFggLEACM4pBJE6HKPIkEIGqjs08pXQpKKfLch0ckeIODl7a8gVXP/Al7vU60Q6ALEpwAngzKjYLrEQTOBcIxA7zO5rpnrgvqmnPOce211+L000/HSy+9pMkWRa6YpUSWbKmeY6NKZSilEGpAEIYX/v4cGAkIPycUNFTzf7Baqpdq/TyY76cz9wjQ0NCA0ePHBnpHNcBLmOSxeZ3a2tpw8ODBXnVgLCws0gk1r6WUmDt3Ln7zm99E1tx6XyfNJgyEEKxfvx4XXnjhH+3IsIQLRowYIdUkGU5kAyEEra2tuOOOOzBr1iy7kFtY1Am6u7uxd+/emtKVihmnIHBqyGL0uLHwBS8odymGNDgz8eAoXnIkpURDQwPAKDwiQUc0YHeuA8sefxjr/rkBPgi6BAcoA0GYoSSEFs+tBNFS7PeKQHEcB8uXL8fs2bPxwx/+EL7vw/d93ZUAQEHHqOHgTKbJoZWyJ0uJgACej1df3oBcZ5fuIoFQqFiNoUrbgmpltegxJkOSSbV/Dserm81i/CGHBOV3NfUdRrMPOzs7sW/fvkQ7YmFhUQOBJ6XgnOv18Pzzz8dPf/rTCMlajfLuoVqL1XmqmFpKiSVLlnzIjoxhTrhMnz5d5vN57Wj2VUl6KB36vnQtikOd4w033ICzzz47MlEGaxfMwsKiOmhra8P+/fsLSh7TQkiU5SgQoKm1BS2jRpbsmpM2siUeICXt9GeYAz+Xh0sZKKXISQ42ogFobsArb23Ct6+/Dvcu/R06vS59XoRSgNKySJfe1gezhWN8TZBS4qmnnsKHP/xhzJ8/H+vXr9fdh1zX1c9XvzOvO2PMZkhWw7ExxpMwWqlDSBzcvgNvbd4ChzJILhI1emodcSLZFwKgBJMOnRwhXMwuZmmZ/6YdNlvKqt93dXVhz549kfOLd5W0sLBIL1SL6Hw+r+fu1772NXz+858fkvWx3M2qSp4/pRSu62riyXEcK6I7nAmXD3zgA3LTpk3a8Yy3uqp3XHvttbjssssiXSiU02xhYVG76OzsRGdnZ4RITrvDbn4qwTlACJpam5FpbIAg6SNVSi48RnvE+E62lBJeLo+sm9HitaAEHblucIci0zICb27bgs9d+r9x4okn4mc3/Az79uwFAHDfD7VtBu6AKQ0WhZ07d+L222/HaaedhjPPPBMPPPCAzmhRgrhmCZFqA62cK9ulqLoOfeDIQwvoQojA5WnvwuaNm8BANKFHw5bjlfZthirzIi4+yRiDJzjGThhfU99hEjzPw4EDB6K20ZinNtvFwiLdUHM0k8kE3eHC+Xvbbbdh3rx5Red2Pdhm5f9QSqGSGQBon2H69OmWdBluhMt3vvOdI9esWaMHvBKXK0Y4VKJ3edLrlTNZik3IuEOfJNBonotZy/3pT38a1157rSaYlPNtd08sLGoXag4fPHgQuVwukq1WzU4lAzbcjAFC4NCpUwGHgUvRY6NF8Uy+3s6vWvbNbMdrdlRRh5vNIO97ERFcs8PP1s1bABC8+sKL+NY3voEjjzwSn7z4Yvzh/vuwfecO+L5fMrsnqXNSXDRZCIHNmzdj0aJFuOCCCzB79mx86Utfwtq1a7VOi0oHVuUp8Ra2aveqloPB+JiplTWwR/+j53MHui4Er7y0Hi5l2tk3Cdf+ZrBW0v/py5xNQoY5Qcv1sAOTgISAxKQphyIucKSyXAY706VUVyEzQy8+h9RtMxNp27ZtRckx66NZWNTu+rJs2TK85z3vKVib1Tobz0KM+zrlzv+k5yT5TUnx40DjXSklPM8r8A2klNi0aRM++MEP7rAjo/7gFPvDT3/601cVuWI6j5lMpmolNQPtx97bY0yRvEwmg3w+DwA499xzcfPNN+vdSVsnbGFRXzhw4AB83484/aZAY1qc9qQgSBIEZTMORevY0SAug8zJQKRVff4acbSS7KqUEpyH3wULAy2VgUAo/FweO7ZuC4JJ5oISiX379+G/l9yL//7tEowZMwZzjjsec+bMwYknnojDDz8cY8eOxejRo5HNZrVNVyS653kQQqCtrQ1vvvkmXnvtNTz99NN47rnn8OKLL6KtrU1nr1jR9Bpy5GPUghLRlRLY9sYm5No7ATcgyiQhoDLIpHJdN9ADSgn6Y4tMMlNlu3Ah0NTSDDgM4BwIuFnQFJ1XubZ3//79ia9XS50wLSwsoh0BCSFwHAcrV67E3Llz8dZbb+nNGLVu10vZZ6nrsXLlykPsyBgmhMuMGTPkxo0bkc1mI+33VEp0NRa0/rCUxQZv0iQ1d1VNXZZZs2bhl7/8JRobG7VzrR5rOuoWFha1i7179+pykLhNSCvRUmDXKDB+wgTIsPetlBKMUvgpdEb6el0j+g0EEELCAUGGMnQc2It9b+8CvMBmU8ogCQVhQWnPwf0HsGbNGjz88MMAgu4sI0eOxLhx4zBmzBg0NTUhm81CSol8Po+DBw9i9+7d2L17N9rb25HP5yMZjeb6wBjTHYjqFTUpIl1q7MWngwR2vrUduY5ONIwdCY8LEOUHKBHDWj9pISPaJ8x1kOc+Ro0ZDWRcIM81GxUWWkWu12Bnu5Ty28oZe7t27Yo0cSjW0cjCwiK9JEux30+ePBm///3vceaZZ8LzPPi+r9fdYplyg/15K0n2lNPYYMSIEbKjo8Mas3omXD760Y8+s3z5chBCkMvlIoQDY0wTLkO9qPV30Md1aNSizTnHmDFjsHjxYkyZMqVnVyhMHQ8ce1qXDqmFxXBDfIe0FuY2KTSCGDV+bFAuQGIpr3JoxDDLcS56u76EEFBQSAIIAkjRk2HoUoa3du2B394JCIDSwJ5zKeASpnVfVGmSCsR2796NnTt3FnQ8MdOV1X3VWcjMbDTHR7U2HWplTa058kUCvL0Dbfv2o3HcKEhCwGIlYWmYM72VSpf7fNPXaWgeAdLYANneXfz61AD27t3br+tiYWGRvnUnrp9FCMFJJ52Eu+++G5/4xCcAIKKTVk07PRQ+IWMMHR0d+OAHP7hjxYoVE+0oqQ8UZJPed999c9RgzmazYIzpwa1YxqFOqa4Uw6gccyEEstksbr/9dhxzzDHaSTHJFvO9bY2whUVt4+DBgxEnPe3OevzTKZvcOmok8jLIthBIPxlcVrCIQLeFyKDFLYIYWRPlu3fuBDwPIARcBOeuOgL5+TyIlLr7jFky5DgOMpkMXNcFYwyu62pyRREtaoPBJGHUGqDbC1uyJf3nEx5EHdIgEySAzhze3voWIKTOXOWyfr5bRR5GNA8ogZvNoLF5xIBFpYcabW1tBX6oLSeysKhNW5W0/ggh8PGPfxwLFy6M2LHh0CVWJQKsWrXKlhbVK+EyYcIEqdhD5cB6nqedUZXSNVS7QJUgO0xxJLOe/5prrsHHPvaxAmV/AFrbxZwIFhYWte2w13QtsJQApRjR0gKf80g2S5qsU5I+S2/lBJoEk1ESBgja/e7euSv4jZQAISAsEAUFJSCMBRkL4UaBsteKQFcpyao81syGUWuBcu6UCDHnXJeSqh02S7bUvJePndt3aMKNy3TpNw1Uv06di5ndou63tLTU/NfX3t5uFzELizqDGZ8pP+Daa6/FRRddNGQaatWS0EgS8RdC4PTTT7c7/PVGuHzzm988Zffu3ZHe4EIIvQtolhKlmXBIUqxO6rGuSqYA4LOf/Sy++93vFtTrq3bQmUxGM6tWv8XCovZx4MCBgu4Y5u2aQCaDES3NBaLeafn8fXVUkh5PJMBAwEB01svu3bv13xljQemRECCMgWYccCngcT8SQJvrQJxoia9rStsnXmLi+37dlhMNB0dHeS0EAAjFnp27gjFBDHJCyJopq+nVgZdRMXA/nCMtra3RFKCU2YZy7NfBgweLdiaxGcgWFrVFsMR9F3PjxfM83H333TjxxBMjXeUGYj/6S4hU6rXL0XABgkqLtWvX2oFSb4TLXXfd9RdzUKlWyJ7naedUZbsMRYZLfwZ6qUGtSJV58+bh1ltvTSRmpJSRlHOzNaGFhUXtoqOjI7Kwx7sUpR4EcFwXjY2Ngc5Jyj5zscyWcrIUC9othkEwIwRESHQeaNPtbjnn8PJ5ICRIct3dgdaL6wZPDXf2TeJFCd8qQl05cer7V5mcquxIETFmG+h6c3jrHSI8NHJ57N29B8LzIXlPG+I0dqHqT6mMlBKShO3XYQjoMorGxkbjgbHnkeppPyWdU7njsbOzM+KHWsLFwqK+1iE1v9Wm/9KlSzFt2rRhM7+Vzeac4/zzz3/ejpI6Ilz27t2rd/XUBBBC6LRqdTvuEA923Ww5bGaSI2+miCdNYikl5syZg3vuuQeu60ZIFtPBHqjjY2FhkT7ENQBMvYNUOCBh4KO0JyIaFABACZxsoEeiCQMUpuP21+Zq7YsiB4zHUEIKjlIkiqmbk7SGiPBcJAlLPSgJgkYJEC6wd+cu9aJBGRGlIFKCSAlGWSRLMb6GmN3m4hoX8XVEOTvxzKekx8fXGfN84t9HmhzG3tbwcs4vzSSOSuRQ80mTCRLYu3MXCBdwwv7IUkpQh+nyov76KmZ6uDmWzGvTl/LofpVS0yBzx8zgUh2/Wka2Bg+R0cwfZXeGkjxK+nvS+Xd1dUWuqem/WR/NwqJ2SAXzp+mTmUL1QNC56He/+x0ymUzkOabWWty+qqOczJhin81c8ytlW3pbTyMd5hjD448/fqwdLXVCuLz//e+XqmRG7RrWOswsHdP5USTKYYcdhnvvvRdjxozRO53xCW9hYVGfyOfzRRe9mthBkRLMdbQ9U0FiwU5+rdrvgMkpIAQkF/DzXqFzVIyYGsL1p5QzVWsOcbHzSyKS0nh+BZkbEsh1dUPkfTiEJnb1qcZ1HCxwSHBEsz4UAeNkM73PvZRDtYotFhxZWFjUdvyWdHv27Nn4r//6rwghoeZ7qXLf/jRHGEw/sBjxHN/gUHH5gQMH7KCoF8Ll6aef1sREGlNqB0K4AD27S4rlbGpqwp133onDDjtMPy7eCtTCwqJ+0dXVVZRoqQkbYAiZ17PDFc+G4Zyju7s7FUREqaPY2Kpnx7jWAt2Ojg7k8/lIufBg1f8P1TVK0kbIZrM1P+5MwsWSLRYW9QVzHptxnOu6uPDCC3HNNddEslXj5AspkmXbX7sd90UqvS4k3Vcac+rc58+fb8VcahwUAHK5XISgqJcsD5UObrZ4FkLg1ltvxfvf//5ICYGZCmxhYVHf6OrqKhBTrSmnPRQ3rwUh80oRL4pwMbvGpdlhjDtotUq6lFs+VFNrJyHo7u7WunTxspRKjd2hKiUjJcr6lL5RLSOfz8PzvF6DGAsLi9pEXBJCrf+MMSxcuBAXXXRRgfC9EEKXHJW7hvW2rg02CR+3z3ECWWnHvfDCC6faUVHboAsWLGhU7TJVyc1QtX2u9GRVu1a+78NxHFBKceWVV+KSSy4pcIgs2WJhMXyQFLQP1g73YAWMyqaVCvJqFUllOCq91iwlSHp8Wr/DWv5eknQ1il33WjlPPwzalZ8wWMTYUM/J+HvXA+Hi+36EcLEbZhYW9Yck8kHFd4sWLdKdi5RmJ6W0JjZkyj1vlb0jhMD27dvtgKhx0DfffPP/qCyQeuvAoIgjNRlPPvlk3HTTTXoAx0Uz60G7xsLConeone2kgKgmnHYh4DhObWbnlOlwFBPQ5JwDMXHStKHYDlYtf0e9pWyXOve0ziFV95/UjrSS46DaXXTM941n8dZDGaJq0V4sOLOwsKhdKD3RUjEdYwyrVq3CkUceqWO3YqRrX21utf3BuMivGYurn2kopbYYGOj27ds/r5jDSvYZH2pkMplIXd+oUaOwaNEiPVnj4sDmILfEi4VF/S/o8U4i8fupRkyjqt52d+NkSlLnl7STEzVFPvTx3GqecCEEMIQXzc9diXlUjASt1rVJsm2lApJatN/WT7OwqE8oUjguIBsnJ1pbW/Hwww9j/Pjxke6ySXZ2IKRL/P0r7esU839UvOo4ji2XrAPQ/fv3Z4Bgx0DVx9XDF6vSyoQQmDx5MhYvXoxp06ZFFuxibZ/rVYjSwsKicEFLCu5rJfCVCZke9WC/k8rI4JQUAAAgAElEQVRae2thnLbvpqYJiTKdxFotKSKUAkbb0STHvqYdu1i7c/M7qmfHvd7Pz8JiuPlopsaWmfmhCJZp06Zh1apVGDlyJBhjiURsf2z7YK5j8TUnyf8xy4lUzGpR4+uy0m5RA9i8399B098FbyA905McDjUhDz/8cJxzzjno7u7Wr22SKvXSmcnCwqI8G2RmhZg7waaI7lCLXJY8N8Nmx4kXZdv6EvQPVfeUYnAcp6jjVEmNsaRuSOrnQK5Jsdc1zz9tBFJ/Pk+tlrNJzoFwfCmxxfjtNKLc70cY5VLxltfKfgwFMRFPnR+I7TC/J9upyMKifqAykEvZQDX/Pc/D7NmzccoppxQlJQbSFro3Mr4/dqwcO64e4zhOJBPTooYJF9d1dT2cGsQDyfBIy+6CqXD9l7/8BQsXLkRDQ0OkbMh0is3F2+6QWFgMH8Qd91pZ2AarBCIt5xYnvhQx7jjOoF1La/uHEYwdU9UJol40TkoREfWSYWXnrIVFfSKeqRK3Xb7vg1IK3/fBGMP3v/99rFixoqQtqCXCQumOqnNVmqMLFixotKOjdkEbGho0e1aKVezN2U9jKqdJIi1YsACPPfaYHsxx/QPzvoWFRf0EGqX+npSdVxMLc2ivTZ2qekqnjxMu6jalFNlsdlACtloXtbXos1era+PjAvr1ZgPVOdZDcwBbNmRhUf9QxHd8c9zM+nAcBw888ACuu+66miFgy/l8cXkPRUBdd911XXZk1LDLMWbMmKfU4I2rIw9WsFMdX4pGWl0TQnDppZfi7bffjkzcpPO1DreFRX1DtUaNZ7nVDOFKCDzP67d+Sy3YuCRS33EcNDQ0VM3xsahfEINwMY962nRJmudJbdVrLThRvpudxxYW9Qdlg834TWV6mMTKG2+8gc985jOanFGPTaO/01ei2BQBtjFpfYDOmDHjWjOVthI7vHEHJumo1uCWUuqJun37dlx66aV6QivHw9zdslouFhb1DzNLopgafdrheV5BcFgvnebiNlmtS47joLHRZtVaDJiJgOM4mnAxydZ6IFziWW+mjfM8ry7sg21uYGFRr+aZRGI0lc2isvSAgDi+8MILceDAgZJaYmkhW/pq38xOmr7vI5PJ2IFR6+vWz372s0fMjj59JVzS6tyrgeq6rt4NEULg4YcfxrXXXqu1AJKcK1tWZGFR38hmswWdilSpYa20hVad5eKORT1kKMbLIcwuBa2trRV/D/O62R3zYQAp0djYqPWA6q1MJSnoUOfY3d0N1EAZYqnP5TiOzlK0sLCoN/Mc+GOu62r9EiCanXf55Zfj2WefjTRC4Zzrx6ZFj28g4uCKbCGEYMSIEXZg1DgoADQ2NkZSaetFVI0xBs/zImnDAHD99dfj/vvv15Mznnljs1wsLOob8bIUs0tJLWa41FvKaVJWpDrX8ePH2wFsMWC0tLQgk8lEyLxaEs3ui5NvkrHd3d0VCwqGCpZwsbCo48A0QVNLZbkAwE9+8hMsXrw4EreZGqS1bsOVNp9ZVj179mw7MGp9XAPAjBkzIrVyfVl8K9Uma7AcjkwmA8/zIjW/lFJceumleOmll/Rj4+0TLSws6g9qnsdLitK200tkcJQ4EQifayeDov/nkEabp/S3NAmOUGMHEiPHjQEIIBN8Klnk98XGQtJ1sGtAHczz8FBjIgkjRoyAk3HBISNC+vUA06chEvonEJYUEUCQZLtDkf5ghTFmS4osLOoUnHOdvauyPJR9XrZsGb7zne/o9VvFrWZGSJrscL8C87ADk8r0EULg0UcftUIu9UC4nHvuueeYwYgaKEm7JPEdoP4KFCV1Byn1PuU6zeaAVTWAcUdKSomDBw9i/vz52LFjR4Fyvy0psrCob6iyFJU5Ye6iFAteBnshLmX3TCKBEAJwgXxXNzzPA2MsOAcJOEbgWGyxD34v9EGI1D/V7XLtbl+vS7l2nVEXUhAQsCAyFASUOvAhMf7QSWE0LSEkgRCABAUIg0D5pFOxLIDBJOD6kkFhCaHer2Oi/yEBKimIIJBSHWGWFMJrRwlGjRkNSQDCKCQREOCQRIA6JDI/zEOS8o7eT0AARECC60P9rj8HoTL6OxSW5anU+/b2ds1KSdU8AESTvIM5vvo6/pPmgJQSmUxG73YrX68vXTYtLCzSbd/jXXoA4OWXX8bnP//5gu6Mpr0rhzjvS4xZzHcYiI/Q23OVH6oqMKxuXR0RLjfccMPqTCajhePinS/KHSR9nVCVnJz9waZNm3DxxRejq6tLT2gzEyZpclln18Ki9tHc3BwJrM35X42uZcVeU+uV9JbhIgF4Hrq7u4NdkD58zrSq+McdDu0UhaUeQgh4EBh7yATAdQBKgNjnppSCsPrIVChFCFmgJPlEJBLzNPScogRjxo2FJATcWNvVOBuKAGOw5pC6zQgBz3vo7uhMvl4ydo0G4bsaqA+lzqexsbGgpMiWgltY1ElgaojGqnm/c+dOfOpTn8KuXbsGff1Iw/kr/RoAmDdv3qt2VNQJ4QIA55577qvltkWt1CA1F99qO5FqQj/22GP493//dwBR9X7zHE1nzDq7Fha1j5EjRxYNeBIzTNK4MPs+Ots7wED6nDFTCyCE6LIH6jCIcJd+0qRJcJube84RBJASSOjIYlG/KDUnJQFk6cGFyVOmRMqN6i2DKO7LSSnh5fI4ePBgTZ+XEpA0CZd4draFhUVtQ2W4qOqDL37xi1i3bl1F5ncx4jdNQrumrtiyZcvebUdE7UMTLsuWLXu3StOs1g5PJdt39fW5KsWWMYY777wT11xzjU5RBRApMTJbkdkF3cKi9tHS0hIhe4eS/O2rXSESIJQCQqCtrQ0stE/l7h6nsW1iqc/IISGkhKQEPudobm3BuAnjC5ykuLhurQeVSd+NXXsGdh2IDIkYCkw4dBI8wYfcyR7MDLr4RpGfz6OzvWPIzrPca91bNkxTU5MlVi0s6hhKi4Uxhu9+97u47777BnVDJU32RBFNQgice+65b9vRUB+I5GB++ctfPsf3/aqLkVWqVKc/9fGccziOg+uvvx6LFi3Sn8ckX9IalFhYWPQPI0aMiNgcM/2+FgJcQghAKQ7u3w+HsqJCl/HAPZ7Jk2a7Zl57XwpIEvykDsOUGdMBKSAFLxA9t6SEBRCorhQVUM5mMGrCOHDZM+8ZoVrLpJoExKA5d6G2SVBySMAIRa6rG7yru+a/26amppI6gBYWFrUNx3FACMHixYvxgx/8AISQgrisXqF8Gdd1sWLFiol2NNQHIoTLDTfcsHrmzJmRDhGDvYgNxm5rua9h9nZnjOHyyy/HypUre91VtOSLhUVtQ4nm9sVhH+x539vrmzoLUkqAEOzftQcMhTY0KdDsrWwqbeBhUYgSDJbhbY9zvOPdRwIOi3x3KrCsBy2HYuUtdu3pHQIyUfZZEykEaBo7Gi1jR2sNIDMrqhrjpxrfYzwr1yEUB/cfAHJ5XW+lzlSS6ozpvmThlSKkkuy3hYVFfWHt2rW44oorNAFhVh4M1pqblvVfCIGPf/zj99pRUD8o8Cxefvll0tDQUNWBWKoz0qA5ZYaDZb7/v/3bv+Gll16C53lDLqRnYWExOBg1apQuFSyn81rVF9xYe+P4rruUQW3Errd3QvKeriTSyGSp5Tb38dRhSikkJRAAcsLHkUe9G2jIAowWrBuWlBi+0ERVqfbgBDj0sOnItowAhww6FYVrvOSiahkuVZ1DQoJRin27dgOelyhwo4lNkv7zGjduXFE/0s5/C4vaxz//+U9cdtllaGtr0/IPlSopKtoNMkUZslOnTsU999xzsR0J9YPErZzu7u4hXbGqsWCawRYA3aFpx44d+OQnP4kDBw5EVLIt4WJhUT9oaWmJEBKmTlM1Ftyi3VX6UmYgBPbv2wfJORiILgVNsxhcX64PYyzoRISgM7QkACiBgMTk6VNBG7NhhkJUe2cwd8GGch20baH7NqeSCEtJAsLlkCmTQbMu/LAkTaWq19XY4SJCJgFA2979gMeH7DMN1A6p73jkyJGJLWEtLCxqH52dnbjkkkvw+uuva7+Gcw7XdStqo9NqNyil2LJlizVqdYaiubPnnHPOHpPtM50SEttFjTs7fRVFK1WL298FOv68+PvEOw+pg1KKf/zjH7j44ov145TOi1lqZWFhUbsYNWoUGGO6fKBYh7LBEsvurS10yefq1rYUu97aAcIlCAAZOiJJOi2DbbfKtdFxu1/sMwkCbW8BaC0KAPA5R+uY0XjHu44EhA+EO19CiCATJuE100pWxAPG3jR3bHBZfDxFxo+hzaLKhhRhBwoc9b+Ohuf7kGH5XT6fh+M4cBynIruovZWC9adkO2lsFPWPuNDznpCAjHUow1vbtgGk0O2rRmZLOeecZBuSzm/ixIlFdbcsLCxqB+ZmtiJTPv3pT+PJJ5/UZIta11Wmy1CtK73FpeX4NvHHmcSxyuK59NJLb7AjYxgRLitXrhw3depUfZ8xBs/zIoMjDZ09+kvA9IZHHnkEl112mT53NdFtpouFRe1jxIgRaGhoKOhUlHZbFjHYPkfbgQPIdXUNCZFQKTKqnOdSQ79GEMCTAu9+z9EAo4BDQSgFYwym6Lu5TqX1O7UBYxWubUjWBc6sABqymDhlMvKSQ0AWOPSDMZeSCJhqZJ2p85JSAlzgwN59gFDpPkP33ZQiRdX1YYwV+JsKo0ePrumSSQuL4Yz4XDcJh6uuugq///3vIySMspXmJkwtx5lqs891XQghdDKD7/uYO3cu/h97Xx4nVXWm/Zxz7q3qbpodWQU3FFEUN8CN0YRRMcmYxCVi0GBIcDeJE82YGANOksmX+GXM5hYdNTpJZibj56jJuMUYDXHBDRUVQUREkC0i0NBdde857/fHvefWubdudVd1V3VXNefhV7+mq2u5yznved/nvO/z3nnnnV+3o2Q3IlwA4L333mN6QGiyRbfq6iz9vhEWwa4mBRHhnnvuwXe/+93YTkpvd3CysLCoPgYNGoSBAwc2fODbvqMNbdt3BB1WOC9qYd/o5IEWCk7qauSUj8NmTAMyDiAlVFgawjkvBJSW4Nid2ZZgcyQUlw54FwUIhiHjxmD02LGQUhYEcnn/Kk/R52BmfEkpsXHdekCqPiVbyg3I0rK7eEisjh492rZMt7BocPuk40pd9njTTTfhpptuAhEhk8lENtrM1qsHUfyeZgzrls++74NzDt/3wRjDiBEjsGTJEuuk7I6ECwBcc801LdqR14O/VNp2IxIrnb2PMYaFCxfiN7/5TSrZZGFh0ZhoaWnBoEGDYjvAdZ+lRwm7JgSQywedisLd4L7c9a1llgun4AEEpQ956WPCvnujaY8RgMMjJyZtbbKB2W7q0BsEisMFSCnAFTjg4MloGjgA0pjzRKF4ruC92ikxzYmvxvg07Zm2C7n2DmzasLFu/bJkxlxathFjDK7rYtSoUbH3NIL9trCwiMPUZPn973+PK664IspSzefz0Qa3rjDQWayNHnOaxJFJIG3ZssUasd2ZcFm4cGH7xz72MSilkMlkQERFA74zDZZGWNxLkS16x/SSSy7Bk08+aRd0C4t+gkwmg2HDhhXZrHoNxlO7FAGA52Pd++/D5SIS/u4t4c9qX6u0YFMTLaHWKRgBCoDPCG5zEw45/LAgg8F1CiVFjDdkAGZLJKo7lrgQAGMgHbgLDpDClMOmFnUfjAnog/rH+RuOvCsEtm3divbtO8L+6vHXqzo9h7SmBc3Nzdhjjz1sZzILiwaGMko9X3rpJXzxi19EPp+P/AAhBBzHiV6n/RtdflPPtrcc/1Ofp7ZtF1988QI7KnZzwgUAHn/8cTZmzBjk8/loEW+09NueZLq0tbXhvPPOwzvvvAPf961TbGHR6IaPc4wbN64o4GoUUWzGGKAUwBjWrFkTO/beSLlNlpRWcx2QiWgw7ZOJMeRJ4u9OPAHwPYABLDxvMzhLEi/9odzVooJrmLzfA5px4CEHw5N+NE/MoL43yMpS97cWui5mULNu3Tog75UsJ+pN0qU7peiaIBs+fHhRlyLzM6zOnoVFfUP7KYwxrF+/HvPmzcPWrVsBFDQziQi5XC7KbDFJl0ZHLpeL2bRZs2bhxhtvvN2ODEu4AAA++OADlmQWk852f+ngY2a3aMGmtWvX4nOf+xy2bdtmR42FRT9Y8Pfee++6DXI76xrCE8f73up3Y+WevaXin0a8VN0WI67jwo3r0+F7OPCQgzFg7BjA96MuRWnBre3ws/shcsx1YM6A/adMwYg99gjWdYOMk6BeE7LtTR/GFKN85+1VAUlLjXH8aSQyEWHChAnIZrNd2iQLC4v6nd++78PzPMybNw+vv/56zG/RHeP0c1rjRGe81KM/WUlJqCaQiAgHHnggHn/8cWu0LOESx7e//e3B5ahE95eOEFosV+8QLV26FHPnzo3YSQsLi8YNxrTwYnKRrHeHXQUrPCAJ8BU2rP8A+Y5cIJwL9FpJUfI61eq6mcSTdrUkKXjSR/PggTj0qCMApktBOISbvjFAREWlWcnP70uHzaKTsUalBZTTJwlFZAtjDIoR4AgccfR0+BzwQfBBYIIXtEJEQXi61ve2mnotnREujDFwMAgFbHh/HSADLQROADdyWnilzmANfLG0TDRTKFM/N27cuKL36Nf1F8LMwqK/QwiBiy66CI8//ngkVeE4TtSJSJcX6TIiLS5bbyVF3bHhWpNm6NChWL58uTVYlnApxqJFi7afeuqp28zFzmynqAeSyUB2d/GrlDGsZKHvqlbe3Ckx25ExxvDII4/g4osvhpQyUpo2P8s6zhYWDWD4OMc+++wTm6+N0PpdhpkvHATOAO4IbP/gA7Rt/RBcSTBG4KJ8MkRn0iQf3XE0Yr8z1bNHFDdT8ACFx8ZBjIMzB25zC3ZKiZmnnAw4DgAOxh34frgWwVhDpAqD9YB0ieqnUfh88/W9TiiUKHtKK4naHQJKcxzqzKbg3gUPKIqEbtPGLRFBsKBjFYXdiTCgCVOPnoa8APIuwRcKPvnBnOGAUj6IZPCTAcEEYxXPi1I+h3mfuyQHlAQjFZ57QJpEZJMi43de/ICAAgcTbuCjKYLr+Vj/zmqAA4r82ByLrrEqfF5vBitpfp7jONHvOtDS123ixIm9RvZaWFhUDjMuMv+v5zERYdGiRbjjjjtinRVNolVnt+hKgzTdrVJrZ1f2tdzYsqty5HLW41LxIeccW7dutYbLEi6l8dBDDw2ZOHFiNIk06WCmspupYY1KQOjzMTNc9Ln86le/wnXXXRfrDAIU+sVb0sXCov4xduxYMMZi9qoeWg4mA880ckQqCSiCyuWBvIf3V6+BKxxAUa9luNTM9qZloaBQCUGhI5TP5+FBYfLUQzB0rwmAw0E8cMgoZWnjDXYd0rKudtf1hYgi4eTyHBsGpds+cw5wYPJhh2LY6JHIhYSKKmfcVXmzpzevV6TfAoZtm/+Gze+vB1jo15ACo74nlktdEzPAklJGApoAsN9++9nFy8KizmFKM2iiRJcE3XHHHfj+978fPa+7j0kpkclkShIdpbLgamVju/vZZlzoum4sA09/7oUXXvhFO0os4dIl3n77bTZ48OBYfa3O+KiXPunVcH60QK7p7GazWRARvvvd7+K2226LZfRoUsbutlhY1D8mTJiAlpaWaG5r4qUh5q+5e+NLrHjjTWSFExESvWU/+yojxNzJ4q6DmX//cYAklO5OkwKF4iCbUVwnRj9Xr8RLf3LG05zTzuafJt0UirNNkiVHxDjABIKlmQGOi5mzZsFtagaYACMOTkEhjWKF/5vFNdW87r19D3Wwo8mKzRs3QbbtDEhav5iQ7UkGT63PAShkTjPGsO+++9rFy8KiAey7OYc558jlcvjjH/+Iyy+/PNrI5obYfbltn/tSky1Z7ljKtmt7lYyLiQinnXbaql/84hd32ZFiCZeysG3bNqbTPjnncF03GmCe53XqaNSLA9lZypkp0qQnleM4yOVykZjTxRdfjEcffTSaSHpiWVhY1D+GDh2KUaNGwdSlSpYTpe1w9Lb9SguEGAtKHZyQZFn5xnIoz48cm/5KCpBx/q7rIpfPI+97OPHkvwcGNAPKB/HKbLBJsNQb2dJoHZZqgaDcq0CYlUsMRNdOcLSOG4Mp045AW/uuQKeFAEG9M577MihwhQNHCLy3+l1AKiDho5jjva9Il866Nmn/UmfsDBw4EGPHjrWLl4VFnRMuZumPJlGWLVsW6WCa5IpJXHSl79SbNrbTsukyvl9vSOnrQUQ49NBD8cADD0y0o8QSLhXhO9/5DtfkhGYrlVJwXbcuCZZKJqtmXn2j+4Xv+1Hamw7S5s2bh6VLl0bsrIWFRWMgm81i/PjxkY3SC2I92KvOxEEDGQdlZNNxvP/uGrRv2wGha5fLFBktW4S0Quckqc1QqSYXp+ChWPAoCsKNzEKPFEaOH4uDph8FNGVA0i8ZTCaDyorFWHsxYO7P2i1pYyX5t67GSlfkgFIq0GERDMfNOhGDRgyDH97kQK8kvYyoXzh2nBcCHgKWv/4G4EswHmbxoTizq9zr2hs+mLkrrjfGOOcYNWoURo4caRcvC4s6hqnpCQSaTO+++y7mzJmDDz/8EACi8iGzC5n5nloSKT0hXcqFlpzQtlgphREjRuDVV1+1u/KWcKkc1157Lc2fP/9HmqnUA7MRNQSSE1uTKubEMcWBdfnQ5s2b8fnPfx6bNm3qF/3hLSx2B+j5vs8++0ROfVqKaClBtl5f9NOyXAQPywMYdn34ETav3xDouNSxE9JjR84gYKSU4K6DDumhnSQ+ecZngigyFDqt5rXu6/WoXpzPvnJyk2RZ6nyghEMjOMAIYvBAnHjKSWiXHkRYT69fD1ROulQ69vtirkREhVRgvsKKN5cDhE5FwRX6tmN0mriwDlZ0QDZ27Fg0NzfbBczCos79K93xTSmFrVu3Ys6cOXj77bcjQWxTv8XzvEjfJa0LUV+vh12S/4m/JZvJOI4D13WxZcsWS7ZYwqX7uOOOO/7p2GOPjYnLmgPU7ApkPtcIBsN13SizxfO8KHPHPEfOOd5880185jOfQVtbmx1RFhYNhClTptRlO9FOs1KCFb0QVxKAvI83l70OwXiqsGhyJ7so40QlHjVyTMo+/y7+HrWJVBJOUxY5SEw+YiqG7rtXbFUrOu+UsgmeQrb0NEOnVsRDXwXwfTH+0zIvyi17IQBwOCAYpp9wPMbuPQEd0kvNcOoN8qS3bYvneXAYR8ZxsWXDRmx5f104t1XQvckY+4zi2kZ9Pbo663558MEH26YEFhYNED+Z9vJLX/oSXnjhhWijmnMetYDWsZaWcUi+tyvfzNwsq8V5dFXymPZ3szJCx5AXXHDBAjsyLOHSY/zlL39h+++/fySe2+hGwnRafN+PFPL1BNJOt9Z3cRwHL774IubOnYv29nbrEFhYNACICAcccEC0y5IkjevmOEs8r5SCwzmUDDoWrXpjOcjzwRT1yrVLOiW9GVR6+Xy0i5/z8mj38iBX4Ixzzg4C7QoORXUjoO+t62uOy74K3mt5jp2VFiXJls7IGfNekq6XURIY3IpPnP5p7JJ5gHMoxLt4VVJO1tN1vTf9Ah7aBZdxrHjjTWBnO8CCjLjOjkPV0dDSJIvZIXLKlCnWv7KwaBD7zhjDpZdeiv/5n/+J7Lvv+5BSwvO8WDxllt90lk3cG/O/p98hhIiyCT3Pw0knnYQbb7zxdjsqLOFSFaxYsYINGjQoGqymQrPepdDBjHZ4ko5kPWS/mPXCWsfF1HfQ2i1mRyL9t9///ve47LLLQETI5/N96nBZWFh0PdcnT56MbDYba0Pal6WBEXHB00kMVlCNjWyTIxzAV3j9ldeQ39keBpCUancE4+BlsBFdZXIkS60qzfwoJ4OEoVDukbwWendMEcFxXUBwtOXaMfPjJ2LYPnsDjoiTJ8rItlSqZACvO+F0RbqUo0HS03GQXBf72/qRtptZ9P9SBFiiLCggWyjQbOEsqi866sSZGLPf3vBIgQkebZCY80vPh6C7Uel7311isZY7sKnHF84bDoYm5mDZi0ujgc0YAxO8iMSttcx2d8qwdHMC8/x0RqKFhUXfQsdxpfS3GGP44Q9/iFtuuSXWoUeTEaVaPCcrI8zPM7Pf0mxsuT5JKc2oUn83bb/2Ec2SKXONTq5phxxyCB577DFrtCyqu85u3bqVZTKZaFfCHJQ6S8TzvE67fTSKU6nJF7P9IgDccccdWLhwIfR1iJxBq+9iYVFXUEph9OjRGD16dKwldL3ZoORKzQiAKfCrFCAVdny4FevfW4uscFL1EPQ5V0qM9JV9TV2wQqFTTYwwR8AnBeIMJDiUwzHnC+cC0gPPuCAGSFIgEES4w6/bRic1QepFu8UGlOU6LwmHXPBATFrwgHQZOhizz/g08gjIFt/3wcgIFFj9+hw9HQNEBJdxtO9ow9vL3wIYB4xNMKDQYrvILtbB8NNBlanzMGTIEOy99952flhY1IHvZG6eJ+0WYwx33XUXrrnmmtjzWiS3FvaxErvQFcFSzvdrnU8d35pZLfo7Ro8ejddee80aLIvqEy4AkM/nmZ6QOuVbw/M8ZLPZoral9dIZpDsBgSaQNPOayWTwve99L2J1ddszU5jTwsKiPpz6AQMGYN99942ICO3c1ytiLYwZgwxtJ+cc2NWO5a8ugwterH9h7MAQUd115en0PlHxGhHbHWNhgMaAdunhmI+fgL2PmAqpfBApOBkXruPC872ACPfjTmKMaNHlKBZ1O/4ZAQzx7BjhhkKMGRcgCTgMx5/095gwcX90EIGYgGAOoBgc7oLAQeChC2Q8KHw0OojgcoFN76/HpjVrAUVwwg5FZtaIJhqLBIf7GDqQM3fRJ0yYgDFjxthJYGFRB76TGdeYcxUAfv/73+OSSy6JVTXo9tD17F91lXlr+iFah8as5pBSRva1pWJhkAkAACAASURBVKUFGzZssN6ERe0IFwC44IILvpXsWKQHoud5naZ7NQr5oo9RK2q7YfeDfD4Pxhi++tWv4ne/+100IZPvs7Cw6HsopaI0dTNttS5sDOsk6DR2klQURDEse/kVqI58rPNKrEynG+dXTzYramfLGBRDtMOkzzFPElIwfH7++YGWiysgieD5HgQXUd24Rf2tpZVAsECjhHMO4TqQvh+UkfkekHXBR47Ep846Hb4AwANHX2uukSzsQCpQzTOb+qxLEQFvvfY60J4DJMVS4UvZFV5nrdFNu3XwwQfH9FwsLCz6eD02JBV0dsfixYsxb948dHR0RHPYNbrD1XL+9nbnIt/3o411Xa6qfaydO3dassWi9oTLL3/5yx8ce+yx0c6rdoq1nksjObylAhSd0aLVqDXRomsT8/k8FixYgCeeeCJ2vtbZt7CoH4eeMYZp06YV1efWE9mSmomiKAgcQ80KKSXAGFa9tQI7t20PSAkiCMYiI6/Py7RnvSUY2u37Y5IsxrWInYsiQCowAoTjoM3rwJRpR+CIkz4GkAQpH4xzSCWLasVTOzSVKTpcieirRc8IClPclhFASsJ1gq6B0veDwUEqEsv9h7NOxx7jx0Eagtgy70WEAhFBsd7ryNPdQKCUlkDXjh2DA4aXl7wQkC2h/0UM8KQfE4jWGS71lPGmN6o0wUJEmD59up0cFhZ1AjOe0zZpxYoVOOecc/DRRx9FchKamNB2N63tcz2sMd0hmlzXjUqJtLSE7/s4//zz/9mOEIteIVwA4Omnn2bjxo2LLZqakNCTr5GQ5vjoc0vW7unz3LZtG8455xy89tprkYGysLCoD+hU0MMPPzxV9KyvyRaVIFt02j8PAyozAFNKAQTk/rYVa995N/q7KejWU1KgXggFRsZ5iUC0jofXwScF5XDs8DrwhQu+BAxqBURQbiTCkgqTUEte305Jrl5wAnc30iZ5ruWeu+AC0vcCckzPV1KA62DUpP1x8qc/hTavA3npg6SKxA1BBAEWVY2ZpEtQqlQ//kZP7JDDOHa17cTyZa8DYJGItik4qVi6hks9jYuoXBLA9OnT68I+W1hYskXGSxOJsHr1apx55pl4//33I1ujH2bmRy6X63MipRrdj0wyySx9PP7443H77bcvtKPEotcIFwBYu3Yta21thVIq1gWk3L7qXdXQ9SXpoh0BU/vBdd2ic92yZQvOOussrF271qbDWljUEbSdMbUBGsWh10GI7szCGAs6t0iFJc89F7WGTtrcauhI9UpbRhSTH6VKHhhjQfclCgRyJQPyUBg9YU+c+YVzAUeACQFJKhK4S1sIOQCuep9ssZkxnczRRGaLvk+kFBgYSI8URwCuCzgCX1zwZTgtTZCCRfdaShk5/ZGuWtiVqEgktkb3ojfvsRACr7/+OvIfbo3EhZnghdR/fc4h6cJRnxoumhwdMWIEJk2aZMkWC4s6gLarnHN4noetW7dizpw5eP311wsZhWHrZ91RUNvgeshwSa693emiZorj6p8TJkzA4sWLrZGy6H3CBQDa2tqYyXQmS4pi6e0NtJgmOxDpc9OtpE1Hb+XKlTjzzDOxadOmWJcACwuLvpu/2g61trZi8uTJUErVhTOgA37exfGb7eo552EpDMOyl5aCPB9CBVoXJslSskSyDuN90g6R0UnIDI455yCpIMKAkjgLWkQzAY8DH7XvxGc+dyYmHHwgFAVlFLr8KipNMbKJenO3f3fMZukJAaFLX/R9YjpdXRMkYb3ZiZ+YjUOmHQWfUTR+dPmvYoAiAnNE6rgnVr8aa2ldtJJlhyYx6RLDa88/DxCgjHR+rV9TSquFoT50XPQ90/7Sfvvth2HDhlU8biwsLGq/hp199tlYsmRJrN2zLh/K5XKRjouWYKjF2tHbdsF13UgMGAAGDBiA9957z5ItFn1HuADA1VdfvZ9O31dKRan8Sb0EnRlSzy2UzY5Eyb7w5rHriahrkZcsWYLzzjsPbW1tqX3ktcGw7aMtLHrB8IUEqZ6nxxxzTBEZmswG6Q3Rt9QASmemGAGn7szDEWiYKKWC0gpP4W+r1uD9d96BkBKOAoSKB2jB+7TxD/7HiQOKQVHwKHxT+oNIgkiW/HsyM6HihyaGGItaQJMReDLGwAkFsiVs/xwRURyQrgO/KYOvXXsN0JQFHAdKEhgTIGLg3AE4g2IEEgyKA4oXO5OdkSOljr/cLgdpGw5JnZlGDjIrzVKNMrH0ddT/NOHCA9LMUwQSTjB+GQe4wPB998WZX5yHXZDwjdbPwbwJBHJ9Fn6WtgOJNuMIxxyDAIhHP/WDFIv93/xdPxhEUVaZeX/L8S8ADhZ2S9JEI3EWjX0KfwcncA4IRlB+HkIwwPdA23Zg2V+fBVTQsYnzoCW6wwWYJHDFIVSQFcZjhKMCq5NCI3OMHHfccTEf0cLCovfmX9pz2l86++yz8fjjj8dauev1TWfUmbFeNTbWk5/RnQyVzt6TXKf1eZjrlymNwTlHW1ubJVss+p5w+f73v//OZz/72aVmnVuSeNHkRD2lm/UEOttFq1dzzvHEE09g3rx5MVY0SbCUImMsLCyqD02IHn300bGMkbSFvR4y8EzCwXQ0GGPgCEgISIWlS15Ak+MGZTah3dUEkpQyltGhd7RFHfVDLmUDo8C42AMraHkA8EnBI4WdXg4jJ4zD3MsvASABwYLsCDAoTa6ZxBrVvmtNGpnXldPYiKUU5tjsrmPCEL+vASUQZK94nldQU27O4rwF8zFwzB7YRT4kj4+X5KOa97GWc72z55VSQacuCmay67rI5XIY2NyCdSvexraNW6Jj1Nl7jKhwbU2CsM7Ec7XPlCRcdAaxhYVFbW13OWvUggUL8OCDD0b2qF6aDlQDrhuKshstrYUQcBwnpktKRLjgggv+0Y4ai7ogXADgvvvuO3zy5MlwHCdaMM3dH5OE6S8Lqud5kYOglILnebj//vtx+eWXxwgWc1I3qnNtYdFwxi+ce5xzHHnkkRg6dGj/ODFFeO4vfwX5IcHNWSS025l+lmIAr6OW0eV8dtr5EBGa3EywA8eB7bl2nPzpT2GvGUcCgkGRBBPhGiNV1JWICQEYKdHlBsVpj54E7f3F/vdUM4gjnQAItFzCgJwDEMDss8/A4X93LLbl2+ExKiJVki2Gq0Gw9OZ9Kjlnw1I6FQY8WTcDhxieefppUNtOIMyAM+1dZ8fdnfFby7lPRBg0aBCOOeaYmtsbCwuLYtKlVFbZ1772Ndx9992RPclkMhHpUu/nVY699TwvKtc2Kxq0Ho2WjTjttNNW3XLLLTfYEWNRN4QLALz55pts+PDhEbGiiQYzDa2/pIzqdmH6nIQQUc3frbfeikWLFsXqGU0BXutUWFj0LoYNG4YDDzywx91B+iKoLfYogM1r1uK9FauidF6zA1NUksBKi9A2EumSdvzKD9ozcseBcjjynHDFN78BDBoAuIGAru5VExZwgHwfkBJUD23BG3wNSC2/SmRldYaSmjq6dBcExRngCux/7AycOW8udngdyJGEEqwq17I7dqDatsMkP8yW1sQLf+A86MLlK4WscLBr+w4seebZIDOIAoHhyL9oMJ08xhgOOuggjBw50hIuFha96FfouWbqsuifixYtwo033ggA8H0fjuPA8zxwzqPMkHpck8q1H5poMWM4U6dTEy9TpkzBAw88MNGOGIu6I1wAYOPGjcxUuDZLaPQAb6RFtVSAZgrp6tfpmj8hBP75n/8ZN998c5SCl1bzbWFhUbvF11SZ55xjxowZRSVFjUC2FDkSBKA9h7/8+Ulk3UyB4A7PLSnanbQ2rJvXk/qgu0spTRC9tvhKggRHOySGjx+Li6++EsgKgFEkwBtl/+gzT+liZMmVnhMPlWSYpAnCMkKgkwIOLgQgGAbsOQYXXXUFPJcj7zKwrAsWCuRW69qWux7Xat3WekUliYmwDM5xHHBFWP3WSvxtzVpABOXZLPSx9Lz3UwjFnmRo1cQxDbNxiAjHHXdc0FmpH2U/W1jUM5JzzZSAuOGGG3DdddfFbKsuWdSdierR3+sO4aQTALT9UUpFMhGjRo3Cq6++aoM1i/olXABASsm0YrWZplVJOlq9tY1OHrcuIWKMRercruvCcZyIePnKV76Cu+++OyJmzHbYFhYWvUNWaL2AmTNnFi24aXanXgjRUlozgZFVePHpZ9HRthMu41FZgW4Pm3YOnOqzW1G5DlPSASQicCfIZoEjsLVjJ/5u9kk48XOnA01OIDgakiukZEC6cA7UeRe5Rlkf9FpmZliVO3+SwX+hLXSg6aIggdYmXPT1r2Lw2JHoIAmfVFkZst3NmkqbZ31lC8zrqJSCBIERoZm7+PMjfwxK5TwfDAxO2MGskfwL8/y0Xbb6dhYWvRQYch7bmNEbGHfddRe+9a1v6TgOjLHYJrkpGdHo66X5Pr2uZDIZAEEFw8aNGy3ZYlH/hAsAnHvuuf+azWZjgo66a0ijB3EAYtotmi3O5/Ox8+Wc48tf/jIefPDBYDfWIKAsLCxq71SYi+q0adMwYsSIhph/aWRL9DOMWD96fz1efeElNAkXDuOx8zZfT/2MdCEiSFIQbpDmnPPykKRAgmPTzm244B+/gv2PmwFkBZTDwbgIy4oKAX3Zx1QDDZf+inI1Xcw24FHpW/iPGAABoLUJZ1/0JRxyzDS0kw9iHOQRXDigvAJT1SEW6lHIWLFi4pexQKtly4aNeOHpZwEugnKiFNKrs+OuF7lLTZiOHDkSRx55ZMN367KwaCSYWR0aDzzwAC688MLoOV2poOMbncXfH9YzTTCZPqLrusjn8xBCIJfL2SDNonEIlzvvvPPrRxxxRNGENSdyI8P3fXDOozQ7PWEBRJ2YNME0d+5cPProo9Hz1qmwsOhd0oWIMH78eIwdO7YhHAazVDFVG4NxIO/j2acWwyUGwQstZnWGHSPEtCAaiXTpcqdecLTncwBCMT8QJCOQK/BRbheuvO5ajJh8AIgr+CRBISGlpIyygWpNPiSFXEu2nm7QDkVpmS0Vi+hGmi2ADDswQzB87IxP49SzPouPcruQk8F4zrgupO/DNTodppXpNkqGh24HrVj6fCQiCM7BGYNDDAOyTXj1hZcgP9oGSIVMJgMWti/VvkWy+0+9ki56zBx44IHYc889o3FjS4osLHoHWreEiPDkk09i3rx58Dwv0qQ0N26ICJ7n1V2X2e7aer1RHnV3C8kk13WxYMEC25HIorEIFwB45pln2F577RUTjNUD2xSQNcWbyk0r7evU2WR2izZgZts0PZF37NiBc889F0899VT0OlNY2JIwFha1W4zNYGzWrFmxAFHPQ7NUoa+y8MzjNDUOkraBEQClAC7wwl+exofrNsDhQTtDHbSYAZwO6qp5fL3lRHVm5zVxT7JQquozQgckZJODhf/3Bxi47wSgyYEUDB4pcMbBUNjhMwmCmO5Poj13pTY6adtNQqIrp7G866x6+Oh+kFyKFDPPs9MyYEXRoOTMAedO0Ao67Eh0xKl/j7kXfRk7VB7KcQAWpLSTVMgwEZQfdXJM3bUNadc9TXutpyK9jDGAdz6uzFR+oQBBADyJPz/0KJD3AQKULyEYh8NFRLISC9pq13vQo+3biSeeaBcqC4temKPJeaozXF588UXMnTsX27Zti62B5qaPnrPm3+vBvnRXF9Ncj3UMR0SYPXv2GtuRyKIhCRcAWLNmDWtubo7UrU0dF3OimARMRW0765SoMIklzjk2b96Mz3/+83j22WcjIsbcfddOapKIsbCwqIIhDB38WbNmRfPObAeYyWRiKvUN4EEFOg5t7Xj2qcXIgkN6ftQamhvGP7KxLF0wt1zyui9tbTm6HSpo2gLJgA7lo2nYYHz/pz/GgPFjACYBh0OBIvFcXxV0xcwMzFLBdU8D7kZ32LuzBqY5w/o57Q8QADgMcDkOPPE4XP7Nq5DnBB8UZr2wioRtq0kMJgmlqtslKnQnMklSzjkgg9IpRoBDDO+88RZWvf4mICkgYCq5F1RwCHkfjwuTUDrllFNi5Jf1fSwseg4dT6VlyprxyRtvvIE5c+bggw8+ABEhm83WVZZZpQR6Oc/rzRbtA2rx3BkzZuDBBx/c244ei4YlXABg586dzFTRT61PRnEL6XpGJceo09bWr1+Pc889F8uXLy+qtzZJF5tWa2HR84U6bY7OnDkTw4cPjwXZOsOlkfSlGOcBu+D5ePKRP6KjbRcEASIl4OxMc6TSgDKZ3dBXouZmoEopHWvI4djh59Ayahj+5cafoGnCWEAQSDAonSLBAgaKGADOIFwnEuGNgkBKf1hypfvrJRGBg8EP24wSI0Aw7D39cFz6zSvRLgg5AIoYBIIHIbhHPgtaRlOj2ybqemwrpSCIwWUcrU4WTz76R6BtFxh3isZhKW2hWo7VnohVSimx995747DDDotlmVnfx8KievZWzyff94vm69q1azFnzhysWrUqIiG0VEJ/WYdKZS3qn7p8auLEiXjuueesbotF4xMuIenA9KTWg91s0aoneXfatvbVjmNnu2lEFKur1oHI6tWrcfbZZ+Pdd99NNQJCiIYWFrawqMfgUf8cNGgQjjrqqKj9n3YwTDvUKJ0+OAuirA3vrsEbL7+CZicD5cvUICtNQLeeAvJyv7fL0hEtqqsU4Aq0eTm0jhqOf/nFDXDHjASyDuBwgIWkldkJppNOeiaZ1F9FcEuN+550/Sn1WQoEcA4FBbgce00/HFcs/Bb44AFoh4zK4GIkmvHorYCl0r9V5Ph3QpgQEQTj4AAcBXy4YROe/tOTAHdAfmX+QS2Iwu6MieT4OvHEE5HNZvvcrlhY9DeYXVGBgryBxrp163D66afj9ddfh+M4UbahXgMbiWzpThaMrjzgnKOpqQlvv/22JVss+g/hAgDz58//F5OAMBdhvePc3daAfblYp7ZgTXQlirQBiPDqq6/inHPOwY4dO2Kq37oOuz+ICltY9CXSMsj0HPvMZz5TNGdNzRTzPfUaBJB2ihQBnsRjf3gI3FdwWKgthYJShw60+kuHtChDwBC/jWnUEIFCQk0xYEeuHYNG74Ef33YTBowbBTAFcIBI6ZZPwb023ttZ0NofM1xKES09Hf+p5VmchQSDAjICE2cciau++x1kRwxBu1KQQsTuZ0TSsOrpETVCwAQAXBKahItn/vQk5JYPAV9CJDSaYveM1acDmKYfceqpp0Y6EtXQyLGwsIj7MxqmRt3mzZtx1lln4ZVXXomyWvTc022RG2XNKqfUOC1O09ktnHO0tbVZssWi/xEu//Zv/3bNzJkzU7samKRLLSdgb5EuOptHly2YdcqO4+DZZ5/FGWecgfb29uj19aYAbmHR34JKx3FwyimnoLm5OdYa0RROS9qQegwAmElMK4U3XlqKd1e8jeZMNgq8SpUSURjwVhqAd8cW16LkiKGY/ODGTx62y81kMlAs0HTZ6eUwaI/h+D83/RQD998HcARABKZtLkWsVKxtdJrgbX8LCKuV1dLVmhwj/DiAliwmH380/ul7i5AZMhA7vA74jMBdJxqfDAmB3M7GdRdjrtLxV62xWw7JmSSSdBtoRwjIXB5PPvIYQAwZ7kCwzn2kUqRLb5GF5djPwYMHY8aMGVFwaBsIWFhUNx4xGwPoOGTbtm0488wz8dxzz0WlfTqr3nEc5PP5up9/ldjhUrZX25urrrrqYDtaLPol4QIAf/7zn9mkSZPgum6MXNGTvxrpbPVgMLRR0CVSuiOGLmXgnOPxxx/H/Pnz4Xlep21DLSwseu6A6MV3/PjxmDp1amEXOcysE6LQ6afeoYMuIQLiADt24tE/PASvIxfqYhQCL57oWFTKIUkjjeuJBOgqKGaqENhnHRf59g5ABiLIwnXQ5nWgdeRw/PjGn2HPSQcAgoOUBDJu0DWmENnHAlRGhe+xChOVkQyp95EzIOPgqJM+hn+87tuQAzLYLnPwBQN3A6e/6POg25mbFEzlDni9jd9SBIgOkIQQeP6ZZ7F++QrAk+CMQfpe6jgs13OqB12XGTNmYOzYsTFdP+v7WFhUbx7qLA7t++zcuRNz5szB4sWLoyYmZlWB53nIZrO9Mg+7S4j3REQ3+dzcuXN/+4Mf/OANO1os+i3hAgBvvfUWa25uLhJLMwmKRnYyS010bfjMkqH//u//xvz585HL5exotbCoMnT2ilm2R0T47Gc/G+3saMX+fD7f5RyuF0gpwRHaT+EACnj2iSexfcuHyIKnZn6UQ0bV03l31Q6ycJOLnTTf94MMQ4QkNyl4pLA93w42oAn/8tMf47CZxwICgO8BghWIFs6jcqXktVE9dBjrZq3S2Q6qtsfKGIvIP2IEchjgMJz8+bNw+Tevgp8VaJN5MCfIBs23dyAjAlFYTsV6LUQU3e/+FKRrbRpNiAbzG3Ak8KeHHgWkgutkgnHtuKnkipnJosnW7jcBr858LXV/TjrppCjYA4wW7/1YI8nCordjEb3Rm8/ncc455+Cxxx6LbQbr7DJNwNSTaG5PfJHOxHKBoFvlr3/968/bkWJRTdStGEgul7vOdd1FeofDLC+qxoSv1aJdqQ5CWjs2E47jYOnSpVi7di0+/elPR0GiJqCS3R2sM2JhUdncM+eM3jkeOnQobr311kLmQmhzKmk/29f2hYhASoIpFYRr+Rw8ARw5YxokEZQiCM5ApMA5gyIViJSyoEsMSEuYUFyRlBBLIqi0JW85ryeW/MLEgxEYBwjBsevnYj1qdBaP8Z1JW0sBgwIGDmIc4BySATyTwXEf/xjaQVj15vIgKiUGMAEogIGBsUBUV4vrEphRchRqkOmEi8RDt56Gil9bpv/CSr+3nAcL/0MEMMZjP6GPPfx78s2MgrbhsVwR3emp6HtSiJro5cGdMDdOBAtL3YiBCyfgcziCEi5XAIMH4gtfuxyzzzkLuzghH0zK6Po7YcZWkiCMNmbCRyVjLX2wqs7HXqjtY6Y5BUllhHK+UtuZkmK5iuAIJxAGFoWGAYIH7d0hOFqcDNa88Sb+3+13AnkJkhKCM0jlg/HEzaH4/WSsMFYJAOOsx2LDaQFPqZbfaQ0R9P+bmppw/fXXY8iQIUVES1J7y8LCovR8THY51ZtLyU2m888/H/fee29J6YLeJq9N+12pLS/HPiR9PvN6TJo0Cc8//7w1MBZVR11nQOdyOWa2Z611MFNPUErFBKvuvvtuXHDBBUVkiy57KNU9w8LConIcdNBBmDp1arSA63mX1j6xXp0tIQQcLiAYh8MFQAwvLn4GW9dvRJYJZLiISqVUaFf1jldPA62evK4SQssM5k1HrTMtj7TPUSjof0gGbCcPHRmGcy6Yj8u/twgYNADIukEHIxR2ABkB5qZAavDcDxbkSFi5zPMhEDjjsazNqBUp42CcB9fN4UH2kCA0jR+Db/3o+zjxH05FTgAej5e4af2dUmRLf4LrulF2nSYnXNeNOoY4YTvoh+57AOjIA4RCRhtvDD+Acx6VaOrxIaXEEUccgf322y/6W7LzmG0NbWFR/tpmEhB67phNAObPn4/f/va3URbL7lC6l+woqNepkSNHYvny5TaQstj9CBcAuPzyy88xgx6d5l9N0ca+MIJdBTXa8Akhoh32O++8E5deemmRk6mDQQB107bNwqLRcfrpp0c7PmapXyN0CWOiuKsSpELb2nV44pHHIBTAVGBTZcIW1pK47a69LWenq5zj76x1dKSTxRBquuSwXeZw6Myj8eO7bsPIyRMBkoATaPkESQ4KrnCi0rRMWOOe7FrUVRejKDODCj/LeZS73lR0j1ih1EQlSJfko1AOFH8YFxxQBCVl1JJbIRh3QfttAppcHDzrRPzopp9hrykHYgc8+Kz0vayHjYVS47hax6Y3UDgYHASZPaRUUNZIwEAni3Vvr8YLTy2OMqN0CQ4Hq3hu1coP6qwLSOw8DZHvU089NfJ/0ua91XKxsOgcuqOpJm3T1j8AuPTSSyOyJdmRqN7IkWrO+0g0P2x1rfX5Nm7caMkWi5qh7iOH5557btns2bOvWLlyZZNelJM7HNUwEL1pZJKsaqnXaGOpSSbOOV588UV89NFHOOWUU2IlVknxXQsLi54tyCNGjMDtt98OpVSk0O84TpET09f2JNWwO6HzRMGx+GEWBrIZrN3wAWaecAJaBg+ED4JPCoKLIMsjJBz0+0qfYI3PuZOSpTTx3q5SjkulGacFgUG5RZD1wh0HvpIY0NqK2Z84FR4DVr65HMrzILgTFpkQENpp3/cDkoHFy3HMUpuwcKfQ+QiFKq2oBKfENS7nPqQ9Xc6aU/QBJUqHmPEFyWqmNJKMjGIVLoJxBs6AlizQksGciy/AFy+7CLLJRY4TJDebQpW+ZzUNvFltug2V81oWZqgIziHDAIgzBhWSv0IBrczFb2+7E2tffiUoz1IApAKIoCpIqU/u8vYmTJJFZ4kNHjwY119/PYYPHx7L5jU3lax/Y2HR9dzSG9Rp81wpha997Wu46aabIv/GbBJQL6RmOWWKydeVax+0zdHn6/u+NSwWtZ2XjXCQDz300JBDDjkkVj7T1aSsdCJX28BUUnNYyqk0iRQepmATEX7605/i29/+dvR8MtVWGxILC4vuz98DDjgARxxxRDT3NAnaKCVFpk3QwS7yPtrXbcCTj/wRrio4Hpqs7Ukg2dsZg6WcrFK2vdSxlXLqXNeFJ314jNDBCTmX4awF52Phjf+KoQfsA8l8qKwDRYV1iZQKWnIzQPHgYS625iP6flacVdJVlovJC9Siq0ypzBX96CrzhvRnhJ2bXC7AwCBVQE5hQBMmTD0IP7zjVpxyzhnYpvJoh0QOEh6pihzseptz1fAZzPVeMA6SKiqnYlLhg9Vr8OyfngxqrnyKsloYY122ha43O6v9GM45pkyZgoMOOijacTd9IdupyMKiMtIljWwBgGuuuQY///nPYwSMr/5UpwAAIABJREFUjqt0dky9+zY9sbuu60Y/lVK4/PLLz7IjxqLWEI1yoJs2bbpuzz33XLR9+/ZOSYpKF/ueBBjd+exyX6/T3DT0Do92PP7617/CcRzMnDkzZkx9308VvbKwsCgfer5JKfHAAw9EpUXmrlE153/VnRIEQViQKREGLEpFqQPrNm7C9GOOxoChg+GHAS7jYcBHZSRXVKCP0j0D2vlnJTu7lXIsy935Kvp8qaLr5oRZLjnfg+TAwKFDMPtTn0AOwKo33wyyNZQEQIAQgFLxDB3jfEz51aJz1WkiBHDGwIDSQqasi+tVwlEtW3Q07fNZ/FA79yw4iFQoyMqDsjVGQHMWGNSMORd9GfMuuxBNI4YELZ8ZgRwRkILQ7Z37kgnofulbd15X9Hs4h4XO6gjnL1OEVieD++/8NVY9vxQgwGUiOly99lOZ399XdsrUUNC2VUqJq666CjNmzCg6NlMwtx7sq4VFvfsveoNIEy9683bRokX4wQ9+EJjpsJRGZ7l0tvHSCORLJe/Tmnzz5s27+dZbb73ejhoLS7gY2L59+3VDhgxZVKpFcrVSequxoFfj/Zp0UUpFNc1m4PfEE0+gpaUFxx13XKELRKj5Yh0SC4uezT8iwvjx4/GrX/0KHR0dMQ2pei8p4kY3EC06rpRCxgnEOPM7d6F58CBMPuRgsIwTZFaExAsRFbro9IBw6dF1YOU5TGmOVylNinIJdkZBNx2dWaDCrBXmCnik4DMCz7qYOu1IHDp9GlaueRdt27aFpURBqRAzxF11Z580nROWJGSMOqS0BkTUCcGSLPVJEi2V3BeezKZJkkJAyQ5JFN4WrtcsUNBpKOvisI/PxDe+vwiHHDsdO+CjnSsoh4MLN+iaxQTgqx61Ia/K+lcG4dKTTZ8u7weFqe4AZDiHBeNodjPYvOZ93PnTm0DtHoRUgUaOUlFHLqkqs0+18hdKZSaZZI/2b5RSGDlyJH7yk59g0KBBMWJFB4o97jxlYbGb+TBmlgvnHDfccAMWLlwYxRZmF0b9XDn+TV8RJV19XqXZuKecckr+3nvvPcaOFgtLuKSgo6Pjumw2u6hU2Uy1DEUtCZdyHH9NspjtE7VzYhrQxx57DIMGDcKxxx5bxGhbWFj0bA63trZi6dKleO211yJnpBz70OeEi1EGxTmHryQED4Q3GWMgRVj1zmrMnPUxuM1NUILDUxIizKJDVw4Rq+w6VptwSSsxKPeelAp2IxKHAFKFHXjGOaSSUUALziAZ4Pk+Ro4ehZNmn4KRY8fizXdWwd/ZFrYxVnEChaFQR8RK/DRIDF6C8qKuro9BuHSmz9HltQoPV2vLMCrmW0wyqUjIhQNEEnAdICMwatL+uODKr+GML8yFGDwA270OyIyAZICvJAgMInzosqzuECpVy4DoRcIl9T1GIKR3YpvcDFog8F//djdWL3kJzCcwnSkiOITrQElV1vpf6XjoiQ+UzKoyS4TMoPCTn/wk5s+fX/TeJMliN5QsLCqf3z//+c9x5ZVXFulCRsFgSMDoTJd6PZfO5n+5doFzjuOPPx5/+tOfbDmAhSVcOoOU8joAi8zF3CQjak2YlHp9KTX97hyL6ZCUau+md9wfeeQRDBo0CEcffXTdBHwWFo0O7ZCMGTMGd9xxRzSv+rKkKK2UJhWKwBkDGIMCFYRYteHnDvz2dnRIiWNmHo+dXg7MFYE4py9THbbYc91NXCn3utQwg6arziksZDbM9tIsLPHR+iu+lHBcB74KMl72O2B/nPSJ2XAGtWLFqndAuRzAuMGA8OChADABEOA4GRDpxJjgtfofUUA6KAokZ1UozFsQoi192VhEhIQ1QLGfzPg9JFR4QCrFXgMedihiEOAQoUqICFkjAgO4KJxXoDIMFp4bXAG4Aq17jsOZX5yHC//xKxh7wH5oU3n4AlA8uLag4LOjds9EnZ9fF+M+WXpSS8IlOaY6Izo667KVzNTSZX2O4wRtypWC4BxZCLz7+lu4+8ZbgZwPAQbOwo5knEFqf6HC70+7XuV0BUubT12RSuZ3mX6b1qbbe++9Y1l5vWlbLSwaBWmkg+kbmOV6AHDXXXfhq1/9arRh1Nn7e4NsSdqXntiZtHUh7bVmts+UKVPw/PPPW0NiYQmXcnDttdfetnjx4q+bhkV36KmGyna19GC66yB0uQOWMCSPPvooBg8ejGOOOSZmcNMyXuwOkYVF19B2ZNy4cXjggQewcePGsudOredXV58vgEKnm0QGBQMAqcC4wLvvrcGhhx2GYeNGQxKBU0DUUInv6Srg723CpacOX4k/Rp2KotIfHTAa+jZKKSgQfKUglULLwFZMPuggfOIfPgnR0oz31q+Dt7MNaMoWdF1YIftFKYoyiRgrdC3S6i2M86g0zAyjSZcu9eD6UVJ43tD3ARE4C9bSgHegqLNSRAjBIHJIBTo2rgMIBmQduKOG46wvnY8vfeUSTJl2ODo4YVtuF3zOAs0gHpwvJxaUL3WTMKvdAKFujeuekgT6dYKHpTYUtk0moIk7+K/b7sK6l18DQpJKH6cKxyqv0tTpKnjpyeckhYE555g8eTIWLVqEbDZrM3QtLCqYV1qvJa2EmHOOX//617j44ovR0dFR13Or2nZdt33WtkZvUO+5555YuXKlDYAsLOFSLp566qkd559//qBly5YdY3bzqVaw01eES7lidmbWi+M48H0fjz32GPbYYw8ceeSRMWcmyXZbssXConwnQAiBXC6Hhx9+OFq4+7qkqEsSNkG4UCIWZxQ6OErio507cMwJM+H5PhwuwmCeSpIuAPoF4dLFC4KkDaMrT4EMCVr2goLAmIeZKB35HBQRkHVxyFFHYNYnZmPYhD2xet37yG3fFgjq+jLIDFEUOcaaxHFCmWMODubwqMuPzkJBSHSp7ojeFg/s+MvD0hVdbiaYgCAWdk8igAUZLxIUZEyBRRoj4AAcDnDCmIMmYc6F8zH/a5di/8MPAbIO2mQekgMQIsgOIwIjDkasSHsmut59SbaUSbiklWyVIvI6ey7tbyJctzkLMoCamMDKV5bhv352E5BXADcIl3Cc6lsB1vPpU+uSanM3nYhw6aWX4uSTTy66rhYWFsXQvr1JtmhiQZMwnHP8x3/8BxYsWID29nY4jlO+aHo/QFKOgTGGgQMHYtOmTda4WPQJGn7gnXbaaW8/8MAD+5mTyvf9qjC51RThrYajaH6GJlIcx0Eul4u1kf7Zz36Gyy67LDI6piOYNNAWFhZdB1QbN27EIYccgs2bN1dl/nT3/UnStGQ6vyHYSimEi6sCW5njBLgM86/9Bk78xCnIKR8534PPCKoT+6NQ2y4u1MeEC/HC3zkVv49zDuUXdMQcXhAgRNjxwQWHwzhY3sdLTz+HB/7zv/HeG28B7TnoEhxOgJIyKFdiHCAFBYA4pZIknPHIzvfk+pFSsSyZiGwhgvIluLEXQywgZJQKz5czQHBASsDhcPcYhmnHH4tT/uGT2PuAiSBXYJvfAcULGZYR8R8SfZwK67MyxmhEHFD319CqkDJMVTyezBLgtBKdSsZg1NpZERxJcCVw3ZVXY90Lr4IRB1TY9h3heAk/SlDZfFGn16zcsqxSLVpNjaVSWS56DA8dOhTPPPMMJk2aZBcdC4tu+ALJrqYA8O///u+45JJLsGPHjsi+m4RMPZ5Ltex6UgQYAFpaWrBr1y4b+Fj0GUSjn8Bbb731s+nTpy9at25dzURja1FC0J2gzXxPUjTYdHQeeeQRjB49GkceeWRkdJLphhYWFqUhpYwFUK2trVixYgVeeumlPiVcyn6/0RnH+NUohwnKUpSUAGdYuXo1TjjxBDAhQCLQfenMvenvGS7M6NITS99m8bbOIiyx4Qi0NogBTAgoRVCk0O7lQK7Anvvtg1mfnI3Djz8GaM5iw5bN8HMdIOkDYetpqcI2yq6DMH0m6I7EeaStQqAgi8bQYUnNaGBdn79eFyjcCSyQMARigS5IUL4Unq8rgpKhJhfICIw78lB85svzMP+Ky3D0SSciO3QQcpzQDgnpckiEYq5CgBRBej44cXDwAsnC4uSQzurhYDV1yLseIFTVMdUd0WJGAYEyKNOMh++9H8/+/mFAAi6FnbAAKEbR60X3D70mAVSanl0aTj31VFxyySW71e67hUVPYPryvu9H7eD13+677z5ceOGF2LFjRzQPNQlarQ3p3iRbumt/9HUCAM/zrGGx6FP0mwG477770jvvvFNTgqQnfzcdieT/uxsw6HaKuk20Ni5KKTQ1NeGWW27BF77whdixpTHhFhYWpeernldLly7F9OnTgyyAHu4Q1TrDRQevpWNJHrU7JkaAAD55/rn43ILz8ZHXDnJFLMMl+T2NnuHS5TGpeLkIGSUvmmjhnAN+oUaciGLXRdeMA4Dv+8g4Lpq5A+ZJeDt2YfnLr+LZPz+FV158GR2bNgfdjViYOaJkyKSwQPOFEBO9ZcmMBKrs+pmdgDTREgmYKgU4TqDNAgAZNziGjINxBx+Io449GkccOwOj9xoPcgV25XNgggfnrgKSxaNgzpBS4GGbbc45SAbXgjuiiMAjotj17TOyBSgrwyVZGtOVaG458yDaUPF8DMg2wZXArs1b8Y0LL0PHhs2ARxBa0BmACo+T95BoqfT6pb2+VFZPpzaKCPfffz9OO+20WDtaq+NiYdG9eXz//fdj3rx5aGtri57THYhMkepGI1oqfb22z2HJ4oIbb7zxdjtCLCzhUiWMGDGCPvzww5poLNQb4aKdk0wmg3w+HxlTU7fFdV3ceeedmDNnTiwosDtIFhblwdwhAYDjjz8ezz33XN0TLsmAOxmMKQWIbAYylw9rjATQnMG3b/xX7Dl5IjqUHxEuad/RnwiX5HHpzJbYcXAWu446Q8T3/VgWob5emgQ3yRvGGFS4GynCcqIME8jvasfbbyzHkr8+g6Uvv4xta9YCHfmgbES36FZRO6Ow7TTFFvBKCRdzHYrKO/R9dngggNuchRjUiv0PnISjjjsGBx46BYNHDIPT0oR2Lw/wsERVBDutEgSHBUSew0W0ToEzKBYQLQyBjgtT6QG70qKxFTrZfUG4VDK2OyNc0rRgiAhCEgaxDG7715/h6XsfBHwCU6F+kPYDwuMUPTz9Sq5fSZuT0v0r+Zz5u+4WsmTJEjQ1NVm/xMKiwjmbnDMPPvggzjvvPOzatQue5yGbzUIpFWXEV6OhSJ/Y427aKMYYzj333Dvvueee+XbEWFjCpcrIZDIkpewyIOpp56BaEi7l1E9H9fZGaqFJtujzz2QyuOuuu3DOOefY0W5h0Q2Hxpyv9957L84666y613ApRbgw0noZHEQKQEAcSN8HXI79j5uGr//ztfCyAh4vrdHQXVKkUQkXLZwbidwyBiaCOnFiQQtfKWVErujsFv1ancbNHYF8Ph/8H0GmCgdDs3DRJFzkdu7ClvUbsGLpK1i1fAXeeOMNbHp/HeB5UXejWE1T2u+drfQRgRRm0vBC1owY0IJx48ZhzF7jsd8hUzBh//0watwYNA9sBbkCeZLISR/CdeApCdd1QUSQUkYp7VLKQLdGBhsAnvQDkV1HBIeoEi2RKT6uTMKlz8iWMgmXJFESK6NRFBvDaa2gzeyYIgFdX2FIUwtWvvAK/uWrVwI5hQxx5HO56LrrDBdeiiSsQTDTVbZKmg+T5s/o3xctWoSFCxeWtLcWFhalbY/OVhFC4L777sP8+fOxY8cOKKWQzWajzVjdWANAlO3SnwkXreEye/bsnQ8//HCrHTEWlnCpEVzXJc/zIidYGxztHCZZ3kpbNlbswBtORDm7Q5UEXKXerx1+pRQymQxuv/12zJ07t+j49O6sdXIsLEpDE5u7du3CYYcdhpUrV8acF7O0rxpzqVptWUvZECICd0ShWxGCrBXWlMG5lyzACWd/GttVPrAjGRdKApIURJjB4AoBSVToYhOKoEYBdImAtbdsTE8Jm6R2S9J297T9b5II48Z3ijDzRTAO6XnYvn07Nq3fgDWrV2PN6nexZeMmbNqwEe072tCxfQfg+YUMGF+G6UuikLHCeSBym3XBXBc862LI0KEYPGIYRo8dgz0nTMC48Xti5OhRGDx0KJyMizzCjkThWFGBqm+hZXaZjoU5chWLEyxdrWG9TrJUSLikjZPo3Ci4XsTiLcU1hOsg53sQQsBhHJ4X/B+CQ+U8tIChSTL800WXY9Pyt4G8gkOBthJ3QpsTjhuouOYNUVDWZRI6pcZpkuTorp+SRqjEhJiN9qzano4cORJLlizB+PHjbQmRhUUKoVLqeZ3hrufNfffdh/PPPx/bt2+PYp16Opeu/Jwk+dzV8WtCxYzxtJyCJpemTZuG559/3gY1FnUDpz+elOd5jDFGmtEFEBOW6m1j1JnjU8qh7+nrzO/O5XL40pe+BM/zcP755xeRLabhS5ZQWFhYIFrMs9ksLrzwQnzjG98o2o3VNsb3/bonL3WmRkS2aP2nXTn85x13Y/+jpmLYPntCCh4InhIhk8nAz3twQ5vBAcjIJvWv+91dMqBSsk0TQzJkKRgDfAAd0gMDg3AZMnsMwT57DMPEw6eAg4ET4HfkkO/IoaNtJ3buaEPHzl3o6OiAl8sHZU7hGORCoKmpCZkBzWhpHYCmlha4zVlkm5sBVwSBeai/IqVEu5TwZAccNxuej0mfBP8r5xzTrlZat6f+EhyZ58RY2Dw8JF2SBA2xwnwjIvgINkWUUvDzHpodFwOYwH/eeSc2rXwH8BUEGDKOg5znBQFXkvyjxJgqc7wmdWiq6R9FXbtSCB4AOOOMMyKyxfTPrA9isbvDJCj15qk5d0wdxt/85je46KKLsGPHjoiAaJT5093uaPra+L4f+CW+H0lJ+L6PAw44wJItFvXnV/bXE7v66qunXn/99Us1sWAGR8m2mrXOcCnXkPTE0UnLcDGdHG2Ab7nlFixYsKDI+THJF5vtYrG7I7nTYrZe3LRpE6ZMmYItW7bEdJHMUpJkF7GeBPy1yHAxCVbXdeH7fkEHiknsddxRuOYH30VeAFIwKB6cEyMAmpyBmUmSrA1v7AyXooyBRLZLNdeKUscvQQFJEbUAZhCMQbAwQGUcgvMoy4LzoA11QOBQFPDqzj8yzL6SCDIOdPYFhaLAUcDNEGUs1er8ejq2+zrDJfInSpBI0drL4mNKv16FHZw8FfgmDgvajGeFgybuYOXLr+CHV18LbNsJ+IQMcXAAXtiKW0WfWSgn0ve6M9vR2a55ObvLlWS4pJGWukV4U1MTFi9ejKlTpxZ9lhX2t7Ao+PHad08rubvnnntw2WWXYfv27YH9N7Js65VUqcZrzVhO+1o6o3/06NH44IMPbABjUXfot6va4sWLNy5YsCD/wgsvzDIX787Sa2tJuJT7nmo6splMJlYyRET43//9XwwfPhzTp0+POVfacFlhXQuLQhewNNKytbUVH3zwAZ555pmY8r+ZLl+N76+58Q+FXs2MHCICHIFtGzcAzU2YMvVQeEpCqqA9MGcMruNEO+yMF8RB4sdMfUq49HQrgaHzrjLVEmVPs/kKof1lDA4XwTVmDOAMUinIsGU0cQbJAMkZfAbkSSGvfOxSPnwG5KCQh4IHBQ8EHxS8HgTuOmFL5qDVNOk24igIgZQ6h91ifWBU1v1l6JxwSbwgWGvDlt5SKYAHQUPQ1pkjCw7Z1o6f//B67HhnDaAA18lAeT5IKbiZDHwlo8+KWr3rduUs+B7Wh3YlbWwnietZs2bh61//eqGUCoVNIpvdYmERZMyasYvpYzDGcOutt+Kyyy7Dzp07kclkornVCPa5pyWlZtmUSUi1trbib3/7mw1eLCzh0tt48cUXF8+ZM+eo11577QD9nN5h6U0Nl74gXpJihuZnP/TQQ9hjjz0wbdq02O68vi7W4bGwKMzD5EMphQMOOAC33XZblC0XZROU0FiqR8LF3HHWBAwAUEiurFi5EgcfPhUjRo4E8SAY930ZtJKmqF1PWJ6kVTsJxKjvA76efg11bYt7IqLeqSMafj+j4F5Q2EGIh8cS3SdNj+hgGwTFERAzpILfKXwVM6JzTbKE7ycEGiCcMSD8fsZ4TdenRidcIn/CsAuJPwQlYlQgRKJSI8bAEWx2iEwggMsUQShgIM/gt7ffhVceezwUGObgUkVkS973ILQAsSZvjNJATYCWO//SAp9q3NvkNTEziznnuP766zFp0qSirFormmthUYhVTE04c/788pe/xFe+8pWY36EfWlS73n2rpP2pqBTX8LX0Blc2m8WuXbus4bCwhEtfYdmyZb89+eSTv7Nq1SrWUwejO4RLKVG6WhMvjuMUpRabRurhhx/GyJEjcfjhh8dYdLPbkYXF7o607mKMMQwZMgQrV67ESy+9FIly69dUQ7Su1gGHFrQ0S6CiHTSGoIwll8M769dh5syZQYkKAOG40U50IYAs5LMk9SQalXBhnRxvd0qMyr0O+nkOBgYGzsL/8WJRVH3dFRmECoIMFsGDDBiHCxBnBQFXKgiqayeehRkXUYYLAxhqW1JU7wFBuYRLyVySRAYMN64xKJR34TzISJGBIO6wAQPxzGNP4D9/cXOYqsKj9uFam4FxDt+Yf0W6OEyTduWThMmAp1qEi7mxZdrQqVOn4nvf+17ggBrZLWaGoPU/LKzfwWJxgF53f/rTn+KKK64INJ909ztjs5QaSFCtu6XT+rV6HQszdS3ZYlHX2C1WtUcffVTMmDEj6Ajg9K1OcDWdms6gywR0povp3GiDdfHFF+OWW24JnHSjlbatn7bY3aF3lpRS0bwwHQIpJa655hoMGDAAQoio5aIWcqt3aFJVlxQBQVAnhAjIFkWABNa/+Cru+/V/YKCThaMAKB9cdB489zdB1FqfX+rnhySJAhXKTsIglnMetJ8mxB6C8eARaoUwRVC+hPJ8KM8HZMG++xSUJumf+kGcBR2N+vh6d/Woh0Ch21lMYWcvBYLyfHAFtDpZbFi1Bnf+4pYgs0UByHlBByLOkffyEK4DX/rgRlaI1pHhZRIsadevVqK5aQFVc3MzvvzlL6OlpSUSCjZtkvU/LCwKGlHmXCQi3HDDDbj66qsjv14IEc2jRsoMK2WDKgpeDUHhK6+88mg7aizqHbvNyrZu3brrpkyZsmjDhg3d3qGsNMOls5aLlThs3TGimu3WgsGmzoQ25I7j4A9/+ANaW1tx3HHH2V0lC4uEA6B3UJJzmnOOYcOGYfny5Vi2bFlsbldjHtXacXJdN9JPMFu36qAn2C3nAGN4Z8UKjN9nH+y1374BAQCE+RdhMgsh2srXJRTUR+dV+KLavL1q7aBTxEmT4yzpcJula6a+UFInA2EnHMaCzJjUWvlwx1QZQbYKy4kCQqdvx2ffRzyVa7iYRIwu02JUyG5hABQP7w3nIKmQ4Q6yxJCVwI0/+jHWv/YGIIMSo6zjgmShW4kvJYRb6ELCEZBq5rGQeQ/LOf4aZLekBY3a7xg+fDhuvvlmtLS0xF5jljaaY9vCYneEuSGi58J1112HRYsWwfO8KIM9Keyv39sIXRLN404Ss10dv874A4CLL754wU9+8pMH7aixsIRLHWHTpk3XTZ48edGHH34YY0eTi3w5C36lZUKmUam0VrGc96bVTJvBYalj5JzjkUceAQCccMIJRT3ty0mpt7Dod/FWCUI0WV40adIk/PKXv4wFF43i7KQ5a1GpkNaFUARIiRdeexVHH300Wga2BtofpKBIAYxHATznHFx/ZhmEctJ2VvPasR4+ekqI9eQ8dLcZrbfCtB6IFs9lod5KqfezIEmCYAipchZ/hMfIjdIwzhhEUJOCvmpgWDf6MJ0QLrF1tpR9UMGGhpIqFMVl8KUMsodCsivrZsBzPoZkmvH/fvUbPPW7+wAIcC4gAmGW6D5HHaXCexp1JwqLvzTJyXRv8V5CZ0GT6UPouX3VVVdh9uzZnc4V61tY9Hek+dbm+pcsDfrmN7+JH/3oR0VkgzkHazF/kvp15dqDcuOaND8g2ZXJ/FyRyO4777zz7rz99tsX2hFlYQmXOsSWLVuumzhx4qItW7bE6iJNgapkqms5jnWlrULLDS5q4XzojBdNrjiOgyeeeAJtbW2YPXt2TNsh6VRZfRcLi8K8HDlyJFatWoWXX345cgj6ww4tZwyCcziuC0kE2tWOFe++i4/P+niQ/CACTRBFYWqvVNEOuxmJliMs21M9lL68/zWz20bGEKiQUVQOIcRQ3BabmzIvWhjXeAhiUXZS57Kru8sE7xnh4jgO2tvb0dzSAi+fD8hIwZGXfkHjKS8xxG3GsmdfwO03/BzwFKAIDnggQh3eK30v9U/OCu2lRfK+oyDSW+05VarDY1e6MJp8GT9+PG6++Wa0trbaBcRit/cfkmVAJvGgOxRJKXH55ZfjxhtvjPyK3s5gKcqg7CHZUq4fEOlWGULxJtly1lln/fm3v/3t6XY0WTSMX707nvTKlSvZvvvuGyl6a50Gzjlc1+01DYZK2OByX5vcqe7qu7PZbEQu3XDDDbj00ks7FRa2ZIuFRUHzSCmFhQsXIpvNRg5Cf5gjgcKERD6fB6AAJvDeq6/jnltux5BMM+AHwaErGBT5sc4IrJsaIH3hRNbStvdEC4Or4JHUaSnnASASW9UPFqjrpmq/6AcHi8pg+opuqReNlp6OKc/z0NTUhHw+DzebgSd9KKXgcgGZ95AhjhbuYNvGzbj5xz8Btu8EfAWXibheTYU3gpcY330x3s1deqUULrroIowcOdIuHhYWiHdMTc4dTcpeeumluOWWW+B5XjSPetu/qLZN7kpDSp+nPlczU05vjn/qU59a97vf/e5jdhRZNBJ2W3WyrVu3XjdhwoRF27Zti6XW94Q97q4mS6n31VprRggRGXJt4JcsWYI1a9Zg9uzZcF039nm2lMjCIu4wAUBrayvWr1+P559/vtdEsWu+MGjtD11hIhXOq+jgAAAgAElEQVQgFd5dvRrDR43CpAMPhOJBhxzmCARVRAxM8CIbWmoH3HSwevt6VZImXQ3SpmKNFyOA1iUkyVIRYoVsliirhcU/Q2e0FH1+mAqRSq7wcgurUNVrV1dESzcyXIpKehnAhUBHLgdHiLC0CHDBkQVHxiP834XfwwdvrACHACej21eaClKJ+6XLjFji92oHXZXcWzOIEkJg4sSJ+MUvfmGzWywsUuaUKWeg45A5c+bgnnvugQhtRyaTiV5T6/WynMzUSu1DqdekxRV641v/zZR+mDVrFh5++OH/z96Xh0lRXW+/91Z197APuKGoKP4CirvgQtQIbkjcCBGN+xJ31CzE3S+iaOKCmJBoNGrcNUYB1yygogFFUTYVA4iIogIi+zbdXXXv90f1qblVXd3TPdMz3T1zXp55Zpjptfres7z3nPd04RXEqLqcoS2/+a+++kpstdVWUEr5IlRNGatWTMVKUwPNpiQLpkgmMcimcXvyySdx4YUXYvPmzT7THNa4YTCYbPH2UiwWw3XXXYeOHTtGiqFWI7zSZdKAEsjIiAB1afztT3/Bkv8thEi7EJlpCY6bghYKUgJau00mHKolYG6uz1oLmmZT/50m2wSm3OT4yjfRhx7bfw5Z/+WKzP1bMNloDXtFRJBhSgCOVoAl68VulUaNtNFOSfxt3P1Y9MFsCFfAylQgCSE8/R2R3RZmVjBFfZbeGin9Om3MfcNjxy+88EJss802gamJDEZbhVmxYdoOOgQdPnw4XnrppUCbkVdt2jK+NN+eb0z+UqwNMYWBTUH//v37Y/LkyXzqy2DCpRqxcuVK0a1bN79FgIKElg4mc/VHl4KYiXouy7J8/RZT2I6e4+9//ztOO+00bNiwISuJZMKFwQjup549e+L8889vNXvDdRWEhJ+8exsfQNqFs24DHhz3ZyTXboANj6C2bBtaeIFSLvtZMYKoQElHDBcacBb7XGFipD6xztb1CCfnuVpRct2PxkKrDFFQjs+j1dgD4V1PJ1PpFYvFUJf2dFzidgwJWPjn8xMx7eV/ASmFOKQ31tuYGJa1dwyyxSRdcq2RUlzrxu4Ps1pYa43evXvj8ssv920Aj31mtPnES0q/utzExo0bcfLJJ+Pll1/2fSlNG6XvlUJYFmofGrpNVExA+jXmhNV9990XH3zwAZMtDCZcqhmrV68WnTp1ylL/rgTSpRSJShST7jiO3xtJDsC8jVIK//znPzF06FCsXLnSJ2ioGojBaOugUxfaN9deey1qa2tbRTUHieFq5XWk+BU9EEDaxdcfzcNjf30YcDNCfhKAlQkOG9DAihoJGdXHXS2ES2OfN+8XTRoKfc9FiIQ1XKKS8XDli/ll6r1IXcTrbORXayFbcu51ISBsC2nH8cY5Zw42EpaN6W9PxXOPPAbpaMS0gHAVLAg4ykXadXKuG5H58veKUdWiALg5yJbG6LkU+5nkmlKktcbVV1/NrUQMRgim7pnruvjuu+9w8sknY9KkSQCAeDzuk5YUf1cKYVlKmx3Vhu26ri9zoLVG3759MXfuXCZbGFUNPmrIIJlM3pJIJEYRqdBQUJJrJHQpxOryTTMqRCOi0Oc0kx4KkMwpC0opLF26FFOnTsXAgQPRrVu3gsdgMxitGVHjUDt37ox169bhnXfeqf4pRRJQSsOyM6J+SkNKL8OTtgUNYPmSJXBsC/sesL8nseu6/kk9tMialpI32NLwNUrKJTrc1M+sZNNgRL0GSK4KlqzpOOGfReMDZF3GsdClvI5NexE6968DGi5RDIe3R5LpFKyY7YkRK40uNR2wcOZH+OOtvwPWboKtBGSmIM4RGkJKaNoDIvS56nqdFp0hdCCytVrosxctdE3DY+XDcUv//v1x7733BvY0xw8MRjCH+Pbbb3HSSSf5sQORDXS4ae6zltBwybdHi/clhREt5nfzMHjXXXfFwoUL2WAwqh68iENo166d3rJlS8DYmCrZuQKMUgePYaFa83uuAKepBtAE6bsQw7z77rtj/Pjx6Nu3L1zX9cv8KJCi11cOFXUGoxygfWBi5cqV6Nu3L1avXu0HDlQaTHsp6jQ4n80opy6Mmeh7p+xeNqgBrxSixsa5I3+JH50wGJvcFLQl4UIjJjOC3JZH4roZ+6lUhqQKvR2Jer2SlggeFYoTAa1q8qAECXXLP3F5fYjKMCHSaOOhdesTYlrDitlIp9OIxWJw044/nahOOdBSwIKADYFOMo5vFnyOMTfego1fLYPlZiqJhPJakDLLxNLRfI+/hpWuZ2OM/eLHBRqNig+KjR/I1wPwYwH6TnbOtm0899xzGDZsWCCmYDDaGqlC6z9qBPS8efMwfPhwzJ8/399PlVb11xRdy6j4hf5v23ZgKiy9d7rfTjvthC+//JLzVEarAHu/ELZs2SISiYQfMFDfpGkIWtIY5kvMmhNm8AQA8+fPxzHHHIOpU6cGyBZqwTLHRremfnwGo6E9Yuq2dOvWDTfccENg2gARtjRtoLmnoDV7wKU0hNKAo4G0xuNj/4hP3v0Ana0ELA0IpX2b6Ytxk8MJJVyyBZxQU69bSwuOMiogMNLRZEvwRgLJZNLXG3C1Qjweh7AkLClhC4l2sThqYGHttyvwwJg/YOMXS2FB+o9tki3+etW513AuId0oQd3mXIMm8ULl/+YoVyEEBg8ejJNOOilgB3k/MNoCyP+HD27DbfvTpk3DkCFD8L///Q+A10bUFvYICeKaEgXmCGgpJbbbbjsmWxitCryYcxsEbfZPklaDWe3SnMF+VFtRvjGqjTmhyncfpZQ/mo3IJtd10a1bNzzxxBM4/vjj/duFq1wYjNaO8FqnZMO2bWzcuBF77bUXvv32W//0xtxDDVW4hPd3VIVbi71PEWqfykxT0fDGQSsoICaBLh1x/e23Yo/998G61Ba4lvASyQxBHYvFkE6nIaiLVYr6ipnQ87UEaVTs87TVKpe2WuECoQJrM7JlxvIIBEd7PtAW0veXLjRikKjREmJTEqOvvRHfzPoYgARcDSvz4GGJbUsXb3uiPqdiD2oaGz/QwRRpwtm2jVQqhZqaGvz3v//FgQce6JMtRM6waC6jLREvJtFo+vDXXnsNZ511FtatW5cVa7cmP5ArdqG8wbxGZLe6du2K77//npMJRqsCV7jkgOM4gggWquKgvsrWQirkE+ONx+NIp9N+kkiJ4po1azB8+HA8/fTTfiCVuV5MtjDaDCh5MEGi2x07dsTdd9/tV3fQ2HXThjQmGSp3IGaeotuW7f3saiDtAus24s5Ro/HFJ/PRXtiwRLCFyk2lkbBjAYK2kqYWNXfAWTFEBqPgtZ6TbBGAsKRPtBDRoASgM0RiXFiIu0As6WLszbfhm7mfeuyKk2mtM8gWqvKydGn3f6mrcaPaAmKxWIBQodG1p556Kg488ECPRDIE96kqkMFozaAJROYBrSmy/+ijj+KUU07Bxo0bA9XhUfamtcVN4fjJtCuu66JTp05MtjBaJfioIX+AcQuAUZQomQlUsQamsYap0P835fFzjY6m90nsM51MKaXw8ssvY/vtt8cBBxzgn+ybOi5MvjDaCvFilg8TudK3b1+8/vrr+Oabb3ySwSReGtof5d4/WsCvf/SJEe0pd0oAWitYQkJYFpTrvX/tuJg1axYGHDIA8Y7tYcdjUBm7ISyZEf3MjLgU0hMAFQBERhOmhd6y1jogfNpU29zU+7GtjLwqZWdcJE330/VitP7UqAyRIIWAhIDrONAAEjU1EBroKGOwtqQxbvQd+N/b78ByJeLCgoXMVC5DQ0gAkAp5RaZzCUy2YCyU1/6ZOi7bbLMNnnnmGXTu3Nl/nY7jBARAec0zWnViZVRxmf4fAP7whz/gyiuv9CtazLHPhcYH1Uy0mPaEYguKoTp27Ij169ezcWC0SnCFSwMYNWpUeyGEXzJLo9paY+IY/j+x8US+kFNwXRfpdBqXXnop7rjjDj/YovuwMB6jtcMkJMOq+pRY3H///R7ZkAkoKJgyW/Cq4X1G2QoLElopCFdBCunpuWxOYv1X3+LOm2/FppWrIdIubC2gHdc73VMKrvZaFctBOpQqWW2KgCBXu1SPP8w1IYrgut661q6CLS3ELRtbNm9GHBJiSwp/vP1OfDxlKiw7AVtI6LQD5TgZkqY+ABO6ZdZtqdY72TvT35Ntc10Xl1xyCXbaaadAKwWNwGXhXEZbgFm9YbYT/+53v8PVV18dGMJBRKXruojH462u5S7KbkkpA+/TsizE43Fs3LiRyRZGqwVXuDSAt956y7n++uuff+edd0aYxEtTjE2x94vqf2zuEabmKZQp+klJAwVcr7/+OjZs2IDjjjuuRZMnBqOSgojwBDEpJbbddlssX74cH374YUAst5AT3rBuS9T3Zn1/oBN3QwvCtw2AhkbMikFAQCkX8UQCruMCSmPT6tX4dMFCHHjQgejYoQPcjDCoo1xIyxPX9MfpivpqmlIOI25wmpwo7effHEFpG99hZX12LY2KkxDxQlOKlFKI2zHvz0pDOS46xBOIucADd4zF3ElTAEhIR0O5LuKxGGABrpP2bAQ9vOnahUK+nVCKvd/UxzBPpamliGze7rvvjscee8wnWEyyqJpaCBmMpiA8Bh0Arr76avz+97/3CQbaD+ZtyzmRsKViJrIdWmv/ADsejyOZTLJxYDDh0tYxbdq0lSNHjpz27rvvnhMWd2puwiUctDQn4RIW2qP3Si1DpogwOQutNaZPn44vv/wSQ4YMiTy9ZjBaG3KVxJr7SCmFww47DE888QQ2btwIoL76pTFBStT3lsh7A+8VXvuPJSSU1n5rhOM69Sfato0N332HuR9/ggMPOhCdOncGbAkIAaU1pCWDZIv5Xksca1YL4cKkS2URLsbkZa+FKPNF/IuEQMyy4aYdCA3U2DEkhITtaNx3xxjM/s+bnl6L9qhF2ilaZ9oPM5Rj1rv02ReRkyRpyjppkIgsYo2ado/2/oMPPoh99903i2gxJx7yWme0dtB6p4OWSy+9FPfddx+klIjFYoG2e/N24amfrYFgMe0XfTdbrJlsYTDhwghg+vTpX1x++eUrZsyYcYI5uiwccESd4pS6OiXqMQo9PSrk9YUTu/DpvVkaTLebM2cOZs+ejcGDB6N9+/YBh2KOhOSWI0arSAdD+yh8gkuVYO3atcPOO++M559/3i8bNu9jBlumHamY5Dxzmu9XuggvWfRP+70XkyFjjBM6IbBp5feY88knOPiQQ5BIJOC4LiAlXNLCgIYkTQtXQWSIHNdxIHLYiEITxlz20P99M522l+oxKyXgNtd1y74mUd73Cg2tFLQlAhygkJ5mi9be2pVSIi4kbAXIujT+OuaPmP2fNwBHQ2gBQEELDSkBnSFTqLrLq3Dx/g6h/b97r0VGHrDkIl2K/WwKvX04pjHtlJkcaq1x+umn48Ybb8x5QMRVLozWSKyYByymTweAZDKJU045Bc8++2y9uHaEaHT4AKcxcXypfE0xFTZR1bfmtTFbqqNQU1ODuro6NggMJlwYQXzwwQcfXnLJJZs//PDDY/yS4kxJnBDCH+0WJhRKLXhb6oC8MdU6YbIJABYuXIipU6fiqKOOQteuXX2DTEmkKbzLYLRmmJVgu+++O2bOnIkFCxYAgB90mac9xU7uaKmkJSzkGW6zoJ99AVz6nasACGz6/nvMmDUL/fv1x9bbboOk60BBw7Jt7zo4LqSfgBqkU3MHms10+aqNcCnmeVq21L08hIvv3wR8IlQZpIIAELdjUI4LoYEYhKfZsjmFP90xBnP+8yYELAhXQ2pAiExlS2gvCf93OlIjRgjZrNe72LHR4fuZxLFlWejevTuee+45dOnShUXzGW0CNOKc1nu43XfFihUYNmwYJk+e7OmeWRbS6XRJDhwriZDP9ZrMsc8mEUX5QDweZ7KFwYQLIzdmzpz57nnnnbfVnDlzDrYsK6C+T6rjDQUwlUa4NOZ5w6f5JIL11VdfYdKkSRg4cCC6du3qEyzknBiMtoDw3jjkkEPw8MMP+yPWaS+YZItJvpR7ipHQIVIlV04c1rgwbiuFhNYCW9asxYcfzsTuffpgm+22g5YCChquUpBCwJISloY3FQaA47r1bUdGUljS91zhhEu1BNytlXBxMy1ylvTEoaUl/aorkek3siHQTsbgrNuEcaPvwLxp7wFpBcsFhFB+e1C4dcgjXjJ/F7necWUnVLZt+0mU1hoPPPAADjvssDayNhkMZMXBpq/66quvMGTIEMycOTPQKmRqHrUm+x+lPRMeKkBj5KmNKJVKsaFgMOHCyI85c+b86+yzz+45d+7c/WlctH8aVuDpTqUZ3GIez+zJJoKJ/m/bNr777ju8/PLLGDBgAHbccceAMBiffjHaWkCmlEK3bt0Qj8cxadKkyFHSZrBSyAlYy4nmNjCuNkd+KCGglYZUHlGyZc0aTH9/Bvrs2Rdbb7ctXNJ0cL3WDQsCtmVBaQVpWZnjf9F875cJFz85iEoYmlJm3hoIF0hAaeWNQReZFmLL8iZzKQ3hanSQMdStXIM7bhqFz9+fCbhAwooBymsPUrnehQBEqIZLNPH9N8fnE14H4RN813Vh2zaGDx+OG2+8EbZt+wQM+3hGa0e4jYYOUubOnYsTTjgBixYtCgyZKPQwpZx+pjF2JEpfKio3oDZEJlsYTLgwisJHH3300tlnn91zzpw5+4fLc0kUq7kNZqmD4mLK9cPBVfj7hg0bMGHCBOy33374wQ9+4Ou3mCWYDEZbCMZoXw0YMAATJkzAqlWr/ACEtJDyaUCVi3AJ/CCyCloi00I6tFfQsKREPFMFCAi46TSmvTkFu+62G3rutDNgEi1KIZ1OIxaPwyXbKZpxukkbJ1zCay2fhkB5pmaUl3DREoAUsIWEcjyxeO24XjtRMoWuNR3w/RdL8bvrf4sVCz6HpS3olFfhqrQKTN2iPWF+6fAvjXctGnj/LUloRO0/8+dtt90WEyZMQJcuXQL6LgxGawcdnNBhq5QS//73v3Hqqadi6dKlgcme5OtNIqLS/ExTXlOYcCG9OsoTKO7PtFVx8M9ok2DP2AQ8+eSTF5x55pnPmiw29WkWYrzofrn+35wGsqnESzqd9suKzVN6+m7bNtauXYuhQ4fi6aef9n9HDorBaO2ES9TPjz76aNZtlVL+vqDApFDbkeur3Omw0J4dSTkOJAAbEtiSAjZswbgbR2HKi6+ho4hBOgoy83LteP30hmhdC47TWnoNt9YRpQ0GRhkflXYdSNtCLBZDTTwBnUyje6eumPfuB7jlN9dj1aIlEGkF4SrELBupVMpvPZIIjXw2/p/Rya2/1qYIdZGfRzk+I7JXd911F3bYYYeSnt4zGJUO13UD2iQA8NRTT+HMM8/EsmXLfE1HmkpEoJaa1mTno/SgzFwAqJdb+O1vfxvn1cNoq+AKlybi448/Hn/OOef0+Pjjj/vR2ORCSIt8YlPFtvc0V9CV73XYtu2TLo7jBARxqXSQDO7EiRPRrVs39O/fP2CMGYzWinB1C6357bbbDgAwbdq0wOlYqUvxm/w4OU7ew8KfWaf3mWN9/71LAS289iLLtqEcDbguPnrvPdS5Lvbeb18oS0BbEsKykEylPGI2hz1rK6K5LbU+o65rZZAs5a1wUVAQUkJZAq72JmjptIOtazrizRdfw1/uuAfp1ethaQHhKs8fZk50PUJF++9AG8LSQigI6OD2ClWRFfL+W+KEO9eUL/L1w4cPx6233hpIqLidiNEWYFanAsBDDz2Eyy67DJs2bfLjYCEE0um0r+Fi7p1KqXApla0P7/twhW9NTQ2uueaanrfccssaXj0MJlwYjcbcuXNfOeOMM/p88skne5MaeVT/c3MQLlG3b4nEzezJDI+ONo0t/fyf//wHGzduxHHHHcdkC6NNki4UoB166KF4+eWXsWrVqsC0D3NfVXLiHyZdov5mWZY3+lkrgDSclIYlLUjLI1QWfToPS5Z9i379+6Fdh/ZIuw5sy0KaxkLLjNKFaIb023hAVcLHr7ZkM2y7K+c9lGksNAAIBWFJb6KIEEhYNmJaoKOI4e9/fRQvPPwYsGGzV9mS2d9OhmxxtPJEdiP67jySxbvOUoememX9KIomQ5ri/6MSr3yP0aNHD4wfPx4dOnQIVLgy2cJoCzCF72+++WZce+21gUNG8uGJRMKPkUu5R5rVvxc5uS5qDHx4etPVV1+92+23376EVw6DCRdGk/Hxxx+PP//88zvPnj17AJEupgGOCmyby6C2ZNCTS2OB2ofM37/33nv49NNPcfzxx/sjc81rxO1GjNZIuoT3imVZOOSQQ/Dggw9mieWS3WjsHm5MBUihVXnhdFjkyZMVdPD9k6CF1tBaQWsFQGPF4s/xwdw56NP7B9i6Wzco5QIS0EJAxCy4WgEyQ1i5mQAuI6jrtx4ZhIlfYRPx+4D4r/CIFhrZS/cRJfq8y558aols5ZCIL21cLPN3Qpf19SnjpUV9IYKACKxjLSAgIHJoD/ntAHAhpQCUglau32OtpYAUGpbjorOIAes34S933oN3XnoN2LwFQkhI/y1oaOlVxVgCEDJb50hk/c+r/AJE4F/Uzip2fxYTZ4QPSczHMDUoTF8upcRf//pXHHzwwQEfXjFrn8FoBpAGi3mActVVV2HMmDGBmJeIGNItzLXHWjqGjyLVG3qeKI3GfLFGeNKibdu47rrrejLZwmAw4VJSzJkzZ9Ill1yyeebMmcco5ZUZExNOJ9n0u3KPfW0OAidXpY5JrixYsABTpkzBMcccg86dOweMs5TSn/jEYLRmbLvttojFYnjrrbf8QIb6u8tFtpoBVJPFakX0f4n00ACgPHZk8/er8da0adi+e3f0/r8fQGkNR3s6UXE7BpUJWm3LC2i1GTD6iWr9E3iJdMTzGsQKQDyDyLpdYCR2Ewm2MlrtJt5dl/X1adHEl5dhWnI9DAnbWxZNIJKwpCd4KzSgXQc10kbXWDss+WQ+/jj6Dnz23kwg5cCy4hCZxEMhqLsiCr36ouHkqNCkqDl8vNYaiUTCq/KR0o9btNa46KKLcM0112SJ5IaTMwajtcCsUgGAdevW4ayzzsKTTz4J27azqr1NgrIxvrRZhOIj9nsuYjYXsWK+l7DuHOk0UnuhEALXXHNNn9tvv30xryAGoxx1u20AF1544S1/+9vffks6J6a+CTHgLTHFqJQoVszXdDpmiSX9rnfv3hg/fjz22GOPrICNwWgrOPjggzFjxgyfeARQsHBuqexGOLnLtQ/DQVhj+r8pUQ5UK8hM6pqIYdCwofjpOWcg3q0WSe0inUzBjsfgKK/SRdoWkk4adiYjDzye1l5xhlntoKOfF/AqXOh9SR0UMjVv19hAtvwVLk2JDFRZX18haytf0iCEVyUjVKhyI3Q7Bdcn+rX0hC51XRqdLBsdrTimTX4Tf/vLg0h9s8JjV4TlTdcSXssbXSVprO9Sf/ZmhUuxlSuNvS0lT5Rskn3q3bs3ZsyYgc6dO8NxnKxphUy4MFoLiFAIV14vXboUZ555JqZPnw7Xdf2DEvNgMddI9cb48VLorOg8FYGF2JwoQjYWi/n5TSKR8ATDM3F/LBbDdddd12P06NHf8kpiMJhwaVZcccUV5/35z39+NIoRLiaYrFbShRyWOZmIAjeq9tlqq63w2GOP4YQTToA56YnBaAtIp9NYunQpDjjgAKxfv74kiUo5+sOLCiR1MGBLOWmP2IjbgFaA0Ni69264+De/xm577g7XdeEIjRQUYFsQlkQqlYKE11rkt4AIAQUNVwYJFPM5iUih70S4SA1Aaf/xFBMuFU+45EtI6HP1KzCIBDF+p2hUqfYmhhC5kNxSh641HWBtrsMzDzyCN195DdhcB8AC0g5sy66v5BCAm3lu6RMvpf3MzcSnmL3WmAOSqFH2RLgAXlXQm2++icMOO8wnW8L+HuCx0IzWQ7YQaL3PnDkTZ5xxBhYuXIh4PO7/zYxvc7UFN0Unq6mkS1Pun88+mBp09J5s28Y111yzG1e2MBhBcEtRM2HGjBlzLrvsslWzZs36salPYpYeljuxasxzFvO8VIZMjivMlieTSfzjH//Atttu608wqohkhcFogYDOtm3U1tZiu+22w6uvvlqS0arlIFwip5no6MlG1OahoWEJAVcpQANSAdpVEMLC5u9XYerkN9ChQ0f06dMHjtCejguRtVr7iS0l0Z4OiwiQKL5uS+CFBV9H/X+9PifvtSGPSE3h14Jbiprv9YU1W0zNF6C+XSxSFUUIaEtDCQ1ICVe5EEpDp9KobdcR3y1ZinG3/A6z33gbSDkQ2kJceKLPAkCMpmgJRLSuiSa1pOXyuc0tahxuGTCrU6k6d9SoUTjrrLMCvwvr1DHZwmgNMGNQWuNvvPEGTj/9dHzxxRdIJBKB8c5KKcTj8UgfXozgdXP49VJUyITbG+kxE4lEoLUoFovh2muv7XHbbbd9xauIwWDCpcXw4YcfzhgxYsSXM2bMGBqLxeC6bkCILhzkFEM4lDOYL4R4Mat5zPdsVrFYlgXHcfDqq68imUzi6KOP5ioXRpuAuff3228/LFq0CJ9++mlgr7QEWRJla0oREFowyItwfi28SgBXKcTsGLTy7EIiFs+I6gIQFj6Z8QEWLP4ce++9Nzp3rUXacSAzorkC8H42KhZ0JtG2ICCUV3Ugcr2OKI0ZQWKmjecEmHBpOcIl8HN4DctMK6vKrJWM1g+JJLtQno8SAjXChky56NquI96Z9CbG3vo7rP3scyCtAC0gqfpJSk9cF/UFOmHCRWpRksvf3P4+1543f0/aFI7j4Oijj8aDDz6YdTvzMIVFcxmtzT/Tz48//jjOPfdcrFq1yj9IjMViWYLWjuPk9KlN1UUr5SjohqacRdkF82fa99RKRUTTdddd1/O22277mlcQg1HyqIxRCEaOHHnUPffc83pY8YFk6JgAACAASURBVD8Xa1zphEsu42zC1KSgnk4S4DMnINApgZQSp556Kv7yl7+gtraWFw2jzcB1XWzZsgX77LMPvv76a6TT6RYLykpFuIRtgZX5kRpTApUHmQRYSm/0rmVZsCwL6XTatwWuAmAJwBawt6rFeVdehkOPORJJoZByneDzCsCB9h9bCAE4CiZtm+t1BNqKSmD3uKWoRK8vdH0L/XiUMJIEpf0ghyqiFFy/ncyCgEi76BSrATYl8cSDD+Odl1/zFksqCTteAyeVhshUVLmui5p4AmnX8R7D9Hf03Rd1aTqhRP6z2HaiQm4brprJpdOgtUavXr0wadIk7LbbboG/uZlR2ObhCh+YMFoDzJai3//+9xg1apS/3sk/W5aFVCrlEy+FTtlsrP5ZoXs7323DLYqFPHbUbcPTmKSURLZwZQuDwYRLeXHNNdccfNddd70XHptW7YRLLiNtCumFJzPRSUA8HvdJGLrPQQcdhKeeeioQ3DEYrTmgI1vwySefoF+/fi1GuOQKvgo5/WooYDP1UEyCg34Ot1ZKCC9JVRS4em0bWisgJoGEhf2PGoSzL70QXbfbBnXpFFx4NsbNjJHWxkRj7UYTBmHCxSRdTDREwDDhUnmEi99alNHwMZOb+k+ifrS4pYGuNR3w0Xsf4Im/PISVCxcDjsqI42YErKUnkish/EkcUkq4WmXGOmdOfOkzJz0gq/SkQzHiuYVq4OSKOYjsSSQSeO6553DSSScF7kvTFwnmFBeucGG0BiSTSVxxxRV4+OGH/UldplA0AF+vJap1PuwnGzMeuqmkSzGES1RlS66x0JTDkLj2TTfd1GXUqFHredUwGEy4VAT+3//7fzvcdttt31DQZla6hI10Kfouy0HMFKJ8br42uhZ02i2EwA477IAnnngCRx55ZNYEhKhTBPM6hquHGIxKhnkqrLXGo48+ip///OfBZNHQUiCRuuYmZJu8f5TOSXZk/yx8coYSV+1mJkRQE0g8BigH7Xt0x5kXXYBDjjoCSSjAlnCUgoKGoxWkZcHVCkLLwLQ0Evg0x85HkS70qi2dv6umQfssReSY3HyjcxtTydBUwiWfsGOzEjYNvD5hvB66XlprT38loorC9BNSSrjQgUlfEsoXWo4poEbacDfV4YUnn8GbL77sCeO6GjY8v6ykLzbktabp6LUc/sxoSpF5+lsI6RG1RkqRYBVyezPeiMfjSCaTvq254YYbcPvtt0feh8GoVoQJw/C6XrZsGc466yxMmTIlS5uolPF5PtuQiyxpbnImHHeYdtWcsqqUQiKRQDKZZGPAYDDhUrl5lkmyUGuNbdsQQgSqPqqFaCnUuIdPBkxjTmWZtm3Dtm3ce++9uOiii7IcI50mUKUMJVNmaTMHhIxqJF0A4OKLL8bDDz+clQyZ+6SYKS7ltB+UgEYlq1pEJKyiftyzcl1Ytg1XZ1orLAtKpYG4jT2POBTnjbgEW+/QHUnXgSs0HKXgSnjiupmnNKeiWaLepprJuNleRHqnsgSES67ENt/o3JIF80VUuJSU6CkR4YLQ2jdebNb6N30H7RFHKwgrM9IVAglLQrgK0lHoaMUx570P8NRDf8PqzxZ7ryWVghQStvSSCYcEgAzCxRwZHkUcmmu+oWmEDSVUjR0LW0xyFT7oMX2x4zg44YQTMH78eD8u4ZHPjNbmd01Sgfzv7NmzcdZZZ2HBggWBgw7aA2a7fCXF1o29T9QkNKpcIWKKYnWSBgCAdu3aYcuWLWwMGAwmXCobsVhMk34BEQXmGOWmBr+VSriEA04KTE2HZk5IGDlyJO68807f6BP5Yla65Po9g1HJMNeq2QMuhMBhhx2Gd999FwD8vnGyFS1hB5pc8izqk88o4oXG6uaa4GAJ6QvyaZEZTStFhnRxAVvCqu2Ek04fjsFDT0SsY3tsSG2BtG2v2iWTdJvX14Lw20m01n4VTjiB1sYUpMbaOSKTchEsTUlcC7qvLrMNbCrhAkQSjn7VklHpZVlWIHHSANJWptLRVbC1gE6mUZtojy1r1uPph/6G96f8F1i3IbMRvUCI1pyU0ifMTKIl/IoVolvUaI0V4v9KSbg05QScrisd/vTp0weTJ0/Gjjvu6L9WU7eBwWhtZIvWGhMmTMBll12GlStXIhaL+fEl7Q2TnKx0wqUxlS3h+9GBhdn+TyK5dXV1nD8yGEy4VAdqamp0XV2dz5qbYrLmfPtqJFwaOjU1W6roRI2MObHptm0jlUph6NCheOihh7D11lsHyBU+bWO0poCPCAYhBFauXIn+/fvjq6++yko2i1335SBdoggXSlqV8X5UpomHCI5wsEcEk7RDZJMUcJUDtE9gq113xlmX/Bz7DTgIdU4adU4KrmV7SXMO8dJAxYIpHioKsyvFEi6lsFfFBNyi3AMIS0C45CNfLKPSyycMqLJEACqj2ixSLrq26wBRl8brr/4LLz79HOqWfQekXchYHCqV9Co4NJB20pCZpMofOx4iW4Q2KqJCa92s2GrMkKcsQrIZKlt8siizl8jeUIuAlBIdO3bESy+9hIEDB2at26hWDAajWv2v+f/f/va3uPvuu/2WOvLJdAhazvi6OW1BVOxOtsA81KSDn44dO2Ljxo0ceDMYTLhUFzp06KA3bdqUZcQrpSWgqYRLQ07ArGoxK1vM0wSlFPr164e///3v2G233QKJjClixmMpGdUGs7rNrMxSSmH27NkYMGCAvzdobTfUrlBqe9CY++YiXHKSEpoqS4xrQ6QLdORElXp9FxuwgD0HHobTLzgX2++yMzan07BrEkg5aaQcB1bMI2D8Sjodfn06MoluKuFUqH5LyYPohjRSchDiJbObTSRcdFgDR4VEG4mszIgjSym9NjAiBlQatrTQScYxb+ZsPPPQo1j+2WJPq0XakNAA7SspYYUJBRoFnefzINHcqCqXfBVSUcleSyRi4c/ZtCmmIOjYsWNx5ZVXZrXosl9ltCYkk0kkEgls2bIFF198MZ555pnAIQiRkQAC0/QKaektB+HS1NcUFbtT1T1VoXfu3Bnr169nI8BgMOFSnejcubPesGGDX75X6paYlgySCp1iYpYnmy1U4UCUql6UUthmm23w5JNP4uijjw4kq6ZzMAUyGYxKJ1tMgWfa+/4kFNfF888/j9NPP93fG41NelqawM1FuEQlp/R3SnAp2E06aWhKpg3NJq01LJGpcMhMJkJMeneu7YSjTz4BJ/70p2jfuRPS8MZIi7gNV3iiucKSWaSLNG1TCQmXKKKloc8wamRv8S+gzBpgTSRcwpOjwlOjXKqIJF0et36CUExIdIzHsfSzxXjp789j5n+nARu3eBOItIAtJLR24SoXQkpASmilIKSEhNda5Lpugxo+5tS9cHtcoVNAoj7fYvZ4U5Is8sG0r4QQuOyyy3Dfffdlk0uGxgW37TJag++VUuLLL7/E6aefjvfee8/3vUSqROmnmQeD1Uq25CJ8TRLejM3JTnTq1Alr167lnJHBaCS4NrQCkEwmb6mtrR21ZcuWgLEvNVrSSeR6Lkow6X3SKRs5NBLoo1M3GkGplMKmTZvw/PPPY+utt8YBBxyQFfTxWEpGtcCclmOuXZOAkVJijz32gOu6ePfddwMVYC1NoBR9e/rSxsSZDDmiRP3PGhoaAkLUa18IIeC4Dmw75gnguq5HYAgBQTosyAhvK4XMnT1Nls11WPzxPLw7/X20q6nBzjvuhHbt2sFJp72E2vbuI4Q3hUbQi/XepPccQqDJ55ciOyk3f86XWJfGdpW5QrLBnhrRIGGlhbGQMr+je1nSE7gVSkO5LmzLQjweh+u6SK3fhAmPPIEn73sQX8+dByQdwAXgasQsO7OPAItaBYSAFALItBL57QPG82tpkGiC1orxLnTg5t7fm3B9GxrNXor9Hx5LP3jwYDz00EOIx+P+81DFj1kRw2QLo9ohhMAbb7yBn/zkJ/jkk0+yYs9Aq6JxIELCseXQcCkleVOI3zGrzbt164bVq1dzUM1glC0qY5QU3bp102vXrm0RwqC5Hr+hCheCqdtCJwfmCT8yCVUukdBf/OIXGDt2LC8aRtUj17h0cw8NGzYMEydOLNn+bakqGTPv1gJeexAQ1FYxJsH42hnUZgjt63K4rutXH8Qsb3qREJ5Oix8Upx1oKbwHbBfHDn16Y8iwk3HQjw6F1b4GG1N1UFL4CX1Uy1OUmG/Rn2lYC0bpwKjofLYyPDmmcS9AFr3+StnS2lCFi9DSnwhlfieoDAFHGj/+uGVkxNZ1ZpKUqxC3Y+iQqMGKZcvx79f+iSmvvQYsX+NVtLgalrR88s9xHcTsGByV9kgwSwYqzZQT9EG5Kp1M8eVIbkmKgva4+XMhvrNQjbSGENaK22+//fDKK69gxx13jJz2Z/7MFS6Mase9996Lm266CZs3b/Zj0PAkIjMOTafT/u/T6XSLVlE3VAHXGFHtfBV44QrLnj17YsmSJZwrMhhMuLQ+0mXNmjVZBtEMjszTpnJNIWlOh1JIQKmUwo9//GM89thj2HrrrbPaM8Ijo1njhVFNoJNlWtepVAoDBw7E+++/X69jkamIMe9jTuWpBMIlFxmRj5gpiWOzJBwnDcQswJbYrs//4YTTfooDDx0AtIsjBQVHK6jQeNz6iQyZqUiZihsJz54A8E84zRPQsM5MFomio9+3OZI6kK8rWZDNVDk+EgnVIAGW7/MRQuR87IBfCokdS3hkllIKsCSEChImfiKvPfKNbg+lfZKKJlMppaBERsfH0G5RaQdSAe2tGGpgYfXy7/CfF1/Bfye9jvSqNYDrXWxJ48TLcBidS7enVDoLhdzOFKY3/SLFEfRZ9OrVCxMmTMDee+/NhpdRNYgir83WtyhfqrXGz3/+czzxxBM5CeZyxIal1nHK1aIf9TPlFibxRNPK9thjD/zvf//jYJnBYMKldaJHjx76m2++8QO0WCyGdDoNwBsRaxIvTQ0Iq4F0yfV3pRT22GMPPPnkk+jXr1/OE0JyJiz8x6jGgJJa71avXo0BAwbg888/D05siZhqJprY0lAtdiMnqaAUrFgMSTft/aImDgiFrfr8H448/jj8cOCP0LG2CxwopBzHS/qtTPsSAGWMkA4SGQKuVrCEJ+ZLlSsBGyVFwUl+mIQhkqMhwoWer7GES5QdFCERWP+16MatCyWQTbggu62KCBez2kTBWPsCnu6KqyAhPI0WK45vvvgSb772b7z9n9ehVq7OlFBpWMICtFveNRhBuLRkUmZO+CJfaRKLdGiz7bbbYuLEiTj44IMDgqBcwcKodN9ortMwsUn+kLRIXNfFN998gzPPPBPTpk3Lauctt39r6mShYv9OxAoJ4pq3p+rzfv36YebMmRwsMxhMuLRu7Lbbbvrzzz/PnLamfU0TKnssJFGrdsIlF+lCzjYejyOVSqFDhw647777cO655wZul6tskgNKRrUGlfPnz8eRRx6J5cuXI5FIIJlMBu5jErLNtf+rgXSh1iNIARca0MqrdrEE4Dpov/OOGDT4GBx29CDstEtPbEwnsSWdhLAsuBKAsOBq5RO1ruv6rUzUiqSQaScJtY8oURhJYRIgWZ89ih+bHHxg1bTP1GhJElGvVxptT8iuiLGEzprmYRIu5MeoXYyuo2/b29Vg8+bNiFs2oDTcZApd2nWATCt8vWgxXn1hIua8/wHU92sAyHoNHymBtANpibJUtuTzWy2ZlBHZYo60DWuwdOnSBY888giGDh3qr3Ee+cyoNh8ZbnUzW+II06ZNw1lnnYVly5b5E4cqya81xkY0RUzXnExmCgLT6OfDDz8cU6dO5fyQwWDCpW2gb9++ev78+VnjkvOppBeqoVKJSVO4JD+qRN8M4omlJ4wYMQLjxo0LqKyHg3sOKhnVCLMseubMmTjmmGOwbt26gMA0aSIVMkWhWsfOF/P6skQPMy0msKVHwNTEgY7tsN/BB2LQ4GOw5777QMRtbHHTcKSEg6COioIO6Erl0mJxqTojwsGGiZhSES7Z93d94ifquwWR8+8m4SJyEET+FKqQwLBfFQMVac/p/pQQuVoF7LnZmgTlXYWO8RqIlIvZ09/HpJdfw6LZHwFbkkDaBYQFuC5sOwYXGtp1IW0bUE7ZCZdSthM15r5mQkU2hNoGLMvCww8/jLPOOiunrWEwqhXUPiSlxH333YeRI0cilUr567/QOLkSCZdS35aq3ShGPuqoo9SkSZPYADAYTLi0Ley55556/vz5gRLh1kq4mO8h3wkhncaZk11Ir+Xwww/HY489hh133DGrhJrBqLag0dRfMPfGm2++iZNPPhmbN28OnGbTXmhuwqTS95NJxlqWBZ0ZG2xZFhzl1k/BsaVX9WJb2GXPPfCjI45A/yMORWzrrkhb3rUkW0NtLg29dwUNJUWAwBA5CJes+xbYUiTyki2AK9xIUVr6Lg1CKPydnj8sZBt4fTpUim8QMp4WS6jKSgbXcLhySxtaOsLVqBEWaqSN779djnemvI1pk9/E6kVfeEK4lg2kXX/ikOu6/mQgn2wvc0tRmHiJ8mvNSbaYI2xNkpCIlLvvvhu//OUv8/pdBqOSYbYPmYK2sVjMv80vfvELjBs3DpZl+T6hEqubm2P0s+mncwnvEtlC1eJDhgxZ969//auWVxeDwYRLm8QPf/hD/e677/oBU0NOoxpbiopxMiaRAiCrhWKnnXbCE088gUMPPTQwBYkCT24nYlQLiEjUWsNxHD+YdF0Xb7zxBk466aSstqJwOXVj9n9DNqTS7YerXAgpYYnM6FvHhYaGbdn1VXJSZKpeMjostgVojcR2W6H/UQOx3yEHYa999kasJoFkOgWlNZQloDJkWK4JNtTGpEOONh/ZkqXFomXe2xdCuOT7ez4CJhfhEmgZMsRyZYTWjRb114d0WIQQECrTauR69hhKQ2gNW1pe+xAAnUxj0Ufz8Oa/JmHOezOA9RuAtAKkBVtLOOk0LOHZdcd1YGWE0Sl58Co0qj+0aUpFDCWiJBpPJ/5aa9x0000YPXp05PORn2QwKtq+R+jyUWWW1hrLli3DGWecgalTp/rkrln1mC8GLJXmUin3emOrWnK15AMISBQopTB8+PC3nn/++UG8uhgMJlzaNI499lh38uTJkhKqQtoGmrQwKrDU0nSEZr8u9amTwLDruojFYnjggQdw7rnnZo255JM8RrUkXFGTtUzRy5deegk/+9nPkEqlAMA/qWoq4dpQpVyl7x+atOM6DiCEp71itCOabUGmPXW18ogXSwLtE+ix66445EeHYf9DDsR2O/WAkgKOBNJQUMgeIe1XeDQwiUmLBsiXBsY65yJj/NeSR8OFxGy1FIFWIvo/ET7h8MB8/ZHVLZTQCA1lZYgVhCpYMmSNTruwMwK4NcKGTjv4atFivDf1HcyZ8SFWLvoCSKYz7I4NOC6gveeyhISrXCSsmEewQPuft/Zfk6roPd3cCR0loJRoUuXbr371K9x1111Z0/vMNiL2j4xq8Y1hP5VOpzFz5kycffbZWLRoEQBvqhzFh1FaRVGiudVKuBQ6Np60Wsj3nXfeeX967LHHruKVxWAw4cIA8JOf/GT2xIkT92sJVfVyB1xRQV/UWLvAqNFMEkr/11pj5MiRuPPOOwMOlgNKRrUFlmbZdFgc8MUXXwyQLqWocMs34rgaCBdq/wkTBuYpp23bcNNOQBhXaw0rZiOt4bWlSAnELMhOHdB7r7448NAB6Lv/vthqu23g2t6kojRpw2TaZpwQGR4mV8wpQDmrWLTMq7HS0OeTq6VGF/ixCVhQQgReX4Bw8Z44su0IElAyM3I7Q25JDVhawBICMUi0t+Oo27gJXy9eglnTZ2DOhzOx7IslwOY6r23IBWxZTwDQuG7tem0ydqZyyVUuXKpcEuZodFWR+7glCRezbcBxHFx00UX485//7F3HHG27fCDBqBaY1cq0Zu+//35cf/31WL9+vV/d7DgOLMsKCMpH2c/mELouBeFSLNlSCOFiTj+96qqrTh83btzfeUUxGEy4MAycd9554x5//PEriVygFiO//90QwDLJCDLChVbGVGrA1ZjSyiFDhuCRRx5B9+7d/WtFvf65AmEOOBnVEGzSad3EiRPxs5/9zJ9oZq7hqBajBhP2IhK7qnF2BVSY+G0wwoJWypt+499We5UviRj67Ls39jmwH/bcf19st1MP1HTsAMcC6pJJbyoSPJFey7KgM5UzSilYMRtOhqAhQoJska8P49afxkJpf4qP/z2UEPsCtEZrpbBkQIyWPnM66Q0T0AENFSGQchSkbUHCKMM3dFukEPWvP7QWXGgo7SBu2VCOC1sB7e044lpg1bIV+GbJV/jow1mYN/cjLF+8BEhnNIeUBrQ3alvq/J+XzBO66FZguovxc5Zl+afVUUK5Qghccskl+POf/8ztQoyq2gP5tArNv9XV1eHSSy/F448/7tu7cOt5oS1F5d7n+QjZ8HvJ9TfLsuA4TsAHmG2G9Pvrr7++52233fYVrzYGgwkXRgSuvvrqQ8eMGTMtTLqYeiW5HFahp1fVTrhQMkq379OnDx555BH88Ic/zHnSaFbIMBiVDnNyEQC88sorOOWUU/zk25zMZZ54maNic+2rQvd/tRAu2Roj+f8vhXeNBIICgxpepYnWrjdmOh7DVjv1QN/99sHu++6Fnrvuiu16bA87HoerFRyt4CgXaa3gCkDa3rhpLesJC7qOUmf32UuIAOFC/6fEwQyyw6S7+XfzdmYLlX+6mxlzDaW979LO+oyp2kUa9lNC+PaSxJrbJ2oglQupgdSmLfju22VY8PE8fPThLCxZ8Bk2r1wNuApIpQEhvSoiIosETSfSeQmXqOql1kS6FOrn4vE46urqAqf5sVjM13wSQuCKK67A2LFjYds2UqkU4vE4G09G1REvWSPmM3Zn3rx5uOCCCzBjxowAuRC2FaU6ZCglkdQUbZZcQrgAsg5jiYAh259IJJBMJjn/YzCYcGEUmOxosxyyOXRdKi2hysfwm1BKoaamBnV1db7jSSQSuP/++3HBBRdEOj2uamFUC0wxXZMQGD9+PM4++2zU1dUFAlNz7GOU6HZjCZdq2Tc5xy+L/O8rKkinUcbCsqCREd3VXvVLTbeu2L5HD+zWtw9+sMfu+MHufVC7zVZAuziULZHULrakU94ko4yWipQSEl57jt/WFE9446WVjm4tMj4/k3yh12vlcO1C5yidNyppIAW0zojoGqSMVgoSArbwqmcsKWEL77XbGeJl/dp1+P7b5fhq/gJ8MX8+Pv30U6xavsIjV9Kud500MmUxXouRqa/gE14R+jH11UfBhiFJ70vDH6atqpx0aSgRC1exhtcsXcsrrrgCY8aM8TVbGIxqQVQ1nimMCwATJkzAlVdeiRUrVsA8gMy3h8pNtuQigZpqE8z3R/aBDlZoFHw6nUb79u2xefNmDnYZDCZcGMWgpqZGU3JlGlazVzVKeLMppEs5VNxzOaxcjsgsnzRP+JVSuPDCC3HPPfegU6dOTb42DEa59oG5pk3dosmTJ2P48OHYtGlT5P4w7UOpAtFqqnQxK0ZyETI0xci0dzltqczoZKQzIq8x23vAmA1Rk0D3HXdAz97/h16798ZOu+2KbXtsj85dukDb3memoP3qEKU8MV4lLa/SxLS5oUvshsZUU8sQUD+2OXDSS+1IOthmJg3Shp5Lwgo8jpQStvRajCwNqLQDJ53GqpXf45slX2HJ4sX4bMFCfPH5YjhrVnuCt67yiBWl/L4jsxKD2pWEELBlpvLH9VqZcpbUm2SL0c9kki4NEWmVTqYUs9/M8efhUa/XXnstfve73wXsBICCRpszGJXm6+iQgfzdr371K/zlL39BMpn0SRitNeLxeMC/VcqBWjEaK02xGSbpao6DdxwHW221FVatWsWbn8FgwoXRGLRr104nk8mAuGbY8JqOq1hyoZKCs1zOM+yQqKyUEplwknTIIYfgscceQ+/evbNOTaopgWS03SA0ap3SWn7jjTfw05/+FJs2bfL3QKkmGFUr8RLWQjGJCBkiXiixp+A+qtqFAnwFr02L7K/KTM2BQchAeZUwoqYGnbrVYvuddsR2O+6Anrv1ws677oLO226FDp07IdG+HWQ8hpSrPL2YzGfqOA5cnTm1RHbLJJE+udYGES1CeFUl9Lhaa69CxbZ9HRlLA5ajIVwF5bhIJ5PYuH4DVi5fgW+Xfo3VK1bim6VL8c3Sr7F6xXdAMlVPqkjpabE4jl/NYmrImBUZMcv2xzjbUnrvCwi0xfqToES0DK7MQ6y1RqIlvM/C1Wr0HDfeeKM/+lkp5U/zYzCqBeH2borfli1bhnPOOQdvvPGG3yJrVviFW4oqgXBpyt6Pum9DMTztd2or1Fqje/fuWL58OQe2DAYTLoymoLa2Vq9duzYQkJWKcKmkRCqf8zQdk1LKV2EnB2yWrmut0bVrVzz44IMYPnx4QPOCq10Y1QQ6+QvvhVmzZuHYY4/FunXrAmvfTGhLvd8rnXCJSszDhIs/UjpU9UFEjYL2tVSggi1dRH44qp7E1a7XimNZXhWHq1yPjLEyXzEb6FCDjt26YuvttkXnrrXYYeeeqK2txbbbbovabl3RoUMHJNrVIB6PQ9p2YNwvVeJoKQLEhl+hQ5UtKlMBo6iNSPlkTjqZwoYNG7Bq1SpsWrce3y39Fmu/X4Xl3y7DqpUrsXH9Bjhb6rzWIFd5X5blfVcaktafm2lr1a5PegQJFB2YsKXd+hNYqtDxKmyQRbjQ/02iJVzRQqRNpREupa4IpSohSjZNMcwbb7wRN998c04tMvZvjEoH2YLwqPIpU6bg3HPPxddffw0AAb9HMVx4GlG5q5iL3fuFTDIr5L2QjZVSomfPnvj888950zMYTLgwSoHu3bvrFStWBEUeI7QZStVaVMmEizkO0Dz5MCe70PfrrrsON998c2BqEYNRDUQLVSWEawe52gAAIABJREFUT7opAZs3bx5OOOEELFmyJCupbc2ES0MTifK1E5kBrVmWDSkC4rUkMmsSBkJ7Gi/CqrczNG2IkgApJSA9QgfCe9yMOq/3sxSAC69aRErAshBPJNChcyd07doVHTp1RIcOHRBLxFFTU4NYIoF4PA47HvNehxSBoFulHaTTaaSTKSSTSTipFDZu3IjkljqsX7/e/zmVSsFNJr2KFW+es/eahPBCBa3rNVik9MgVKb3qFCL0dEawUchAm1tAf8VsgVPeYwDwf7Ztb7pRrs8z6jPNEtVt5YSLeZJPp9lKKYwaNQo33HBDzkOWdDqNWCzGxpNRFaSLaX/vvvtujBo1yqsiNES/0+m0LwSdSqV8EqYpQyPKSbYU629zTSuybRvpdBoHHHAAZs2axUEtg8GEC6OU6NWrl16yZEmDhruQhCvfY5QrsWqoPNScyhEWUTOddPjE/8c//jEeeOAB7LDDDryIGBUPsw2O1nh48gyt72+//RbHH3885syZU9T+by2ESyEJepYdcVWg4o2qXszrTwQXEQwAYAnpV7ekXaeeBFM6W1NF1E8colYh+ty09weP4CECRakgMSOMr/pXniFJUE+UZH5tsDD0RPXkiYZPrniVJ+ks0l5nKk/czPQm828SwYpK5dRPzQM8Esp1XUjbyrQdKUBKCK39qhT6Hmjd0sHvdLvw51jJhEtz6p2ZxMsf/vAHjBgxwlhDwdN9EiDlQwVGpcP0ZevWrcN5552HF1980a9eMafvxWIxv3WGqpobihFbYv03Zt8Xq9USdR/a547j4Nhjj1WTJk3iWfAMBhMujObA3nvvrT/++ONAdUfYMDd19HG5emQLfa6GyKJwlYvWGrvssgsefPBBHH300YEWo6hE16wS4OCVUalBKxEG69evx6mnnopJkyYFE2XjlNycYhS131rb5KJKQ66Wp4bIIVXk8xRi+SOrfnJo4DTmfYbFiwt93EKuRzUQKlEVKA352LA4ciwWg+u66NChAx544AGcccYZvIkY1Wf3IohB8k3Tpk3DBRdcgM8++yxA4EbFguWIQxuKiZvLfkTFs2Y7vFIKp59++sRnn312GK8wBqMyIPkStD58/PHHYuDAgX7pZXh0pDlmr9pQqDPNdztyStR2QaKCixcvxpAhQzB69GjfuVNwG3VCyNMeGJUcxFJbnRACnTp1wsSJE3HOOecEAlMSLTUDtbA4bGNGWDIaYdt09leu35tfVpFfooCvfCRMU6tHwo9TzOO2BrIlnFjmSt7CmmO0T82R0FtvvTVeeuklnHbaaQHdCgajGmCuZZNokVJi1KhROO6447B48WI/FqPKjXDbfL42+uaKQ8Pxnync25JkS1jrRkqJK6+88mwmWxiMygKXmrVSLFmy5JZTTz31sHnz5vVKJBL+pBJTwLAU00iiNGKqgXQxT0vCbUf//e9/8eGHH2LQoEHo2LGjX9USlYQyGBWZvIdaV6jc+ic/+QlSqRTefffdyMCtkMq3pu4/bmlgtAY0hWyJql4xv5NPCk+j0lr7lS277rorXn31VfTv3x92Rki50D3MYFSKnzL3gxACq1atwplnnomHHnoI6bTX2khaWFTZ1dSW+Wq2HxS/mlXYFNO3b98eN910k7zjjjs+4tXFYFSYveNL0LoxYsSIC++7776HzD5XOiVoinMqJ+FSCsemlEI8Hkc6nfZbhEwnRi1GDzzwAI499tjA/ZhwYVQDzOQrvL6ffPJJXHjhhQEilm5H/2+KhhPvDwYTLbnvl4twMX9nEig04pX8z4ABA/DCCy+ge/fugRHR1Vy9ymhbe8isaCG8/fbbuPjii7Fo0aIscoHEnimOrRT/E6Wh0lCFdSmek0goqvipra3F2rVr2fEyGBUKPgpp5bjvvvseHj16tKRESykVIFtKFUCW0pmU2mFGPRaJq8ViscCpYiwW84PapUuXYujQobj99tsDiWlLla0yGKUKBCmopSDtjDPOwJQpU1BbWxuo7qKT8qg91Ng9WWyZNYNR6UliKXxlLrLF9DPm2Ge67SmnnIJ///vf2H777f37mYRqQyPfGYxygyoziNh3XRd33XUXTjzxRCxcuBC2bQeqXmKxmDdFrcJJxYZGOZcyPqYJTVpr9OjRg8kWBqPS7R5fgrYD27a1Gbg1heTIRzqUgixprABZoc6QTghIvyUWi0FKiVQqFeiHpb744cOH495770WPHj3ylm23pHAbg5ELprgz/T88DtZ1XSxduhRDhgzB/PnzI9sNG1vJVk0VcAxGUxKpXCRKvvvmGtscroKh1iISxbz88stx7733+kRMWEiXK1wY1QLyNZs2bcJFF12Ef/zjH35cZlZjUhUHkTCO4/iEZFTM1RItq/kI1Cg/1xT7kcu/kgbhrrvuis8++4wdK4NR4eAKlzYEx3FEly5dSuKMGmLyKzFANt83VbYA8IVz0+m0H8gSEROPx2FZFp5//nkMGjQIb731lv/4fHLPqFRQ2yCdIlLfuymsKaVEz549MWvWLAwbNgxKKbRr1y44CjgigCzUfjRnBRyD0VT/kO+rJYiZ8F6Kui+RLR06dMDYsWPxxz/+0R+NG96T5kEBg1Hp+09KiTlz5mDQoEE+2ZJIJAAgUNElpfQPD6idKEqjrFj/1Bxoart5oXuXDvwOOOAAJlsYDCZcGJWItWvXip133rliiZKGgtJSkS5Uek2niPQ3KtGkExRKUG3bxqJFi3D88cdj1KhROadMsL4LoxJAJ4LhJNJsH6J1mkgkMH78ePzxj3/Eli1bsk4Ow6OhC7ET4fvwtCNGNSeHjb1doXslqqKM/M+OO+6IF154AVdddVWAiAk/BldXMqoFQgiMGTMGRx11FGbOnAkhBOLxuE+o2LbtHxKYUzZt2666Kq6m2I98/v2EE074ZsaMGbzZGYxqsXt8CdomDjjgAD179uzA78ipUTsCOTpyBFTWXGjJY1MdcjGloaVO4hoqDT3yyCPxwAMPoFevXn5ppxko53rtHBQzKjEgpL3+5ptv4rTTTsPatWv94Dc8rpPIHFO8kOyFaTuauv9z2QMmbBjNnRw1R0trFMkSTiipXZXIlv79++O5555Dr169/H3Hk4gYleQzzHWb72fyDcuWLcNVV12FCRMmBFq7aT+Uwn8U6l9KTYYU87rztUQR6DDQnNKklML5558/9tFHHx3JK5HBqB6w126jmDVrljjxxBM/DzsAM2EiA0/ly4lEgoO9DKZMmYLDDjsMTz31lE+2mA7SDNjNsZ5cAcOoBJjCmlS2rbXGoEGDMHPmTOy3336Ix+P+3yngM0UL4/G4X+5NE1RM3ZjmSISZbGE0N9nS2ASq2OcyJ96ZlZZEXJ5zzjmYOnUqdtlll0DFGvtfRrlBPsNPJAz9L/q9eWBHfuOf//wnDj/8cEyYMMGPJek7EY0tJfpcTrKlkOtLj0dj4KlF+LrrrtuPyRYGo/rACmttGAsWLBh3+eWXr/jwww9PiKrKUEpBaw0aKU3Cm4U4xFIJ57aEAFpj3ocQAhs3bsQrr7yCb775BkcccQQSiYQfQJinEeZkI1P0jcGopHVNv6utrcU555yDlStXYvbs2YE2PNKPoLVtBsuURJZibTMpySj3/mhMAlXofUjA2mz5o4OO9u3bY8yYMbjjjjsC08V4bzAqDWYsGK5+phiIyJlrrrkGv/71r/H9999Da+37ErMaJtxa19avq9nW3rFjR9TV1Ylp06at4JXHYFRhXMGXgAF4E4zM0cc0IpaqM6i/1lSPb+6kKUy45CNfynHyTc5Qa40999wT48aNw8CBA/1rRKf9ZgJabgKJwTCDOlqb5gk6rc9UKoVXXnkF559/PjZs2BBIQulUnqpbzP1qtiGWav/zvmGUClFrqRTrtdjHMG9PrUK9evXCk08+iYMOOihL94jXP6OSfAeRhFF/M/W+lixZgp/97GeYMWMG4vE4UqmUX7VBei2O4/iHeZVyIFXsZKHm8s1KKXTv3h3Lly9nA8BgVDH4mJ1BCZeora31R/JRJUYsFgv02BbjDFv7FB/z9OZ///sffvzjH+PGG28MjJY2y2spwOC2CEZFGH+DGDE1iAjxeBxDhw7FnDlz0K9fP2itUVNTE2iBME8oaS+0VEk4g1FsAtVcbUONIVso2cz4XwwfPhwzZ87EQQcdlDX2Nlx5ymCU23eYtj48AY9ixWeeeQb9+/fHjBkz/IMos7JFSolUKuXfP51Ol10Ut9i4tTniORqBrZRC7969mWxhMJhwYbQmrF27VpA4n2VZiMVi/tQe0migk7jmDEbD96tE4oaSVSKoqL1izJgxGDhwID755BP/5B9AoOKFTyoZ5QYFx+G1aJKptM979eqF6dOn49prr/XXNI1MN0ufiYAxNY1aMollMIpZS431K6Val9Sq26VLF9x///14+umn0blz56yKSPK/UeQLg1EOmIdN6XTar3akOGfjxo04++yzcfbZZ2P16tWBtmozfqRYM5FIlH1tN4ZoaS4f5bouXNfFIYccgoULF/KGZzBaAXgjM7JwxBFH6LfffttvMSDtFjNJK9bRNLemS0snZ5Rg0vPG43Ekk0n/dKZ9+/a49957cd555wFAIBhhMCoxgCbChQJJs5KFksBJkybhggsuwLJly7LIQ7OVrtT7kduKGMXY++ZoGSrl49i2jXQ6jcMPPxz3338/+vbtG9l6GiVEWip/ymCUYj/QWqS21LfeeguXXHIJFi5c6Iuqm1UvRMib+iT0d2pRLUdLUUuL4+aaTkT7ftiwYR9OmDDhQF5lDEbrAFe4MLLw9ttvi4svvvgGqmohZ2oK/LVEoFrOE+58Aa2Z/FGFC51AkqbLxo0bcdFFF+HMM8/E6tWr/Qku5X5fDAatUzPYNZM6Ork0NVmoguuYY47BRx99hFNOOcUvCQ+PhC5lMsiJJaNSSJJS2m2tNW6++Wa88cYb2GuvvQKEiklk0h4L+x4GoxJgrkfbtnHDDTdg8ODBWLhwof83aqWmFnW6fSqV8sl8y7L8VqNyHEqVYxJRPlx55ZVnM9nCYLQye8mXgJEP8XhcU9knnTxQMEiBITlJKi81k7dCSIumCGNGBaBRozPDt2nuwNUcebjrrrvinnvuwYknnhggXaJONhiMakli//GPf+Cyyy7DmjVrfOFDCrxN2xDei6XQeeG9wihnQkQ2nioXzZYKMwE120pp3e+99954+OGHceCBBwbWMVdwMSoFZqUirfOoOIVuN2fOHFx88cX44IMPCiJMKmWdR9mLfLFhMcRMuD2XKlfo+tCBB7Waa63RoUMHbNq0iY0Ag9EKwRUujLxIpVKiW7duSKfTgdGvlEgRseC6LhzHQTweL9iZhkcAFuOE801vyDfytqWdfiwWw+LFizFs2DBcccUVWL16dZZTN6dRMBjVktgOGzYM8+bNw2mnnea3HZKNIJsQ3mdUKcNgVDPZQoK3ZtJEVaCmb7Isy0+wbNvGr3/9a7z33ns44IADAi0VYSKHwSgniAQwCYIw0UK3++1vf4sjjjgCM2fO9JIKKavaTpRKRJt8oDkswaz6MatIhRDo0aMHky0MRisGb25GQdhzzz31p59+6geWptK86VzM74UQJk0JeE3CpZAqGdORhk8Wm9upU3Ddp08f/OlPf8LRRx8dOAUJj49mMKoBlBxOnjwZl156KZYsWRLQKzIJWUo6S5FQMkHJKFWilEtLoaH7UCJKp9MkgmtqGVGy1a9fP9x///048MADA0lrVMVoVIUmg1HuvWWuU5rMeMkll+Cdd97xiRla+w3Z53LZ78bu9WJB1W3moAmTvDL3u1IK+++/P2bPns1OjcFoxWCvzigI8+bNE0cffTTM9iKzPYacbNipNCeiKkPylYPmqiRpDudPgbQpPBqLxbBgwQIcd9xx+M1vfoNNmzb5iaiZlDIY1RSESykxePBgzJs3D1dffXWAWKGKOCmlT9IyWcIoNbFSqlPpQjXKTHtNBAlVgZrtGB07dsSdd96JDz74AP379/fJRvKTZpULkSxMtjAqBVGDEqSUGDt2LA499FBMnToVWusAkW6K4pq2vtyVvKXSESzkPZA+jdmKRUMoKF6mazZ06NB5TLYwGEy4MBg+Jk+eLC699NJfU4DpOI5/SmcGiy1FHDRW+6UlSJdwebkQAul02g9Gxo0bhx/96EeYPn26f3s6EWUwqiXpNZPURCKBO++8E3PmzMEPf/jDAOlIJ3ylSibN5436YrTONVdqssW8rzmdqyHQyXWYQKTHc10XxxxzDGbPno2RI0dGTvQK+x5eu4xKQXg6Fq3TRYsWYfDgwRg5ciTWrVvnk4amhpGpW1Rp/qohW9IY3xf1mFTtQ4cOZosWXVfHcTBixIiLXnzxxb14xTEYrR/MqjIaBdu2NanOk1MxGfyG2gZytQQVQ5pEtRM1lUApVcBLyabrun6wTe1X9HutNeLxOH7961/j1ltvRSwW84MdPuVkVGtSTATLM888gyuuuMIPzM2139zrm6toWt+6irL/pU7CCl07ZusE3S+RSCCZTGKXXXbB6NGjccYZZ/i3DSdalJRFCZAyGJUGx3Hwt7/9DTfddBNWrlyZNT2L1m54ElEl2o5CfVhD98031plgDk+gPU+3cRyHnRSDwYQLg9EwunTpojds2BAYGxuLxQqu0shHmhTSA5yvH5fIjXKRLmZpuRACqVQqK8m0LMuf6nTYYYfh7rvvxsEHH8w9/IyqIldy7RulFL7//ntcc801eOaZZwLtRc0dkDPh0roJl+Z6vEKJfyIVzbbRmpoajBgxAtdffz06d+4cWOdRSVi+5I3BKCdMO718+XL84he/wIsvvuhX6Zr6fVTdQms4XM1VbWRLsbfNRbiEDxfo/1tttRVWrVrFG53BaGPgrI7RaKxbt0707dvXFwczq10a49yKdXamo4ty8o11+qUIFsxefXK6RL6Ypx5Uejpt2jQMHjwYt99+u0/CMBiVDFrLZp+/+WVZFrbZZhs8/vjjmD59Oo444gi/f53BKBfZEn5MsxWg0MoZU+AWAE4++WTMmDEDd955J2pra7OSMLPi0zzxNn0X7ScGoxJsOwC88MILGDBgACZMmBCYTGnbtl/lQq1EFLdUymFRqexGOB4sVGg33FKutcY+++zDZAuDwYQLg1E8PvnkE3H88cevMPtVCeaUEvMExHRIUb20hRIe4RaiXEF0+LELPcEspaM2g2lTq8UUGl6/fj1uvvlmHHXUUZg7d64fqJstWuZY7uZMSBiMghxIZm9HwTwF3X///fH666/j1VdfxX777efvg/DkC/P/VJputik1NFY6an+XUtuFdTaibVwxNjuXnkJT/UGhzx32E+Ek0fRVUWQMCUBrrXHEEUfgrbfewvjx47H77rtnJVq0psNJqHnqbf6NKxsZzUE6mGu+IVLPdV2sXr0ap59+Ok477TR8+eWXAbtKNj1c0WK2lLeE3SmkCrqxQr35KuDCdsKs8AnHauY1HTJkyIqPPvqIyRYGgwkXBqNxeO2117rfdNNN25GTicVifruM2W4U1SoT5Qyb02EX89jNWRZrtl5R+xElmO+//z6OPPJI3HrrrZH9xGaSa560VqJYHaPtBvrhgFQIgeOPPx7Tp0/Hs88+iz59+vjECo3RNAN2sh8UsNq2DcuyIgkeM7DOlbw3hshtKbvUmhK6UtvjUhFluWw7rU3yT+aUITrFp0SKyPLevXtj/PjxePPNN3H44YcHqlQYjEqAGRtEtVuH7S3pyo0fPx777rsvXnjhhQCRUmlkYGMrqQu5Xb5WWfqdOeiAfJVJoNq27T/OL3/5y5+89tpr3XlVMhhtFxwdMEqKrl276rVr1/oJFwWwSinE4/Gs6T3NRXaUMvBtjkQr3OdrBvfpdNr/+6BBgzB27Fjss88+gaAnXIZOPxcrPsxgNHfQT0E+7SVap8lkEhMnTsStt96KBQsWBEgX8zTVFBo1E4Z8eyvfaPhiE/KGAnJG8Xa0FKK3+Z6noTYAc1QrrS2z1cdca3R7rTV22WUXjBw5EhdddJFPANI6D5OMDEa59xutRbOV2Vyf5npfs2YNfvnLX+Kpp54KVCeHSZqw2HM12Z3G3C5KZ9D8ORaLBfyWGaN17doVq1evZmPAYDC4woVRWqxZs0b069fPd0bU12tZFlKpVGCMYL6vSkJzvB5qtzCnFSmlfFE6Oh2ZMmUKBg4ciNGjR2e1EZlBFBE3DEYlBbpmhQDtJUpOa2pqcOqpp2Lu3Ll45JFHsPPOO/tJK1BfBUYEZKHTIxoiVhozRrqapm4092ttzOM3Ra+r2ASzkNdLa8ycGBRuLzIJmB122AF33303PvroI4wYMQLxeNx/DFrn5gQSBqMS4pZ8JDHFDlJKTJgwAXvvvTeeffbZQGun2TZktodXE+FUaptmHgbYtu37J6oEouu11157MdnCYDDq4w6+BIxS49tvv73lzDPP7DNv3ry9zRNCclItMRa21IFvcwTRFMyHy1cpITVbhd566y1MnToVu+++O3bccceABoAZ9HOVC6MSg95wW4bZwiGlxF577YWLLroIO++8Mz7++GNs2LDBP00lULBvCmSHhQlLtV8bKikvhz1pqMKmuStwStme1ZyvLSrZjLK9tm1njW0lko/eX/fu3fGrX/0KTz/9NAYNGoREIpF1KBCemMf2l1EpdjdKqJ9ssZQSK1euxDnnnIPbbrsNmzdvDowmJ9tMa5kqlitd2Lk5JhNF+RiqvCSixRQVPvHEE7+cOnVqV16JDAbDtyN8CRjNifbt2+u6ujo/wA2Pf26RRV6B7UX0OJRAkrMmvQsqUSWCihx8IpHAjTfeiN/85jdIJBJZSVDUyFEGo6VhBu7/v70zD4+qPPv/d9YsLBECJLIXZRNECIiCa7VQsVgqosUFVND3fV1waSu2UpeftbZqfenl0o1X0Ira1kuRYrUqqFVbQSSAgAgCArJDWCIhk1l/f9j79J4n58ySzCQzyfdzXVxkZs7MnDnnOc+57+9zL3pM6voYdtdlKBRCbW0tnn32WTz++OPYsGFDvSKNjUmfSydCJptzVLr7nSzlKVuFZhPNe2aYvd05aWg0TDr735DvMOdKfX+KRCIoKyvDDTfcgFtvvRXHHXdc3H6JIKPHoT7meuwT0tzig4zLUChkdZJ0uVyYO3cu7rrrLlRVVVmLPJJip0VxSZMRm8Tv9+dkNG22WkAnSykyj9Mtt9wyfvbs2X/j6COEUHAhTUq3bt1iu3fvtla3M9nCuakFl0yJLna51RK2K8a6GDWyEit1cILBIM455xzMnj0bQ4cOrbfaT4Of5AJO4p8Ou040To8cOYKFCxdi9uzZWLVqlSXUOBUoTeaoN3WB7kzOWekKLtn+/mwJLqZ44bQPmYhA0nOwFHnv1asXpk+fjhtvvBGlpaUJx60ei3rln4I3ySWhRc/HLpcLW7duxW233YZFixZZiztS/FVHsWgxUqctJ6uhleuCS2P23YzU9vl8Vtp8aWkpWz4TQii4kObl7LPPjr333ntxqQRNJbjkouiiCyxqAUqnXugUITlmEsIaDofRtm1b3HHHHZg5cyZ8Pp9lKLFbBsklo18XFNWGv4xtU2QUJ0AiDoLBIN5++238+te/xj/+8Y963TXsrm8nhzxfRJdkgkJTpjwlKkBsJ7jo96ezb4nOk5Pg1NDfLulpwWAQADBo0CDcdNNNmDJlCoqLi+PmUv1btdjSVPcuQtJFFmh0XZFYLIaHHnoIjzzyCA4dOmSNW1nQ0WPZ5XJZczCAuPTOXEyZy0bHIvPa1++X+5kIUCNGjMBHH33EiYAQQsGFND8//OEPz//1r3+9WDthemVQol+aQohpCoOhMcUlk+2fhLXHYjGcdtppePjhh3HWWWfVe69TaoedMMPaAyTXnAZzlfWTTz7BE088gRdffBHV1dVx2+jVR7uxrq8NPc+kGylDsj9f6lpfTvcLnWomzo/pIGlR28Tr9eKss87CrbfeinHjxsHn81n7wSgVkg/Xi9NY1ambsVgMH3zwAW677TasXLkyToTJpn1kpmWmO6/aCbmp2lp2dlQ69lg0Go2r56Tr6klEnMw3V1555bxnn312GkckIYSCC8kpSktLYwcPHrRCsT0eD+rq6uByueDz+axuRlkd+E3kUGWzhoHuTOTxeHDdddfhgQcewHHHHWcZCbpujunEpiruENKcToVdJMyBAwfw5z//GXPnzkVlZaV1DWiBxa4Ytcwx4oCb3YrsiiOS5hFczHOnn3cS1PTnaEFGF/5s27YtLr74YsyYMQPDhg2z3q/FG0JyHR11ItEoOkU5FArh8OHD+NGPfoTnn38e4XA4rghuNu2jxkag2Qk26dhYqbSGT4SOJpZoIbmn6Ajj6upq3igIIRRcSO4yfPjw2IoVK+D1eq3VGBEQ5LmWILg01uhwwq67RjAYRLdu3fCzn/0MU6dOjSvsmE4xXa7wk1zFLLobCoWwfPlyzJkzB6+++ioOHjwYFymnQ+XletHpfHatpjn+m19wMeciu9Vycz63SyvTYk3fvn0xdepUTJ8+HeXl5db4MAUWFh4n+XCt2KXwydiNRCJ4/vnn8eMf/xi7d++2nvN6vXGF+LMtuGTL/sm24CKLVeFwGD6fz2ofL7bUwIEDsX79et4kCCEUXEjuM3369J/PmzfvLrN1rIRythTBJVtGhxZTdEtCAPjWt76FRx55BEOGDIlb6aUjQfLNqQAQV9NFnGSdLheLxbB792688sormDNnDj755JM4YUV3ltGrlRIeLttoR500n+CiC3OaIf12KUQ6ak8LZ23atMG3vvUt3HDDDfjmN78Jv98fd/7NMcQ5kuTb3Gg+v379etx8881499134+qMpDOvZUNwSSdFSH+OkxDe0PpQ6dhWEuki94lgMIgJEyZsWLhw4QCOQkIIBReSVxQVFcUCgUCTFn1tjhVss9BiY5w6WaVcaZD1AAAgAElEQVTSjqM4DyLAFBUV4ZZbbsHMmTPRsWNHx04ihOSqU6EjHJyQ60Cc9FAohBUrVmDu3LlYuHAhDhw4UK91p1wvZnFqkhuCi4gsZg0Wv9+PcDhcrzuQee769++PKVOmYMqUKejZs2ecw2bOf+Y9h/MjyUfxJRKJ4KGHHsLDDz+M6upqy06Q//XCTLLxnSuCi911m632z073HiniXlhYiNtvv33QL37xi0856gghFFxIXtK3b9/Y5s2bm6wLRHMZ1I0t5qadBHEwdf0Bs6AbAAwcOBD33nsvLr30UstB1au6dvtDh4M0J6FQyCpiqse6jkCwi0gQ8UXG9OHDh/HGG2/g6aefxr/+9S8cO3bMcrB1XRD9mGO/+QUXu5QhOc+SGiFh/uJMlpeXY+LEibjqqqswYsQIa/yEQiErZVU+SxxPfb7NblqE5IPI4nK58N577+FHP/oRVqxYYdkDfr8foVAoTpTUzzW14JLJ+SGb77G755SXl2PPnj28MRBCKLiQ/Oe73/3upr/+9a8n6DaF2RJJmtOpakxorKAjXKRAntvttowrcTDEKfF6vbj00ktx33334cQTT3SMJGJYPckVzFoaiYTAVOpu7N27F6+++ipefPFFvP/++wgEAvVEF7MTDmkewcUUkbUgJmKL1+tFly5dcN555+HKK6/EmWeeibZt29YTlM3IFbMAMwVmkq9z4+7du3H33Xdj/vz5qKurs8a0RLpqEdksJt0UgksmxZZ0iug29vv1+7/5zW9iyZIlnCAIIRRcSMvC7/fHRCjItkGQi85GY4wDnXOsDStxXjp16oSZM2fi1ltvhcfjsXVS6YCQXBRc9HNmZxr5Wzvb5vt0JMPOnTvx9ttvY8GCBVi6dCkOHDiQlmHP66Np5kBTcPH5fOjVqxfGjh2L7373uxg9ejTatWvn+D6zu5HdmLArPkpILiPpQ08++SR2794dVwNPUmCk5pWueaQ7F2Z7fmtsW2hzPk6nPXRjBRepJXjrrbee+cgjj/yTI44QQsGFtEhOOOGE2JYtW+oVR9SGsqx06q4l2simIGOfNx2LxVBRUYFf/OIX+Na3vlXPkNMOq5m6lOr+0XEh+eLkV1dXY+nSpViwYAE++OADbNiwwYoMkyKruqWqzEc6EkZWlMW5kXlIi0bmNajrk+iwfx1po/dT115o7Bzn5JCYBczNGjp2329X+8RM0bJzlnT9HInWE2dRz+WFhYUYOHAgxo0bh4svvhhDhw6F1+vl4CV5i13KpL4u9DWn78nRaBSvvPIKfvrTn+Lzzz+PW1yRNLlUIlia295J155o6Byn69qZbd/tOj3JPNSjRw9s376dRgwhhIILafl873vfW/vKK68M0jVddNV9CQvXrRAzVRQ2FwWDxoouplPl8/lw+eWX44EHHkDXrl3jjDxtBOrVYjnuTpExFFxIPqANcT3ua2pqsGXLFixevBhLlizBsmXLUFVVFTf/6LQj+V8LEOLwmBFmdnVodASGzF/ShtS8bnW3nsam/CUqFiz76PV644QjJ+HELkpEt1HVoo0u8K2LGOvuQm63G127dsWoUaMwfvx4nHnmmejRo4clsrBtM8l3tI1id6/Vc4NcQ2vWrMHMmTOxePFi6/VMpMW1pGhfU7SSiF+32w2v12vNseFwGH6/H8FgME74drlcGDt2bPCNN94o4CglhFBwIa2KoqKimHSmiEQiVttobcCL0aJXR1uj4KKdHqfoFh2eHwwGUVZWhrvuugvXXXcdiouL44xA0+FzStkgJJ9wKjqtHflwOIwjR45g3bp1+Pvf/44333wTGzZswLFjx+KiP2TVVNdSMlsc6046Ihp7vV5rzjKvYVOQsRM2Gn3zV5Ep5rxhPp/s/ebvtHMgzc+T4+Tz+dCtWzcMHz4c559/PkaNGoW+ffvC7/fHRbIw1ZG01HlI/y2Ov1xH1dXVmDVrFp566ikEAgHbeUUiW7RdlI+2TibnNl2/TgRe+Vuio91ut9XuuaCgAD/84Q/7P/jggxs5MgkhFFxIq+Tkk0+OrVu3zjIqxOAA/rNaLf+bXXpaiuDi5HjYdfdwElz079MhtqFQCEOHDsXdd9+NCRMmxEUOaWeJK8ukpTo8qTj0W7duxccff4x3330XK1aswGeffYbq6mrb4pTmdadXUqWOglmLxu76NcWXTEbwme2RnX6Dvv7t0p8SiTFmLRWfz4cBAwZg5MiROP/88zFixAj07NnTcoZ0RyHZL6foO0JayrxjJ/7OmzcP99xzD3bs2BEX3Svpd7oDl0SiOTUdyHUbJxvdjOR4yEKdpIfqSMVIJILevXvjiy++oD9ECKHgQsg111zz2Pz582dIQTizO08sFrNupo2+MPJoJdUuJcBcvbdDVnoAxBkh3/72t/Hzn/8cw4YNs4wWnfvMKBeS79h1srBrjW6uQItoIK8fPHgQmzZtwpo1a7BixQpUVlbi888/x+HDh21FC7Pegikq6BbV2vHKdJtVp+gVM2IwkRBj7o8pzgJf18Dp3Lkz+vfvjzPOOANnnXUWBg4ciK5duzrWibETVSiykJY8B5nzUGVlJW6//Xa8//77cZEZAOoVxbWroZRvRb8zNaeZv09Huvh8PoRCISuVSITjMWPG4K233qIvRAih4EKIpqSkJHbkyBErLLSgoADRaNS6mUpaUWsVXLRzJM6TWdsmFouhoKAAwWAwLhpI6kd4vV5MmTIFs2bNQp8+fej0kBbn7JjXunZoTHSUhQiOdu2FpQjvpk2bsHHjRlRWVuKTTz7B5s2bsWfPHhw7dixOtDGL5Nql99itVmdqfrJrxWz+bX6fuU9S66Vdu3bo06cPTjzxRFRUVODEE0/EySefjO7du6OwsNDWybQj2TzD1CKS75iCiRZwZ86cabV51gKsRGjoa9ScG+w6uOW6fZNpsUUfGy1iy6KSCDCFhYX4wQ9+wBQiQggFF0KcOP3002PLli2D3+9HXV0dfD4fXC4XgsGgZZjks+CSTq2GZCH9ib5DHEazjoSEJXfo0AG33norbr31VrRr1y5hahGL5pJ8FV7ketPCitM1ZNYyStS+WoSccDiM/fv3Y+PGjdi8eTNWr16NTZs2YfPmzaiqqkJNTQ2CwaAl+Oh9yYbAkKx9qq5DI9sUFBSgY8eOKC0tRa9evdCnTx8MHDgQ3/jGN9CzZ08cf/zxVovmRHUk5Hdph8jcN7uoF6fnCclnZC55/PHH8cgjj+DLL78EgLiirjqaV0eg6dRDqd+SSpeiRNdPJutENYXY4jRHa5FF5lOZ277xjW9g8+bNnEQIIRRcCEnGLbfcMvmxxx57QW6oUoBRjJR8F1wSGSSJRBa77UynzdxWpzuEQqF6q+79+vXDT37yE0ydOjVlg4eQXHdyzPogiUQJ81qx28YpBcnuGhQn6eDBg9i3bx92796NnTt3YseOHdi1axf27t2LPXv2YN++fTh69CiOHTuGY8eOpRTBl4oj4/F44Pf7UVBQgMLCQrRv3x6dO3dGx44d0bVrV5SVlVlCSufOndGpUyeUlpaibdu2jl1V7EQSOyfOKUXKTGdKdi4IyVckyuXNN9/Ej3/8Y6xatcoa6zL+9WKI1+u12knr+iM6SkYLMQ2xb1JNScqm2JKu4GO3rT5uciylQPmkSZPeffHFF7/JEUgIoeBCSBqUlZXF9u3bZxkkUkRODBpxsMQQMesnOBkcTsZHLhaPzbSBpFtuiwETCoVw5pln4t5778X555/v6Iia/5uOqD4vhBD760+unWAwiNraWhw9ehTV1dU4duwYDh8+jEAggJqaGtTV1SEYDCIUCiEUCsWlOUkXDr/fj8LCQhQVFcHv96OkpATFxcVo37492rRpg+LiYhQVFcHn81HYICTNa1WuNVNUNdN7tKC4evVqzJo1C2+++aYVvSJp0pm8/uzsmKa+vhtjn9i910zllILCdgXJ5f+SkhIcPnyYExshhIILIQ3l29/+dt0bb7zh9/v9cLlc1kqQ5DxrwUV3OnIyUFpj0TmN7vQkn63Fl4kTJ2LWrFk45ZRTAMA63k77Zta+oENHSOLrOZVrRBe0tUu/MecrXneENB67os52ha/tFmZ27tyJu+++G3/+859RW1trXZcSgZFKhEqjDf8sfr7d3NVQ+8TpfWYLbNO+E9FKbLnhw4dj+fLlnPwIIc0GJyDSovD7/TExfHT+rsfjQTAYtNoppmsEOHXoyCUHLdOfJ4aTFl98Pp9VzK+oqAjXXHMNfvCDH1iFdc3PkE5IZqoFi+8Skv717eTIpPp8qp9LCHHGrK+krx9dSwX4z2JEKBTC/fffjzlz5mDv3r1xdoiIBJks+p8oZScf7JBEn6W7t0nqkD7mutPbbbfdNn727Nl/46glhDQntLJIi2P48OGxFStWWKGlYgSJ+ALE11VoiDGTqw5ZJj9P0oik7bYOj9bhuuXl5Zg2bRpuv/12dOrUqV7baKfWlYQQ5+sv0XVi183ISUBJJ5WAAgwhjb9W5R4o/z/33HO49957sW3bNmvBQaciSZqtiC2NXZBIVPA7122QVD5H23ES7aJTlgGgd+/e2Lp1KycyQkhOwGVm0uJYsWKF6/bbbx8fiUSs1SZJL9JV/JOtoNgZMU1Zwb85EcNM0oTEoJFjJ3+73W7s2bMHDz74IIYOHYrHHnsMoVAIwNeijBx/MYRay/EjJJvOjMxjOv3AqbNPOs4WhRZCkqNTku1qvMmCQ2VlJc466yxcddVV2LJli1VbxGzvLNv7fL6MRH+aHb207ZKN+2+mWjunG3UsdoUcV7FTvv/97/+dYgshJKf8Kh4C0pLp1atXbNu2bVZrxcYYHLkcpZFpI0pCde1W28wigFKsTlbthgwZgvvuuw8TJkwAUL/FLKNcCEn/2jaFlESPkzk15lyYqIMZIaQ+uvi7vpbcbje2bduGO++8E6+88orVNVFqy5kptnbRtxL90th7uNMckMlrPFNiSzrb6ghlnV5UUlKCqqoqTmCEkJyDES6kRbNt2zbXJZdcslTqiQCwNWbScVZaA1J7RQxF+d+aOFQor8fjsQxPr9eLNWvWYNKkSZg4cSJWrFgRt9ImLacJIanNNXZtq53aWMtKbyrzlI6SyZTjREhrQIQT3ZbZ5XLh0KFDmDlzJoYMGYKXXnrJqhsnNocWW8yuRrJ4kYnrMNE9tjnFlsbaUPJemecAWNHLo0ePpthCCMlZODmRVkPHjh1jBw8etIweu1VdMxLD/NsubD9XHLSMTgyq6JysvunaLGI06hbQ+lhJXnphYSEmTZqEO++8E4MHD447hoSQ9K9z3erULn3IroCuOW8l2pbXJiHJ0ddgbW0tZs+ejd/97nfYsWOHdS3pIq66U59+r7636ms7U4JLtuoyJbI57FKHndIbU7Vd9HY6Oqhdu3b46quvOGkRQii4EJIrSPtoSTHSbRh1Vx25mYs4o8PwdYqMNgT0c7pobFMIJE0tyKTqGIoh2aZNG1x22WX44Q9/iP79+zs6ek4OX7q1KAghhJBUhBMd5ZXo3qTvP7FYDIFAAHPmzMHs2bOxffv2uEK4zXGvMpsC5Jr9kOrnyDkx2z7rz4hGo6ioqEBlZSUNAkJIzsOJirRKfD5fTHKwJTxVG1Jut9vq0hOLxeD3+61w31RWgVt6BEwyvF4v6urq4lpKu91uFBcXY/LkybjrrrvQo0cPS9wy20brMGtCCCEkU+j7TUPupbW1tXjmmWfw6KOPYvPmzVaHIa/XawkEzXX/0pE1Tq+ns19NLbaIraA7IYoNJinJHo8H119//Q2/+c1vfsfRTAjJB+jNkFbLSSedFFu/fn1cGkwkEkFBQQHC4XBcZx7pLOD3++vVSNCRGbnaVrU56jN4PB4Eg0Gr01EoFILP50MoFEL79u1x7bXX4rbbbkPv3r3r7aMYWlqESbQKSQghhKSKXnBJds+WSM1AIICnn34aTzzxBNatW2fZB+FwGH6/36rZ0twLBokK5qa7X80huEikkMfjsewIl8sFr9eLbt26sd0zISTvYNFc0mr59NNPXTfeeOP1Op/a4/FY3Xl8Pp/12O12W2KBWXTXLqVIImGc/rV0dHqWCFdSC0YM18ceewynnHIKbrzxRnzxxRf16lJI6pYOJyaEEEIae3+S6ErznmW3bTgcxmOPPYYhQ4bghhtusMQWiWbRHYjMz82l35zu9g2xVezek+7niL2gbS23242LL754McUWQkg+womLEAA9e/aMffnll/D5fNZqCoC4dtIS5aJbODb4wmum3O6mNmjNrgu6eKesGrrdbhQVFWHq1Km45ZZb0Ldv37h2j+b+JwuZJoQQQpywi57UUapyjwkGg/jjH/+IX/7yl/jiiy/iFmDcbjdCoRDcbreVUmRGX2brPm9XlDaRfdEU9//GFsU1P0tEl2AwiLKyMuzdu5f+CiEkb6HXQgiA7du3u6ZOnfrbYDBorVxJ/RFJLwKAwsJCWyOKNUfqG0zBYLCe0SXHFoC1EhgKhVBbW4snn3wSI0eOxIwZM6xOD/K6HFtpZUsIIYQ0yPD9dxpQIrHg+eefR0VFBa6//nps27bNElgKCgoAIK5rnwgvTdnBMNXvamqxRT/X0O+WZgXBYBATJkzYQLGFEJLvcBIjxKBnz56xHTt2WCssdXV18Pl8VpSL2aUoW8ZUtg2ibCJFc30+nxUWHIlErMdi8IrBKsaZFCru0KEDbrrpJkybNg29e/eGy+WyUr2SdYAihBBCEt0Pnbri/eUvf8Evf/lLrF69GtFotF4hXLv36nbtIhZk4z5uZx/Y3dvN9u/ZOHbZtC9isRhKS0tx4MAB+iiEkBYBl4oJMdi+fbvrv/7rv37gdrutTjvhcNhy+M1aIzq8t7XUaElGMBi0wqwlKkXnZIdCIeuxPp5isB49ehQPPPAARo0ahdtvvx1btmyB1+vNSDoXIYSQ1ovuTBiJRBCNRvGXv/wFFRUVmDJlClauXGndiyTKVRdylTQiKeQq0ZrNEX2ZrEBupo9bU3zPmDFjohRbCCEtCU5ohCRg2LBhsVWrVlndDHRqjIQRS+qRRGjotsbZNLKS5XFn2yjKJmLsSl58hw4dcMkll+Dmm2/GKaecYm0jx1z/Tn3speCuuRJJCCEkP5F7sb4PSpF2sz6Leb/U9/C6ujr86U9/wuzZs/HJJ59YHQkTdcTLlXuI2R1RFizktWwd91S3M20U3ZTAbDTg8/kQDofRpUsX1mohhLRIOLERkoSf/OQnJz366KPrgsFgXISFNnA8Hk9cMdimMLZSFVzyMSLEbAsNfN3Gs7i4GOPGjcOtt96Ks846y9H4tgsXz9WW3YQQQtJz/J2Kp6cyzx89ehRz5szBvHnzsGbNGgCwBH4RbXJVaNH3SPNel817fUM6DemFKABWRyev12stWPl8PtTV1eGCCy6o+fvf/96Wo5sQ0hKh50FIilRUVMQqKyvh9/utEGO/329FWuiol6aIcLEziBIJDfmGrFgCX4stsgoWi8VQVFSEUaNG4Y477sC3v/1t2+MhYpiuuSPtO30+Hwc0IYTkIU73Ol3IVtdbk3vJgQMH8MQTT2DevHnYtWuXVUdM7uEArEWVXBZczIjN5iqMm8o5EvFKUrB0EXwAaN++PQ4fPkxfhBDSomENF0JSpLKy0nXvvfeWSnqRFHiVbgciwDSnwGG2T85XsUWOpRxbWRHzer1wu92ora3Fe++9h+985zs444wz8Mc//jGu6wQAq3WnGH6RSCROxCGEEJJ/aEcegCXEa/FEz/179+7FjTfeiH79+uH+++/Hjh074sQZj8djCQKmoGEncuQS5v5kQxRK9zfLPkSjUevYhkIhhEKhuHptZ599NsUWQkjruG/xEBCSPqNHj459+OGHcSHNIhKIUZFtg7OhxlC+GNQijohwZJevLkZ1NBrFgAEDcMstt2Dy5Mno0KFD3PZO4eeEEELyEx11Yhazj0Qi2LRpEx588EG8/PLLOHbsmG3qqdxL5B4hNdnMz7f7zua8PzbVvb8h3yHHVI6l1Mbx+XwIhUJo06YNjh49Sv+DENJq4IRHSCNo165d7KuvvgIAy7iQrjzZNriaMpy4qZG20QUFBXEhyE4rjrpuzgknnIDrr78e1113HUpLS63nJZVIr2wSQgjJL0Rs14XTdc2v1atX44EHHsDf/vY31NbWxgkrcn+WGiMiDIjIb0a5aOEhl1KKsn3fb+zn65bakroViURw1lln4b333qPvQQhpVXDSI6SRjBs37vAbb7xRYhZvTWYwZctISvbZ+dCpR0QRMZClu4EYxvK8RLfI68B/cvC7d++Oa665BtOnT0ePHj2yfuwJIYQ0Hea9bPHixXj00UfxzjvvwOVyIRAIWAKLRFqIGADAaukcCASs6BYRcXK9aK7TsUjVBsj2vsixFCGspKQEhw4d4s2XENIq4eRHSIbo3r17bNeuXdbKW8ILr5kEl3zr1KPz9HVakBh0OlzZLJ4odOnSBd/73vdw/fXXY8SIERyohBCSx4jQ7na7EQgE8OKLL+LJJ5/EqlWrrLk/EolYRe11RIzcQ6SuiKSuStF76VLkdD/NBeFF38ftIl2bW3CR6BbpUjRhwoQNCxcuHMCRSwhprVBwISSDTJs27aH58+fPNHPAJWJDUmV0C2kJb9arbk3RWjrfDe6EE5tqzy0rbT6fD+effz6mT5+OcePGoaioKO7461QjXScGQL1aPWYUkzbkzXbWhBBCUG++TGcBQOZq2XbPnj146qmn8PTTT2PTpk3WvVPmbD1Ht8S026a4l0pjADnuetFDHuvWz5I+JPTq1Qvbtm2jn0EIafVwIiQkC/Tr1y+2adMm28J8YphIhIbOK4/FYlbqDGmYkQjACg8Ph8NxxXdFhBk8eDCmTJmCqVOnory8vJ4jIAa+KcBoAa0pavUQQkhLxJxDZb61E2F0hMqnn36KX/3qV3j99dexf/9+SyyX+lxMGW38fVRHqMj9VP+to3zM8yTbXH311Q/PnTv3Th5lQgih4EJI1rjpppuu+8Mf/jAnGo3GOf1Sc0SMk0R546RxhqTZzckUTnS60bBhw+I6Xphiitkdye41nkNCCElMImHbMk7/HS0hEYivv/46Hn/8cbz77ruoq6uzoi70AkU4HLbusyS1e6TT+dGLPiJkeb1e63XdPVCn9Z500klYt24db4KEEKLgpEhIlqmoqIhVVlZaUS1irJiCgDZAGTnRyInNaPUpBqaZyiXb+P1+nHPOObjhhhtw4YUXoqCgIM4RSBbRYpdTTwghxNmplzlTp93Ka263G7W1tXjmmWfw29/+FuvXr4+LAPV6vairq4Pf70csFkMoFEJBQYGVsitigHmfbemkWsctlfOjC9eb6dCSbiTbFBcXY8aMGUN/+ctfruboJoQQwy/hISAk+9xzzz1dHnroob3BYLBeSK4Og6bQkjmjU/L5zZorOuxZXvf7/QgGgwCAQYMG4dprr8WUKVPQpUuXeudKDEwJY7czVHkeCSEk+TwN1BdEvvjiCzz55JN44YUXsGfPHmtelTQXLaKb9UN0tExrElySFc1NJ+pHFiokItfv9yMcDtf7W9Kix4wZg7feeov+BCGEOMAJkpAm5Lzzzou9/fbblrMvxqHOh07W4YikOLmpkHQx1EUM0W1CJcpFolpCoRBcLhfKysrw/e9/H9dddx0GDRrkmLduZ6wywoUQQtLj7bffxpNPPok333wTNTU1AOJrhsi8LY+l5osIBJJS1NruoaaYYtdZKZ3PknQtneoci8Xg8/kgi0ZutxtdunTBrl27eLMjhJBkPgkPASFNT5cuXWIHDhywVu1MYSCVLjzEGTmuchz1ap28LqtzOv/f5/NZ50Iij4qKijBmzBhMmzYNF1xwAXw+X5xYxnQiQghp2Dx98OBBLFiwAP/3f/+HVatWxaUESdqKRBLK3yIG6LQXHQHT2ubgTAkusp0UnLfrvCfC17Rp02b+/ve/f4SjmBBCkkPPgJBm4rrrrvt/zzzzzD2hUMhalUvVYadTn74xqo+Z1AywO+6ywifRL7rtZd++fTF16lRceeWV6NatW1zxY104kOeHEEKcWb16NX77299i0aJF2L17d1wUi8yjWtiORqMoKChAXV1dXBqRbCvPibDeWtpC2/02s1h8up8j58Lr9VptoSWSaNSoUfjwww95gyOEkDTgpElIM3PaaafFli1b5lhzRIdUS5pMOk69U263nbhj123HFCxaQxRHoi5HANCxY0eMHTsW06dPxznnnGNF09h1MZIwdyC+Bozd6iEhhDQ3Zucgp/uGnrucOrXp548ePYqXX34Zc+bMwYoVKxAIBKzUIBHBM3Vv0fuSrujQHPe3ZDVYkoksqfwOu0gYOYf6/qajWeT5rl27YufOnfQZCCGEggsh+UunTp1iBw4csFKMfD6ftbpkdnIQwygVA9FpBSyR4NLacRJcTOEFAAYPHozLL78ckydPRp8+feoJNFpYEbTAYrcay3NACMmVOVDqXWnxQs9XpqNuis/r1q3D73//e7zyyiv48ssvrUgVn89ndR6SqMJM1DFLR2Sx+925Pv82NmJH7jf63Ek0kTwvEaAejwdXXHHF/86bN++HvCoIIaSB8y4PASG5w9VXX/2bF1544QYxcCWdRQrW6XBp0/BKtzOBXSQL65Ck7oSIkSrPtWnTBueddx4mTZqEsWPHory83NrGdETs/nY6h4QQ0tREIhEAsAR+c27SkXv63iEic1VVFRYuXIhnnnkGH374IcLhMABYaSoSQaPnyMYIJU73tnSjXPLpPpTudmZxfjlXOnVLooyYPkQIIZmDEykhOcjpp58eW7FiRZxRpIu+mikoiSIyUjFKTaO5tTv+qRjo+pjLKrAcu65du+KCCy7A5ZdfjjPOOAMFBQVx0S76eCf6mxBCmsOhF2E/1XTHSCSCcDiMJUuW4JlnnsGSJUtQVVWFwsJCK+x/7EcAACAASURBVHVIipKbEZvmdzZ2/nNKacp3AaUxn21nG0hxXCkgL8eprKwMe/fu5U2IEEIy5VfwEBCSu3Tq1ClWVVVlFbALBoNWrZfG5nnbGaEUXOINdqdjqAs8hkIhy3j1eDzWORJDdsCAAbjkkktw+eWXY8CAAfVSjXi8CSG5jq4/Zc6Pq1evxrx587Bo0SJs27bNek3mOHHozfuOXf2XTMyHiWqTOd37mots7EeiY2imI+vj5fF4cNlll734/PPPX8YRTwghGfQreAgIyW2uueaax+bPnz8jHA5bue9OYd6msdVQY84pV9/OmG2RE2OS46fz3cWRkLB4WTWUFqXioBQWFuL000/H5MmTcemll6Jdu3ZWSH4qhjIhhDQlOh3STCGqqqrCn/70Jzz33HOorKxEMBgEAGvek//t5jW/349gMGgJOLFYzCo83tj6Leb8bZdW1JAuPpkWRJri852K5sqxkHQiABgxYgSWL1/Omw8hhGTDr+AhICQ/OO2002LLly+3NSgTOe0NMe5au+CSikGri+HqnHjToAX+02lKavN07twZEyZMwOWXX44RI0agbdu2HOCEkJxBp/sEAgErNeidd97B/Pnz8eabb+LgwYNxoozH44mrzxKJROD3++OiYkSkls83O+VkxLBNEt2RbcEl1+vFyP0pGo2iU6dOOHDgAG/qhBCSzXmXh4CQ/KJPnz4xCdtOZEjaGX+NjXxJZtC2dJwEFRFSdOi8Pla6Fo92aLxeLwYOHIiLLroIl112GU4++WS2iCaENPs8p1N8Vq9ejT/+8Y94/fXX8fnnn8cJJNJNT0ddarFGz3862kR3IzLrlOmCupm6PyWqUZZpgSSVdF677TK9qOFUNBf4ehFg6tSpD8+dO/dOjnhCCMkuFFwIyUPuv/9+3+OPPx7cv3+/Y/ci6XIkhqxZNyTTBm2TTlxZNpibArOmgd/vR0VFBcaNG4dLL70UAwYMsP2d2mExceqIRAhpueKI6cSbrZzlb31vSCRCRCIRrFy5EosWLcJf//pXrFu3zqpVlUoh3VTm53RqiCUSDpy+3xTHReBp6votmfouc+FE7u/Af4rfmu2edW0WSQkLh8M466yz8P777/PmQAghFFwIIcmYMWPGVU899dSzx44dg8/ni6snItEWHo/HytWW5zOZJ9+cgoudMZsPQoPOn9erxfJ7iouLMWLECEyaNAkXXXQRevfuXa9DlSmiabHF7ngkayFOCMk/sUXPAXatms25wSy4LveEWCyGjz76yBJZtmzZgpqaGms73U0oFcEjk4KLneCQiuBiCi9NLbhkQ2zRv8Xn81n3kIKCAgQCgbjzpO8xPp8PZWVl2LFjByd/Qgih4EIISZdLL730nRdffPFcl8tlrWaZLTglCiYbKSt04NNDuhnJ+dKrkpJqJF2OCgoKMGLECEycOBEXXHABTjzxRGvl2nQmzAgmnhdCWpcAo51tu9d1yk5dXR1WrlyJBQsW4LXXXsPmzZtRW1trOeoyz2ixoiH3A6cIlUTPN2bushNcsiGEZENsSTXlSVK59DZSqFjfTwCgffv2mD59+vjZs2f/jVcJIYQ0PbTGCWlBnHLKKbE1a9bUi54QI1vXHMnqxJJlRz+VYsG57hjJORGBTOohAEAoFLJCxqUleCgUQmFhIYYNG4YJEyZg/PjxGDRoEFOHCGmFhMNhuN1u2zRRM6VIi7H79+/HsmXL8NJLL+Hdd9/F7t27UVdXBwBx23u93rgOQgDiCoNnW3DJxH1ECy6Z6N6XbaHF7vgliuLUaUX6sY5unTx58gvPPffcFbxiCCGEggshJIN06dIltn//fgBfr4RJy06z2Gu+Ci75KLJoRGQxo1J0m04dxSLdPqS7h8vlQkFBAYYMGYKLLroIF154IQYPHgy/329b00GvVhNCWgbmta4Fdp1CtGXLFrzzzjtYtGgRli5div3798eJEV6vFy6XyxJ6dUchEXfkXtIQQSFRDRanzkGZLBybLOKlOYUWp+OTSuFdnSIlIotEJA0dOhSVlZWc8AkhhIILISRbzJgx46o5c+Y8GwgE4Pf7rRSWliS45DOyMun3++FyuSxRTFKMxBDXhY+1MyURTABQWFiIAQMG4MILL8TEiRMxdOhQx04fuoMIIST/SCZSRKNRbNiwAQsXLsSiRYuwdu1afPXVV3HdgCQ6JhaLWamn8lwoFLLaOct3OdWAaaigkOi3ZOuYZUtwSeczTTGpIfsjYouuxyZzepcuXbBr1y7egAkhJIfgpExIC+fCCy888Nprr5VKXRAJFc/KhJJiyHYmjGvTaM2naBcdcWLuu7ymO4voUHEgvjimFmQkFWDAgAEYO3YsJk6ciIqKChQVFWWtfg8hpHnQNZ+i0ShWrlyJt956Cy+99BLWr1+PmpqauFofcg8wC21L0Vxx4qUGmPk+ACgqKrLE4VwXXOwK5zan4OIklDXk3qdrtABA586dcdNNN5Xcd9991bwyCCGEggshpBkYOXJk7KOPPnJsKZxpASTVbTP9XfkgvOhIFXGadLtVbUzLarTUZdC5+lJ0V4QX7TiJ83TCCSfgnHPOwbhx4zBq1CiUl5fzYiAkz4UWl8uFI0eOYPny5Vi0aBHefvttbNq0CYFAoF4knJ4jvF5v3NyiWwrL3zJH6VohZrvpbAoumai10lRdidIVWzLx+7SQVFJSgmnTprEgLiGEUHAhhOQKJ510Umz9+vVxRRGdVgHFaJW/ExmvTSm4NHriS2KEN9RIz5XuQGbdAjnPxx9/PCoqKjBmzBiMGTMG/fr1iyu8af4GcVjMLiVObVvFoRPnTrcobYpUNkKa+jrT14oIGHbXotO16fS603ds27YNixcvxttvv4333nsPu3btipuvRHTN5vybqChuc859TvNvpuqrJGtXnWx/9LZa6DJf00KZKb4LxcXFmDx58sNz5869k1ciIYRQcCGE5CC9e/eObd26Na4tse5wIIagrIjqVBcno7opU4rScQq00ZrKdzcm5DsXImy0OKZFFy2aFBcXo0+fPjj33HNxwQUXYNiwYejcubMlxJmRUHq12Emgke3Mwp0anQ5FSD6iozxSEUv0denUYU3XV5HryOPxoKamBsuXL8frr7+Od955B+vWrUMgEIgTwu06FWVzvk0UodKc81+mUnZSFVwaEt0inxONRuHz+RCJRGyLp8s4E3FGzrfP58Mll1yy4IUXXpjIK5EQQii4EELygG7dusV2794dt+KmhRUJI5fVNt1Jx8kYb27BJZHwIw6B0zZOkRjZDEvPlvOhRRfpRCI1HMSYl+1KS0sxbNgwnHHGGRg7diz69euH0tLSes6A6RDolAOdvmC+TwQbRrmQloh5bZjdwWT+kPoocv2YETGBQAAbNmzA+++/j7feegvLly/H7t276wk2Ok3InNMouGRHcEl2bzHn3kT7INFQetzIHKmFcamlE4vFcNFFF21btGhRb15thBBCwYUQkoeUl5fH9u7daznjsvqmDUNddyRTBnuTTXaGEJTIcE60f/kgvGiRTM6nrt9gpjRIZxIAVoRT9+7dMWzYMJx77rk4++yzMXDgQLRp0yZhypGdmGJXn4ZdrEi+iyt20Q6pjGtzDopGo/j888/xz3/+E4sXL8bSpUuxc+dOq6uceW2JgCMRa2a0WVNHD9r9puYUW+zm+kwKLpl4bywWg8/nQzQatYRvvd/mosb555+PJUuWcNIkhBAKLoSQfOfuu+/u+sQTT+w8dOhQnFMuTrvX602YUpRrgouT4Z1KDZdkzlYuCy9isJsOmF5FlUgXHa6uhRefz4dwOIxYLIaioiIcf/zxGDFiBM4991yce+656NOnDwoKCmw7LNlFxSSq/0JIvgouOl1Rix92aXkAEAqFsHXrVnz88cd47733sHTpUmzcuBGBQMD6LN0hSEeM6e8W4cVpn1qL4JILBXHTfa95vHSxYjnnsVgMp556KpYtW8YJkxBCKLgQQloaM2bMuGru3LnP1tXVweVyIRQKWa1BxUFvjGHdVClFToavU5HgRKH5Tk5FLgovUmPCrBkhK+NyDnWRW/28rg+hnT1xBjweD/r164eRI0fi7LPPxqmnnorevXujsLCwXgtrJ0eVkJaIjH0RHevq6rB582YsW7YM//jHP7B69Wps2bIFR48ejRNrdF0jmWclUk1voyMi9BxmV9TcvNYyJcjkSkpRtufexhRON+8tGr2AIUKLiGwulwsDBw7Ep59+yomSEEIouBBCWjrXXnvto3/+859/cOzYMdvCjA01rJu7hkuytKhUBJtcFlwkykSvspuFdL1eL4LBIGKxGPx+vyXA6KLJ2tGTz9ORL/J6mzZt0KtXL4wcORKjR4/G6NGj0b17d5SUlMQ5oYS0ZMLhMOrq6rB27VpUVlbigw8+wIoVK7Bt2zYEg8G46C9deNeMmpNr0K4GjJ53dFckpy5zFFzSf09Dj1OqdV30OZLzGw6HcdJJJ1FoIYQQCi6EkNbIdddd9/+effbZe+rq6uJSUBoqnuRClEOyornppBzlmuhirnyL4KHb15q/U9dksTvHOgrI7XZbxT9jsVhce1OXywW/348TTjgBw4YNw5lnnonTTjsNffr0Qdu2bVk0l+Q9uvPX/v37sXbtWnz44Yf417/+hfXr12PPnj0IBALWWBfhxCxGbl57uoiqpA3pWi3m/7reR7JORdmYO+3mv6ac2zMpiJi/rzGfnej9dtv169cPGzdupD1OCCEUXAghrZ2rr776Ny+//PINR48ejSveaFeIVaIitIOhu9jk9cSZRHDJ9QiYpnCERLCRwr3l5eU45ZRTMHz4cIwcORIDBw5Et27d4PP5bI+XU7eoZE5wKk6R0/lzOm9On5tLHVrybXwki8IwtzU7iyU6zqYAYW7r9LrZstzsvFVdXY3t27fj448/xieffIIPP/wQn332Gaqrqx1ruaQyf6QrEGRijNmNXXmcrTFsdnLKlJDSlKKNjB85z3aCtVmQXN5jCtmDBw/GmjVrOGEQQggFF0IIieeqq67648svvzzl2LFj8Hq9VrFVMTS9Xq9V9LGwsBDBYBDRaBRFRUWora3Ne9El1ZSj1ii2iCMiUS9alNPOaElJCY4//nicdNJJOPXUUzF48GD0798fvXr1iqsro6N0zLbSds60mb7kVLw0FREglfckSq8gyR1XJ+fb7ljqaA/tyKYicthtl+h8HTp0CDt27MBnn32GyspKVFZWYuPGjdi5c2dcXRWziK2M1UyJJOl2Ucv0/JYNcSNVYTQXxRa7+UJ38ZNIQhHvdKc/mcOGDBmC1atXc5IghBAKLoQQkphrr7320eeee+4HwWAQfr8/rk6BmcKiO+Tku0NKwSU1h8SMapJVX52CpI9Tu3btLBFm2LBhOOWUU9C7d2/07NkTHTp0qOfoaAfaKZLBLn2jMSkQZjeYhrYHJs5ObCqRTbpNvT7uZrty08nXBaFdLhdqamqwd+9ebN68GZ988gnWrVuHdevWYefOndi7d29c9xgzRcjuOjfPf2PHQqLouXwSXNK55jI9b9odw8Z8h8xpkiJm15VNd5qSaM8hQ4Zg1apVnBwIIYSCCyGEpMcVV1zxl5dffvlSKcKq21zq1V9pRdwSBJdUary0ZsHFdH513Qktwth1TRKnOBqNwu/3o6ysDD169MCgQYNw8skn46STTkKvXr3QvXt3FBYW1nOGEokwiZwoUwxMNU2JAkvjnOFUU7bM7Z1ql9iJLoFAAHv27MGOHTuwdu1afPrpp1izZg22bt2Kffv2IRAIWNvq+cssWqu7tDVFK+bmqI+S6e9JVzTKtuCSieOjU2XNsamjnHw+HwYPHoyVK1dykiCEEAouhBDSOCZNmvT+a6+9dmZtba0V0aKdEp/PF5de0pLFhtYstpgihl0ah36sQ/K10yurx+Lk6rFUWFiI448/Hv369UP//v3Rv39/DBw4EL1790ZpaSkKCwvh8/ka7cSaETV2EVpMJcq8AGNGJOmx5JSKJMLKl19+iS+//BIbN27Ehg0b8Nlnn1nCypEjR+LOlRlVY6akmU603tYUXJw6CmVKMGgpgktTj6dszGvmnCXRLvoYVlRUYMWKFZwUCCGEggshhGSWiy++eOVrr702tK6uDj6fz4pcCAaD9RxwCi4tV2gxnWe7827n+EqEi7xf0tNkG13PRep6AF+H7vv9fnTt2hVdu3ZF3759ceKJJ6Jnz57o0aMHevTogU6dOqFNmzYp1V5JNXrFrrArSTw+5Hjr86qjopxq9UhKWlVVFbZt24atW7di8+bN2LBhAz7//HPs3r0bBw8eRE1NjeUAS2SVXUSCOM4S0SKdt/R+6gLhTnWJxPnWrZpzef6wK5abzphvqWJLKu8xxRWpKSQRnEOHDkVlZSUnAkIIIRRcCCHZZfLkyYteffXV8TU1NZbjLEZpS8WurXRri4DQ0QJ2vzkVp84UYnTXI3F47Zx2cXzMz3C73Wjfvj2OO+44S5A58cQT0bt3b5SXl6O8vBxlZWUoKSlBu3btrO+x22epQWOmxzHSJTPObTQaxbFjx3DgwAHs2bMHu3fvxrZt27Bx40Zs374dX3zxBQ4ePIgjR44gFArVi4KxizYxI2bEaZa/zYgFPcb0ODQL5JrXeSYEi5YiuDRFmlVzfa5E4InAFo1GMXr0aPzzn//kxU8IIYSCCyGkafmf//mf21988cX/raqqahE1XJIZ7K095cR0TvUx0Ckhsp3pLHu93riIAh3JolurmtEzTg6vGZVgl9bm9/vRrl07tG3bFmVlZejcubNVJ6ZLly4oLy9H165d0bFjR5SWlsLv98Pv9/PibgB1dXWoqalBVVUV9u3bh7179+LLL7/Eli1bsHv3bnz55Zc4cOAA9u3bh2PHjsUJH3ZipowRPZ5knJh1XszuRjI+ZKyJI22OM3mPCDOmkGOXQtnQ670pakBlU3DRAmi+CC7pfKY+136/H2PHjt356quvdueVTQghhIILIaTZ6d27d2zr1q1xRVO1IWtGL5hGrrnynI5zwAiEFnLjchC0Un3d3MZ0nu22l7QBj8eDDh06oEOHDigrK0N5eTk6duyITp06oXPnzjjuuOPQpUsXtGvXDiUlJWjbti0KCgpQWFiIgoICS0zS6S2pCnVmK+JkxWYTOdmJ0qcSfY9dbZVwOIxAIICvvvoKR48exaFDh3D48GHs27cP+/btw6FDh+L+3rVrF2pqanD06FHU1dVZkQKppBs6RUyRpru+skWy+TlT+yH1eJzENwBxbZztuhC1a9cO48ePX/DCCy9M5IghhBBCwYUQknMMGzYstnr16jgHS3cx0rUVdF2EVEQTCisUXNIVIPS2OlrC7jPN+g2mQCHjVWrK+P1+FBcXo02bNigqKkLbtm1RVFSE9u3bo6SkJO7/oqIitGvXDgUFBdb2BQUF8Pl88Pl8cLvdKCwsjEttkWtIR1aIGKL/yW8Kh8MIh8Ooq6tDMBhEIBCw/g6Hwzh27BgCgQCOHj2K2tpa1NXVoba21npcU1OD2tpaS2AR8aSmpgaBQCCulbKdiKX300nQSSayUHBpmusrV45tJvcjGo3C6/Vaoot00NNRTU7FvNu3b48pU6Zc/+STT/4fRwohhBAKLoSQnOeCCy44+u6777YJBAJx6Ua6fbDX67UcRTGUtWPpZJhTcKHg0hBnzRRR9OdIypMWZMzVb/P7tdhhiiM6DcbJ2RVRQtcOsXvOvCbMlC3tTJqvJztGZnSMeZ2Zj7WQapcSZFcsV39+QyLXCAWXVD7DbFMv6HbgOrUsEomgvLwc06dPP+HnP//5Fo4QQgghFFwIIXnHlClT5r788svX6gK7ACwDWDu5dukY2qhOFpKeLDqGQk3rFlyc0lacRBHdkUmPTS206Od1Vxv9Hi0yikCiRRWz3o3TvurXnY6H3ft0Sl+qIpD5vBkh5HStmq8nuqYpuDT99ZVLxzSTYose68B/CntrEUYX3h40aBDWrVvHGwIhhBAKLoSQlsGMGTOumj9//rNHjhyxhBap8aAdOjvnINUaAMnqQFBwad2CSyoCTCLxQjtx5vtNMcTJyTWFGP3PrHNiFnFN1jnJjMhx2hezK48pwiSKUEl0Pdm9x+w6leg8JIpqIy2LbIgtuv28Fku9Xi9CoRDcbjdGjhyJpUuX8kZACCGEggshpGUya9asPvPmzdu8a9cuq0VvOByGz+er1w3EdCzTreGSzGEnLUtwSXUF3xQGnEQH8z06GssUSOyK06YiJJgCjNN2qQguyYrv2rXztts2ldQTMwLI/D36vSLs6Bo5FFxan7CS6Qgbu+gWnS4k4ovX68UFF1zAjkOEEEIouBBCWhd9+/aNbdq0CT6fL64gZyInrDGCS7oOP8muoJLu+UtVkEnnvNulEek0oET7bAoOOm3HLoIk0e9pSMqbKXTomiqJHF47QciuHbJ+n26Z67T/IkI5iUfJOhU19voljRMvMjn/NUeLZ2nnLAXZS0pKcMkllzz41FNPzeIZJoQQknG7loeAEJIvnHbaabHly5fbGv2JWt6ahnhji0JScMnyjakZBBcz8sSppohTcVqzAKeIESJuSH2IRNEnTpEn6az+J4qAcaq/Yred+f1mvRWzla5TzRen42UnMOkaNxRcclNsycT8l+3zlezzJXXoxBNPxKZNmziZE0IIySpuHgJCSL6wbNkyVzQadV1zzTX/e9xxx8UV99RRBvK8rgvhtFpvt3qfikFvdnqhCBPv9Dulj+jHiRx/p3920RmpOF7J6oKYrYqdxoRTm2O7sWN25zF/m914shuj6TiTTqk/En1itx923y+P9TUk7zPPQSIhR583uwgZvV+J3u90/NkCvvmu63Suw1S7Ycn2upuXLmhrzhtOBax9Pp/jeDv11FMBwEWxhRBCSJPcP3kICCH5zODBg2Pr1q2LiyaIxWLweDxxRr7X67XqQ5hGunSGke4UyZwKu5oUBLbiRqpFVBv6+XbvT/X7G7rSnuvnPVkUTDpOb7J0qWyPH7t91tdfono6pPlpzDkRkUV37RLkObuoKa/Xi3A4HFcTqH379jjvvPPWvfLKK4N5VgghhDQljHAhhOQ1a9eudcViMde4ceN2+nw+AF+HjOsUD3EcQ6GQVYBXjHXZNhKJWMJLQ5wJOnsNc/6d3pMoAiaTjqBdxEprdnLtRI3m+g2J6jJR7MzNcZduNIsdOqoqGo3GieQejwcej8eqv6I7DMlcr0Xz3r17Y9asWSdUV1e7KLYQQghpFluYh4AQ0pK46aabrps/f/4caSvt8/kQCoXqOZFmPQox0KVrRboOaarOabLtWkrkjFOdnGTRC4mcaaf0kYZEuNitjKd63PP9/OS6uJRu23aKnS1vPOk6QRKtqCNaJMJFttPb+P1+nHPOOXjrrbdo4xJCCGl+u4aHgBDSUhk0aFDs008/tSJZAFih5mY3FaklASClOiFOrW4TtcdtqEOZlzeXLAguqTp8pghmJ7qY709HdMnn85MP4kS67d4puLSssWRXvFnSiyRdVBejlvbOpaWlmDRp0szf//73j/DsEEIIyRm7hoeAENLSGT9+/I4lS5Z0CwQClnFuRrqk60TYRbY4OfXpdtHJd4c/nQiUVF43t02nC5FTvQ87x66lHP9MOMepCFVNMX7szpnT3yQ3x1JDMOdpEVrkOanPEo1GMXToUKxcuZL2LCGEkJyENVwIIS2eV199tXttba0rFou5+vTpEyeQSP2WSCTSIKejsS2mW4NzlgmBoiE1IVI9N6wHkv7xbOrvTOX88zymdy019F9DrtF06rpI3RaJQJR5WhfCbdOmDb7//e+/GIvFXBRbCCGE5LT9xENACGmNXHrppe+88cYb5x49ejROGNDdjhI5dk6RFrpYr5Oj31iRJl8iXJwiSjIdAdPQLkXme1ON5sg3x76hY6y5OgEli2BJFO1C0TM74yGdz2xMBFuic+3z+TBo0CBGsxBCCMkreNMihLR6hgwZEluzZo1l1EvhXOl2oVuQakFGtyv1er2IxWKIRCLw+Xz1VnP142w77I11eJr9xuSQzqLTwLLtQJr70pTHr7FpMhQdWrDRloKo1Ny1bnREijlnJnqPLoCrOxN16NAB3/nOd+Y9++yz0zgCCCGE5N29m4eAEEK+ZvLkyYvefPPN8QcPHoxzAnT9ADPFQdpMpxIF0JQOTyrfaScc5EKUQDqCS3Psa1MILhRbSENp7jFg1k4S8cVpbpI5NBwOw+v1IhKJwO/3o6KiAh9++CHtVEIIIXkNb2SEEGLDGWecEVu6dKklrHi9XmsFNhqNWpEw4kTICm6iKJZcc4bNfcyVAqTJCrY2leDitB+5GiFEsaV1kEotG6dt0hHzGhohIwKLx+OBx+NBMBgE8J9CuLKNzK367/LyckycOPGG3/zmN7/jmSaEENISoOBCCCEJuOOOO85YsGDBB1u2bLFak9o5INJqOhaLIRqN1utcJP9ywVnPl5Sihr7eGo8fxZaWS3Od28YKLoIWWrxeLwDERbwUFRVh9OjRWLx4MW1SQgghLQ7e3AghJEWmTZv20KJFi2ZWVVVZ4ovP50MwGKwnsJjOikTAUHBJfR9zVURozuOXSlts0jJoTqGlsREyMj+6XK64VEz5XR6PB3379sUVV1zhv+eee0I824QQQloqFFwIIaQBjBs37vD7779fIl2OPB6PY62XnL4J5Kj4kiuCi1O3nuZ0vtmKvGXT2HOaKJIu3Si7hox5t9uNSCRipQtJxIvX68Xxxx+PCRMmXPvEE088zTNNCCGkNUDBhRBCGskZZ5wRW7lyJWpray3RRZyV5nTSU3HYEz3XrDenBgouTZG2lSuCC8WW3KQlnRe7+SuVLkn6+u3atSvGjBnz22eeeeZGjg5CCCGtDQouhBCSQUaMGBFbvXq11UY6WdHX5nAAk31/rqQ92XUoStc5zMa+5ML58HLKSgAAC7VJREFUo9iSu2QiQiUTY62h7cwzIe79W2R5/Omnn76FI4IQQkhrhoILIYRkidNOOy22du1a1NTUAPg61N6s5SLh91KMV0Qav9+PcDhsFeDVNWIikYiVwiQRNWax3sYKDHTskx+fxr4/nToZPA9Ne37leJvt3hOdeyfBr6nPXTQateYEvQ+6gLfMN3p+Md8nc5UUA5ffJfVZzNfLyspw/vnnv/Dcc89dwVFECCGE/Nuu4CEghJDsU1FREVu/fj1qa2vh8/kQCoXi6r2Ik6PFE91W1e12w+v1Wu/TDpHpHDW3oNAaHPJMOfSpQsGl+Um15Xtz19jRrZbNfZAW9+FwOK6+ijkutQDs8XgQjUbjxBn5jvLycpx77rkUWQghhBAnu4+HgBBCmpbhw4fHPv30U9TW1lrODPC12BIOh+NWnF0uFzweD1wuF0KhUL3VZu0AAchIlAsFl9w7PhRcmv54O0WqJBNcmnq/zH2QOcJun+T9IvbqyBd5zozEM6N8evfujbFjx971hz/84RccKYQQQkgSu5GHgBBCmoef/exnroULF0bXrFmDYDBorRprsUWnDQGwImJEqNGr2PLexjp/OuXFzuls7YJMc9dwIdkRLFI9B82RMpSsrov5uswbpiCr5wot0MhcosUXec7n86FPnz4YP378tx599NElHEWEEEJIGnYjDwEhhOQG5557bmzVqlU4evSoFemiHR8znF/EF6/Xi0gkYqUh6VSjxggKTh1KKLhk7/cniqwg2RMskr3H6fw3tdhit/9O9X6cupHpiDot2gL/EV+KioowcOBAXHzxxe67776bA5AQQghpqN3IQ0AIIbnHxRdfvPKDDz4YWlVVFecgRSIR629dKDeVop7pCgoUXJDU4c62IECxJbPHtiHj3+71pkwhSjb+Eu2LFmrlsdRxkZQi+bukpASnnnoq3nrrLdqGhBBCSKbsRh4CQgjJbW677bbvvf766wu2bNliFbgUR0rXdBEBJhOFc50cT9Z3oeCSbzTkGDakLXlDzm+29l1Huck8oV+TeaJLly4YNWrUqgULFgzjSCGEEEKyYDfyEBBCSH4xduzYyKpVq9z79u2znKhkq/INEQwouDTu+DXUqU4kuDDCqHHHNp1zrI+1rpWU7vFPlhKU6X13+k632w2fz4eTTz4ZY8aM6f/ggw9u5AghhBBCsmw38hAQQkj+ctttt31vyZIlCzZu3IhQKGQVvNQ1YHQLWElJ0kUzpZaDdCjRTpukLkn0jHbe7DqY6C5JFAbyR5BIVCjZadt0X7fbPllR5nyP8LE7vnbHWz82azDpa1W20W2bdZFcy7j793M+nw+9evXC6aef/uz8+fOncsQTQgghTQutYUIIaUFMmjTp/X/+859n7t+/P050EeS5uBuBeqwdOXHmdA0Zr9cbl9YkAosIOmYRTpIfgoDdWHDaLpUuOel8T6pCTj4fXy2oiAhqPi+PzfbwOtpGCytaQJX3ulwudOnSBSNGjNj56quvducIJ4QQQpoXCi6EENKCueiii7YuXbq01/79++PEF3H4BB3ZYhe5IqvsZpqF+TdTXvLgxm+0DbYTBpyEA6dt0m2bnI7gkuhzch27fbYTn+SfCCherxexWAyRSAQejwcul8u6Zs2C2R07dkS/fv3wzW9+k2lChBBCSK7ZXTwEhBDSOrjrrrv6LVmyZMPq1atRV1cX5+TK/xKh4na7LcdOUpLs6lqIgCPv088x0iU3BYBE9X7SjU5pyHk2C9Km2gWrpQgu+veL0ClCiwgvZvcx/VmFhYXo378/zjnnnMsfe+yxP3FUE0IIIbkLBRdCCGml/Pd///cd77///sObN2+2BBjtEGoxRVbZdR0X6XTS0uputETS6YLU2NeTGh4OgkuiSJd8G1Pp7K8WWOR9OnXP7Xaja9euGD169OK//OUvYziaCSGEkPyBggshhBAAwLXXXvtoZWXlDz7//HPU1tZazp4urhuJROq1ntaPmU6U+86/KZiYgpkpiNgJBMled/pu/V1On9MSxLtUj59O1dOt3rt3745hw4ate+WVVwZzBBNCCCH5Cy1jQgghttxxxx1n/Otf//pg7dq1OHLkiOUcer1eKwVCRyXoNIhUnHHSPM5/Oi3EG2RYOHx+ul2MWtIx179dR4pJsenu3btj9OjRLz7//POXccQSQgghLQdavoQQQlJi1qxZfZYtW7Z5zZo1qK6uRl1dHaLRKPx+f1w721SjH0jTO/5yDhJFnuT6b8mHMZRIcOnQoQP69OmD008//donnnjiaY5SQgghpOVCy5cQQkiDufrqq3+zcuXKG7Zs2YKampo4B9Op0K5OQZLtgP+kJunOLLpmjN7erAEi25miglkUOBKJ1Hsu32iNNXLM3ywFnc3nnYrNOrVCN0UcqVckEVwy1mQsSwFp3Q5d3meOyVgshuLiYvTs2RODBg1a+tJLL43ijEEIIYS0Lii4EEIIyRj33HNPl48++mjLhg0b2uzcuROhUKie46zb4GpHWQr1iigiDq0WSFwuF+rq6uq1sdYOtCnK6Nfle/I50qa1FiXWdU9E9NDn06l1uYwBeSzvtRPk9DiR7zLHinyvbC/fUVJSgk6dOmHQoEGbKyoqKu67775qzgiEEEJI64aCCyGEkKxy5513Dl++fPnHn332Gfbv3x8nwuhIFNPpNYuJ6u5J2mHW2+taMtpRT1ZbJh+Fh9aKWSvIjHRxGkciyujxYZf6oyOz9OtavCkuLkbXrl0xcODAzcOHDz/53nvvreWVTgghhBATCi6EEEKanJtvvvmalStXztu6dSsOHDhgtaU2I1N0yob5utmW2s7pFgdbO+r69XyDLbfrHwe7SCZ5rOsKmWPCTlwxhRa32422bduia9euqKioYFFbQgghhKQFBRdCCCE5wU9/+tOeq1evfm/t2rW9qqqqUF39dUaGjmiRlCNdA0Y6JwFfiyperxfRaNSxXkuiNsn5IDC0duyENVOA0UKdy+WCx+MBANsaLFKvpaCgAO3bt8c3vvENDB48+OG5c+feyaNNCCGEkMZAwYUQQkhOc+WVVz7/2WefXb59+3YcPny4Xu0OM6rBrNuhW/Ga6Ua2N8YcE2Bau9hi/n5dq8Wufkui4+V2u+H1enHcccehR48e6N+/P6NWCCGEEJI1KLgQQgjJS2688cb/+fzzz3+7fft27N27F1999ZXV4UinkpjRMKZAk/aNs4kFGXYlsn/NLmpJolfcbjfatWuHsrIydO/eHSeccMI9c+bM+RmvGkIIIYQ0JRRcCCGEtDhuvvnma7744otfbt26tezAgQM4cuQI6urqHDsUpSOiNKXg0hLFlsb+JhHRCgsL0bZtW5SWlqJnz57Bvn37/vcTTzzxNEc/IYQQQnIFCi6EEEJaHXfddVe/7du3/3Tnzp1T9u/fj4MHD6K6uhqBQADhcDjhe3VLarOLkqQ06W10C2GzuK/+Wwq46toz+jv0Y7tOPHE39wSikPmaXU0Uu8+U1yWCxO73A7Bqouj32BWmNb9TR64UFBSgbdu2OO6441BaWopu3bp93KdPnx/96le/+gdHLyGEEELyBQouhBBCiAP33Xdf+6qqqu/u37//+/v27Rt/5MgRHDp0CIFAADU1NQgEAlZtGBEadD0ReSwigym+2LU3dkqZkcd2bZH1Z8l3mOj9sfseeU4XKU5qRNiIJXp/dHepwsJCS0gpKSlBp06dUFpaurS0tPSv5eXlT91///37OOIIIYQQ0pKg4EIIIYRkgVmzZvU5cuTI2V999dXII0eOnF1dXT3o2LFjqK2tjRNswuGw9S8SiVjCjSl4yGOv12uJN3biTMKbvk0Ei1MkC/C1UOLxeODxeOB2u62iswUFBSguLkZxcbGV2tOhQ4dVJSUl73fq1Oml9u3b/+uee+4JcRQQQgghpDVDwYUQQgjJQ372s5+5otFoYTQaLYrFYt5oNFoYi8W8tjd7lyvscrnCAOD3+3fffffd7DNNCCGEEJJl/j+dsrktmKovpwAAAABJRU5ErkJggg=="
+# The application icon as square PNGs in several sizes. Qt picks the closest
+# one for the window, taskbar and tray, so nothing is decoded at full size or
+# rescaled at startup
+ENCODED_ICONS = {
+    16: "iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAC70lEQVR42n1TT2iUdxB9M79v9/s22SSmpO3a+GdtpQai1VAVzGoNokH3oohS8VJoIYeWtlKo0EoTLypa01IPCR5qtBKXUqg0BxVyiUS8pFXbBsFYDN1iTKGWbNpds99+v9/zECMKtg+GYRjewMy8BzwNxe7dBqRABBABSAEpADwAgv+BiOiTdQBg2RPdZ5MeZxGCXOb7/oHES680R1GlhpVwgfqJmwzLlX/vjQ8COAyg/IjDuQFKkiKyNNW86mrT2wcbwuB50DmQgIDQeIC/f76MO7lj35YLf+0BdxngOweACmxUUWUimfx09QdHGrRxZVmM50xQ5WJ+gl6i2lWm79vky69VEi8uerOqtnaVeuetqBKAeqLDER2ldv7CTbF5KdwfvxULyzNqnZ29qnoSTowh7kJKvJqlQmEzgN8AKIBpAaAi4hLJZE+pbN9akF4StLS0SHVVlURRBFHB739MYOSna2h8NY3UCzXFKLIFgHb82uiwERGSDCphuPXjfe+/fu7019r+RkZ/vf4jfAPsaN+C7qOH0Ly4Eb/cGEHTtk3xlva2moXLm+rujNxYAQCJZDI5ODAwQJLuz8lJrm5dx3293Xz3mxNs2ryeJ3t6SZL37k7YdWvWOgCDAD4B0Ib6+vrhoaEhkqxEUcQvPj/OvQf38/ylC2yYn+J7Z05w284dDGfKJOkia6NsNns3CIJFxhioc65ULBbnlISY8TA9U0Tv9zl4gQ9RmXs5ALgHpZIpFovzrLXP5XI5AwCxWCz2Q39/P0lG/xQK0Zr1rW77Zx/ynZPHuHTDWnfu7FlLMszn88xkMlMAWlV1VvoyK1ED4KuOjg7m83lOT03xy+PdrrOz014dvkKS7OvrYzqdvg5gpTFmjgMBICRhjKFzbmNdXd1H2Wy2LZPJ1Pq+j7HbY+7ihYs3R0dHTwHoUdWyc84AsE97AVBjjLXWAkAKwBIAcQCTAMZUlSRBUgG4/3Kk6erqUmMMPM97HI/2faadHwKV81eGdWngmwAAAABJRU5ErkJggg==",
+    24: "iVBORw0KGgoAAAANSUhEUgAAABgAAAAYCAYAAADgdz34AAAFCklEQVR42p2Wf2xW1RnHP+fc+7ZQh2bS0r5dW1f6iypKBOvcZJlZZBFNO43tH45ohNFWMJoscytbDGwkavxjYIwuWbfObMvcMAgx0zAWRsLGosQftR0xY6GQCCkWLP54f7S9957z9Y/3fdm7YhzuyT25N+c+53yf55vnfJ8Dl24BYPmcZj5jPgBUHAC++LZlPgZwZT6XBGAAGWtLn4Chsurym20Q5Gcy50dLyySBPGWOl5bRN7ZtC4H7gT8a+CtwAJgBPgD+DPwF2AX0X93XV/FZbJRPWsBX1dTU5c+dezF97aqvVd+4FpdahHyCvAq5GIMxhiT3MeeO7OPD42OvfSGd7s6eOXN+HpUXA6waGAjeHB4+dF3v/V9tXb8tev9sLpAExiDvLQhjrC8Bgdy/h7dUTL36ykvG2jsLPp8OEBprE3l/T7pzxfPfevaV+Ng776ZwMcbYArkGjAAJWYMNUxCmcHGUjD16Vzh7/r0upDcxpgQigPA/UAagp+22Xp+LjHFxTGpBJZKwGIoPMhbN5ji97zmqrurk1Mu/xM/lFIbhHYm1b8yrvKBUcg4JoLmqptbmMh+bwBpwMUpifDxHMjdDPDeLj2ZBYvGKr7OooZWmb28yV65cY5IkWUHdyirgMmBhgUKcKafKWnv48tr66xKZBdnp82GwsAprLcZARUUF3nuiKMIGAVHiIElY/KVG3GyGj06dnDPWTiME8l760Fr7uCk7pa7j+uvrj42O7gwNd6/fsN6sW7fONjQ04L14b3KSygULqE3XkctkGR8f55lnn+Efrx6h+3sDrOq+jSSKEKJy4UImXn+b3//oMV/anOXLl9cC+1avXq23Rke9inb48GHdess31drWpva2dj3QP6hsNlf6reHhYV1ZXa1bB+7Vg79+ym94+jFtGtmp2x/aqCAM3gegpaWlEfjX4OCgnHOJJCVJor179ghrdMsD92no5d9p6KXfqPmmlWptXqrp6WklSSJJGhsbU2NdWkBM4WD+DXgRuJH29vZq4OjQ0JAkxc45xXGsKIp0VWOjvrP1EUnS0I4ndOfQg/rtmaOqWbZUj275sSQpn89LkqbOnk2uvuYaB2wNUyEFqSnY25s3b5akJIqiC1EdHf+nrlhSrafeOKA/vLBLHUtbBOjhkZ2692c/0U2ruiRJpYAkaWpqKmlubpa1dqCvry8AKkLgo0wmAyBrbUHAABsEKHGYioCf/uJpjp2YKJzIykqSKCIILlJu5XI5xXEMkN29e7cDYM2aNZcBr/X390tSJEmlTJa1tWvtw9/Vc6fe0t1bHtLgz5/UyLujWtRQqycff6KcIj8xMRE3NTUJ2GIL9AQXoLu6uhYDR3p7e5XNZmNJ3jmngwcPqqKyUjevu0s/2DOiTSM7VbOsRV+5oUuZbEbee0lKDh06pPr6egFbi5uHzFNRenp6FgG7Ojs7tX//fkmKJbnx8XHfs/YOfbmpSR0trfrh9x+Rc85LSvL5fLJ9+3alUqk8sDEIgv+OfD5I0WEjcLq7u1t79+7VzMyMJCVFwESSO3HihHbs2KGOjg4BB1Kp1IqLaPkUuTaAsdb6urq6xZOTkxuAe5YsWXJtW1tbmE6nmZub4+TJkxw/fvyD2dnZvwO/CoLgT865C2pwKS0zAFwxG5xzHUAH8MXiBqeBd8IwPOu9x3tf6s3+/2n6SamDFdURSaVhy5r+575VMO/mUF70Km8o/8s+AVAq1BnTdV5cAAAAAElFTkSuQmCC",
+    32: "iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAHW0lEQVR42tVXa2xU1xH+zrl3vevdtcMmYO86xsSxHRww5mFTkpKWoiaUqOWVyqVCJK1UiaYVgSpQREhaqiZIxUhplfJogRQiIhVZvKwALY+wsWmUAi6WbaBAig0G2yzFS8HY3r2P8/XHPnwxSQPlV0Yanfs4Z+abOTNz5gBfUhIA9OT4wIK+iGSSAYDJ0Xb815PfhWOOcsx9IHBa6lFImeaVpMzweFZ6AqECiIHvEGIw8P/bAyJlQVZe3hO9nZ0zFFAmAD8T1g8F8E0ALQCakkBtAXRkeL1hoz92gFQpEOp+AQgAqKqqknv27PmNaZoLfUOGeDKDj0MJDVQ2QIJKWRBCBwAhBEDCuHkdfdeuAMBRV1bWj4yenk+/CIT4jHc5ZcoUcfTjj3cKYOb4l17B0MlzrD5kg8nZVBRUtiaEUJBaQjgJZcTwnzPH0La9Wo9d77ziefjhp/uj0Y6kXHUvADQAtsvlfktRvT5t1R+NrAnPu9rPXRSSFggBJq1Nh5tQIERakCv7EcQ6LxhNq17MMHtvfkBgJsjP9YIc9GwHioqGm2Z8yfh5P7YfnTLb1dZyVkgoQGoQQkKIgYCUUkIKDRICUndB92bBuHkdvpLxGYUvvm4DmOHKzK5IKtfuBQButrXNcnt9ntEv/JBdlzqF0HRACpCEGpxZQiScoLtg9kQRPXkEtAy0716L/s5Wai43rP5b30ttbXIUTs/fkSpCSiilKgKPldAzLITe232QupaYL0Qi2FIMkRYj3ZmIdbahvXY9rJ4oruxZj459m0VyzVPJzTKTY4o1AIkoHiggAgByMgPDbAoB0zABRUhdh5ADdYbkQM5rGhDvReDJSmS/thUUGsa9uRO61y8u71qLjiPbH/vqkp9nZcdiRv+tW6J8wgS+s2iRJaW0Sd4RhBKAklIed/uyJnofyYFlKdi2jds9PYBhJGYpleDkFiQ4KcGTCb/XCyElDMNEvLsruQBdjiBUAAwAJzIzM5cNBgBN06ZpgpNsS33XBsYA4NSvPyMqKyth2woetxtenw+aJmFZFnp7+2CaCe+Gw2GcbGoBAJROLEfJ155CvC8O2jaElEhZbMbiaPxrGLeud/99cAoiHA7rQmi/A3D72eees+vq6zmYmpqbeeRImGfPnb/r367duzl23HhC1zjz1Ze5vu0EN0dO25u6WuxNkVPWxq4Wa7vRYc1etjDuPC90AAgGg6MAnPX7/dywYUNaqGmatG2bq1ev5kM+vzOQ+GgwxG3btpEkLcsiScZiMa5YsYIAWDShnHN/tZSzly3knOWvcM5rizhz6U+YM2I4hZCn0spzc3O/AuDfJSUlbG5uNknStm0ahkGSXLx4MQGw7PmpXPje7/nrwzu48N3fsnjSBALguvXrSZLxeDwNfO++fczMcKfA9gC4AeAWgCiAwxkZGaUAgLy8vHEAblRUVDASiVgkaRhG2qLDhw8TAOe8+lPWRS/z/TPHuGz3n/jOqTpubm/kpFnTqUnJ1rbWtCdSwBsbG+1QXp4SUrYOLyoaHSwuHlY8btwwkcqiUChUAOByWVkZo9GolXK506WzvjODWXk53Hb+BEnydHMLAbBg1BNcVV/LNcf+QqFr/OUbv6BzfQpEU1OTPWTIEAL4iImyPNBnSCnPjxgxgteuXbOdSp1UVDCClbOmc1PbP/j25j9w2rRp1HSdADj95R9wa1cLc0Y+zm9/azoHy0iBaWhoMH0+H3Vdf49kuteQAKKGYeDGjRtMHGp3NzJSSljxODx+Lzb9+X0cPHgQKRdmeD0gFZRlQdPuLvcped3d3VRKQQjRLaUcUDJmzJgAgNP5+fm8ePGi6USdGr8/dy69gYe47lQd3wrvZEnFWHqz/Rwz9Rm+3fghV4V3EQCrq6s/cwvq6+sNt9tNIcReKSUc50KCcnNzCwG0FxYW8ty5c+bgIDzR0EAA/Ma8F7j5UgM3/OsTrv5kLze2n+S6f/6NpZMnMtufxUgkQqUULctKgzh06JDh9/sphDhaXl7uG3wYpQtQfn5+MYBPhw4dygMHDhgklTOtqtesSQTe2FF8qfoN/mzbWs5duZSB4XkEwNra2nQNSJLauHGj6XK5KIT4cOTIkVn/q1fUAKCgoCAE4IgQgsuXL1d9fX0WSSqlSJI1NTUcXfrkHYXo6UmT+FFdnTNm1dWrV8358+cTADVN21pVVZVxL42qBgA1NTWay+V6E4BZWlrKLVu2qP7+fpOkndJwobWVx08c5+UrV5yK7Wg0alZXVzMYDBJA1O/3LxBC3FeXnA6OYDBYCeADACwuLuaSJUu4f/9+1dHRYZJM84ULF6wdO3ZwwYIFDIVCTJ50WwoKCgodht33BUZLpV8gEJgMYBOASwDo9/uZn5/PwsJChkIhut3pUnsWwJrc3Nwyh9Xag9yMUi5TUkrMmzfPV1tbW9bT0zMKQAiAC0AMwOWcnJxTkUjkjJTSSua95rghPfDVTHNex1LWCZHoEwcVLj2pVN3P9et+5srPWaMcmfHlov8CFIOwqYHPTukAAAAASUVORK5CYII=",
+    48: "iVBORw0KGgoAAAANSUhEUgAAADAAAAAwCAYAAABXAvmHAAAMrklEQVR42u1Za3BV13X+9uOcc69AyJJ4Y0BgGBzsAA42GAgIiEOnBENdDCq169TPmgYrDSXmMWnjZJLwckMcHMD24DGOh5Zgp7HHqe1MCTAWUKfGiFpgLGBspEpCMZIM6HHvOWfvrz/uuZcrWVIEhEx/eA1nxMzde+211v6+tdbeG/hcPperEnGNdKb1Mvr+3zkgAMgu5ocdxqlOxhCAvdbOdWW46m5Afn5+ntb6t1rrXT3Qp6JAXLHoyxirABgAprCwMLc5kbhNAl8QQhUaGiUhBQUTza1tt0LIWQDguLFPKFEFQEgphYQUlDgP8qSn1OELFy40dtB9zUQBQE5OzkAvHt/guG61uITvzr4w+j7zmwAoAWrHqXfd2NZYLDY8e41rwQENIHRddwGE2Oonk4MAIG/gYNt76Bhrnd4ALWgtSAvSCFqrUsqFASQhACEESMIkmtF69mPZdq5OCgDKcRqlEA/7vv/LK9kJ0RPYOI7zkJDyOT+ZREHR6HDi335TxW64VbSYHBjIiI8ROwkQBCggROSGSP1AADAGYetFfHrid6x6dZtprjmlteOA1i4yxrx8uU6IP2S853l/Zok3Az9pRs+5S8xY9S/y3EWL+qp6CFpAACQRWQsynWREu1yaWVAICKWgY71hky2ofHa1/eTIXqG006qVnJBMJk9HdtkeY7sLx5gP5CW1/k3gJ3uPmjUPf77+eVlb24Taj8/CdTVS0JCAUBBSQgiZMlBE/4eAkEz5JiSkEBBSACBMshVCO+h32xzR9H6ZSTbVxyDlSGvtzigz9SjFym4cY0ss9pgJgsF5g4eZ2d/ZJJsaPkV9XRO8mJeKNGWKlqJdiDO7ASEgonIh0ubYELQWQjkwyTZYKTF80bc0hLC0dp7jOF+KIKSu1AERKfAIPGit5YR7viHjBf1QX9cIRGS06ZQiOsekFAIiFfqUEzLlmOp1HXSvPNAaqJxcUEgUTPwK+k78qjXGAFJ+/XKKrO7CKROPx8cnE4mieJ98jpg+R15s+hRtCQspFdjN7jLrrxDZvQShHA/nDv0axm9D/+l/icaj+9FweA+UG4N//pyUUsKGZs7lEFl3RWwrxARLonDUF0y87wDd1PApjLFROswymExNEKKDI7w0joSQEgx8nHz+n2CMQf+pd6L2jRdw/lR5Zl0pAAgxyvO8oojMnXGBParElhwBAL0HDYXQCsmkD0NCdYSM6JhrUhBr95sQoLWQrocxf7cB1voQrocRf7UC548fSs2xRtTt/YUNLjTqEBgN4HRnBmf1YQRgu3RAUOQDQE5eAZTSoJCpTCIlwGytTCctABa0qWin1xLRbgghYcMAfSfNAQGYlovILboJuaNvAa2F9uI4/+G7tul8g9RSjohgpNPN4aJFi/Dyyy8bpqJjMlTrqvJqrf/VWru4d98BQa9+Az0/GSAITUQSAalkqmhFEGLHYAkRFQVG/5jKRCRoTSoJWAtak9IhFcILDTTJVgEhGkg2iUuRSe9mIKRoBXEUwAbf9z/skhdKqY1aa8qsPkYC1N33QD3+5KUkTHUF85XWDY7jTBRdFbHCwsLc5ubmyToWg0n69wD4m0SiTQIQ1w8dinvvvRdTbp8SMQ8IQwMpBRzHgZQS1hJhGMBaC6VUCkxC4OTJk3hxxw6Ulx8BALieh1G3TcD0e++GdB0EbQkorSmlzGwtMz0KkWhpxX8+9/Ow9sPTrtL6XdFdAwfAcV13E8kHgiCIDRo0SCxfvhwPPvgg8vPzu0xt1toUV7oQYwxeeeUVrF27FuXl5YAQGDttEv5idSmGjRuL5sbzUS5kVkEEaIic63JxpvwYnlz4ACGEkN1wYFosFqv0ff8bQRDEH330UXHkyBGsWLEC+fn5MMbA930AQDKZxAs7dmD+gvkYMXIk+vXrhyFDhmBGcTHWrVuHs2frAAC+7yMMQyilsHjxYrzzzjvYuHEj+uTm4njZO9i06CHs274TjqshlYRSCkorKKUgtYJ0FGxoUHPiFK2lFUCiU/w7jnNPLBZLAuDQoUOD119/nWkJgoDWWoZhSJI8fPgwb5s0qVu8Drl+CHfu3EmSDMOw3XySPHbsGKfPmJ7hxi1zZnJayQJOWTiPUxbPD6Yunh9Mib7xX50ROK4bSCmptX7uM8a7rvsPsViMAOysWbNMTU1NO8NJ0hhDkjx48CDz8vIIgHkF+ZzzwF9z6dYN/Pau5/jNHZu5cOUyDhk1IuPI008/nXGCJK21DIKAJOn7PpcuXdojAgshKKX8VWFhYa7ocGhZIaXcmEgkzH333Se3b98utNYIwxBa60zlBYDGxkZMuOUW/G91NUaOvwmLfrAaA0YXQRLwHAfGGsACbRcv4pc/egqH/v0/AAEcKDuAqVOnwhgDpVSGMyLqndavX49Vq1bR9TwBoFlI+QxgBSAjB2wLLA4lk8m32kXe87zH4vE4AQSlpaU2HaF0tLMhRJKrVq8mAA4sGsYf7HuNZb8/w6O1Z7hp72tc+uxGrnplOzeV7+GP39vDn504wPGzv0wAnD5jRqd6s3dj27ZtBBA6jmMcx1n/B69vXNddGMEmWLZsmc3GasdFSLKlpYXDhg0jAC754Wr+quYE6adg8ds9ewiAjufyy4vn88n/fos/eX8fV7/6AmM5cUopeeTIkXZQzBbf90mSzzzzDKPTIB3HWRcZ7UUBz7TaUmt9qxDixUQiYZcsWaI2b94sjDGQUmb1OZfSIwAc/+A4qqqq0KcgH2OnTsLvG88hoVLQevfw4RQcCJT94jUc2PUqpFIYMHI4bvjSOFhrUXbgQDt92eI4DoIgwCOPPIL169fLIAhCACsdx7kPQDLiQaZTlUqpX/u+nzNz5ky89NJLXRqfLXV1ZyGEQMHggeiV2xst0qL0R9/F7FmzsXrNGgghYElIKfH+3gOwQQjteOhfNBQAUFNT022LnHbi8ccfR2lpqQqCwAohnvc8b2RkfCb9S5L1Qgg0NTWhoaEBSqkMUbs8BUmZOtSYENYa5MTi+Li6Gnv37U2RPSIkSWjXiZazMGGYmd+dkMzMr6+vZ2Rnk5Qy0fGgI6WUX1NK1Rw9elQuWLDAtrW1pSLYyfamd2XYsKGQUuKTqho0NzTBT7Rh6l1z0atPLpKJBGgtAt8HSUxZOA9SSgSJBGpOnAIAjLrhhm6NN8ZAa41ly5Zx165d1Fpba+3itra22ij6GeNkIpGoJrnQdd3koUOHxMKFC20YhlE/YzuN/I1jbsSYG29EW0sryt/aB+1o5A3sh4c2/xAjxo1FTp/e6Df8epT88z9i3B3FEFLizP98gDMVJ+B5HoqLizvdCZKw1kJrjTVr1nDLli3GdV0lhHjUGLO3q5Nauvtc4HmeAWDnzp1rWltb26XNjml08+bNBMDc6/L4+K5nuaXyADcd3cMfH/4Nn3jr37ju4Ot8qmI/f/L+fm783Rsc8cWxBMDFJSXtillajDGZLLdy5UoLIHBdl1rr7/TkGjRdhe/2PC8EwGnTppna2trPOJHO4clkkpMnTyYA9h00gH+/bQOfqtjLpz8s45ZT/8WfVR7kT4+/zTWvvsjRE8cTAPPz8/nRRx99pg6k9YdhyIcffthGRZVKqScu5w43vRN3ep7XCoBFRUXB22+/nTE8HbX04tXV1bz55pszd55fLJ7Cu1c9xvuf/C6XPPFtTrlrLnN69yIA9unTh3v27Gk33xiT0VlVVcXZs2eHAKznedRar7qCC+jUYK31FNd1qwDQcZxg7dq1Nr1oGIY0xmSMaGho4P3330+tdZe9y4zi4kzxShfI7F3dvXs3Bw0aFACg53kJx3G+fiXGt3MiHo8Pdl33jbRh06ZNC/fv398OSumqSZLl5eV84nvf47w77+Tk22/nV+64g4+VlvKNN9/MjEkmk+2wX1lZySVLlpiImPQ87wOt9e1XY/xnrhxd113ued6F9Km9pKQkLCsra9djdCRkR+nYMlRWVnL58uUmNzc3BEDXdem67raCgoI+fwzjsy+4ZOTEGM/zdmXDZObMmcHWrVvNyZMnLXsgdXV13L17tykpKQl69epl022x53mHPM+7owf3tVf3PgAAsVhsOoBvhWE4LwxDJ4Iaxo4da8aNG8fRo0ejf//+Ih6Pw/d9NDQ04PTp06yoqEBFRYVuamrKFETXdQ9Za38aBMGuKCjqWr6byez+w3Gcm+Lx+Pc9z3tPCBH09CbBcZxTsVhsaywWK+7hLfkf/ZVSZb0wAgByc3PHWGsnAhhPcjjJfGOMI6W0UsrzAKoBHAPw3uDBgytOnTqV7OTd7U8u8iqIpq4m4tfioTsbXh0ftrMfve2f4uH7c/lcLlP+D9DNMp/bD+oHAAAAAElFTkSuQmCC",
+    64: "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAT0ElEQVR42u1ae3RV1Zn/fftxzr3JTQJ5SHhoABEtgkGjIi2gBasOwQcVXVWxWm2ntnWqY0VbZ7q0OnQEXbZTq2gVOjKdKUZXy+pggbajrdRXqIKaiCJqQJ4xgbxv7jln72/+uOfcnIQEQkWcB3uts3LPyT5n7+/3vb9vA0fH0XF0HB1HdhAA8f+Z+P5+f2pDfgIEypDD0V8Re26Li4sLrbUjjDH7wmcyJhWizzv/a7iqBrNhx3FOUEo1SCk9rfVdg/y+iIH0iYrkXytBJrrJy8sbbq0dQ0THMLMLAFJKEJE1xnT7vv9lZp4XTu8AMB+A3wOQlIAU1tq0lLJRa93Q2traMtB6nyYA0XtcUFBQ4nneFdbaeSA6lUgURpMYAJjRc88Aw4bvU8/q2R9EPY+YGcx2D5hrlVJPjho16uktW7ZkPgkQDnWImEjfpLXeoR2XldYc0mwBBANcJpwzqHkEsNKalXZYKVXnOM7FsT3QpyEBEoDJy8sr933/3wA6l8EIfD8AQKWjx4misROIk6VgEmC2YGsAa8Pf2b998SQCQCInJ9bLILN3Dzq3b+b0vkYLAEprydZCAPcG1n6PmWUIIh8pAAQA67ruWGPMGhLiBON7vmWoMTPOp1Mu+wpU+YlozTgILMUYHS3DoUr0WZoifQjFPppjfHgdLWh962VsX7McbVs3WamUBbMSQjzs+/63QuMbHAkABACkUqni7nT6RZLyhMDz/MSQEj19wSIcf+5F2L69GY07myGYkWUp96g7U49NiDGMIupjPGRwaAsIkAoqmQ/20ti28mFsW/2vLJUOwFYT0beDIHjw49oEeSjcZ+anSYgpgef5qfKR+qIHn8LIsz6Pd+veQ3NjKxytASIQRcRJkBC5K/s/ASEkiETvubH/Z+dm4TDdaTCAsjPPgwBob/3LQkhpwXyu1vppY0xTuD/+pACQAIzW+moQ3Wat9Z1Uob7wx0+i9MSJ2PrOB9jb4sF1ZGjwbY9wEe0nbsTIPmfO0kiMXt6AAUGRpIRgMCNId2Do5LOR3r6FOra/a4VUjjXmOGb+5ccBQAxCReyoUaOSzHwPGGyCQE676W4Mm3Q6mnftRvO+DJQSyNq2UNx5ACNNFFEXMwEi5xF7sODebxOBiOB3deC4y26Gzi9SbI0logu11pNDFZCfBAASAO/Zs+cSErLC9z076tSpYvzsy5Fu+QjNLR6MsSC2YA7NXMh17kM/cR9JIAKJKBwQWS8QAsSMrMewNgoKsj7TS8M95liUnz0P1loLIcha+9WPE9McDIBo21dGEc2keddBKIXutI+OjgykFLCgLOMj2085m9/zIQqJpqxqUGT7aX/HIJwEVP4QqLxUFggpIRJ5EELBet04Ztol0Il8wUEABi6sqKhIhN7gkEFQBxF/U1JSUtDa1jbF+B4VlA4Tw0+dCr+7E53pACZgKEWwlvuHjnqLMYdRIRH1SEh8HjOk46K7cRu2/edjKBp/Go6ZcSm8tiY0rLgf6d0NgBBZAwoWIGIAx+3YsWMygJdDhprDCQC3tbUdTyTKmMGl4yeRO6QEfncnujNBzsZRjLgojN0fkN7/J6I+ThFgtlCJfGz/7TI0vrIaTbVrUPbZOWh76xV8tP53+xcVpDRgViCaEgJwWCVAALBENDbcpC06bqxkKWGMgecFsZi9r62jgxrlfkECwfgZlJ46E63vbsCQz5wBoV0UjKtE4ZiT4e3dDYCyahZ4CNIdEfiVf60NUAebYK0dBiEAgPOKy8A2gDEBfN/AsAVFyh+6tr56kH1i0VvZ40DF4kUiBN2dGHrqOZh8UhUokYTxM3BLR2DS7Uth0u1gyxDaRfeu9/HG4q8RswWITojlFweS6KjuYKO5By1NCSGGRjvMH1oK7SSg3SSE40JpF0InIJwEhHYgHBfCcUE6ewnHhXRcSJ2A0BqkFUT4nBwXpJ3se0pnL+1AKAfWBJCJFGABISRgLJgEKDUUIjUUMr8IbvkYqLwUwVoQ0bA777xTDARACHQ8AbOR26SDSEcgpbwHRHewtaZk9AkqUVwGGwTUnQl6jF+c8xRxmvtYOc6FwpEHyKpBbB7HvpVNh3vZkPh8ay0yjdtgAx9E5DOwBcx2v+BLAIIkG2u7iLmTiDYAWOb7fv3BYgcVonevlJKllPFUlqOQJ7qX4YXDdMlsOMV918QgnvW3RwJYSslaa5ZSdruue93BJEAAsMlk8izf958kojKAJAOtABcASGRVJGsUTZAt7OTlp3JM4FASsvdigBCjl9MBEcHzPHiZDABAO26O+wxGqngoACDT1QWlVeQSQUSWctyPeyWGtRZsmdNt7bDMVimlmRlKqVmDspwlJSUFAAocx/FaWlqu9H3/+0RUwswIgoAAYPbs2bj++utRVVUFIUSPgeNwA30MZOQKhRAQQvTS187OTqxatQrLli1DfX09AMB1XQRBgNGVEzDnpr9F+Ynj0NnWDinDfAGAIIoHFWCmrM8IAezu6MTqh5Zh4+/+aLTW0lpbOxgAdFi3K1RKPQDgOiklZUIOXXrppViwYAGmTJly2EtPnuehpqYGixcvxptvvpkTy2RRIf7mxuswbf48+J6PwPMgpQJgwyyCe3IIjuIUwEk48LrSuG/uV9C0fSdLJS0NooFhXNedGQTBMillRRAEbK3FWWedRQsXLsTMmTNzRomZIYTIcV2prJetq6vD888/j/r6ejQ1NUEpjZEjR6CqqgozZszA8OHDAQBBEEBKud/7mUwGS5YswcKFC8P3FYIgwKTPfw6X3XkrUiXFSHd0gsI8IkqmmChXfGQwhJRwE0nc/8VrsWPze1BaMR3EZ1ql1N8DuF9KKTKZTJBMJtXdd9+NW265BUIIGGNyohwPcIgIzz33HBYtWoTn/vgcvIzX70KlpaX40pe+hNtuuw3HHnssjDGQUvZSn+h+27ZtWLBgAWpqaqC0RuD7KDtuJK6+9/s4tnIC/IwHIai3aROhPWCG9QP81+P/gd//bLkVUgCMdwcyfgQAWuuHlFLsuq4BYE477TR+7bXXmJnZWstBEHB8WGtzz2+66ab+rTuJ/aw7AC4tLeUVK1YwM/f7Xd/3c/ePPfYY5+fnc5gQsJtM8vFVp/CYygk8pvJkHlN5sh0zeaIdc+pEO3ryyXZ05cl2dOUEWzx8mA1dux96hC/3S/yECRMcpdRTWmt2HMcHYK+55hru6upiZu61mfgmgyBg3/f5kksuYQDsuC4D4OLhw/ic+fP42vvv5JuX/5S//fOf8FX/9F0+Y8657CTcbAVBSgbADz/8cL8gMDMbY3LP//Lqqzx+/PjsOtoZvHtVkoUQrLW+byDOO0qpZ7TWrJTyAPAPf/jD3Cb621j8+Q033MAAOJFMMgA+76vz+d6XfssPbX6Zf/LWn/lHb/yRf/zmn/inb7/AD21+if/hN0/wSVNPZwDsJrKArVmz5oBrRQxobGzkc845J7eeUoqVUlYptVcqlZFKpZXWaaVVWmndJaVsFEL8wXGceT0KEtP5qqoq+cYbb6wkotnWWt9aq5cuXYprr70Wxphe7i0+Ir1du3YtLrjgAriuCz8IMP+e7+GMeRfCa2tHZ3cabsJFMunCWgMvnUHgGeQXFUIIwvLb78b6Vb+HkBKjRo5EXV0dUqlUr5yhvzU9z8NVV12Fp59+Go7j2CAISGu90HGcH3ueVyCECGJ9jI5Yp0kAsPHGpG1qaqoRQlxsrfUB6JqaGlxxxRXwfR9KqX43EvfrV199NXbu3IkgCFD9zesw86tXY6IqxPmjP4NxJcPw+tt1eOeV17Bv5x6khhShsLQYXW3tAIDK82Zg0/OvoO2jZrS0tKCsrAxTp07NAd9PjpIzkJdffjnef/99bNiwAVprDoLgs0EQrPd9/+UgCNqiK5PJdMear7ZXyKu1fsRxHNZae0II/tWvfsXMzJ7n8YFGJKa1tbVM2QIFDx87mhetX8srNq3P6m5gmJn5Z48+mtPFIcNK+ap7buMH65/ne19YxQ9uep7/btmPWEjBRMSTJk3i0OUecH1jDBuT/f78+fMZgHUcxwohAtd1Z8ZiGeov8hUAAqXUdwB8HYDv+75+4oknMHfuXPi+D631oPL6tWvX5n6feeF5cAtSEGGyxCEDUwUFICHgJhJo2dOEf//+Yrz++z8hf+gQdLa04/jTK3HchBPBzNi0aRM2b94MIoK19kDZam7O8uXLcdFFF5HneayUkr7vP+U4zglhINdvkUI4jjMHwH1EZDzPU4sXL8b8+fMHRXxcP+vq6nLh6OjJJ0MYi4aufdi4/QN0dXRiw8aNuOsHP8jqbxBAaQ0iwtpHlyPwPIAAJ5mHsaedkguK3n777VyQNZg9MDNWrFiBM888U3ieZ6SUxcaYlUVFRUMGKpwKa+0vQ2MivvGNb9CCBQsGTXx88b1792YNTcJF/tAiGM9DXkEB7l22BOPHj8fUqVOx+Z13IEJuRZFj8/adaGtsgtIaYKDomNLct5ubmwdf3Q3tRDKZxOrVq1FRUSGDIPCJaEJHR8ft8RpAXxXYxcxERNzQ0ADP83Lh7CGVl6PozXK2nE0EQYRkMondu3fDGAOlVE+kGIInpITUMpv7E8MEwX5EDXZE325oaEBnZ2eODiLaOeC+iWiuMWaf1ppWr15tr7/+esiw7jcYECLxLB82LJvAZDLYt3MPtKPR3dWJ46sqkUzlg62NtccIUmfBqDhlAorKyxD4PgiMjxo+zH17xIgRA7rBgdzi1q1bMWfOHDQ1NQVEpJn5N77v/zSyd/sB4Pt+vZTyKmMMua5rf/GLX/Ctt94KpdSgQQCAqqqqXJa/6c+1kErB6+pC8ajhuOiWr8MYA9/zYI3JFlW7M8gfUoSLv/NNGN9CKY3OljZs+cvr2fJbfj4mTZo0KAAi4puamlBdXY1du3YZrbWy1tYNHTp0fqwk1m/nRxtj3pFS7rPWVjuOY9atWyeYGbNmzcolOwfaBBGhtLQUjzzyCKy1+OjDHTj1vHOQN6QQ6Y4OHH96JYaPrcDenXvgdaWRSOXjM587E1f/8z+ifNwYdLa2YsgxJXhl5Rq8vHI1iAjTp0/HjTfeiGwDSByU+JaWFlxwwQXYuHGjcRxHGmP2aK2/0N7evudAvcPokIGy1r4khNDW2nMcxwmeffZZYa3FrFmzwtI39wsCEcEYg5KSEtTV1aG+vh5+JoO9O3djysUXwPgBMp1dGF05AVMuPh+nz/kCZlz5RXz2souQV1iAztZ2pIqL0PzhDjyx4G4Yz4e1Fg888ABOOumkAQOhyFMopdDU1ITZs2ejtrbWOo4jgyBod133/O7u7voYjQfsDlsAipn/oJRKWWunaa2DZ599lpqbm6m6ujpH6IG4UVlZiccffxxEhJ1bPkB7815UzpwO5TroaG1DEBgkC/KhHI3uzk6wZRSUFKN523b87Ft3YN/O3QiMwaxZs7Bw4UIwcy4VHoj4hoYGnH/++diwYYMJie8QQlR7nvdyGOSZwbbHOZSEtUSUsNbOcBzHvvTSS/T666/T7NmzkUwmEQTBfiBEgUhZWRnKy8uxcuVKuK6L9zfWY8v6jSirGInSUSOQKExBKg3luHDzkvC6M1j/m7V44vZ7sG/HLhhrMWzYMKxatQpFRUX96n+8WPLCCy+guroaW7ZsiYhvE0JUB0Gw7q89PRIdaIRS6h+EEOy6rgVgJk6cyBs2bNgv/OwvLL7vvvt6VWalEDx28kT+/Jcv47kLvskX3vw1njp3Nh9TMYoBsApT4fLycn711VdzawyUBTIzL1myhN1suu07jsNCiF3JZPKMwTZ8BnPwEVrrr0gpvWih/Px8fuihh3ptqG+sHoHw61//misqKgadp5977rn83nvv9ZsGxwFvbGzMxfxKKV9rzUKI113XHXc4iN+vL5BIJKZJKd93HIellD4AW11dzW+99daAQEQE7N27lxctWsSVlZXxY3S5K5VK8cxZs7impqbfekO8AMLM/OSTT/Lo0aMZQOC6bpT/1xQXFxce4pGfQwMhlUqVKaVqtNY5sUulUnzHHXdwY2Njr81HGVx849ZafvPNN/mpp57iBx98kB999FF+5plnuKGhodccY0yu/BUHtLa2lqurq6PWlu+6Lksp00qpmw/hrMPHOg6LSCWUUrtd12UisgCCESNG8F133cVbt27dTxU8z+NMJnPAlDYIAs5kMuz7/n56/+KLL/KVV17JSikb6XrY2VmXl5c3+XAfmjyYXRBhsjFSKfW4Uso6jpNrOA4ZMsRec801vHr1am5vbx+wlOV5HnueN2C568MPP+SlS5fyzJkzmYgMAD/W0tqllLqROVfNVoeDsEM+KRoCMcX3/e8CuERKibBRYgCgoqJCTJs2jaZPn47KykpUVFSguLgYruv2+lh7ezv27NmDLVu2YP369Vi3bh1qa2tta2urBSCUUiIsvTcDeMx13X/p6uraHS/bH2kAejVMYkDcAGCulLLIWgvf9xHrwVNhYSGVlJSgqKiIXNeFMQbpdBr79u3j5uZmzmQyHAOYHMeJ/P27RPSE1vrn6XR6Z18mfNpDxA1PqBo3KKXWKKX2ua7LkaU+kPsLS9Qc0+8PpJQ/dxwnOvwUlz76JHT7cABBca7k5+cP832/ipnPDI+vjCaiYiLKDw85M4CAmduYeTcRbQawAUBteXn5G9u3b0/38UQGH/NQ9JEYUQDVrzsaN26cG5amigEUFxcXF5599tnqALZGHinr/kl6jagQaQYTfseOsfCR5Nqnvdb/eNE+Oo6Oo+P/7vhv2S1zwPEun2YAAAAASUVORK5CYII=",
+    128: "iVBORw0KGgoAAAANSUhEUgAAAIAAAACACAYAAADDPmHLAAAxaUlEQVR42u19d5xV1bX/d5dz+1RmQIogRcpIk2IsKIiK0SAhPtEYxUSMmjw1xveiUfIMkhh8vhiT/MxTf8ESbDG2aLAhdkUxKoqoIIICUqfAlHvnlnP2Xu+PU+65d+4M01Awsz+fk+DcU/bZ67v62usAPaNn9Iye0TN6Rs/oGT2jZ/SMntEzekbP6Bk9o2f0jJ7RM77mg/2LvCd33pUA6B6y/2sBnBcAQ89whvgXeEeKxWKjtNZV0Wg0kMlk6nrI/i/C+WPHjo0Gg8H7pZSWEIKklJlQKHSrA/weSXAAEFEAkL5D7OVwzwsC4IFA4H+FECSEUL6DQqHQlc55obz7t/foAdA+JLrsqGpijIGxXHuWcw4p5R4hhOUSXghhcc6tQCCwOv/8Lgx3vgekQS33MytdAbAYYxg8eHBJbW3tcMuyRgIYbFlWRTAY7KOUklprj8hCCDjWvam1TmmtFWNMKaWilmUV5YGJM8aY1noI5/xPACyfd5CDKSGEkFIajDGDiEzTNJOBQKBRa72Nc/6ZlPLTxsbGTURk5a2nKnC/HjewDcLDdc3Ky8v7p1KpU03TPBXAkQAOAgCi1tezrd86IkE6cW6KMfYJ5/xVzvmT/fr1e2XDhg1pn3GtDwQgsK/wuRyAYowhFosdlclkfqS1nqW1LvUtNLW1kO0gflsSzuoCMDgR8TwVtN4wjPvD4fAddXV1231AUD0AaMn1GgBKSkomptPpBUqp01xiEpFyFp7nzs+W1DkkJ/8/WGFhDgL5fs59bdr7svhOZcyZAXkXuwDljnoBY6yWc/6/xcXFN9XU1MT3dxB82QCQAKwRI0YUbd68+VdKqUuJSOYtJHPYyuNA0hpaqdY53k/c1riW/G/LCvzowwMrdJ0zH8adeZE9H2dOjDFNRNqVOoyxdcFg8CeJRGK58160P6oE9mUTv6io6BupVOpuIhrlI7xwics4BxFBWVaOyJChMJgwAM5B2l5LTQRoZROBbM4kjzDaoY1u43VZLpMzV+zbBGZgDv0JWlktAMgZwKSRfX4WMoqIJGMMhmFcl06nFxLR3sTO1xoAEoAVCoXmKqUWE1HQ0cHSI7zg0KZlExVASd+D0W/MJPQZMwnBg4YihShMSHDOYTMagUiDtAZpAnMJD/dvGiDywJJVD1lVwtzXZ9zhcAcAjNnXOqcTEWBmoFLNSO2uRmLbp4h//hEaN6+FmUrYyl5K5/4efbXzbtwwjCVXX331DxcuXKj2NxB8GQAQAFQkEpmfyWR+4/xNuVzPGAdBQ1kKwjAw+LhTMPyk0zFg/CToSDFqalOor09AK+UjclbSk8OxzJPULG+FmUdutGIDsBYL4dgNns3hSAouwIUNFjLTSNVsx+73X8LO1/+Bpm0bHSAYAGm/oWoyxgwp5RNXX331GQsXLqT9yUPY1wCQjDErEAj8Win1Xw7hHT1PABewMhkAwKEnfhvjz/l3VIwaAwbCjq212LWjAUoBQgownqtGW9gD5HCus7bkephErb8q80kBByo+CCBr72UBw8ieA3EJbgQgAkFQshG1bz6NTUvvQHLPrkLSwCQiQ0p5r2ma5zl2j7U/AEB8CWL/P5VS1zuckI2YOcQv7T8YJy74E8affzki5ZVINzXi88+qUVuTBJcC0uBeuMDldlfXuy4YgfuMP5ZzUAHCe2K+Bd9zkHeNfQ55xp99MHBbZTCAtAWdTkEzgeLhE1F5xAyYe2rQ9MV6cO6fE4QTqDo8GAwqy7JedtZHf10BIACoWCx2RiaTuYOILMaYBMCICIxzWKaJodNm4uTfLkHZ8LHIxOuRTqWxeUsj4nETgYAEGOWJcYejGfmEPmtVsLUVJyjo4/s0hf/anHNZnjfh/GalmsHDMRx09LcghUTdR2/mgIAxxgEorfWJ0Wj05Uwm87mzTvR1AwAHoIuKikak0+mnHWuYOcETj/gTzr4I0375/6DAoVIJKOLYvGk3kikLRoA7y8LzpLhrzDlc2sF4vpszYIyBiLL4opaeYEcjhYxzMK2gMhn0mjAVgUgJat9/xVFd7m0YiIgppY7r1avXXc3NzebXTQIwAHzOnDn8o48/ekprGswYs908EBgXNvHP/XdM+dkiJBsbAG0BQmDLpjokkxYMQ8CL3Lic73Gd83diDhjaIAzZ+jpr6TsAIOc3b8Y6R2uwAvYCy4kvtG5TMGZzvNkcR/mYY8AZsyWBEDbgbCRZRNTLsqyQUmrZVy0FxL4Q/Z9//vlPlVLzwGAxJzDCHc4fPftcHHvV/6C5oR4ggpAc27Y1orEhBSm5zxDzETpnfVyrn7XThPW5d4V4nFEBDLOCp9jPpDbtZ1vCcJipBMrGTEF620Y0bf00HwRaa31ENBp9OJPJ1PoCRQc0ADgAqqysPKi5ufkREALMo5ZN/EGTj8OM3/wZ6eZmkNaQhsCePSns3NkIKXnesvqtepd2vHCYtrXIX865rBUZzwqAwOf6ucTnru2x94e7YFOkUTbqCNS+tQxWsgmcC/dCTUSGUqqUiB77KgHAu1n8U0NDw3ytdYkX2mUMWilEyypxwn/9AcoJ63LBkTEVdu5sgOCs+z1VzgDOQMz5dyuh4lzpkMv1rJMkIbLVlsqkIEorMej0S/ONSuGoxrOKiopG+NzjAxYAHIAqLy8foLWe56DZky5aKxz146sRGzAYZrIZjAOCc+yqbkImo8C4jzuJ5XK6+9/Uuam2IC7LNQZtVcPBIBxsMDBiXQ+eEMCZgBmvR68jT0Xp8IlQygJso5CBkSbSRjqdvmQfMONXAgAkEokLiSjqINoT/f3GHoERM7+HZMNuMCHAOUNzysTuPc0QgjuxdGWHcYmyRzdLRUYAp7ZfgzHmBPldc8D57xzbgLWpebJpQidczRkOPnWe7X04xSwMTACAUursYcOGFSNbnHJAAkBVVVUFtNbnuD6vTUT7ZSeddxkghBOftw3C3XsSIOVY+K3EQ1yB4A/2+Y+2CM2okLpnWYIWUjv+G3vBHy8GmHPki3z30MgezAkfW8kEig87EiVDx9shbc7dBygiqti6des3v4TA3D4DgABAmzdvPgbAUEe3ccY5lGXhoJHjcPCRU5GON4FxW8yalkZjQwqcu9Z8VuQXIrD3t45YI4yB+8Q/Y6wle7GOqhM4CSaVE+/PGVqDtLIPpUBKA8oCcYnex8zyGaLe/5BlWWeh9TDEfg8ABgCWZc0if/7VWfyRp54JHorYGTrYgaCmpjQyacsW/3AzuYXDtoXo5XJbm5RiucGfggYey5UErUmWbPAI4OEIZKwEPBD2JJwrqTRp8GAYRrQURrgIIlwEEYnBiJQAXKLiqG8hXN4XyjJdJ0fY4QqaNmjQoFJPdX6JozuKQhURsWAwONXxczkAKNNEIBzFwKOmIZNMggnu6EZCU1M6xxp3I3NdMu4KWeJ557emNtpUJ77nyFAIDev+iVT1VsQGjkJ40ChYqWZHtxNEOILmz9Zg1+v/gIo32PelLHy5NGzpwTykMcZIE1F5TU3NNwAscw3qAwUAHICuqKjop7UemQ2IcZBlofeIsSjuOwjJVBKM2wEvpQjJVMax/LMrtDcQdLX403bNWLvZKwdgRJDhKDY/8gdsfvpu+8WFgUPPvRqVx30HVjwOIxJDfMN7+PDmS6Ayqba9Uy78z9Faa26a5nQHAOxAUgEMAFKp1EgAYUf/M5e7Dxo9ATwQyop/xmBaFkxT5+jnjsTcuyQZCqiOvQKLCCIUQfPmj7H56bshhIAMBqGVic1/vw2qaQ8gJbiU2Lb8QahMCkYoDGkEIA0DwjAgpISQEtIwHEZouYZa6yOduesDDgBa61GOXtYAnCocoGL4aFhagcCgNdkGYEZDK91lYrdGuL3aB+2UJr4iVTAukKmvsV9YSJDSEELATMVhNcfBpARpDZWMg3Hb2yGyXVpop67Aq05iLYWCvRYjKyoqYg4A2IECADi+7Agfw0ArC5xzlPQbBGWatnHlLGgqY0IjuyjtJVwLQ64bANQeoDDGoDIpxAaPRri0ElYmDW1ZUEqhdNg4hCoHQJtpQAj0nnwSSKvsOZYFpexDK5Xzb9+zbd+CqLK5uXlI18KfX34ugAEgzvlFWuuRjDENxjgphWCsGOO+dzFYKOwEPxg4Z2hoSiORSEMI1m5uzLfG84mfLRNrn2HY4Y0gWkHEilEyZBxS1V+AMYbyMUdjyNyrwQIRG0zKQtHgw2AIiczunRCBIIxwDDIUgQxGIUJRyFAERjgGzjm0ZfrnoQFwIcSLlmV9jOzGkv3eCNT2fi5dmeMqAwgVlcKIFoEsE4w0iDEQMVhK2WWzAMhJruTH3L1y8A4Zfm78jbcgdpd3DzEGlWpGdNg4jLnqz7BSjRDRUijLhDJT4EyAEWBZJvp/58foN+N70GbSngvBUwekNYxoCXa/sxwf3XGtUzqWDQr4JemB4AUwW90TNwKBcgULyHqBCMaKYBhBpC3TKdV2a/x9hZ1tEL7j27XIx0xZKVqI+G3dv7XfGOPQ6WZoxsCMCMxkwvs7OSXkjAhmvBFMSCBYnFM5wJz6BISiCB50iP2MliAdciABwJ284JxHmFc75/rMETvvaVkAY9DQUCBb/2mVUxJJeaGeVrMAbaXi3WLNnNKe1quGqIAt4Rl+gFdvQC6B/HJGKbtUAcw28gBon+uuyMwBHneCTowIKp2EjBRDBELQmRSYEHC5g4gOnjNnjnj44YdZF9RzoV0vrVYhdxkA48aNi3788cdRy7LsYgdnQUMlZYj2qgQ1Ndp5AABCSATjDEbGgCGFRzebG9BKcQY8TiEvKu/bBuYSx1tw5ZOqThGnP9IHt5wkiyaWJymcqrPcimGvts+JXLrJBn/VkSeDCszXfT1pgFf0h4wUI51O5lyptS5+5JFHVGcCQe1QmwU3rHYZADt37gwQUYi7tW/aFqENX3yGFX/4JVLJpJdNY4yhKZ5CKmXZgSBHPzIwHwGze/k84hRw39w9Arm7uPLu4ePn3EVyYgLwqyJqKR+8HUeUE0a2S8ZVnidjF694rp9zd3JEP5GGJtsYJiKoVNxOCjmbRxzjdrQQ4il3+3tBt41z+H8XQoBzTpxzJoSwMplMnWmaGSmlFkJ8JoRY3bdv37c2bNjQ6AOC6mQ6pKUNAKCSc76RMVaErMSEtlRPO662/G/G/AWjHeL0tmIghe0XtlUIsaSysvLmrVu37vaDoLsAsIExVgyAnJo3213jLesdKYfBvoTkl68WkPlsjL3l3SjHMtlb7VnufVs3YH1l7lq1doLuotinArEeTkTgnG8KBoMXJBKJF10QdBkARUVFvZqbm7fA7stjJ2LzVqAQMttL/Las9cJ49OM697nUTsS3xWFdDkd3Y9i7LalQABRKay2FECoajc5paGj4OwDR1VlwIqJgMPi0UuqbhYItHQm++CcthLCjcG1tC2/B6NTh4CZRy13brT3OnZPWul1RSyJCW/q824Vdnq3Apchxu2FnbjljLBUOhyfG4/F1XQYAAIpGo70zmcxdRDRFCBEjIu6PpTs5gjiA4raIzhjzjBylVM7L7A0wzLdbpxDY2gciBp973uI+lm/LumEYrQIhCwCNWGkZwIFUIgEupG38OtFMzjkY497cXTeaOVvPWpS+U5768m2HJ2XnH7TWIEsj1dzszU0aBkhrV1JYRCSFEK/Mnz9/OutOMVRRUXFQeXl5SSqV4qlUimcyGQagkTF2UHNz8zWmac7y5yD80oFzDsvK7sGfNGkS5s6di2nTpsEwjBZBorZi+awTO4ay4GkZenafs3btWtxzzz145plnkEwmPSD4OZ1lqQnSGoPHVuFbP7kA/UYdinh9HEorCEN678w5zyE0OQYiZ7kxDHLiCa7vkuO4kPYlnDRIaTQ3xbFp1Rq8eO/fUPvFdkjDyLrTRJoxxgOBwEzWzdKnBUWi0eiJ6XT6t0Q0Pl8NE5GdVTPtHVKBQACzZ8/Gj370Ixx//PH7rQW/fv163H333ViyZAl27NjhzN2AUroFsCzLQqQohhPO/y6mn382RCiERGMjmKNO8t3T/O3vufrWF3934xmO1GKuqeqUwzEpEAyH0LSrDosvuwYb3nkfgUDABaoiIs45X9rdWSfuxBYylZWVBzU0NPyP1nqur1SM+wmvlILWGuFwGOeeey4uu+wyjBkzJkfk8k64SjmVxXkqprWEUvvtBbit6VBbW4slS5bglltuwebNmz0Q+9UX4wzKsu2Yg0cdin+75icYMvlwNDU0OgWy+dFKlo1zsL00FSGGthwOrRSipSWo27INN825AOlEs9Ngg0hrzTjnNd2+MwiACofDpyUSice11scC0IwxcpMEruhzuf68887DPffcg3nz5qFPnz6e0eeJxzyitXa4Ypgx5gZHIIRocbj3dSJvWYOpHc9yz3NtlFgshqOPPho/+MEPUFJSgg8++ABNTU3eHMhpW8M4h5QCe3bV4J//WAZtWRhx1ERwacDKmF6RSA44s+yc3cvIfOFtxgrsZ8wejDN7800qhfJ+fbHlg4+wfcPntj1AxBwwR7sLABKAmjp1qty5c+f/WJZ1CxGVwI74C8c19MS91hozZszAvffei8suuwyVlZUe17hEau9wr/MTsbm5GZs2bcKaNWvw3nvv4f3338e6deuwfft2JBIJCCEQjUZzrlFKtVsyuGAgIiilEIlEcOyxx+Kcc85BJpPBqlWrYJompJSeW0FEEFKCiPDpP9/HpnfX4NDJY1Hctw8yzUlwtzI6pxRtL1qX5cqMQjEH0oRAOIRPVvwTX3z8ieMZ6OwO6W4ivlVcXDwslUrdrZSa4nA93F567qJaloUhQ4Zg0aJFOOusszwCugvakeFyu3vvDRs24JlnnsHzzz+P1atXY8eOHcg43UfyiVdeXo4RI0bguOOOwymnnIIpU6Z4z1dKeSK+I6pBKeUR/J133sH8+fOxfPlyz1B039NWC/aGmaLyUnx3wc8w7uTpiNc32PfiHdgm6K9+LnAJaQ0wjlAohN/OmYftn2z0PAJHyjZ3NRDEHZE/yzTNO4moAnarV+nX9S4hLrvsMixcuBBlZWU54rejw0+kZ599Frfffjuee+45zzL3S5L8bF++iwkAhx9+OC688ELMnTsXsVjMsx06Ojf3/u7c7rrrLlxzzTWorq723Eb/ulimCQLwrUvmYcaPv490KgMznfZK1akd8Xq32rllHo1BGgEU9SrD07//M5b+4XZIQ7rlelprzaSUb7MuEB+MMQqHw9dkMplFWmtwzpU/jckYg2maGDFiBG699VZMnz6901zmcr1LlLfffhvXXnstli1b5gHJMIwCRmCOv+TMKyv6tdaePTJs2DBcc801mDdvXpfn6c5py5YtuPzyy/H444+DMQYpZQuX0bIsHD5jGr73q58jXF4KS1lw6yoYUYHGV3nxBubrXekkuqAIjbuq8co9j+DFJQ9mbRJ7fRQAEQgErmKdNPb0ggUL+A033PBnpdQFrsh3Y86uricinH/++bj55ptRWloKy7K8aFpnia+UwnXXXYcbb7wRpmkiEAh4v7sxArenD8tJMlK25ZuTkXN/dMHgSqoZM2bg1ltvxdChQ2FZVlaXd3D4r73ttttw1VVXIR6PIxgM5gSVuBAwMxkMHDUcQyaNRSaV9uoHvNgEOVsJGPNtpnUBYGcctbbrLaA0Guv2YPMHHyHR0AQhhT//oh3pVtOnT5/DOvpOAgD69OkTDQQCzzgt2E0ppZZSkhCCAoEAAaDi4mK65557yB2WZVFnh3vtzp076fjjjycAZBgGBYNBcp8rhCAjYJA0pH9/ZqsHZ9w+33+9c0/YfQ5o2bJlRHar8E7PXSnlzX/16tU0fvx4AkDBYNB7rvvs9sy7o4c0JHHOSQhBTto4wzmnSCRyQUezgQKA6t27d5/6+vqlWuvJjpXv6XspJdLpNMaNG4f77rsPo0ePhlKqhS7ujL7ftGkTTjnlFKxbtw7hcBiWZeWIWqUsaKc6p7iiHANGDMNBQw9B2UG9EYpGoC2FxvoG1Gz+Ajs+/Qw7Pv3c40LHNfIkgvseUkrcd999OOuss7okCfzSoKmpCRdffDH++te/elFEf5fUNjOJeUZBm9HtlnEQ7fRhNgKBwF9SqdT5HUkGSQBWZWXlsMbGxqdN0zyUc+51+nTFrmmamDNnDu68804UFRV1edFcsb99+3ZMmzYNn376KUKhUE7I2I22SSEx7qSpmPCtEzFozCgUVZTZGzEcXeqWd0FrZJLNqN28DauXv4w3Hn0Ku3dU2y6hyLpIrn2gtcZjjz2G2bNnd9omKGS8Llq0CL/4xS+8eIXfS+hsFrJAStipSSEQkXBa196WTqcvdbuxs/YSPxAIHKq1fp6IBrqWvj8ur5TCL37xC1x//fVdMqDyLWrTNDFt2jS89dZbObrTJpCC1oSx047BqZf9EANHj4TWGqlkCpZpOjo0V9DZ/Z45AqEgApEAGqtr8ep9j+G5Ox+AmUrDCARsPepJFoVgMIjXXnsNEydOzDFEu/JeQgg8+uij+P73v49EItHCVcwnfItcQxu5j0L7IjnnG6SU16VSqfuR2x5578QPBoPDlFIvABgIX49fN4HDGMPixYsxb968Lov8fG657LLL8Kc//QmhUMiz1j2uDxg44+qf4LhzzoCpLKSbEk4tqO0f8xZtv+EryLAbSotgALGSGD5b9SHuufp67NjweQsQmKaJQw89FKtWrUIkEul0KLmQSli5ciVOP/107NixA4FAwFvPPEIS5zwJIJKjMhhrqz4gDmAnY2yVlPKJ4cOHP/HBBx8kkNe5nO1N5xcXFw9LJpMvOJzv9fh1FyYSieBvf/sbZs6c2WWRn0/8F198ESeccEJOfN0lfqy0BBf+8TcYNeVINNbtsZtM82xRiN0slnnvmlNn7LSbcUuztdaIFBch2dCIO664FutXvgsjYEA7yR3XJvjpT3+K3//+912Wbvkg+PTTTzFr1iysW7fOA4FfEwJgkUhkQa9eve5tbGwsMl1OaGU46rd+4MCBdatWrTJ9QGrx7QLWFvEHDBgwrLq6+gWtdQ7x3eBORUUFHn/8cRxzzDEwTdPzw7syXIRbloXJkydjzZo1OeJRa41gLILLF/8BgyeMQ31NLdKkIRiD5BwZZRecBqQEKZUDCLeKmHux9ywQtKUQCIdAysItF/wUn733oRe88WftVq1ahcMOO6xTgaK2QLBr1y7MnDkT77zzTj4IiIiIMZYsKiqa1dDQ8GJnPDe0UhrOWvPzo9Fob6XUCsuyhjHGLCKSfuL369cPzz77LMaMGdNtnO9fkCVLluAHP/hBbnaNMSjLwoU3/xqTZ52C3buqAc5xeO+DMaJXH0SkgbpUM96r3oLPm3ajtLTYfhmdbfllpjPIJFOO1S1zda7WCERCaKqpw01nXYzGut3gwv4+gSsF5syZg4ceeqjbpIBf4tXX12PmzJlYsWJFjjpwPErGGEsZhnFKOp1+GUAAbTecpnZmFFpm9CorK6ONjY2vKqUOL0T8AQMG4LnnnsOoUaO6lfh+I+mII47Ae++9l+V+J35+zHe+he//9jrU1+yGIo1Zh45DVUXfFvf5++qVeOCRB7Fnyw4k6hsRiITQ55CBGDxxDPqPHArSQLo5CS6Ez1OwP1RR1Ksc7y5djjv/45eQTgLHNXaFEFizZg2GDx/eZYOwEAji8ThmzpyJV155JV8SaCeHXx8KhaYkEomP0A2fo8lPRPOpU6eyN9988xmt9YmMsRyDz+X8F154ASNHjux24ruLsGLFCkyZMsVbfK/XYGkJ5v/9L4iWlqIxHsfY3gMw69Bx0O7eAmZzu+AcDXvqMXTIENTV78m1aqXAyClH4LRLL0D/quFINDSCC8Np2kGexR0rKcHtF16JNa++4RmFrhSYP38+fvOb33T7+7uAisfjOPXUU/Haa6/lg0ARkeCcf1FaWnqk83Eq7xtMnc3hu8QXjDG1cuXKu7TWJ8LuaStdHZjJZNC7d28sW7ZsnxDfb/U++uijOYUXLvdNmXMayg/uCzOVAuMMQ8t6Z7/9weyaGOF4JiVlpZh1+mxwIRAKhyENA9Kw4/Afvvwmfjf3Urz71HJES0sciz/bnYoBsJSFE3/4PXAhoJ0SbtcVe+KJJ7pVBXjEcGoNYrEYnnrqKRx55JHIZDL+dRaMMaW1PrihoWFpnz59ou3IF7ULAMLx9a+zLGsuABO+Hr9KKRQVFeGpp57C6NGj9wnxXYJrrfHCCy/kLLiyLBjBAI6YOQOZRApM2IWUBuetvjsRQXABrZTvsHfmSMOAmUrjL1ddj7WvvolIcZH3mxuRSyWacciEwzBozEgoy1ZBLoeuW7cO69at84zSfQGCoqIiPPnkkxg9ejQymYyfGQRjzNJaT9i9e/cDbjPuzoLALeGyotHoWUqpBf7wrst5nHM89thjmDRp0j4jvitpvvjiC6xfvz5bsOAUXgysGonegwcinUrbxACwPd4A5ksE5dcJvP766zlA8p6lFIS0s2MPXHcTEnsawA2ZG1rVBCMYxthpU3J8bikllFJ46623Ct67u0CglEKvXr3w9NNPY+DAgTBN0ytCcehjKqVmBQKB3/kKbzoFAKusrGx0Op2+y6kW9Sp4XJ/7L3/5C0488cR9Rny/+F+/fj1SqVSO8QUAwyaOhQwGnD12hKA08H7tFtQlE5C+DKMbWr3pppuwbt26nDx8Lgg0DMPAnh3VePOxpYjEojm7dRjjUKaFIRPGeBW+fln74YcfYl8ONzx88MEH48knn0RJSYkXZHOGYTtN1n9EIpELOwsCPmjQoNJ4PP43Ioq4u7pcxGcyGSxatAjnnHNObonTPgTAli1bcgtFnL/3HXoIlI9AgnGklcIjG1Zh5Uer0dTYBKU1Nm/ejKuvvhpXXnllTu69oNRxAPbBC6/CTKWcEm04tfoclmmh14C+iBTFoFyXzLnWLQLtzh0+hUBgWRbGjBmDhx9+2JMAvkikICKVTqdvjcVix7ixmg4BYMeOHbdqrasYY17HatfiP//883HNNdfAsqxuCfK0Z9TW1hYERnFFufPlMHiBHYMJZCTDeRdegJEjR+Dww8dj9OjRuPHGGz17Ir8PUaGMWc3m7Wiq22N37PCsKtvzCMWiiJQWt4ib7t69e58DwFU5lmXhpJNOwq233uoFxHzfHoDWWqZSqTsHDBgQRgebTHEAZzkXCT/xJ0yYgLvuussr4viyRiqVKggAIxT0ijkYsqVQAgClTWzfsQNrPliDRCLhFYnsNWnirFQmlUI6kbSDPv4UqlPIaXj3Yy3mua8B4IIgk8ngoosuwiWXXJKvigVjjLTWI3bt2jUc7d8CaQOAiOqcMmHyZ6o2b96MN998c69idF+IvTyqeYYbK/BxYDuzFwLnHMFQ0NOd7Q2CkPNMaQiv9asbFILT/jV7P+pUo6nuMJANw8Du3buxcuXK/P2JbphQRSKRhg7bAEKInzmiRLkcxzlHXV0dTj/9dGzatKlDi9rVUVRUVJBrk41xcJmtmHUaFIEbBvoMGQRNGlpTx3LnDg1jFWWIlpXYn6vlrmzQ4IIhk0wi2ZTwRIY7n1gs1tlcfadyIwBwzjnn4N13381nSuXQ8fbGxsZN6GCHMZ5Kpe4RQtziuoMu4gKBAHbu3InZs2ejsbGxRWeKfTX69u1bEAA1X2yFEDKnCwiYhmVaqJryDbtgRus2RX5LlWAbmkPGj0akrNj+oIPP/ZXSQGN1HRL19XZRpU/69O/ff5+5gYWio5dccgmeffbZ/J1HioiklPKfAwcO/E+nDL9DE+IAxLe//e0rOOcvOV+0VO6Dg8EgVq9ejTPPPNMTOfsK8a7VP2TIEO/F/WPT6o9BlsppLsE4QyqRwKFHTcLAUcPt5Ann7S6r12THDKbMmQ3LtFr0BzYCAWxduwHaUuBC5EiAkSNH7nNmcD2vG264AbfddhuCwaB/XTQRCSHEzlgsdsaGDRvS7Un+FAIAPfzww7qysnIO5/xzIvISDJZlIRgMYtmyZTj//PMLWtbdNdyFHT58OHr37p3NhDkctuG9NWiqqYOUBuyqZvu7f6QUZMDAv/380mwgiLO9gpVLAW0pTP3e6Rg2eTxS8SQYk77PzNnF9mtXvNWCIwFg8uTJ+9QWcNPrixcvxvz58/M5n8jODFmhUOjMPXv2fIFONpd0RQbfvn17XTAYnM0YSzhGofaD4N5778Xll1/u2QPdDQLXsCkuLsbEiRNztl9Jw0BDTR3WvvEOwtGIsxB2oQfjHM2NcRx69CScveA/oZWyN5UK53vDLLt1hjFmczIAK2NizPHHYPZVlyLRFPcVZNrgMYJB1GzZhrUr/gnuzM0NjFVUVGDixIm58Yp9QPyHHnoIF110UU4vAudQjDERDAYvjMfjrznqu1NGmvCJDWma5o5QKPSRUups2LX+DABzbYI33ngDpmnipJNO6tBeuo7oOzcb9uSTT3qbGVwCNNbU4chvfzNXXDMCEwzpZBLDv3E4+g8bgs/e/xDNjU3eFij7O7+Us4H0+PPm4OyFP/e+Yua8qZ0V1Bqx0hK89JeH8OGrK2EEAiDHO9Ja49RTT8XcuXPzI3PdSvylS5firLPO8u7vI77JGDMMw7g+lUr93m+7dQUAcCSBtCxrbSgUqlVKzQSgmDOICIZh4OWXXwYR4YQTTuh2ELj3GjRoEBYvXoxkMulJAS4Edu/Yhd4HD8Dgww9DMpGwq3h93TVSyRQGjRmJI049EUVlpUjHm5FJJkFKQ4YCqOjfD4efPA1n/tcVmHLWbKRTaZClsl8PY3ZpeCAUQuOuWtx37Y2w0hn4d5horXHjjTdi+PDh3VYV5A434LZs2TKcfvrpXvLJJ21NAIZhGHeZpvnTrnA+2kgjGgDMcDh8fSaT+YWLOH+sPZPJ4Nprr8WvfvWrbisCzbd63WLQvMoYFFWU4ecP/n+Ey0phpjPg7mdn3McrDSMYRDgWRaY5iYbqWqTiCfCggaJevRAtLYUyLSTjiewOG8+rIEBpFFeU447Lr8XbTy73dK9bADt8+HB88MEHXmS0u97b5fynnnoKZ5xxhpcB9O0ndD9Bv3T+/PmzFy5c6H5Vs0u6uFCIjwBIpdTzQohiIpriIE9k3SOJl156Cc3NzTj55JM98dSd6qCqqgqLFy+GaZo5WclkUwI7NnyGI799sm2LOI0pWZ4tkW5OQpNGqDiGWEUZQkUxEAHp5mZYpukBJz9LWNKnEsv/fD+ev+uv/o4aXobut7/9LSZNmtSt9QAu5z/yyCM488wzveirj/gWERmGYbx+8sknz168eLHZGYu/vQBwbyy01s9KKXsR0VGFQPDaa69h27ZtmDVrlrdAXRWJLgHLy8vR3NyMV199NccIElJi16atqN9RjYmnnACttJ2o4Txb++t8DIocoirTdD5SQd6ewZz+ftrurVPauxdWPPQPPPirm2FI6XX6dCugJ0yYgFtuucUDRHd8s0BrDSklFi9ejPPOO89rLuEnPgDJGHu9pKTk1NWrVyfQxSqg9gDA//vTwWBwgFJqslMi5rV5CQQCePvtt7F69Wqcdtppnp/aHSAgIhx99NF49NFHUV1d7RmELgg2f/QJdn22GWOmHY1QUQzpVAr+voA5xPE+S5dbAUdOGxUjGECkOIrn73wAf1t4M4RTcOJJF8cjefzxxzFgwIBuqQV0CSyEwKJFi3DFFVd4zbAKEP8NrfUpyWSyqTuJ3x4AgIiEUuoJKWW51voo2LuCuD9i+NFHH+H555/HjBkzUFZW1unePvlSIBgMYvLkyViyZEnBBMnWTzbiw5ffQL8hA9Fv+FD7I40ZE6R01vvzXoR7TaVJa5BmkIZEpKQYjdU1+NvCm/D8XX+FNIQTf8hNxNxwww2YM2dOt4h+9x5EhEsvvRQ33nhjzi5nn9iXjLHXS0tLT90XxEc7s0ZeIwjDMH6ntf4PIrLcwhF3kdLpNPr3748HHngAxx13XLcYh+5C3X333Zg3b162SNRLZHCYGRMMwDe+/U0c973ZGFA1AjIQgGmZsEwL2srGLLiwP9wkA3ZUb/f2XXj3H8vx0v0Po7GmrsVmTfe9zj33XNx7773dQnz/PoC5c+di+fLlCIVCXsMs1+ADYEgpXysqKvpWXV3dPiF+uySA/1wietYwDKa1ng67LzDcOIFhGKivr8f999+PiooKHHHEEV7vnc5KA9fynjhxIkpLS/HMM8/kgMpVB4xzfLF2PVb+/WlsfOcDxGt22367FJBGAJwLECmk483YvWU71r7+Fl6866944ne344OXXke6OWnvBPLF9V3if+c738H999/fZb3v1/dvvPEGZs6ciXfffdfb7Oo7zwRgcM4fHzt27OkbN25M7Cvid0ZaCAAIh8OXO3vNiXOu/HvchRAEgObNm0fxeLzL++v9199xxx3e/Vvsrw8EvN/cI1ZaTH0GHUwDhg+lvkMOoZKKXjnnMICMQKBFjwD3nLlz55JlWaS1Jq11l/sbEBH98Y9/9HoohEIh/7M159x0eizcuWDBAu6L1u5XQzogmCOESDjNB0x3AaWU3guOGzeO3nrrLXL60pFSqssgeOmll2jw4MF28wPnWfkEdInKCjRMcBtJ5BPeP2/GGP3617/25t1Z4mutvXnX1NTQd7/73RbzduagOOdaCEHBYPDXbrcVfAVfE+8QCIqLi4+QUn5eCARup41AIECLFi3yFtE0zU4vqLuY1dXV9MMf/pAYYx5Rg8Ggx73+eUhDkjQM+/AR3P3dMIyc7hwTJ06kV155xevu0dm5+rl+6dKlHmhDoRAZvrlwzk3GGAkhMpFIZJ5PNe+3xM8BQUVFRV/DMJY7i2oJIbSL7IBPLB933HH0/vvvd7lljP+6FStW0OzZs0lKmcPhgUDAO1wCG4bh/c1tLeOXDCNHjqTbb7/dA1ln56eU8iRdbW0t/fjHP/ae4Yp8P/E55ySl3BKLxab61/VAGcIxXFgwGLzRx2GW+6L+vjvhcJh++ctfUiKR8ERkZxY6/7r333+frrzySqqqqupQ/5zy8nKaNWsWPfjgg5RMJrsETn8vICKiBx54gA455BBPChYS+ZxzCgQCy3r16tXvqyJ+d4gZr+FAOBz+jmVZt2mt+zjxAk+UuSXOSilUVVVhwYIFOPPMMz3f19142ZlgiutlWJaFNWvWeMGpjRs3orq6Gul0GoZhoKysDP3798fIkSMxadIkTJgwAb17926RjeyIpZ8/9/z2dQWsfNe/h5RyYSaTuc5xO7u80XO/UAllZWUHB4PBpa40kFIWlAYAaPr06fTiiy+24OyO6l2lVJueRlv3czm3M8/0c/zGjRvp4osv9lSLq37yuF45Iv+TaDQ6PS/O8rUYwo3khcPhS6WUe3wqQfmB4FrcAGjmzJk5QHANvo56Da6nYZpmwetdopmm2SmiuwD133fDhg10xRVXUHFxcY4N4jM2tRDCdFu1hUKhPw8aNKj0QNT3HVEJ3PEShhmG8YRvMUxnQbyF8htj06dPp0ceeYTS6XSXObS9EqC9RM+3C9555x268MILqaioyHMd82MTQgjLjZdIKT8Jh8OndTIId+CqBMYYotHouVLKz/OAQK0Boaqqiv77v/+bNmzYUFDUd8U964gUySd6Q0MDPfTQQ3TKKad43o1L+DwX0xP3QohUMBi8YcSIEUUHkovX7dJgwIAB5cFgcJGUMu5yheM25gDBrxqi0SiddtpptGTJEtq6dWtBl9AllAuKjgDDJbb/PvmjsbGRnnvuObr00ktp0KBB2Q6cTqzDT3iH6BZjjDjnZBjG0pKSkvH7M9ezL9E2UAAQi8VGplKpK4noPKcMHU6a2eMMt49/JpPxEjOlpaU45phjcOKJJ+LYY49FVVUVwuFwm3F399/+LKP7/219iGrjxo1YuXIlli9fjpdfftnbsAoAwWAwx/p37q+cQlru5PNXGoZxfTKZfMq3nVt1RwHHgQoAfy7BAoCSkpLDU6nUz5RSZ7pAcH7zpIafUPm9/4cMGYLx48dj/PjxGDNmDIYOHYq+ffuitLS03buY6+vrsXPnTnz22WdYu3YtVq9ejffeew+ffvop0um0d55hGN7GGF/HbXIIL5wGThBCrJRS3pRKpR51znNRtt9+RJV9RWqBwS44RUlJydjm5uYfa63Pdr4y4i4Y+ePh2c+sMS+ekJ85LC0tRUVFBSoqKlBaWoqioiKEw2GPeOl0GslkEvX19aitrfWOvL584JxDSpnTLtYVEC4xnf0TbsHIc4FA4JZkMvmkQ3gvhb6/6+iv0hjxgODGD5LJ5LmWZc0lolG+GkPlAwP3E8nf818p1an9i35iFxDtfqKTT1KBc17LOf97MBi8Mx6Pv9VWM8YeAHQACFVVVYFNmzadYFnW2VrrGU5U0a/HLeR/IakV/V7o27p5H7Rs8XsewXNAxxhLc85XcM4fKikpeby6unpXoXc4kAbbz+bi2QiOnVCWyWSmK6VO01ofS0RDClQf+40r99vF3ru1soOpRTdt3/ORB7gazvk/OedPBYPB5U1NTRvyuL1DH3zuAUD75sR9xAUADBs2LFhdXT3GNM1jtdbHKKXGATgETh/DQtZ8a523W32wff52xthaxthKwzBeLS8vf2fbtm27fddzn34nHOCDHQDzawEGAJg4caKxfv36wZZljSSiw7TWQ4loAIAKIirhnMe01iFnKxh32JycnTb1jLE4gGoAX3DOP+OcrwuHw2v79u37+dq1a+N5gHGJrg9kbv86gNVtayda42DGGBYsWMCnTp0aKy4uLgdQHovFKmOxWAWA8gEDBpRXVVUF9rKlzf8c9nVf1AN57jmGoM99bK9ozjHyOnF9DwAO4Pf6lyFyz+gZPaNn9Iye0TN6Rs/oGT2jZ/SMntEzekbP6Bk9o2f0jH/p8X/tIe1lwmxNZwAAAABJRU5ErkJggg==",
+    256: "iVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAB2kElEQVR42u19d3wc1dX2c++d2aZmybYkW64YV7BxoZlmCM2G0DGBQEgogUB4wxsg1CTgND4CyQuEFBJKIIEkmEAChBZ6JxhCM+6Ae1dfbZm593x/TNnZ1WyRbNkrM8e/+UnW7s7OzL3nOf0cIKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAtruxIJHsMsQtw8vKfsIKKCAdmEQFwVeFwHQBxRoALuu1FcA0NjYODGVSs1qa2sbAABVVVWbamtrn1+5cuVKInLWmoJHFlBAuw7zY/LkycPC4fCfdF1Pa5pGQgj3CIVCHdXV1bceeeSRFQHgBxTQLsb8u+22256RSGStEII45ySEMLyH/TeKRqMvjx8/vsr+XAACAQXUz802PmnSpMpIJLLIZvK0V/J7DsU5T3HOqaKi4n7GGIr4CwIKKKAyJw0AYrHYNTaT52N+cjQDzrmh6zo1NTXt79UgAgoo2AjbWTJ7DmEza28OUeCghx56SEgpzyLLu1fSGkopqaWl5Sv2+/Wca+3tkXttua+zwOQIaFcFTuFh1h26yadMmVIfDodTjo1fwmFyzikWiz3POd9Zz8sLboHgKSd1MqCSpTsDYCInuYZzjlNOOUUsXbp0+IoVKyKapoUaGxvHpFKping8DilltxMKIaDrOoQQCIVC4JyDcy4556ZSKgEgTUQGERmmaRJjTBERNwwjtXLlyhGmaYZsm76k62eMwTTNMbFYbEJnZ2evn8OAAQP0aDSqaZrGQ6FQSNd1nYg4AGpra+vcsGFDZygUwl577aWEEKsvu+yy9Fe+8hVJRMrnmQpYoUmFIES50zZ2QIWZHgCkl9nHjh07qrm5eUIqlZqqlJpGRKPT6fRAXdeHGoYRcRgcAIgIdhzejyuzfjrv9/vd+/9C5yxCVGzNGWMgIuQDl9xr9r5PKeV+NhQKUTqdXqtpWhrAUl3X1xLRwlAo9OGwYcMWf/TRR2uVysIExzkZgEEAADtdvee2pAdjDIccckjl4sWL9+3q6jpKSnm4aZp7EFHUy4yccyilXIYgIskYy7uR8zG3Z02YK7q7f5b1QPqXvhky154FBM61eb6TPK9RlpphX7cfiDDGnCPOGFsUCoVej0ajz40YMeLNBQsWbPWcSuQCb0ABAOwIxmfOprvzzjv173//+19KJBJnpNPpw5VSwxxmtzexN8+e5RyliWPqv4KuBAAijyT3/s6JiDvPkXMOxtgWzvnruq7/fdy4cU+9++67W3K0sAAIAgDoU8Z3VE+MHDlyVEtLy1npdPp0KeUeHrXWYXjulXS5qnPA/CXdN3lsf277EBw/yKZwOPxYZWXlfRs2bHjNk8YcAEEAAH1i40vGGEaPHr33xo0bL0in06cTUZXD9LaK6/oDtofq3Z+Zf1uBIM+9k0ebEg4YaJr2UmVl5a+2bt36iO0vyALrgAIA6C1pAEyH8Tdv3nxVKpU6WSnF7Q1qwqe8djtu+O1G3vMXc+DtKFDwXkMv7p8ASCISjDFmA8ErkUjk562trf+yz6fZ2kDgLAwAoMfqPgGgUaNGjdy0adOVpmleKKUU9uaVji/AbxP3hLFK2/i0zUtQ6Ht6C1g7E0BySDralw0ET1dXV1+xcePGhZ71DLSB7WD/flGkviIiXlNTc9m6deveS6VSF0spOWNMevLkWS7zON7r7cn8lkMxE0XIHECpQrPY93jPW+jzue/LvSb/z/aN9uA9kEkakkoplUqlZjc3N79TXV39wwsuuEC3mT/IZQk0gKL3yACo4cOH771169bb0+n0TFvSmfk2UOmqqyXFGZhHHyX3r85byKutMvePvb8j2s5LzyijkFDhL2Yo4a32+7Pew5wfxTWfPCaEVEoJxhh0Xf9PY2Pjt1auXPnfwCQIACAfCQCSc46qqqqrEonEj6WUus34Il88vWTmt3QFcMYBZjO5JChluvxN6B4bJD/+A8viKOeyiPkvE3NeczQGL6ex3MVlhVeayH0546S3r4plGJ/ca8v87v1eDkAxuIAIMPv6rYslIjAoMBCIMfcGemhyEBFJAJoQIllZWfm/LS0td3puNwCBAABcld+cNGlS3cqVK+9NpVLH21JfokBJbIEEnYyayi1XgpIEpbpHpjQ9DCZCYJoAnNx7paAIltaqACJlMRFJkJIZnVpRFmNStz1dDiYvz6MJFeY9IRjANDDiIEjkZgeXCgT2mkgiEpxzRKPR2x9//PHLDzvsMDPwCwQA4DL/gAEDpqRSqb+n0+ndHanvd89+Er8b43MOECCl6dmwOqobh6JutwkYPG4P1DaNBq8chBTpSEMDFwKMC4uRSXlsbGnZ18r6O5MSipQFArZEd97PyAApBUUKpAhMWZmySpENHspVM4jII+xZzhI79rzzKvdyHohxS2YzZqkfzNFKLGluZT6wDBw5mYD220EEaUqQkQZSCchEB7raWpDcugldm1cjsWkVUm1bQWRkYEQI6xxK9cqJSRZJzrmmadrjhxxyyBn//ve/447mF7D3FxMANABmY2PjqVu3bv29Uqo2n63fnfEJxMjRY63NzxiUabqyLVJTh+F77Ydh0/bFoAmTUT1iLGJ19UiZDFubO9DW2gXDIBAzc4Si7RVgtreAZWxk5fmdMXikvpUpB49aTlm2hK1GM+TRfrN9EF6LnJhj9tsqeI5dwnwMfdePQWSfz75FrxnAGBizIqiMM0vKpxIwOluR2Lwe8ZWL0LbsA7Ss+BCJ5nWu+cM0ATig57n2QiDgWT+DiPTKysr3xo8ff+KCBQtWByDwxQMAJ1wkKyoqzkkkEvc4jqN8Kr8fADDFoTjAOcE0rP2jhyvQNP0gjJ11BJqmH4SKIU0gTYCURLyzC5s3dKC1PQ4iQAgdnAmAqQIuQ5VlsZJHGrN8TOxxL3qZz0EE528o4KDLclQSeex7n43APE7MnO/30/SznyVln4hzMCGgcQ1caGCkYLRtQevyD7H5nWew+aO3YCbabTNBWJpRjm+gBCAwiUiLRCLLhg4deviKFStWB+bAFwcAGADBGDPr6up+1tHRcY2UUtmbhpdi7zuSh3EOaUv8WO0gjJt9MsbNPhV1o8eDiRCMZBxMGZAK2Lw1jpaWFKRk4IKBcVcm9igRxlNN41TSFH+vvy+vALOwgmfLZXa/OiZ//4ivi9PzN5X9fpIA42AiBBGKgMGAse4zbHzrKax9/UkkWzZkgMDH/1IqCOy2226HL1y4MACBLwgACACyoqLixlQqdTURmYyxvI06/DYy4xyKJEgSItV1mHzi1zDphNMRaxqBdDoNdCUAEHhIQ2fcwIYNrUgkCEKEAKZsieWV5KrA9zJ/TZ1sNT1LrVc5LMvzOt6IiqvN+baAG3Ugi/kZigOArTMV3EbZz4Fb0QD7vsh2irJQCBFdh9m8CetfeQQrn/sb0vFWy/xhHKBMzVWhW/OCQEVFxccHHXTQ3k8//XQKQUv0XRoAdMaYUVlZeWNXV9fVsNJ4RZ4y2u4SkzEwDkjDBJiGPb58GqadfTFqRo5DqqsLMtUFxjmY4FAgbNnYiS1bEiAwaIJ57GKexXzECN2FOZWwD3MZSuUo9rxbmW6vFn6bsv387s2feNazBogx1xfhmipEIKXAQzqi4QhS65bj88f+iDVvPW5rA7rlH4ACGHfTOQuBgFJK03X98WuvvfbkefPmBU1HdlEA0ACY9fX117W0tPxESmkwxvR8m7sbwzBrW0gl0ThxBg68+DoM2W8mksk0ZCoBwQQIBK5xpNISa9ZsRWdHGpoIg/EcZqZsxiWWj3GoYGoxdfsgbfOSFUvv7SkY9AR4ci0JYvm/U4EAJaGFwghpIbS8+zyW/O3/0LVlDYQWssKlLNubkQuEnmxGk3OuhcPh2xOJxKVEpAMwApbvrjr3a+aPRCJf6ezs/I1SymSMafDvodF9Y9q2PpiG/b52KQ77/s2IjRiDVHsHpDLBeARgDJoOdMbTWLWyGckuCV2LgDFlO/mYj6zLUesBQJHNCPk0gEL9Mwu3GuipFrC98/xzi5GKShjmf03kGDdMA6k0ZEoiPHoiGvf5EszNG9G+dhk418CIAKZ8HZTea2CMcSIylFIHVFdXf55MJt9DpgVZQP0cAAQA2dDQcGgikXhcKUWMMc4s6iZAycN4BIBzDaZhoKphBI758W8w4bRz0JVOQyUSYILbzjgFoTG0tqSwcmUzpAQ0zVG/HdHGSpDMGe98fuG946oMtycAlOKkYyXeqhPRYMSsHAUOyFQSPFaNoTOPBlfA1sX/AWMcnGc/d2LkCwg2CCgp5dGNjY1/7+jo2AwUtCACAOgHxAHQ+PHjR61fv/5p0zQrHG9/7gZ01UEGCGJQjNvMn8bwvQ/GsbfchwETp6GztcWKX3NhWwUKQtOwZWsn1qxuAeMhO6HPSbTh6O6N8u/rxxw9OEsX5uhFA6FtZv5cldnXBHFuk6jHXOILLiX2SnIjkixzbZwLQJowJWHQ9FmorB6MTR++CSgTHALEFJgt1Jn/dTDGGCmlwoZh7H/dddfd+/LLLwdc348BgAHgDz30EPvjH//4pGmaE+xOPSK/ZLNUdWYFCiENA3vMOQ1H/fQ3QEUd0vEOCKHZUp+DoCCEhq1bE1i3thlC6HZITLr57W7evmdnUzdznfx2N3ZUq/xSJX2mYIlsxkcJGkvfaxfuuWynn5FKomaPfVHTOBwb33vRyh7kAHPXJb/AYIyZUsph7777LqXT6Rdt8zEIDfZDJ6AGwKysrLw1mUxeSkQmAK1wQY9lXTKhINMKM874Jg6+7MfoTCSgDAlwLasMVtM0bG3uwNrVWyFEGE6RGXPVTNbNw+crkb2JQB4HIREBvO96ABRixizNpATxTuUAAHDKhK26i3DNIDS/8QQ+/N114EgDxLslDfncMwFQnHM0NDTMWLt27QcIMgX9PFdlr62YAwcOPC6VTl9KVkcfH8nvqWEngJGVTivTCtO/ejEOvuKniHcmAFOBcwFmx96JAKExtLfHsW7tViv0ZAsJbmsH3dVlsgtaKKPmd1P3fRhwGy1QS0pbsfp8X9nNDAFlXWa2im4DnH04b3K+o9Rr8o8LUs7Rc5CzYngMnOtIt7Vh0IHHYPI3vg8pmZVUBObbvyC307KUUmzZsuW3Dz30UDAfsZ+ZABwAZsyYUb1mzZqnTCUrbXcfz+9SsqpUuBAwjTSmnXIeDv7ej9DZ0WXn4ju2sJV2KgRDKqWwcuUmgDQ3E87N3e9m1Hr2Mysttu82uthWQUk20+aEHsG8EjNbtQfl+VpWam5Cie/odn95nl1PNQpyLQKYiQSqJ04DNxS2Ln4bQmi+WlGOcHAai4x45pln1qZSqQUIogL9BgAEANne3n6rkTYOA2MSDIIVlBwMTFgOv0nHnIZDr/s5uuJJcCKrhsZrIjCAiGPVyk1Ip+0CHI9ayYptYoaSAGC7GV4OAOScl3G/zkVsOxiBPQAAyngWWDdw3AYA8J6DEVLpNAbteQASq5egY+0KcCG6aSA53YUsjyARKaUOmDp16r3r16/vwhc8KiD6C/M3NDTsG4/Hf6tIKcatNF+WlztgMX86jRH7HYo5P/ktEoYJImU178gCDEAIDevWtqG9LQlNE5bCmVUo0z8AAL2xwbc3AMDT3GQbASAfGBADmLJaiwyeuA82L3gZRleLFTVAwdAks7WAypaWFtM0zeft/fWFdQj2Cx8AEfH29vZfmKbJ7dJV5mfzOsUpnFnMXzt6Ao750R1IQYCZygodIdtOFJqG1pY4mps7IXTNqs/3qZLrcQifeObYjr5W977t83rjCpTXBi/i6aNi26BwFq13LRgngNuJUkxtt5hHtgPTMu+kmQDVNWD8mVeA7LUtQZYLIqJUKnVxQ0NDve0I5AEAlLH0r6mpOdU0zYMYY5KICmstjIOUQihWhS/fcDtEbQNUOmF15qGcjcQZUmmJ9evbLBXSdQr3j+BI79xrO5b66kkSI4ALpOJtqJlxKIYdfAqUlAD3rwHzmgH2PhrQ2tr6v/ajCwCgTPcOzZ07N5pKpX4kpSSUkObLGGAqE7O+830MnLwvkh2tYFx4u9y5uj9jAhs2tMI0lNUqiHrW/bcv22fn7cbLYIUR7c495Onl4Z+IU4L6znrW+ThfwMNnYNL2fyZ2MxJ3JiNjSCaTGH7C+QjX1IOUmd3EhHzXTQAgKeW3Ro8e3YBM+/HAB1BGpAGQGzduPC+RSHzD1kNFvmw/y+7nMA0Dux96HA763+sRb+0A59yjGmZ2htA1tLcnsGFDGzQhbFVVdPPoOyE0lseOZSyfml0s7W0bQYZlmN5t41VIVSh4flZyJKPQ5ftFOFghX8g2aQCZc5JpIFRTD02PYOuHL4PbtQWMZTcdzc4QhCRCBRG1JpPJV/AFTQ4qVw2AAZBz584NxePx7ymlCvSRtvvSQUBJiXDNABx6ybVIp9LZBTuM3OQcxgBDKqzf0AbOeGZAfU4XHzdCRhzk2vTM34bOPbb1AfRwFkHhVWZue7P8HGVdN4PolvPAiFvaEZWSQES+/9veugEnz8EFUl0daDjoWAwYM82a0sy5Xa7BfBQia8wYEVE8Hv/mjBkzYl9ULaBcAUAAoGeeeeZU0zTH2Om+3F9NJpvPFZRU2P/r30HFbhOszj2MuXX5mQ0pwYWG5q1d6OpK2SE/f+O62ICMcp/xl6Wq5wBLMYDJek8ZskW2/4NAZMIMRTHy2G9YPQfspoeUf4tzxphSSo38/PPPT7ZPJQIAKA9SRMQMw7icinIZgQSDNE0MHrcXppxyLhLtbWBc95U7jGlIGwpbtrSD5bSdsjLrlC0MZEGG315Zff2CGLO0CM5804Od3qS0A4HCag9iHRabC5hdHaiZPBMDx+8PqUyAC3s9C5xHKers7Pwm86gGAQDsfOmvGhoa9jNNc6ofMmePsYLdLYbhgG98FxSrhDJNAATFsofFEBGYxtHS0oVUygRn2b3syHYwFXNEWe23HSdc+SJAbulRzyIG/lztagQsAwzZ2oRf0VPvDQDyOVRuwo+n87IpQhh+1FkAOJRdCNZdhrjXIwBASnlAY2PjBBsAeAAAO3/fIh6Pn6OUchs6OpusWyNPzqFMhWFTD8DIWV9CosPqJUfEwBTLaVgBmFKipaUTgnNwT4oP600wjXnaYhdxWG2rlPTzulMJzANPn//SixGZp4ApT2Qhj2mQqSDIVBJ4/18SuHo0LPJIelfid3PD2D0BGIeRiKNmz31RN3YfkKkyg1k898YY95o/UkqpxePxr5S5VvyFAAAGwBw/fnyVYRjH24wvCjuvrI0y7bTzQHoEXKlueXuuaiE0dLankEykIQR3pT0rkXGzjpyEokLv7ROELMGBmPXccm3/8pkAnLeIp+Dk43yhSFKQegRDDj7OflbS13zz9ETgAJBMJk+9/vrrNXzBKgTLDQAEADQ3N88mokZ7jFfezr6Mc0gpMXjsFIw8aBbSnXFrEk8BRmltjdudZrMDC9u9VRb6JkHHndbDCrfEKh/3Adv+WGM3LPHTTxjjSCcTqJ1yAKIDh0OZqhjYcQBKSrnHnXfeOe2L5gwsNwAgxhgSicSpduiP/NffDu/Z6zrluFOhVVRDqnSW19epBCdiACckkibinSkIzkFg4Mw6wBgIvNuxXe3vAqO2S3swsJxwnsvi3YtdSpeYzvnyaCm91WC6Rxl40e7Bxa6bux2KLIMAZO0ARTlhRrK6NZFpArWDUb/vUSB4Jw3bRgqjXExQSinW1tZ2YolKVgAAfaT+y5kzZ1YZhnEoAJY/7Ze7I7siNQMx+tDZSHbFwa2eoL6QwbhAe3sXTFO5mW+5GkVfqri56uf2bua5syX/ds1bcJx9LHPASeNQBCIJRRKKTEhlHUqZ1t+UAiMJM5XEoBlHgIkwSMpiWgAjIkgpjyMiji9QToBWZmAkFy9evJ+Ush6AYiy7dM+124hBcAZJwG77H47qxlFob2sFNAGhFCTP2UqKQUmG9raEPbyje17RtvbZ72vmytfHr1B/v5KBpQ/vW5GZiZoQs1R3xrMmkTjfrlge/wAAEQpDE7rTyd1tApLJxPRoHAAUB2omzEDdhL2xdeHrEIy5E5lzH5WdGgyl1B5NTU1jASzBF6RMuJwAgAGAYRhH2H3sC4RklOupGful2UjDGjcFAIpnM7fjK0gkDSSTpm/J6M5i6p5oEH6Mn1UiW6T3/469F2sNSBF4LALBBGCaAGfgPAwjnYJKJwGuFVwLRRJCD0MXAon1y9C2fi0omQAj6Unv7l5uzOx5RPFYBULhaMG5RcjMFzCVUlpnZ+eXPACgAgDYcaQYYzBN8yB7Q+cv/GEM0pSoHNSExj2mwUgkwRlAKttGtlRta25fIpGGoRR0jefdcz2Z57ejmD+XwfO0vPIHBVbyBYGwndqM22UFkjNEIhraFr6FTW8/j+SWdWDhCAaMnIjB+x0JvXE0UokkBLN9OiTAPQNLFUno4RjQuhEr/v5bbH7/JZjJzl7JFWvgqO0MpEzxX47yw4gI6XT6SMbYb6nc0zx3MQBgANTEiRPrli9fPsneyPn9E5wBEmjaczqig+oR77Q8+5ZUYN16bxAB8XgSO2NEXE8GXG6v7+vNd/TGBPKdA0CA4hp0AXz6wC1Y9fz8LEG65YNXsPL5hzDxq5ejauZsmF1dtiPW43sjAg+Fwbauxfu3/S+61n8GzgQ0YWlvVoqCx9lbaCiqXUHonp3lNf04AEgp9z/iiCMq/v3vf8cDJ+AOvo7169dPUErV2tpA0R4cQ6fNBHgYUCpL/cxysjFAKUIqaWbl/bM+CqX1Rf1ATx1s3jh6SdOJe+CUzFdH4PxNgSMciWLV/Duw6vm/QdMEhB6CpmkQmoCm6zDjLfj43h8htfg9aJGYZbB715Yx6BxY/MAv0LX+M2ihEBgjSAaYti8BSmUdjBSgZPeDVKlryiw3gGp87733JpUZf+zyAOB0bZ3ssf/z2wpSgQkNQyZNgZk2sqRBtxNzwDBNpA1pdePeyZpdT8Glt2C0IzXYjOmkIKIRJD//EKte+Cu4bvtblGml7yqClCaEHoIy01j5+B8RURJSWGE+O2YLEYkivuwjNH/8BrgQIGlYg0KIQdjTg3J9Dt4ej34ZGCU+D0VELJlM7hcAwE4gKeWUogvGGJRSqBo8BNXDRsAwkrb672mO4dH+OGNIpQ1IqcDBS7b1+0pV7yljFtModsb15H8RCGk6mhe+AzLT4PYkY7cNiz0ZWEkJxhhaPl+Iri0bIPQwJLPc8woA10No/3QhQKatojPPYDey6y+Y70GUOTJ/o5IAzDEHlFL7lVtC1a4OAIoxBinlxMyaMF8V1fl73ajdodXUQpkGvEM3ujMLh5FW7nxA1oPsv3IBgXL7vgL998EISHW0uJOW/J+p5eyT6S4YiQ4IxuxmLAzKbnYqE3G33oC2oZNwD30ijh9gr7/97W9fiMEh5QAADID64Q9/qEkpd7M3Eyu2cQeNngiuRWCSsgpE8jbEZEglZTcPQqFzb+vsvXKkvtYknEcrGYNeWWNl6+VYct7GrUSACMegxyqglAK3h5xoZMXrIwPrrRwBYuB5onF+91IsSlLk3q2aYKVGXXvttXXwSxgJAKBv7P8//vGPwxhjQ53rKlYQUjtitKXiO339mf8CK1JIGulM5R6opGKTbWGU/qA+9gUQMADKSKNu96mW80VlwJnIicFwMG6ZBtXDxyM8aDiUaUBxBsUYiDOY6SRqJ+4NPVwDUgrEhJ3EY5drk3SbwXiTgTOyI9csKO4PYJlW0EREVW1tbeO/CH6Asrm5VCo1SEqpo0CcjoiseC4YaoYMhZSmr3ro3dxSKZim3OFMkZsTX2onnv5E3Z4V45DJLlSMm46h+8yBNCW44FaKts3cXDAoaQDgGD3nq5BaCJyUnbpDAOdQRhra0N0w8ugzQcpy3jIuQJxbW5YJC2CYsI/ccufcUW09qn6URIREIjEpS2XcRUkrExBShmGMs50wkoi0fB1ulZTg4Rhig+ohzbRnxJe/V0pJQJqufOq2nrtyvse2pgn39LusFmwchikx7qwrYHS2YfMnr7lcZEMyRLgK48/8X1ROPRhGvBPguiXZ3YHAHEZXAsO/fA5SzRux+rW/w7uC2wrKxd5jOwInfRGcgGWTCdjZ2RmVtne40EZWAKKV1dBraqGkzKsuODnfUipYhYXZBl1vjLtcx2RfStRtzUXYBkdY77/XdrKSmUQ6WoU9Lvk5Nr7xFDa//xKSzevAQhHU7D4Zww45AeGReyDV1WmnZitwsp19bg9XhRQ4xpx3HQZO3g/rXn8MnZvWWiFBZ0R7VjUgZao/c2cTkgJjDKm2LSBbaBQzSU3TnGiDAQUAsAOooqpqWrql2dPP3Sf/3f4ZrRkALVYNQ0oQU+BkyRcFb3jIWktTEaQ9wVche+afsg1TTj1j/r5VpykHnniPgGKn7ldy1G8BZhhIcw2DjzwNjYedCEp1QQkBRGKQpolUvB2Mcattm70OAiK7vlcppFIp1Mw8BnX7HQmZ6AJk2llFF3Ss9AFr9Ymya4SduoBYOIqPf/sDrP/geTc1OI+wcRzQuymlmN2TIgCAvqbmrVs546WF5SpqaqHrIaSTKbuvn9Onr/tnlFLWuK9eqP5FZs5vXwda3oo/6qbZ9AsThjEwUjDiHTAY3AasFO901fwsZs13DjAYXR0wwcGEDmgaDCgwxbvrH7mNWh0AIMCoqkSoYUhRs94eIAoATePGjRsKYC124cKgcnACEmMM4WikutTNHK2qgdAECN0Z2zcDjLK5p6eFL7nOwR3rxNs+A8B6GwLcVoDhjFv5AMqu1OO8iN8ms1ROKTDZ+QFKKSiTANMG9qyD3AP2wZSdCawsMzBUN6TkNZRSRrds2TJgV/cBlAMAKM45IqHQBFsV5Pk3n/V/LVZlNXZUrNu8v3ws5GV8RpZk4fZRqjNgZ1cJEmG7gUFP3teT++7mf3BlrhWr9Ybqcv/lGuKWQ5/smS7k2vxOzMBp3u6OLnW6O3HrUM7cU0bgiiFa1+hsuWI+AJNzDk3TJpQRn+y6JoCUEp0dnZyzfKW6TksYa5OEK6rcyA8V3IRWTTooEway2kZtm/rflxqAkylXOrP2vlag0H2U6kjM16vAuTRV4Hq7TXgGZQOA53WZM4Itaxy5t82Zz7cpMEilEBlQB8Y4SFHRoShSSsTj8cpAA9hxICBzFyHfIoUqKuw20yovM2/r3I5trejrbeYd2T0MM/nsvT9vMT0h373lHUya53vzfoayR3j1ZIRCPsMn9/6J7HbhzDsoJOceGYdSCqJyAFg4ZueS+DO+ty4gGo1O3dUBYGdrAAwA3XbbbeGrrrqqLpVKlSRd9UjUiuiTCZDVB9DrQ8+y+cm2EZ0hmK6zkGWbBQUkaSnvcb40H0/6RzWyz+vLkN478+MxUnmfmfIo4Bz+mg858/PITw6XpnlkGp/6dwB2O4J51odAdlVfocGqVADMcv+X+eLsplBWboKUJkSkAlo4BiPZiVJ6Q2zdupXZPLIz+YSK4GP/NwFeeumlOk3ThiSTSd/5387m4WR1ederaqAJDVyEAC0E7o0AMEuxISJoGoemA1xwCK7b58quTiPvDu22/bwM6qc2epxZ9jm6sbjn1AzO1FqetbTkTPmlzPe5EQFbifZNX3VHBPtsD5ZxpmQ9Gpa5buaxozIN8DK2NvMyouceFMsGQ5bDuyzz5qzr41QYYFgBhVSw7NtTOeYAdyYXMyvdmJjl33GLArkGLRyGXlmJdNumovxPRKisrKyKx+MmEZllLMQFMjlSql8CwKJFi5BOp4tmarkMaSSR2rQORnMzFBNQLDsE6PCKJgSMeBpo3gwwK9tMOSOtAMtTTJQNs14s8I4fs5uRZzY8c/d2zogBd469hxczn6Tu4J09xZbcykXX6cfId9595nWvFmGfKgeMiHIde8ptvwXy9tdjrvONsj0wnutV9sco03HH8/ks/vcMWnXnLlJGeyHvjXlMHqf9t9PI09vZhygbRsjW9Bis3A5SEvAOiCGAGAfnHCptFM0KZoxx27z4UiQS+Z9UKrV97G27IY1SCpxzCCHAuXVduq67f9M0DZFIhHRdb+vq6tq8ZcuW9mQy6YLQ2LFj00T06aefftpuZ856TXqGHlQx7uw8ZwaAYrHYkFQqtYKIooz5uXOc/0qAOLRYDFzTAGnbgQye3JnsRm9k56eBONw+I5TJHaAcWecms+TYFOSnluQ3BHylSwZXstcne9wXy6g8rIhV70hq32thvqaFmzhjwxmD1xzKZXbq5tRzhnJkmyXkr1JT9oWSO4i9lO3XNxEXDgYmSnN9FXOU9qZLU6Fz+P1u5bFQ1vUIK6disxBiNef8E03TXquqqnph/fr1y1TGv1FSOXNZAACAIZzzFYyxKHy3viNSJDhxC+U9zJDtXGJuW8CMGm23oSbpqv2MfJpm5og812ZmrOh+zD0XIx9TlmXeTF4Ng3kZ0Z6o57oreJEVo0KizINhTutsZP2NMeZ/HsqDUF7fsSPwKdNUNF/2pnt35GnIAsq5J1bUz1DQZehiEPcwnWO+2d+mWE+8kYRt7AnQ23bzTlk8y5666rzGvIBgHyld118Oh8O/am9vf8IGAgFPlLQfA0AuQm7jzHpCRoUt8HrfCiW/L8lmF8pqYEI9XjKvIuGrmZTcI5VlOR2zbZ+eSUPy+FT61HPmeh53VgLXDnEOuioVEWlEBCEEhBCvVlZWzmtubn7e0/BU+WtE/YS6pcfSNhzo5evYngdQOMuPPIo55XEA212OGPL8LccBSL0FtOxrZNvQW5H14Iu3tTELA8quBNuvmeo2CE/uRCkYY8Q5l0opZRjGwW1tbc9VVFTc8eUvfzlmM7/olxpAXyzcrlLglW8wiLemwG+AyPZ6hrn1Cz1JkvKbc1DoOrelOWo5Sf5iCWbbY31sxyBjjHFd198ZNWrUaUuWLPnczy9QNl2BiSjvFOCepK4WzzEvD+bfHu25/Hrz5Ruzvb2anXjPU+i7SrnGXrTs6vV1luO69+E1CXuuhplKpfZZtWrVmxMmTJhhM78oOwAYN25cWtM0o1DtdU+y07ZnT/6+1D68EntbgaDsDNQ8YFSKNN7WzsmF9srOeJ591X+yBC1D45ybiUSiceXKlc9MmjRphA0CvFwAgACIZcuWbQmFQq+jSAyz1IUuJpV6u6m2paLOT/Llb2S63RK9euFT8vdXbA+Jtb2lXv7z5X+GpfaBLG2tC69VqVqIf9Hbtu0Bj9/DAYGBy5cvf3Tu3LlReJpmlINxJADI+vr6/Zubm1+3TQGvqtLn15hrP2+LLea1hXs3BShPyK3P758KvMZ32jyVQr6FLP9D1ivS42Ri/s+QsazN5Q3Llmq3d8tp8MZYc6NM1BNfhvJ8zJPC3kvfiP0ZE4AWjUZ/19XVdRERCTg1VmVAHIAaMGDA1zo7O+9VSgkPAxWMY/owGXPmCvaFuul98MJpctHLcV/5X0P2xkJpQ0xyHXK55ka+brgFuuSiWI1DvufJ7YYf3kSWbXHm5UaBnFoCpVS3gKrf//sT+WdD2JmnjIELewS6Um5KQyZF29+Z6oAA51yrqak5YuvWrc8jO8O6PDSBAQMGHJJKpa42DGMmY6xa0zReqvPJ87eSW/71xC501CrOOQzDQEClMa6maZBSblOT0m4AwKxmH7GKSpDGkYp3QjAB4swaHuv9DGNgnGWtn/W7/ZPbHQlspdgJIcIeQup+1jkXcjMwmU/qGnUHTSKrDZ0TaXa6GDlVjUplGp0QWf0sSYGkAqSEktIahecBBqHrUEpa9SPMaYKct/uVJCIRCoU+vuqqq2bMmzfPLLfMCEstYQwNDQ2D6+rqBsdiscHJZDJkGAY3TRNSSjg/HTJNE0QkTNOMx2IxLZFInNPR0fFVZfV9Y9vC/ETk5msrpdzvrampwZw5c3DSSSehrq7Oze8uhRypmGsf5otXF4pl5zKV91ylhMD80k/z/fT+njtoNff3999/Hw899BBee+019xo1TXM3eqlA4P8esidEE4aNHYMTr7gIQyeNRUd7O1QqDca1rMxM4hbTc/c5cnDeHQByC5msbkROTgGz2pODZQELumka5MmQzGQ7ktcvAACeSkimMmnpbncjb7mztAafSsNEZ2s7Nny2Ep/+5wN88sZ/EG9rAxPW/oQkV0sosNclY0xUVFSc3NbW9mg5pkbZEyV7Xtk0YsSI0Zs2bfq5YRjH263FeW+8sl7mEUJkSftp06bhzDPPxGmnnYbhw4cHIr4ILViwAPfffz/mz5+PDRs2WAsshNt0oxQgyFdGLcBhSBPRmmoccdapOPyc0xGprUZHazucMkDFPBpiLlB5/5aZMZ5d4Uk53hhPdiF5zaSccgjmZ9V7alayAMdTaQlm1ys42oYHbDjnEJyDhzRwRWhetQ4vPPAQnv/TfJApoema2+zEN8/Uum5JRDwUCr2QSqWOKOfcSAaAzZ07l82fPz/f6xxA+oADDqj66KOPrk2lUldIKYtWOBYLEeYyfjgcxvHHH4/zzjsPRxxxBISw/JM5PUwCynmeDqMDwJYtW/Dwww/jrrvuwrvvvutqEY5m1Xt/CYOSJhQBDSOH4bhLzsNeRx+KlGki3ZUC14SleiNTr8Fyy7ZZbnEzZfoLZGVgk39PCL8/5fSoVd240Vsmnb33vLVtuZnbimW0iFAkjGisAotffhP3XjUPHVu2QtN093Xmvy5EREwIkW5oaJjRX5OjXVNh8ODBR7S3t/+fYRh7elzAojcAkMv4AwcOxJlnnokLLrgAe+yxR5bJ4d3cARU3dxzQJCI89dRTuOOOO/DUU0918xPk1jyU5MhlAOcMZtqqmJ1x9GE4/rILMXjkcLS3tVvil7PsHgIFUnLzu5B65sNgBZ2QLMvpmymUQqb9AvP5DMv4H4gI0pSoGVSLz975AL86/7swklZTHa6oO+hkTEQJQMRisatFP3SQCgBy8uTJtZ2dnbfF4/HbTNOsZ4yZHq2gJMb32s/OBlRKoampCVdccQV+//vf47TTTkN9fb3rxHKkVsD8pTvvnIiAlBJCCIwdOxZnnnkmZs+ejWQyicWLF9ugS9A0YRcc5TJJIS2AAKUguAYuBNYuW4EFTz6HiqpK7DZ1TxDjMNPprDLgQgBQzBdTCIjy9WjJBwBZjO75SaxIFQkROGfQuUBXZxeGjBuDkKbh41feBNc0qMIzlclSwLjZn3axK/Vra2tP7ujouEUpNZqIlL0ovCdS30/iDxs2DJdccgnOO+88DBo0yJX2DtMHtH1MA2cClKMVfPDBB/jFL36Bv/71rzAMA0Jwa2iIxzQoCAAgEGNuvRbXuOstn3rkITj58otRO3IY2tvawJkoWN3tU33bTQPIEt1e30GBgGP3NAtPDwbm941++kP3Kkr3ejlHGBw3feWbWLd0BfSQ5Q/IwweklGKhUGhVf9EANABy1qxZAzZv3nx7V1fXTUqpWsaYyRgTLpAW8ZTn2qeOxK+vr8e1116Lu+++G0ceeSRisVjWJg2k/fbXCBzbXymFIUOG4KSTTsKxxx6L1tY2fPzxx1YTT/vZF88jyG5rQorc7jrrln+GBU8+h6oB1RgzdU+koQDDBLhA98ZmHs88K2DguxKfZQaPUh6AyD29e2QGmvrlYGWiOsV9IZYfRKGidgC6trRgydsLXF+AHx84dTdCiJpyBwC3xVFjY+MhK1as+EcqlTqaiKT9MIT3wZTC/I4kl1IiFovhkksuwX333Ydjjz0W0WgUpmlmxYrLTXp648Vu3NivU27O66VI0p0FBs51NjU1Ye7cU/GlL30Ja9aswfLly6GUgqZpJTsGHSHgPAdN05CId+HDF15D85r1mLDPNIRrq5FKJqFl6eosj31eRJH2/OSegcRZIxyK2ASsFK+iD6ZkXSMBLKQh3dGBBf/6dzeN1S+DUCmFcgYAAWtoCFVVVV3T3t5+v2mag22pr8GnZLhQ+q2z2eycAZx55pn485//jLPOOgvV1dUu45eTxPcysjcXwJGgPTmczzq5DIXyDnY2EIwePRpnn3029txzTyxZsgTr168HEUHX9W4Rg2JAYOVnAELTsOqTpVj4wusYPWY3NI3dDYlkypPQ46/69+T5KG7b7qx7o1QqcL6eAAAKdF7SdR0dW1rw1qP/siYw5YtalPhNO1vlN8ePHz901apVf0in08eQVeBM6EFyvAMGXjt/1qxZmDdvHmbNmlWWNr7D9A5TeKm1tRWrVq3CZ599hpUrV2Lt2rVobm5GPB5HKpWClBKapqGiogI1NTUYPHgwmpqaMHLkSIwYMQJNTU2IxWJZ53RCmeWk8Ugp3etJJpP4zW9+g//3//4fNm/e7AK0X+gwt54jswcsH4HgAqZhgGsCJ37nfMw693QkDBMqaVjJND5d0SgLJHs+KSkfOBErxU9Qml9ccQZhKkRqqrD4pdfx2299D7oWgiL/LHqv87vcAMDZ8aqxsXF2c3PzH0zTHGZ7+LWsB1hCiaXX+zxq1CjMmzcPZ599trvJ/JhsZ256B6wc2rx5M95++228/PLLeOedd7B06VJs2LChVxswFAph6NCh2GOPPTBz5kzMmjULM2bMQDQadd9TbuFNJ2oAAGvWrMENN9yAu+++G7ClXa554ye1u5mAjINIQSqF6UcdgrnXXYbYwFrE2zuznr0XAPI6Abdpp7PtBgCMMZApUTmoDv/65W/x1G/uRSgUzgmrdjclI5FIquxqATjnqKys/EEikZgnpXTGMws/lC+EbEIIt9X4//zP/+D6669HXV2dK2FzF3tnbnIvEG3cuBHPPvssHnnkEbz++uvYvHlz9kOyer4VHAue+5qj9udKzTFjxuCwww7DiSeeiMMPPxyRSKTswNEBcMcP8PLLL+Oaa67Bm2++6QJBbkJWMV+Qlf7LYRoGGkYNx9k/vhqj956K9tb2zKwEZFKB+9L0gec7egsAnABoHFpa4WdfORdbV62B0DRrMKp/ObQCwHVdX1guAKABMKdMmVK/fPny36fT6ROUNZzdqxUURHav1Hds3L333hu/+MUvcMghh3STKOWk5gLAG2+8gXvuuQePPfZYFtOHQiFX43EYuLfVh97DqalwaNy4cTjrrLPw9a9/HSNGjChLIHCAWymF2267DT/+8Y/R0tJSkjZAnnCd1RGawG2TQA+H8JWrL8UBZ5yEjvYOkF3XYSnQVMYAYH3QkBKD6gfjsZvuwFN3/hG6rtl7JS8QOolAD7JyYf76+vr929ra7jcMY2yuyl9I8nv/79j60WgU1113Hb73ve8hFAqVlWqbq4E8/vjjuP322/Hcc89lMb0juYtV0G2LPeoNxzk+ktraWpxxxhn49re/jUmTJvmCVbkA54oVK3D55Zfjn//8Z15toJhWwDmHtCvwDjvzZJx02UVIaRxmIgUuBBih27zBkjxq1HMA6IkpwMBA0qqKrGkYiAXzn8S918yDAMvb28ATBlScc15TU/ONnbmiTtaeHDx48DdaWlp+rZSK+dn7eW7ClYxeW3/WrFm47bbbsNdee5Wd1DdN01VlX331Vdxwww144YUXLBTUNJcZexq2yw8CVLK/12GqdDoNAIhGozjvvPNw1VVXYdiwYWX9LH//+9/jqquuQmtrK0KhUFbpcbFn6E5l4gymYWDCvtNx1s+uRWXjYHR1dEJwYZXkdtu63Z8t85lOVUpWYC4AqJz0gayCJGUBEtM1xGIxCEV47cFH8fBNd4BIgufxj3n+RkTEdF1v2X333SftLADgABRjDDU1NTd1dnZe6bVNSrHjvCWm6XQaQgjMmzcP11xzjRvuKyep7wDV6tWr8cMf/hD33XcfiMiV9n6Sqycddv0pdwpPaedzNCkiwqBBg3D55Zfju9/9LsLhcBbj7WxyTCLOOZYtW4ZLLrkEzz77bN4io7zP0079d/xGg5qG4pu33IDh0/dEMpECeHbHIcdPwJRff8fM486kCVCPAMAr5XOvX+PWODGzoxMrFnyA5+77Gxa9+Q64sPoW5Kuh9QhOpzPQXxOJxBk7gzsEAHn88cdX/fvf//51Op3+GjKNClkhqZ/r6GOMwTRNTJgwAb/73e8wa9asLGYrN0/2XXfdheuuuw6bNm1yZ8HlSquegkBhEyA3p750bcLrSAWAvffeG7fffjtmzpyZlZdQbtrATTfdhOuvvx6pVMo1/wo9SwarL5YTAuSCw0gbiFZV4qs/uAwDRw1HKpkCchL+iAhckVuyy5Ap8WfMkeK2ZuBpOJKZjNS9w5EXkNxuSspqCEJSQqZNxJvbsGbZCiz7z3tYvXiZxVCaZs16zLPGOfwjOeeirq7uwM2bN7+xM5gfVVVVA8Ph8JuaphHnPC2EICEEaZrW7XBeE0IQ55w456Trulsbcf7551NraysRERmGQeVEzvVs3LiRTjnlFDuqxCgSiRS8z205nGeUe/T2fJqmUTgcJgCk6zr95Cc/ce9PSlk2z1pK6V7Pf/7zH5o6dap7zbnPpZR7dmpxuCaIcUZMcPcAZ9b8Ng7rd8Gs9zD74NYB+yfTOHGNW+fKOjT7J88cghETzDo3KzxdRmjWtRa6L+99M8ZMzjlFo9EnvJm0O4p0ABg9evSUWCy2zL5goxTm995EKBQiADRo0CB68MEH3Q1gmmZZMX86nSYiopdffplGjRpFACgSiVAoFCoKdD1hTk3TSNP1kp7dtgCBw0gA6OSTT6aWlpayA12llHs9nZ2ddOGFF1pMbAuNnjwD57kKbv2u6xppmiBdE+5PXdNJ13TShOY5hH1k/iaEIKF5mDLnsP5mM6lzje5Pz2fsa9I1nbiuEROF1zZn7RVjzNB1PTlixIhJKFI52xeefsRisWm6rm+yN2mPmN/ZhABo5syZtHTpUncDKqXKUvLfd999LmD5Sf1ijJ+7uJqukR7S3c2MEmaQMcYym1nTrI20DRqCow1MmTKFli9fXpaal1cY3HvvvRSJRAgAhUKh3oGgu16cNN0+NN5z4NY8PzWeORxGFjyvBueuE7MPD2j4raXP39NCCBowYMC1Xp5kO0jyG01NTXM3b958l2ma1ZzzvE07/Ox9b+XexRdfjF/+8pdl55DKtUf/7//+D5dddhk0TXOvvyTbnQgKCgzcWhxh2Y/SMJEzBBmxmmrEqmtQWVOFUDQCYVeFJVNJxNs7kWjrQLy1LcuN7DSStBpUKnvcd3a3nGI+Al3XkUql0NTUhMcffxzTpk0ru7XwhlvffPNNnH322Vi+fLnrF+hVY9KeRfmy2xNn/U75Bqr3FRlEpIdCoUeTyeSpdp9Mhb7Nc8rE+CORyJlSyj/bziOVT/Xw6/DrePkjkQjuuOMOnHfeea4HuNxq9B0m+OlPf4rvf//70HW9x1NqFCkIMIBzmFLBTueCFtYxdNwYjNpzEkbtMR4Nu41A1eBBiFVVIByJQGia7aVSUFIinUoj3t6F9o2bsPHzlVi9ZBlWfrQYaxYvRzqRzOQBCG45mQo5ynxCS46DcODAgXjyySex7777ljUgb968Geeeey6eeOIJhEKhrCKr7Q08Oxv4cpmfMaZXVVUtOPvssw/61a9+lfZiWF8BAAMgOOdmQ0PDNZs3b/6Zk9mX26izUMzSYf5Ro0bhL3/5C/bff/+ybcdlGAZ0XceNN96Ia6+91t1kfp15s7Qcb+yIMQhPy3EtFMbYfaZiyiEzMXa/aRg0fCiEXcwjpQlpSpCUtrJPmZCS7ZkWnENoGrguwBlgpNJoXrMOS954F+89/QKWvvO+7aXmEIJDSVWwui732p326HV1dXjuuecwbdq0ssoV8IvEXH311bjpppt8ew30V6bPcx1kl81rkUjk36eeeuoZf/rTn7YiZ1Q46yvmZ4yZtbW1N3V2dl5pmqa0GZ+VEuLzMv+hhx6KBx54AEOHDi1LCeOVMr/73e9w0UUXZTG/H/MwwOoP731onEPZIcGK6mrsf+Ic7HfSMRgybgyYJpBOpWCkUlDSdIc/cMYBJjxdZTP56wS7Nt29DgITDHokjGgkCplMYvl/P8Srf/kH3n36JUtd1uy+fX6dZZ1QV856OTkDQ4cOxauvvorddtutLLUzb2/Ce+65BxdffDFSqVTe7MGeCJgyk/oEq/OvJoRAJBK554orrvjmvHnzVC7z9wUAOD37zHA4fJOU8kqllOFXv1+oP5+D2ueffz5+/etfu9ld5SZZvNLlySefxJe//GW3933BakW7AyRTdu244JCGiVA4hFlfPQWzzjgVg0YPQyqVQqorkVW7r5jTRZb1arM6QygYJ4SrYtCZhpXvfYSn7voT3n/uNctpo2vWsAniINZtz3RbNwcE9txzT7z22muoqqpyNYRyIm9h0euvv47TTz8da9as6ZYv0JNnuq1DaHujyeY5v7IPzRagG2Ox2DXt7e332h2AmN9Csr5gfl3Xf05E3yMiwwn/5d6sn+T3Jsb8/Oc/x/e+972yS+zJlSpOFtp+++2HtrY2t1il0OI56Z0kOMi+3z0P2g8nX/ZtDJ06EYmuLhjxJDhn2X3qYSWY5Lac7sFuy/ihuNVIEwSEK2PQOcfHz7yCh3/5O2z8fBW0kA4mCRJUcKPkmmsnnngiHn300bLunOyYa59//jlOOeUUvPfee74gUIxBC9Wl9AQAejgxyRmi7Y32CKtdBoOmafFYLHbfkCFDfrJ48eL1Nk/mHa8ntjfzh8Phm5RSVwIwGWO698YKSX4nfTcWi+GBBx7AN7/5zbJuyOltvXX88cdj+fLlvh1rfBGXAGgCyjShRUI49XuXYO73L0N0YC0629sBqUDCAm2W5S9wvMfb1siBMQahYI29YhwybSCdSmPYnuOx37FHoLO5FSs/XgzGGezGMkUlmFIKuq5j4cKFiEajOOSQQ9zCnXIjJypTV1eH008/HR9++CEWL14MTdMKOgYLVaPmcKfySOW84VnGGHka3eR9H2W+zFHjmS3VOWOMCyGYruuLIpHI7WPHjr149erVD2zZsqXT5klZdD9uR+b/uZTye7AnkRZDzdyOPfX19XjkkUdw4IEHuihdruSo/j/4wQ/wk5/8xA1L5gUMZKbMMI1Dpk0MHjkM59z4A+y+3wy0t7Ra7bA5B3PHR2XGSnlHTPG8AEAlL7V34KT1wwIzLRRCJBrBS/fPx8M33QFlr4OSKm/MyCvBHIZ/6623MH369LL0B+SuoZQSF154Ie6+++5eNxpx/qxpGssVEtuS6p0LXMqiuKZpGxhjSzRNezMajb588cUXvzNv3ry0R7ArlBBlZNuL+aPR6M8Nw8jL/Pkkv6M6jhkzBo899hgmTZpUts6+3I3z9ttv46CDDvKt4ssHAI69P2HfaTj3lh+jsn4Q4q3t4JrIMLknHKp8akPzAQAVWnPK5J/n64nvamiKUFlbjUWvvIm7r5iHzpZW6CELBIppRQ6Y77333njzzTfLtsGq14xz/CvXXXcdfvazn7maQL7Zink0WSWEoMGDB19XW1v7eiqVqjAMwzRNs9ssS8dx7Oz/UhzMQggMHDgQnPN1W7du3fLEE0+07rPPPkbOdWgeX0DJDLzNzF9RUXFTOp2+0qk0KlXyO8w/ffp0PPbYY2hqaip75veOvJ45cyYWLFjgOinzbQ4FAlcAFwKGaWD6EbNwzs3XQwkNZiIJJoRVc+6ZSZevkozswhXGGLJHRfi812tbEivoOMwajGGDXNWAaqz+aBHuuORqtG/YDM1uNJFX/8jR6G699VZceuml/WZNhRC49dZb8d3vftcFrUIj1XNeV0TEiOhTAEcA+HwHXDq3DypV4m8vAHDsD1lVVXVTIpHoNfMfeuiheOSRR1BbW1u2nn4/6e8N+RWdEagITLO6z+w9+1Ccf8tPkDRMSMOwwn/2jPvcTDHrT9lsrTyVawxkTcWx30UFnjtjPCvvqxAAwAYYaZqoqK3CuoXLcNv530W8tRVCMJAqPsyTiFBTU4NPPvkEgwcPLsuoQL4Iwf33349zzjnH1Wj8yop9AMABAa7r+taxY8cevnDhwg8AhIrZ4T29VHRrSL4N/pBefk7nnJsDBw68KR6PX0lEJmNMK6Uvv5f5TznlFDzyyCOoqqrqF8zvLHpzczNOP/10dHV1FUwmyUhEy8E5dr/puPhXNyFlmpCGtJifrFgggZCWJlJGGso0QUrBlBKGlFBEEB41moGsEcrc49ln3V2DHI4j0TH1yT4yG7lblwDG3MYWQgiku1IYOLIJoyaOxTtPPW+Vp3qjCcx/Cq2maejs7EQqlcIxxxxT1r4Ar//CNE1MmzYNe+21Fx599FF7UpHwdQ765LQwAFIpVRGPx2dPnz79r2vXrm23pbRECbUbJR7b7757w/wAjIaGhitbW1tvMk3T8Hr7i4VGnBTSb3zjG7jnnns8vdvLf/RWjx1/RG6CT+3QBlz94O8RrhsAsysFCA4oS24b9uz3+mglRtUOQkPlAFRoOlJKoiURx+dtW7C6sxkGI0RFCArKnaFujbAmN/GH7IJ0BxQKa4/5U3+9v5tmGtWD6vDanx7Gn2+4BZrtKBNUvHFmKBTCRx99hN12261sw7m55Dign3nmGZx88sno6uqCEMJ3uEbuPrd/mnYizjtSyiMAOCCgyu1eeypyndz+M7q6un4npTQ55xrsDL9izO9I/gsvvBB33XVXWcf4C0n/c845B8lksuj7wZjVookxfOvmH2HYnhOQaI9b+ff2s0lLA1HGcfjoPXDk7pMxrq4BDRXVqItWYHCsCiNq6jClfhiG1QxEe1cntnR1QucCJlkhNl3ToYVCCEXCECEdQtchOAcIkEqClMqeM58bB/AfQ5v9fsGR6urCuH1nYMuqtVj1yRJoQrNyBAoUEQkhkEqlAABz5szpN0AvhIBpmhg3bhwOOOAAPProo0gmk91AoAB4csaYqZQaHgqFDj3ooIP+vnLlyhR2aP3P9tcANMaYOWTIkNO3bNnyFzu3P0uDzJfW6zB/KpXCRRddhN/85jdl11WmGDmOrNtvvx2XXnppQenvpN5ybm2kI7/+FZz2wyvQuqUFnAvA7jFnmAaqtDBOnrg3hlRWW9JUUbfUXif11ySFJxZ/gKXxTaiurECyI47OllZ0bG1BV3snSCmEohHEaqpRM6gOsdoaN404nUzZvGx1u2XgBTeyd3eQPetK00JQ8QR+dvp5aFmzAVwIKDuxKZ8ppJRCbW0tFi1ahPr6+rye9XJe8zfffBPHHnssWlpa3AhBKQIDgAFAj8ViT8Xj8WPQg/BcuQGABsCsq6vbL5FIvJ5Op7mN5D1i/ksvvRS33nprWXWZLVX6Oxti+vTpWLhwYd6N4HreOaCkQsPokbjmr3+A1AXIJNd1Y5IElxKn7bk/RlTVQpGycvvz+hEJjAgmgFsfvh9/f/AvWL/kU2zZsBGJjk6Q9NRRREIYMKgOjWNGY9y+0zHxwH3QOGYETCKk40kILiymzpJcopufyS0RBgM4oEyJitoB+Oipl/C7S6+FLgSI8k/FdXwB6XQat9xyCy6//PKyjwjkA4G33noLc+bMQWtra09BwCQiTdO0P0gpLyAizeMP6BcAIADIpqamvTZu3PisUmqw3V6IF/P0e5n/29/+Nu64445+x/xe2//f//43jjrqqPwZf24CDwDOoKTExb+6EVOOPhSdre1gzFIhiQHJZBIHjhiLw0aML8r8udfx7oIF2HuffdwF5FxYDSHtqkClFLx9bPVoGJMP3h+HfX0uxkzfC6nOLhjStOfH+fkEsgHA3Sh2v4Gq6mrc+e2r8P7zrxWMgjjmnWma2GOPPfDf//4Xmqb1u2nLjk/gjTfewDHHHIO2traCLcj9QIAxptXU1PxfS0vLZY5ALYd746Uw/7Rp04a2tbU9S0T1dieakpjfsQG/9a1v9Vvm99KDDz5oPbQ8dqwbuhMW80/Yf29MPvwQdLR3WK3L7WQgJSUqQmFMbRhpD6cszS52stZm7L03Tps71+oSGw6BWIbplVWLCSEEdKFB1zWYiRTee/Zl/N83LsX8n90KZRgIx2JQsvToVKZfgOW3OPaCc63vlrKgGHHi6wsXLsTbb7/tDiXpT6TrOkzTxAEHHIB//etf7jDZUvwZ9l7XiMhobW39bjgcvthv7kU5AgADQLNmzRrw8ccfP5JIJOrtMV3cYfTcNEfv3xxv/7nnnovf/va3/Zb5nXvp6OjAs88+627qgp+xh7Icec7pIAHb22+zEQMMUhhcUYWacKTHhT3O8/3yccdZ9rTypBjbWXxOV1kJCVNJMMGgaQKQhBf/9Hf88tzvYPOyTxGpqbJe970C7zD77KhGMt6FpqkTMf2ow2BICZYnfOustRPeffTRR31NxP5AmqbBNE0ceOCBeOKJJ1BRUeFOTip2P7avS4NVpvvrhoaGU1AgXb4cAMCp6VfvvffeX5VS+9moJQptylxv/5lnnom77767X0t+h9nfeOMNrFu3Lq/6n7H9OZSS2G3KHpg4c2/EO+OWV97dDARSCrXhmJ3C1TNmcBynY8eOtcwCz7V0a/FCDMyeV63sHvaarmPt4k9x6/mXYdV7H6GqsspK8c3qWWAzvjPr2icaYsgUvnT6yRCapQrnc297J/k+/fTTbpVgfyRN02AYBg4++GD8/e9/dzs+OYNp8q1V5r+MGYYhN2/efO/QoUMPsEFAlCMACMaYWV1d/dt4PH40rJ5iJWX5Ocx//PHH47777nNDP/1V7Xfu7+mnny6o/uc6VQ488RhokQhg5rC4PVRCZ9u27r1lImk7tTpb2vC7/7kWG5d+inBFFNSDqAxjDMmuBJr2moDdpu8JMq2kJmL+IODsgSVLlmDhwoV5x3v3F3PAMAwcddRR+Mtf/pLVqyGvUMi8zplV3le1devWhwcNGjQEmZkYZQMAGmPMjMVi347H49+yJb9eilrqMP9BBx2Ev/71ry6z9FfmdxhNKYVXXnmluPpv27fR6kpMOHA/JBJJX8BgYOgyUr0GJCLCunXrSgIkP+aVUkLXBOIt7bj7mh/DSCSsnoI9UM2JCCKsY8aRh7j3zguYM5qmQUqJV199tSQzqj+AwMknn4w//OEPBf0BPtWAHIBMp9NDOjs7n77gggt0ZLcM3akAIACYtbW1RxiGcYdSyu3eWwjhvDb/lClT8M9//hPRaLTfJPkUUv8ZY1i3bh2WLFlScOMSs2LsRIQx06Zg4LBGGOmUOyKKbCYhArjGsaWrE6leNqVkjOHFF1/sNbgyxmCQgqZpWLfkUzxx2x9QEYtZjkTGoBgrYphwCAikE2lM2H8fhGIxmNLMTM4poEm98cYb/V4oeEHgvPPOwy233JJl2pTg4xCMMTOVSk257777HrTfz3cGCOTGgeTIkSNHxePx+aZpuok+pTC/YRgYNmwYHnvsMdTV1fWbrK9S1P9FixYhHo8XjV87y77HzH3AdWFl4XV7DyHEBLamOrG6vdkClRIlrwOonZ2dePjhhy2VvpcedU7M9dC/PP8xrHjvA0QqK8CkLKoJWGOuOIxUGoNGDceICWNB0u5lUORZfvTRR+739kdnYC4ImKaJyy+/HFdeeSUMw8i7R3zuVWOMmVLKUysrK39qO9jFzgIABoDNnTs3tGnTpkcNwxhgdynhxZjfqYUfMGAAnnjiCYwcObJsO8H0FgAWLlxYUN0mIjCyR1cLgd2m7oFUKpU3VVQxBsmB/6xbDonS80MNwwDnHD//+c+xdu3agm3Hi2oBTuSAc5Ah8ewf/wqNsx5FJUgRtGgYu0+fbG8mVhQAVq5ciY0bN2JXISdt+KabbsLXv/51pNNpd11KWBtNSmkkk8lramtrz8FOiAxwj0oin3rqqXtSqdRUx+NfTE3zNpL429/+hr322qtfe3nz0eLFi4urrZxZ3v3GBgwe0QQjlS4wjZYQ1kL4tH0LXl+9zK7XJ5im6VtPIaWElBKhUAiPPfYYbrzxxpKz0fKaN9wCAaksB97CV97EuqUroEfDViixyJo7v5MijNxzQsbeLaK9dHR0YPXq1f3eD+B9Bo6f6K677sIRRxyBdDpdcrYjY0xTSsn29vbf7YzIALcRx6ypqflOMpk800lSyCf5c/vCm6aJO++8E0cddVS/S/Ms+nBsib9q1aqitp2j/NYPHYJIVaXV3DTPZ7j9bCNaGK+vXYbnVn4Csho6unFlb0caIYTbg+C0005zXysmYQq9x5kGxMguV06lsfDVNxGOhDP5/blGKXG7Bjmz+dPSxKBRw8B1vWhikSMY1q5dW6qt3G9AwLm/+fPnY88993TLiP3WIIe3GGOMKaVCmzZt+uuYMWOGI9P7b4cAgDl48OAD4/H4L5RSRSW/t6GHYRi49tprcd555+1yzO9dqE2bNhXfsPZ7Bw5tcDvnFFPsOWPQdR3/bVmLXzz+Fzz4lwfR3Nyc1UarpaUFTzzxBGbPno2LLroIhmFst4EWubRkwQcgw/SpIma+oS7GGJRpYsDAOlTW1kAWcWo6r61fvx67GnlN4X/+859oaGgoOVvQ8b8ppYavWbPmgQsuuEDzw9++IG3SpEl1n3766f1SSo0xplgRvd+RSKlUCqeffjp++tOf7pJqvyN90+k02traSkAL68eAIfWeOvzizACpUFNbg2ff/hf+/tPbMHToUIwZMwY1NTVob2/HsmXLXIYpZeZA7vWX9F5b5d+0YhXibR0Q4TBISfs+GPLGBBhAhkSoIobogCq0b9piv7vwd27ZsgW7Ijmp2rvtthv+/ve/4/DDD/edQ+itiPSsj7DcPMbBf/3rX68G8GOU0NV3m4Hr888/v9YwjN28ab6F1EnOOdLpNGbOnIl77rmn3yf6FKNUKoVEIlECYlg/ogOq7XLb/DiRa0czApLN7RBCYP2GDXj11VfxxBNP4JVXXsH69euh63rBbrXbDHZ2l6B4Sxs6W9shNF5yfiIRQYQ0xCqr8mJe7t7o6OjArkqOU/DAAw/EH/7wh55GaQQRqWQyefk+++wz0Gb+PmUsrpQ6ye47nlf4ezOapJQYM2YM5s+fj2g0mmUr74pkGAbS6XQJNqv1WigS7m7zeY9cJ5ptPiQ645ajT9cRCoUQDocRCoVcZ1+f9k8gq3w5mUwiHe+ycvspu+1c3rZnsJqdhsPhYkqPS11dXdiVyakb+NrXvobvf//7PeERDoCklDXLly/fz/O3vgOAUCi0mzNkoNiYI8fbefXVV6OpqQnpdHqXZn4ALvOVov5bdj332NDF5ag9y9P9Dq/X35mS5CdRexKh6YnZI326/pJPD8rMeYtPtcm9B2f46a5MjoP8xz/+MSZOnNjNH1DIlFNKUUtLS3iHXGc6nV7nmUxScJiBo+7ffPPN2LhxozsEc1dfyNJALjPTMIMIpc6Xg6tN+WldO8TnAYALDk0Ia0BJqZon8953afkMu7rQcJ6Hpmm4+eabsWjRoqJhWy/PMcZYNBrdITXTXAjxnK37F+VkBwCWLl2KM88805VQu0o4x490WyUvzPoZmZlOJHOkY+FGrs5k79qGQb4MtCOeLQcDKSASiSJaVQGpJMAIZB9ZmgDLPhgDpCmRSFp+ElbC5eaC3a5GpmlC13U8+eSTuPLKK3sStSEiYpqmxUeOHPmOw3Z9uvYDBw68gXPebW64nwPHqeIKhUJ4/vnnccEFF7iez12VIpGIu2FLkcbx1jbX1meeFtuFVHVDKdSPHmntgJ2gUTkVv1WDalFRVwNlmsgeV+cV9tkdqhlnMBJJJNo6SgasysrKXV7yL168GGeddZbvgJEC+0gyxng0Gr3NM9izTyUAX7Vq1WexWOwCWwuQfmpJ9zbRJkKhEO655x785Cc/cZ0euxI596zrOqqrq0tSoQGgZcNmSwqWABbOs02lkhiy+yhUDqyzniPr2TVuE/Pb3YvBgCG7j0K4qsLq8lPiRQghkGjvRLy1raR7BoCBAwfusv4izjm2bt2Kk08+GS0tLb6DRfJ0z5YAtHA4vGDmzJk/wg5qI84BaG1tbY+EQqFfAdDtCT9FN56UErqu4wc/+AEeeOCBXRIEnIVzJtuU4ujasnY9jHTK6tFXou1NSQM1DYOx+zQ7p57vmJyK7JbOwPh9pgE9CAGCCJqmo2XTZiTaOooW+DjPc/jw4bsc83unRZ9++ulYtGhRSVOj7OeliIhrmralqanpjKeffjqVI1f6FAAkAO3YY4+9QgjxIqzUYFnMDnVuVtM0nHvuuXjppZd2ORBwNuyIESOKA4C9VptWrkK8pRWapltNQv3yuZjKOhQAxTn2Ofpw61yy9FTfXqo39g0SiFn9C8MVFZh48H5IJpPgnHUb9uH1a1jmPwMUg9BC2PjpSsAt/WZFn+fIkSN3OWeg07D1ggsuwHPPPdetbXyBvUMAlKZpGDRo0JkrVqxYjkz7cOwIACAAav78+elJkyZ9RdO0VUqpohfgtWtM08TcuXNdb+eu5hMYN25cCWhB4IKjvbkVG1astCMk9tQe6i4pXI+vzQiJeBcmHbI/Bo8c7hboeN+/ncWVFfLjcIeUTDtqFhp3GwXZlS5ZlXeu//OPFhUVV47/aMCAASUBan9z+mmahhtuuAH33HOPy/yFwrWedTU551pNTc3V69evf9ZPAPc1ADieRvH+++9vrqioOEbX9aSddUbFZps7td1btmzBcccdh/Xr1/vaPf3ZD7DHHntkSbB8UlVwK4FmxXsfQROa26ATBWYHkl14o0wT4dpqzPnGGbZvIHvsVrF59T1WV+F4/xW0WBhHfuMMGGkDjIsS7X8C1wRS7XGseO+jrPMWepajR48uyaTqL+T0ALjzzjsxb968vGp/ns7ZJudcj0Qiv29ubv45dkK7cK8OJgFora2tC6PR6FeFEJyIpHW9BarKbH9AKBTCihUrcMIJJ6Czs9MtjthVACAWi/nmdedKVgD45O0FkCnLD8Dcid9OcRD5SlHOObraOzDz1GMxbu+9YBp24oiivJtoWzQDBkv6K6kw+xtfxfCJ45CMJ9z8f7cpaHf7xQYnQigcxvoVn2LDZ6vAhbCmIOfbaLZGM3XqVNeRvCtIfl3X8fDDD+Nb3/pWSenantckY0zTNO21c8899ztE1Od5/8UAALCnmLS3tz8aiUR+YM/9k6UwihMZeOedd3Dqqae62V79OUfA6fY6fPhwjB8/vuBYKwZ7eg9j+PzDRdj02SqEImFrnrfjJSAFQOWG0i1byxb5Jmc464YrEbVLihnnWRqEX2Smp44qwM5ZN0yM3Wcqjr7wbLS3t4NpInM3DvNTdp0HA7N6H4KgRXQsfOUNKNOEzoXtBym83gcffPAupfY/++yzOPPMM91K2BKZXxGREEKsGjdu3Bm/+tWvUuiDyb+9AQDA6l2udXV1/SQcDj+klHLVkmKagAMCzzzzDM4880zXROjPIOD0fp85c6ZbplvIESg0DelkCv99/jVEIhEQqazkGN9H4TA1Z0h0dWHQuFE45+YfWva5UmBCdOvQ7f9M80+RzurjYBes1I8YhnN/fgOkbQrkrqdvHoNtmgghkGzvxIJnXrJ3tCpoOTh746CDDur3DkDvuLBTTz3V1QxL1HiJiCgcDqcbGxtP+eijj9bsSKdfKQBAsGqTxbHHHvvVWCz2rg0Cspj32WsOzJ8/HxdeeKGbKNRfQcCRfkcffbSbp194da11fPPxZ9DV1gHuIxnyASkRQXCOjtZ2TD7iYFzwixsgdA3SNCG4sIaAFLHLcwEg67sYg9AEpGmiYeRwXPz7W1DRMBDpVCpnTFjOKXP9nVIhGqvAstcXYN3SFdCc/vjkL/Ucc3Dy5MkYM2ZMv24W6zD/Rx99hOOPPx6dnZ0F03xzxoY7Hn8RiUS+snr16gU72ulXCgC4O2n+/Plq4MCBx+u6vqonNoqD9n/4wx/w3e9+140M9EcQcDbqIYccgsGDBxe0XRmsFllC07Dxs5X44IVXUVFVAaXswRk+CSCW48wyDcCcqUoc7c0tmDbncFx65y0YOLQRpmGAMXsGIKyJQMzrJGQZ1Z0cdcFTTyCE1aTUNEyMnzkD/3vv7agd0YRkZxe4yI44ECkQFAgSxFS2VgC41/DS/H9kQNKnk7Bzv84znD17Njjn/TZK5DD/0qVLMWfOHGzevLngjMAc5oetSYtYLHZte3v7P1AGMwJFEXEi2tvb24cMGfJWZ2fnV5RSIbtwiBXyRDshQl3X8frrryORSODoo4921en+5P11tJpYLIaPP/4YH3zwQdFmnFavPIXmtesx8/jZkPZMQHfsd+79M8/fWEZqJpNJDNl9NPae/SV0tLRi9eKlVvMOYuCaAIPVi9+ZCOTY52DMckByDsatgZ5KKUQrKnDst8/BV66/AlosBqMrmV8Ss+6pq4wxQBFiFRX4dMGHeOy2u6AJzW0hlo+cUuZbb70VQ4YM6ZcagJPi+9lnn+HII4/E6tWrS0r08ZDBOderq6t/39bWdhXKZEBosZQzAqB1dHSsqq2tXSClPFtKSfaGYLmb2a/zia7reOWVV2AYBo488sh+CQLOhq2trcV9991XygfAhUDrpi0Y2NiIcXvvhUQ8Ac6zx+26JUR5mmhwxpBKJqFXVWCf2V/C+BlTkeiMY/PadZCGCUXKZj7rvbDPT07PQGUdVQNrMfOEOTj7R1di+pzDEU8mQYZ0Jb+vWce6+wMcCofC+PMNv8Cmz1dB6NkDRXLX1TEB999/f1x33XX90v53knxWr16No446CitWrEA4HC7I/DlmnklEejgcfrijo+OcefPm7RSPf28AALZzQksmk8urq6s3JZPJL8MKYbBcEMg4jlg3EHjppZdARDj88MP7trlFH0YDRowYgccffzwr1yHvPdgYufKTJdh39uHQK6NW00yPpC8EAI7Nzu2R3EYqjfrdRmKfY4/AXofMRG39YIAIqXQKqXQaJKXF8ETQYxEMbhqC8fvtjcO+cRpOvuJi7HvSbGhVFehqj1vTiHnGRPDVZlh36a+UQuWAGrz3r+fx9O/vhxYKAQVsX6/9f/3112PGjBn9rmW8w/xr167F0UcfjcWLF3fL8vPes0/lnwlAq6io+M+VV155zGGHHaZ2lsc/7zYtkTQAZmVl5ZWJROImKaXBOdcLaQHemnanldgPfvAD/OhHP3L7CPYXEHDsv7vuugvf/OY3u9l+fiWfTlOI/Y4/Cuf+/Idob2kD0zQrMsD8H39uCq7TbdhhQMYYwtEIQuEwzGQKHVtb0LalGcm2DmvuXySMiroBqB5Uh2hNDcA50skkzFTaMglyrjNvNME2ATg5mgVB6DrMeBduPO2baFm7EdyeOEygvOclIjQ2NmLRokVuUVV/W/OVK1dizpw5WLRoUV7m93P0woqoCU3TPpk2bdrh77zzzkZ70csmQaYnVScEa5DBqzU1NU2pVGofIjIYYyIfAOSCgaZpePHFF5FOp3HkkUf2K03AucYJEybgwQcfdCu9CjXucKYmrV60DPXDhmDMtMlIdHVZGkU+RmA+T91+n1NaaqZNpBJJmNJqyDmgYRAGjmjCwNHDUTOkHuGaShCAdDINI5kECN3KUos6ZJkzAcj6qUCoqqzEn667CcsXfAAtpFtJSiy/L8hR/7/zne/gmGOOcaVpf2L+FStW4Oijj8aSJUsKMr8PEEgiEuFweF1DQ8MhnvLessqO6+lqEBGJZDL5WCQSGSal3AeAAZ/5gfkYQtd1vPzyy2hra8OcOXO2KbFlZzgDI5EIQqEQ/vWvf5U83ooxYPHb72HqwfujunEwjHQ6b8sulnN0c8TZXnjGmR11UJCGASNtwEilIQ0DZCpLiDPuG94rKRhjOyY5GExlonbgQDx/91/x7D0PIBQOgaSd0OTkJ1B3VVgphZqaGvzxj39EZWVlvwF7h/k/+eQTHH300fj000+LMn8OsCoiEtFotHPChAlzli5duhg7Ody3vQDA/Zxpmv8UQgwjon1sO4f3BARef/11rF27Fscff7xrJ/YHECAiTJ48GX/729+wdevWkkCAcY50IoVlH3yMfY85HHooBCkVOON5jbBMVj3zhlxcj7/7fw4QY7a0ZlnoQd3yAry9/VgR6Z8BvYrBtfjgmZfxp+/fZKX8khV6ULxbwCAr01BKiauuugrHHXecWzNS7mQYBnRdxzvvvINjjjkGa9asKertz2V+AFzX9c66uro5y5cvf6tcPP7bEwAAQCil/sk5H05EezPGDOQMFckn5RwQeOedd/Dhhx/ixBNPdG3qcnYQeTsi1dfX4+GHHy7uDLQlrhACbZu2YM2iJdjv2CMBzkGmdD33fvZWxi/ActWBHlhtfvZ9cfcPZwymNFE1sBafvfFf3Hnp9yENw4pkUAYk4GP3O8AxbNgw/OlPf0IoFOoXreMd5n/22Wdx3HHHYevWrSUzv33fyrLUeGckEpnT3Nz8Wjkz/7YCAGyG/2csFptimuaeAAzGmPBjnNzFV0pB13UsXLgQr7/+Oo477jhUVFSUPQg4iSxTpkzBa6+9huXLl2dlgvnmRdgSXdc0bPx8DdYsW4F9jj4MCIcg0+k8WXgsrx+ikIZV+uuFh5aYypr489mb7+OO/7kGqY44QkLAqg8r/L2O9P/Nb36DffbZp+wnRTsZnk5hz9y5c5FIJHrE/ESkGGOcMdbJOZ+TTCbLnvmBbes5ThYfKz5//vyvVldXP01EOhEZxdqLu5vMzhh88cUX8aUvfQkrV650Byv0B4fgHXfcgWg0WrIPw1ASWkjHhy+8gV9fdDWoI4GqqupeZ8b1Ra8AUlZr8AF1A/HhM6/g9ouuRLKtA5quQ1JxZnBGxZ9wwglu49hyVv29jW1+85vfYO7cua4PoFTmd9R+xliccz7HNM1+wfzbQwMAAPbAAw+YjzzyyMOPP/74Xul0eqLjGCxFQjmawLp16/CPf/wDBx98MIYNG9aTuWo7zSFYX1+PSCSCZ555piQtgNkMJnQNm1auwUevvokxe01Cw+iRSCVTVjktt2x+xfwt9cLlyMxj7ucZOm5X+bm5e9ZMGGs2gZTQwhoqKqN4/u6/4E8/uAmmaUDTdGtUmMfBkC+USEQYNGgQHn/8cbf5Z7mq/o7pxjnHDTfcgCuvvBK6rhcs7PEBe0VEnHPeVVlZeXwikXi5vzB/cUOwZ5qEIiJRUVHxl0QiMdf2CeilbAAnXGYYBqqrq3H//ffjhBNOcM2BctxAjuQQQuDoo4/Gs88+C13XfXsGZP3fdqAxYeUI6NEwTvnuRTj0qyfDJIV4PA6NcSjBnEkNWWxcGAByAJOp/ADgYVppVyxW1lShc0sz/n7T7XjniecgNM2y9amo+usykmEYeOSRR3DSSSeV9cBYRzORUuJb3/oW7rrrLoTD4awpTPnu1av22zZ/vLKy8ri2trYX+xPzb08AcM0JxpjinN9FROfZmoBeyuZ1ssYc9f+WW27B5Zdf7pYTl6Ma6WyUjRs3Yt9998Xq1at9nYLd7tvpEqRxkKmgSGHPg/bFyd+9EEP3nICuRAJmMg044T7ybDzeAwDo5vwjT50/oJRVoBWpiIELjo+ffQmP/PJObFm9FiHdGvqiGLnJSF5mz80n0DQN6XQal19+OW655ZayZn7n2jZt2oSvfe1rePbZZxGJRHqS4ONl/g7G2LGmab7a35h/ewOAV9NVmqb9QSl1fk9AwHndccpceOGFuOOOO1x7rBxBwLmut99+G4ceeijSdoy/KAjYar5mZ9oZhoFQNIxDzzgJh505FwOGD4GZSCKRTGYabrLuzTqzbNEcAMj+TgsASNqfERzhWBQhYvjsw0/w7D1/xgfPvQoA0EMhuzU43IQlvzTXXOY/6qij8NRTT7lgXm6am7OvNE3Du+++i69+9atYunRpScyfY/NLpZQIhUKdoVBoTmdn52v9kfn7AgCcc3LGmIzFYn9IJpPnK6VMxphWKgg4zqR0Oo1DDz0U999/P4YPH162UsW5rvnz5+O0005zcwP8ZirkVZ/s6IJSClWDarH/CUdj/y8fhYZxY8A4RyqZgmGkLebyVv3ZflwrIVflLCpzTQ6C1bRU10MIRUJIJZL49N2P8PpDj+P951+BMk2rkzEjd1x4Lij7MYbD/FOnTsWLL76Impqasqz2c2x6zjkeeOABfOtb30JnZ2dvJL8EIKLRaEdjY+Mxn376ab9l/r4CAFcT4Jyrurq6O1paWr6tlJKMsay+0cWAwAGBYcOG4YEHHsAhhxxStn4BBwTuuecenHfeea62UuJEGOcN4JzBTBsgAKFwGOMP3AczjpiFMTOmYMCQeohwCFJJmKYJaUgoqTKJOVAg5tjjAoLr0DQNIV0HcSDR2YGtn67G4rfexXvPvoTPP/zEes5cA9esoqNSJamX+ceNG4cXXngBTU1NZRny82qP1157LW688UZwzgvW8jv3mVvYo5TSdF1fMXHixLkffvjhf/sz8/clAGRpArquf8c0zduIyKki5D3VBHRdxy9/+Utccskl3Ra1XEHAGSzqlECXes+MWbX8yjQhbclVUV2NERN3x2577YGhe4xD/cgmVA2sQygWs/Ly7QQdpggkJdLJNLraO9GxaSs2fL4Kny9cjM8//Bjrl30O0+7XKDTN8jNIVVJpmpcZdF1HKpXCxIkT8cwzz2D48OFlvSbr16/Heeedh6eeegqhUKhgCDWPtmMC0IQQn+i6fkRXV9f6/s78fQ0AzvkFALO6uvriZDL5a8Mw3IypnvgFHO/sOeecg9tvvx2VlZVlaRI42WTz58/H2WefjWQy2S06UAoIEAM4wU0SMg0ji0l1u+qvsqYGVdXV0CNhgDNIw0Ay3oXOtg50Njcj3taRla3HBYcQVg2/O5KcFR/q6cf806ZNw+OPP46mpqayY36vyv/CCy/g3HPPxcqVKwuq/PnUfgAGEekVFRVvT5w48cR33nlnw67A/DuSNMYYBg8efLLtNSXOuck5J+cQQhQ9QqEQAaC99tqL/vvf/xIRkWmapJSiciLDMIiI6OWXX6YhQ4YQANJ1vUf3mntomka6rpMeCpFmnwtAwYMBJIQgPZT5nNBK/07v+jDGrHPpOgGg2bNnU0tLi7sG5UTe67nxxhtJCEEAKBwOu8/S7/C5d8U5NzRNo3A4PH/u3LnOmGgesHQvQAAAamtrDwqHw5sAEOfcyMcU+RYmHA4TAKqsrKTf/e533Ziu3EDgs88+o4MOOogAuPfjZazeAoLQ7Gek6zYw2If9f03v/ux6cuReo8P4AOiSSy5xmaycmF8p5T73devW0YknnuiCbygUKsr4OWuiGGOSMUa1tbW/JnJDLAHzbysINDQ0jI5EIh/ZD7soCOT+XfdIwNNOO43Wr19fltqAsxlTqRT97//+r8tAoVAoa8P1lkm395HL9M61aZpGAGjAgAF07733uswmpSxLqf/EE0/Q8OHDCQBFIhELEEuX+sQ5l4wxpes6VVdXX+thfBaw8LaTAIBZs2YNiEQij2iaRowxw1a3fEHA+9P7d8ckGDFiBP3jH//w3Qw7m7xM8thjj9G4ceMs9ZyxLLNgZwJBPsb3Sv2jjz6aFi9eXHZA65X6nZ2dWUAbiUTyMn4B5jcYYxQKhVI1NTWn2v4aLWD+7UvcdrKwioqKG20QIM65zGf/FjMJANCFF17o2qWGYZTVJnVAqa2tjb73ve9RJBIh2wwiXdfdTbizGT9X3W9qaqLf//73ZWlqeYH+lVdeocmTJ7saVikqvx/z2/f/eVNT035erTWgvgEBBgA1NTXf0HU9aYOAUcwnkLuIjt0LgMaNG0dPPfVUWWoD3mv58MMP6ayzznLVa2fjOj6C3A26vZk+FwAcJ6NzLTU1NXT11VfTxo0by07l90r9RCJB11xzjevoKyb18zn7GGMm55yi0eiLkyZNGhEw/44LQ2oAMGTIkBmhUGiZvTmNYgDgh+RebeDiiy92tQEpZVluXiKid955h772ta9RRUWFe+2OeePcYz4V3QsO+UAj971+ar7DPABo0KBBdNlll9Fnn31WliDqfXYvvPACTZ06tSRHXwHml06Eo7Ky8o7rr78+5DVVA9qBzsHJkyfXxmKxv9sLJO2jKBB4F9arDey+++70t7/9LWvzlItZIKXMYqylS5fSvHnzaMKECVmhPCf86TiyCqnuhY6sUKJPGHHy5Ml0880307p167IYv1yel/daNm7cSBdeeKF77eFwOGsv5HP6+TC/Yfti4nV1ded68jMCT//Ocg4yxlBdXX2NRxU2SgGA3EX2agMnnXSS68AqNzs2FwgSiQQ99dRT9M1vfpPGjBnjG993NATv4TC2Iwm9h9fM8B7jx4+nSy65hJ5//vmsZ2IYRtloTLnP595773U9/A6z92Rf2MyvnDyUSCTy0YgRI2Z4BFHg7NvJJgG3Q4WHRSKRT+1FM4UQqlQQcBbcYQYAVFVVRTfccAO1traWbbQgF5iSySS99dZbdNNNN9EJJ5xAY8eOdZ2HPT1isRhNmDCBzjjjDPrVr35FCxYsoHQ63U29LkfvPhHRq6++SgcffHCW1O8p4zt7iTFGmqZRZWXlvbNnz67+Itv75Yp2GgBz6tSpg5cuXfqbdDp9ql1eK1FCp6HcVE6n2QgRYffdd8d1112Hs88+O2tQZbmksZInRTf3mgzDwOrVq7F8+XIsX74cq1evxoYNG9DS0oJ0Ou22tqqoqMCgQYMwdOhQDBs2DKNGjcKoUaMwbNiwbud07r9cCqy8JbsA8Pnnn+NnP/sZ7r77brchq3fkfLEeEzn/d/L526uqqr7b0tJyj/2eshnVFZCPSVBbW3thKBTqsBHccLSBUjUB571es2D//fenxx9/PEsCl1Nii9fzbhjGdtNWTNN0VfxySpryhkqdcOmPfvQjqquryzJ7euIP8qj80m5UQ9Fo9NURI0ZM8uyxQOXvDybB8OHD94hGo696VTlvklCpaqDXLABAxx13HL366qtZDFJuue25gOAwsXOYpukCWO5r3tfLrWbCT9Xv6uqiO++8k8aOHdtN3S81LJwTBXEcfbKqquqG66+/XgtCfP00SkBEvKqq6oZQKGTkagM9kQi50QLGGJ100kn0+uuv55VIAfWtxE8mk3TXXXfRpEmTunn38yWHFcl3kIwxaTv6Pm5sbDwkV6gE1E8ThxoaGvYNh8OveZDeLLWYyK/C0PGSM8boxBNPpOeff75snWP9nXKdne3t7XTnnXe6WXxOQpTj3e8J43sr+DyOvl/OmjWrMpD6u6A2UFlZeZWu63EPCKjeZsjlhssOO+wwevTRR7OkVDmFx/qjtPc+u40bN9LNN9+cFeosxPglZjiadjYpRSKRj+vq6o7I9SkFtItpAyNHjpwYjUafLqQNbAsQTJ8+nX7961/Tli1busWmA62g56HNTz75hK644gq3T8J2Ynw3rq9pWrqqquqnX/7yl2NBbP8Log1wzlFTU3N+KBRa72yI7QEEXmfh0KFD6YorrqAPP/ywm1c9AIPC0l5KSc888wzNnTs3K4+ht4yfU8tgOKm80Wj0+cbGxr0Dqf/F0wY4AEyaNKmxoqLid7quK0clFELIbSm3zY0ahEIhmj17Nt1///20efPmbr6CLyIYOJ78XKfpsmXL6Oabb6bp06e7z49zXtC5V4jhc9KgTcaYU1a9qq6u7hxPM9JA6n+R8waGDBlycCQSecHTfcftN7AtLbnC4XBWDv2QIUPo/PPPp+eee46SyeQXRjPw5ifk+kQ2b95MDz74IJ1wwglZBU7eYp1SHbV56hqkU8Cj67oRi8VunTJlSn2uMAio9Dj7rpg3IBljGDhw4BltbW0/UEpNtDMJTeQkf/Q0+80ZgQUA6XTa/fv48eMxZ84cHHfccZg5cyai0aj7mnfcVH8Yk+1HTvYdEXVrxLp69Wq8/PLLePLJJ/Hiiy9iw4YN7rMKh8PuvIN8900lDJOFNXqOAAjOOUKh0FMDBgz4wYYNG94NsvkCAPAzCwBAzZ07N/rvf//78s7Ozm8rpRrJGtaxzUDgfMaZL+ftNLv77rvjyCOPxJw5c7D//vtj8ODBWZ+TUrpDQ7xHuZDD6E5Kci7DExE++eQTvPjii3jyySfxxhtvoK2tzX09FAq5nZzJZ0BKD5nfUaGEEAK6rv8nGo3Oa21tfdLD+AoABewcAICfWSABoKGhob6jo+MiwzAulVLW2ptSOhGFUvv1U55e8s4MAKUUDLvvPgAMGjQI06ZNw6xZs3DIIYdgypQpqKmp8ZWw3unCfQ0M5Bl55WXSfBrKp59+ivfeew8vv/wyXnvtNXz88cdZoOcwvRfcqMjYdMozbShX4jPGoOv6x9XV1bds2rTpTzlt5VXAxgEAFLtHAbuH+6RJk0asWbPm0mQyeZ5pmjWORsAY22554Q4YEFGWmQAATU1NmDZtGmbOnIkZM2ZgwoQJaGpqKjjfwCtJcwGpVEb3fsZrxvhRc3MzPvvsM7z//vt46623sGDBAixZsgSJRCLrPLquZ11fKddEBWYM5kp8zjk0TVsYDod/OXv27D/Pnz8/nQvsAQUA0GMgYIxh8uTJo1euXHlZIpH4upSyyqMRbNdUUa9UzTUVACAWi2HEiBEYN24cJk2ahIkTJ2L06NEYNmwYBg0ahKqqqj55GIZhYOvWrVi3bh0+++wzLF68GIsXL8aSJUuwcuVKbNq0qdt96LqeNaQl3/2WoubnvEY24zMLPzk0Tfs4Eon838yZMx94+umnUwHjBwDQJ47CcePGjVq1atU3lFIXmKY5xAMEji9huz4jLyDkmgteikajqK2tRX19Perr6zFkyBAMHjwYdXV1qKmpQVVVFSorKxGJRBAKhVyJrpSCaZpIpVJIJpNIJBKIx+PYsmULtmzZgk2bNmHDhg1Yv349Nm/ejNbWVl8GFUK4Wkk+DaSnZpIPIBAASURuPocQ4tUBAwbc+eMf//ihCy+80PAwfmDnBwCw3R2FzJEo++yzz8AlS5acnkgkvg1golMn7zgMiYj1hT3utfUdJjZN07Wl+3TxbSem1+7vCbNvg+9BWb+SsMHGDIfDz4RCoV+1tbU949EuAsYPAGCHAAF3fASzZ88O/+c//zk2kUhcYBjGkUTE7U3ragXbigReB1m+n6XY7D2RysUcgH1JHjVfesFUCLE1FAo9VFNT8/v169e/b7/P0dACxg8AYOf4CBx1tLGxcVpra+s3DMM4RSnV5Bk4aQJgRMQZY4x6MgK8RADojcOvmL1d6Br6gOG9tr0jzSGEgBDinXA4fP+wYcMe/uSTTzb4aWQBBQCws30EZEsh7LXXXgNWr159QldX11ellLOUUmHPRjc9m5eV4hTrrdawvZi/Dxg968/Oc3NUfFvabwqFQv+sqqr686ZNm17JUfPdzwQUAEDZmgeMMYwYMWLC1q1bTzQM4zgp5f5KKe4Jgfk6D7cHCPQknr4Dmd1heK8XX3jMlhZd118Kh8MPDxky5OlFixY1e86j2dI+UPMDAOh/WgFjDPX19Xt2dHQcI6U8SSk1Qymle5JqHJuXMca2OZrQk0y6PmZ+ypHyWk4S0QZd118Ih8NPNTY2Pr9kyZL1ns871XmBmh8AQL/XClzpxTnHyJEjxzU3Nx9qGMYc0zT3V0o15iTIKDuDjeUcvQKAvmD8Qio92Z47R613rsme5/ixEOKlaDT6YkNDw6s5kt55f+DUCwBg1wcDxhimTJkyYO3atVOSyeQs0zQPVUpNVUrVeb3vHpOBegsKxRg5N6qQm62XR7KTh1GFrda7n7Pt+c80TfuPruvPDxgw4LU1a9YscsKmHqZngYofAMAXEQzIq+JyzjFjxoyBn3766RTDMPY3TXM/0zT3IqIRRMS9+f8+wOC3Tt1Awo/JC9jqyD03EXXzWXiOZs75Ms75h6FQ6D8VFRULjjzyyMX3339/Mue7NI9pEDB9AACBz8D+qeDxcDPGcOqpp4ZeffXVMalUarJpmntIKSdLKScQ0TClVJWTNuxlau/v3krCUswBpxQ3B2SQo8obAFZpmraSc75c07R3I5HIByNGjFj+7rvvbvXJFxB+9xdQAAABFQaELA3BK3GnTZs2ZO3atbXpdHqiYRhVQogpbW1tqKmpGZ9IJGrT6TSFw+EqTdNGpNNpZjfjYERkJdDb5yci5QEJCofDjIjWJ5PJrbFYjAFYappmc2Vl5dqurq7P6+vr1wFYf+2116696KKLDJ88/1xAo0DKBxTQtgOCsFXngr3rvKm6QgiceOKJA4cOHToQgHs0NDTUjxgxYsjgwYMbvX+vqqoaePjhhw90nHclNCTh9jVpCCbnBBpAQDt8PfyqEVWe33vjp/DzI/g5AAMKACCgXWzNAuYOKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAgoooIACCiiggAIKKKCAAupr+v/6Cte2MAL9HAAAAABJRU5ErkJggg==",
+}
 
 
-def getIcon() -> Image.Image:
-    data = base64.b64decode(ENCODED_ICON.encode())
-    buffer = BytesIO(data)
-    img = Image.open(buffer)
-    return img
+def getIcon() -> QIcon:
+    icon = QIcon()
+    for encoded in ENCODED_ICONS.values():
+        pixmap = QPixmap()
+        pixmap.loadFromData(base64.b64decode(encoded), "PNG")
+        icon.addPixmap(pixmap)
+    return icon
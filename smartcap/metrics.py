@@ -0,0 +1,138 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator
+
+# Recent durations kept per stage for the diagnostics tab and the benchmark
+MAX_SAMPLES = 500
+
+logger = logging.getLogger(__name__)
+
+_recorder = None
+_recorderLock = threading.Lock()
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+class StageStats(object):
+    def __init__(self, name: str, samples: list[float]):
+        self.name = name
+        self.count = len(samples)
+        self.last = samples[-1]
+        self.mean = sum(samples) / len(samples)
+        self.p50 = percentile(samples, 0.5)
+        self.p95 = percentile(samples, 0.95)
+        self.max = max(samples)
+
+    def asDict(self) -> dict:
+        return {
+            "stage": self.name,
+            "count": self.count,
+            "last_ms": round(self.last * 1000, 2),
+            "mean_ms": round(self.mean * 1000, 2),
+            "p50_ms": round(self.p50 * 1000, 2),
+            "p95_ms": round(self.p95 * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class Recorder(object):
+    # Spans are recorded from the GUI thread and from request threads alike.
+    # Lines for the metrics file go through a queue to a background thread, so
+    # writing them never adds disk I/O to the paint times being measured
+    def __init__(self, path: str = None):
+        self.path = path
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.file = None
+        self.queue = queue.Queue()
+        self.writer = None
+
+    def record(self, name: str, seconds: float, **fields):
+        with self.lock:
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=MAX_SAMPLES)
+            self.samples[name].append(seconds)
+            if self.path:
+                if self.writer is None:
+                    self.writer = threading.Thread(target=self.write, daemon=True)
+                    self.writer.start()
+                    atexit.register(self.flush)
+                self.queue.put((time.time(), name, seconds, fields))
+        if logger.isEnabledFor(logging.DEBUG):
+            details = "".join(f" {key}={value}" for key, value in fields.items())
+            logger.debug("%s %.1f ms%s", name, seconds * 1000, details)
+
+    def write(self):
+        # One JSON object per line so the file can be appended to across runs
+        # and read back with any JSONL tool. Flushed once the queue is drained
+        while True:
+            at, name, seconds, fields = self.queue.get()
+            try:
+                if self.path:
+                    self.writeLine(at, name, seconds, fields)
+                    if self.queue.empty():
+                        self.file.flush()
+            except OSError as e:
+                logger.warning("Cannot write metrics to %s: %s", self.path, e)
+                self.path = None
+            finally:
+                self.queue.task_done()
+
+    def writeLine(self, at: float, name: str, seconds: float, fields: dict):
+        if self.file is None:
+            self.file = open(self.path, "a")
+        record = {"time": at, "stage": name, "ms": seconds * 1000}
+        record.update(fields)
+        self.file.write(json.dumps(record) + "\n")
+
+    def flush(self):
+        # Waits for the queued lines, called on exit so none are lost
+        if self.writer is not None:
+            self.queue.join()
+            if self.file is not None:
+                self.file.flush()
+
+    def stats(self) -> list[StageStats]:
+        with self.lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+        return [
+            StageStats(name, values)
+            for name, values in sorted(samples.items())
+            if values
+        ]
+
+    def clear(self):
+        with self.lock:
+            self.samples = {}
+
+
+def recorder() -> Recorder:
+    global _recorder
+    with _recorderLock:
+        if _recorder is None:
+            _recorder = Recorder(os.environ.get("SMARTCAP_METRICS") or None)
+    return _recorder
+
+
+def record(name: str, seconds: float, **fields):
+    recorder().record(name, seconds, **fields)
+
+
+@contextmanager
+def span(name: str, **fields) -> Iterator[dict]:
+    # Fields known only once the stage is done can be added to the yielded dict
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        record(name, time.perf_counter() - start, **fields)
@@ -0,0 +1,325 @@
+from PySide6.QtWidgets import QWidget
+from PySide6 import QtCore
+from PySide6.QtGui import (
+    QMouseEvent,
+    QKeyEvent,
+    QPaintEvent,
+    QCursor,
+    QRegion,
+    QPainter,
+    QPixmap,
+    QColor,
+    QShortcut,
+    QKeySequence,
+)
+import logging
+import time
+from typing import Callable
+from .metrics import percentile, record
+
+logger = logging.getLogger(__name__)
+
+
+class FrameStats(object):
+    def __init__(self):
+        self.paintTimes = []
+        self.latencies = []
+        self.requestedAt = None
+
+    def requested(self):
+        if self.requestedAt is None:
+            self.requestedAt = time.perf_counter()
+
+    def painted(self, start: float):
+        end = time.perf_counter()
+        self.paintTimes.append(end - start)
+        record("overlay.paint", end - start)
+        if self.requestedAt is not None:
+            self.latencies.append(end - self.requestedAt)
+            record("overlay.motion_to_frame", end - self.requestedAt)
+            self.requestedAt = None
+
+    def summary(self, refreshRate: float) -> str:
+        budget = 1000 / refreshRate
+        paint50 = percentile(self.paintTimes, 0.5) * 1000
+        paint95 = percentile(self.paintTimes, 0.95) * 1000
+        latency95 = percentile(self.latencies or [0], 0.95) * 1000
+        verdict = "within" if latency95 <= budget else "over"
+        return (
+            f"{len(self.paintTimes)} frames, paint p50 "
+            f"{paint50:.2f} ms p95 {paint95:.2f} ms, "
+            f"motion-to-frame p95 {latency95:.2f} ms, {verdict} the "
+            f"{budget:.2f} ms budget of a {refreshRate:.0f} Hz display"
+        )
+
+
+class OverlayWindow(QWidget):
+    firstPainted = QtCore.Signal()
+
+    OVERLAY_COLOR = QColor(0, 0, 0, 100)
+    READOUT_MARGIN = 6
+    MAGNIFIER_SIZE = 120
+    MAGNIFIER_ZOOM = 4
+    MAGNIFIER_OFFSET = 24
+    # Without a frozen frame the magnifier grabs the screen, which is far
+    # slower than painting. It is refreshed at most this often while moving
+    MAGNIFIER_GRAB_INTERVAL_MS = 50
+
+    def __init__(
+        self,
+        screen_id: int,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        finishedCallback: Callable,
+        cancelCallback: Callable,
+        background: QPixmap = None,
+    ):
+        super().__init__()
+        self.screen_id = screen_id
+        self.background = background
+        self.finishedCallback = finishedCallback
+        self.cancelCallback = cancelCallback
+        self.startPos = None
+        self.endPos = None
+        self.cursorPos = None
+        self.pendingPos = None
+        self.magnified = None
+        self.frameStats = FrameStats()
+        self.shown = False
+
+        self.setWindowTitle("SmartCap")
+        self.setWindowFlags(
+            QtCore.Qt.WindowType.FramelessWindowHint
+            | QtCore.Qt.WindowType.WindowStaysOnTopHint
+        )
+        if background is None:
+            self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
+        self.move(x, y)
+        self.resize(width, height)
+        self.quitShortcut = QShortcut(QKeySequence("Esc"), self)
+        self.quitShortcut.activated.connect(self.cancelCallback)
+
+        # Mouse moves arrive faster than the display refreshes, only the latest
+        # position is applied once the event queue has been drained
+        self.motionTimer = QtCore.QTimer(self)
+        self.motionTimer.setSingleShot(True)
+        self.motionTimer.setInterval(0)
+        self.motionTimer.timeout.connect(self.applyMotion)
+        self.magnifierTimer = QtCore.QTimer(self)
+        self.magnifierTimer.setSingleShot(True)
+        self.magnifierTimer.setInterval(self.MAGNIFIER_GRAB_INTERVAL_MS)
+        self.magnifierTimer.timeout.connect(self.refreshMagnifier)
+
+        self.show()
+        self.activateWindow()
+
+    def selectionRect(self) -> QtCore.QRectF:
+        if self.startPos is None or self.cursorPos is None:
+            return None
+        return QtCore.QRectF(self.startPos, self.cursorPos).normalized()
+
+    def readoutText(self, rect: QtCore.QRectF) -> str:
+        ratio = self.devicePixelRatioF()
+        return f"{round(rect.width() * ratio)} x {round(rect.height() * ratio)}"
+
+    def readoutRect(self, rect: QtCore.QRectF) -> QtCore.QRect:
+        size = self.fontMetrics().size(0, self.readoutText(rect))
+        size += QtCore.QSize(self.READOUT_MARGIN * 2, self.READOUT_MARGIN)
+        topLeft = rect.bottomRight().toPoint() + QtCore.QPoint(4, 4)
+        # Keep the readout on screen when selecting near the bottom right corner
+        topLeft.setX(min(topLeft.x(), self.width() - size.width()))
+        topLeft.setY(min(topLeft.y(), self.height() - size.height()))
+        return QtCore.QRect(topLeft, size)
+
+    def magnifierRect(self) -> QtCore.QRect:
+        size = self.MAGNIFIER_SIZE
+        pos = self.cursorPos.toPoint()
+        x = pos.x() + self.MAGNIFIER_OFFSET
+        y = pos.y() + self.MAGNIFIER_OFFSET
+        if x + size > self.width():
+            x = pos.x() - self.MAGNIFIER_OFFSET - size
+        if y + size > self.height():
+            y = pos.y() - self.MAGNIFIER_OFFSET - size
+        return QtCore.QRect(x, y, size, size)
+
+    def decorationRegion(self) -> QRegion:
+        region = QRegion()
+        if self.cursorPos is None:
+            return region
+        rect = self.selectionRect()
+        if rect is not None:
+            region += rect.toAlignedRect().adjusted(-2, -2, 2, 2)
+            region += self.readoutRect(rect)
+        region += self.magnifierRect().adjusted(-2, -2, 2, 2)
+        return region
+
+    def backgroundRect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        # The frozen frame is in device pixels, widget coordinates are logical
+        ratio = self.background.devicePixelRatio()
+        return QtCore.QRect(
+            round(rect.x() * ratio),
+            round(rect.y() * ratio),
+            round(rect.width() * ratio),
+            round(rect.height() * ratio),
+        )
+
+    def grabMagnified(self) -> QPixmap:
+        span = self.MAGNIFIER_SIZE // self.MAGNIFIER_ZOOM
+        pos = self.cursorPos.toPoint()
+        return self.screen().grabWindow(
+            0, pos.x() - span // 2, pos.y() - span // 2, span, span
+        )
+
+    def refreshMagnifier(self):
+        if self.cursorPos is None or not self.isVisible():
+            return
+        self.magnified = self.grabMagnified()
+        self.update(self.magnifierRect())
+
+    def moveCursorTo(self, pos: QtCore.QPointF):
+        self.pendingPos = pos
+        if not self.motionTimer.isActive():
+            self.motionTimer.start()
+
+    def applyMotion(self):
+        if self.pendingPos is None:
+            return
+        dirty = self.decorationRegion()
+        self.cursorPos = self.pendingPos
+        self.pendingPos = None
+        if self.background is None and not self.magnifierTimer.isActive():
+            self.magnifierTimer.start()
+        # Only the old and new decorations are repainted, not the whole screen
+        self.update(dirty + self.decorationRegion())
+        self.frameStats.requested()
+
+    def paintEvent(self, event: QPaintEvent):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        if self.background is not None:
+            painter.drawPixmap(
+                event.rect(), self.background, self.backgroundRect(event.rect())
+            )
+            # The frozen content inside the selection is shown undimmed
+            dimmed = QRegion(event.rect())
+            rect = self.selectionRect()
+            if rect is not None:
+                dimmed -= rect.toAlignedRect()
+            painter.setClipRegion(dimmed)
+            painter.fillRect(event.rect(), self.OVERLAY_COLOR)
+            painter.setClipping(False)
+        else:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(event.rect(), self.OVERLAY_COLOR)
+            painter.setCompositionMode(
+                QPainter.CompositionMode.CompositionMode_SourceOver
+            )
+        if self.cursorPos is not None:
+            rect = self.selectionRect()
+            if rect is not None:
+                painter.setPen(QColor("white"))
+                painter.drawRect(rect)
+                readout = self.readoutRect(rect)
+                painter.fillRect(readout, QColor(0, 0, 0, 200))
+                painter.drawText(
+                    readout, QtCore.Qt.AlignmentFlag.AlignCenter, self.readoutText(rect)
+                )
+            magnifier = self.magnifierRect()
+            if self.background is not None:
+                span = self.MAGNIFIER_SIZE // self.MAGNIFIER_ZOOM
+                source = QtCore.QRect(0, 0, span, span)
+                source.moveCenter(self.cursorPos.toPoint())
+                painter.drawPixmap(
+                    magnifier, self.background, self.backgroundRect(source)
+                )
+            elif self.magnified is not None and not self.magnified.isNull():
+                painter.drawPixmap(magnifier, self.magnified)
+            center = magnifier.center()
+            painter.setPen(QColor(255, 0, 0, 180))
+            painter.drawLine(
+                magnifier.left(), center.y(), magnifier.right(), center.y()
+            )
+            painter.drawLine(
+                center.x(), magnifier.top(), center.x(), magnifier.bottom()
+            )
+            painter.setPen(QColor("white"))
+            painter.drawRect(magnifier)
+        painter.end()
+        if self.startPos is not None:
+            self.frameStats.painted(start)
+        if not self.shown:
+            self.shown = True
+            self.firstPainted.emit()
+
+    def mousePressEvent(self, event: QMouseEvent):
+        if self.startPos is None:
+            self.startPos = event.position()
+            self.moveCursorTo(event.position())
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        if self.endPos is None:
+            self.moveCursorTo(event.position())
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        if self.endPos is None and self.startPos is not None:
+            self.cursorPos = event.position()
+            self.finishSelection()
+
+    def keyPressEvent(self, event: QKeyEvent):
+        key = event.key()
+        if key in (QtCore.Qt.Key.Key_Return, QtCore.Qt.Key.Key_Enter):
+            if self.cursorPos is None:
+                self.cursorPos = QtCore.QPointF(self.mapFromGlobal(QCursor.pos()))
+            if self.startPos is None:
+                # Keyboard selection: Enter anchors the first corner at the cursor
+                self.startPos = self.cursorPos
+                self.update(self.decorationRegion())
+            else:
+                self.finishSelection()
+            return
+        step = 10 if event.modifiers() & QtCore.Qt.KeyboardModifier.ShiftModifier else 1
+        offsets = {
+            QtCore.Qt.Key.Key_Left: QtCore.QPointF(-step, 0),
+            QtCore.Qt.Key.Key_Right: QtCore.QPointF(step, 0),
+            QtCore.Qt.Key.Key_Up: QtCore.QPointF(0, -step),
+            QtCore.Qt.Key.Key_Down: QtCore.QPointF(0, step),
+        }
+        if key not in offsets or self.endPos is not None:
+            super().keyPressEvent(event)
+            return
+        pos = self.pendingPos or self.cursorPos
+        if pos is None:
+            pos = QtCore.QPointF(self.mapFromGlobal(QCursor.pos()))
+        pos = pos + offsets[key]
+        pos.setX(max(0, min(pos.x(), self.width() - 1)))
+        pos.setY(max(0, min(pos.y(), self.height() - 1)))
+        if (
+            event.modifiers() & QtCore.Qt.KeyboardModifier.ControlModifier
+            and self.startPos is not None
+        ):
+            # Ctrl moves the whole selection instead of resizing it. The old
+            # frame is marked dirty first, applyMotion only knows the new start
+            self.update(self.decorationRegion())
+            self.startPos = self.startPos + offsets[key]
+        QCursor.setPos(self.mapToGlobal(pos.toPoint()))
+        self.moveCursorTo(pos)
+
+    def finishSelection(self):
+        rect = self.selectionRect()
+        if rect is None or rect.width() < 1 or rect.height() < 1:
+            # A click without dragging selects nothing, start over
+            self.startPos = None
+            self.update()
+            return
+        self.endPos = rect.bottomRight()
+        self.hide()
+        if self.frameStats.paintTimes:
+            logger.info(
+                "Selection frame times: %s",
+                self.frameStats.summary(self.screen().refreshRate()),
+            )
+        self.finishedCallback(self.screen_id, rect.topLeft(), rect.bottomRight())
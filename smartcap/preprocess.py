@@ -0,0 +1,160 @@
+import hashlib
+import io
+import logging
+import threading
+from PIL import Image
+from .cache import imageHash
+
+IMAGE_FORMATS = ["Auto", "PNG", "JPEG", "WEBP"]
+MIME_TYPES = {"PNG": "image/png", "JPEG": "image/jpeg", "WEBP": "image/webp"}
+# Screenshots with at most this many colors (dialogs, code, plain text) stay
+# sharp and small as PNG, anything busier is encoded lossy
+MAX_PNG_COLORS = 256
+MIN_QUALITY = 40
+MAX_BUDGET_ATTEMPTS = 8
+
+logger = logging.getLogger(__name__)
+
+
+class ImagePayload(object):
+    def __init__(
+        self,
+        data: bytes,
+        imageFormat: str,
+        width: int,
+        height: int,
+        originalSize: tuple[int, int],
+        originalBytes: int,
+        options: tuple,
+        overBudget: bool = False,
+    ):
+        self.data = data
+        self.imageFormat = imageFormat
+        self.mimeType = MIME_TYPES[imageFormat]
+        self.width = width
+        self.height = height
+        self.originalSize = originalSize
+        self.originalBytes = originalBytes
+        self.options = options
+        self.overBudget = overBudget
+
+    def describe(self) -> str:
+        # The original is measured as uncompressed pixels, not as the PNG that
+        # would be uploaded without preprocessing, so the label says so
+        w, h = self.originalSize
+        text = (
+            f"{w}x{h} ({formatBytes(self.originalBytes)} as raw pixels) → "
+            f"{self.width}x{self.height} {self.imageFormat} {formatBytes(len(self.data))}"
+        )
+        if self.overBudget:
+            text += ", over the byte budget"
+        return text
+
+
+def formatBytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def preprocessOptions(config) -> tuple:
+    return (
+        config.maxResolution,
+        config.imageFormat,
+        config.imageQuality,
+        config.grayscale,
+        config.byteBudget,
+    )
+
+
+def encode(image: Image.Image, imageFormat: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if imageFormat == "PNG":
+        image.save(buffer, format="PNG", optimize=False, compress_level=6)
+    else:
+        image.save(buffer, format=imageFormat, quality=quality)
+    return buffer.getvalue()
+
+
+def preprocessImage(image: Image.Image, options: tuple) -> ImagePayload:
+    maxResolution, imageFormat, quality, grayscale, byteBudget = options
+    originalSize = image.size
+    originalBytes = image.width * image.height * len(image.getbands())
+
+    if maxResolution > 0 and max(image.size) > maxResolution:
+        image = image.copy()
+        image.thumbnail((maxResolution, maxResolution), Image.Resampling.LANCZOS)
+    if grayscale:
+        image = image.convert("L")
+    elif image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    if imageFormat == "Auto":
+        fewColors = image.getcolors(MAX_PNG_COLORS) is not None
+        imageFormat = "PNG" if fewColors else "JPEG"
+
+    data = encode(image, imageFormat, quality)
+    for _ in range(MAX_BUDGET_ATTEMPTS):
+        if byteBudget <= 0 or len(data) <= byteBudget:
+            break
+        if imageFormat != "PNG" and quality > MIN_QUALITY:
+            # Trading quality is cheaper than losing resolution for lossy formats
+            quality = max(MIN_QUALITY, quality - 15)
+        else:
+            scale = min(0.9, max(0.5, (byteBudget / len(data)) ** 0.5))
+            size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+            image = image.resize(size, Image.Resampling.LANCZOS)
+        data = encode(image, imageFormat, quality)
+    overBudget = byteBudget > 0 and len(data) > byteBudget
+    if overBudget:
+        logger.warning(
+            "Image is still %s after %d attempts, over the %s byte budget",
+            formatBytes(len(data)),
+            MAX_BUDGET_ATTEMPTS,
+            formatBytes(byteBudget),
+        )
+
+    return ImagePayload(
+        data,
+        imageFormat,
+        image.width,
+        image.height,
+        originalSize,
+        originalBytes,
+        options,
+        overBudget,
+    )
+
+
+class CapturedImage(object):
+    # Shared by all requests about one capture, so concurrent requests encode
+    # and hash the picture only once
+    def __init__(self, image: Image.Image):
+        self.image = image
+        self.lock = threading.Lock()
+        self.payloadValue = None
+        self.hashValue = None
+        self.contentHashValue = None
+
+    def payload(self, options: tuple) -> tuple[ImagePayload, bool]:
+        with self.lock:
+            if self.payloadValue is None or self.payloadValue.options != options:
+                self.payloadValue = preprocessImage(self.image, options)
+                return self.payloadValue, True
+            return self.payloadValue, False
+
+    def hash(self) -> int:
+        with self.lock:
+            if self.hashValue is None:
+                self.hashValue = imageHash(self.image)
+            return self.hashValue
+
+    def contentHash(self) -> str:
+        # Exact pixel identity, unlike the perceptual hash used for the opt-in
+        # near-duplicate cache matches
+        with self.lock:
+            if self.contentHashValue is None:
+                digest = hashlib.sha256(f"{self.image.mode} {self.image.size}".encode())
+                digest.update(self.image.tobytes())
+                self.contentHashValue = digest.hexdigest()
+            return self.contentHashValue
@@ -0,0 +1,220 @@
+import io
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from typing import Iterator
+from .preprocess import ImagePayload
+
+PROVIDERS = {}
+MAX_CACHED_CLIENTS = 8
+RETRYABLE_CODES = (429, 500, 502, 503, 504)
+
+_clients = {}
+_clientsLock = threading.Lock()
+
+
+def registerProvider(cls):
+    PROVIDERS[cls.name] = cls
+    return cls
+
+
+def providerNames() -> list[str]:
+    return list(PROVIDERS)
+
+
+def getProvider(name: str, apiKey: str, model: str) -> "Provider":
+    # Clients are expensive to build and hold the HTTP connection pool, so keep
+    # one per (provider, api key, model) and share it between requests
+    key = (name, apiKey, model)
+    with _clientsLock:
+        provider = _clients.pop(key, None)
+        if provider is None:
+            if name not in PROVIDERS:
+                raise ValueError(f"Unknown provider: {name}")
+            provider = PROVIDERS[name](apiKey, model)
+        _clients[key] = provider
+        while len(_clients) > MAX_CACHED_CLIENTS:
+            oldest = next(iter(_clients))
+            _clients.pop(oldest).close()
+    return provider
+
+
+def parseTargets(text: str, defaultProvider: str) -> list[tuple[str, str]]:
+    # "Google:gemini-2.0-flash, Mock:test" -> [("Google", "gemini-2.0-flash"), ...]
+    targets = []
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        provider, _, model = entry.rpartition(":")
+        targets.append((provider.strip() or defaultProvider, model.strip()))
+    return targets
+
+
+class Provider(object):
+    name = ""
+
+    def __init__(self, apiKey: str, model: str):
+        self.apiKey = apiKey
+        self.model = model
+
+    # `image` is either an ImagePayload sent inline or whatever upload()
+    # returned, `history` holds the earlier session.Turn objects to send along
+    def generate(self, image, history: list, prompt: str, systemPrompt: str) -> str:
+        raise NotImplementedError
+
+    def stream(
+        self, image, history: list, prompt: str, systemPrompt: str
+    ) -> Iterator[str]:
+        yield self.generate(image, history, prompt, systemPrompt)
+
+    def isRetryable(self, error: Exception) -> bool:
+        # Quota exhaustion and transient server errors are worth another try
+        return getattr(error, "code", None) in RETRYABLE_CODES
+
+    def upload(self, payload: ImagePayload):
+        # Providers without an upload facility send the picture inline every turn
+        return payload
+
+    def close(self):
+        pass
+
+
+@registerProvider
+class GoogleProvider(Provider):
+    name = "Google"
+
+    def __init__(self, apiKey: str, model: str):
+        super().__init__(apiKey, model)
+        from google import genai
+
+        self.client = genai.Client(api_key=apiKey)
+
+    def upload(self, payload: ImagePayload):
+        from google.genai.types import UploadFileConfig
+
+        return self.client.files.upload(
+            file=io.BytesIO(payload.data),
+            config=UploadFileConfig(mime_type=payload.mimeType),
+        )
+
+    def request(self, image, history: list, prompt: str, systemPrompt: str) -> dict:
+        from google.genai.types import (
+            Blob,
+            Content,
+            FileData,
+            GenerateContentConfig,
+            Part,
+        )
+
+        if isinstance(image, ImagePayload):
+            imagePart = Part(
+                inline_data=Blob(data=image.data, mime_type=image.mimeType)
+            )
+        else:
+            imagePart = Part(
+                file_data=FileData(file_uri=image.uri, mime_type=image.mime_type)
+            )
+        # The picture goes with the oldest user turn that is still sent
+        contents = []
+        for turn in history:
+            contents.append(Content(role="user", parts=[Part(text=turn.prompt)]))
+            contents.append(Content(role="model", parts=[Part(text=turn.answer)]))
+        contents.append(Content(role="user", parts=[Part(text=prompt)]))
+        contents[0].parts.insert(0, imagePart)
+        return dict(
+            model=self.model,
+            contents=contents,
+            config=GenerateContentConfig(
+                system_instruction=[
+                    systemPrompt,
+                ],
+                temperature=0.1,
+            ),
+        )
+
+    def generate(self, image, history: list, prompt: str, systemPrompt: str) -> str:
+        request = self.request(image, history, prompt, systemPrompt)
+        return self.client.models.generate_content(**request).text
+
+    def stream(
+        self, image, history: list, prompt: str, systemPrompt: str
+    ) -> Iterator[str]:
+        request = self.request(image, history, prompt, systemPrompt)
+        stream = self.client.models.generate_content_stream(**request)
+        try:
+            for response in stream:
+                if response.text:
+                    yield response.text
+        finally:
+            # Closing the generator drops the underlying connection
+            stream.close()
+
+
+class MockError(Exception):
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class MockUpload(object):
+    def __init__(self, payload: ImagePayload):
+        self.uri = f"mock://{id(payload):x}"
+        self.width = payload.width
+        self.height = payload.height
+
+
+# Offline provider that replays canned answers. The latency before the first
+# chunk and the delay between chunks (seconds) are read from
+# SMARTCAP_MOCK_LATENCY and SMARTCAP_MOCK_CHUNK_DELAY. SMARTCAP_MOCK_SCRIPT may
+# point to a JSON list of answers that are replayed in order, and
+# SMARTCAP_MOCK_FAILURE_RATE (0 to 1) makes requests fail with a quota error.
+@registerProvider
+class MockProvider(Provider):
+    name = "Mock"
+    defaultAnswer = "Mock answer to *{prompt}* for a {width}x{height} picture."
+
+    def __init__(self, apiKey: str, model: str):
+        super().__init__(apiKey, model)
+        self.latency = float(os.environ.get("SMARTCAP_MOCK_LATENCY", "0.5"))
+        self.chunkDelay = float(os.environ.get("SMARTCAP_MOCK_CHUNK_DELAY", "0.02"))
+        script = os.environ.get("SMARTCAP_MOCK_SCRIPT")
+        if script:
+            with open(script, "r") as f:
+                self.answers = itertools.cycle(json.load(f))
+        else:
+            self.answers = itertools.repeat(self.defaultAnswer)
+        self.answersLock = threading.Lock()
+        self.failureRate = float(os.environ.get("SMARTCAP_MOCK_FAILURE_RATE", "0"))
+
+    def upload(self, payload: ImagePayload):
+        time.sleep(self.latency)
+        return MockUpload(payload)
+
+    def answer(self, image, prompt: str) -> str:
+        if random.random() < self.failureRate:
+            raise MockError(429, "Mock quota exhausted")
+        with self.answersLock:
+            answer = next(self.answers)
+        return (
+            answer.replace("{prompt}", prompt)
+            .replace("{width}", str(image.width))
+            .replace("{height}", str(image.height))
+        )
+
+    def generate(self, image, history: list, prompt: str, systemPrompt: str) -> str:
+        time.sleep(self.latency)
+        return self.answer(image, prompt)
+
+    def stream(
+        self, image, history: list, prompt: str, systemPrompt: str
+    ) -> Iterator[str]:
+        time.sleep(self.latency)
+        words = self.answer(image, prompt).split(" ")
+        for i, word in enumerate(words):
+            if i > 0:
+                time.sleep(self.chunkDelay)
+            yield word if i == len(words) - 1 else word + " "
@@ -0,0 +1,130 @@
+import time
+from .cache import requestKey, responseCache
+from .config import ConfigValues
+from .metrics import record, span
+from .preprocess import CapturedImage, ImagePayload, preprocessOptions
+from .providers import getProvider
+from .session import Session
+
+
+class Request(object):
+    # One question about a capture, from cache lookup to provider call. It has
+    # no Qt dependency so the GUI worker and the headless batch mode share it.
+    # The on* hooks are no-ops unless the caller replaces them. The answer is
+    # not added to the session here, the caller does that once it accepts it
+    def __init__(
+        self,
+        config: ConfigValues,
+        capture: CapturedImage,
+        prompt: str = "",
+        provider: str = None,
+        model: str = None,
+        useCache: bool = True,
+        session: Session = None,
+    ):
+        self.capture = capture
+        self.prompt = prompt
+        self.config = config
+        self.provider = provider or config.provider
+        self.model = model or config.model
+        self.useCache = useCache
+        self.session = session or Session(config.historyTokenBudget)
+        self.cancelled = False
+        # When the answer came from the cache, the time it was stored
+        self.cachedAt = None
+
+    def onPreprocessed(self, payload: ImagePayload):
+        pass
+
+    def onCacheHit(self, created: float):
+        pass
+
+    def onRequestSent(self, requestBytes: int, dropped: int):
+        pass
+
+    def onChunk(self, chunk: str):
+        pass
+
+    def cancel(self):
+        # Checked between chunks, a blocking request cannot be interrupted
+        self.cancelled = True
+
+    def run(self) -> str:
+        # Only the opening question of a session is answered from the cache,
+        # follow-ups depend on the conversation so far
+        cacheable = self.config.cacheEnabled and not self.session.turns
+        if cacheable:
+            cache = responseCache()
+            cacheRequest = requestKey(
+                self.provider,
+                self.model,
+                self.config.systemPrompt,
+                self.prompt,
+            )
+            cacheImage = self.capture.contentHash()
+            cacheSize = self.capture.image.size
+            threshold = self.config.cacheNearMatch
+            nearHash = self.capture.hash() if threshold > 0 else None
+            maxAge = self.config.cacheMaxAgeDays * 24 * 3600
+            if self.useCache:
+                with span("cache.lookup", hit=False) as fields:
+                    hit = cache.lookup(
+                        cacheRequest, cacheImage, cacheSize, maxAge, nearHash, threshold
+                    )
+                    fields["hit"] = hit is not None
+                if hit is not None:
+                    answer, self.cachedAt = hit
+                    self.onCacheHit(self.cachedAt)
+                    return answer
+        # Encoding is done once per capture and reused until the options change
+        with span("preprocess") as fields:
+            payload, encoded = self.capture.payload(preprocessOptions(self.config))
+            fields.update(encoded=encoded, bytes=len(payload.data))
+        if encoded:
+            self.onPreprocessed(payload)
+        with span("provider.client", provider=self.provider):
+            provider = getProvider(self.provider, self.config.apiKey, self.model)
+        with span("provider.upload", provider=self.provider) as fields:
+            image, uploaded = self.session.image(provider, payload)
+            fields["uploaded"] = uploaded
+        history, dropped = self.session.history(self.prompt)
+        requestBytes = len(self.prompt.encode()) + sum(
+            len(turn.prompt.encode()) + len(turn.answer.encode()) for turn in history
+        )
+        # The picture counts on the turn that sends it, inline or as an upload
+        if image is payload or uploaded:
+            requestBytes += len(payload.data)
+        self.onRequestSent(requestBytes, dropped)
+        request = (image, history, self.prompt, self.config.systemPrompt)
+        target = {"provider": self.provider, "model": self.model}
+        with span("provider.request", bytes=requestBytes, **target):
+            if self.config.stream:
+                chunks = []
+                sentAt = time.perf_counter()
+                stream = provider.stream(*request)
+                for chunk in stream:
+                    if self.cancelled:
+                        stream.close()
+                        break
+                    if not chunks:
+                        record(
+                            "provider.first_chunk",
+                            time.perf_counter() - sentAt,
+                            **target,
+                        )
+                    chunks.append(chunk)
+                    self.onChunk(chunk)
+                text = "".join(chunks)
+            else:
+                text = provider.generate(*request)
+        if cacheable and not self.cancelled:
+            cache.store(
+                cacheRequest,
+                cacheImage,
+                cacheSize,
+                text,
+                maxAge,
+                self.config.cacheMaxSizeMb * 1024 * 1024,
+                nearHash,
+            )
+        return text
@@ -0,0 +1,73 @@
+import threading
+from typing import Any
+from .preprocess import ImagePayload
+from .providers import Provider
+
+# Rough estimate that is good enough to keep requests bounded without
+# depending on a provider specific tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def estimateTokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class Turn(object):
+    def __init__(self, prompt: str, answer: str):
+        self.prompt = prompt
+        self.answer = answer
+
+    def tokens(self) -> int:
+        return estimateTokens(self.prompt) + estimateTokens(self.answer)
+
+
+class Session(object):
+    def __init__(self, tokenBudget: int):
+        self.tokenBudget = tokenBudget
+        self.turns = []
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.uploaded = None
+        self.uploadedPayload = None
+
+    def image(self, provider: Provider, payload: ImagePayload) -> tuple[Any, bool]:
+        # The first turn sends the picture inline so a single question does not
+        # pay for an extra upload round trip. Follow-ups upload it once and only
+        # reference the upload afterwards. Also returns whether it was uploaded
+        # by this call
+        with self.lock:
+            if not self.turns:
+                return payload, False
+            if self.uploaded is None or self.uploadedPayload is not payload:
+                self.uploaded = provider.upload(payload)
+                self.uploadedPayload = payload
+                return self.uploaded, True
+            return self.uploaded, False
+
+    def history(self, prompt: str) -> tuple[list[Turn], int]:
+        # Newest turns are kept first, older ones are dropped once the budget
+        # is used up. Returns the kept turns and how many were dropped
+        with self.lock:
+            budget = self.tokenBudget - estimateTokens(prompt)
+            kept = []
+            for turn in reversed(self.turns):
+                budget -= turn.tokens()
+                if budget < 0:
+                    break
+                kept.append(turn)
+            kept.reverse()
+            return kept, self.dropped + len(self.turns) - len(kept)
+
+    def addTurn(self, prompt: str, answer: str):
+        with self.lock:
+            self.turns.append(Turn(prompt, answer))
+            # Turns that can never be sent again are not worth keeping around.
+            # The newest one stays even when it alone is over the budget, the
+            # session would otherwise forget that anything was asked
+            total = self.turns[-1].tokens()
+            for i in range(len(self.turns) - 2, -1, -1):
+                total += self.turns[i].tokens()
+                if total > self.tokenBudget:
+                    self.dropped += i + 1
+                    del self.turns[: i + 1]
+                    break
@@ -4,114 +4,366 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QGridLayout,
     QComboBox,
+    QCheckBox,
     QTextEdit,
     QPushButton,
     QLineEdit,
+    QSpinBox,
     QRadioButton,
     QHBoxLayout,
     QSizePolicy,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QListView,
 )
 from PySide6 import QtCore
 from PySide6.QtGui import (
-    QMouseEvent,
-    QPainter,
+    QDesktopServices,
+    QKeySequence,
     QPixmap,
-    QColor,
+    QPixmapCache,
     QShortcut,
-    QKeySequence,
 )
-from typing import Callable
+import time
+import weakref
+from datetime import datetime
 from PIL import Image
 from .config import ConfigValues
+from .providers import parseTargets, providerNames
+from .cache import responseCache
+from .history import PAGE_SIZE, THUMBNAIL_SIZE, HistoryEntry, history
+from .metrics import recorder, span
+from .request import Request
+from .preprocess import (
+    IMAGE_FORMATS,
+    CapturedImage,
+    ImagePayload,
+    formatBytes,
+)
+from .session import Session
+
+_requestPool = None
+_workerRegistry = None
+
+
+def requestPool(maxThreads: int) -> QtCore.QThreadPool:
+    global _requestPool
+    if _requestPool is None:
+        _requestPool = QtCore.QThreadPool()
+    _requestPool.setMaxThreadCount(maxThreads)
+    return _requestPool
+
+
+def workerRegistry() -> "WorkerRegistry":
+    # Created on the GUI thread by the first request
+    global _workerRegistry
+    if _workerRegistry is None:
+        _workerRegistry = WorkerRegistry()
+    return _workerRegistry
+
 
+class WorkerRegistry(QtCore.QObject):
+    # Cancelled workers keep running until their provider call returns, so the
+    # pane no longer holds them. They are held here instead and released by a
+    # queued signal, which makes the GUI thread drop the last reference to
+    # each of these GUI owned QObjects
+    stopped = QtCore.Signal(int)
+
+    def __init__(self):
+        super().__init__()
+        self.running = {}
+        self.nextKey = 0
+        self.stopped.connect(self.release)
+
+    def start(self, pool: QtCore.QThreadPool, worker: "Worker"):
+        self.nextKey += 1
+        self.running[self.nextKey] = worker
+        pool.start(WorkerRunnable(worker, self.nextKey, self.stopped))
+
+    def release(self, key: int):
+        self.running.pop(key, None)
+
+
+class WorkerRunnable(QtCore.QRunnable):
+    # The pool deletes its runnable on the pool thread, so the worker is only
+    # referenced weakly here
+    def __init__(self, worker: "Worker", key: int, stopped: QtCore.SignalInstance):
+        super().__init__()
+        self.worker = weakref.ref(worker)
+        self.key = key
+        self.stopped = stopped
+
+    def run(self):
+        worker = self.worker()
+        if worker is None:
+            return
+        try:
+            worker.run()
+        finally:
+            del worker
+            self.stopped.emit(self.key)
+
+
+class Worker(QtCore.QObject):
+    chunkReceived = QtCore.Signal(str)
+    preprocessed = QtCore.Signal(object)
+    servedFromCache = QtCore.Signal(float)
+    requestSent = QtCore.Signal(int, int)
+    finished = QtCore.Signal(str)
+    failed = QtCore.Signal(str)
 
-class OverlayWindow(QWidget):
     def __init__(
         self,
-        screen_id: int,
-        x: int,
-        y: int,
-        width: int,
-        height: int,
-        finishedCallback: Callable,
-        cancelCallback: Callable,
+        config: ConfigValues,
+        capture: CapturedImage,
+        prompt: str = "",
+        provider: str = None,
+        model: str = None,
+        useCache: bool = True,
+        session: Session = None,
     ):
         super().__init__()
-        self.screen_id = screen_id
-        self.finishedCallback = finishedCallback
-        self.cancelCallback = cancelCallback
-        self.startPos = None
-        self.endPos = None
-
-        self.setWindowTitle("SmartCap")
-        self.setWindowFlags(
-            QtCore.Qt.WindowType.FramelessWindowHint
-            | QtCore.Qt.WindowType.WindowStaysOnTopHint
-        )
-        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.move(x, y)
-        self.resize(width, height)
-        self.quitShortcut = QShortcut(QKeySequence("Esc"), self)
-        self.quitShortcut.activated.connect(self.cancelCallback)
-
-        self.overlay = QLabel(self)
-        self.pixmap = QPixmap(width, height)
-        self.pixmap.fill(QColor(0, 0, 0, 100))
-        self.overlay.setPixmap(self.pixmap)
-
-        self.show()
-        self.activateWindow()
-
-    def mousePressEvent(self, event: QMouseEvent):
-        if self.startPos is None:
-            self.startPos = event.position()
-
-    def mouseMoveEvent(self, event: QMouseEvent):
-        if self.startPos is not None and self.endPos is None:
-            pixmap = self.pixmap.copy(0, 0, self.pixmap.width(), self.pixmap.height())
-            painter = QPainter(pixmap)
-            painter.setPen("white")
-            x1 = self.startPos.x()
-            y1 = self.startPos.y()
-            x2 = event.position().x()
-            y2 = event.position().y()
-            painter.drawRect(x1, y1, x2 - x1, y2 - y1)
-            painter.end()
-            self.overlay.setPixmap(pixmap)
-
-    def mouseReleaseEvent(self, event: QMouseEvent):
-        if self.endPos is None:
-            self.endPos = event.position()
-            self.hide()
-            self.finishedCallback(self.screen_id, self.startPos, self.endPos)
+        self.request = Request(
+            config, capture, prompt, provider, model, useCache, session
+        )
+        self.request.onPreprocessed = self.preprocessed.emit
+        self.request.onCacheHit = self.servedFromCache.emit
+        self.request.onRequestSent = self.requestSent.emit
+        self.request.onChunk = self.chunkReceived.emit
 
+    def start(self, pool: QtCore.QThreadPool):
+        workerRegistry().start(pool, self)
+
+    def cancel(self):
+        self.request.cancel()
+
+    def run(self):
+        if self.request.cancelled:
+            # Cancelled while still waiting in the pool
+            return
+        try:
+            text = self.request.run()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(text)
+
+
+class AnswerView(QTextEdit):
+    MIN_RENDER_INTERVAL_MS = 100
+    MAX_RENDER_INTERVAL_MS = 1000
+
+    def __init__(self):
+        super().__init__(readOnly=True)
+        self.text = ""
+        self.renderTimer = QtCore.QTimer(self)
+        self.renderTimer.setSingleShot(True)
+        self.renderTimer.timeout.connect(self.render)
+
+    def clear(self):
+        self.renderTimer.stop()
+        self.text = ""
+        super().clear()
+
+    def appendChunk(self, chunk: str):
+        self.text += chunk
+        if not self.renderTimer.isActive():
+            # Markdown is reparsed as a whole, so render less often as the answer grows
+            interval = self.MIN_RENDER_INTERVAL_MS + len(self.text) // 100
+            self.renderTimer.start(min(interval, self.MAX_RENDER_INTERVAL_MS))
+
+    def setAnswer(self, text: str):
+        self.renderTimer.stop()
+        self.text = text
+        self.render()
+
+    def render(self):
+        scrollBar = self.verticalScrollBar()
+        atBottom = scrollBar.value() >= scrollBar.maximum()
+        position = scrollBar.value()
+        with span("render.markdown", chars=len(self.text)):
+            self.setMarkdown(self.text)
+        scrollBar.setValue(scrollBar.maximum() if atBottom else position)
 
-class Worker(QtCore.QObject):
-    finished = QtCore.Signal(str)
 
-    def __init__(self, config: ConfigValues, picture: Image.Image, prompt: str = ""):
+class AnswerPane(QWidget):
+    answered = QtCore.Signal(object)
+    done = QtCore.Signal(object)
+
+    def __init__(self, provider: str, model: str, tokenBudget: int):
         super().__init__()
-        self.picture = picture
+        self.provider = provider
+        self.model = model
+        self.tokenBudget = tokenBudget
+        self.session = Session(tokenBudget)
+        # What has been shown to the user, independent of the truncated history
+        # that is sent to the provider
+        self.shownTurns = []
+        self.prompt = ""
+        self.requestInfo = ""
+        self.config = None
+        self.capture = None
+        self.worker = None
+        self.sentAt = None
+        self.firstChunkAt = None
+        self.cachedAt = None
+
+        self.titleLabel = QLabel(f"{provider}: {model}")
+        self.answer = AnswerView()
+        self.answer.setMinimumWidth(300)
+        sizePolicy = QSizePolicy()
+        sizePolicy.setHorizontalPolicy(QSizePolicy.Expanding)
+        sizePolicy.setVerticalPolicy(QSizePolicy.Expanding)
+        self.answer.setSizePolicy(sizePolicy)
+        self.answer.setAlignment(QtCore.Qt.AlignTop)
+        self.statusLabel = QLabel()
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.titleLabel)
+        layout.addWidget(self.answer)
+        layout.addWidget(self.statusLabel)
+        self.setLayout(layout)
+
+    def isBusy(self) -> bool:
+        return self.worker is not None
+
+    def send(
+        self,
+        pool: QtCore.QThreadPool,
+        config: ConfigValues,
+        capture: CapturedImage,
+        prompt: str,
+        useCache: bool,
+    ) -> Worker:
         self.prompt = prompt
+        self.requestInfo = ""
         self.config = config
+        self.capture = capture
+        self.answer.setAnswer(self.transcript(prompt))
+        self.statusLabel.setText("Waiting…")
+        self.sentAt = time.perf_counter()
+        self.firstChunkAt = None
+        self.cachedAt = None
+        self.worker = Worker(
+            config=config,
+            capture=capture,
+            prompt=prompt,
+            provider=self.provider,
+            model=self.model,
+            useCache=useCache,
+            session=self.session,
+        )
+        self.worker.servedFromCache.connect(self.showCacheHit)
+        self.worker.requestSent.connect(self.showRequest)
+        self.worker.chunkReceived.connect(self.appendChunk)
+        self.worker.finished.connect(self.showAnswer)
+        self.worker.failed.connect(self.showError)
+        self.worker.start(pool)
+        return self.worker
 
-    def run(self):
-        if self.config.provider == "Google":
-            from google import genai
-            from google.genai.types import GenerateContentConfig
-
-            client = genai.Client(api_key=self.config.apiKey)
-            response = client.models.generate_content(
-                model=self.config.model,
-                contents=[self.picture, self.prompt],
-                config=GenerateContentConfig(
-                    system_instruction=[
-                        self.config.systemPrompt,
-                    ],
-                    temperature=0.1,
-                ),
+    def elapsed(self, since: float) -> str:
+        return f"{time.perf_counter() - since:.2f} s"
+
+    def transcript(self, prompt: str = None, answer: str = "") -> str:
+        turns = list(self.shownTurns)
+        if prompt is not None:
+            turns.append((prompt, answer))
+        if len(turns) == 1:
+            return turns[0][1]
+        return "\n\n---\n\n".join(
+            f"**You:** {prompt}\n\n{answer}" for prompt, answer in turns
+        )
+
+    def reset(self):
+        self.cancel()
+        self.session = Session(self.tokenBudget)
+        self.shownTurns = []
+        self.answer.clear()
+        self.statusLabel.clear()
+
+    def showRequest(self, requestBytes: int, dropped: int):
+        if not self.isCurrent():
+            return
+        turn = len(self.shownTurns) + 1
+        self.requestInfo = f"turn {turn}, {formatBytes(requestBytes)} sent"
+        if dropped:
+            self.requestInfo += f", {dropped} old turns dropped"
+
+    def isCurrent(self) -> bool:
+        # Signals a cancelled worker emitted before it noticed are already
+        # queued and still arrive, only those of the current worker count
+        return self.worker is not None and self.sender() is self.worker
+
+    def appendChunk(self, chunk: str):
+        if not self.isCurrent():
+            return
+        if self.firstChunkAt is None:
+            self.firstChunkAt = time.perf_counter()
+            self.statusLabel.setText(
+                f"First chunk after {self.firstChunkAt - self.sentAt:.2f} s"
             )
-        self.finished.emit(response.text)
+        self.answer.appendChunk(chunk)
+
+    def showCacheHit(self, created: float):
+        if not self.isCurrent():
+            return
+        self.cachedAt = created
+
+    def showAnswer(self, answer: str):
+        if not self.isCurrent():
+            return
+        self.worker = None
+        # Committed here rather than on the worker thread, so an answer that
+        # arrives after a cancel never becomes part of the conversation
+        self.session.addTurn(self.prompt, answer)
+        self.shownTurns.append((self.prompt, answer))
+        if self.config.historyEnabled:
+            history().addEntry(
+                self.capture,
+                self.provider,
+                self.model,
+                self.prompt,
+                answer,
+                self.config.historyMaxEntries,
+                self.config.historyMaxSizeMb * 1024 * 1024,
+            )
+        self.answer.setAnswer(self.transcript())
+        if self.cachedAt is not None:
+            saved = datetime.fromtimestamp(self.cachedAt).strftime("%Y-%m-%d %H:%M")
+            elapsed = (time.perf_counter() - self.sentAt) * 1000
+            status = f"Served from cache in {elapsed:.0f} ms (saved {saved})"
+        elif self.firstChunkAt is not None:
+            firstChunk = self.firstChunkAt - self.sentAt
+            status = f"{self.elapsed(self.sentAt)} (first chunk {firstChunk:.2f} s)"
+        else:
+            status = self.elapsed(self.sentAt)
+        if self.requestInfo:
+            status = f"{status}, {self.requestInfo}"
+        self.statusLabel.setText(status)
+        self.answered.emit(self)
+        self.done.emit(self)
+
+    def showError(self, error: str):
+        if not self.isCurrent():
+            return
+        self.worker = None
+        self.answer.setAnswer(self.transcript(self.prompt, f"**Error:** {error}"))
+        self.statusLabel.setText(f"Failed after {self.elapsed(self.sentAt)}")
+        self.done.emit(self)
+
+    def cancel(self, reason: str = "Cancelled"):
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        # Keep whatever has been streamed so far, the late chunks and result
+        # are ignored once this worker is no longer the current one
+        self.worker = None
+        self.answer.setAnswer(self.answer.text)
+        self.statusLabel.setText(f"{reason} after {self.elapsed(self.sentAt)}")
+        self.done.emit(self)
 
 
 class PromptWidget(QWidget):
@@ -119,62 +371,280 @@ class PromptWidget(QWidget):
         super().__init__()
         self.config = config
         self.screenshot = screenshot
+        self.capture = CapturedImage(screenshot)
+        self.panes = []
+        self.hiddenPanes = {}
         vLayout = QVBoxLayout()
         self.screenshotLabel = QLabel(self)
         self.screenshotLabel.setMaximumWidth(500)
         self.screenshotLabel.setScaledContents(True)
         self.screenshotLabel.setPixmap(screenshot.toqpixmap())
+        self.uploadLabel = QLabel(self)
         self.promptTextEdit = QTextEdit(self)
         self.promptTextEdit.setFocus()
         self.sendButton = QPushButton("Send")
         self.sendButton.clicked.connect(self.sendPrompt)
+        self.cancelButton = QPushButton("Cancel")
+        self.cancelButton.setDisabled(True)
+        self.cancelButton.clicked.connect(self.cancelPrompt)
 
         self.sendShortcut = QShortcut(QKeySequence("Ctrl+Return"), self.promptTextEdit)
         self.sendShortcut.activated.connect(self.sendButton.click)
 
         vLayout.addWidget(self.screenshotLabel)
+        vLayout.addWidget(self.uploadLabel)
         vLayout.addWidget(self.promptTextEdit)
-        vLayout.addWidget(self.sendButton)
+        buttonLayout = QHBoxLayout()
+        buttonLayout.addWidget(self.sendButton)
+        buttonLayout.addWidget(self.cancelButton)
+        self.bypassCacheButton = QCheckBox("Bypass cache")
+        self.bypassCacheButton.setVisible(self.config.cacheEnabled)
+        buttonLayout.addWidget(self.bypassCacheButton)
+        self.newSessionButton = QPushButton("New conversation")
+        self.newSessionButton.setToolTip(
+            "Forget the previous questions and answers about this capture"
+        )
+        self.newSessionButton.clicked.connect(self.newSession)
+        buttonLayout.addWidget(self.newSessionButton)
+        self.compareButton = QCheckBox("Compare models")
+        self.compareButton.setVisible(bool(self.config.compareModels.strip()))
+        buttonLayout.addWidget(self.compareButton)
+        self.config.addListener(self.configChanged)
+        self.destroyed.connect(lambda: config.removeListener(self.configChanged))
+        vLayout.addLayout(buttonLayout)
 
         hLayout = QHBoxLayout()
         hLayout.addLayout(vLayout)
-        self.answer = QTextEdit(readOnly=True)
-        self.answer.setMinimumWidth(300)
-        sizePolicy = QSizePolicy()
-        sizePolicy.setHorizontalPolicy(QSizePolicy.Expanding)
-        sizePolicy.setVerticalPolicy(QSizePolicy.Expanding)
-        self.answer.setSizePolicy(sizePolicy)
-        self.answer.setAlignment(QtCore.Qt.AlignTop)
-        subVLayout = QVBoxLayout()
-        subVLayout.addWidget(self.answer)
-        hLayout.addLayout(subVLayout)
+        self.answers = QSplitter(QtCore.Qt.Orientation.Horizontal)
+        hLayout.addWidget(self.answers, stretch=1)
+        self.setPanes([(self.config.provider, self.config.model)])
 
         self.setLayout(hLayout)
 
+    def configChanged(self, name: str, value):
+        if name == "cacheEnabled":
+            self.bypassCacheButton.setVisible(value)
+        elif name == "compareModels":
+            self.compareButton.setVisible(bool(value.strip()))
+
+    def targets(self) -> list[tuple[str, str]]:
+        targets = [(self.config.provider, self.config.model)]
+        if self.config.compareModels.strip() and self.compareButton.isChecked():
+            for target in parseTargets(self.config.compareModels, self.config.provider):
+                if target not in targets:
+                    targets.append(target)
+        return targets
+
+    def setPanes(self, targets: list[tuple[str, str]]):
+        if [(p.provider, p.model) for p in self.panes] == targets:
+            return
+        # A pane keeps its conversation while its target is not shown, so
+        # toggling the comparison or switching models back continues it
+        existing = dict(self.hiddenPanes)
+        existing.update({(pane.provider, pane.model): pane for pane in self.panes})
+        self.panes = []
+        for index, (provider, model) in enumerate(targets):
+            pane = existing.pop((provider, model), None)
+            if pane is None:
+                pane = AnswerPane(provider, model, self.config.historyTokenBudget)
+                pane.answered.connect(self.paneAnswered)
+                pane.done.connect(self.paneDone)
+            self.answers.insertWidget(index, pane)
+            pane.show()
+            self.panes.append(pane)
+        for pane in existing.values():
+            pane.cancel()
+            pane.hide()
+        self.hiddenPanes = existing
+        # The title is only useful to tell answers apart
+        for pane in self.panes:
+            pane.titleLabel.setVisible(len(self.panes) > 1)
+
     def sendPrompt(self):
         self.promptTextEdit.setDisabled(True)
         self.sendButton.setDisabled(True)
+        self.newSessionButton.setDisabled(True)
+        self.cancelButton.setEnabled(True)
 
-        # Use threading to prevent blocking the UI
-        self.thread = QtCore.QThread()
-        self.worker = Worker(
-            config=self.config,
-            picture=self.screenshot,
-            prompt=self.promptTextEdit.toPlainText(),
-        )
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.showAnswer)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
+        # Requests run on a bounded thread pool so that comparing models sends
+        # them concurrently without blocking the UI
+        self.setPanes(self.targets())
+        pool = requestPool(max(1, self.config.maxConcurrency))
+        prompt = self.promptTextEdit.toPlainText()
+        useCache = not self.bypassCacheButton.isChecked()
+        for pane in self.panes:
+            worker = pane.send(pool, self.config, self.capture, prompt, useCache)
+            worker.preprocessed.connect(self.setPayload)
 
-        self.thread.start()
+    def setPayload(self, payload: ImagePayload):
+        self.uploadLabel.setText(f"Upload: {payload.describe()}")
 
-    def showAnswer(self, answer: str):
-        self.answer.setMarkdown(answer)
+    def paneAnswered(self, winner: AnswerPane):
+        if self.config.firstAnswerWins:
+            for pane in self.panes:
+                if pane is not winner:
+                    pane.cancel("Cancelled, another model answered first")
+
+    def paneDone(self, pane: AnswerPane):
+        if not any(pane.isBusy() for pane in self.panes):
+            if any(pane.shownTurns for pane in self.panes):
+                # Ready for a follow-up question about the same capture
+                self.promptTextEdit.clear()
+            self.enablePrompt()
+
+    def newSession(self):
+        for pane in self.panes + list(self.hiddenPanes.values()):
+            pane.reset()
+
+    def cancelPrompt(self):
+        for pane in self.panes:
+            pane.cancel()
+
+    def enablePrompt(self):
         self.promptTextEdit.setEnabled(True)
         self.sendButton.setEnabled(True)
+        self.newSessionButton.setEnabled(True)
+        self.cancelButton.setDisabled(True)
+
+
+class HistoryModel(QtCore.QAbstractListModel):
+    PREVIEW_LENGTH = 120
+
+    # Rows are fetched a page at a time as the list is scrolled. Thumbnails are
+    # decoded only when a row is painted and kept in the bounded QPixmapCache
+    def __init__(self):
+        super().__init__()
+        self.text = ""
+        self.entries = []
+        self.exhausted = False
+
+    def search(self, text: str):
+        self.beginResetModel()
+        self.text = text
+        self.entries = []
+        self.exhausted = False
+        self.endResetModel()
+        self.fetchMore(QtCore.QModelIndex())
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.entries)
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent: QtCore.QModelIndex):
+        if not self.canFetchMore(parent):
+            return
+        before = self.entries[-1].id if self.entries else None
+        with span("history.page", search=bool(self.text.strip())) as fields:
+            entries = history().page(self.text, before)
+            fields["rows"] = len(entries)
+        self.exhausted = len(entries) < PAGE_SIZE
+        if entries:
+            first = len(self.entries)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(entries) - 1)
+            self.entries.extend(entries)
+            self.endInsertRows()
+
+    def entry(self, row: int) -> HistoryEntry:
+        return self.entries[row]
+
+    def data(self, index: QtCore.QModelIndex, role: int):
+        entry = self.entries[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            created = datetime.fromtimestamp(entry.created).strftime("%Y-%m-%d %H:%M")
+            answer = " ".join(entry.answer.split())
+            if len(answer) > self.PREVIEW_LENGTH:
+                answer = answer[: self.PREVIEW_LENGTH] + "…"
+            return (
+                f"{entry.prompt or '(no prompt)'}\n{answer}\n"
+                f"{created} · {entry.provider}: {entry.model}"
+            )
+        if role == QtCore.Qt.ItemDataRole.DecorationRole:
+            key = f"smartcap-history-{entry.image}"
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None:
+                pixmap = QPixmap()
+                pixmap.loadFromData(entry.thumbnail, "PNG")
+                QPixmapCache.insert(key, pixmap)
+            return pixmap
+        if role == QtCore.Qt.ItemDataRole.ToolTipRole:
+            return f"{entry.width}x{entry.height} capture"
+        return None
+
+
+class HistoryWidget(QWidget):
+    SEARCH_DELAY_MS = 200
+
+    def __init__(self):
+        super().__init__()
+        self.model = HistoryModel()
+        self.searchInput = QLineEdit()
+        self.searchInput.setPlaceholderText("Search prompts and answers")
+        self.searchInput.setClearButtonEnabled(True)
+        # Searching waits until typing pauses
+        self.searchTimer = QtCore.QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(self.SEARCH_DELAY_MS)
+        self.searchTimer.timeout.connect(self.search)
+        self.searchInput.textChanged.connect(lambda: self.searchTimer.start())
+
+        self.entryList = QListView()
+        self.entryList.setModel(self.model)
+        self.entryList.setIconSize(QtCore.QSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE))
+        self.entryList.setUniformItemSizes(True)
+        self.entryList.setMinimumWidth(360)
+        self.entryList.selectionModel().currentChanged.connect(self.showEntry)
+        self.entryView = QTextEdit(readOnly=True)
+        self.openImageButton = QPushButton("Open image")
+        self.openImageButton.setDisabled(True)
+        self.openImageButton.clicked.connect(self.openImage)
+
+        leftLayout = QVBoxLayout()
+        leftLayout.setContentsMargins(0, 0, 0, 0)
+        leftLayout.addWidget(self.searchInput)
+        leftLayout.addWidget(self.entryList)
+        left = QWidget()
+        left.setLayout(leftLayout)
+        rightLayout = QVBoxLayout()
+        rightLayout.setContentsMargins(0, 0, 0, 0)
+        rightLayout.addWidget(self.entryView)
+        rightLayout.addWidget(self.openImageButton)
+        right = QWidget()
+        right.setLayout(rightLayout)
+        splitter = QSplitter(QtCore.Qt.Orientation.Horizontal)
+        splitter.addWidget(left)
+        splitter.addWidget(right)
+        splitter.setStretchFactor(1, 1)
+        layout = QVBoxLayout()
+        layout.addWidget(splitter)
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        # Entries written since the tab was last shown appear on top
+        self.search()
+        super().showEvent(event)
+
+    def search(self):
+        self.searchTimer.stop()
+        self.entryView.clear()
+        self.openImageButton.setDisabled(True)
+        self.model.search(self.searchInput.text())
+
+    def showEntry(self, current: QtCore.QModelIndex, previous: QtCore.QModelIndex):
+        if not current.isValid():
+            return
+        entry = self.model.entry(current.row())
+        self.entryView.setMarkdown(f"**{entry.prompt}**\n\n{entry.answer}")
+        self.openImageButton.setEnabled(True)
+
+    def openImage(self):
+        # The full size capture is only read from disk when asked for
+        index = self.entryList.currentIndex()
+        if not index.isValid():
+            return
+        path = history().imagePath(self.model.entry(index.row()).image)
+        QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(path)))
 
 
 class ConfigWidget(QWidget):
@@ -184,7 +654,7 @@ class ConfigWidget(QWidget):
 
         providerLabel = QLabel("Provider:")
         providerInput = QComboBox()
-        providerInput.addItem("Google")
+        providerInput.addItems(providerNames())
         providerInput.setCurrentText(self.config.provider)
         providerInput.currentTextChanged.connect(lambda p: self.config.setProvider(p))
         modelLabel = QLabel("Model:")
@@ -211,11 +681,173 @@ class ConfigWidget(QWidget):
         grid.addWidget(modelInput, 1, 1)
         grid.addWidget(apiKeyLabel, 2, 0)
         grid.addLayout(apiKeyInputLayout, 2, 1)
+        streamInput = QCheckBox("Stream answer")
+        streamInput.setChecked(self.config.stream)
+        streamInput.toggled.connect(lambda enabled: self.config.setStream(enabled))
+        freezeFrameInput = QCheckBox("Freeze screen while selecting")
+        freezeFrameInput.setChecked(self.config.freezeFrame)
+        freezeFrameInput.toggled.connect(
+            lambda enabled: self.config.setFreezeFrame(enabled)
+        )
+        streamLayout = QHBoxLayout()
+        streamLayout.addWidget(streamInput)
+        streamLayout.addWidget(freezeFrameInput)
+        grid.addLayout(streamLayout, 3, 1)
+
+        maxResolutionLabel = QLabel("Max resolution:")
+        maxResolutionInput = QSpinBox(
+            minimum=0, maximum=8192, singleStep=128, suffix=" px"
+        )
+        maxResolutionInput.setSpecialValueText("unlimited")
+        maxResolutionInput.setValue(self.config.maxResolution)
+        maxResolutionInput.valueChanged.connect(
+            lambda value: self.config.setMaxResolution(value)
+        )
+        imageFormatLabel = QLabel("Image format:")
+        imageFormatInput = QComboBox()
+        imageFormatInput.addItems(IMAGE_FORMATS)
+        imageFormatInput.setCurrentText(self.config.imageFormat)
+        imageFormatInput.currentTextChanged.connect(
+            lambda f: self.config.setImageFormat(f)
+        )
+        imageQualityLabel = QLabel("Image quality:")
+        imageQualityInput = QSpinBox(minimum=10, maximum=100)
+        imageQualityInput.setValue(self.config.imageQuality)
+        imageQualityInput.valueChanged.connect(
+            lambda value: self.config.setImageQuality(value)
+        )
+        byteBudgetLabel = QLabel("Upload budget:")
+        byteBudgetInput = QSpinBox(minimum=0, maximum=20 * 1024, suffix=" KB")
+        byteBudgetInput.setSpecialValueText("unlimited")
+        byteBudgetInput.setValue(self.config.byteBudget // 1024)
+        byteBudgetInput.valueChanged.connect(
+            lambda value: self.config.setByteBudget(value * 1024)
+        )
+        grayscaleInput = QCheckBox("Grayscale (text-heavy captures)")
+        grayscaleInput.setChecked(self.config.grayscale)
+        grayscaleInput.toggled.connect(
+            lambda enabled: self.config.setGrayscale(enabled)
+        )
+        grid.addWidget(maxResolutionLabel, 4, 0)
+        grid.addWidget(maxResolutionInput, 4, 1)
+        grid.addWidget(imageFormatLabel, 5, 0)
+        grid.addWidget(imageFormatInput, 5, 1)
+        grid.addWidget(imageQualityLabel, 6, 0)
+        grid.addWidget(imageQualityInput, 6, 1)
+        grid.addWidget(byteBudgetLabel, 7, 0)
+        grid.addWidget(byteBudgetInput, 7, 1)
+        grid.addWidget(grayscaleInput, 8, 1)
+
+        cacheEnabledInput = QCheckBox("Cache answers")
+        cacheEnabledInput.setChecked(self.config.cacheEnabled)
+        cacheEnabledInput.toggled.connect(
+            lambda enabled: self.config.setCacheEnabled(enabled)
+        )
+        cacheNearMatchLabel = QLabel("Cache near matches:")
+        cacheNearMatchInput = QSpinBox(minimum=0, maximum=64, suffix=" bits")
+        cacheNearMatchInput.setSpecialValueText("off")
+        cacheNearMatchInput.setToolTip(
+            "Also reuse an answer for a capture of the same size whose 1024-bit"
+            " image hash differs in at most this many bits. Pictures that differ"
+            " only in a few words can match, so answers may be wrong"
+        )
+        cacheNearMatchInput.setValue(self.config.cacheNearMatch)
+        cacheNearMatchInput.valueChanged.connect(
+            lambda value: self.config.setCacheNearMatch(value)
+        )
+        cacheMaxAgeLabel = QLabel("Cache max age:")
+        cacheMaxAgeInput = QSpinBox(minimum=1, maximum=3650, suffix=" days")
+        cacheMaxAgeInput.setValue(self.config.cacheMaxAgeDays)
+        cacheMaxAgeInput.valueChanged.connect(
+            lambda value: self.config.setCacheMaxAgeDays(value)
+        )
+        cacheMaxSizeLabel = QLabel("Cache max size:")
+        cacheMaxSizeInput = QSpinBox(minimum=1, maximum=10240, suffix=" MB")
+        cacheMaxSizeInput.setValue(self.config.cacheMaxSizeMb)
+        cacheMaxSizeInput.valueChanged.connect(
+            lambda value: self.config.setCacheMaxSizeMb(value)
+        )
+        cacheClearButton = QPushButton("Clear cache")
+        cacheClearButton.clicked.connect(lambda: responseCache().clear())
+        grid.addWidget(cacheEnabledInput, 9, 1)
+        grid.addWidget(cacheNearMatchLabel, 10, 0)
+        grid.addWidget(cacheNearMatchInput, 10, 1)
+        grid.addWidget(cacheMaxAgeLabel, 11, 0)
+        grid.addWidget(cacheMaxAgeInput, 11, 1)
+        grid.addWidget(cacheMaxSizeLabel, 12, 0)
+        grid.addWidget(cacheMaxSizeInput, 12, 1)
+        grid.addWidget(cacheClearButton, 13, 1)
+
+        compareModelsLabel = QLabel("Compare with:")
+        compareModelsInput = QLineEdit(self.config.compareModels)
+        compareModelsInput.setPlaceholderText(
+            "provider:model, ... (e.g. Google:gemini-2.0-flash-lite)"
+        )
+        compareModelsInput.textChanged.connect(
+            lambda text: self.config.setCompareModels(text)
+        )
+        maxConcurrencyLabel = QLabel("Parallel requests:")
+        maxConcurrencyInput = QSpinBox(minimum=1, maximum=16)
+        maxConcurrencyInput.setValue(self.config.maxConcurrency)
+        maxConcurrencyInput.valueChanged.connect(
+            lambda value: self.config.setMaxConcurrency(value)
+        )
+        firstAnswerWinsInput = QCheckBox("First answer wins (cancel the others)")
+        firstAnswerWinsInput.setChecked(self.config.firstAnswerWins)
+        firstAnswerWinsInput.toggled.connect(
+            lambda enabled: self.config.setFirstAnswerWins(enabled)
+        )
+        grid.addWidget(compareModelsLabel, 14, 0)
+        grid.addWidget(compareModelsInput, 14, 1)
+        grid.addWidget(maxConcurrencyLabel, 15, 0)
+        grid.addWidget(maxConcurrencyInput, 15, 1)
+        grid.addWidget(firstAnswerWinsInput, 16, 1)
+
+        historyTokenBudgetLabel = QLabel("Conversation budget:")
+        historyTokenBudgetInput = QSpinBox(
+            minimum=500, maximum=1000000, singleStep=1000, suffix=" tokens"
+        )
+        historyTokenBudgetInput.setToolTip(
+            "Older questions and answers are dropped from follow-up requests"
+            " once the conversation exceeds this size"
+        )
+        historyTokenBudgetInput.setValue(self.config.historyTokenBudget)
+        historyTokenBudgetInput.valueChanged.connect(
+            lambda value: self.config.setHistoryTokenBudget(value)
+        )
+        grid.addWidget(historyTokenBudgetLabel, 17, 0)
+        grid.addWidget(historyTokenBudgetInput, 17, 1)
+
+        historyEnabledInput = QCheckBox("Keep a searchable history")
+        historyEnabledInput.setChecked(self.config.historyEnabled)
+        historyEnabledInput.toggled.connect(
+            lambda enabled: self.config.setHistoryEnabled(enabled)
+        )
+        historyMaxEntriesLabel = QLabel("History max entries:")
+        historyMaxEntriesInput = QSpinBox(minimum=10, maximum=1000000, singleStep=1000)
+        historyMaxEntriesInput.setValue(self.config.historyMaxEntries)
+        historyMaxEntriesInput.valueChanged.connect(
+            lambda value: self.config.setHistoryMaxEntries(value)
+        )
+        historyMaxSizeLabel = QLabel("History max size:")
+        historyMaxSizeInput = QSpinBox(minimum=10, maximum=102400, suffix=" MB")
+        historyMaxSizeInput.setValue(self.config.historyMaxSizeMb)
+        historyMaxSizeInput.valueChanged.connect(
+            lambda value: self.config.setHistoryMaxSizeMb(value)
+        )
+        historyClearButton = QPushButton("Clear history")
+        historyClearButton.clicked.connect(lambda: history().clear())
+        grid.addWidget(historyEnabledInput, 18, 1)
+        grid.addWidget(historyMaxEntriesLabel, 19, 0)
+        grid.addWidget(historyMaxEntriesInput, 19, 1)
+        grid.addWidget(historyMaxSizeLabel, 20, 0)
+        grid.addWidget(historyMaxSizeInput, 20, 1)
+        grid.addWidget(historyClearButton, 21, 1)
 
         systemPromptLabel = QLabel("System prompt:")
         systemPromptInput = QTextEdit(self.config.systemPrompt)
         systemPromptInput.textChanged.connect(
-            lambda text: self.config.setSystemPrompt(text)
+            lambda: self.config.setSystemPrompt(systemPromptInput.toPlainText())
         )
 
         verticleLayout = QVBoxLayout()
@@ -223,3 +855,67 @@ class ConfigWidget(QWidget):
         verticleLayout.addWidget(systemPromptLabel)
         verticleLayout.addWidget(systemPromptInput)
         self.setLayout(verticleLayout)
+
+
+class DiagnosticsWidget(QWidget):
+    COLUMNS = ["Stage", "Count", "Last", "Mean", "p50", "p95", "Max"]
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self):
+        super().__init__()
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        metricsPath = recorder().path
+        self.pathLabel = QLabel(
+            f"Spans are also written to {metricsPath}"
+            if metricsPath
+            else "Set SMARTCAP_METRICS to a file path to record every span"
+        )
+        self.refreshButton = QPushButton("Refresh")
+        self.refreshButton.clicked.connect(self.refresh)
+        self.resetButton = QPushButton("Reset")
+        self.resetButton.clicked.connect(self.reset)
+        # Only refreshed while the tab is shown
+        self.refreshTimer = QtCore.QTimer(self)
+        self.refreshTimer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.refreshTimer.timeout.connect(self.refresh)
+
+        buttonLayout = QHBoxLayout()
+        buttonLayout.addWidget(self.pathLabel, stretch=1)
+        buttonLayout.addWidget(self.refreshButton)
+        buttonLayout.addWidget(self.resetButton)
+        layout = QVBoxLayout()
+        layout.addWidget(self.table)
+        layout.addLayout(buttonLayout)
+        self.setLayout(layout)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refreshTimer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refreshTimer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        stats = recorder().stats()
+        self.table.setRowCount(len(stats))
+        for row, stage in enumerate(stats):
+            values = [stage.last, stage.mean, stage.p50, stage.p95, stage.max]
+            cells = [stage.name, str(stage.count)]
+            cells += [f"{value * 1000:.1f} ms" for value in values]
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if column > 0:
+                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+    def reset(self):
+        recorder().clear()
+        self.refresh()